@@ -0,0 +1,190 @@
+"""Representative API payloads shared by the benchmark scripts.
+
+Shapes follow the Teamleader Focus ``*.info`` responses (bare ``data`` dicts)
+and the ``*.add`` / ``*.create`` request bodies from spec v1.112.0.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_CUSTOM_FIELDS: list[dict[str, Any]] = [
+    {"definition": {"type": "customFieldDefinition", "id": f"cf-{i}"}, "value": i}
+    for i in range(3)
+]
+
+_GROUPED_LINES: list[dict[str, Any]] = [
+    {
+        "section": {"title": f"Section {s}"},
+        "line_items": [
+            {
+                "product": {"type": "product", "id": f"prod-{i}"},
+                "quantity": 2,
+                "description": f"Line {i}",
+                "unit_price": {"amount": 50.0, "tax": "excluding"},
+                "tax": {"type": "taxRate", "id": "tax-21"},
+                "total": {
+                    "tax_exclusive": {"amount": 100.0, "currency": "EUR"},
+                    "tax_inclusive": {"amount": 121.0, "currency": "EUR"},
+                },
+            }
+            for i in range(5)
+        ],
+    }
+    for s in range(2)
+]
+
+CONTACT: dict[str, Any] = {
+    "id": "cde0bc5f-8602-4e12-b5d3-f03436b54c0d",
+    "first_name": "Erlich",
+    "last_name": "Bachman",
+    "status": "active",
+    "salutation": "Mr",
+    "emails": [{"type": "primary", "email": "info@piedpiper.eu"}],
+    "telephones": [{"type": "phone", "number": "092980615"}],
+    "website": "https://piedpiper.com",
+    "addresses": [
+        {
+            "type": "invoicing",
+            "address": {
+                "addressee": "Teamleader HQ",
+                "line_1": "Dok Noord 3A 101",
+                "postal_code": "9000",
+                "city": "Ghent",
+                "country": "BE",
+            },
+        }
+    ],
+    "language": "en",
+    "payment_term": {"type": "after_invoice_date", "days": 30},
+    "tags": ["vip", "partner"],
+    "custom_fields": _CUSTOM_FIELDS,
+    "marketing_mails_consent": False,
+    "added_at": "2016-02-04T16:44:33+00:00",
+    "updated_at": "2016-02-05T16:44:33+00:00",
+}
+
+COMPANY: dict[str, Any] = {
+    "id": "e8d31ae7-8258-4fcd-9b2d-78f41b0aa5d5",
+    "name": "Pied Piper",
+    "status": "active",
+    "business_type": {"type": "businessType", "id": "fd48d4a3"},
+    "vat_number": "BE0899623035",
+    "emails": [{"type": "primary", "email": "info@piedpiper.eu"}],
+    "telephones": [{"type": "phone", "number": "092980615"}],
+    "addresses": CONTACT["addresses"],
+    "language": "nl",
+    "preferred_currency": "EUR",
+    "payment_term": {"type": "end_of_month"},
+    "responsible_user": {"type": "user", "id": "user-1"},
+    "tags": ["customer"],
+    "custom_fields": _CUSTOM_FIELDS,
+    "added_at": "2016-02-04T16:44:33+00:00",
+    "updated_at": "2016-02-05T16:44:33+00:00",
+}
+
+DEAL: dict[str, Any] = {
+    "id": "f6871b06-6513-4750-b5e6-ff3503b5a029",
+    "title": "Interesting deal",
+    "summary": "Additional information",
+    "status": "open",
+    "lead": {"customer": {"type": "company", "id": "2659dc4d"}},
+    "department": {"type": "department", "id": "dept-1"},
+    "estimated_value": {"amount": 123.3, "currency": "EUR"},
+    "estimated_probability": 0.5,
+    "weighted_value": {"amount": 61.65, "currency": "EUR"},
+    "current_phase": {"type": "dealPhase", "id": "phase-1"},
+    "responsible_user": {"type": "user", "id": "user-1"},
+    "source": {"type": "dealSource", "id": "source-1"},
+    "quotations": [{"type": "quotation", "id": "quot-1"}],
+    "pipeline": {"type": "dealPipeline", "id": "pipe-1"},
+    "custom_fields": _CUSTOM_FIELDS,
+    "created_at": "2017-05-09T11:25:11+00:00",
+    "updated_at": "2017-05-09T11:30:58+00:00",
+}
+
+INVOICE: dict[str, Any] = {
+    "id": "e540fe7e-dce2-459e-bf7e-24e605fc18b3",
+    "department": {"type": "department", "id": "dept-1"},
+    "invoice_number": "2017 / 5",
+    "invoice_date": "2016-02-04",
+    "status": "outstanding",
+    "due_on": "2016-03-03",
+    "sent": True,
+    "invoicee": {"name": "De Rode Duivels", "vat_number": "BE0899623035"},
+    "grouped_lines": _GROUPED_LINES,
+    "total": {
+        "tax_exclusive": {"amount": 100.0, "currency": "EUR"},
+        "tax_inclusive": {"amount": 121.0, "currency": "EUR"},
+        "due": {"amount": 121.0, "currency": "EUR"},
+    },
+    "payment_term": {"type": "after_invoice_date", "days": 30},
+    "currency": "EUR",
+    "deal": {"type": "deal", "id": "deal-1"},
+    "custom_fields": _CUSTOM_FIELDS,
+    "created_at": "2016-02-04T16:44:33+00:00",
+    "updated_at": "2016-02-05T16:44:33+00:00",
+}
+
+QUOTATION: dict[str, Any] = {
+    "id": "e7a3fe2b-2c75-480f-87b9-121816b5257b",
+    "deal": {"type": "deal", "id": "deal-1"},
+    "grouped_lines": _GROUPED_LINES,
+    "currency": "EUR",
+    "text": "Quotation text",
+    "total": INVOICE["total"],
+    "status": "open",
+    "name": "Webdevelopment",
+    "custom_fields": _CUSTOM_FIELDS,
+    "created_at": "2016-02-04T16:44:33+00:00",
+    "updated_at": "2016-02-05T16:44:33+00:00",
+}
+
+#: Curated model name → representative ``*.info`` data dict.
+CURATED: dict[str, dict[str, Any]] = {
+    "Contact": CONTACT,
+    "Company": COMPANY,
+    "Deal": DEAL,
+    "Invoice": INVOICE,
+    "Quotation": QUOTATION,
+}
+
+#: Generated base class name → representative request body.
+GENERATED: dict[str, dict[str, Any]] = {
+    "_ContactsAddrequestBase": {
+        "first_name": "Erlich",
+        "last_name": "Bachman",
+        "emails": CONTACT["emails"],
+        "telephones": CONTACT["telephones"],
+        "language": "en",
+        "tags": ["vip"],
+    },
+    "_CompaniesAddrequestBase": {
+        "name": "Pied Piper",
+        "vat_number": "BE0899623035",
+        "emails": COMPANY["emails"],
+        "language": "nl",
+        "tags": ["customer"],
+    },
+    "_DealsCreaterequestBase": {
+        "lead": DEAL["lead"],
+        "title": "Interesting deal",
+        "summary": "Additional information",
+        "estimated_value": DEAL["estimated_value"],
+        "estimated_probability": 0.5,
+    },
+    "_InvoicesDraftrequestBase": {
+        "invoicee": {"customer": {"type": "company", "id": "c1"}},
+        "department_id": "dept-1",
+        "payment_term": {"type": "cash"},
+        "grouped_lines": _GROUPED_LINES,
+    },
+}
+
+
+def list_page(item: dict[str, Any], size: int = 100) -> dict[str, Any]:
+    """Return a ``*.list`` response page of *size* copies of *item*, distinct ids."""
+    return {
+        "data": [{**item, "id": f"{item['id'][:-4]}{i:04d}"} for i in range(size)],
+        "meta": {"page": {"size": size, "number": 1}, "matches": size * 10},
+    }
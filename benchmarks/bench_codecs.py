@@ -0,0 +1,76 @@
+"""Compare the JSON codecs on representative request and response bodies.
+
+Usage::
+
+    python benchmarks/bench_codecs.py [--number 200]
+
+For every codec available here (:class:`~teamleader.codecs.StdlibJSONCodec`
+always, :class:`~teamleader.codecs.OrjsonCodec` when ``orjson`` is
+installed) it times decoding ``*.list`` pages of 100 items — invoices with
+``grouped_lines`` being the heaviest — and encoding a ``*.create`` body.
+
+Figures are microseconds per call (best of five repeats).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Make the repo root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks._payloads import CONTACT, DEAL, GENERATED, INVOICE, list_page
+from teamleader.codecs import JSONCodec, OrjsonCodec, StdlibJSONCodec
+
+
+def _best_us(fn: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def _available_codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson not installed — only the stdlib codec is measured\n")
+    return codecs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    reference = StdlibJSONCodec()
+    responses = {
+        "contacts.list (100)": reference.encode(list_page(CONTACT)),
+        "deals.list (100)": reference.encode(list_page(DEAL)),
+        "invoices.list (100)": reference.encode(list_page(INVOICE)),
+    }
+    request = GENERATED["_DealsCreaterequestBase"]
+    codecs = _available_codecs()
+
+    print(f"{'payload':<28} {'bytes':>8} " + " ".join(f"{c.name:>10}" for c in codecs))
+    for label, body in responses.items():
+        timings = [_best_us(lambda c=c: c.decode(body), args.number) for c in codecs]
+        print(
+            f"{'decode ' + label:<28} {len(body):>8} "
+            + " ".join(f"{t:10.1f}" for t in timings)
+        )
+    timings = [
+        _best_us(lambda c=c: c.encode(request), args.number * 50) for c in codecs
+    ]
+    size = len(reference.encode(request))
+    print(
+        f"{'encode deals.create':<28} {size:>8} "
+        + " ".join(f"{t:10.1f}" for t in timings)
+    )
+
+
+if __name__ == "__main__":
+    main()
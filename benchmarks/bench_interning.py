@@ -0,0 +1,130 @@
+"""Measure the memory saved by ``interning()`` on a synthetic deal scan.
+
+Usage::
+
+    python benchmarks/bench_interning.py [--deals 100000]
+
+Builds ``--deals`` synthetic ``deals.list`` records, decodes them page by page
+with :func:`json.loads` (so every record gets its own string objects, exactly
+as on a real scan), deserialises them with :meth:`Deal.from_api` once without
+and once with an active :class:`~teamleader.models.interning.Interner`, and
+reports the memory retained by the resulting models.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any
+
+# Make the repo root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from teamleader.models.deal import Deal
+from teamleader.models.interning import interning
+
+PAGE_SIZE = 100
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def synthetic_pages(deal_count: int, seed: int = 42) -> list[bytes]:
+    """Return JSON-encoded ``deals.list`` pages holding *deal_count* deals.
+
+    Reference data is drawn from small pools (10 departments, 50 users,
+    20 phases, 5 sources, 3 custom-field definitions) to mirror a real account.
+    """
+    rng = random.Random(seed)
+    departments = [_uuid(rng) for _ in range(10)]
+    users = [_uuid(rng) for _ in range(50)]
+    phases = [_uuid(rng) for _ in range(20)]
+    sources = [_uuid(rng) for _ in range(5)]
+    definitions = [_uuid(rng) for _ in range(3)]
+    currencies = ["EUR", "USD", "GBP"]
+
+    pages: list[bytes] = []
+    for start in range(0, deal_count, PAGE_SIZE):
+        data: list[dict[str, Any]] = []
+        for _ in range(min(PAGE_SIZE, deal_count - start)):
+            currency = rng.choice(currencies)
+            data.append(
+                {
+                    "id": _uuid(rng),
+                    "title": f"Deal {rng.randrange(1_000_000)}",
+                    "status": rng.choice(["open", "won", "lost"]),
+                    "lead": {"customer": {"type": "company", "id": _uuid(rng)}},
+                    "department": {"type": "department", "id": rng.choice(departments)},
+                    "estimated_value": {
+                        "amount": rng.random() * 10_000,
+                        "currency": currency,
+                    },
+                    "weighted_value": {
+                        "amount": rng.random() * 5_000,
+                        "currency": currency,
+                    },
+                    "current_phase": {"type": "dealPhase", "id": rng.choice(phases)},
+                    "responsible_user": {"type": "user", "id": rng.choice(users)},
+                    "source": {"type": "dealSource", "id": rng.choice(sources)},
+                    "custom_fields": [
+                        {
+                            "definition": {"type": "customFieldDefinition", "id": d},
+                            "value": rng.randrange(100),
+                        }
+                        for d in definitions
+                    ],
+                    "created_at": "2024-01-01T10:00:00+00:00",
+                    "updated_at": "2024-06-01T10:00:00+00:00",
+                }
+            )
+        pages.append(json.dumps({"data": data}).encode())
+    return pages
+
+
+def _scan(pages: list[bytes]) -> list[Deal]:
+    return [Deal.from_api(d) for page in pages for d in json.loads(page)["data"]]
+
+
+def measure(pages: list[bytes], *, intern: bool) -> tuple[int, float]:
+    """Return ``(retained_bytes, seconds)`` for one full scan of *pages*."""
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if intern:
+        with interning():
+            deals = _scan(pages)
+    else:
+        deals = _scan(pages)
+    elapsed = time.perf_counter() - t0
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deals
+    return retained, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deals", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pages = synthetic_pages(args.deals)
+    plain_bytes, plain_s = measure(pages, intern=False)
+    interned_bytes, interned_s = measure(pages, intern=True)
+
+    saved = plain_bytes - interned_bytes
+    print(f"Deals scanned:     {args.deals:,}")
+    print(f"Without interning: {plain_bytes / 2**20:8.1f} MiB  {plain_s:6.2f}s")
+    print(f"With interning:    {interned_bytes / 2**20:8.1f} MiB  {interned_s:6.2f}s")
+    print(f"Saved:             {saved / 2**20:8.1f} MiB  ({saved / plain_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
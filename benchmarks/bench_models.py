@@ -0,0 +1,63 @@
+"""Compare model (de)serialisation strategies.
+
+Usage::
+
+    python benchmarks/bench_models.py [--number 20000]
+
+For every curated model (``teamleader/models/``) it times the hand-written
+``from_api`` and ``to_dict`` plus :func:`dataclasses.asdict`.  For a sample of
+generated ``_*Base`` classes it times the codegen-emitted ``from_api`` and
+``to_dict`` against :func:`dataclasses.asdict` on the same instance.
+
+Figures are microseconds per call (best of five repeats).
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Make the repo root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import teamleader._generated.models as generated
+import teamleader.models as curated
+from benchmarks._payloads import CURATED, GENERATED
+
+
+def _best_us(fn: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def _row(label: str, cls: Any, payload: dict[str, Any], number: int) -> None:
+    obj = cls.from_api(payload)
+    parse = _best_us(lambda: cls.from_api(payload), number)
+    to_dict = _best_us(obj.to_dict, number)
+    asdict = _best_us(lambda: dataclasses.asdict(obj), number)
+    print(f"{label:<28} {parse:10.2f} {to_dict:10.2f} {asdict:10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    header = f"{'model':<28} {'from_api':>10} {'to_dict':>10} {'asdict':>10}"
+    print("Curated (hand-written) — µs per call")
+    print(header)
+    for name, payload in CURATED.items():
+        _row(name, getattr(curated, name), payload, args.number)
+
+    print("\nGenerated (codegen-emitted) — µs per call")
+    print(header)
+    for name, payload in GENERATED.items():
+        _row(name, getattr(generated, name), payload, args.number)
+
+
+if __name__ == "__main__":
+    main()
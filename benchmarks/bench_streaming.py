@@ -0,0 +1,75 @@
+"""Compare buffered and streamed parsing of a large ``invoices.list`` page.
+
+Usage::
+
+    python benchmarks/bench_streaming.py [--size 100] [--chunk 65536]
+
+Buffered mode joins the whole body and decodes it in one go (what
+``_post`` does); streamed mode feeds the same bytes chunk by chunk through
+:class:`~teamleader.streaming.ListStream`.  Reported per mode: time to the
+first item, time to the last item, and peak traced memory while consuming
+the page one item at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Make the repo root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks._payloads import INVOICE, list_page
+from teamleader.streaming import ListStream
+
+
+def _buffered(chunks: list[bytes]) -> Iterator[dict[str, Any]]:
+    yield from json.loads(b"".join(chunks))["data"]
+
+
+def _streamed(chunks: list[bytes]) -> Iterator[dict[str, Any]]:
+    return ListStream(iter(chunks))
+
+
+def _measure(
+    mode: Callable[[list[bytes]], Iterator[dict[str, Any]]], chunks: list[bytes]
+) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    items = mode(chunks)
+    next(items)
+    first = time.perf_counter() - start
+    for _ in items:
+        pass
+    last = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in mode(chunks):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first * 1000, last * 1000, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    body = json.dumps(list_page(INVOICE, args.size)).encode()
+    chunks = [body[i : i + args.chunk] for i in range(0, len(body), args.chunk)]
+    print(f"invoices.list page: {args.size} items, {len(body) / 1024:.0f} KiB\n")
+    print(f"{'mode':<10} {'first ms':>10} {'last ms':>10} {'peak KiB':>10}")
+    for label, mode in (("buffered", _buffered), ("streamed", _streamed)):
+        first, last, peak = _measure(mode, chunks)
+        print(f"{label:<10} {first:10.2f} {last:10.2f} {peak:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Benchmark suite for the SDK hot paths, with JSON results and baseline comparison.
+
+Usage::
+
+    python benchmarks/suite.py [--output results.json] [--baseline base.json]
+                               [--threshold 0.2] [--filter models.] [--quick]
+
+Cases (microseconds per operation, best of ``--repeat`` runs):
+
+``models.<Model>.from_api`` / ``models.<Model>.to_dict``
+    Deserialisation and serialisation of every curated model.
+``resources.<prefix>.list``
+    One 100-item ``CrudResource.list`` page, fetched from
+    :class:`~teamleader.testing.FakeTeamleader` and hydrated into models.
+``resources.<prefix>.iterate``
+    A full ``iterate()`` over 500 records (5 pages), buffered and streamed.
+``tokens.memory`` / ``tokens.database``
+    ``OAuth2Handler.get_valid_token()`` through :class:`MemoryTokenBackend`
+    and, when Django is installed, :class:`DatabaseTokenBackend` on in-memory
+    SQLite and :class:`TieredTokenBackend` over it (``tokens.tiered``).
+``client.call``
+    ``client.call("users.me")`` against the fake server — the per-call
+    overhead of auth headers, encoding, routing and decoding.
+``replay.<prefix>.iterate``
+    The ``resources.<prefix>.iterate`` traffic, recorded to a
+    :class:`~teamleader.cassette.Cassette` and replayed through
+    :class:`~teamleader.cassette.ReplayTransport` — the client-side cost
+    alone, without the fake server's routing.
+
+``--output`` writes the results as JSON.  ``--baseline`` compares against
+an earlier results file: a case is a regression when it is more than
+``--threshold`` (default 20 %) slower than the baseline, and the script
+exits with status 1 if any case regressed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Make the repo root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import teamleader
+import teamleader.models as curated
+from benchmarks._payloads import CURATED
+from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token, TokenBackend
+from teamleader.cassette import Cassette, RecordingTransport, ReplayTransport
+from teamleader.client import TeamleaderClient
+from teamleader.testing import FakeTeamleader, FakeTransport
+
+#: Bumped whenever the JSON layout changes.
+SCHEMA_VERSION = 1
+
+#: Curated model name → resource attribute / API prefix.
+_PREFIXES: dict[str, str] = {
+    "Contact": "contacts",
+    "Company": "companies",
+    "Deal": "deals",
+    "Invoice": "invoices",
+    "Quotation": "quotations",
+}
+
+
+@dataclass
+class Case:
+    """One benchmark: *fn* is timed *number* times per repeat."""
+
+    name: str
+    fn: Callable[[], Any]
+    number: int
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+
+def _model_cases() -> Iterator[Case]:
+    for name, payload in CURATED.items():
+        cls = getattr(curated, name)
+        obj = cls.from_api(payload)
+        yield Case(
+            f"models.{name}.from_api", lambda c=cls, p=payload: c.from_api(p), 5000
+        )
+        yield Case(f"models.{name}.to_dict", obj.to_dict, 5000)
+
+
+def _resource_cases() -> Iterator[Case]:
+    server = FakeTeamleader()
+    client = server.client()
+    for name, prefix in _PREFIXES.items():
+        payload = CURATED[name]
+        server.seed(prefix, [{**payload, "id": f"{prefix}-{i}"} for i in range(500)])
+        resource = getattr(client, prefix)
+        yield Case(
+            f"resources.{prefix}.list",
+            lambda r=resource: r.list(page_size=100),
+            20,
+        )
+        yield Case(
+            f"resources.{prefix}.iterate",
+            lambda r=resource: sum(1 for _ in r.iterate(page_size=100)),
+            5,
+        )
+        yield Case(
+            f"resources.{prefix}.iterate_stream",
+            lambda r=resource: sum(1 for _ in r.iterate(page_size=100, stream=True)),
+            5,
+        )
+
+
+def _handler(backend: TokenBackend) -> OAuth2Handler:
+    backend.save(
+        Token(
+            access_token="bench-access",
+            refresh_token="bench-refresh",
+            expires_at=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        )
+    )
+    return OAuth2Handler("bench", "bench", "http://localhost/callback", backend)
+
+
+def _setup_django() -> bool:
+    """Configure Django on in-memory SQLite; ``False`` if Django is unavailable."""
+    try:
+        import django
+        from django.conf import settings
+    except ImportError:
+        return False
+    if not settings.configured:
+        settings.configure(
+            DATABASES={
+                "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+            },
+            INSTALLED_APPS=["teamleader.django"],
+            USE_TZ=True,
+            TEAMLEADER={
+                "CLIENT_ID": "bench",
+                "CLIENT_SECRET": "bench",
+                "REDIRECT_URI": "http://localhost/callback",
+                "SCOPES": [],
+            },
+        )
+        django.setup()
+    from django.db import connection
+
+    from teamleader.django.models import TeamleaderToken
+
+    if TeamleaderToken._meta.db_table not in connection.introspection.table_names():
+        with connection.schema_editor() as editor:
+            editor.create_model(TeamleaderToken)
+    return True
+
+
+def _token_cases() -> Iterator[Case]:
+    memory = _handler(MemoryTokenBackend())
+    yield Case("tokens.memory", memory.get_valid_token, 20000)
+    if _setup_django():
+        from teamleader.django.token_store import (
+            DatabaseTokenBackend,
+            TieredTokenBackend,
+        )
+
+        database = _handler(DatabaseTokenBackend())
+        yield Case("tokens.database", database.get_valid_token, 500)
+        tiered = _handler(TieredTokenBackend())
+        yield Case("tokens.tiered", tiered.get_valid_token, 5000)
+
+
+def _client_cases() -> Iterator[Case]:
+    client = FakeTeamleader().client()
+    yield Case("client.call", lambda: client.call("users.me"), 2000)
+
+
+def _replay_cases() -> Iterator[Case]:
+    server = FakeTeamleader()
+    for name, prefix in _PREFIXES.items():
+        payload = CURATED[name]
+        server.seed(prefix, [{**payload, "id": f"{prefix}-{i}"} for i in range(500)])
+        cassette = Cassette()
+        recorder = RecordingTransport(cassette, FakeTransport(server))
+        recording = TeamleaderClient(server.client()._auth, transport=recorder)
+        list(getattr(recording, prefix).iterate(page_size=100))
+
+        replay = TeamleaderClient(
+            server.client()._auth, transport=ReplayTransport(cassette, cycle=True)
+        )
+        yield Case(
+            f"replay.{prefix}.iterate",
+            lambda r=getattr(replay, prefix): sum(1 for _ in r.iterate(page_size=100)),
+            5,
+        )
+
+
+def cases() -> list[Case]:
+    """Build every benchmark case (servers are seeded and Django set up here)."""
+    return [
+        *_model_cases(),
+        *_resource_cases(),
+        *_token_cases(),
+        *_client_cases(),
+        *_replay_cases(),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Running and comparing
+# ---------------------------------------------------------------------------
+
+
+def run(selected: list[Case], *, repeat: int = 5, scale: float = 1.0) -> dict[str, Any]:
+    """Time *selected* cases and return the JSON-ready results document."""
+    results: dict[str, dict[str, float | int]] = {}
+    for case in selected:
+        number = max(1, int(case.number * scale))
+        case.fn()  # warm-up: lazy imports, caches
+        timings = [
+            t / number * 1e6
+            for t in timeit.repeat(case.fn, number=number, repeat=repeat)
+        ]
+        results[case.name] = {
+            "best_us": round(min(timings), 3),
+            "median_us": round(statistics.median(timings), 3),
+            "number": number,
+            "repeat": repeat,
+        }
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+        "sdk_version": teamleader.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], *, threshold: float = 0.2
+) -> list[tuple[str, float | None, float, str]]:
+    """Compare two results documents on ``best_us``.
+
+    Returns ``(name, baseline_us, current_us, status)`` rows, where status is
+    ``"regression"`` (slower than ``baseline * (1 + threshold)``),
+    ``"improvement"`` (faster than ``baseline * (1 - threshold)``), ``"ok"``,
+    or ``"new"`` for cases missing from the baseline.
+    """
+    rows: list[tuple[str, float | None, float, str]] = []
+    for name, result in current["results"].items():
+        now = float(result["best_us"])
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            rows.append((name, None, now, "new"))
+            continue
+        base = float(before["best_us"])
+        if now > base * (1 + threshold):
+            status = "regression"
+        elif now < base * (1 - threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, base, now, status))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument(
+        "--filter", default="", help="only run cases containing this text"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="run 10%% of the iterations"
+    )
+    args = parser.parse_args(argv)
+
+    selected = [c for c in cases() if args.filter in c.name]
+    current = run(selected, repeat=args.repeat, scale=0.1 if args.quick else 1.0)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+
+    if not args.baseline:
+        print(f"{'case':<40} {'best µs':>12} {'median µs':>12}")
+        for name, result in current["results"].items():
+            print(f"{name:<40} {result['best_us']:12.2f} {result['median_us']:12.2f}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    rows = compare(current, baseline, threshold=args.threshold)
+    header = f"{'case':<40} {'baseline µs':>12} {'current µs':>12} {'change':>8}"
+    print(f"{header}  status")
+    for name, base, now, status in rows:
+        before = f"{base:12.2f}" if base is not None else f"{'—':>12}"
+        change = f"{(now / base - 1) * 100:+7.1f}%" if base else f"{'':>8}"
+        print(f"{name:<40} {before} {now:12.2f} {change}  {status}")
+    return 1 if any(status == "regression" for *_, status in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
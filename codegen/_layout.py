@@ -0,0 +1,55 @@
+"""Shared helpers for laying out the per-tag ``_generated/`` packages.
+
+The endpoint and model generators both split their output into one module
+per OpenAPI tag so that importing the SDK only loads a small index; the
+per-tag modules are imported on first use.
+"""
+
+from __future__ import annotations
+
+import keyword
+import re
+from pathlib import Path
+from typing import Any
+
+#: Module that collects schemas not owned by a single operation.
+COMMON_MODULE = "common"
+
+
+def tag_module_name(tag: str) -> str:
+    """Return *tag* as a safe lowercase module name.
+
+    E.g. ``"projects-v2"`` → ``"projects_v2"``.
+    """
+    name = re.sub(r"\W", "_", tag.strip().lower()) or "untagged"
+    if name[0].isdigit() or keyword.iskeyword(name) or name == COMMON_MODULE:
+        name = f"tag_{name}"
+    return name
+
+
+def operation_tags(spec: dict[str, Any]) -> dict[str, str]:
+    """Return ``operationId → first tag`` for every operation in the spec."""
+    tags: dict[str, str] = {}
+    for path_item in spec.get("paths", {}).values():
+        for operation in path_item.values():
+            if not isinstance(operation, dict):
+                continue
+            operation_id = operation.get("operationId", "")
+            if operation_id:
+                op_tags = operation.get("tags", [])
+                tags[operation_id] = op_tags[0] if op_tags else ""
+    return tags
+
+
+def reset_package(directory: Path, legacy_module: Path) -> None:
+    """Prepare *directory* for a fresh generator run.
+
+    Removes the single-file module the package replaces (*legacy_module*)
+    and every previously generated ``.py`` file, so tags dropped from the
+    spec do not leave stale modules behind.
+    """
+    if legacy_module.exists():
+        legacy_module.unlink()
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("*.py"):
+        stale.unlink()
@@ -4,6 +4,9 @@ Downloads the ``@teamleader/focus-api-specification`` package tarball
 directly over HTTP (no npm CLI required), extracts the dereferenced
 YAML spec, caches it to ``codegen/spec/api.yaml``, and returns the
 parsed dict plus the spec version string.
+
+:func:`load_cached_spec` re-reads the committed snapshot instead, for
+regenerating the ``_generated/`` layer offline after a generator change.
 """
 
 from __future__ import annotations
@@ -63,3 +66,15 @@ def fetch_spec() -> tuple[dict[str, Any], str]:
 
     spec: dict[str, Any] = yaml.safe_load(raw_yaml)
     return spec, version
+
+
+def load_cached_spec() -> tuple[dict[str, Any], str]:
+    """Return ``(spec_dict, version_string)`` from ``codegen/spec/api.yaml``.
+
+    The version is read from the spec's own ``info.version`` field.
+    """
+    print(f"Loading cached spec from {SPEC_CACHE_PATH} …")
+    spec: dict[str, Any] = yaml.safe_load(SPEC_CACHE_PATH.read_bytes())
+    version: str = spec.get("info", {}).get("version", "unknown")
+    print(f"  version    : {version}")
+    return spec, version
@@ -2,10 +2,13 @@
 
 Usage::
 
-    python codegen/generate.py
+    python codegen/generate.py [--offline]
 
 Fetches the latest ``@teamleader/focus-api-specification`` from npm,
-regenerates all three ``_generated/`` files, and prints a summary.
+regenerates the enums module and the per-tag ``endpoints/``, ``models/``
+and ``validators/`` packages under ``_generated/``, and prints a summary.
+With ``--offline`` the committed ``codegen/spec/api.yaml`` snapshot is used
+instead — handy after changing a generator without bumping the spec.
 
 After running, review changes and run tests before committing::
 
@@ -15,6 +18,7 @@ After running, review changes and run tests before committing::
 
 from __future__ import annotations
 
+import argparse
 import sys
 import time
 from pathlib import Path
@@ -22,25 +26,35 @@ from pathlib import Path
 # Make the repo root importable when run as a script
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from codegen.fetch_spec import fetch_spec
+from codegen.fetch_spec import fetch_spec, load_cached_spec
 from codegen.generate_endpoints import generate_endpoints
 from codegen.generate_enums import generate_enums
 from codegen.generate_models import generate_models
+from codegen.generate_validators import generate_validators
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate teamleader/_generated/.")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="use the committed codegen/spec/api.yaml instead of fetching from npm",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Teamleader SDK — code generator")
     print("=" * 60)
 
     t0 = time.monotonic()
 
-    spec, version = fetch_spec()
+    spec, version = load_cached_spec() if args.offline else fetch_spec()
 
     print(f"\nGenerating from spec v{version} …")
     generate_enums(spec, version)
     generate_models(spec, version)
     generate_endpoints(spec, version)
+    generate_validators(spec, version)
 
     elapsed = time.monotonic() - t0
     print(f"\nDone in {elapsed:.1f}s")
@@ -1,10 +1,17 @@
-"""Generate ``teamleader/_generated/endpoints.py`` from the OpenAPI spec.
+"""Generate the ``teamleader/_generated/endpoints/`` package from the OpenAPI spec.
 
 Walks ``spec["paths"]`` and emits:
 
-- A frozen ``@dataclass`` called ``Endpoint`` describing a single operation.
-- A module-level ``ENDPOINTS: dict[str, Endpoint]`` mapping ``operationId``
-  to its ``Endpoint``.
+- ``__init__.py`` — a frozen, slotted ``@dataclass`` called ``Endpoint``
+  describing a single operation, an ``operationId → tag module`` index, and a
+  lazy ``ENDPOINTS`` mapping over that index.
+- ``<tag>.py`` — one module per spec tag holding that tag's endpoints as a
+  tuple of plain rows, turned into ``ENDPOINTS: dict[str, Endpoint]`` on
+  import.  Only imported when one of its endpoints is first looked up, which
+  keeps ``import teamleader`` cheap.
+- ``_descriptions.py`` — the operation descriptions, imported only when
+  ``Endpoint.description`` is read (docs, error messages), so the long
+  strings never sit in a worker that only makes calls.
 
 All Teamleader Focus API paths use POST.  Parameters live in the request
 body (``requestBody.content.application/json.schema``), which is either a
@@ -13,31 +20,46 @@ direct object schema or wrapped in ``allOf[0]``.
 
 from __future__ import annotations
 
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-OUTPUT_PATH = (
-    Path(__file__).parent.parent / "teamleader" / "_generated" / "endpoints.py"
-)
+from codegen._layout import reset_package, tag_module_name
 
-_FILE_HEADER = """\
+OUTPUT_DIR = Path(__file__).parent.parent / "teamleader" / "_generated" / "endpoints"
+LEGACY_OUTPUT_PATH = OUTPUT_DIR.with_suffix(".py")
+
+_HEADER = """\
 # ============================================================
 # AUTO-GENERATED — DO NOT EDIT BY HAND
 # Run `python codegen/generate.py` to regenerate.
 # Spec version: {version}
 # Generated at: {timestamp}
 # ============================================================
+"""
 
+_INDEX_BODY = """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import importlib
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
 
+# Most operations share one of a handful of required-parameter sets
+# (``{"id"}``, the empty set, …); keep a single frozenset for each.
+_REQUIRED_SETS: dict[tuple[str, ...], frozenset[str]] = {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Endpoint:
-    \"\"\"Metadata for a single Teamleader Focus API operation.\"\"\"
+    \"\"\"Metadata for a single Teamleader Focus API operation.
+
+    ``request_path`` (``path`` without its leading slash, as passed to the
+    client's ``_post``) and ``required`` (``required_params`` as a frozenset)
+    are computed once at construction so ``call()`` does no per-call string
+    or list work.  ``description`` is loaded on first access.
+    \"\"\"
 
     operation_id: str
     method: str
@@ -45,14 +67,113 @@ class Endpoint:
     tag: str
     required_params: tuple[str, ...]
     optional_params: tuple[str, ...]
-    description: str = ""
+    request_path: str = field(init=False, repr=False, compare=False)
+    required: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "request_path", sys.intern(self.path.lstrip("/")))
+        required = _REQUIRED_SETS.setdefault(
+            self.required_params, frozenset(self.required_params)
+        )
+        object.__setattr__(self, "required", required)
+
+    @property
+    def description(self) -> str:
+        \"\"\"Human-readable description from the spec (loaded lazily).\"\"\"
+        from teamleader._generated.endpoints._descriptions import DESCRIPTIONS
+
+        return DESCRIPTIONS.get(self.operation_id, "")
+
+
+def _table(
+    tag: str, rows: Iterable[tuple[str, str, str, tuple[str, ...], tuple[str, ...]]]
+) -> dict[str, Endpoint]:
+    \"\"\"Build a tag module's ``ENDPOINTS`` from its rows of ``Endpoint`` fields.\"\"\"
+    table: dict[str, Endpoint] = {}
+    for operation_id, method, path, required_params, optional_params in rows:
+        operation_id = sys.intern(operation_id)
+        table[operation_id] = Endpoint(
+            operation_id, method, path, tag, required_params, optional_params
+        )
+    return table
+
+
+class _LazyEndpoints(Mapping[str, Endpoint]):
+    \"\"\"Read-only ``operation_id → Endpoint`` mapping backed by per-tag modules.
+
+    Membership, ``len()`` and iteration only consult the index below; the
+    tag module defining an endpoint is imported the first time that endpoint
+    is looked up.
+    \"\"\"
+
+    def __init__(self, index: dict[str, str]) -> None:
+        self._index = index
+        self._loaded: dict[str, Endpoint] = {}
+
+    def __getitem__(self, operation_id: str) -> Endpoint:
+        endpoint = self._loaded.get(operation_id)
+        if endpoint is None:
+            module = importlib.import_module(f"{__name__}.{self._index[operation_id]}")
+            self._loaded.update(module.ENDPOINTS)
+            endpoint = self._loaded[operation_id]
+        return endpoint
+
+    def get(  # type: ignore[override]
+        self, operation_id: str, default: Endpoint | None = None
+    ) -> Endpoint | None:
+        endpoint = self._loaded.get(operation_id)
+        if endpoint is not None:
+            return endpoint
+        if operation_id not in self._index:
+            return default
+        return self[operation_id]
+
+    def __contains__(self, operation_id: object) -> bool:
+        return operation_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# operation ID → tag module defining its Endpoint
+# fmt: off
+_OPERATION_MODULES: dict[str, str] = {
+"""
+
+_INDEX_FOOTER = """\
+}
+# fmt: on
+
+ENDPOINTS: Mapping[str, Endpoint] = _LazyEndpoints(_OPERATION_MODULES)
+"""
+
+_TAG_BODY = """
+from __future__ import annotations
 
+from teamleader._generated.endpoints import _table
 
+# (operation_id, method, path, required_params, optional_params)
 # fmt: off
-ENDPOINTS: dict[str, Endpoint] = {{
+ENDPOINTS = _table({tag}, (
 """
 
-_FILE_FOOTER = """\
+_TAG_FOOTER = """\
+))
+# fmt: on
+"""
+
+_DESCRIPTIONS_BODY = """
+from __future__ import annotations
+
+# operation ID → description, read by Endpoint.description
+# fmt: off
+DESCRIPTIONS: dict[str, str] = {
+"""
+
+_DESCRIPTIONS_FOOTER = """\
 }
 # fmt: on
 """
@@ -86,17 +207,28 @@ def _safe_repr(s: str) -> str:
     return repr(s)
 
 
+def _tuple_repr(items: list[str]) -> str:
+    """Return a tuple literal for *items*, with the trailing comma a 1-tuple needs."""
+    inner = ", ".join(_safe_repr(item) for item in items)
+    return f"({inner},)" if len(items) == 1 else f"({inner})"
+
+
 # ---------------------------------------------------------------------------
 # Main generator
 # ---------------------------------------------------------------------------
 
 
 def generate_endpoints(spec: dict[str, Any], version: str) -> None:
-    """Write endpoint definitions to ``teamleader/_generated/endpoints.py``."""
+    """Write endpoint definitions to ``teamleader/_generated/endpoints/``."""
     paths: dict[str, Any] = spec.get("paths", {})
 
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    lines: list[str] = [_FILE_HEADER.format(version=version, timestamp=timestamp)]
+    header = _HEADER.format(version=version, timestamp=timestamp)
+
+    index_lines: list[str] = []
+    description_lines: list[str] = []
+    tag_lines: dict[str, list[str]] = {}
+    module_tags: dict[str, str] = {}
 
     endpoint_count = 0
     for path in sorted(paths):
@@ -111,9 +243,8 @@ def generate_endpoints(spec: dict[str, Any], version: str) -> None:
 
             tags: list[str] = operation.get("tags", [])
             tag = tags[0] if tags else ""
+            module_name = tag_module_name(tag)
             description: str = operation.get("description", "").strip()
-            # Escape description for repr
-            description = description.replace("\\", "\\\\").replace('"', '\\"')
 
             # Extract required / optional params from body schema
             body_schema = _extract_body_schema(operation)
@@ -129,25 +260,43 @@ def generate_endpoints(spec: dict[str, Any], version: str) -> None:
                     else:
                         optional_params.append(param_name)
 
-            req_tuple = "(" + ", ".join(_safe_repr(p) for p in required_params)
-            req_tuple += ("," if len(required_params) == 1 else "") + ")"
-            opt_tuple = "(" + ", ".join(_safe_repr(p) for p in optional_params)
-            opt_tuple += ("," if len(optional_params) == 1 else "") + ")"
-
-            lines.append(f"    {_safe_repr(operation_id)}: Endpoint(")
-            lines.append(f"        operation_id={_safe_repr(operation_id)},")
-            lines.append(f"        method={_safe_repr(http_method.upper())},")
-            lines.append(f"        path={_safe_repr(path)},")
-            lines.append(f"        tag={_safe_repr(tag)},")
-            lines.append(f"        required_params={req_tuple},")
-            lines.append(f"        optional_params={opt_tuple},")
-            lines.append(f"        description={_safe_repr(description)},")
-            lines.append("    ),")
+            index_lines.append(
+                f"    {_safe_repr(operation_id)}: {_safe_repr(module_name)},"
+            )
+            if description:
+                description_lines.append(
+                    f"    {_safe_repr(operation_id)}: {_safe_repr(description)},"
+                )
+
+            module_tags[module_name] = tag
+            tag_lines.setdefault(module_name, []).append(
+                f"    ({_safe_repr(operation_id)}, {_safe_repr(http_method.upper())}, "
+                f"{_safe_repr(path)}, {_tuple_repr(required_params)}, "
+                f"{_tuple_repr(optional_params)}),"
+            )
 
             endpoint_count += 1
 
-    lines.append(_FILE_FOOTER)
-
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text("\n".join(lines), encoding="utf-8")
-    print(f"  Wrote {endpoint_count} endpoints → {OUTPUT_PATH.name}")
+    reset_package(OUTPUT_DIR, LEGACY_OUTPUT_PATH)
+    (OUTPUT_DIR / "__init__.py").write_text(
+        header + _INDEX_BODY + "\n".join(index_lines) + "\n" + _INDEX_FOOTER,
+        encoding="utf-8",
+    )
+    descriptions = "\n".join(description_lines)
+    (OUTPUT_DIR / "_descriptions.py").write_text(
+        header + _DESCRIPTIONS_BODY + descriptions + "\n" + _DESCRIPTIONS_FOOTER,
+        encoding="utf-8",
+    )
+    for module_name, lines in sorted(tag_lines.items()):
+        (OUTPUT_DIR / f"{module_name}.py").write_text(
+            header
+            + _TAG_BODY.format(tag=_safe_repr(module_tags[module_name]))
+            + "\n".join(lines)
+            + "\n"
+            + _TAG_FOOTER,
+            encoding="utf-8",
+        )
+    print(
+        f"  Wrote {endpoint_count} endpoints in {len(tag_lines)} tag modules "
+        f"→ {OUTPUT_DIR.name}/"
+    )
@@ -1,8 +1,16 @@
-"""Generate ``teamleader/_generated/models.py`` from the OpenAPI spec.
+"""Generate the ``teamleader/_generated/models/`` package from the OpenAPI spec.
 
 Walks ``spec["components"]["schemas"]`` for object-type schemas and
 emits a ``@dataclass`` named ``_<ModelName>Base`` for each one.
 
+Classes are split into one module per spec tag: an operation's
+``<operationId>request`` / ``<operationId>response`` schemas go to that
+operation's tag module, shared schemas to ``common.py``.  The package
+``__init__.py`` only holds a ``class name → module`` index and a module-level
+``__getattr__`` that imports the owning module on first access, so
+``from teamleader._generated.models import _DealsCreaterequestBase`` only
+loads the ``deals`` module.
+
 Field-ordering rule (required by Python dataclasses):
   1. Required, non-nullable, non-array fields  — no default
   2. Required, nullable fields                  — ``| None``  (no default,
@@ -12,6 +20,16 @@ Field-ordering rule (required by Python dataclasses):
 
 ``allOf`` / ``oneOf`` in a property fall back to ``dict[str, Any]``.
 Schemas that are only ``oneOf`` at the top level are skipped.
+
+Every class also gets a specialised ``from_api()`` classmethod and
+``to_dict()`` method.  Both are emitted as straight-line code — one
+``data.get(...)`` / ``if ... is not None`` per field, no ``dataclasses.fields()``
+reflection at runtime — so they cost the same as a hand-written version:
+
+- ``from_api`` reads every property by its wire name; arrays fall back to a
+  fresh ``[]`` when absent or ``null``.
+- ``to_dict`` always emits required fields, emits optional scalars only when
+  they are not ``None`` and optional arrays only when non-empty.
 """
 
 from __future__ import annotations
@@ -22,21 +40,63 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-OUTPUT_PATH = Path(__file__).parent.parent / "teamleader" / "_generated" / "models.py"
+from codegen._layout import (
+    COMMON_MODULE,
+    operation_tags,
+    reset_package,
+    tag_module_name,
+)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "teamleader" / "_generated" / "models"
+LEGACY_OUTPUT_PATH = OUTPUT_DIR.with_suffix(".py")
 
-_FILE_HEADER = """\
+_HEADER = """\
 # ============================================================
 # AUTO-GENERATED — DO NOT EDIT BY HAND
 # Run `python codegen/generate.py` to regenerate.
 # Spec version: {version}
 # Generated at: {timestamp}
 # ============================================================
+"""
 
+_INDEX_BODY = """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import importlib
 from typing import Any
 
+# class name → tag module defining it
+# fmt: off
+_CLASS_MODULES: dict[str, str] = {
+"""
+
+_INDEX_FOOTER = """\
+}
+# fmt: on
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CLASS_MODULES})
+"""
+
+_MODULE_BODY = """
+from __future__ import annotations
+
+from dataclasses import {dataclass_imports}
+from typing import Any, Self
+
+
 """
 
 
@@ -105,17 +165,99 @@ def _is_nullable(prop: dict[str, Any]) -> bool:
     return bool(prop.get("nullable", False))
 
 
+def _schema_module(
+    schema_name: str,
+    op_tags: dict[str, str],
+    prefix_tags: dict[str, str],
+) -> str:
+    """Return the tag module that owns *schema_name*.
+
+    ``<operationId>request`` / ``<operationId>response`` schemas belong to the
+    operation's tag; other dotted names (``projects.listrequest``) fall back to
+    the tag of any operation sharing their prefix.  Everything else is shared.
+    """
+    for suffix in ("request", "response"):
+        if schema_name.endswith(suffix):
+            tag = op_tags.get(schema_name[: -len(suffix)])
+            if tag is not None:
+                return tag_module_name(tag)
+    if "." in schema_name:
+        tag = prefix_tags.get(schema_name.split(".", 1)[0])
+        if tag is not None:
+            return tag_module_name(tag)
+    return COMMON_MODULE
+
+
+def _emit_from_api(fields: list[tuple[str, str, str]]) -> list[str]:
+    """Return the source lines of a flat ``from_api`` classmethod.
+
+    *fields* holds ``(field_name, wire_name, kind)`` in dataclass order, where
+    *kind* is ``"required"``, ``"optional"`` or ``"array"``.  Required
+    non-nullable fields are indexed directly so a malformed payload raises
+    ``KeyError`` instead of building a model holding ``None``.
+    """
+    lines = [
+        "    @classmethod",
+        "    def from_api(cls, data: dict[str, Any]) -> Self:",
+        "        return cls(",
+    ]
+    for fname, wire, kind in fields:
+        if kind == "required":
+            lines.append(f"            {fname}=data[{wire!r}],")
+        elif kind == "array":
+            lines.append(f"            {fname}=data.get({wire!r}) or [],")
+        else:
+            lines.append(f"            {fname}=data.get({wire!r}),")
+    lines.append("        )")
+    return lines
+
+
+def _emit_to_dict(
+    required: list[tuple[str, str]],
+    optional_scalar: list[tuple[str, str]],
+    optional_array: list[tuple[str, str]],
+) -> list[str]:
+    """Return the source lines of a flat ``to_dict`` method.
+
+    Each list holds ``(field_name, wire_name)`` pairs.
+    """
+    lines = ["    def to_dict(self) -> dict[str, Any]:"]
+    if required:
+        lines.append("        out: dict[str, Any] = {")
+        for fname, wire in required:
+            lines.append(f"            {wire!r}: self.{fname},")
+        lines.append("        }")
+    else:
+        lines.append("        out: dict[str, Any] = {}")
+    for fname, wire in optional_scalar:
+        lines.append(f"        if self.{fname} is not None:")
+        lines.append(f"            out[{wire!r}] = self.{fname}")
+    for fname, wire in optional_array:
+        lines.append(f"        if self.{fname}:")
+        lines.append(f"            out[{wire!r}] = self.{fname}")
+    lines.append("        return out")
+    return lines
+
+
 # ---------------------------------------------------------------------------
 # Main generator
 # ---------------------------------------------------------------------------
 
 
 def generate_models(spec: dict[str, Any], version: str) -> None:
-    """Write model base dataclasses to ``teamleader/_generated/models.py``."""
+    """Write model base dataclasses to the ``teamleader/_generated/models/`` package."""
     schemas: dict[str, Any] = spec.get("components", {}).get("schemas", {})
 
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    lines: list[str] = [_FILE_HEADER.format(version=version, timestamp=timestamp)]
+    header = _HEADER.format(version=version, timestamp=timestamp)
+
+    op_tags = operation_tags(spec)
+    prefix_tags: dict[str, str] = {}
+    for operation_id, tag in sorted(op_tags.items()):
+        prefix_tags.setdefault(operation_id.split(".", 1)[0], tag)
+
+    index_lines: list[str] = []
+    module_lines: dict[str, list[str]] = {}
 
     model_count = 0
     for schema_name in sorted(schemas):
@@ -132,6 +274,9 @@ def generate_models(spec: dict[str, Any], version: str) -> None:
             continue
 
         class_name = f"_{_schema_to_class_name(schema_name)}Base"
+        module_name = _schema_module(schema_name, op_tags, prefix_tags)
+        index_lines.append(f"    {class_name!r}: {module_name!r},")
+        lines = module_lines.setdefault(module_name, [])
         required_keys: set[str] = set(schema.get("required", []))
 
         # Partition fields into four buckets to satisfy dataclass ordering
@@ -139,6 +284,8 @@ def generate_models(spec: dict[str, Any], version: str) -> None:
         req_nullable: list[tuple[str, str]] = []    # | None, no default
         opt_scalar: list[tuple[str, str]] = []      # | None = None
         opt_array: list[tuple[str, str]] = []       # list[...] = field(...)
+        # field name → (wire name, required) for the emitted from_api / to_dict
+        wire_names: dict[str, tuple[str, bool]] = {}
 
         for prop_name, prop_schema in props.items():
             field_name = _safe_field_name(prop_name)
@@ -146,6 +293,7 @@ def generate_models(spec: dict[str, Any], version: str) -> None:
             is_req = prop_name in required_keys
             nullable = _is_nullable(prop_schema)
             is_arr = _is_array(prop_schema)
+            wire_names[field_name] = (prop_name, is_req)
 
             if is_arr:
                 # Arrays always get default_factory — go last regardless of required
@@ -175,11 +323,53 @@ def generate_models(spec: dict[str, Any], version: str) -> None:
         # If all fields have defaults (no required plain/nullable), add sentinel
         if not req_plain and not req_nullable and not opt_scalar and not opt_array:
             lines.append("    pass")
+        else:
+            ordered: list[tuple[str, str, str]] = (
+                [(fname, wire_names[fname][0], "required") for fname, _ in req_plain]
+                + [
+                    (fname, wire_names[fname][0], "optional")
+                    for fname, _ in (*req_nullable, *opt_scalar)
+                ]
+                + [(fname, wire_names[fname][0], "array") for fname, _ in opt_array]
+            )
+            required_out = [
+                (fname, wire_names[fname][0])
+                for fname, _ in (*req_plain, *req_nullable, *opt_array)
+                if wire_names[fname][1]
+            ]
+            optional_scalar_out = [
+                (fname, wire_names[fname][0]) for fname, _ in opt_scalar
+            ]
+            optional_array_out = [
+                (fname, wire_names[fname][0])
+                for fname, _ in opt_array
+                if not wire_names[fname][1]
+            ]
+            lines.append("")
+            lines.extend(_emit_from_api(ordered))
+            lines.append("")
+            lines.extend(
+                _emit_to_dict(required_out, optional_scalar_out, optional_array_out)
+            )
 
         lines.append("")
         lines.append("")
         model_count += 1
 
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text("\n".join(lines), encoding="utf-8")
-    print(f"  Wrote {model_count} model base classes → {OUTPUT_PATH.name}")
+    reset_package(OUTPUT_DIR, LEGACY_OUTPUT_PATH)
+    (OUTPUT_DIR / "__init__.py").write_text(
+        header + _INDEX_BODY + "\n".join(index_lines) + "\n" + _INDEX_FOOTER,
+        encoding="utf-8",
+    )
+    for module_name, lines in sorted(module_lines.items()):
+        body = "\n".join(lines).rstrip("\n") + "\n"
+        # Modules without array fields never call field().
+        imports = "dataclass, field" if "field(default_factory" in body else "dataclass"
+        (OUTPUT_DIR / f"{module_name}.py").write_text(
+            header + _MODULE_BODY.format(dataclass_imports=imports) + body,
+            encoding="utf-8",
+        )
+    print(
+        f"  Wrote {model_count} model base classes in {len(module_lines)} tag "
+        f"modules → {OUTPUT_DIR.name}/"
+    )
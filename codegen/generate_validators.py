@@ -0,0 +1,458 @@
+"""Generate the ``teamleader/_generated/validators/`` package from the OpenAPI spec.
+
+Each operation's request-body schema is compiled ahead of time into a plain
+Python function that appends a human-readable message to an ``errors`` list
+for every problem it finds::
+
+    def _deals_create(body: dict[str, Any], errors: list[str]) -> None:
+        for key in sorted(body.keys() - _KEYS_0, key=str):
+            errors.append(f"{key}: unknown field")
+        if "lead" not in body:
+            errors.append("lead: required")
+        ...
+
+No schema is interpreted at runtime — type checks, enum membership, required
+and unknown keys are all straight-line ``isinstance`` / ``in`` tests, so a
+body validates in microseconds.
+
+Emits:
+
+- ``__init__.py`` — :func:`validate_request` and :func:`get_validator`,
+  which import a tag's validators the first time one of its operations is
+  validated (reusing the endpoint package's operation → tag module index).
+- ``<tag>.py`` — one module per spec tag with that tag's compiled
+  validators and a ``VALIDATORS: dict[str, Validator]`` table.
+
+Supported schema keywords: ``type``, ``properties``, ``required``, ``items``,
+``enum``, ``nullable``, ``allOf`` (merged) and ``oneOf`` (any branch must
+pass).  Everything else (``format``, ``example``, ``description``…) is
+ignored, so the validators only ever reject bodies the spec rules out.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from codegen._layout import reset_package, tag_module_name
+
+OUTPUT_DIR = Path(__file__).parent.parent / "teamleader" / "_generated" / "validators"
+LEGACY_OUTPUT_PATH = OUTPUT_DIR.with_suffix(".py")
+
+_HEADER = """\
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: {version}
+# Generated at: {timestamp}
+# ============================================================
+"""
+
+_INDEX_BODY = """
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+from teamleader._generated.endpoints import _OPERATION_MODULES
+
+Validator = Callable[[dict[str, Any], list[str]], None]
+
+_loaded: dict[str, Validator] = {}
+
+
+def get_validator(operation_id: str) -> Validator:
+    \"\"\"Return the compiled request-body validator for *operation_id*.
+
+    The tag module holding it is imported on first use.  Raises ``KeyError``
+    for an unknown operation.
+    \"\"\"
+    validator = _loaded.get(operation_id)
+    if validator is None:
+        tag_module = _OPERATION_MODULES[operation_id]
+        module = importlib.import_module(f"{__name__}.{tag_module}")
+        _loaded.update(module.VALIDATORS)
+        validator = _loaded[operation_id]
+    return validator
+
+
+def validate_request(operation_id: str, body: dict[str, Any]) -> list[str]:
+    \"\"\"Check *body* against the spec's request schema for *operation_id*.
+
+    Returns a list of ``"path: problem"`` messages — empty when the body is
+    valid.
+    \"\"\"
+    errors: list[str] = []
+    get_validator(operation_id)(body, errors)
+    return errors
+"""
+
+_TAG_BODY = """
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+"""
+
+_TAG_FOOTER = """\
+# fmt: on
+"""
+
+#: Line length of the generated code (``tool.ruff.line-length``).
+_LINE_LENGTH = 88
+
+_TYPE_CHECKS = {
+    "string": "not isinstance({v}, str)",
+    "number": "isinstance({v}, bool) or not isinstance({v}, (int, float))",
+    "integer": "isinstance({v}, bool) or not isinstance({v}, int)",
+    "boolean": "not isinstance({v}, bool)",
+    "array": "not isinstance({v}, (list, tuple))",
+    "object": "not isinstance({v}, dict)",
+}
+
+
+# ---------------------------------------------------------------------------
+# Schema helpers
+# ---------------------------------------------------------------------------
+
+
+def _request_schema(operation: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the request-body schema of *operation*, or None if it has none."""
+    content = operation.get("requestBody", {}).get("content", {})
+    schema = content.get("application/json", {}).get("schema")
+    return schema or None
+
+
+def _merge(schema: dict[str, Any]) -> dict[str, Any]:
+    """Flatten ``allOf`` into a single schema.
+
+    Properties and ``required`` are unioned; the first ``type`` / ``enum``
+    wins; the result is nullable if any part is.
+    """
+    if "allOf" not in schema:
+        return schema
+    merged: dict[str, Any] = {k: v for k, v in schema.items() if k != "allOf"}
+    for part in schema["allOf"]:
+        part = _merge(part)
+        for key, value in part.items():
+            if key == "properties":
+                merged.setdefault("properties", {}).update(value)
+            elif key == "required":
+                required = set(merged.get("required", [])) | set(value)
+                merged["required"] = sorted(required)
+            elif key == "nullable":
+                merged["nullable"] = merged.get("nullable", False) or value
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+
+def _path_join(parent: str, name: str) -> str:
+    """Append property *name* to the f-string body *parent*."""
+    if '"' in name or "\\" in name:
+        raise ValueError(f"Unsupported property name in spec: {name!r}")
+    name = name.replace("{", "{{").replace("}", "}}")
+    return f"{parent}.{name}" if parent else name
+
+
+class _Module:
+    """Accumulates the source of one generated tag module."""
+
+    def __init__(self) -> None:
+        self.constants: list[str] = []
+        self.helpers: list[str] = []
+        self._constant_names: dict[str, str] = {}
+        self._helper_names: dict[str, str] = {}
+
+    def constant(self, prefix: str, values: list[Any]) -> str:
+        """Return the name of a module-level frozenset holding *values*."""
+        items = [repr(v) for v in sorted(values, key=repr)]
+        literal = "frozenset({" + ", ".join(items) + "})" if items else "frozenset()"
+        name = self._constant_names.get(literal)
+        if name is None:
+            name = f"_{prefix}_{len(self._constant_names)}"
+            self._constant_names[literal] = name
+            # An empty set gives mypy nothing to infer the element type from.
+            annotation = "" if items else ": frozenset[Any]"
+            line = f"{name}{annotation} = {literal}"
+            if len(line) > _LINE_LENGTH:
+                # One item per line keeps long key and enum sets within limits.
+                line = "\n".join(
+                    [f"{name} = frozenset({{", *(f"    {i}," for i in items), "})"]
+                )
+            self.constants.append(line)
+        return name
+
+    def helper(self, schema: dict[str, Any]) -> str:
+        """Compile *schema* into a standalone ``(value, path, errors)`` function.
+
+        Identical schemas (the custom-field value shapes, say) share one helper.
+        """
+        key = json.dumps(schema, sort_keys=True, default=str)
+        name = self._helper_names.get(key)
+        if name is not None:
+            return name
+        name = f"_schema_{len(self._helper_names)}"
+        self._helper_names[key] = name
+        lines = [f"def {name}(v0: Any, path: str, errors: list[str]) -> None:"]
+        body = _emit(self, schema, "v0", "{path}", 1, _Counter(1))
+        lines.extend(body or ["    pass"])
+        self.helpers.append("\n".join(lines))
+        return name
+
+
+class _Counter:
+    """Hands out fresh local variable numbers within one function."""
+
+    def __init__(self, start: int = 0) -> None:
+        self.value = start
+
+    def next(self) -> int:
+        value = self.value
+        self.value += 1
+        return value
+
+
+def _string(body: str) -> str:
+    """Return a string literal for the f-string *body*.
+
+    An f-string only when *body* has a replacement field; otherwise a plain
+    string, with ``{{`` / ``}}`` escapes undone.
+    """
+    if "{" in body.replace("{{", "").replace("}}", ""):
+        return f'f"{body}"'
+    return '"' + body.replace("{{", "{").replace("}}", "}") + '"'
+
+
+def _err(indent: int, path: str, problem: str) -> str:
+    """Return an ``errors.append(...)`` line; *problem* may hold ``{}`` fields."""
+    pad = "    " * indent
+    message = f"{path}: {problem}" if path else problem
+    return f"{pad}errors.append({_string(message)})"
+
+
+# ---------------------------------------------------------------------------
+# Emitter
+# ---------------------------------------------------------------------------
+
+
+def _emit(
+    module: _Module,
+    schema: dict[str, Any],
+    var: str,
+    path: str,
+    indent: int,
+    counter: _Counter,
+    *,
+    check_type: bool = True,
+) -> list[str]:
+    """Return the lines validating the value in *var* against *schema*.
+
+    *path* is the body of an f-string naming the value in error messages.
+    """
+    schema = _merge(schema)
+    pad = "    " * indent
+    lines: list[str] = []
+
+    if "oneOf" in schema:
+        shared = {k: v for k, v in schema.items() if k != "oneOf"}
+        helpers = [
+            module.helper({"allOf": [shared, branch]}) for branch in schema["oneOf"]
+        ]
+        n = counter.next()
+        path_arg = _string(path)
+        lines.append(f"{pad}for check{n} in ({', '.join(helpers)},):")
+        lines.append(f"{pad}    branch_errors{n}: list[str] = []")
+        lines.append(f"{pad}    check{n}({var}, {path_arg}, branch_errors{n})")
+        lines.append(f"{pad}    if not branch_errors{n}:")
+        lines.append(f"{pad}        break")
+        lines.append(f"{pad}else:")
+        lines.append(
+            _err(indent + 1, path or "body", "does not match any allowed shape")
+        )
+        return lines
+
+    schema_type = schema.get("type")
+    if schema_type is None and "properties" in schema:
+        schema_type = "object"
+
+    enum = schema.get("enum")
+    type_check = _TYPE_CHECKS.get(schema_type or "") if check_type else None
+
+    branches: list[tuple[str, list[str]]] = []
+    if schema.get("nullable"):
+        branches.append((f"{var} is None", [f"{pad}    pass"]))
+    elif check_type:
+        branches.append(
+            (f"{var} is None", [_err(indent + 1, path, "must not be null")])
+        )
+    if type_check:
+        expected = _err(indent + 1, path, f"expected {schema_type}")
+        branches.append((type_check.format(v=var), [expected]))
+    if enum:
+        if schema_type == "string" or all(isinstance(e, str) for e in enum):
+            enum_expr = module.constant("ENUM", list(enum))
+            membership = f"{var} not in {enum_expr}"
+            if not type_check:
+                membership = f"not isinstance({var}, str) or {membership}"
+            allowed = f"{{sorted({enum_expr})}}"
+        else:
+            membership = f"{var} not in {tuple(enum)!r}"
+            allowed = repr(list(enum)).replace("{", "{{").replace("}", "}}")
+        not_allowed = _err(indent + 1, path, f"must be one of {allowed}")
+        branches.append((membership, [not_allowed]))
+
+    nested_indent = indent + 1 if branches else indent
+    nested: list[str] = []
+    if schema_type == "object" and "properties" in schema:
+        nested = _emit_object(module, schema, var, path, nested_indent, counter)
+    elif schema_type == "array" and schema.get("items"):
+        n = counter.next()
+        item_lines = _emit(
+            module,
+            schema["items"],
+            f"v{n}",
+            f"{path}[{{i{n}}}]",
+            nested_indent + 1,
+            counter,
+        )
+        if item_lines:
+            loop = f"{'    ' * nested_indent}for i{n}, v{n} in enumerate({var}):"
+            nested = [loop, *item_lines]
+
+    if not branches:
+        return nested
+    for i, (condition, body) in enumerate(branches):
+        keyword = "if" if i == 0 else "elif"
+        lines.append(f"{pad}{keyword} {condition}:")
+        lines.extend(body)
+    if nested:
+        lines.append(f"{pad}else:")
+        lines.extend(nested)
+    # A lone ``if v is None: pass`` checks nothing.
+    if lines == [f"{pad}if {var} is None:", f"{pad}    pass"]:
+        return []
+    return lines
+
+
+def _emit_object(
+    module: _Module,
+    schema: dict[str, Any],
+    var: str,
+    path: str,
+    indent: int,
+    counter: _Counter,
+) -> list[str]:
+    """Return the lines checking the keys and properties of an object schema."""
+    pad = "    " * indent
+    properties: dict[str, Any] = schema.get("properties", {})
+    lines: list[str] = []
+
+    keys = module.constant("KEYS", list(properties))
+    key_path = f"{path}.{{key}}" if path else "{key}"
+    lines.append(f"{pad}for key in sorted({var}.keys() - {keys}, key=str):")
+    lines.append(_err(indent + 1, key_path, "unknown field"))
+
+    for name in schema.get("required", []):
+        if name in properties:
+            lines.append(f"{pad}if {name!r} not in {var}:")
+            lines.append(_err(indent + 1, _path_join(path, name), "required"))
+
+    for name in sorted(properties):
+        n = counter.next()
+        prop_lines = _emit(
+            module,
+            properties[name],
+            f"v{n}",
+            _path_join(path, name),
+            indent + 1,
+            counter,
+        )
+        if prop_lines:
+            lines.append(f"{pad}if {name!r} in {var}:")
+            lines.append(f"{pad}    v{n} = {var}[{name!r}]")
+            lines.extend(prop_lines)
+    return lines
+
+
+def _function_name(operation_id: str) -> str:
+    cleaned = "".join(c if c.isalnum() else "_" for c in operation_id)
+    return f"_{cleaned.lower()}"
+
+
+def _emit_operation(
+    module: _Module, operation_id: str, schema: dict[str, Any] | None
+) -> str:
+    """Return the source of the validator function for one operation."""
+    name = _function_name(operation_id)
+    lines = [f"def {name}(body: dict[str, Any], errors: list[str]) -> None:"]
+    if schema is None:
+        keys = module.constant("KEYS", [])
+        lines.append(f"    for key in sorted(body.keys() - {keys}, key=str):")
+        lines.append(_err(2, "{key}", "unknown field"))
+    else:
+        merged = _merge(schema)
+        if "properties" in merged and "oneOf" not in merged:
+            lines.extend(_emit_object(module, merged, "body", "", 1, _Counter()))
+        else:
+            lines.extend(
+                _emit(module, merged, "body", "", 1, _Counter(), check_type=False)
+            )
+    if len(lines) == 1:
+        lines.append("    pass")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Main generator
+# ---------------------------------------------------------------------------
+
+
+def generate_validators(spec: dict[str, Any], version: str) -> None:
+    """Write compiled request validators to ``teamleader/_generated/validators/``."""
+    paths: dict[str, Any] = spec.get("paths", {})
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    header = _HEADER.format(version=version, timestamp=timestamp)
+
+    modules: dict[str, _Module] = {}
+    functions: dict[str, list[str]] = {}
+    tables: dict[str, list[str]] = {}
+
+    count = 0
+    for path in sorted(paths):
+        for operation in paths[path].values():
+            if not isinstance(operation, dict):
+                continue
+            operation_id: str = operation.get("operationId", "")
+            if not operation_id:
+                continue
+            tags: list[str] = operation.get("tags", [])
+            module_name = tag_module_name(tags[0] if tags else "")
+            module = modules.setdefault(module_name, _Module())
+            functions.setdefault(module_name, []).append(
+                _emit_operation(module, operation_id, _request_schema(operation))
+            )
+            tables.setdefault(module_name, []).append(
+                f"    {operation_id!r}: {_function_name(operation_id)},"
+            )
+            count += 1
+
+    reset_package(OUTPUT_DIR, LEGACY_OUTPUT_PATH)
+    (OUTPUT_DIR / "__init__.py").write_text(header + _INDEX_BODY, encoding="utf-8")
+    for module_name, module in sorted(modules.items()):
+        parts = [header + _TAG_BODY]
+        if module.constants:
+            parts.append("\n".join(module.constants) + "\n")
+        for source in [*module.helpers, *functions[module_name]]:
+            parts.append("\n\n" + source + "\n")
+        table = "\n".join(tables[module_name])
+        parts.append("\n\nVALIDATORS = {\n" + table + "\n}\n" + _TAG_FOOTER)
+        (OUTPUT_DIR / f"{module_name}.py").write_text("".join(parts), encoding="utf-8")
+    print(
+        f"  Wrote {count} validators in {len(modules)} tag modules → {OUTPUT_DIR.name}/"
+    )
@@ -24,7 +24,13 @@ Quick-start (Django)::
 
 __version__ = "0.1.0"
 
-from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token, TokenBackend
+from teamleader.auth import (
+    FileTokenBackend,
+    MemoryTokenBackend,
+    OAuth2Handler,
+    Token,
+    TokenBackend,
+)
 from teamleader.client import TeamleaderClient
 from teamleader.exceptions import (
     TeamleaderAPIError,
@@ -34,6 +40,7 @@ from teamleader.exceptions import (
     TeamleaderNotFoundError,
     TeamleaderPermissionError,
     TeamleaderRateLimitError,
+    TeamleaderRequestValidationError,
     TeamleaderServerError,
     TeamleaderValidationError,
 )
@@ -51,6 +58,7 @@ __all__ = [
     "Token",
     "TokenBackend",
     "MemoryTokenBackend",
+    "FileTokenBackend",
     # Exceptions
     "TeamleaderError",
     "TeamleaderAPIError",
@@ -59,6 +67,7 @@ __all__ = [
     "TeamleaderNotFoundError",
     "TeamleaderPermissionError",
     "TeamleaderRateLimitError",
+    "TeamleaderRequestValidationError",
     "TeamleaderServerError",
     "TeamleaderValidationError",
     # Models
@@ -0,0 +1,403 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:51:11Z
+# ============================================================
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+
+# Most operations share one of a handful of required-parameter sets
+# (``{"id"}``, the empty set, …); keep a single frozenset for each.
+_REQUIRED_SETS: dict[tuple[str, ...], frozenset[str]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    """Metadata for a single Teamleader Focus API operation.
+
+    ``request_path`` (``path`` without its leading slash, as passed to the
+    client's ``_post``) and ``required`` (``required_params`` as a frozenset)
+    are computed once at construction so ``call()`` does no per-call string
+    or list work.  ``description`` is loaded on first access.
+    """
+
+    operation_id: str
+    method: str
+    path: str
+    tag: str
+    required_params: tuple[str, ...]
+    optional_params: tuple[str, ...]
+    request_path: str = field(init=False, repr=False, compare=False)
+    required: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "request_path", sys.intern(self.path.lstrip("/")))
+        required = _REQUIRED_SETS.setdefault(
+            self.required_params, frozenset(self.required_params)
+        )
+        object.__setattr__(self, "required", required)
+
+    @property
+    def description(self) -> str:
+        """Human-readable description from the spec (loaded lazily)."""
+        from teamleader._generated.endpoints._descriptions import DESCRIPTIONS
+
+        return DESCRIPTIONS.get(self.operation_id, "")
+
+
+def _table(
+    tag: str, rows: Iterable[tuple[str, str, str, tuple[str, ...], tuple[str, ...]]]
+) -> dict[str, Endpoint]:
+    """Build a tag module's ``ENDPOINTS`` from its rows of ``Endpoint`` fields."""
+    table: dict[str, Endpoint] = {}
+    for operation_id, method, path, required_params, optional_params in rows:
+        operation_id = sys.intern(operation_id)
+        table[operation_id] = Endpoint(
+            operation_id, method, path, tag, required_params, optional_params
+        )
+    return table
+
+
+class _LazyEndpoints(Mapping[str, Endpoint]):
+    """Read-only ``operation_id → Endpoint`` mapping backed by per-tag modules.
+
+    Membership, ``len()`` and iteration only consult the index below; the
+    tag module defining an endpoint is imported the first time that endpoint
+    is looked up.
+    """
+
+    def __init__(self, index: dict[str, str]) -> None:
+        self._index = index
+        self._loaded: dict[str, Endpoint] = {}
+
+    def __getitem__(self, operation_id: str) -> Endpoint:
+        endpoint = self._loaded.get(operation_id)
+        if endpoint is None:
+            module = importlib.import_module(f"{__name__}.{self._index[operation_id]}")
+            self._loaded.update(module.ENDPOINTS)
+            endpoint = self._loaded[operation_id]
+        return endpoint
+
+    def get(  # type: ignore[override]
+        self, operation_id: str, default: Endpoint | None = None
+    ) -> Endpoint | None:
+        endpoint = self._loaded.get(operation_id)
+        if endpoint is not None:
+            return endpoint
+        if operation_id not in self._index:
+            return default
+        return self[operation_id]
+
+    def __contains__(self, operation_id: object) -> bool:
+        return operation_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# operation ID → tag module defining its Endpoint
+# fmt: off
+_OPERATION_MODULES: dict[str, str] = {
+    'accounts.projects-v2-status': 'accounts',
+    'activityTypes.list': 'activity_types',
+    'bookkeepingSubmissions.list': 'bookkeeping_submissions',
+    'businessTypes.list': 'business_types',
+    'callOutcomes.list': 'call_outcomes',
+    'calls.add': 'calls',
+    'calls.complete': 'calls',
+    'calls.info': 'calls',
+    'calls.list': 'calls',
+    'calls.update': 'calls',
+    'closingDays.add': 'closing_days',
+    'closingDays.delete': 'closing_days',
+    'closingDays.list': 'closing_days',
+    'cloudPlatforms.url': 'cloud_platforms',
+    'commercialDiscounts.list': 'commercial_discounts',
+    'companies.add': 'companies',
+    'companies.delete': 'companies',
+    'companies.info': 'companies',
+    'companies.list': 'companies',
+    'companies.tag': 'companies',
+    'companies.untag': 'companies',
+    'companies.update': 'companies',
+    'companies.uploadLogo': 'companies',
+    'contacts.add': 'contacts',
+    'contacts.delete': 'contacts',
+    'contacts.info': 'contacts',
+    'contacts.linkToCompany': 'contacts',
+    'contacts.list': 'contacts',
+    'contacts.tag': 'contacts',
+    'contacts.unlinkFromCompany': 'contacts',
+    'contacts.untag': 'contacts',
+    'contacts.update': 'contacts',
+    'contacts.updateCompanyLink': 'contacts',
+    'contacts.uploadAvatar': 'contacts',
+    'creditNotes.download': 'credit_notes',
+    'creditNotes.info': 'credit_notes',
+    'creditNotes.list': 'credit_notes',
+    'creditNotes.sendViaPeppol': 'credit_notes',
+    'currencies.exchangeRates': 'currencies',
+    'customFieldDefinitions.create': 'custom_fields',
+    'customFieldDefinitions.info': 'custom_fields',
+    'customFieldDefinitions.list': 'custom_fields',
+    'dayOffTypes.create': 'day_off_types',
+    'dayOffTypes.delete': 'day_off_types',
+    'dayOffTypes.list': 'day_off_types',
+    'dayOffTypes.update': 'day_off_types',
+    'daysOff.bulkDelete': 'days_off',
+    'daysOff.import': 'days_off',
+    'dealPhases.create': 'deal_phases',
+    'dealPhases.delete': 'deal_phases',
+    'dealPhases.duplicate': 'deal_phases',
+    'dealPhases.list': 'deal_phases',
+    'dealPhases.move': 'deal_phases',
+    'dealPhases.update': 'deal_phases',
+    'dealPipelines.create': 'deal_pipelines',
+    'dealPipelines.delete': 'deal_pipelines',
+    'dealPipelines.duplicate': 'deal_pipelines',
+    'dealPipelines.list': 'deal_pipelines',
+    'dealPipelines.markAsDefault': 'deal_pipelines',
+    'dealPipelines.update': 'deal_pipelines',
+    'dealSources.list': 'deal_sources',
+    'deals.create': 'deals',
+    'deals.delete': 'deals',
+    'deals.info': 'deals',
+    'deals.list': 'deals',
+    'deals.lose': 'deals',
+    'deals.move': 'deals',
+    'deals.update': 'deals',
+    'deals.win': 'deals',
+    'departments.info': 'departments',
+    'departments.list': 'departments',
+    'documentTemplates.list': 'document_templates',
+    'emailTracking.create': 'email_tracking',
+    'emailTracking.list': 'email_tracking',
+    'events.cancel': 'calendar_events',
+    'events.create': 'calendar_events',
+    'events.info': 'calendar_events',
+    'events.list': 'calendar_events',
+    'events.update': 'calendar_events',
+    'expenses.list': 'expenses',
+    'files.delete': 'files',
+    'files.download': 'files',
+    'files.info': 'files',
+    'files.list': 'files',
+    'files.upload': 'files',
+    'incomingCreditNotes.add': 'incoming_credit_notes',
+    'incomingCreditNotes.approve': 'incoming_credit_notes',
+    'incomingCreditNotes.delete': 'incoming_credit_notes',
+    'incomingCreditNotes.info': 'incoming_credit_notes',
+    'incomingCreditNotes.listPayments': 'incoming_credit_notes',
+    'incomingCreditNotes.markAsPendingReview': 'incoming_credit_notes',
+    'incomingCreditNotes.refuse': 'incoming_credit_notes',
+    'incomingCreditNotes.registerPayment': 'incoming_credit_notes',
+    'incomingCreditNotes.removePayment': 'incoming_credit_notes',
+    'incomingCreditNotes.sendToBookkeeping': 'incoming_credit_notes',
+    'incomingCreditNotes.update': 'incoming_credit_notes',
+    'incomingCreditNotes.updatePayment': 'incoming_credit_notes',
+    'incomingInvoices.add': 'incoming_invoices',
+    'incomingInvoices.approve': 'incoming_invoices',
+    'incomingInvoices.delete': 'incoming_invoices',
+    'incomingInvoices.info': 'incoming_invoices',
+    'incomingInvoices.listPayments': 'incoming_invoices',
+    'incomingInvoices.markAsPendingReview': 'incoming_invoices',
+    'incomingInvoices.refuse': 'incoming_invoices',
+    'incomingInvoices.registerPayment': 'incoming_invoices',
+    'incomingInvoices.removePayment': 'incoming_invoices',
+    'incomingInvoices.sendToBookkeeping': 'incoming_invoices',
+    'incomingInvoices.update': 'incoming_invoices',
+    'incomingInvoices.updatePayment': 'incoming_invoices',
+    'invoices.book': 'invoices',
+    'invoices.copy': 'invoices',
+    'invoices.credit': 'invoices',
+    'invoices.creditPartially': 'invoices',
+    'invoices.delete': 'invoices',
+    'invoices.download': 'invoices',
+    'invoices.draft': 'invoices',
+    'invoices.info': 'invoices',
+    'invoices.list': 'invoices',
+    'invoices.registerPayment': 'invoices',
+    'invoices.removePayments': 'invoices',
+    'invoices.send': 'invoices',
+    'invoices.sendViaPeppol': 'invoices',
+    'invoices.update': 'invoices',
+    'invoices.updateBooked': 'invoices',
+    'levelTwoAreas.list': 'addresses',
+    'lostReasons.list': 'deals',
+    'mailTemplates.list': 'mail_templates',
+    'meetings.complete': 'meetings',
+    'meetings.createReport': 'meetings',
+    'meetings.delete': 'meetings',
+    'meetings.info': 'meetings',
+    'meetings.list': 'meetings',
+    'meetings.schedule': 'meetings',
+    'meetings.update': 'meetings',
+    'migrate.activityType': 'migrating',
+    'migrate.id': 'migrating',
+    'migrate.taxRate': 'migrating',
+    'LegacyMilestones.close': 'legacy_milestones',
+    'LegacyMilestones.create': 'legacy_milestones',
+    'LegacyMilestones.delete': 'legacy_milestones',
+    'LegacyMilestones.info': 'legacy_milestones',
+    'LegacyMilestones.list': 'legacy_milestones',
+    'LegacyMilestones.open': 'legacy_milestones',
+    'LegacyMilestones.update': 'legacy_milestones',
+    'notes.create': 'notes',
+    'notes.list': 'notes',
+    'notes.update': 'notes',
+    'orders.info': 'orders',
+    'orders.list': 'orders',
+    'paymentMethods.list': 'payment_methods',
+    'paymentTerms.list': 'payment_terms',
+    'plannableItems.info': 'plannable_items',
+    'plannableItems.list': 'plannable_items',
+    'priceLists.list': 'price_lists',
+    'productCategories.list': 'product_categories',
+    'products.add': 'products',
+    'products.delete': 'products',
+    'products.info': 'products',
+    'products.list': 'products',
+    'products.update': 'products',
+    'NextgenProjectsExternalParties.addToProject': 'external_parties',
+    'NextgenProjectsExternalParties.delete': 'external_parties',
+    'NextgenProjectsExternalParties.update': 'external_parties',
+    'NextgenProjectsMaterials.assign': 'materials',
+    'NextgenProjectsMaterials.create': 'materials',
+    'NextgenProjectsMaterials.delete': 'materials',
+    'NextgenProjectsMaterials.duplicate': 'materials',
+    'NextgenProjectsMaterials.info': 'materials',
+    'NextgenProjectsMaterials.list': 'materials',
+    'NextgenProjectsMaterials.unassign': 'materials',
+    'NextgenProjectsMaterials.update': 'materials',
+    'projectGroups.assign': 'groups',
+    'projectGroups.create': 'groups',
+    'projectGroups.delete': 'groups',
+    'projectGroups.duplicate': 'groups',
+    'projectGroups.info': 'groups',
+    'projectGroups.list': 'groups',
+    'projectGroups.unassign': 'groups',
+    'projectGroups.update': 'groups',
+    'projectLines.addToGroup': 'project_lines',
+    'projectLines.list': 'project_lines',
+    'projectLines.removeFromGroup': 'project_lines',
+    'NextgenProjects.addCustomer': 'projects',
+    'NextgenProjects.addDeal': 'projects',
+    'NextgenProjects.addOwner': 'projects',
+    'NextgenProjects.addQuotation': 'projects',
+    'NextgenProjects.assign': 'projects',
+    'NextgenProjects.close': 'projects',
+    'NextgenProjects.create': 'projects',
+    'NextgenProjects.delete': 'projects',
+    'NextgenProjects.duplicate': 'projects',
+    'NextgenProjects.info': 'projects',
+    'NextgenProjects.list': 'projects',
+    'NextgenProjects.removeCustomer': 'projects',
+    'NextgenProjects.removeDeal': 'projects',
+    'NextgenProjects.removeOwner': 'projects',
+    'NextgenProjects.removeQuotation': 'projects',
+    'NextgenProjects.reopen': 'projects',
+    'NextgenProjects.unassign': 'projects',
+    'NextgenProjects.update': 'projects',
+    'NextgenProjectsTasks.assign': 'projects_v2_tasks',
+    'NextgenProjectsTasks.create': 'projects_v2_tasks',
+    'NextgenProjectsTasks.delete': 'projects_v2_tasks',
+    'NextgenProjectsTasks.duplicate': 'projects_v2_tasks',
+    'NextgenProjectsTasks.info': 'projects_v2_tasks',
+    'NextgenProjectsTasks.list': 'projects_v2_tasks',
+    'NextgenProjectsTasks.unassign': 'projects_v2_tasks',
+    'NextgenProjectsTasks.update': 'projects_v2_tasks',
+    'LegacyProjects.addParticipant': 'legacy_projects',
+    'LegacyProjects.close': 'legacy_projects',
+    'LegacyProjects.create': 'legacy_projects',
+    'LegacyProjects.delete': 'legacy_projects',
+    'LegacyProjects.info': 'legacy_projects',
+    'LegacyProjects.list': 'legacy_projects',
+    'LegacyProjects.reopen': 'legacy_projects',
+    'LegacyProjects.update': 'legacy_projects',
+    'LegacyProjects.updateParticipant': 'legacy_projects',
+    'quotations.accept': 'quotations',
+    'quotations.create': 'quotations',
+    'quotations.delete': 'quotations',
+    'quotations.download': 'quotations',
+    'quotations.info': 'quotations',
+    'quotations.list': 'quotations',
+    'quotations.send': 'quotations',
+    'quotations.update': 'quotations',
+    'receipts.add': 'receipts',
+    'receipts.approve': 'receipts',
+    'receipts.delete': 'receipts',
+    'receipts.info': 'receipts',
+    'receipts.listPayments': 'receipts',
+    'receipts.markAsPendingReview': 'receipts',
+    'receipts.refuse': 'receipts',
+    'receipts.registerPayment': 'receipts',
+    'receipts.removePayment': 'receipts',
+    'receipts.sendToBookkeeping': 'receipts',
+    'receipts.update': 'receipts',
+    'receipts.updatePayment': 'receipts',
+    'reservations.create': 'reservations',
+    'reservations.delete': 'reservations',
+    'reservations.list': 'reservations',
+    'reservations.update': 'reservations',
+    'subscriptions.create': 'subscriptions',
+    'subscriptions.deactivate': 'subscriptions',
+    'subscriptions.info': 'subscriptions',
+    'subscriptions.list': 'subscriptions',
+    'subscriptions.update': 'subscriptions',
+    'tags.list': 'tags',
+    'tasks.complete': 'tasks',
+    'tasks.create': 'tasks',
+    'tasks.delete': 'tasks',
+    'tasks.info': 'tasks',
+    'tasks.list': 'tasks',
+    'tasks.reopen': 'tasks',
+    'tasks.schedule': 'tasks',
+    'tasks.update': 'tasks',
+    'taxRates.list': 'tax_rates',
+    'teams.list': 'teams',
+    'ticketStatus.list': 'ticket_status',
+    'tickets.addInternalMessage': 'tickets',
+    'tickets.addReply': 'tickets',
+    'tickets.create': 'tickets',
+    'tickets.getMessage': 'tickets',
+    'tickets.importMessage': 'tickets',
+    'tickets.info': 'tickets',
+    'tickets.list': 'tickets',
+    'tickets.listMessages': 'tickets',
+    'tickets.update': 'tickets',
+    'timeTracking.add': 'time_tracking',
+    'timeTracking.delete': 'time_tracking',
+    'timeTracking.info': 'time_tracking',
+    'timeTracking.list': 'time_tracking',
+    'timeTracking.resume': 'time_tracking',
+    'timeTracking.update': 'time_tracking',
+    'timers.current': 'timers',
+    'timers.start': 'timers',
+    'timers.stop': 'timers',
+    'timers.update': 'timers',
+    'unitsOfMeasure.list': 'units_of_measure',
+    'userAvailability.daily': 'user_availability',
+    'userAvailability.total': 'user_availability',
+    'users.getWeekSchedule': 'users',
+    'users.info': 'users',
+    'users.list': 'users',
+    'users.listDaysOff': 'users',
+    'users.me': 'users',
+    'webhooks.list': 'webhooks',
+    'webhooks.register': 'webhooks',
+    'webhooks.unregister': 'webhooks',
+    'withholdingTaxRates.list': 'withholding_tax_rates',
+    'workTypes.list': 'work_types',
+}
+# fmt: on
+
+ENDPOINTS: Mapping[str, Endpoint] = _LazyEndpoints(_OPERATION_MODULES)
@@ -0,0 +1,304 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+# operation ID → description, read by Endpoint.description
+# fmt: off
+DESCRIPTIONS: dict[str, str] = {
+    'accounts.projects-v2-status': 'Fetch which version of Projects the account is using.',
+    'activityTypes.list': 'Get a list of all activity types.',
+    'bookkeepingSubmissions.list': 'List all bookkeeping submissions belonging to a specific financial document id and type',
+    'businessTypes.list': 'Get the names of business types (legal structures) a company can have within a certain country, sorted alphabetically.',
+    'callOutcomes.list': 'Get a list of call outcomes.',
+    'calls.add': 'Add a new call.',
+    'calls.complete': 'Mark a call as complete.',
+    'calls.info': 'Get information about a call.',
+    'calls.list': 'Get a list of calls.',
+    'calls.update': 'Update a new call.',
+    'closingDays.add': 'Adds a closing day for the account.',
+    'closingDays.delete': 'Removes a closing day for the account.',
+    'closingDays.list': 'Returns information about closing days of the account',
+    'cloudPlatforms.url': 'Fetch cloudPlatform url for type and id.',
+    'commercialDiscounts.list': 'Get a list of commercial discounts.',
+    'companies.add': 'Add a new company.',
+    'companies.delete': 'Delete a company.',
+    'companies.info': 'Get details for a single company.',
+    'companies.list': 'Get a list of companies.',
+    'companies.tag': 'Add a new or existing tag to a company.',
+    'companies.untag': 'Remove a tag from a company.',
+    'companies.update': 'Update a company.',
+    'companies.uploadLogo': 'Update the logo of a company.',
+    'contacts.add': 'Add a new contact.',
+    'contacts.delete': 'Delete a contact.',
+    'contacts.info': 'Get details for a single contact.',
+    'contacts.linkToCompany': 'Link a contact to a company.',
+    'contacts.list': 'Get a list of contacts.',
+    'contacts.tag': 'Add a new or existing tag to a contact.',
+    'contacts.unlinkFromCompany': 'Unlink a contact from a company.',
+    'contacts.untag': 'Remove a tag from a contact.',
+    'contacts.update': 'Update a contact.',
+    'contacts.updateCompanyLink': 'Update contact to company link.',
+    'contacts.uploadAvatar': 'Update the avatar of a contact.',
+    'creditNotes.download': 'Download a credit note in a specific format.',
+    'creditNotes.info': 'Get details for a single credit note',
+    'creditNotes.list': 'List credit notes.',
+    'creditNotes.sendViaPeppol': 'Send a credit note via the Peppol network.',
+    'currencies.exchangeRates': 'Get a list of exchange rates for a provided currency.',
+    'customFieldDefinitions.create': 'Create a custom field definition.\n\n***Required scopes:*** `settings`',
+    'customFieldDefinitions.info': 'Get info about a specific custom field definition.',
+    'customFieldDefinitions.list': 'Get a list of all the definitions of custom fields.',
+    'dayOffTypes.create': 'Create a new day off type.',
+    'dayOffTypes.delete': 'Delete a day off type.',
+    'dayOffTypes.list': 'Returns a list of day off types for the account',
+    'dayOffTypes.update': 'Update a day off type.',
+    'daysOff.bulkDelete': 'Deletes a list of days off for the given user.',
+    'daysOff.import': 'Imports a list of days off for the given user.',
+    'dealPhases.create': 'Create a new deal phase.',
+    'dealPhases.delete': 'Delete a phase.',
+    'dealPhases.duplicate': 'Create a new deal phase by duplicating an existing one.',
+    'dealPhases.list': 'Get a list of all phases a deal can go through, sorted by their order in the flow.',
+    'dealPhases.move': 'Move a phase to a new position in the pipeline.',
+    'dealPhases.update': 'Update a deal phase.',
+    'dealPipelines.create': 'Create a new deal pipeline.',
+    'dealPipelines.delete': 'Delete a deal pipeline.',
+    'dealPipelines.duplicate': 'Create a new deal pipeline by duplicating an existing one.',
+    'dealPipelines.list': 'Get a list of all deal pipelines.',
+    'dealPipelines.markAsDefault': 'Mark a pipeline as default.',
+    'dealPipelines.update': 'Update a single deal pipeline.',
+    'dealSources.list': 'Get a list of all deal sources, sorted alphabetically (on name).',
+    'deals.create': 'Create a new deal for a customer.',
+    'deals.delete': 'Delete a deal.',
+    'deals.info': 'Get details for a single deal.',
+    'deals.list': 'Get a list of deals.',
+    'deals.lose': 'Mark a deal as lost.',
+    'deals.move': 'Move the deal to a different phase.',
+    'deals.update': 'Update a deal.',
+    'deals.win': 'Mark a deal as won.',
+    'departments.info': 'Get details for a single department.',
+    'departments.list': 'Get a list of departments.',
+    'documentTemplates.list': 'Get a list of all document templates.',
+    'emailTracking.create': 'Create a new email tracking.',
+    'emailTracking.list': 'Get a list of all email tracking.',
+    'events.cancel': 'Cancel a calendar event (for all attendees).',
+    'events.create': 'Create a new calendar event.',
+    'events.info': 'Get details for a single calendar event.',
+    'events.list': 'Get a list of calendar events.',
+    'events.update': 'Update a calendar event.',
+    'expenses.list': 'Get a list of all expenses.',
+    'files.delete': 'Delete a file.',
+    'files.download': 'Request the download link for a file.',
+    'files.info': 'Get details for a single file.',
+    'files.list': 'Get a list of files.',
+    'files.upload': 'Request the upload link for a file.\n\nThe following remarks apply to `temporary` files:\n- they exist for a maximum of 24 hours if not linked to an entity\n- do not show up in any file overview\n- are not included in external syncs',
+    'incomingCreditNotes.add': 'Adds an incoming credit note.',
+    'incomingCreditNotes.approve': 'Approve an incoming credit note.',
+    'incomingCreditNotes.delete': 'Deletes an incoming credit note.',
+    'incomingCreditNotes.info': 'Get details for a single incoming credit note.',
+    'incomingCreditNotes.listPayments': 'List payments for an incoming credit note.',
+    'incomingCreditNotes.markAsPendingReview': 'Mark an incoming credit note as pending review.',
+    'incomingCreditNotes.refuse': 'Refuse an incoming credit note.',
+    'incomingCreditNotes.registerPayment': 'Register a payment for an incoming credit note.',
+    'incomingCreditNotes.removePayment': 'Remove a payment from an incoming credit note.',
+    'incomingCreditNotes.sendToBookkeeping': 'Send an incoming credit note to bookkeeping.',
+    'incomingCreditNotes.update': 'Updates an incoming credit note.',
+    'incomingCreditNotes.updatePayment': 'Update a payment for an incoming credit note.',
+    'incomingInvoices.add': 'Adds an incoming invoice.',
+    'incomingInvoices.approve': 'Approve an incoming invoice.',
+    'incomingInvoices.delete': 'Deletes an incoming invoice.',
+    'incomingInvoices.info': 'Get details for a single incoming invoice.',
+    'incomingInvoices.listPayments': 'List payments for an incoming invoice.',
+    'incomingInvoices.markAsPendingReview': 'Mark an incoming invoice as pending review.',
+    'incomingInvoices.refuse': 'Refuse an incoming invoice.',
+    'incomingInvoices.registerPayment': 'Register a payment for an incoming invoice.',
+    'incomingInvoices.removePayment': 'Remove a payment from an incoming invoice.',
+    'incomingInvoices.sendToBookkeeping': 'Send an incoming invoice to bookkeeping.',
+    'incomingInvoices.update': 'Updates an incoming invoice.',
+    'incomingInvoices.updatePayment': 'Update a payment for an incoming invoice.',
+    'invoices.book': 'Book a draft invoice.',
+    'invoices.copy': 'Creates a new draft invoice based on another invoice.',
+    'invoices.credit': 'Credit an invoice completely.',
+    'invoices.creditPartially': 'Credit an invoice partially.',
+    'invoices.delete': 'Delete an existing invoice. Only possible for draft invoices or the last booked invoice.',
+    'invoices.download': 'Download an invoice in a specific format.',
+    'invoices.draft': 'Draft a new invoice.',
+    'invoices.info': 'Get details for a single invoice.',
+    'invoices.list': 'Get a list of invoices.',
+    'invoices.registerPayment': 'Register a payment for an invoice.',
+    'invoices.removePayments': 'Marks an invoice as unpaid and removes all linked payments. This will also trigger a re-rendering of the invoice PDF.',
+    'invoices.send': 'Send an invoice via e-mail.',
+    'invoices.sendViaPeppol': 'Send an invoice via the Peppol network.',
+    'invoices.update': 'Update a draft invoice. Booked invoices cannot be updated.',
+    'invoices.updateBooked': 'Update a booked invoice. Only available when editing booked invoices is allowed through the settings.',
+    'levelTwoAreas.list': 'Get a list of level two areas (which correspond to provinces, departments or states in most countries).',
+    'lostReasons.list': 'Get a list of lost reasons for deals.',
+    'mailTemplates.list': 'Get a list of all mail templates.',
+    'meetings.complete': 'Mark a meeting as complete.',
+    'meetings.createReport': 'Creates a report for a meeting.',
+    'meetings.delete': 'Deletes a meeting.',
+    'meetings.info': 'Get information about a meeting.',
+    'meetings.list': 'Get a list of meetings.',
+    'meetings.schedule': 'Schedule a meeting.',
+    'meetings.update': 'Update a meeting.',
+    'migrate.activityType': 'Translates `meeting`, `call` and `task` into their respective activity type UUID.',
+    'migrate.id': 'Translates an ID from the deprecated API into a new UUID.',
+    'migrate.taxRate': 'Translates tax rates from the deprecated API into a new UUID tax rate.',
+    'LegacyMilestones.close': 'Close a milestone. All open tasks will be closed, open meetings will remain open. Closing the last open milestone will also close the project.',
+    'LegacyMilestones.create': 'Create a new milestone.',
+    'LegacyMilestones.delete': 'Delete a milestone.',
+    'LegacyMilestones.info': 'Get details for a single milestone.',
+    'LegacyMilestones.list': 'Get a list of project milestones.',
+    'LegacyMilestones.open': "(Re)open a milestone. If the milestone's project is closed, the project will be reopened.",
+    'LegacyMilestones.update': 'Update a milestone.',
+    'notes.create': 'Create a new note.',
+    'notes.list': 'Get a list of all notes.',
+    'notes.update': 'Update an existing note.',
+    'orders.info': 'Get details for a single order.',
+    'orders.list': 'Get a list of orders.',
+    'paymentMethods.list': 'Get a list of payment methods.',
+    'paymentTerms.list': 'Get a list of available payment terms.',
+    'plannableItems.info': 'Returns the info for a single plannable item, either by ID or source if the ID is unknown.',
+    'plannableItems.list': 'Lists all plannable items that match the optional filters provided.',
+    'priceLists.list': 'Get a list of priceLists.',
+    'productCategories.list': 'Get a list of product categories.',
+    'products.add': 'Add a new product.',
+    'products.delete': 'Delete a product.',
+    'products.info': 'Get details for a single product.',
+    'products.list': 'Get a list of products.',
+    'products.update': 'Update a product.',
+    'NextgenProjectsExternalParties.addToProject': 'Add an external party to a project.',
+    'NextgenProjectsExternalParties.delete': 'Delete an external party.',
+    'NextgenProjectsExternalParties.update': 'Update an external party.',
+    'NextgenProjectsMaterials.assign': 'Assign a user or a team to a material.',
+    'NextgenProjectsMaterials.create': 'Create a material. All properties except for `title` and `project_id` are optional.',
+    'NextgenProjectsMaterials.delete': 'Delete a material.',
+    'NextgenProjectsMaterials.duplicate': 'Duplicate a material.',
+    'NextgenProjectsMaterials.info': 'Returns all the information for one material.',
+    'NextgenProjectsMaterials.list': 'Lists all the materials that match the optional filters provided.',
+    'NextgenProjectsMaterials.unassign': 'Unassign a user or a team from a material.',
+    'NextgenProjectsMaterials.update': 'Update a material. All attributes except for `id` are optional. Providing `null` will clear that value from the project (for properties that are nullable).',
+    'projectGroups.assign': 'Assign a user or a team to a group.',
+    'projectGroups.create': 'Create a group. All properties except for `title` and `project_id` are optional.',
+    'projectGroups.delete': 'Delete a group.',
+    'projectGroups.duplicate': 'Duplicate a group and its entities, without any time trackings.',
+    'projectGroups.info': 'Returns all the information for one group.',
+    'projectGroups.list': 'Lists all the groups that match the optional filters provided.',
+    'projectGroups.unassign': 'Unassign a user or a team from a group.',
+    'projectGroups.update': 'Update a group. All attributes except for `id` are optional. Providing `null` will clear that value from the project (for properties that are nullable).',
+    'projectLines.addToGroup': 'Add an existing task or material to a group.',
+    'projectLines.list': 'All line types (tasks, materials, groups) can be side-loaded.',
+    'projectLines.removeFromGroup': 'Remove a task or material from the group it is currently in.',
+    'NextgenProjects.addCustomer': "Add a customer to the project. Doesn't fail if the customer was already added.",
+    'NextgenProjects.addDeal': "Add a deal to the project. Doesn't fail if the deal was already added.",
+    'NextgenProjects.addOwner': "Add a user as owner. Doesn't fail if the user was already added.",
+    'NextgenProjects.addQuotation': "Add a quotation to the project. Doesn't fail if the quotation was already added.",
+    'NextgenProjects.assign': 'Assign a user or a team to a project.',
+    'NextgenProjects.close': 'Mark a project as closed.',
+    'NextgenProjects.create': 'Create a new project. Only `title` is required. All the other fields are optional.',
+    'NextgenProjects.delete': 'Delete a project.',
+    'NextgenProjects.duplicate': 'Duplicate a project.',
+    'NextgenProjects.info': 'Returns all the information of a single project.',
+    'NextgenProjects.list': 'Lists all projects that match the optional filters provided.',
+    'NextgenProjects.removeCustomer': "Remove a customer from the project. Doesn't fail if the customer was not added.",
+    'NextgenProjects.removeDeal': "Remove a deal from the project. Doesn't fail if the deal was already removed.",
+    'NextgenProjects.removeOwner': "Remove a user as owner. Doesn't fail if the user wasn't linked.",
+    'NextgenProjects.removeQuotation': "Remove a quotation from the project. Doesn't fail if the quotation was already removed.",
+    'NextgenProjects.reopen': 'Reopen a closed project.',
+    'NextgenProjects.unassign': 'Unassign a user or a team from a project.',
+    'NextgenProjects.update': 'Update a project. All attributes except for `id` are optional. Providing `null` will clear that value from the project (for properties that are nullable).',
+    'NextgenProjectsTasks.assign': 'Assign a user or a team to a task.',
+    'NextgenProjectsTasks.create': 'Create a task. All properties except for `title` and `project_id` are optional.',
+    'NextgenProjectsTasks.delete': 'Delete a task.',
+    'NextgenProjectsTasks.duplicate': 'Duplicate a task, without its time trackings.',
+    'NextgenProjectsTasks.info': 'Returns all the information for one task.',
+    'NextgenProjectsTasks.list': 'Lists all the tasks that match the optional filters provided.',
+    'NextgenProjectsTasks.unassign': 'Unassign a user or a team from a task.',
+    'NextgenProjectsTasks.update': 'Update a task. All attributes except for `id` are optional. Providing `null` will clear that value from the project (for properties that are nullable).',
+    'LegacyProjects.addParticipant': 'Add a participant to a project.',
+    'LegacyProjects.close': 'Closes a project, all its phases, and all tasks within each phase (but not meetings).',
+    'LegacyProjects.create': 'Create a new project.',
+    'LegacyProjects.delete': 'Delete a project.',
+    'LegacyProjects.info': 'Get details for a single project.',
+    'LegacyProjects.list': 'Get a list of projects.',
+    'LegacyProjects.reopen': 'Reopens a project, changing its status to "active".',
+    'LegacyProjects.update': 'Update a project.',
+    'LegacyProjects.updateParticipant': "Update a participant's role for a project.",
+    'quotations.accept': 'Mark a quotation as accepted.',
+    'quotations.create': 'Create a quotation.',
+    'quotations.delete': 'Delete a quotation.',
+    'quotations.download': 'Download a quotation in a specific format.',
+    'quotations.info': 'Get a quotation.',
+    'quotations.list': 'Get a list of quotations.',
+    'quotations.send': 'Send a quotation.',
+    'quotations.update': 'Update a quotation.',
+    'receipts.add': 'Adds a receipt.',
+    'receipts.approve': 'Approve a receipt.',
+    'receipts.delete': 'Deletes a receipt.',
+    'receipts.info': 'Get details for a single receipt.',
+    'receipts.listPayments': 'List payments for a(n incoming) receipt.',
+    'receipts.markAsPendingReview': 'Mark a receipts as pending review.',
+    'receipts.refuse': 'Refuse a receipts.',
+    'receipts.registerPayment': 'Register a payment for a(n incoming) receipt.',
+    'receipts.removePayment': 'Remove a payment from a receipt.',
+    'receipts.sendToBookkeeping': 'Send a receipt to bookkeeping for processing.',
+    'receipts.update': 'Updates a receipt.',
+    'receipts.updatePayment': 'Update a payment for a(n incoming) receipt.',
+    'reservations.create': 'Create a new reservation.',
+    'reservations.delete': 'Delete a reservation.',
+    'reservations.list': 'Lists all reservations that match the optional filters provided.',
+    'reservations.update': 'Update an existing reservation.',
+    'subscriptions.create': 'Create a new subscription.',
+    'subscriptions.deactivate': 'Deactivate a subscription.',
+    'subscriptions.info': 'Get details for a single subscription.',
+    'subscriptions.list': 'Get a list of subscriptions.',
+    'subscriptions.update': 'Update a subscription.',
+    'tags.list': 'Get a list of tags.',
+    'tasks.complete': 'Mark a task as complete.',
+    'tasks.create': 'Create a new task.',
+    'tasks.delete': 'Delete a task.',
+    'tasks.info': 'Get information about a task.',
+    'tasks.list': 'Get a list of tasks.',
+    'tasks.reopen': 'Reopen a task that had been marked as complete.',
+    'tasks.schedule': 'Schedule a task in your calendar.',
+    'tasks.update': 'Update a task.',
+    'taxRates.list': 'Get a list of available tax rates.',
+    'teams.list': 'Gets a list of all teams.',
+    'ticketStatus.list': 'Get a list of ticket statuses.',
+    'tickets.addInternalMessage': 'Adds an internal message to a ticket.',
+    'tickets.addReply': 'Adds a message to a ticket.',
+    'tickets.create': 'Create a ticket.',
+    'tickets.getMessage': 'Gets the ticket message.',
+    'tickets.importMessage': 'Imports an existing message to a ticket.',
+    'tickets.info': 'Get details for a single ticket.',
+    'tickets.list': 'Get a list of tickets.',
+    'tickets.listMessages': 'Lists messages of a ticket.',
+    'tickets.update': 'Update a ticket.',
+    'timeTracking.add': 'Add tracked time.',
+    'timeTracking.delete': 'Delete a tracked time.',
+    'timeTracking.info': 'Get information about tracked time.',
+    'timeTracking.list': 'Get a list of tracked time.',
+    'timeTracking.resume': 'Start a new timer based on previously tracked time.',
+    'timeTracking.update': 'Update tracked time.',
+    'timers.current': 'Get the current running timer.',
+    'timers.start': 'Start a new timer.',
+    'timers.stop': 'Stop the current timer. This will add a new time tracking in the background.',
+    'timers.update': 'Update the current timer. Only possible if there is a timer running.',
+    'unitsOfMeasure.list': 'Get a list of units of measure.',
+    'userAvailability.daily': 'Returns the daily availability for all users.',
+    'userAvailability.total': 'Returns the total availability for all users.',
+    'users.getWeekSchedule': 'Returns information about week schedule of a user. Only available with the *Weekly working schedule* feature.',
+    'users.info': 'Get details for a single user.',
+    'users.list': 'Get a list of all users.',
+    'users.listDaysOff': 'Returns information about days off of a given user.',
+    'users.me': 'Get the current authenticated user.',
+    'webhooks.list': 'List registered webhooks ordered by URL.',
+    'webhooks.register': 'Register a new webhook.',
+    'webhooks.unregister': 'Unregister a webhook.',
+    'withholdingTaxRates.list': 'Get a list of available withholding tax rates.',
+    'workTypes.list': 'Get a list of all work types, sorted alphabetically (on their name).',
+}
+# fmt: on
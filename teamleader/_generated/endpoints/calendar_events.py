@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('calendar_events', (
+    ('events.cancel', 'POST', '/events.cancel', ('id',), ()),
+    ('events.create', 'POST', '/events.create', ('activity_type_id', 'ends_at', 'starts_at', 'title'), ('attendees', 'description', 'links', 'location', 'work_type_id')),
+    ('events.info', 'POST', '/events.info', ('id',), ()),
+    ('events.list', 'POST', '/events.list', (), ('filter', 'page', 'sort')),
+    ('events.update', 'POST', '/events.update', ('id',), ('attendees', 'description', 'ends_at', 'links', 'location', 'starts_at', 'title', 'work_type_id')),
+))
+# fmt: on
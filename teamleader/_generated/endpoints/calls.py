@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('calls', (
+    ('calls.add', 'POST', '/calls.add', ('assignee', 'due_at', 'participant'), ('custom_fields', 'deal_id', 'description')),
+    ('calls.complete', 'POST', '/calls.complete', ('id',), ('call_outcome_id', 'outcome_summary')),
+    ('calls.info', 'POST', '/calls.info', ('id',), ()),
+    ('calls.list', 'POST', '/calls.list', (), ('filter', 'page')),
+    ('calls.update', 'POST', '/calls.update', ('id',), ('assignee', 'custom_fields', 'deal_id', 'description', 'due_at', 'participant')),
+))
+# fmt: on
@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('companies', (
+    ('companies.add', 'POST', '/companies.add', ('name',), ('addresses', 'bic', 'business_type_id', 'custom_fields', 'emails', 'iban', 'language', 'marketing_mails_consent', 'national_identification_number', 'preferred_currency', 'remarks', 'responsible_user_id', 'tags', 'telephones', 'vat_number', 'website')),
+    ('companies.delete', 'POST', '/companies.delete', ('id',), ()),
+    ('companies.info', 'POST', '/companies.info', ('id',), ('includes',)),
+    ('companies.list', 'POST', '/companies.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('companies.tag', 'POST', '/companies.tag', ('id', 'tags'), ()),
+    ('companies.untag', 'POST', '/companies.untag', ('id', 'tags'), ()),
+    ('companies.update', 'POST', '/companies.update', ('id',), ('addresses', 'bic', 'business_type_id', 'custom_fields', 'emails', 'iban', 'language', 'marketing_mails_consent', 'name', 'national_identification_number', 'preferred_currency', 'remarks', 'responsible_user_id', 'tags', 'telephones', 'vat_number', 'website')),
+    ('companies.uploadLogo', 'POST', '/companies.uploadLogo', ('id', 'image'), ()),
+))
+# fmt: on
@@ -0,0 +1,27 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('contacts', (
+    ('contacts.add', 'POST', '/contacts.add', ('last_name',), ('addresses', 'bic', 'birthdate', 'custom_fields', 'emails', 'first_name', 'gender', 'iban', 'language', 'marketing_mails_consent', 'national_identification_number', 'remarks', 'salutation', 'tags', 'telephones', 'website')),
+    ('contacts.delete', 'POST', '/contacts.delete', ('id',), ()),
+    ('contacts.info', 'POST', '/contacts.info', ('id',), ()),
+    ('contacts.linkToCompany', 'POST', '/contacts.linkToCompany', ('company_id', 'id'), ('decision_maker', 'position')),
+    ('contacts.list', 'POST', '/contacts.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('contacts.tag', 'POST', '/contacts.tag', ('id', 'tags'), ()),
+    ('contacts.unlinkFromCompany', 'POST', '/contacts.unlinkFromCompany', ('company_id', 'id'), ()),
+    ('contacts.untag', 'POST', '/contacts.untag', ('id', 'tags'), ()),
+    ('contacts.update', 'POST', '/contacts.update', ('id',), ('addresses', 'bic', 'birthdate', 'custom_fields', 'emails', 'first_name', 'gender', 'iban', 'language', 'last_name', 'marketing_mails_consent', 'national_identification_number', 'remarks', 'salutation', 'tags', 'telephones', 'website')),
+    ('contacts.updateCompanyLink', 'POST', '/contacts.updateCompanyLink', ('company_id', 'id'), ('decision_maker', 'position')),
+    ('contacts.uploadAvatar', 'POST', '/contacts.uploadAvatar', ('id', 'image'), ()),
+))
+# fmt: on
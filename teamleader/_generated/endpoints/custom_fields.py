@@ -0,0 +1,19 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('custom_fields', (
+    ('customFieldDefinitions.create', 'POST', '/customFieldDefinitions.create', ('context', 'label', 'type'), ('configuration',)),
+    ('customFieldDefinitions.info', 'POST', '/customFieldDefinitions.info', ('id',), ()),
+    ('customFieldDefinitions.list', 'POST', '/customFieldDefinitions.list', (), ('filter', 'page', 'sort')),
+))
+# fmt: on
@@ -0,0 +1,20 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('day_off_types', (
+    ('dayOffTypes.create', 'POST', '/dayOffTypes.create', ('name',), ('color', 'date_validity')),
+    ('dayOffTypes.delete', 'POST', '/dayOffTypes.delete', ('id',), ()),
+    ('dayOffTypes.list', 'POST', '/dayOffTypes.list', (), ()),
+    ('dayOffTypes.update', 'POST', '/dayOffTypes.update', ('id',), ('color', 'date_validity', 'name')),
+))
+# fmt: on
@@ -0,0 +1,18 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('days_off', (
+    ('daysOff.bulkDelete', 'POST', '/daysOff.bulkDelete', ('user_id',), ('ids',)),
+    ('daysOff.import', 'POST', '/daysOff.import', ('days', 'leave_type_id', 'user_id'), ()),
+))
+# fmt: on
@@ -0,0 +1,22 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('deal_phases', (
+    ('dealPhases.create', 'POST', '/dealPhases.create', ('deal_pipeline_id', 'name', 'requires_attention_after'), ('estimated_probability', 'follow_up_actions')),
+    ('dealPhases.delete', 'POST', '/dealPhases.delete', ('id',), ('new_phase_id',)),
+    ('dealPhases.duplicate', 'POST', '/dealPhases.duplicate', ('id',), ()),
+    ('dealPhases.list', 'POST', '/dealPhases.list', (), ('filter', 'page')),
+    ('dealPhases.move', 'POST', '/dealPhases.move', ('after_phase_id', 'id'), ()),
+    ('dealPhases.update', 'POST', '/dealPhases.update', ('id', 'requires_attention_after'), ('estimated_probability', 'follow_up_actions', 'name')),
+))
+# fmt: on
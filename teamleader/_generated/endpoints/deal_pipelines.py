@@ -0,0 +1,22 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('deal_pipelines', (
+    ('dealPipelines.create', 'POST', '/dealPipelines.create', ('name',), ()),
+    ('dealPipelines.delete', 'POST', '/dealPipelines.delete', ('id',), ('migrate_phases',)),
+    ('dealPipelines.duplicate', 'POST', '/dealPipelines.duplicate', ('id',), ()),
+    ('dealPipelines.list', 'POST', '/dealPipelines.list', (), ('filter', 'page')),
+    ('dealPipelines.markAsDefault', 'POST', '/dealPipelines.markAsDefault', ('id',), ()),
+    ('dealPipelines.update', 'POST', '/dealPipelines.update', ('id', 'name'), ()),
+))
+# fmt: on
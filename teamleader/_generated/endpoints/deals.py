@@ -0,0 +1,25 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('deals', (
+    ('deals.create', 'POST', '/deals.create', ('lead', 'title'), ('currency', 'custom_fields', 'department_id', 'estimated_closing_date', 'estimated_probability', 'estimated_value', 'phase_id', 'responsible_user_id', 'source_id', 'summary')),
+    ('deals.delete', 'POST', '/deals.delete', ('id',), ()),
+    ('deals.info', 'POST', '/deals.info', ('id',), ()),
+    ('deals.list', 'POST', '/deals.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('deals.lose', 'POST', '/deals.lose', ('id',), ('extra_info', 'reason_id')),
+    ('deals.move', 'POST', '/deals.move', ('id', 'phase_id'), ()),
+    ('deals.update', 'POST', '/deals.update', ('id',), ('currency', 'custom_fields', 'department_id', 'estimated_closing_date', 'estimated_probability', 'estimated_value', 'lead', 'responsible_user_id', 'source_id', 'summary', 'title')),
+    ('deals.win', 'POST', '/deals.win', ('id',), ()),
+    ('lostReasons.list', 'POST', '/lostReasons.list', (), ('filter', 'page', 'sort')),
+))
+# fmt: on
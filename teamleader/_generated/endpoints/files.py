@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('files', (
+    ('files.delete', 'POST', '/files.delete', ('id',), ()),
+    ('files.download', 'POST', '/files.download', ('id',), ()),
+    ('files.info', 'POST', '/files.info', ('id',), ()),
+    ('files.list', 'POST', '/files.list', ('filter',), ('page', 'sort')),
+    ('files.upload', 'POST', '/files.upload', ('name', 'subject'), ('folder',)),
+))
+# fmt: on
@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('groups', (
+    ('projectGroups.assign', 'POST', '/projects-v2/projectGroups.assign', ('assignee', 'id'), ()),
+    ('projectGroups.create', 'POST', '/projects-v2/projectGroups.create', ('project_id', 'title'), ('assignees', 'billing_method', 'color', 'description', 'end_date', 'external_budget', 'fixed_price', 'internal_budget', 'start_date')),
+    ('projectGroups.delete', 'POST', '/projects-v2/projectGroups.delete', ('delete_strategy', 'id'), ()),
+    ('projectGroups.duplicate', 'POST', '/projects-v2/projectGroups.duplicate', ('origin_id',), ()),
+    ('projectGroups.info', 'POST', '/projects-v2/projectGroups.info', ('id',), ()),
+    ('projectGroups.list', 'POST', '/projects-v2/projectGroups.list', (), ('filter',)),
+    ('projectGroups.unassign', 'POST', '/projects-v2/projectGroups.unassign', ('assignee', 'id'), ()),
+    ('projectGroups.update', 'POST', '/projects-v2/projectGroups.update', ('id',), ('billing_method', 'color', 'description', 'end_date', 'external_budget', 'fixed_price', 'internal_budget', 'start_date', 'title')),
+))
+# fmt: on
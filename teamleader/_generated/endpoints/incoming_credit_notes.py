@@ -0,0 +1,28 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('incoming_credit_notes', (
+    ('incomingCreditNotes.add', 'POST', '/incomingCreditNotes.add', ('currency', 'title'), ('company_entity_id', 'document_number', 'due_date', 'file_id', 'iban_number', 'invoice_date', 'payment_reference', 'supplier_id', 'total')),
+    ('incomingCreditNotes.approve', 'POST', '/incomingCreditNotes.approve', ('id',), ()),
+    ('incomingCreditNotes.delete', 'POST', '/incomingCreditNotes.delete', ('id',), ()),
+    ('incomingCreditNotes.info', 'POST', '/incomingCreditNotes.info', ('id',), ()),
+    ('incomingCreditNotes.listPayments', 'POST', '/incomingCreditNotes.listPayments', ('id',), ()),
+    ('incomingCreditNotes.markAsPendingReview', 'POST', '/incomingCreditNotes.markAsPendingReview', ('id',), ()),
+    ('incomingCreditNotes.refuse', 'POST', '/incomingCreditNotes.refuse', ('id',), ()),
+    ('incomingCreditNotes.registerPayment', 'POST', '/incomingCreditNotes.registerPayment', ('id', 'paid_at', 'payment'), ('payment_method_id', 'remark')),
+    ('incomingCreditNotes.removePayment', 'POST', '/incomingCreditNotes.removePayment', ('id', 'payment_id'), ()),
+    ('incomingCreditNotes.sendToBookkeeping', 'POST', '/incomingCreditNotes.sendToBookkeeping', ('id',), ()),
+    ('incomingCreditNotes.update', 'POST', '/incomingCreditNotes.update', ('id',), ('company_entity_id', 'currency', 'document_number', 'due_date', 'file_id', 'iban_number', 'invoice_date', 'payment_reference', 'supplier_id', 'title', 'total')),
+    ('incomingCreditNotes.updatePayment', 'POST', '/incomingCreditNotes.updatePayment', ('id', 'payment_id'), ('paid_at', 'payment', 'payment_method_id', 'remark')),
+))
+# fmt: on
@@ -0,0 +1,28 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('incoming_invoices', (
+    ('incomingInvoices.add', 'POST', '/incomingInvoices.add', ('currency', 'title'), ('company_entity_id', 'document_number', 'due_date', 'file_id', 'iban_number', 'invoice_date', 'payment_reference', 'supplier_id', 'total')),
+    ('incomingInvoices.approve', 'POST', '/incomingInvoices.approve', ('id',), ()),
+    ('incomingInvoices.delete', 'POST', '/incomingInvoices.delete', ('id',), ()),
+    ('incomingInvoices.info', 'POST', '/incomingInvoices.info', ('id',), ()),
+    ('incomingInvoices.listPayments', 'POST', '/incomingInvoices.listPayments', ('id',), ()),
+    ('incomingInvoices.markAsPendingReview', 'POST', '/incomingInvoices.markAsPendingReview', ('id',), ()),
+    ('incomingInvoices.refuse', 'POST', '/incomingInvoices.refuse', ('id',), ()),
+    ('incomingInvoices.registerPayment', 'POST', '/incomingInvoices.registerPayment', ('id', 'paid_at', 'payment'), ('payment_method_id', 'remark')),
+    ('incomingInvoices.removePayment', 'POST', '/incomingInvoices.removePayment', ('id', 'payment_id'), ()),
+    ('incomingInvoices.sendToBookkeeping', 'POST', '/incomingInvoices.sendToBookkeeping', ('id',), ()),
+    ('incomingInvoices.update', 'POST', '/incomingInvoices.update', ('id',), ('company_entity_id', 'currency', 'document_number', 'due_date', 'file_id', 'iban_number', 'invoice_date', 'payment_reference', 'supplier_id', 'title', 'total')),
+    ('incomingInvoices.updatePayment', 'POST', '/incomingInvoices.updatePayment', ('id', 'payment_id'), ('paid_at', 'payment', 'payment_method_id', 'remark')),
+))
+# fmt: on
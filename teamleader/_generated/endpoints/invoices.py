@@ -0,0 +1,31 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('invoices', (
+    ('invoices.book', 'POST', '/invoices.book', ('id', 'on'), ()),
+    ('invoices.copy', 'POST', '/invoices.copy', ('id',), ()),
+    ('invoices.credit', 'POST', '/invoices.credit', ('id',), ('credit_note_date',)),
+    ('invoices.creditPartially', 'POST', '/invoices.creditPartially', ('grouped_lines', 'id'), ('credit_note_date', 'discounts')),
+    ('invoices.delete', 'POST', '/invoices.delete', ('id',), ()),
+    ('invoices.download', 'POST', '/invoices.download', ('format', 'id'), ()),
+    ('invoices.draft', 'POST', '/invoices.draft', ('department_id', 'grouped_lines', 'invoicee', 'payment_term'), ('currency', 'custom_fields', 'delivery_date', 'discounts', 'document_template_id', 'expected_payment_method', 'invoice_date', 'note', 'project_id', 'purchase_order_number')),
+    ('invoices.info', 'POST', '/invoices.info', (), ('id', 'includes')),
+    ('invoices.list', 'POST', '/invoices.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('invoices.registerPayment', 'POST', '/invoices.registerPayment', ('id', 'paid_at', 'payment'), ('payment_method_id',)),
+    ('invoices.removePayments', 'POST', '/invoices.removePayments', ('id',), ()),
+    ('invoices.send', 'POST', '/invoices.send', ('content', 'id'), ('attachments', 'recipients')),
+    ('invoices.sendViaPeppol', 'POST', '/invoices.sendViaPeppol', ('id',), ()),
+    ('invoices.update', 'POST', '/invoices.update', ('id',), ('currency', 'custom_fields', 'delivery_date', 'discounts', 'document_template_id', 'expected_payment_method', 'grouped_lines', 'invoice_date', 'invoicee', 'note', 'payment_term', 'project_id', 'purchase_order_number')),
+    ('invoices.updateBooked', 'POST', '/invoices.updateBooked', ('id',), ('custom_fields', 'grouped_lines', 'invoice_date', 'invoicee', 'note', 'payment_term', 'project_id')),
+))
+# fmt: on
@@ -0,0 +1,23 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('legacy_milestones', (
+    ('LegacyMilestones.close', 'POST', '/milestones.close', ('id',), ()),
+    ('LegacyMilestones.create', 'POST', '/milestones.create', ('due_on', 'name', 'project_id', 'responsible_user_id'), ('custom_fields', 'depends_on', 'description', 'starts_on')),
+    ('LegacyMilestones.delete', 'POST', '/milestones.delete', ('id',), ()),
+    ('LegacyMilestones.info', 'POST', '/milestones.info', ('id',), ()),
+    ('LegacyMilestones.list', 'POST', '/milestones.list', (), ('filter', 'page', 'sort')),
+    ('LegacyMilestones.open', 'POST', '/milestones.open', ('id',), ()),
+    ('LegacyMilestones.update', 'POST', '/milestones.update', ('id',), ('custom_fields', 'depends_on', 'description', 'due_on', 'name', 'propagate_date_changes', 'responsible_user_id', 'starts_on')),
+))
+# fmt: on
@@ -0,0 +1,25 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('legacy_projects', (
+    ('LegacyProjects.addParticipant', 'POST', '/projects.addParticipant', ('id', 'participant'), ('role',)),
+    ('LegacyProjects.close', 'POST', '/projects.close', ('id',), ()),
+    ('LegacyProjects.create', 'POST', '/projects.create', ('milestones', 'participants', 'starts_on', 'title'), ('custom_fields', 'customer', 'description', 'purchase_order_number')),
+    ('LegacyProjects.delete', 'POST', '/projects.delete', ('id',), ()),
+    ('LegacyProjects.info', 'POST', '/projects.info', ('id',), ()),
+    ('LegacyProjects.list', 'POST', '/projects.list', (), ('filter', 'page', 'sort')),
+    ('LegacyProjects.reopen', 'POST', '/projects.reopen', ('id',), ()),
+    ('LegacyProjects.update', 'POST', '/projects.update', ('id',), ('budget', 'custom_fields', 'customer', 'description', 'purchase_order_number', 'starts_on', 'status', 'title')),
+    ('LegacyProjects.updateParticipant', 'POST', '/projects.updateParticipant', ('id', 'role'), ('participant',)),
+))
+# fmt: on
@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('materials', (
+    ('NextgenProjectsMaterials.assign', 'POST', '/projects-v2/materials.assign', ('assignee', 'id'), ()),
+    ('NextgenProjectsMaterials.create', 'POST', '/projects-v2/materials.create', ('project_id', 'title'), ('after_id', 'assignees', 'billing_method', 'description', 'end_date', 'external_budget', 'fixed_price', 'group_id', 'internal_budget', 'product_id', 'quantity', 'quantity_estimated', 'start_date', 'unit_cost', 'unit_id', 'unit_price')),
+    ('NextgenProjectsMaterials.delete', 'POST', '/projects-v2/materials.delete', ('id',), ()),
+    ('NextgenProjectsMaterials.duplicate', 'POST', '/projects-v2/materials.duplicate', ('origin_id',), ()),
+    ('NextgenProjectsMaterials.info', 'POST', '/projects-v2/materials.info', ('id',), ()),
+    ('NextgenProjectsMaterials.list', 'POST', '/projects-v2/materials.list', (), ('filter',)),
+    ('NextgenProjectsMaterials.unassign', 'POST', '/projects-v2/materials.unassign', ('assignee', 'id'), ()),
+    ('NextgenProjectsMaterials.update', 'POST', '/projects-v2/materials.update', ('id',), ('billing_method', 'description', 'end_date', 'external_budget', 'fixed_price', 'internal_budget', 'product_id', 'quantity', 'quantity_estimated', 'start_date', 'status', 'title', 'unit_cost', 'unit_id', 'unit_price')),
+))
+# fmt: on
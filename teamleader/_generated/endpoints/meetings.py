@@ -0,0 +1,23 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('meetings', (
+    ('meetings.complete', 'POST', '/meetings.complete', ('id',), ()),
+    ('meetings.createReport', 'POST', '/meetings.createReport', ('attach_to', 'id'), ('custom_fields', 'summary')),
+    ('meetings.delete', 'POST', '/meetings.delete', ('id',), ()),
+    ('meetings.info', 'POST', '/meetings.info', ('id',), ('includes',)),
+    ('meetings.list', 'POST', '/meetings.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('meetings.schedule', 'POST', '/meetings.schedule', ('attendees', 'ends_at', 'starts_at', 'title'), ('custom_fields', 'customer', 'deal_id', 'description', 'location', 'milestone_id', 'work_order_id')),
+    ('meetings.update', 'POST', '/meetings.update', ('id',), ('attendees', 'custom_fields', 'customer', 'deal_id', 'description', 'ends_at', 'location', 'milestone_id', 'starts_at', 'title')),
+))
+# fmt: on
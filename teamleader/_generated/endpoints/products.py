@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('products', (
+    ('products.add', 'POST', '/products.add', (), ()),
+    ('products.delete', 'POST', '/products.delete', ('id',), ()),
+    ('products.info', 'POST', '/products.info', ('id',), ('includes',)),
+    ('products.list', 'POST', '/products.list', (), ('filter', 'page')),
+    ('products.update', 'POST', '/products.update', ('id',), ('code', 'configuration', 'custom_fields', 'department_id', 'description', 'name', 'price_list_prices', 'product_category_id', 'purchase_price', 'selling_price', 'stock', 'tax_rate_id', 'unit_of_measure_id')),
+))
+# fmt: on
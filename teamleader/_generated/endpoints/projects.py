@@ -0,0 +1,34 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('projects', (
+    ('NextgenProjects.addCustomer', 'POST', '/projects-v2/projects.addCustomer', ('customer', 'id'), ()),
+    ('NextgenProjects.addDeal', 'POST', '/projects-v2/projects.addDeal', ('deal_id', 'id'), ()),
+    ('NextgenProjects.addOwner', 'POST', '/projects-v2/projects.addOwner', ('id', 'user_id'), ()),
+    ('NextgenProjects.addQuotation', 'POST', '/projects-v2/projects.addQuotation', ('id', 'quotation_id'), ()),
+    ('NextgenProjects.assign', 'POST', '/projects-v2/projects.assign', ('assignee', 'id'), ()),
+    ('NextgenProjects.close', 'POST', '/projects-v2/projects.close', ('closing_strategy', 'id'), ()),
+    ('NextgenProjects.create', 'POST', '/projects-v2/projects.create', ('title',), ('assignees', 'billing_method', 'color', 'company_entity_id', 'custom_fields', 'customers', 'deal_ids', 'description', 'end_date', 'external_budget', 'fixed_price', 'initial_amount_billed', 'initial_amount_paid', 'initial_cost', 'initial_price', 'initial_time_tracked', 'internal_budget', 'owner_ids', 'purchase_order_number', 'quotation_ids', 'start_date', 'time_budget')),
+    ('NextgenProjects.delete', 'POST', '/projects-v2/projects.delete', ('delete_strategy', 'id'), ()),
+    ('NextgenProjects.duplicate', 'POST', '/projects-v2/projects.duplicate', ('id', 'title'), ()),
+    ('NextgenProjects.info', 'POST', '/projects-v2/projects.info', ('id',), ('includes',)),
+    ('NextgenProjects.list', 'POST', '/projects-v2/projects.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('NextgenProjects.removeCustomer', 'POST', '/projects-v2/projects.removeCustomer', ('customer', 'id'), ()),
+    ('NextgenProjects.removeDeal', 'POST', '/projects-v2/projects.removeDeal', ('deal_id', 'id'), ()),
+    ('NextgenProjects.removeOwner', 'POST', '/projects-v2/projects.removeOwner', ('id', 'user_id'), ()),
+    ('NextgenProjects.removeQuotation', 'POST', '/projects-v2/projects.removeQuotation', ('id', 'quotation_id'), ()),
+    ('NextgenProjects.reopen', 'POST', '/projects-v2/projects.reopen', ('id',), ()),
+    ('NextgenProjects.unassign', 'POST', '/projects-v2/projects.unassign', ('assignee', 'id'), ()),
+    ('NextgenProjects.update', 'POST', '/projects-v2/projects.update', ('id',), ('billing_method', 'color', 'company_entity_id', 'custom_fields', 'description', 'end_date', 'external_budget', 'fixed_price', 'internal_budget', 'purchase_order_number', 'start_date', 'time_budget', 'title')),
+))
+# fmt: on
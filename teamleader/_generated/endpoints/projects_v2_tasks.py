@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('projects_v2_tasks', (
+    ('NextgenProjectsTasks.assign', 'POST', '/projects-v2/tasks.assign', ('assignee', 'id'), ()),
+    ('NextgenProjectsTasks.create', 'POST', '/projects-v2/tasks.create', ('project_id', 'title'), ('assignees', 'billing_method', 'custom_rate', 'description', 'end_date', 'external_budget', 'fixed_price', 'group_id', 'internal_budget', 'start_date', 'task_type_id', 'time_estimated', 'work_type_id')),
+    ('NextgenProjectsTasks.delete', 'POST', '/projects-v2/tasks.delete', ('delete_strategy', 'id'), ()),
+    ('NextgenProjectsTasks.duplicate', 'POST', '/projects-v2/tasks.duplicate', ('origin_id',), ()),
+    ('NextgenProjectsTasks.info', 'POST', '/projects-v2/tasks.info', ('id',), ()),
+    ('NextgenProjectsTasks.list', 'POST', '/projects-v2/tasks.list', (), ('filter', 'page')),
+    ('NextgenProjectsTasks.unassign', 'POST', '/projects-v2/tasks.unassign', ('assignee', 'id'), ()),
+    ('NextgenProjectsTasks.update', 'POST', '/projects-v2/tasks.update', ('id',), ('billing_method', 'custom_rate', 'description', 'end_date', 'external_budget', 'fixed_price', 'internal_budget', 'start_date', 'status', 'task_type_id', 'time_estimated', 'title', 'work_type_id')),
+))
+# fmt: on
@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('quotations', (
+    ('quotations.accept', 'POST', '/quotations.accept', ('id',), ()),
+    ('quotations.create', 'POST', '/quotations.create', ('deal_id',), ('currency', 'discounts', 'document_template_id', 'expiry', 'grouped_lines', 'text')),
+    ('quotations.delete', 'POST', '/quotations.delete', ('id',), ()),
+    ('quotations.download', 'POST', '/quotations.download', ('format', 'id'), ()),
+    ('quotations.info', 'POST', '/quotations.info', ('id',), ()),
+    ('quotations.list', 'POST', '/quotations.list', (), ('filter', 'page')),
+    ('quotations.send', 'POST', '/quotations.send', ('content', 'language', 'quotations', 'recipients', 'subject'), ('attachments', 'from')),
+    ('quotations.update', 'POST', '/quotations.update', ('id',), ('currency', 'discounts', 'document_template_id', 'expiry', 'grouped_lines', 'text')),
+))
+# fmt: on
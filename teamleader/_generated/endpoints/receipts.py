@@ -0,0 +1,28 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('receipts', (
+    ('receipts.add', 'POST', '/receipts.add', ('currency', 'title'), ('company_entity_id', 'document_number', 'file_id', 'receipt_date', 'supplier_id', 'total')),
+    ('receipts.approve', 'POST', '/receipts.approve', ('id',), ()),
+    ('receipts.delete', 'POST', '/receipts.delete', ('id',), ()),
+    ('receipts.info', 'POST', '/receipts.info', ('id',), ()),
+    ('receipts.listPayments', 'POST', '/receipts.listPayments', ('id',), ()),
+    ('receipts.markAsPendingReview', 'POST', '/receipts.markAsPendingReview', ('id',), ()),
+    ('receipts.refuse', 'POST', '/receipts.refuse', ('id',), ()),
+    ('receipts.registerPayment', 'POST', '/receipts.registerPayment', ('id', 'paid_at', 'payment'), ('payment_method_id', 'remark')),
+    ('receipts.removePayment', 'POST', '/receipts.removePayment', ('id', 'payment_id'), ()),
+    ('receipts.sendToBookkeeping', 'POST', '/receipts.sendToBookkeeping', ('id',), ()),
+    ('receipts.update', 'POST', '/receipts.update', ('id',), ('company_entity_id', 'currency', 'document_number', 'file_id', 'receipt_date', 'supplier_id', 'title', 'total')),
+    ('receipts.updatePayment', 'POST', '/receipts.updatePayment', ('id', 'payment_id'), ('paid_at', 'payment', 'payment_method_id', 'remark')),
+))
+# fmt: on
@@ -0,0 +1,20 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('reservations', (
+    ('reservations.create', 'POST', '/reservations.create', ('assignee', 'date', 'duration', 'plannable_item_id'), ()),
+    ('reservations.delete', 'POST', '/reservations.delete', ('id',), ()),
+    ('reservations.list', 'POST', '/reservations.list', (), ('filter', 'page')),
+    ('reservations.update', 'POST', '/reservations.update', ('id',), ('assignee', 'date', 'duration')),
+))
+# fmt: on
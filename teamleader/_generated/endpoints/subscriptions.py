@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('subscriptions', (
+    ('subscriptions.create', 'POST', '/subscriptions.create', ('billing_cycle', 'department_id', 'grouped_lines', 'invoice_generation', 'invoicee', 'payment_term', 'starts_on', 'title'), ('custom_fields', 'deal_id', 'document_template_id', 'ends_on', 'note', 'project_id')),
+    ('subscriptions.deactivate', 'POST', '/subscriptions.deactivate', ('id',), ()),
+    ('subscriptions.info', 'POST', '/subscriptions.info', ('id',), ()),
+    ('subscriptions.list', 'POST', '/subscriptions.list', (), ('filter', 'page', 'sort')),
+    ('subscriptions.update', 'POST', '/subscriptions.update', ('id',), ('billing_cycle', 'custom_fields', 'deal_id', 'department_id', 'document_template_id', 'ends_on', 'grouped_lines', 'invoice_generation', 'invoicee', 'note', 'payment_term', 'project_id', 'starts_on', 'title')),
+))
+# fmt: on
@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('tasks', (
+    ('tasks.complete', 'POST', '/tasks.complete', ('id',), ()),
+    ('tasks.create', 'POST', '/tasks.create', ('due_on', 'title', 'work_type_id'), ('assignee', 'custom_fields', 'customer', 'deal_id', 'description', 'estimated_duration', 'milestone_id', 'project_id', 'ticket_id')),
+    ('tasks.delete', 'POST', '/tasks.delete', ('id',), ()),
+    ('tasks.info', 'POST', '/tasks.info', ('id',), ()),
+    ('tasks.list', 'POST', '/tasks.list', (), ('filter', 'page', 'sort')),
+    ('tasks.reopen', 'POST', '/tasks.reopen', ('id',), ()),
+    ('tasks.schedule', 'POST', '/tasks.schedule', ('ends_at', 'id', 'starts_at'), ()),
+    ('tasks.update', 'POST', '/tasks.update', ('id',), ('assignee', 'custom_fields', 'customer', 'deal_id', 'description', 'due_on', 'estimated_duration', 'milestone_id', 'project_id', 'ticket_id', 'title', 'work_type_id')),
+))
+# fmt: on
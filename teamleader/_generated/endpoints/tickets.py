@@ -0,0 +1,25 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('tickets', (
+    ('tickets.addInternalMessage', 'POST', '/tickets.addInternalMessage', ('body', 'id'), ('attachments', 'ticket_status_id')),
+    ('tickets.addReply', 'POST', '/tickets.addReply', ('body', 'id'), ('attachments', 'ticket_status_id')),
+    ('tickets.create', 'POST', '/tickets.create', ('customer', 'subject', 'ticket_status_id'), ('assignee', 'custom_fields', 'description', 'initial_reply', 'milestone_id', 'participant')),
+    ('tickets.getMessage', 'POST', '/tickets.getMessage', (), ('message_id',)),
+    ('tickets.importMessage', 'POST', '/tickets.importMessage', ('body', 'id', 'sent_at', 'sent_by'), ('attachments',)),
+    ('tickets.info', 'POST', '/tickets.info', ('id',), ()),
+    ('tickets.list', 'POST', '/tickets.list', (), ('filter', 'page')),
+    ('tickets.listMessages', 'POST', '/tickets.listMessages', (), ('filter', 'id', 'page')),
+    ('tickets.update', 'POST', '/tickets.update', ('id',), ('assignee', 'custom_fields', 'customer', 'description', 'milestone_id', 'participant', 'subject', 'ticket_status_id')),
+))
+# fmt: on
@@ -0,0 +1,22 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('time_tracking', (
+    ('timeTracking.add', 'POST', '/timeTracking.add', (), ('description', 'invoiceable', 'subject', 'user_id', 'work_type_id')),
+    ('timeTracking.delete', 'POST', '/timeTracking.delete', ('id',), ()),
+    ('timeTracking.info', 'POST', '/timeTracking.info', ('id',), ('includes',)),
+    ('timeTracking.list', 'POST', '/timeTracking.list', (), ('filter', 'includes', 'page', 'sort')),
+    ('timeTracking.resume', 'POST', '/timeTracking.resume', ('id',), ('started_at',)),
+    ('timeTracking.update', 'POST', '/timeTracking.update', ('duration', 'id'), ('description', 'invoiceable', 'subject', 'work_type_id')),
+))
+# fmt: on
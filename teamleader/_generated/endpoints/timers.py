@@ -0,0 +1,20 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('timers', (
+    ('timers.current', 'POST', '/timers.current', (), ()),
+    ('timers.start', 'POST', '/timers.start', (), ('description', 'invoiceable', 'started_at', 'subject', 'work_type_id')),
+    ('timers.stop', 'POST', '/timers.stop', (), ()),
+    ('timers.update', 'POST', '/timers.update', (), ('description', 'invoiceable', 'started_at', 'subject', 'work_type_id')),
+))
+# fmt: on
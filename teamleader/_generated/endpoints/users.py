@@ -0,0 +1,21 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:20:52Z
+# ============================================================
+
+from __future__ import annotations
+
+from teamleader._generated.endpoints import _table
+
+# (operation_id, method, path, required_params, optional_params)
+# fmt: off
+ENDPOINTS = _table('users', (
+    ('users.getWeekSchedule', 'POST', '/users.getWeekSchedule', ('id',), ()),
+    ('users.info', 'POST', '/users.info', ('id',), ('includes',)),
+    ('users.list', 'POST', '/users.list', (), ('filter', 'page', 'sort')),
+    ('users.listDaysOff', 'POST', '/users.listDaysOff', ('id',), ('filter', 'page')),
+    ('users.me', 'POST', '/users.me', (), ()),
+))
+# fmt: on
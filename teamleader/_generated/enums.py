@@ -2,7 +2,7 @@
 # AUTO-GENERATED — DO NOT EDIT BY HAND
 # Run `python codegen/generate.py` to regenerate.
 # Spec version: 1.112.0
-# Generated at: 2026-02-24T13:41:23Z
+# Generated at: 2026-10-18T22:13:26Z
 # ============================================================
 
 from __future__ import annotations
@@ -0,0 +1,515 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:13:26Z
+# ============================================================
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# class name → tag module defining it
+# fmt: off
+_CLASS_MODULES: dict[str, str] = {
+    '_AddressrequestBase': 'common',
+    '_AddressresponseBase': 'common',
+    '_AddressesrequestBase': 'common',
+    '_AddressesresponseBase': 'common',
+    '_AmountwithtaxBase': 'common',
+    '_AssigneeBase': 'common',
+    '_AssigneesBase': 'common',
+    '_AttendeeBase': 'common',
+    '_AttendeesBase': 'common',
+    '_BillingcycleBase': 'common',
+    '_BillinginfoBase': 'common',
+    '_BillingmethodBase': 'common',
+    '_CcemailBase': 'common',
+    '_CcemailaddressBase': 'common',
+    '_CommercialdiscountBase': 'common',
+    '_CompanycustomerBase': 'common',
+    '_CompanytelephoneBase': 'common',
+    '_CreditnotesgroupedlinesresponseBase': 'common',
+    '_CreditnoteslistinvoiceeBase': 'common',
+    '_CreditnotesresponseinvoiceeBase': 'common',
+    '_CurrencyBase': 'common',
+    '_CurrencyexchangerateBase': 'common',
+    '_CurrencywithrequiredexchangerateBase': 'common',
+    '_CustomfieldsrequestBase': 'common',
+    '_CustomfieldsresponseBase': 'common',
+    '_CustomerBase': 'common',
+    '_DatevalidityBase': 'common',
+    '_DiscountBase': 'common',
+    '_DownloadBase': 'common',
+    '_DurationinminutesBase': 'common',
+    '_DurationinminutesfullBase': 'common',
+    '_EmailBase': 'common',
+    '_ExpiryBase': 'common',
+    '_ForattentionofBase': 'common',
+    '_IdandnameBase': 'common',
+    '_InvoicesgroupedlinesrequestBase': 'common',
+    '_InvoicesgroupedlinesresponseBase': 'common',
+    '_InvoiceslistinvoiceeBase': 'common',
+    '_InvoicesrequestinvoiceeBase': 'common',
+    '_InvoicesresponseinvoiceeBase': 'common',
+    '_InvoicingpreferencesBase': 'common',
+    '_LeadrequestBase': 'common',
+    '_LeadresponseBase': 'common',
+    '_LineitemrequestBase': 'common',
+    '_LineitemresponseBase': 'common',
+    '_LostreasonBase': 'common',
+    '_MetaBase': 'common',
+    '_MilestonesactualsBase': 'common',
+    '_MilestonesbudgetBase': 'common',
+    '_MoneyBase': 'common',
+    '_OrdersgroupedlinesresponseBase': 'common',
+    '_PageBase': 'common',
+    '_PaginationBase': 'common',
+    '_ParticipantBase': 'common',
+    '_ParticipantsBase': 'common',
+    '_PaymenttermBase': 'common',
+    '_PeriodBase': 'common',
+    '_ProductconfigurationreadBase': 'common',
+    '_ProductconfigurationwriteBase': 'common',
+    '_ProductpricewriteBase': 'common',
+    '_ProjectsactualsBase': 'common',
+    '_ProjectsbudgetBase': 'common',
+    '_QuotationsgroupedlinesrequestBase': 'common',
+    '_QuotationsgroupedlinesresponseBase': 'common',
+    '_RelatedcontactsBase': 'common',
+    '_RequiresattentionafterBase': 'common',
+    '_SenderBase': 'common',
+    '_SentbyBase': 'common',
+    '_SortBase': 'common',
+    '_StockBase': 'common',
+    '_StockthresholdBase': 'common',
+    '_SubscriptionsgroupedlinesrequestBase': 'common',
+    '_SubscriptionsgroupedlinesresponseBase': 'common',
+    '_SubscriptionsresponseinvoiceeBase': 'common',
+    '_TaxesBase': 'common',
+    '_TelephoneBase': 'common',
+    '_TimeBase': 'common',
+    '_TimetrackingmaterialsBase': 'common',
+    '_ToemailBase': 'common',
+    '_ToemailaddressBase': 'common',
+    '_TypeandidBase': 'common',
+    '_UseravailabilityBase': 'common',
+    '_UserpreferencesBase': 'common',
+    '_WebhookBase': 'common',
+    '_AccountsProjectsV2StatusresponseBase': 'accounts',
+    '_ActivitytypesListrequestBase': 'activity_types',
+    '_ActivitytypesListresponseBase': 'activity_types',
+    '_BusinesstypesListrequestBase': 'business_types',
+    '_BusinesstypesListresponseBase': 'business_types',
+    '_CalloutcomesListrequestBase': 'call_outcomes',
+    '_CalloutcomesListresponseBase': 'call_outcomes',
+    '_CallsAddrequestBase': 'calls',
+    '_CallsAddresponseBase': 'calls',
+    '_CallsCompleterequestBase': 'calls',
+    '_CallsInforequestBase': 'calls',
+    '_CallsInforesponseBase': 'calls',
+    '_CallsListrequestBase': 'calls',
+    '_CallsListresponseBase': 'calls',
+    '_CallsUpdaterequestBase': 'calls',
+    '_ClosingdaysAddrequestBase': 'closing_days',
+    '_ClosingdaysAddresponseBase': 'closing_days',
+    '_ClosingdaysDeleterequestBase': 'closing_days',
+    '_ClosingdaysListrequestBase': 'closing_days',
+    '_ClosingdaysListresponseBase': 'closing_days',
+    '_CloudplatformsUrlrequestBase': 'cloud_platforms',
+    '_CloudplatformsUrlresponseBase': 'cloud_platforms',
+    '_CommercialdiscountsListrequestBase': 'commercial_discounts',
+    '_CommercialdiscountsListresponseBase': 'commercial_discounts',
+    '_CompaniesAddrequestBase': 'companies',
+    '_CompaniesAddresponseBase': 'companies',
+    '_CompaniesDeleterequestBase': 'companies',
+    '_CompaniesInforequestBase': 'companies',
+    '_CompaniesInforesponseBase': 'companies',
+    '_CompaniesListrequestBase': 'companies',
+    '_CompaniesListresponseBase': 'companies',
+    '_CompaniesTagrequestBase': 'companies',
+    '_CompaniesUntagrequestBase': 'companies',
+    '_CompaniesUpdaterequestBase': 'companies',
+    '_CompaniesUploadlogorequestBase': 'companies',
+    '_ContactsAddrequestBase': 'contacts',
+    '_ContactsAddresponseBase': 'contacts',
+    '_ContactsDeleterequestBase': 'contacts',
+    '_ContactsInforequestBase': 'contacts',
+    '_ContactsInforesponseBase': 'contacts',
+    '_ContactsLinktocompanyrequestBase': 'contacts',
+    '_ContactsListrequestBase': 'contacts',
+    '_ContactsListresponseBase': 'contacts',
+    '_ContactsTagrequestBase': 'contacts',
+    '_ContactsUnlinkfromcompanyrequestBase': 'contacts',
+    '_ContactsUntagrequestBase': 'contacts',
+    '_ContactsUpdatecompanylinkrequestBase': 'contacts',
+    '_ContactsUpdaterequestBase': 'contacts',
+    '_ContactsUploadavatarrequestBase': 'contacts',
+    '_CreditnotesDownloadrequestBase': 'credit_notes',
+    '_CreditnotesDownloadresponseBase': 'credit_notes',
+    '_CreditnotesInforequestBase': 'credit_notes',
+    '_CreditnotesInforesponseBase': 'credit_notes',
+    '_CreditnotesListrequestBase': 'credit_notes',
+    '_CreditnotesListresponseBase': 'credit_notes',
+    '_CreditnotesSendviapeppolBase': 'credit_notes',
+    '_CurrenciesExchangeratesrequestBase': 'currencies',
+    '_CurrenciesExchangeratesresponseBase': 'currencies',
+    '_CustomfielddefinitionsCreaterequestBase': 'custom_fields',
+    '_CustomfielddefinitionsCreateresponseBase': 'custom_fields',
+    '_CustomfielddefinitionsInforequestBase': 'custom_fields',
+    '_CustomfielddefinitionsInforesponseBase': 'custom_fields',
+    '_CustomfielddefinitionsListrequestBase': 'custom_fields',
+    '_CustomfielddefinitionsListresponseBase': 'custom_fields',
+    '_DayofftypesCreaterequestBase': 'day_off_types',
+    '_DayofftypesCreateresponseBase': 'day_off_types',
+    '_DayofftypesDeleterequestBase': 'day_off_types',
+    '_DayofftypesListresponseBase': 'day_off_types',
+    '_DayofftypesUpdaterequestBase': 'day_off_types',
+    '_DaysoffBulkdeleterequestBase': 'days_off',
+    '_DaysoffImportrequestBase': 'days_off',
+    '_DealphasesCreaterequestBase': 'deal_phases',
+    '_DealphasesCreateresponseBase': 'deal_phases',
+    '_DealphasesDeleterequestBase': 'deal_phases',
+    '_DealphasesDuplicaterequestBase': 'deal_phases',
+    '_DealphasesDuplicateresponseBase': 'deal_phases',
+    '_DealphasesListrequestBase': 'deal_phases',
+    '_DealphasesListresponseBase': 'deal_phases',
+    '_DealphasesMoverequestBase': 'deal_phases',
+    '_DealphasesUpdaterequestBase': 'deal_phases',
+    '_DealpipelinesCreaterequestBase': 'deal_pipelines',
+    '_DealpipelinesCreateresponseBase': 'deal_pipelines',
+    '_DealpipelinesDeleterequestBase': 'deal_pipelines',
+    '_DealpipelinesDuplicaterequestBase': 'deal_pipelines',
+    '_DealpipelinesDuplicateresponseBase': 'deal_pipelines',
+    '_DealpipelinesListrequestBase': 'deal_pipelines',
+    '_DealpipelinesListresponseBase': 'deal_pipelines',
+    '_DealpipelinesMarkasdefaultrequestBase': 'deal_pipelines',
+    '_DealpipelinesUpdaterequestBase': 'deal_pipelines',
+    '_DealsourcesListrequestBase': 'deal_sources',
+    '_DealsourcesListresponseBase': 'deal_sources',
+    '_DealsCreaterequestBase': 'deals',
+    '_DealsCreateresponseBase': 'deals',
+    '_DealsDeleterequestBase': 'deals',
+    '_DealsInforequestBase': 'deals',
+    '_DealsInforesponseBase': 'deals',
+    '_DealsListrequestBase': 'deals',
+    '_DealsListresponseBase': 'deals',
+    '_DealsLoserequestBase': 'deals',
+    '_DealsMoverequestBase': 'deals',
+    '_DealsUpdaterequestBase': 'deals',
+    '_DealsWinrequestBase': 'deals',
+    '_DepartmentsInforequestBase': 'departments',
+    '_DepartmentsInforesponseBase': 'departments',
+    '_DepartmentsListrequestBase': 'departments',
+    '_DepartmentsListresponseBase': 'departments',
+    '_DocumenttemplatesListrequestBase': 'document_templates',
+    '_DocumenttemplatesListresponseBase': 'document_templates',
+    '_EmailtrackingCreaterequestBase': 'email_tracking',
+    '_EmailtrackingCreateresponseBase': 'email_tracking',
+    '_EmailtrackingListrequestBase': 'email_tracking',
+    '_EmailtrackingListresponseBase': 'email_tracking',
+    '_EventsCancelrequestBase': 'calendar_events',
+    '_EventsCreaterequestBase': 'calendar_events',
+    '_EventsCreateresponseBase': 'calendar_events',
+    '_EventsInforequestBase': 'calendar_events',
+    '_EventsInforesponseBase': 'calendar_events',
+    '_EventsListrequestBase': 'calendar_events',
+    '_EventsListresponseBase': 'calendar_events',
+    '_EventsUpdaterequestBase': 'calendar_events',
+    '_ExpensesListrequestBase': 'expenses',
+    '_ExpensesListresponseBase': 'expenses',
+    '_FilesDeleterequestBase': 'files',
+    '_FilesDownloadrequestBase': 'files',
+    '_FilesDownloadresponseBase': 'files',
+    '_FilesInforequestBase': 'files',
+    '_FilesInforesponseBase': 'files',
+    '_FilesListrequestBase': 'files',
+    '_FilesListresponseBase': 'files',
+    '_FilesUploadrequestBase': 'files',
+    '_FilesUploadresponseBase': 'files',
+    '_IncomingcreditnotesListpaymentsrequestBase': 'incoming_credit_notes',
+    '_IncomingcreditnotesListpaymentsresponseBase': 'incoming_credit_notes',
+    '_IncomingcreditnotesRegisterpaymentrequestBase': 'incoming_credit_notes',
+    '_IncomingcreditnotesRegisterpaymentresponseBase': 'incoming_credit_notes',
+    '_IncomingcreditnotesRemovepaymentrequestBase': 'incoming_credit_notes',
+    '_IncomingcreditnotesUpdatepaymentrequestBase': 'incoming_credit_notes',
+    '_IncominginvoicesListpaymentsrequestBase': 'incoming_invoices',
+    '_IncominginvoicesListpaymentsresponseBase': 'incoming_invoices',
+    '_IncominginvoicesRegisterpaymentrequestBase': 'incoming_invoices',
+    '_IncominginvoicesRegisterpaymentresponseBase': 'incoming_invoices',
+    '_IncominginvoicesRemovepaymentrequestBase': 'incoming_invoices',
+    '_IncominginvoicesUpdatepaymentrequestBase': 'incoming_invoices',
+    '_InvoicesBookrequestBase': 'invoices',
+    '_InvoicesCopyrequestBase': 'invoices',
+    '_InvoicesCopyresponseBase': 'invoices',
+    '_InvoicesCreditpartiallyrequestBase': 'invoices',
+    '_InvoicesCreditpartiallyresponseBase': 'invoices',
+    '_InvoicesCreditrequestBase': 'invoices',
+    '_InvoicesCreditresponseBase': 'invoices',
+    '_InvoicesDeleterequestBase': 'invoices',
+    '_InvoicesDownloadrequestBase': 'invoices',
+    '_InvoicesDownloadresponseBase': 'invoices',
+    '_InvoicesDraftrequestBase': 'invoices',
+    '_InvoicesDraftresponseBase': 'invoices',
+    '_InvoicesInforequestBase': 'invoices',
+    '_InvoicesInforesponseBase': 'invoices',
+    '_InvoicesListrequestBase': 'invoices',
+    '_InvoicesListresponseBase': 'invoices',
+    '_InvoicesRegisterpaymentrequestBase': 'invoices',
+    '_InvoicesRemovepaymentsrequestBase': 'invoices',
+    '_InvoicesSendviapeppolBase': 'invoices',
+    '_InvoicesSendrequestBase': 'invoices',
+    '_InvoicesUpdatebookedrequestBase': 'invoices',
+    '_InvoicesUpdaterequestBase': 'invoices',
+    '_LeveltwoareasListrequestBase': 'addresses',
+    '_LeveltwoareasListresponseBase': 'addresses',
+    '_LostreasonsListrequestBase': 'deals',
+    '_LostreasonsListresponseBase': 'deals',
+    '_MailtemplatesListrequestBase': 'mail_templates',
+    '_MailtemplatesListresponseBase': 'mail_templates',
+    '_MeetingsCompleterequestBase': 'meetings',
+    '_MeetingsCreatereportrequestBase': 'meetings',
+    '_MeetingsCreatereportresponseBase': 'meetings',
+    '_MeetingsDeleterequestBase': 'meetings',
+    '_MeetingsInforequestBase': 'meetings',
+    '_MeetingsInforesponseBase': 'meetings',
+    '_MeetingsListrequestBase': 'meetings',
+    '_MeetingsListresponseBase': 'meetings',
+    '_MeetingsSchedulerequestBase': 'meetings',
+    '_MeetingsScheduleresponseBase': 'meetings',
+    '_MeetingsUpdaterequestBase': 'meetings',
+    '_MigrateActivitytyperequestBase': 'migrating',
+    '_MigrateActivitytyperesponseBase': 'migrating',
+    '_MigrateIdrequestBase': 'migrating',
+    '_MigrateIdresponseBase': 'migrating',
+    '_MigrateTaxraterequestBase': 'migrating',
+    '_MigrateTaxrateresponseBase': 'migrating',
+    '_MilestonesCloserequestBase': 'common',
+    '_MilestonesCreateresponseBase': 'common',
+    '_MilestonesDeleterequestBase': 'common',
+    '_MilestonesInforequestBase': 'common',
+    '_MilestonesInforesponseBase': 'common',
+    '_MilestonesListrequestBase': 'common',
+    '_MilestonesListresponseBase': 'common',
+    '_MilestonesOpenrequestBase': 'common',
+    '_MilestonesUpdaterequestBase': 'common',
+    '_NotesCreaterequestBase': 'notes',
+    '_NotesCreateresponseBase': 'notes',
+    '_NotesListrequestBase': 'notes',
+    '_NotesListresponseBase': 'notes',
+    '_NotesUpdaterequestBase': 'notes',
+    '_OrdersInforequestBase': 'orders',
+    '_OrdersInforesponseBase': 'orders',
+    '_OrdersListrequestBase': 'orders',
+    '_OrdersListresponseBase': 'orders',
+    '_PaymentmethodsListrequestBase': 'payment_methods',
+    '_PaymentmethodsListresponseBase': 'payment_methods',
+    '_PaymenttermsListresponseBase': 'payment_terms',
+    '_PlannableitemsInforequestBase': 'plannable_items',
+    '_PlannableitemsInforesponseBase': 'plannable_items',
+    '_PlannableitemsListrequestBase': 'plannable_items',
+    '_PlannableitemsListresponseBase': 'plannable_items',
+    '_PricelistsListrequestBase': 'price_lists',
+    '_PricelistsListresponseBase': 'price_lists',
+    '_ProductcategoriesListrequestBase': 'product_categories',
+    '_ProductcategoriesListresponseBase': 'product_categories',
+    '_ProductsAddrequestBase': 'products',
+    '_ProductsAddresponseBase': 'products',
+    '_ProductsDeleterequestBase': 'products',
+    '_ProductsInforequestBase': 'products',
+    '_ProductsInforesponseBase': 'products',
+    '_ProductsListrequestBase': 'products',
+    '_ProductsListresponseBase': 'products',
+    '_ProductsUpdaterequestBase': 'products',
+    '_ProjectsV2AddcustomerrequestBase': 'common',
+    '_ProjectsV2AdddealrequestBase': 'common',
+    '_ProjectsV2AddownerrequestBase': 'common',
+    '_ProjectsV2AddquotationrequestBase': 'common',
+    '_ProjectsV2AssignrequestBase': 'common',
+    '_ProjectsV2CloserequestBase': 'common',
+    '_ProjectsV2CreaterequestBase': 'common',
+    '_ProjectsV2DeleterequestBase': 'common',
+    '_ProjectsV2DuplicaterequestBase': 'common',
+    '_ProjectsV2DuplicateresponseBase': 'common',
+    '_ProjectsV2InforequestBase': 'common',
+    '_ProjectsV2InforesponseBase': 'common',
+    '_ProjectsV2ListrequestBase': 'common',
+    '_ProjectsV2ListresponseBase': 'common',
+    '_ProjectsV2RemovecustomerrequestBase': 'common',
+    '_ProjectsV2RemovedealrequestBase': 'common',
+    '_ProjectsV2RemoveownerrequestBase': 'common',
+    '_ProjectsV2RemovequotationrequestBase': 'common',
+    '_ProjectsV2UnassignrequestBase': 'common',
+    '_ProjectsV2UpdaterequestBase': 'common',
+    '_ProjectsV2_externalpartiesAddtoprojectrequestBase': 'common',
+    '_ProjectsV2_externalpartiesDeleterequestBase': 'common',
+    '_ProjectsV2_externalpartiesUpdaterequestBase': 'common',
+    '_ProjectsV2_materialsAssignrequestBase': 'common',
+    '_ProjectsV2_materialsCreaterequestBase': 'common',
+    '_ProjectsV2_materialsCreateresponseBase': 'common',
+    '_ProjectsV2_materialsDeleterequestBase': 'common',
+    '_ProjectsV2_materialsDuplicaterequestBase': 'common',
+    '_ProjectsV2_materialsDuplicateresponseBase': 'common',
+    '_ProjectsV2_materialsInforequestBase': 'common',
+    '_ProjectsV2_materialsInforesponseBase': 'common',
+    '_ProjectsV2_materialsListrequestBase': 'common',
+    '_ProjectsV2_materialsListresponseBase': 'common',
+    '_ProjectsV2_materialsUnassignrequestBase': 'common',
+    '_ProjectsV2_materialsUpdaterequestBase': 'common',
+    '_ProjectsV2_projectgroupsAssignrequestBase': 'common',
+    '_ProjectsV2_projectgroupsCreaterequestBase': 'common',
+    '_ProjectsV2_projectgroupsCreateresponseBase': 'common',
+    '_ProjectsV2_projectgroupsDeleterequestBase': 'common',
+    '_ProjectsV2_projectgroupsDuplicaterequestBase': 'common',
+    '_ProjectsV2_projectgroupsDuplicateresponseBase': 'common',
+    '_ProjectsV2_projectgroupsInforequestBase': 'common',
+    '_ProjectsV2_projectgroupsInforesponseBase': 'common',
+    '_ProjectsV2_projectgroupsListrequestBase': 'common',
+    '_ProjectsV2_projectgroupsListresponseBase': 'common',
+    '_ProjectsV2_projectgroupsUnassignrequestBase': 'common',
+    '_ProjectsV2_projectgroupsUpdaterequestBase': 'common',
+    '_ProjectsV2_projectlinesAddtogrouprequestBase': 'common',
+    '_ProjectsV2_projectlinesListrequestBase': 'common',
+    '_ProjectsV2_projectlinesListresponseBase': 'common',
+    '_ProjectsV2_projectlinesRemovefromgrouprequestBase': 'common',
+    '_ProjectsV2_tasksAssignrequestBase': 'common',
+    '_ProjectsV2_tasksCreaterequestBase': 'common',
+    '_ProjectsV2_tasksDeleterequestBase': 'common',
+    '_ProjectsV2_tasksDuplicaterequestBase': 'common',
+    '_ProjectsV2_tasksDuplicateresponseBase': 'common',
+    '_ProjectsV2_tasksInforesponseBase': 'common',
+    '_ProjectsV2_tasksListrequestBase': 'common',
+    '_ProjectsV2_tasksListresponseBase': 'common',
+    '_ProjectsV2_tasksUnassignrequestBase': 'common',
+    '_ProjectsV2_tasksUpdaterequestBase': 'common',
+    '_ProjectsAddparticipantrequestBase': 'common',
+    '_ProjectsCloserequestBase': 'common',
+    '_ProjectsCreaterequestBase': 'common',
+    '_ProjectsCreateresponseBase': 'common',
+    '_ProjectsDeleterequestBase': 'common',
+    '_ProjectsInforequestBase': 'common',
+    '_ProjectsInforesponseBase': 'common',
+    '_ProjectsListrequestBase': 'common',
+    '_ProjectsListresponseBase': 'common',
+    '_ProjectsReopenrequestBase': 'common',
+    '_ProjectsUpdateparticipantrequestBase': 'common',
+    '_ProjectsUpdaterequestBase': 'common',
+    '_QuotationsAcceptrequestBase': 'quotations',
+    '_QuotationsCreaterequestBase': 'quotations',
+    '_QuotationsCreateresponseBase': 'quotations',
+    '_QuotationsDeleterequestBase': 'quotations',
+    '_QuotationsDownloadrequestBase': 'quotations',
+    '_QuotationsDownloadresponseBase': 'quotations',
+    '_QuotationsInforequestBase': 'quotations',
+    '_QuotationsInforesponseBase': 'quotations',
+    '_QuotationsListrequestBase': 'quotations',
+    '_QuotationsListresponseBase': 'quotations',
+    '_QuotationsSendrequestBase': 'quotations',
+    '_QuotationsUpdaterequestBase': 'quotations',
+    '_ReceiptsListpaymentsrequestBase': 'receipts',
+    '_ReceiptsListpaymentsresponseBase': 'receipts',
+    '_ReceiptsRegisterpaymentrequestBase': 'receipts',
+    '_ReceiptsRegisterpaymentresponseBase': 'receipts',
+    '_ReceiptsRemovepaymentrequestBase': 'receipts',
+    '_ReceiptsUpdatepaymentrequestBase': 'receipts',
+    '_ReservationsCreaterequestBase': 'reservations',
+    '_ReservationsCreateresponseBase': 'reservations',
+    '_ReservationsDeleterequestBase': 'reservations',
+    '_ReservationsListrequestBase': 'reservations',
+    '_ReservationsListresponseBase': 'reservations',
+    '_ReservationsUpdaterequestBase': 'reservations',
+    '_SubscriptionsCreaterequestBase': 'subscriptions',
+    '_SubscriptionsCreateresponseBase': 'subscriptions',
+    '_SubscriptionsDeactivaterequestBase': 'subscriptions',
+    '_SubscriptionsInforequestBase': 'subscriptions',
+    '_SubscriptionsInforesponseBase': 'subscriptions',
+    '_SubscriptionsListrequestBase': 'subscriptions',
+    '_SubscriptionsListresponseBase': 'subscriptions',
+    '_SubscriptionsUpdaterequestBase': 'subscriptions',
+    '_TagsListrequestBase': 'tags',
+    '_TagsListresponseBase': 'tags',
+    '_TasksCompleterequestBase': 'tasks',
+    '_TasksCreaterequestBase': 'tasks',
+    '_TasksCreateresponseBase': 'tasks',
+    '_TasksDeleterequestBase': 'tasks',
+    '_TasksInforequestBase': 'tasks',
+    '_TasksInforesponseBase': 'tasks',
+    '_TasksListrequestBase': 'tasks',
+    '_TasksListresponseBase': 'tasks',
+    '_TasksReopenrequestBase': 'tasks',
+    '_TasksSchedulerequestBase': 'tasks',
+    '_TasksScheduleresponseBase': 'tasks',
+    '_TasksUpdaterequestBase': 'tasks',
+    '_TaxratesListrequestBase': 'tax_rates',
+    '_TaxratesListresponseBase': 'tax_rates',
+    '_TeamsListrequestBase': 'teams',
+    '_TeamsListresponseBase': 'teams',
+    '_TicketstatusListrequestBase': 'ticket_status',
+    '_TicketstatusListresponseBase': 'ticket_status',
+    '_TicketsAddinternalmessagerequestBase': 'tickets',
+    '_TicketsAddinternalmessageresponseBase': 'tickets',
+    '_TicketsAddreplyrequestBase': 'tickets',
+    '_TicketsAddreplyresponseBase': 'tickets',
+    '_TicketsCreaterequestBase': 'tickets',
+    '_TicketsCreateresponseBase': 'tickets',
+    '_TicketsGetmessagerequestBase': 'tickets',
+    '_TicketsGetmessageresponseBase': 'tickets',
+    '_TicketsImportmessagerequestBase': 'tickets',
+    '_TicketsImportmessageresponseBase': 'tickets',
+    '_TicketsInforequestBase': 'tickets',
+    '_TicketsInforesponseBase': 'tickets',
+    '_TicketsListmessagesrequestBase': 'tickets',
+    '_TicketsListmessagesresponseBase': 'tickets',
+    '_TicketsListrequestBase': 'tickets',
+    '_TicketsListresponseBase': 'tickets',
+    '_TicketsUpdaterequestBase': 'tickets',
+    '_TimetrackingAddresponseBase': 'time_tracking',
+    '_TimetrackingDeleterequestBase': 'time_tracking',
+    '_TimetrackingInforequestBase': 'time_tracking',
+    '_TimetrackingInforesponseBase': 'time_tracking',
+    '_TimetrackingListrequestBase': 'time_tracking',
+    '_TimetrackingListresponseBase': 'time_tracking',
+    '_TimetrackingResumerequestBase': 'time_tracking',
+    '_TimetrackingResumeresponseBase': 'time_tracking',
+    '_TimersCurrentresponseBase': 'timers',
+    '_TimersStartrequestBase': 'timers',
+    '_TimersStartresponseBase': 'timers',
+    '_TimersStopresponseBase': 'timers',
+    '_TimersUpdaterequestBase': 'timers',
+    '_UnitsofmeasureListresponseBase': 'units_of_measure',
+    '_UseravailabilityDailyrequestBase': 'user_availability',
+    '_UseravailabilityDailyresponseBase': 'user_availability',
+    '_UseravailabilityTotalrequestBase': 'user_availability',
+    '_UseravailabilityTotalresponseBase': 'user_availability',
+    '_UsersGetweekschedulerequestBase': 'users',
+    '_UsersGetweekscheduleresponseBase': 'users',
+    '_UsersInforequestBase': 'users',
+    '_UsersInforesponseBase': 'users',
+    '_UsersListdaysoffrequestBase': 'users',
+    '_UsersListdaysoffresponseBase': 'users',
+    '_UsersListrequestBase': 'users',
+    '_UsersListresponseBase': 'users',
+    '_UsersMeresponseBase': 'users',
+    '_WebhooksListresponseBase': 'webhooks',
+    '_WithholdingtaxratesListrequestBase': 'withholding_tax_rates',
+    '_WithholdingtaxratesListresponseBase': 'withholding_tax_rates',
+    '_WorktypesListrequestBase': 'work_types',
+    '_WorktypesListresponseBase': 'work_types',
+}
+# fmt: on
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CLASS_MODULES})
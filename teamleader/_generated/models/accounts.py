@@ -0,0 +1,30 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:50:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass
+class _AccountsProjectsV2StatusresponseBase:
+    """Auto-generated from schema: accounts.projects-v2-statusresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
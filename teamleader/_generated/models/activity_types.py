@@ -0,0 +1,53 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:13:26Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ActivitytypesListrequestBase:
+    """Auto-generated from schema: activityTypes.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _ActivitytypesListresponseBase:
+    """Auto-generated from schema: activityTypes.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
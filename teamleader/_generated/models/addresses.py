@@ -0,0 +1,53 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _LeveltwoareasListrequestBase:
+    """Auto-generated from schema: levelTwoAreas.listrequest"""
+
+    country: str
+    language: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            country=data['country'],
+            language=data.get('language'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'country': self.country,
+        }
+        if self.language is not None:
+            out['language'] = self.language
+        return out
+
+
+@dataclass
+class _LeveltwoareasListresponseBase:
+    """Auto-generated from schema: levelTwoAreas.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
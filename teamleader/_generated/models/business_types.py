@@ -0,0 +1,49 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T22:13:26Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _BusinesstypesListrequestBase:
+    """Auto-generated from schema: businessTypes.listrequest"""
+
+    country: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            country=data.get('country'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.country is not None:
+            out['country'] = self.country
+        return out
+
+
+@dataclass
+class _BusinesstypesListresponseBase:
+    """Auto-generated from schema: businessTypes.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
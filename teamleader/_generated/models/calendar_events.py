@@ -0,0 +1,232 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _EventsCancelrequestBase:
+    """Auto-generated from schema: events.cancelrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _EventsCreaterequestBase:
+    """Auto-generated from schema: events.createrequest"""
+
+    title: str
+    activity_type_id: str
+    starts_at: str
+    ends_at: str
+    description: str | None = None
+    location: str | None = None
+    work_type_id: str | None = None
+    attendees: list[dict[str, Any]] = field(default_factory=list)
+    links: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            title=data['title'],
+            activity_type_id=data['activity_type_id'],
+            starts_at=data['starts_at'],
+            ends_at=data['ends_at'],
+            description=data.get('description'),
+            location=data.get('location'),
+            work_type_id=data.get('work_type_id'),
+            attendees=data.get('attendees') or [],
+            links=data.get('links') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'title': self.title,
+            'activity_type_id': self.activity_type_id,
+            'starts_at': self.starts_at,
+            'ends_at': self.ends_at,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.location is not None:
+            out['location'] = self.location
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.attendees:
+            out['attendees'] = self.attendees
+        if self.links:
+            out['links'] = self.links
+        return out
+
+
+@dataclass
+class _EventsCreateresponseBase:
+    """Auto-generated from schema: events.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _EventsInforequestBase:
+    """Auto-generated from schema: events.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _EventsInforesponseBase:
+    """Auto-generated from schema: events.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _EventsListrequestBase:
+    """Auto-generated from schema: events.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _EventsListresponseBase:
+    """Auto-generated from schema: events.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _EventsUpdaterequestBase:
+    """Auto-generated from schema: events.updaterequest"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    starts_at: str | None = None
+    ends_at: str | None = None
+    location: str | None = None
+    work_type_id: str | None = None
+    attendees: list[dict[str, Any]] = field(default_factory=list)
+    links: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            starts_at=data.get('starts_at'),
+            ends_at=data.get('ends_at'),
+            location=data.get('location'),
+            work_type_id=data.get('work_type_id'),
+            attendees=data.get('attendees') or [],
+            links=data.get('links') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.starts_at is not None:
+            out['starts_at'] = self.starts_at
+        if self.ends_at is not None:
+            out['ends_at'] = self.ends_at
+        if self.location is not None:
+            out['location'] = self.location
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.attendees:
+            out['attendees'] = self.attendees
+        if self.links:
+            out['links'] = self.links
+        return out
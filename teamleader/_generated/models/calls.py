@@ -0,0 +1,221 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _CallsAddrequestBase:
+    """Auto-generated from schema: calls.addrequest"""
+
+    participant: dict[str, Any]
+    due_at: str
+    assignee: dict[str, Any]
+    description: str | None = None
+    deal_id: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            participant=data['participant'],
+            due_at=data['due_at'],
+            assignee=data['assignee'],
+            description=data.get('description'),
+            deal_id=data.get('deal_id'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'participant': self.participant,
+            'due_at': self.due_at,
+            'assignee': self.assignee,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _CallsAddresponseBase:
+    """Auto-generated from schema: calls.addresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CallsCompleterequestBase:
+    """Auto-generated from schema: calls.completerequest"""
+
+    id: str
+    call_outcome_id: str | None = None
+    outcome_summary: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            call_outcome_id=data.get('call_outcome_id'),
+            outcome_summary=data.get('outcome_summary'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.call_outcome_id is not None:
+            out['call_outcome_id'] = self.call_outcome_id
+        if self.outcome_summary is not None:
+            out['outcome_summary'] = self.outcome_summary
+        return out
+
+
+@dataclass
+class _CallsInforequestBase:
+    """Auto-generated from schema: calls.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _CallsInforesponseBase:
+    """Auto-generated from schema: calls.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CallsListrequestBase:
+    """Auto-generated from schema: calls.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _CallsListresponseBase:
+    """Auto-generated from schema: calls.listresponse"""
+
+    meta: dict[str, Any] | None = None
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            meta=data.get('meta'),
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.meta is not None:
+            out['meta'] = self.meta
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CallsUpdaterequestBase:
+    """Auto-generated from schema: calls.updaterequest"""
+
+    id: str
+    description: str | None = None
+    participant: dict[str, Any] | None = None
+    due_at: str | None = None
+    assignee: dict[str, Any] | None = None
+    deal_id: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            description=data.get('description'),
+            participant=data.get('participant'),
+            due_at=data.get('due_at'),
+            assignee=data.get('assignee'),
+            deal_id=data.get('deal_id'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.participant is not None:
+            out['participant'] = self.participant
+        if self.due_at is not None:
+            out['due_at'] = self.due_at
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
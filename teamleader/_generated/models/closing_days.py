@@ -0,0 +1,114 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ClosingdaysAddrequestBase:
+    """Auto-generated from schema: closingDays.addrequest"""
+
+    day: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            day=data['day'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'day': self.day,
+        }
+        return out
+
+
+@dataclass
+class _ClosingdaysAddresponseBase:
+    """Auto-generated from schema: closingDays.addresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ClosingdaysDeleterequestBase:
+    """Auto-generated from schema: closingDays.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ClosingdaysListrequestBase:
+    """Auto-generated from schema: closingDays.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _ClosingdaysListresponseBase:
+    """Auto-generated from schema: closingDays.listresponse"""
+
+    meta: dict[str, Any] | None = None
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            meta=data.get('meta'),
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.meta is not None:
+            out['meta'] = self.meta
+        if self.data:
+            out['data'] = self.data
+        return out
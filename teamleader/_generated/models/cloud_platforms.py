@@ -0,0 +1,52 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass
+class _CloudplatformsUrlrequestBase:
+    """Auto-generated from schema: cloudPlatforms.urlrequest"""
+
+    type: str
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _CloudplatformsUrlresponseBase:
+    """Auto-generated from schema: cloudPlatforms.urlresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
@@ -0,0 +1,4353 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _AddressrequestBase:
+    """Auto-generated from schema: AddressRequest"""
+
+    country: str
+    line_1: str | None
+    postal_code: str | None
+    city: str | None
+    area_level_two_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            country=data['country'],
+            line_1=data.get('line_1'),
+            postal_code=data.get('postal_code'),
+            city=data.get('city'),
+            area_level_two_id=data.get('area_level_two_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'country': self.country,
+            'line_1': self.line_1,
+            'postal_code': self.postal_code,
+            'city': self.city,
+        }
+        if self.area_level_two_id is not None:
+            out['area_level_two_id'] = self.area_level_two_id
+        return out
+
+
+@dataclass
+class _AddressresponseBase:
+    """Auto-generated from schema: AddressResponse"""
+
+    line_1: str | None = None
+    postal_code: str | None = None
+    city: str | None = None
+    country: str | None = None
+    area_level_two: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            line_1=data.get('line_1'),
+            postal_code=data.get('postal_code'),
+            city=data.get('city'),
+            country=data.get('country'),
+            area_level_two=data.get('area_level_two'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.line_1 is not None:
+            out['line_1'] = self.line_1
+        if self.postal_code is not None:
+            out['postal_code'] = self.postal_code
+        if self.city is not None:
+            out['city'] = self.city
+        if self.country is not None:
+            out['country'] = self.country
+        if self.area_level_two is not None:
+            out['area_level_two'] = self.area_level_two
+        return out
+
+
+@dataclass
+class _AddressesrequestBase:
+    """Auto-generated from schema: AddressesRequest"""
+
+    type: str | None = None
+    address: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            address=data.get('address'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.address is not None:
+            out['address'] = self.address
+        return out
+
+
+@dataclass
+class _AddressesresponseBase:
+    """Auto-generated from schema: AddressesResponse"""
+
+    type: str | None = None
+    address: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            address=data.get('address'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.address is not None:
+            out['address'] = self.address
+        return out
+
+
+@dataclass
+class _AmountwithtaxBase:
+    """Auto-generated from schema: AmountWithTax"""
+
+    amount: float
+    tax: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            amount=data['amount'],
+            tax=data['tax'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'amount': self.amount,
+            'tax': self.tax,
+        }
+        return out
+
+
+@dataclass
+class _AssigneeBase:
+    """Auto-generated from schema: Assignee"""
+
+    type: str | None = None
+    id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            id=data.get('id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.id is not None:
+            out['id'] = self.id
+        return out
+
+
+@dataclass
+class _AssigneesBase:
+    """Auto-generated from schema: Assignees"""
+
+    assignee: dict[str, Any] | None = None
+    assign_type: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            assignee=data.get('assignee'),
+            assign_type=data.get('assign_type'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.assign_type is not None:
+            out['assign_type'] = self.assign_type
+        return out
+
+
+@dataclass
+class _AttendeeBase:
+    """Auto-generated from schema: Attendee"""
+
+    type: str
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _AttendeesBase:
+    """Auto-generated from schema: Attendees"""
+
+    type: str | None = None
+    id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            id=data.get('id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.id is not None:
+            out['id'] = self.id
+        return out
+
+
+@dataclass
+class _BillingcycleBase:
+    """Auto-generated from schema: BillingCycle"""
+
+    periodicity: dict[str, Any] | None = None
+    days_in_advance: int | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            periodicity=data.get('periodicity'),
+            days_in_advance=data.get('days_in_advance'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.periodicity is not None:
+            out['periodicity'] = self.periodicity
+        if self.days_in_advance is not None:
+            out['days_in_advance'] = self.days_in_advance
+        return out
+
+
+@dataclass
+class _BillinginfoBase:
+    """Auto-generated from schema: BillingInfo"""
+
+    type: str | None = None
+    invoice: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            invoice=data.get('invoice'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.invoice is not None:
+            out['invoice'] = self.invoice
+        return out
+
+
+@dataclass
+class _BillingmethodBase:
+    """Auto-generated from schema: BillingMethod"""
+
+    value: str
+    update_strategy: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            value=data['value'],
+            update_strategy=data['update_strategy'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'value': self.value,
+            'update_strategy': self.update_strategy,
+        }
+        return out
+
+
+@dataclass
+class _CcemailBase:
+    """Auto-generated from schema: CcEmail"""
+
+    email: str
+    customer: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            email=data['email'],
+            customer=data.get('customer'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'email': self.email,
+        }
+        if self.customer is not None:
+            out['customer'] = self.customer
+        return out
+
+
+@dataclass
+class _CcemailaddressBase:
+    """Auto-generated from schema: CcEmailAddress"""
+
+    email_address: str
+    customer: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            email_address=data['email_address'],
+            customer=data.get('customer'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'email_address': self.email_address,
+        }
+        if self.customer is not None:
+            out['customer'] = self.customer
+        return out
+
+
+@dataclass
+class _CommercialdiscountBase:
+    """Auto-generated from schema: CommercialDiscount"""
+
+    type: str | None = None
+    value: float | None = None
+    description: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            value=data.get('value'),
+            description=data.get('description'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.value is not None:
+            out['value'] = self.value
+        if self.description is not None:
+            out['description'] = self.description
+        return out
+
+
+@dataclass
+class _CompanycustomerBase:
+    """Auto-generated from schema: CompanyCustomer"""
+
+    type: str
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _CompanytelephoneBase:
+    """Auto-generated from schema: CompanyTelephone"""
+
+    type: str
+    number: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            number=data['number'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'number': self.number,
+        }
+        return out
+
+
+@dataclass
+class _CreditnotesgroupedlinesresponseBase:
+    """Auto-generated from schema: CreditNotesGroupedLinesResponse"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.section is not None:
+            out['section'] = self.section
+        if self.line_items:
+            out['line_items'] = self.line_items
+        return out
+
+
+@dataclass
+class _CreditnoteslistinvoiceeBase:
+    """Auto-generated from schema: CreditNotesListInvoicee"""
+
+    name: str | None = None
+    vat_number: str | None = None
+    customer: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            vat_number=data.get('vat_number'),
+            customer=data.get('customer'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.customer is not None:
+            out['customer'] = self.customer
+        return out
+
+
+@dataclass
+class _CreditnotesresponseinvoiceeBase:
+    """Auto-generated from schema: CreditNotesResponseInvoicee"""
+
+    name: str | None = None
+    vat_number: str | None = None
+    customer: dict[str, Any] | None = None
+    email: str | None = None
+    national_identification_number: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            vat_number=data.get('vat_number'),
+            customer=data.get('customer'),
+            email=data.get('email'),
+            national_identification_number=data.get('national_identification_number'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.email is not None:
+            out['email'] = self.email
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        return out
+
+
+@dataclass
+class _CurrencyBase:
+    """Auto-generated from schema: Currency"""
+
+    code: str
+    exchange_rate: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            code=data['code'],
+            exchange_rate=data.get('exchange_rate'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'code': self.code,
+        }
+        if self.exchange_rate is not None:
+            out['exchange_rate'] = self.exchange_rate
+        return out
+
+
+@dataclass
+class _CurrencyexchangerateBase:
+    """Auto-generated from schema: CurrencyExchangeRate"""
+
+    from_: dict[str, Any] | None = None
+    to: dict[str, Any] | None = None
+    rate: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            from_=data.get('from'),
+            to=data.get('to'),
+            rate=data.get('rate'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.from_ is not None:
+            out['from'] = self.from_
+        if self.to is not None:
+            out['to'] = self.to
+        if self.rate is not None:
+            out['rate'] = self.rate
+        return out
+
+
+@dataclass
+class _CurrencywithrequiredexchangerateBase:
+    """Auto-generated from schema: CurrencyWithRequiredExchangeRate"""
+
+    code: str
+    exchange_rate: float
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            code=data['code'],
+            exchange_rate=data['exchange_rate'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'code': self.code,
+            'exchange_rate': self.exchange_rate,
+        }
+        return out
+
+
+@dataclass
+class _CustomfieldsrequestBase:
+    """Auto-generated from schema: CustomFieldsRequest"""
+
+    id: str | None = None
+    value: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            value=data.get('value'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.value is not None:
+            out['value'] = self.value
+        return out
+
+
+@dataclass
+class _CustomfieldsresponseBase:
+    """Auto-generated from schema: CustomFieldsResponse"""
+
+    definition: dict[str, Any] | None = None
+    value: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            definition=data.get('definition'),
+            value=data.get('value'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.definition is not None:
+            out['definition'] = self.definition
+        if self.value is not None:
+            out['value'] = self.value
+        return out
+
+
+@dataclass
+class _CustomerBase:
+    """Auto-generated from schema: Customer"""
+
+    type: str
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _DatevalidityBase:
+    """Auto-generated from schema: DateValidity"""
+
+    from_: str
+    until: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            from_=data['from'],
+            until=data.get('until'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'from': self.from_,
+        }
+        if self.until is not None:
+            out['until'] = self.until
+        return out
+
+
+@dataclass
+class _DiscountBase:
+    """Auto-generated from schema: Discount"""
+
+    value: float | None = None
+    type: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            value=data.get('value'),
+            type=data.get('type'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.value is not None:
+            out['value'] = self.value
+        if self.type is not None:
+            out['type'] = self.type
+        return out
+
+
+@dataclass
+class _DownloadBase:
+    """Auto-generated from schema: Download"""
+
+    location: str | None = None
+    expires: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            location=data.get('location'),
+            expires=data.get('expires'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.location is not None:
+            out['location'] = self.location
+        if self.expires is not None:
+            out['expires'] = self.expires
+        return out
+
+
+@dataclass
+class _DurationinminutesBase:
+    """Auto-generated from schema: DurationInMinutes"""
+
+    unit: str | None = None
+    value: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            unit=data.get('unit'),
+            value=data.get('value'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.unit is not None:
+            out['unit'] = self.unit
+        if self.value is not None:
+            out['value'] = self.value
+        return out
+
+
+@dataclass
+class _DurationinminutesfullBase:
+    """Auto-generated from schema: DurationInMinutesFull"""
+
+    unit: str | None = None
+    value: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            unit=data.get('unit'),
+            value=data.get('value'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.unit is not None:
+            out['unit'] = self.unit
+        if self.value is not None:
+            out['value'] = self.value
+        return out
+
+
+@dataclass
+class _EmailBase:
+    """Auto-generated from schema: Email"""
+
+    type: str | None = None
+    email: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            email=data.get('email'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.email is not None:
+            out['email'] = self.email
+        return out
+
+
+@dataclass
+class _ExpiryBase:
+    """Auto-generated from schema: Expiry"""
+
+    expires_after: str | None = None
+    action_after_expiry: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            expires_after=data.get('expires_after'),
+            action_after_expiry=data.get('action_after_expiry'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.expires_after is not None:
+            out['expires_after'] = self.expires_after
+        if self.action_after_expiry is not None:
+            out['action_after_expiry'] = self.action_after_expiry
+        return out
+
+
+@dataclass
+class _ForattentionofBase:
+    """Auto-generated from schema: ForAttentionOf"""
+
+    name: str | None = None
+    contact: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            contact=data.get('contact'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.contact is not None:
+            out['contact'] = self.contact
+        return out
+
+
+@dataclass
+class _IdandnameBase:
+    """Auto-generated from schema: IdAndName"""
+
+    id: str | None = None
+    name: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            name=data.get('name'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.name is not None:
+            out['name'] = self.name
+        return out
+
+
+@dataclass
+class _InvoicesgroupedlinesrequestBase:
+    """Auto-generated from schema: InvoicesGroupedLinesRequest"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'line_items': self.line_items,
+        }
+        if self.section is not None:
+            out['section'] = self.section
+        return out
+
+
+@dataclass
+class _InvoicesgroupedlinesresponseBase:
+    """Auto-generated from schema: InvoicesGroupedLinesResponse"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.section is not None:
+            out['section'] = self.section
+        if self.line_items:
+            out['line_items'] = self.line_items
+        return out
+
+
+@dataclass
+class _InvoiceslistinvoiceeBase:
+    """Auto-generated from schema: InvoicesListInvoicee"""
+
+    name: str | None = None
+    vat_number: str | None = None
+    customer: dict[str, Any] | None = None
+    for_attention_of: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            vat_number=data.get('vat_number'),
+            customer=data.get('customer'),
+            for_attention_of=data.get('for_attention_of'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.for_attention_of is not None:
+            out['for_attention_of'] = self.for_attention_of
+        return out
+
+
+@dataclass
+class _InvoicesrequestinvoiceeBase:
+    """Auto-generated from schema: InvoicesRequestInvoicee"""
+
+    customer: dict[str, Any]
+    for_attention_of: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            customer=data['customer'],
+            for_attention_of=data.get('for_attention_of'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'customer': self.customer,
+        }
+        if self.for_attention_of is not None:
+            out['for_attention_of'] = self.for_attention_of
+        return out
+
+
+@dataclass
+class _InvoicesresponseinvoiceeBase:
+    """Auto-generated from schema: InvoicesResponseInvoicee"""
+
+    name: str | None = None
+    vat_number: str | None = None
+    customer: dict[str, Any] | None = None
+    for_attention_of: dict[str, Any] | None = None
+    email: str | None = None
+    national_identification_number: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            vat_number=data.get('vat_number'),
+            customer=data.get('customer'),
+            for_attention_of=data.get('for_attention_of'),
+            email=data.get('email'),
+            national_identification_number=data.get('national_identification_number'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.for_attention_of is not None:
+            out['for_attention_of'] = self.for_attention_of
+        if self.email is not None:
+            out['email'] = self.email
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        return out
+
+
+@dataclass
+class _InvoicingpreferencesBase:
+    """Auto-generated from schema: InvoicingPreferences"""
+
+    electronic_invoicing_address: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            electronic_invoicing_address=data.get('electronic_invoicing_address'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.electronic_invoicing_address is not None:
+            out['electronic_invoicing_address'] = self.electronic_invoicing_address
+        return out
+
+
+@dataclass
+class _LeadrequestBase:
+    """Auto-generated from schema: LeadRequest"""
+
+    customer: dict[str, Any]
+    contact_person_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            customer=data['customer'],
+            contact_person_id=data.get('contact_person_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'customer': self.customer,
+        }
+        if self.contact_person_id is not None:
+            out['contact_person_id'] = self.contact_person_id
+        return out
+
+
+@dataclass
+class _LeadresponseBase:
+    """Auto-generated from schema: LeadResponse"""
+
+    customer: dict[str, Any] | None = None
+    contact_person: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            customer=data.get('customer'),
+            contact_person=data.get('contact_person'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.contact_person is not None:
+            out['contact_person'] = self.contact_person
+        return out
+
+
+@dataclass
+class _LineitemrequestBase:
+    """Auto-generated from schema: LineItemRequest"""
+
+    quantity: float
+    description: str
+    tax_rate_id: str
+    extended_description: str | None = None
+    unit_of_measure_id: str | None = None
+    unit_price: dict[str, Any] | None = None
+    discount: dict[str, Any] | None = None
+    product_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            quantity=data['quantity'],
+            description=data['description'],
+            tax_rate_id=data['tax_rate_id'],
+            extended_description=data.get('extended_description'),
+            unit_of_measure_id=data.get('unit_of_measure_id'),
+            unit_price=data.get('unit_price'),
+            discount=data.get('discount'),
+            product_id=data.get('product_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'quantity': self.quantity,
+            'description': self.description,
+            'tax_rate_id': self.tax_rate_id,
+        }
+        if self.extended_description is not None:
+            out['extended_description'] = self.extended_description
+        if self.unit_of_measure_id is not None:
+            out['unit_of_measure_id'] = self.unit_of_measure_id
+        if self.unit_price is not None:
+            out['unit_price'] = self.unit_price
+        if self.discount is not None:
+            out['discount'] = self.discount
+        if self.product_id is not None:
+            out['product_id'] = self.product_id
+        return out
+
+
+@dataclass
+class _LineitemresponseBase:
+    """Auto-generated from schema: LineItemResponse"""
+
+    product: dict[str, Any] | None = None
+    quantity: float | None = None
+    description: str | None = None
+    extended_description: str | None = None
+    unit: dict[str, Any] | None = None
+    unit_price: dict[str, Any] | None = None
+    tax: dict[str, Any] | None = None
+    discount: dict[str, Any] | None = None
+    total: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            product=data.get('product'),
+            quantity=data.get('quantity'),
+            description=data.get('description'),
+            extended_description=data.get('extended_description'),
+            unit=data.get('unit'),
+            unit_price=data.get('unit_price'),
+            tax=data.get('tax'),
+            discount=data.get('discount'),
+            total=data.get('total'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.product is not None:
+            out['product'] = self.product
+        if self.quantity is not None:
+            out['quantity'] = self.quantity
+        if self.description is not None:
+            out['description'] = self.description
+        if self.extended_description is not None:
+            out['extended_description'] = self.extended_description
+        if self.unit is not None:
+            out['unit'] = self.unit
+        if self.unit_price is not None:
+            out['unit_price'] = self.unit_price
+        if self.tax is not None:
+            out['tax'] = self.tax
+        if self.discount is not None:
+            out['discount'] = self.discount
+        if self.total is not None:
+            out['total'] = self.total
+        return out
+
+
+@dataclass
+class _LostreasonBase:
+    """Auto-generated from schema: lost_reason"""
+
+    reason: dict[str, Any] | None = None
+    remark: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            reason=data.get('reason'),
+            remark=data.get('remark'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.reason is not None:
+            out['reason'] = self.reason
+        if self.remark is not None:
+            out['remark'] = self.remark
+        return out
+
+
+@dataclass
+class _MetaBase:
+    """Auto-generated from schema: Meta"""
+
+    page: dict[str, Any] | None = None
+    matches: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            page=data.get('page'),
+            matches=data.get('matches'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.page is not None:
+            out['page'] = self.page
+        if self.matches is not None:
+            out['matches'] = self.matches
+        return out
+
+
+@dataclass
+class _MilestonesactualsBase:
+    """Auto-generated from schema: MilestonesActuals"""
+
+    billable_amount: dict[str, Any] | None = None
+    costs: dict[str, Any] | None = None
+    result: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            billable_amount=data.get('billable_amount'),
+            costs=data.get('costs'),
+            result=data.get('result'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.billable_amount is not None:
+            out['billable_amount'] = self.billable_amount
+        if self.costs is not None:
+            out['costs'] = self.costs
+        if self.result is not None:
+            out['result'] = self.result
+        return out
+
+
+@dataclass
+class _MilestonesbudgetBase:
+    """Auto-generated from schema: MilestonesBudget"""
+
+    provided: dict[str, Any] | None = None
+    spent: dict[str, Any] | None = None
+    remaining: dict[str, Any] | None = None
+    allocated: dict[str, Any] | None = None
+    forecasted: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            provided=data.get('provided'),
+            spent=data.get('spent'),
+            remaining=data.get('remaining'),
+            allocated=data.get('allocated'),
+            forecasted=data.get('forecasted'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.provided is not None:
+            out['provided'] = self.provided
+        if self.spent is not None:
+            out['spent'] = self.spent
+        if self.remaining is not None:
+            out['remaining'] = self.remaining
+        if self.allocated is not None:
+            out['allocated'] = self.allocated
+        if self.forecasted is not None:
+            out['forecasted'] = self.forecasted
+        return out
+
+
+@dataclass
+class _MoneyBase:
+    """Auto-generated from schema: Money"""
+
+    amount: float
+    currency: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            amount=data['amount'],
+            currency=data['currency'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'amount': self.amount,
+            'currency': self.currency,
+        }
+        return out
+
+
+@dataclass
+class _OrdersgroupedlinesresponseBase:
+    """Auto-generated from schema: OrdersGroupedLinesResponse"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.section is not None:
+            out['section'] = self.section
+        if self.line_items:
+            out['line_items'] = self.line_items
+        return out
+
+
+@dataclass
+class _PageBase:
+    """Auto-generated from schema: Page"""
+
+    size: float | None = None
+    number: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            size=data.get('size'),
+            number=data.get('number'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.size is not None:
+            out['size'] = self.size
+        if self.number is not None:
+            out['number'] = self.number
+        return out
+
+
+@dataclass
+class _PaginationBase:
+    """Auto-generated from schema: Pagination"""
+
+    size: float | None = None
+    number: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            size=data.get('size'),
+            number=data.get('number'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.size is not None:
+            out['size'] = self.size
+        if self.number is not None:
+            out['number'] = self.number
+        return out
+
+
+@dataclass
+class _ParticipantBase:
+    """Auto-generated from schema: Participant"""
+
+    customer: dict[str, Any] | None = None
+    contact: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            customer=data.get('customer'),
+            contact=data.get('contact'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.contact is not None:
+            out['contact'] = self.contact
+        return out
+
+
+@dataclass
+class _ParticipantsBase:
+    """Auto-generated from schema: Participants"""
+
+    participant: dict[str, Any] | None = None
+    role: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            participant=data.get('participant'),
+            role=data.get('role'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.participant is not None:
+            out['participant'] = self.participant
+        if self.role is not None:
+            out['role'] = self.role
+        return out
+
+
+@dataclass
+class _PaymenttermBase:
+    """Auto-generated from schema: PaymentTerm"""
+
+    type: str | None = None
+    days: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            days=data.get('days'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.days is not None:
+            out['days'] = self.days
+        return out
+
+
+@dataclass
+class _PeriodBase:
+    """Auto-generated from schema: Period"""
+
+    start_date: str | None = None
+    end_date: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        return out
+
+
+@dataclass
+class _ProductconfigurationreadBase:
+    """Auto-generated from schema: ProductConfigurationRead"""
+
+    stock_threshold: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            stock_threshold=data.get('stock_threshold'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.stock_threshold is not None:
+            out['stock_threshold'] = self.stock_threshold
+        return out
+
+
+@dataclass
+class _ProductconfigurationwriteBase:
+    """Auto-generated from schema: ProductConfigurationWrite"""
+
+    stock_threshold: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            stock_threshold=data.get('stock_threshold'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.stock_threshold is not None:
+            out['stock_threshold'] = self.stock_threshold
+        return out
+
+
+@dataclass
+class _ProductpricewriteBase:
+    """Auto-generated from schema: ProductPriceWrite"""
+
+    amount: float
+    currency: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            amount=data['amount'],
+            currency=data['currency'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'amount': self.amount,
+            'currency': self.currency,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsactualsBase:
+    """Auto-generated from schema: ProjectsActuals"""
+
+    billable_amount: dict[str, Any] | None = None
+    costs: dict[str, Any] | None = None
+    result: dict[str, Any] | None = None
+    profit_percentage: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            billable_amount=data.get('billable_amount'),
+            costs=data.get('costs'),
+            result=data.get('result'),
+            profit_percentage=data.get('profit_percentage'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.billable_amount is not None:
+            out['billable_amount'] = self.billable_amount
+        if self.costs is not None:
+            out['costs'] = self.costs
+        if self.result is not None:
+            out['result'] = self.result
+        if self.profit_percentage is not None:
+            out['profit_percentage'] = self.profit_percentage
+        return out
+
+
+@dataclass
+class _ProjectsbudgetBase:
+    """Auto-generated from schema: ProjectsBudget"""
+
+    provided: dict[str, Any] | None = None
+    spent: dict[str, Any] | None = None
+    remaining: dict[str, Any] | None = None
+    allocated: dict[str, Any] | None = None
+    forecasted: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            provided=data.get('provided'),
+            spent=data.get('spent'),
+            remaining=data.get('remaining'),
+            allocated=data.get('allocated'),
+            forecasted=data.get('forecasted'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.provided is not None:
+            out['provided'] = self.provided
+        if self.spent is not None:
+            out['spent'] = self.spent
+        if self.remaining is not None:
+            out['remaining'] = self.remaining
+        if self.allocated is not None:
+            out['allocated'] = self.allocated
+        if self.forecasted is not None:
+            out['forecasted'] = self.forecasted
+        return out
+
+
+@dataclass
+class _QuotationsgroupedlinesrequestBase:
+    """Auto-generated from schema: QuotationsGroupedLinesRequest"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'line_items': self.line_items,
+        }
+        if self.section is not None:
+            out['section'] = self.section
+        return out
+
+
+@dataclass
+class _QuotationsgroupedlinesresponseBase:
+    """Auto-generated from schema: QuotationsGroupedLinesResponse"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.section is not None:
+            out['section'] = self.section
+        if self.line_items:
+            out['line_items'] = self.line_items
+        return out
+
+
+@dataclass
+class _RelatedcontactsBase:
+    """Auto-generated from schema: RelatedContacts"""
+
+    type: str | None = None
+    id: str | None = None
+    position: str | None = None
+    secondary_position: str | None = None
+    division: str | None = None
+    is_decision_maker: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            id=data.get('id'),
+            position=data.get('position'),
+            secondary_position=data.get('secondary_position'),
+            division=data.get('division'),
+            is_decision_maker=data.get('is_decision_maker'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.id is not None:
+            out['id'] = self.id
+        if self.position is not None:
+            out['position'] = self.position
+        if self.secondary_position is not None:
+            out['secondary_position'] = self.secondary_position
+        if self.division is not None:
+            out['division'] = self.division
+        if self.is_decision_maker is not None:
+            out['is_decision_maker'] = self.is_decision_maker
+        return out
+
+
+@dataclass
+class _RequiresattentionafterBase:
+    """Auto-generated from schema: RequiresAttentionAfter"""
+
+    amount: float | None = None
+    unit: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            amount=data.get('amount'),
+            unit=data.get('unit'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.amount is not None:
+            out['amount'] = self.amount
+        if self.unit is not None:
+            out['unit'] = self.unit
+        return out
+
+
+@dataclass
+class _SenderBase:
+    """Auto-generated from schema: Sender"""
+
+    type: str
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data['type'],
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'type': self.type,
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _SentbyBase:
+    """Auto-generated from schema: SentBy"""
+
+    type: str | None = None
+    id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            id=data.get('id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.id is not None:
+            out['id'] = self.id
+        return out
+
+
+@dataclass
+class _SortBase:
+    """Auto-generated from schema: Sort"""
+
+    field: str
+    order: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            field=data['field'],
+            order=data.get('order'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'field': self.field,
+        }
+        if self.order is not None:
+            out['order'] = self.order
+        return out
+
+
+@dataclass
+class _StockBase:
+    """Auto-generated from schema: Stock"""
+
+    amount: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            amount=data.get('amount'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.amount is not None:
+            out['amount'] = self.amount
+        return out
+
+
+@dataclass
+class _StockthresholdBase:
+    """Auto-generated from schema: StockThreshold"""
+
+    minimum: float
+    action: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            minimum=data['minimum'],
+            action=data['action'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'minimum': self.minimum,
+            'action': self.action,
+        }
+        return out
+
+
+@dataclass
+class _SubscriptionsgroupedlinesrequestBase:
+    """Auto-generated from schema: SubscriptionsGroupedLinesRequest"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'line_items': self.line_items,
+        }
+        if self.section is not None:
+            out['section'] = self.section
+        return out
+
+
+@dataclass
+class _SubscriptionsgroupedlinesresponseBase:
+    """Auto-generated from schema: SubscriptionsGroupedLinesResponse"""
+
+    section: dict[str, Any] | None = None
+    line_items: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            section=data.get('section'),
+            line_items=data.get('line_items') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.section is not None:
+            out['section'] = self.section
+        if self.line_items:
+            out['line_items'] = self.line_items
+        return out
+
+
+@dataclass
+class _SubscriptionsresponseinvoiceeBase:
+    """Auto-generated from schema: SubscriptionsResponseInvoicee"""
+
+    customer: dict[str, Any] | None = None
+    for_attention_of: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            customer=data.get('customer'),
+            for_attention_of=data.get('for_attention_of'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.for_attention_of is not None:
+            out['for_attention_of'] = self.for_attention_of
+        return out
+
+
+@dataclass
+class _TaxesBase:
+    """Auto-generated from schema: Taxes"""
+
+    rate: float | None = None
+    taxable: dict[str, Any] | None = None
+    tax: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            rate=data.get('rate'),
+            taxable=data.get('taxable'),
+            tax=data.get('tax'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.rate is not None:
+            out['rate'] = self.rate
+        if self.taxable is not None:
+            out['taxable'] = self.taxable
+        if self.tax is not None:
+            out['tax'] = self.tax
+        return out
+
+
+@dataclass
+class _TelephoneBase:
+    """Auto-generated from schema: Telephone"""
+
+    type: str | None = None
+    number: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            number=data.get('number'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.number is not None:
+            out['number'] = self.number
+        return out
+
+
+@dataclass
+class _TimeBase:
+    """Auto-generated from schema: Time"""
+
+    value: float | None = None
+    unit: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            value=data.get('value'),
+            unit=data.get('unit'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.value is not None:
+            out['value'] = self.value
+        if self.unit is not None:
+            out['unit'] = self.unit
+        return out
+
+
+@dataclass
+class _TimetrackingmaterialsBase:
+    """Auto-generated from schema: TimeTrackingMaterials"""
+
+    product: dict[str, Any] | None = None
+    description: str | None = None
+    unit_price: dict[str, Any] | None = None
+    quantity: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            product=data.get('product'),
+            description=data.get('description'),
+            unit_price=data.get('unit_price'),
+            quantity=data.get('quantity'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.product is not None:
+            out['product'] = self.product
+        if self.description is not None:
+            out['description'] = self.description
+        if self.unit_price is not None:
+            out['unit_price'] = self.unit_price
+        if self.quantity is not None:
+            out['quantity'] = self.quantity
+        return out
+
+
+@dataclass
+class _ToemailBase:
+    """Auto-generated from schema: ToEmail"""
+
+    email: str
+    customer: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            email=data['email'],
+            customer=data.get('customer'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'email': self.email,
+        }
+        if self.customer is not None:
+            out['customer'] = self.customer
+        return out
+
+
+@dataclass
+class _ToemailaddressBase:
+    """Auto-generated from schema: ToEmailAddress"""
+
+    email_address: str
+    customer: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            email_address=data['email_address'],
+            customer=data.get('customer'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'email_address': self.email_address,
+        }
+        if self.customer is not None:
+            out['customer'] = self.customer
+        return out
+
+
+@dataclass
+class _TypeandidBase:
+    """Auto-generated from schema: TypeAndId"""
+
+    id: str | None = None
+    type: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            type=data.get('type'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.type is not None:
+            out['type'] = self.type
+        return out
+
+
+@dataclass
+class _UseravailabilityBase:
+    """Auto-generated from schema: UserAvailability"""
+
+    gross_time_available: dict[str, Any] | None = None
+    net_time_available: dict[str, Any] | None = None
+    planned_time: dict[str, Any] | None = None
+    unplanned_time: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            gross_time_available=data.get('gross_time_available'),
+            net_time_available=data.get('net_time_available'),
+            planned_time=data.get('planned_time'),
+            unplanned_time=data.get('unplanned_time'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.gross_time_available is not None:
+            out['gross_time_available'] = self.gross_time_available
+        if self.net_time_available is not None:
+            out['net_time_available'] = self.net_time_available
+        if self.planned_time is not None:
+            out['planned_time'] = self.planned_time
+        if self.unplanned_time is not None:
+            out['unplanned_time'] = self.unplanned_time
+        return out
+
+
+@dataclass
+class _UserpreferencesBase:
+    """Auto-generated from schema: UserPreferences"""
+
+    invoiceable: bool | None = None
+    historic_time_tracking_limit: dict[str, Any] | None = None
+    whitelabeling: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            invoiceable=data.get('invoiceable'),
+            historic_time_tracking_limit=data.get('historic_time_tracking_limit'),
+            whitelabeling=data.get('whitelabeling'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.invoiceable is not None:
+            out['invoiceable'] = self.invoiceable
+        if self.historic_time_tracking_limit is not None:
+            out['historic_time_tracking_limit'] = self.historic_time_tracking_limit
+        if self.whitelabeling is not None:
+            out['whitelabeling'] = self.whitelabeling
+        return out
+
+
+@dataclass
+class _WebhookBase:
+    """Auto-generated from schema: WebHook"""
+
+    url: str
+    types: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            url=data['url'],
+            types=data.get('types') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'url': self.url,
+            'types': self.types,
+        }
+        return out
+
+
+@dataclass
+class _MilestonesCloserequestBase:
+    """Auto-generated from schema: milestones.closerequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MilestonesCreateresponseBase:
+    """Auto-generated from schema: milestones.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MilestonesDeleterequestBase:
+    """Auto-generated from schema: milestones.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MilestonesInforequestBase:
+    """Auto-generated from schema: milestones.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MilestonesInforesponseBase:
+    """Auto-generated from schema: milestones.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MilestonesListrequestBase:
+    """Auto-generated from schema: milestones.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _MilestonesListresponseBase:
+    """Auto-generated from schema: milestones.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MilestonesOpenrequestBase:
+    """Auto-generated from schema: milestones.openrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MilestonesUpdaterequestBase:
+    """Auto-generated from schema: milestones.updaterequest"""
+
+    id: str
+    starts_on: str | None = None
+    due_on: str | None = None
+    name: str | None = None
+    description: str | None = None
+    responsible_user_id: str | None = None
+    depends_on: str | None = None
+    propagate_date_changes: bool | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            starts_on=data.get('starts_on'),
+            due_on=data.get('due_on'),
+            name=data.get('name'),
+            description=data.get('description'),
+            responsible_user_id=data.get('responsible_user_id'),
+            depends_on=data.get('depends_on'),
+            propagate_date_changes=data.get('propagate_date_changes'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.starts_on is not None:
+            out['starts_on'] = self.starts_on
+        if self.due_on is not None:
+            out['due_on'] = self.due_on
+        if self.name is not None:
+            out['name'] = self.name
+        if self.description is not None:
+            out['description'] = self.description
+        if self.responsible_user_id is not None:
+            out['responsible_user_id'] = self.responsible_user_id
+        if self.depends_on is not None:
+            out['depends_on'] = self.depends_on
+        if self.propagate_date_changes is not None:
+            out['propagate_date_changes'] = self.propagate_date_changes
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ProjectsV2AddcustomerrequestBase:
+    """Auto-generated from schema: projects-v2.addCustomerrequest"""
+
+    id: str
+    customer: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            customer=data['customer'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'customer': self.customer,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2AdddealrequestBase:
+    """Auto-generated from schema: projects-v2.addDealrequest"""
+
+    id: str
+    deal_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            deal_id=data['deal_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'deal_id': self.deal_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2AddownerrequestBase:
+    """Auto-generated from schema: projects-v2.addOwnerrequest"""
+
+    id: str
+    user_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            user_id=data['user_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'user_id': self.user_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2AddquotationrequestBase:
+    """Auto-generated from schema: projects-v2.addQuotationrequest"""
+
+    id: str
+    quotation_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            quotation_id=data['quotation_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'quotation_id': self.quotation_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2AssignrequestBase:
+    """Auto-generated from schema: projects-v2.assignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2CloserequestBase:
+    """Auto-generated from schema: projects-v2.closerequest"""
+
+    id: str
+    closing_strategy: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            closing_strategy=data['closing_strategy'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'closing_strategy': self.closing_strategy,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2CreaterequestBase:
+    """Auto-generated from schema: projects-v2.createrequest"""
+
+    title: str
+    description: str | None = None
+    time_budget: dict[str, Any] | None = None
+    billing_method: str | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    fixed_price: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    purchase_order_number: str | None = None
+    company_entity_id: str | None = None
+    color: dict[str, Any] | None = None
+    initial_time_tracked: dict[str, Any] | None = None
+    initial_price: dict[str, Any] | None = None
+    initial_cost: dict[str, Any] | None = None
+    initial_amount_billed: dict[str, Any] | None = None
+    initial_amount_paid: dict[str, Any] | None = None
+    owner_ids: list[str] = field(default_factory=list)
+    customers: list[dict[str, Any]] = field(default_factory=list)
+    assignees: list[dict[str, Any]] = field(default_factory=list)
+    deal_ids: list[str] = field(default_factory=list)
+    quotation_ids: list[str] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            title=data['title'],
+            description=data.get('description'),
+            time_budget=data.get('time_budget'),
+            billing_method=data.get('billing_method'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            fixed_price=data.get('fixed_price'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            purchase_order_number=data.get('purchase_order_number'),
+            company_entity_id=data.get('company_entity_id'),
+            color=data.get('color'),
+            initial_time_tracked=data.get('initial_time_tracked'),
+            initial_price=data.get('initial_price'),
+            initial_cost=data.get('initial_cost'),
+            initial_amount_billed=data.get('initial_amount_billed'),
+            initial_amount_paid=data.get('initial_amount_paid'),
+            owner_ids=data.get('owner_ids') or [],
+            customers=data.get('customers') or [],
+            assignees=data.get('assignees') or [],
+            deal_ids=data.get('deal_ids') or [],
+            quotation_ids=data.get('quotation_ids') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'title': self.title,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.time_budget is not None:
+            out['time_budget'] = self.time_budget
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.company_entity_id is not None:
+            out['company_entity_id'] = self.company_entity_id
+        if self.color is not None:
+            out['color'] = self.color
+        if self.initial_time_tracked is not None:
+            out['initial_time_tracked'] = self.initial_time_tracked
+        if self.initial_price is not None:
+            out['initial_price'] = self.initial_price
+        if self.initial_cost is not None:
+            out['initial_cost'] = self.initial_cost
+        if self.initial_amount_billed is not None:
+            out['initial_amount_billed'] = self.initial_amount_billed
+        if self.initial_amount_paid is not None:
+            out['initial_amount_paid'] = self.initial_amount_paid
+        if self.owner_ids:
+            out['owner_ids'] = self.owner_ids
+        if self.customers:
+            out['customers'] = self.customers
+        if self.assignees:
+            out['assignees'] = self.assignees
+        if self.deal_ids:
+            out['deal_ids'] = self.deal_ids
+        if self.quotation_ids:
+            out['quotation_ids'] = self.quotation_ids
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ProjectsV2DeleterequestBase:
+    """Auto-generated from schema: projects-v2.deleterequest"""
+
+    id: str
+    delete_strategy: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            delete_strategy=data['delete_strategy'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'delete_strategy': self.delete_strategy,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2DuplicaterequestBase:
+    """Auto-generated from schema: projects-v2.duplicaterequest"""
+
+    id: str
+    title: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data['title'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'title': self.title,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2DuplicateresponseBase:
+    """Auto-generated from schema: projects-v2.duplicateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2InforequestBase:
+    """Auto-generated from schema: projects-v2.inforequest"""
+
+    id: str
+    includes: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            includes=data.get('includes'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.includes is not None:
+            out['includes'] = self.includes
+        return out
+
+
+@dataclass
+class _ProjectsV2InforesponseBase:
+    """Auto-generated from schema: projects.inforesponse1"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2ListrequestBase:
+    """Auto-generated from schema: projects-v2.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _ProjectsV2ListresponseBase:
+    """Auto-generated from schema: projects-v2.listresponse"""
+
+    meta: dict[str, Any] | None = None
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            meta=data.get('meta'),
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.meta is not None:
+            out['meta'] = self.meta
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2RemovecustomerrequestBase:
+    """Auto-generated from schema: projects-v2.removeCustomerrequest"""
+
+    id: str
+    customer: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            customer=data['customer'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'customer': self.customer,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2RemovedealrequestBase:
+    """Auto-generated from schema: projects-v2.removeDealrequest"""
+
+    id: str
+    deal_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            deal_id=data['deal_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'deal_id': self.deal_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2RemoveownerrequestBase:
+    """Auto-generated from schema: projects-v2.removeOwnerrequest"""
+
+    id: str
+    user_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            user_id=data['user_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'user_id': self.user_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2RemovequotationrequestBase:
+    """Auto-generated from schema: projects-v2.removeQuotationrequest"""
+
+    id: str
+    quotation_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            quotation_id=data['quotation_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'quotation_id': self.quotation_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2UnassignrequestBase:
+    """Auto-generated from schema: projects-v2.unassignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2UpdaterequestBase:
+    """Auto-generated from schema: projects-v2.updaterequest"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    time_budget: dict[str, Any] | None = None
+    billing_method: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    fixed_price: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    purchase_order_number: str | None = None
+    company_entity_id: str | None = None
+    color: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            time_budget=data.get('time_budget'),
+            billing_method=data.get('billing_method'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            fixed_price=data.get('fixed_price'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            purchase_order_number=data.get('purchase_order_number'),
+            company_entity_id=data.get('company_entity_id'),
+            color=data.get('color'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.time_budget is not None:
+            out['time_budget'] = self.time_budget
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.company_entity_id is not None:
+            out['company_entity_id'] = self.company_entity_id
+        if self.color is not None:
+            out['color'] = self.color
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ProjectsV2_externalpartiesAddtoprojectrequestBase:
+    """Auto-generated from schema: projects-v2_externalParties.addToProjectrequest"""
+
+    project_id: str
+    customer: dict[str, Any]
+    function: str | None = None
+    sub_function: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            project_id=data['project_id'],
+            customer=data['customer'],
+            function=data.get('function'),
+            sub_function=data.get('sub_function'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'project_id': self.project_id,
+            'customer': self.customer,
+        }
+        if self.function is not None:
+            out['function'] = self.function
+        if self.sub_function is not None:
+            out['sub_function'] = self.sub_function
+        return out
+
+
+@dataclass
+class _ProjectsV2_externalpartiesDeleterequestBase:
+    """Auto-generated from schema: projects-v2_externalParties.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_externalpartiesUpdaterequestBase:
+    """Auto-generated from schema: projects-v2_externalParties.updaterequest"""
+
+    id: str
+    customer: dict[str, Any] | None = None
+    function: str | None = None
+    sub_function: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            customer=data.get('customer'),
+            function=data.get('function'),
+            sub_function=data.get('sub_function'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.function is not None:
+            out['function'] = self.function
+        if self.sub_function is not None:
+            out['sub_function'] = self.sub_function
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsAssignrequestBase:
+    """Auto-generated from schema: projects-v2_materials.assignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsCreaterequestBase:
+    """Auto-generated from schema: projects-v2_materials.createrequest"""
+
+    project_id: str
+    title: str
+    group_id: str | None = None
+    after_id: str | None = None
+    description: str | None = None
+    billing_method: str | None = None
+    quantity: float | None = None
+    quantity_estimated: float | None = None
+    unit_price: dict[str, Any] | None = None
+    unit_cost: dict[str, Any] | None = None
+    unit_id: str | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    product_id: str | None = None
+    assignees: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            project_id=data['project_id'],
+            title=data['title'],
+            group_id=data.get('group_id'),
+            after_id=data.get('after_id'),
+            description=data.get('description'),
+            billing_method=data.get('billing_method'),
+            quantity=data.get('quantity'),
+            quantity_estimated=data.get('quantity_estimated'),
+            unit_price=data.get('unit_price'),
+            unit_cost=data.get('unit_cost'),
+            unit_id=data.get('unit_id'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            product_id=data.get('product_id'),
+            assignees=data.get('assignees') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'project_id': self.project_id,
+            'title': self.title,
+        }
+        if self.group_id is not None:
+            out['group_id'] = self.group_id
+        if self.after_id is not None:
+            out['after_id'] = self.after_id
+        if self.description is not None:
+            out['description'] = self.description
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.quantity is not None:
+            out['quantity'] = self.quantity
+        if self.quantity_estimated is not None:
+            out['quantity_estimated'] = self.quantity_estimated
+        if self.unit_price is not None:
+            out['unit_price'] = self.unit_price
+        if self.unit_cost is not None:
+            out['unit_cost'] = self.unit_cost
+        if self.unit_id is not None:
+            out['unit_id'] = self.unit_id
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.product_id is not None:
+            out['product_id'] = self.product_id
+        if self.assignees:
+            out['assignees'] = self.assignees
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsCreateresponseBase:
+    """Auto-generated from schema: projects-v2_materials.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsDeleterequestBase:
+    """Auto-generated from schema: projects-v2_materials.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsDuplicaterequestBase:
+    """Auto-generated from schema: projects-v2_materials.duplicaterequest"""
+
+    origin_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            origin_id=data['origin_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'origin_id': self.origin_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsDuplicateresponseBase:
+    """Auto-generated from schema: projects-v2_materials.duplicateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsInforequestBase:
+    """Auto-generated from schema: projects-v2_materials.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsInforesponseBase:
+    """Auto-generated from schema: projects-v2_materials.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsListrequestBase:
+    """Auto-generated from schema: projects-v2_materials.listrequest"""
+
+    filter: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsListresponseBase:
+    """Auto-generated from schema: projects-v2_materials.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsUnassignrequestBase:
+    """Auto-generated from schema: projects-v2_materials.unassignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_materialsUpdaterequestBase:
+    """Auto-generated from schema: projects-v2_materials.updaterequest"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    status: str | None = None
+    billing_method: str | None = None
+    quantity: float | None = None
+    quantity_estimated: float | None = None
+    unit_price: dict[str, Any] | None = None
+    unit_cost: dict[str, Any] | None = None
+    unit_id: str | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    product_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            status=data.get('status'),
+            billing_method=data.get('billing_method'),
+            quantity=data.get('quantity'),
+            quantity_estimated=data.get('quantity_estimated'),
+            unit_price=data.get('unit_price'),
+            unit_cost=data.get('unit_cost'),
+            unit_id=data.get('unit_id'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            product_id=data.get('product_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.status is not None:
+            out['status'] = self.status
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.quantity is not None:
+            out['quantity'] = self.quantity
+        if self.quantity_estimated is not None:
+            out['quantity_estimated'] = self.quantity_estimated
+        if self.unit_price is not None:
+            out['unit_price'] = self.unit_price
+        if self.unit_cost is not None:
+            out['unit_cost'] = self.unit_cost
+        if self.unit_id is not None:
+            out['unit_id'] = self.unit_id
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.product_id is not None:
+            out['product_id'] = self.product_id
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsAssignrequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.assignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsCreaterequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.createrequest"""
+
+    project_id: str
+    title: str
+    description: str | None = None
+    color: dict[str, Any] | None = None
+    billing_method: str | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    assignees: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            project_id=data['project_id'],
+            title=data['title'],
+            description=data.get('description'),
+            color=data.get('color'),
+            billing_method=data.get('billing_method'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            assignees=data.get('assignees') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'project_id': self.project_id,
+            'title': self.title,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.color is not None:
+            out['color'] = self.color
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.assignees:
+            out['assignees'] = self.assignees
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsCreateresponseBase:
+    """Auto-generated from schema: projects-v2_projectGroups.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsDeleterequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.deleterequest"""
+
+    id: str
+    delete_strategy: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            delete_strategy=data['delete_strategy'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'delete_strategy': self.delete_strategy,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsDuplicaterequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.duplicaterequest"""
+
+    origin_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            origin_id=data['origin_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'origin_id': self.origin_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsDuplicateresponseBase:
+    """Auto-generated from schema: projects-v2_projectGroups.duplicateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsInforequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsInforesponseBase:
+    """Auto-generated from schema: projects-v2_projectGroups.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsListrequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.listrequest"""
+
+    filter: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsListresponseBase:
+    """Auto-generated from schema: projects-v2_projectGroups.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsUnassignrequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.unassignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectgroupsUpdaterequestBase:
+    """Auto-generated from schema: projects-v2_projectGroups.updaterequest"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    color: dict[str, Any] | None = None
+    billing_method: dict[str, Any] | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            color=data.get('color'),
+            billing_method=data.get('billing_method'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.color is not None:
+            out['color'] = self.color
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectlinesAddtogrouprequestBase:
+    """Auto-generated from schema: projects-v2_projectLines.addToGrouprequest"""
+
+    line_id: str
+    group_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            line_id=data['line_id'],
+            group_id=data['group_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'line_id': self.line_id,
+            'group_id': self.group_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectlinesListrequestBase:
+    """Auto-generated from schema: projects-v2_projectLines.listrequest"""
+
+    project_id: str
+    filter: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            project_id=data['project_id'],
+            filter=data.get('filter'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'project_id': self.project_id,
+        }
+        if self.filter is not None:
+            out['filter'] = self.filter
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectlinesListresponseBase:
+    """Auto-generated from schema: projects-v2_projectLines.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_projectlinesRemovefromgrouprequestBase:
+    """Auto-generated from schema: projects-v2_projectLines.removeFromGrouprequest"""
+
+    line_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            line_id=data['line_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'line_id': self.line_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksAssignrequestBase:
+    """Auto-generated from schema: projects-v2_tasks.assignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksCreaterequestBase:
+    """Auto-generated from schema: projects-v2_tasks.createrequest"""
+
+    project_id: str
+    title: str
+    group_id: str | None = None
+    work_type_id: str | None = None
+    task_type_id: str | None = None
+    description: str | None = None
+    billing_method: str | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    custom_rate: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    time_estimated: dict[str, Any] | None = None
+    assignees: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            project_id=data['project_id'],
+            title=data['title'],
+            group_id=data.get('group_id'),
+            work_type_id=data.get('work_type_id'),
+            task_type_id=data.get('task_type_id'),
+            description=data.get('description'),
+            billing_method=data.get('billing_method'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            custom_rate=data.get('custom_rate'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            time_estimated=data.get('time_estimated'),
+            assignees=data.get('assignees') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'project_id': self.project_id,
+            'title': self.title,
+        }
+        if self.group_id is not None:
+            out['group_id'] = self.group_id
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.task_type_id is not None:
+            out['task_type_id'] = self.task_type_id
+        if self.description is not None:
+            out['description'] = self.description
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.custom_rate is not None:
+            out['custom_rate'] = self.custom_rate
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.time_estimated is not None:
+            out['time_estimated'] = self.time_estimated
+        if self.assignees:
+            out['assignees'] = self.assignees
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksDeleterequestBase:
+    """Auto-generated from schema: projects-v2_tasks.deleterequest"""
+
+    id: str
+    delete_strategy: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            delete_strategy=data['delete_strategy'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'delete_strategy': self.delete_strategy,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksDuplicaterequestBase:
+    """Auto-generated from schema: projects-v2_tasks.duplicaterequest"""
+
+    origin_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            origin_id=data['origin_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'origin_id': self.origin_id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksDuplicateresponseBase:
+    """Auto-generated from schema: projects-v2_tasks.duplicateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksInforesponseBase:
+    """Auto-generated from schema: projects-v2_tasks.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksListrequestBase:
+    """Auto-generated from schema: projects-v2_tasks.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksListresponseBase:
+    """Auto-generated from schema: projects-v2_tasks.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksUnassignrequestBase:
+    """Auto-generated from schema: projects-v2_tasks.unassignrequest"""
+
+    id: str
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsV2_tasksUpdaterequestBase:
+    """Auto-generated from schema: projects-v2_tasks.updaterequest"""
+
+    id: str
+    work_type_id: str | None = None
+    task_type_id: str | None = None
+    status: str | None = None
+    title: str | None = None
+    description: str | None = None
+    billing_method: str | None = None
+    fixed_price: dict[str, Any] | None = None
+    external_budget: dict[str, Any] | None = None
+    internal_budget: dict[str, Any] | None = None
+    custom_rate: dict[str, Any] | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    time_estimated: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            work_type_id=data.get('work_type_id'),
+            task_type_id=data.get('task_type_id'),
+            status=data.get('status'),
+            title=data.get('title'),
+            description=data.get('description'),
+            billing_method=data.get('billing_method'),
+            fixed_price=data.get('fixed_price'),
+            external_budget=data.get('external_budget'),
+            internal_budget=data.get('internal_budget'),
+            custom_rate=data.get('custom_rate'),
+            start_date=data.get('start_date'),
+            end_date=data.get('end_date'),
+            time_estimated=data.get('time_estimated'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.task_type_id is not None:
+            out['task_type_id'] = self.task_type_id
+        if self.status is not None:
+            out['status'] = self.status
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.billing_method is not None:
+            out['billing_method'] = self.billing_method
+        if self.fixed_price is not None:
+            out['fixed_price'] = self.fixed_price
+        if self.external_budget is not None:
+            out['external_budget'] = self.external_budget
+        if self.internal_budget is not None:
+            out['internal_budget'] = self.internal_budget
+        if self.custom_rate is not None:
+            out['custom_rate'] = self.custom_rate
+        if self.start_date is not None:
+            out['start_date'] = self.start_date
+        if self.end_date is not None:
+            out['end_date'] = self.end_date
+        if self.time_estimated is not None:
+            out['time_estimated'] = self.time_estimated
+        return out
+
+
+@dataclass
+class _ProjectsAddparticipantrequestBase:
+    """Auto-generated from schema: projects.addParticipantrequest"""
+
+    id: str
+    participant: dict[str, Any]
+    role: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            participant=data['participant'],
+            role=data.get('role'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'participant': self.participant,
+        }
+        if self.role is not None:
+            out['role'] = self.role
+        return out
+
+
+@dataclass
+class _ProjectsCloserequestBase:
+    """Auto-generated from schema: projects.closerequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsCreaterequestBase:
+    """Auto-generated from schema: projects.createrequest"""
+
+    title: str
+    starts_on: str
+    description: str | None = None
+    purchase_order_number: str | None = None
+    customer: dict[str, Any] | None = None
+    milestones: list[dict[str, Any]] = field(default_factory=list)
+    participants: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            title=data['title'],
+            starts_on=data['starts_on'],
+            description=data.get('description'),
+            purchase_order_number=data.get('purchase_order_number'),
+            customer=data.get('customer'),
+            milestones=data.get('milestones') or [],
+            participants=data.get('participants') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'title': self.title,
+            'starts_on': self.starts_on,
+            'milestones': self.milestones,
+            'participants': self.participants,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ProjectsCreateresponseBase:
+    """Auto-generated from schema: projects.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsDeleterequestBase:
+    """Auto-generated from schema: projects.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsInforequestBase:
+    """Auto-generated from schema: projects.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsInforesponseBase:
+    """Auto-generated from schema: projects.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsListrequestBase:
+    """Auto-generated from schema: projects.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _ProjectsListresponseBase:
+    """Auto-generated from schema: projects.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProjectsReopenrequestBase:
+    """Auto-generated from schema: projects.reopenrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProjectsUpdateparticipantrequestBase:
+    """Auto-generated from schema: projects.updateParticipantrequest"""
+
+    id: str
+    role: str
+    participant: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            role=data['role'],
+            participant=data.get('participant'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'role': self.role,
+        }
+        if self.participant is not None:
+            out['participant'] = self.participant
+        return out
+
+
+@dataclass
+class _ProjectsUpdaterequestBase:
+    """Auto-generated from schema: projects.updaterequest"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    status: str | None = None
+    starts_on: str | None = None
+    customer: dict[str, Any] | None = None
+    budget: dict[str, Any] | None = None
+    purchase_order_number: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            status=data.get('status'),
+            starts_on=data.get('starts_on'),
+            customer=data.get('customer'),
+            budget=data.get('budget'),
+            purchase_order_number=data.get('purchase_order_number'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.status is not None:
+            out['status'] = self.status
+        if self.starts_on is not None:
+            out['starts_on'] = self.starts_on
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.budget is not None:
+            out['budget'] = self.budget
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
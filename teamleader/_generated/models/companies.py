@@ -0,0 +1,377 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _CompaniesAddrequestBase:
+    """Auto-generated from schema: companies.addrequest"""
+
+    name: str
+    business_type_id: str | None = None
+    vat_number: str | None = None
+    national_identification_number: str | None = None
+    website: str | None = None
+    iban: str | None = None
+    bic: str | None = None
+    language: str | None = None
+    responsible_user_id: str | None = None
+    remarks: str | None = None
+    marketing_mails_consent: bool | None = None
+    preferred_currency: dict[str, Any] | None = None
+    emails: list[dict[str, Any]] = field(default_factory=list)
+    telephones: list[dict[str, Any]] = field(default_factory=list)
+    addresses: list[dict[str, Any]] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data['name'],
+            business_type_id=data.get('business_type_id'),
+            vat_number=data.get('vat_number'),
+            national_identification_number=data.get('national_identification_number'),
+            website=data.get('website'),
+            iban=data.get('iban'),
+            bic=data.get('bic'),
+            language=data.get('language'),
+            responsible_user_id=data.get('responsible_user_id'),
+            remarks=data.get('remarks'),
+            marketing_mails_consent=data.get('marketing_mails_consent'),
+            preferred_currency=data.get('preferred_currency'),
+            emails=data.get('emails') or [],
+            telephones=data.get('telephones') or [],
+            addresses=data.get('addresses') or [],
+            tags=data.get('tags') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'name': self.name,
+        }
+        if self.business_type_id is not None:
+            out['business_type_id'] = self.business_type_id
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        if self.website is not None:
+            out['website'] = self.website
+        if self.iban is not None:
+            out['iban'] = self.iban
+        if self.bic is not None:
+            out['bic'] = self.bic
+        if self.language is not None:
+            out['language'] = self.language
+        if self.responsible_user_id is not None:
+            out['responsible_user_id'] = self.responsible_user_id
+        if self.remarks is not None:
+            out['remarks'] = self.remarks
+        if self.marketing_mails_consent is not None:
+            out['marketing_mails_consent'] = self.marketing_mails_consent
+        if self.preferred_currency is not None:
+            out['preferred_currency'] = self.preferred_currency
+        if self.emails:
+            out['emails'] = self.emails
+        if self.telephones:
+            out['telephones'] = self.telephones
+        if self.addresses:
+            out['addresses'] = self.addresses
+        if self.tags:
+            out['tags'] = self.tags
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _CompaniesAddresponseBase:
+    """Auto-generated from schema: companies.addresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CompaniesDeleterequestBase:
+    """Auto-generated from schema: companies.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _CompaniesInforequestBase:
+    """Auto-generated from schema: companies.inforequest"""
+
+    id: str
+    includes: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            includes=data.get('includes'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.includes is not None:
+            out['includes'] = self.includes
+        return out
+
+
+@dataclass
+class _CompaniesInforesponseBase:
+    """Auto-generated from schema: companies.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CompaniesListrequestBase:
+    """Auto-generated from schema: companies.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _CompaniesListresponseBase:
+    """Auto-generated from schema: companies.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _CompaniesTagrequestBase:
+    """Auto-generated from schema: companies.tagrequest"""
+
+    id: str
+    tags: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            tags=data.get('tags') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'tags': self.tags,
+        }
+        return out
+
+
+@dataclass
+class _CompaniesUntagrequestBase:
+    """Auto-generated from schema: companies.untagrequest"""
+
+    id: str
+    tags: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            tags=data.get('tags') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'tags': self.tags,
+        }
+        return out
+
+
+@dataclass
+class _CompaniesUpdaterequestBase:
+    """Auto-generated from schema: companies.updaterequest"""
+
+    id: str
+    name: str | None = None
+    business_type_id: str | None = None
+    vat_number: str | None = None
+    national_identification_number: str | None = None
+    website: str | None = None
+    iban: str | None = None
+    bic: str | None = None
+    language: str | None = None
+    responsible_user_id: str | None = None
+    remarks: str | None = None
+    marketing_mails_consent: bool | None = None
+    preferred_currency: dict[str, Any] | None = None
+    emails: list[dict[str, Any]] = field(default_factory=list)
+    telephones: list[dict[str, Any]] = field(default_factory=list)
+    addresses: list[dict[str, Any]] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            name=data.get('name'),
+            business_type_id=data.get('business_type_id'),
+            vat_number=data.get('vat_number'),
+            national_identification_number=data.get('national_identification_number'),
+            website=data.get('website'),
+            iban=data.get('iban'),
+            bic=data.get('bic'),
+            language=data.get('language'),
+            responsible_user_id=data.get('responsible_user_id'),
+            remarks=data.get('remarks'),
+            marketing_mails_consent=data.get('marketing_mails_consent'),
+            preferred_currency=data.get('preferred_currency'),
+            emails=data.get('emails') or [],
+            telephones=data.get('telephones') or [],
+            addresses=data.get('addresses') or [],
+            tags=data.get('tags') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.name is not None:
+            out['name'] = self.name
+        if self.business_type_id is not None:
+            out['business_type_id'] = self.business_type_id
+        if self.vat_number is not None:
+            out['vat_number'] = self.vat_number
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        if self.website is not None:
+            out['website'] = self.website
+        if self.iban is not None:
+            out['iban'] = self.iban
+        if self.bic is not None:
+            out['bic'] = self.bic
+        if self.language is not None:
+            out['language'] = self.language
+        if self.responsible_user_id is not None:
+            out['responsible_user_id'] = self.responsible_user_id
+        if self.remarks is not None:
+            out['remarks'] = self.remarks
+        if self.marketing_mails_consent is not None:
+            out['marketing_mails_consent'] = self.marketing_mails_consent
+        if self.preferred_currency is not None:
+            out['preferred_currency'] = self.preferred_currency
+        if self.emails:
+            out['emails'] = self.emails
+        if self.telephones:
+            out['telephones'] = self.telephones
+        if self.addresses:
+            out['addresses'] = self.addresses
+        if self.tags:
+            out['tags'] = self.tags
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _CompaniesUploadlogorequestBase:
+    """Auto-generated from schema: companies.uploadLogorequest"""
+
+    id: str
+    image: str | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            image=data.get('image'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'image': self.image,
+        }
+        return out
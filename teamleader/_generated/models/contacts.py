@@ -0,0 +1,455 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ContactsAddrequestBase:
+    """Auto-generated from schema: contacts.addrequest"""
+
+    last_name: str
+    first_name: str | None = None
+    salutation: str | None = None
+    website: str | None = None
+    language: str | None = None
+    gender: dict[str, Any] | None = None
+    birthdate: str | None = None
+    iban: str | None = None
+    bic: str | None = None
+    national_identification_number: str | None = None
+    remarks: str | None = None
+    marketing_mails_consent: bool | None = None
+    emails: list[dict[str, Any]] = field(default_factory=list)
+    telephones: list[dict[str, Any]] = field(default_factory=list)
+    addresses: list[dict[str, Any]] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            last_name=data['last_name'],
+            first_name=data.get('first_name'),
+            salutation=data.get('salutation'),
+            website=data.get('website'),
+            language=data.get('language'),
+            gender=data.get('gender'),
+            birthdate=data.get('birthdate'),
+            iban=data.get('iban'),
+            bic=data.get('bic'),
+            national_identification_number=data.get('national_identification_number'),
+            remarks=data.get('remarks'),
+            marketing_mails_consent=data.get('marketing_mails_consent'),
+            emails=data.get('emails') or [],
+            telephones=data.get('telephones') or [],
+            addresses=data.get('addresses') or [],
+            tags=data.get('tags') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'last_name': self.last_name,
+        }
+        if self.first_name is not None:
+            out['first_name'] = self.first_name
+        if self.salutation is not None:
+            out['salutation'] = self.salutation
+        if self.website is not None:
+            out['website'] = self.website
+        if self.language is not None:
+            out['language'] = self.language
+        if self.gender is not None:
+            out['gender'] = self.gender
+        if self.birthdate is not None:
+            out['birthdate'] = self.birthdate
+        if self.iban is not None:
+            out['iban'] = self.iban
+        if self.bic is not None:
+            out['bic'] = self.bic
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        if self.remarks is not None:
+            out['remarks'] = self.remarks
+        if self.marketing_mails_consent is not None:
+            out['marketing_mails_consent'] = self.marketing_mails_consent
+        if self.emails:
+            out['emails'] = self.emails
+        if self.telephones:
+            out['telephones'] = self.telephones
+        if self.addresses:
+            out['addresses'] = self.addresses
+        if self.tags:
+            out['tags'] = self.tags
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ContactsAddresponseBase:
+    """Auto-generated from schema: contacts.addresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ContactsDeleterequestBase:
+    """Auto-generated from schema: contacts.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ContactsInforequestBase:
+    """Auto-generated from schema: contacts.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ContactsInforesponseBase:
+    """Auto-generated from schema: contacts.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ContactsLinktocompanyrequestBase:
+    """Auto-generated from schema: contacts.linkToCompanyrequest"""
+
+    id: str
+    company_id: str
+    position: str | None = None
+    decision_maker: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            company_id=data['company_id'],
+            position=data.get('position'),
+            decision_maker=data.get('decision_maker'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'company_id': self.company_id,
+        }
+        if self.position is not None:
+            out['position'] = self.position
+        if self.decision_maker is not None:
+            out['decision_maker'] = self.decision_maker
+        return out
+
+
+@dataclass
+class _ContactsListrequestBase:
+    """Auto-generated from schema: contacts.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _ContactsListresponseBase:
+    """Auto-generated from schema: contacts.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ContactsTagrequestBase:
+    """Auto-generated from schema: contacts.tagrequest"""
+
+    id: str
+    tags: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            tags=data.get('tags') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'tags': self.tags,
+        }
+        return out
+
+
+@dataclass
+class _ContactsUnlinkfromcompanyrequestBase:
+    """Auto-generated from schema: contacts.unlinkFromCompanyrequest"""
+
+    id: str
+    company_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            company_id=data['company_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'company_id': self.company_id,
+        }
+        return out
+
+
+@dataclass
+class _ContactsUntagrequestBase:
+    """Auto-generated from schema: contacts.untagrequest"""
+
+    id: str
+    tags: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            tags=data.get('tags') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'tags': self.tags,
+        }
+        return out
+
+
+@dataclass
+class _ContactsUpdatecompanylinkrequestBase:
+    """Auto-generated from schema: contacts.updateCompanyLinkrequest"""
+
+    id: str
+    company_id: str
+    position: str | None = None
+    decision_maker: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            company_id=data['company_id'],
+            position=data.get('position'),
+            decision_maker=data.get('decision_maker'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'company_id': self.company_id,
+        }
+        if self.position is not None:
+            out['position'] = self.position
+        if self.decision_maker is not None:
+            out['decision_maker'] = self.decision_maker
+        return out
+
+
+@dataclass
+class _ContactsUpdaterequestBase:
+    """Auto-generated from schema: contacts.updaterequest"""
+
+    id: str
+    first_name: str | None = None
+    last_name: str | None = None
+    salutation: str | None = None
+    website: str | None = None
+    language: str | None = None
+    gender: dict[str, Any] | None = None
+    birthdate: str | None = None
+    iban: str | None = None
+    bic: str | None = None
+    national_identification_number: str | None = None
+    remarks: str | None = None
+    marketing_mails_consent: bool | None = None
+    emails: list[dict[str, Any]] = field(default_factory=list)
+    telephones: list[dict[str, Any]] = field(default_factory=list)
+    addresses: list[dict[str, Any]] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            first_name=data.get('first_name'),
+            last_name=data.get('last_name'),
+            salutation=data.get('salutation'),
+            website=data.get('website'),
+            language=data.get('language'),
+            gender=data.get('gender'),
+            birthdate=data.get('birthdate'),
+            iban=data.get('iban'),
+            bic=data.get('bic'),
+            national_identification_number=data.get('national_identification_number'),
+            remarks=data.get('remarks'),
+            marketing_mails_consent=data.get('marketing_mails_consent'),
+            emails=data.get('emails') or [],
+            telephones=data.get('telephones') or [],
+            addresses=data.get('addresses') or [],
+            tags=data.get('tags') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.first_name is not None:
+            out['first_name'] = self.first_name
+        if self.last_name is not None:
+            out['last_name'] = self.last_name
+        if self.salutation is not None:
+            out['salutation'] = self.salutation
+        if self.website is not None:
+            out['website'] = self.website
+        if self.language is not None:
+            out['language'] = self.language
+        if self.gender is not None:
+            out['gender'] = self.gender
+        if self.birthdate is not None:
+            out['birthdate'] = self.birthdate
+        if self.iban is not None:
+            out['iban'] = self.iban
+        if self.bic is not None:
+            out['bic'] = self.bic
+        if self.national_identification_number is not None:
+            out['national_identification_number'] = self.national_identification_number
+        if self.remarks is not None:
+            out['remarks'] = self.remarks
+        if self.marketing_mails_consent is not None:
+            out['marketing_mails_consent'] = self.marketing_mails_consent
+        if self.emails:
+            out['emails'] = self.emails
+        if self.telephones:
+            out['telephones'] = self.telephones
+        if self.addresses:
+            out['addresses'] = self.addresses
+        if self.tags:
+            out['tags'] = self.tags
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ContactsUploadavatarrequestBase:
+    """Auto-generated from schema: contacts.uploadAvatarrequest"""
+
+    id: str
+    image: str | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            image=data.get('image'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'image': self.image,
+        }
+        return out
@@ -0,0 +1,126 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _DayofftypesCreaterequestBase:
+    """Auto-generated from schema: dayOffTypes.createrequest"""
+
+    name: str
+    color: str | None = None
+    date_validity: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data['name'],
+            color=data.get('color'),
+            date_validity=data.get('date_validity'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'name': self.name,
+        }
+        if self.color is not None:
+            out['color'] = self.color
+        if self.date_validity is not None:
+            out['date_validity'] = self.date_validity
+        return out
+
+
+@dataclass
+class _DayofftypesCreateresponseBase:
+    """Auto-generated from schema: dayOffTypes.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DayofftypesDeleterequestBase:
+    """Auto-generated from schema: dayOffTypes.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _DayofftypesListresponseBase:
+    """Auto-generated from schema: dayOffTypes.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DayofftypesUpdaterequestBase:
+    """Auto-generated from schema: dayOffTypes.updaterequest"""
+
+    id: str
+    name: str | None = None
+    color: str | None = None
+    date_validity: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            name=data.get('name'),
+            color=data.get('color'),
+            date_validity=data.get('date_validity'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.name is not None:
+            out['name'] = self.name
+        if self.color is not None:
+            out['color'] = self.color
+        if self.date_validity is not None:
+            out['date_validity'] = self.date_validity
+        return out
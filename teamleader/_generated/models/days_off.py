@@ -0,0 +1,59 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _DaysoffBulkdeleterequestBase:
+    """Auto-generated from schema: daysOff.bulkDeleterequest"""
+
+    user_id: str
+    ids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            user_id=data['user_id'],
+            ids=data.get('ids') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'user_id': self.user_id,
+        }
+        if self.ids:
+            out['ids'] = self.ids
+        return out
+
+
+@dataclass
+class _DaysoffImportrequestBase:
+    """Auto-generated from schema: daysOff.importrequest"""
+
+    user_id: str
+    leave_type_id: str
+    days: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            user_id=data['user_id'],
+            leave_type_id=data['leave_type_id'],
+            days=data.get('days') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'user_id': self.user_id,
+            'leave_type_id': self.leave_type_id,
+            'days': self.days,
+        }
+        return out
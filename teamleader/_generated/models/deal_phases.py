@@ -0,0 +1,222 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _DealphasesCreaterequestBase:
+    """Auto-generated from schema: dealPhases.createrequest"""
+
+    name: str
+    deal_pipeline_id: str
+    requires_attention_after: dict[str, Any]
+    estimated_probability: float | None = None
+    follow_up_actions: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data['name'],
+            deal_pipeline_id=data['deal_pipeline_id'],
+            requires_attention_after=data['requires_attention_after'],
+            estimated_probability=data.get('estimated_probability'),
+            follow_up_actions=data.get('follow_up_actions') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'name': self.name,
+            'deal_pipeline_id': self.deal_pipeline_id,
+            'requires_attention_after': self.requires_attention_after,
+        }
+        if self.estimated_probability is not None:
+            out['estimated_probability'] = self.estimated_probability
+        if self.follow_up_actions:
+            out['follow_up_actions'] = self.follow_up_actions
+        return out
+
+
+@dataclass
+class _DealphasesCreateresponseBase:
+    """Auto-generated from schema: dealPhases.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealphasesDeleterequestBase:
+    """Auto-generated from schema: dealPhases.deleterequest"""
+
+    id: str
+    new_phase_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            new_phase_id=data.get('new_phase_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.new_phase_id is not None:
+            out['new_phase_id'] = self.new_phase_id
+        return out
+
+
+@dataclass
+class _DealphasesDuplicaterequestBase:
+    """Auto-generated from schema: dealPhases.duplicaterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _DealphasesDuplicateresponseBase:
+    """Auto-generated from schema: dealPhases.duplicateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealphasesListrequestBase:
+    """Auto-generated from schema: dealPhases.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _DealphasesListresponseBase:
+    """Auto-generated from schema: dealPhases.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealphasesMoverequestBase:
+    """Auto-generated from schema: dealPhases.moverequest"""
+
+    id: str
+    after_phase_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            after_phase_id=data['after_phase_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'after_phase_id': self.after_phase_id,
+        }
+        return out
+
+
+@dataclass
+class _DealphasesUpdaterequestBase:
+    """Auto-generated from schema: dealPhases.updaterequest"""
+
+    id: str
+    requires_attention_after: dict[str, Any]
+    name: str | None = None
+    estimated_probability: float | None = None
+    follow_up_actions: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            requires_attention_after=data['requires_attention_after'],
+            name=data.get('name'),
+            estimated_probability=data.get('estimated_probability'),
+            follow_up_actions=data.get('follow_up_actions') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'requires_attention_after': self.requires_attention_after,
+        }
+        if self.name is not None:
+            out['name'] = self.name
+        if self.estimated_probability is not None:
+            out['estimated_probability'] = self.estimated_probability
+        if self.follow_up_actions:
+            out['follow_up_actions'] = self.follow_up_actions
+        return out
@@ -0,0 +1,376 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _DealsCreaterequestBase:
+    """Auto-generated from schema: deals.createrequest"""
+
+    lead: dict[str, Any]
+    title: str
+    summary: str | None = None
+    source_id: str | None = None
+    department_id: str | None = None
+    responsible_user_id: str | None = None
+    phase_id: str | None = None
+    estimated_value: dict[str, Any] | None = None
+    estimated_probability: float | None = None
+    estimated_closing_date: str | None = None
+    currency: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            lead=data['lead'],
+            title=data['title'],
+            summary=data.get('summary'),
+            source_id=data.get('source_id'),
+            department_id=data.get('department_id'),
+            responsible_user_id=data.get('responsible_user_id'),
+            phase_id=data.get('phase_id'),
+            estimated_value=data.get('estimated_value'),
+            estimated_probability=data.get('estimated_probability'),
+            estimated_closing_date=data.get('estimated_closing_date'),
+            currency=data.get('currency'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'lead': self.lead,
+            'title': self.title,
+        }
+        if self.summary is not None:
+            out['summary'] = self.summary
+        if self.source_id is not None:
+            out['source_id'] = self.source_id
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.responsible_user_id is not None:
+            out['responsible_user_id'] = self.responsible_user_id
+        if self.phase_id is not None:
+            out['phase_id'] = self.phase_id
+        if self.estimated_value is not None:
+            out['estimated_value'] = self.estimated_value
+        if self.estimated_probability is not None:
+            out['estimated_probability'] = self.estimated_probability
+        if self.estimated_closing_date is not None:
+            out['estimated_closing_date'] = self.estimated_closing_date
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _DealsCreateresponseBase:
+    """Auto-generated from schema: deals.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealsDeleterequestBase:
+    """Auto-generated from schema: deals.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _DealsInforequestBase:
+    """Auto-generated from schema: deals.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _DealsInforesponseBase:
+    """Auto-generated from schema: deals.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealsListrequestBase:
+    """Auto-generated from schema: deals.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _DealsListresponseBase:
+    """Auto-generated from schema: deals.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _DealsLoserequestBase:
+    """Auto-generated from schema: deals.loserequest"""
+
+    id: str
+    reason_id: str | None = None
+    extra_info: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            reason_id=data.get('reason_id'),
+            extra_info=data.get('extra_info'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.reason_id is not None:
+            out['reason_id'] = self.reason_id
+        if self.extra_info is not None:
+            out['extra_info'] = self.extra_info
+        return out
+
+
+@dataclass
+class _DealsMoverequestBase:
+    """Auto-generated from schema: deals.moverequest"""
+
+    id: str
+    phase_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            phase_id=data['phase_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'phase_id': self.phase_id,
+        }
+        return out
+
+
+@dataclass
+class _DealsUpdaterequestBase:
+    """Auto-generated from schema: deals.updaterequest"""
+
+    id: str
+    lead: dict[str, Any] | None = None
+    title: str | None = None
+    summary: str | None = None
+    source_id: str | None = None
+    department_id: str | None = None
+    responsible_user_id: str | None = None
+    estimated_value: dict[str, Any] | None = None
+    estimated_probability: float | None = None
+    estimated_closing_date: str | None = None
+    currency: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            lead=data.get('lead'),
+            title=data.get('title'),
+            summary=data.get('summary'),
+            source_id=data.get('source_id'),
+            department_id=data.get('department_id'),
+            responsible_user_id=data.get('responsible_user_id'),
+            estimated_value=data.get('estimated_value'),
+            estimated_probability=data.get('estimated_probability'),
+            estimated_closing_date=data.get('estimated_closing_date'),
+            currency=data.get('currency'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.lead is not None:
+            out['lead'] = self.lead
+        if self.title is not None:
+            out['title'] = self.title
+        if self.summary is not None:
+            out['summary'] = self.summary
+        if self.source_id is not None:
+            out['source_id'] = self.source_id
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.responsible_user_id is not None:
+            out['responsible_user_id'] = self.responsible_user_id
+        if self.estimated_value is not None:
+            out['estimated_value'] = self.estimated_value
+        if self.estimated_probability is not None:
+            out['estimated_probability'] = self.estimated_probability
+        if self.estimated_closing_date is not None:
+            out['estimated_closing_date'] = self.estimated_closing_date
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _DealsWinrequestBase:
+    """Auto-generated from schema: deals.winrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _LostreasonsListrequestBase:
+    """Auto-generated from schema: lostReasons.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _LostreasonsListresponseBase:
+    """Auto-generated from schema: lostReasons.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
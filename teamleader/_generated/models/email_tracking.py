@@ -0,0 +1,102 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _EmailtrackingCreaterequestBase:
+    """Auto-generated from schema: emailTracking.createrequest"""
+
+    subject: dict[str, Any]
+    content: str
+    title: str | None = None
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            subject=data['subject'],
+            content=data['content'],
+            title=data.get('title'),
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'subject': self.subject,
+            'content': self.content,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _EmailtrackingCreateresponseBase:
+    """Auto-generated from schema: emailTracking.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _EmailtrackingListrequestBase:
+    """Auto-generated from schema: emailTracking.listrequest"""
+
+    filter: dict[str, Any]
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data['filter'],
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'filter': self.filter,
+        }
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _EmailtrackingListresponseBase:
+    """Auto-generated from schema: emailTracking.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
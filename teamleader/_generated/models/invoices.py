@@ -0,0 +1,616 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _InvoicesBookrequestBase:
+    """Auto-generated from schema: invoices.bookrequest"""
+
+    id: str
+    on: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            on=data['on'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'on': self.on,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesCopyrequestBase:
+    """Auto-generated from schema: invoices.copyrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesCopyresponseBase:
+    """Auto-generated from schema: invoices.copyresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesCreditpartiallyrequestBase:
+    """Auto-generated from schema: invoices.creditPartiallyrequest"""
+
+    id: str
+    credit_note_date: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    discounts: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            credit_note_date=data.get('credit_note_date'),
+            grouped_lines=data.get('grouped_lines') or [],
+            discounts=data.get('discounts') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'grouped_lines': self.grouped_lines,
+        }
+        if self.credit_note_date is not None:
+            out['credit_note_date'] = self.credit_note_date
+        if self.discounts:
+            out['discounts'] = self.discounts
+        return out
+
+
+@dataclass
+class _InvoicesCreditpartiallyresponseBase:
+    """Auto-generated from schema: invoices.creditPartiallyresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesCreditrequestBase:
+    """Auto-generated from schema: invoices.creditrequest"""
+
+    id: str
+    credit_note_date: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            credit_note_date=data.get('credit_note_date'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.credit_note_date is not None:
+            out['credit_note_date'] = self.credit_note_date
+        return out
+
+
+@dataclass
+class _InvoicesCreditresponseBase:
+    """Auto-generated from schema: invoices.creditresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesDeleterequestBase:
+    """Auto-generated from schema: invoices.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesDownloadrequestBase:
+    """Auto-generated from schema: invoices.downloadrequest"""
+
+    id: str
+    format: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            format=data['format'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'format': self.format,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesDownloadresponseBase:
+    """Auto-generated from schema: invoices.downloadresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesDraftrequestBase:
+    """Auto-generated from schema: invoices.draftrequest"""
+
+    invoicee: dict[str, Any]
+    department_id: str
+    payment_term: dict[str, Any]
+    currency: dict[str, Any] | None = None
+    project_id: str | None = None
+    purchase_order_number: str | None = None
+    invoice_date: str | None = None
+    note: str | None = None
+    expected_payment_method: dict[str, Any] | None = None
+    document_template_id: str | None = None
+    delivery_date: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    discounts: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            invoicee=data['invoicee'],
+            department_id=data['department_id'],
+            payment_term=data['payment_term'],
+            currency=data.get('currency'),
+            project_id=data.get('project_id'),
+            purchase_order_number=data.get('purchase_order_number'),
+            invoice_date=data.get('invoice_date'),
+            note=data.get('note'),
+            expected_payment_method=data.get('expected_payment_method'),
+            document_template_id=data.get('document_template_id'),
+            delivery_date=data.get('delivery_date'),
+            grouped_lines=data.get('grouped_lines') or [],
+            discounts=data.get('discounts') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'invoicee': self.invoicee,
+            'department_id': self.department_id,
+            'payment_term': self.payment_term,
+            'grouped_lines': self.grouped_lines,
+        }
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.invoice_date is not None:
+            out['invoice_date'] = self.invoice_date
+        if self.note is not None:
+            out['note'] = self.note
+        if self.expected_payment_method is not None:
+            out['expected_payment_method'] = self.expected_payment_method
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.delivery_date is not None:
+            out['delivery_date'] = self.delivery_date
+        if self.discounts:
+            out['discounts'] = self.discounts
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _InvoicesDraftresponseBase:
+    """Auto-generated from schema: invoices.draftresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesInforequestBase:
+    """Auto-generated from schema: invoices.inforequest"""
+
+    id: str | None = None
+    includes: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            includes=data.get('includes'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.includes is not None:
+            out['includes'] = self.includes
+        return out
+
+
+@dataclass
+class _InvoicesInforesponseBase:
+    """Auto-generated from schema: invoices.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesListrequestBase:
+    """Auto-generated from schema: invoices.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _InvoicesListresponseBase:
+    """Auto-generated from schema: invoices.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _InvoicesRegisterpaymentrequestBase:
+    """Auto-generated from schema: invoices.registerPaymentrequest"""
+
+    id: str
+    payment: dict[str, Any]
+    paid_at: str
+    payment_method_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            payment=data['payment'],
+            paid_at=data['paid_at'],
+            payment_method_id=data.get('payment_method_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'payment': self.payment,
+            'paid_at': self.paid_at,
+        }
+        if self.payment_method_id is not None:
+            out['payment_method_id'] = self.payment_method_id
+        return out
+
+
+@dataclass
+class _InvoicesRemovepaymentsrequestBase:
+    """Auto-generated from schema: invoices.removePaymentsrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesSendviapeppolBase:
+    """Auto-generated from schema: invoices.sendViaPeppol"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _InvoicesSendrequestBase:
+    """Auto-generated from schema: invoices.sendrequest"""
+
+    id: str
+    content: dict[str, Any]
+    recipients: dict[str, Any] | None = None
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            content=data['content'],
+            recipients=data.get('recipients'),
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'content': self.content,
+        }
+        if self.recipients is not None:
+            out['recipients'] = self.recipients
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _InvoicesUpdatebookedrequestBase:
+    """Auto-generated from schema: invoices.updateBookedrequest"""
+
+    id: str
+    invoicee: dict[str, Any] | None = None
+    payment_term: dict[str, Any] | None = None
+    project_id: str | None = None
+    invoice_date: str | None = None
+    note: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            invoicee=data.get('invoicee'),
+            payment_term=data.get('payment_term'),
+            project_id=data.get('project_id'),
+            invoice_date=data.get('invoice_date'),
+            note=data.get('note'),
+            grouped_lines=data.get('grouped_lines') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.invoicee is not None:
+            out['invoicee'] = self.invoicee
+        if self.payment_term is not None:
+            out['payment_term'] = self.payment_term
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.invoice_date is not None:
+            out['invoice_date'] = self.invoice_date
+        if self.note is not None:
+            out['note'] = self.note
+        if self.grouped_lines:
+            out['grouped_lines'] = self.grouped_lines
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _InvoicesUpdaterequestBase:
+    """Auto-generated from schema: invoices.updaterequest"""
+
+    id: str
+    invoicee: dict[str, Any] | None = None
+    payment_term: dict[str, Any] | None = None
+    currency: dict[str, Any] | None = None
+    project_id: str | None = None
+    purchase_order_number: str | None = None
+    invoice_date: str | None = None
+    note: str | None = None
+    expected_payment_method: dict[str, Any] | None = None
+    document_template_id: str | None = None
+    delivery_date: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    discounts: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            invoicee=data.get('invoicee'),
+            payment_term=data.get('payment_term'),
+            currency=data.get('currency'),
+            project_id=data.get('project_id'),
+            purchase_order_number=data.get('purchase_order_number'),
+            invoice_date=data.get('invoice_date'),
+            note=data.get('note'),
+            expected_payment_method=data.get('expected_payment_method'),
+            document_template_id=data.get('document_template_id'),
+            delivery_date=data.get('delivery_date'),
+            grouped_lines=data.get('grouped_lines') or [],
+            discounts=data.get('discounts') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.invoicee is not None:
+            out['invoicee'] = self.invoicee
+        if self.payment_term is not None:
+            out['payment_term'] = self.payment_term
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.purchase_order_number is not None:
+            out['purchase_order_number'] = self.purchase_order_number
+        if self.invoice_date is not None:
+            out['invoice_date'] = self.invoice_date
+        if self.note is not None:
+            out['note'] = self.note
+        if self.expected_payment_method is not None:
+            out['expected_payment_method'] = self.expected_payment_method
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.delivery_date is not None:
+            out['delivery_date'] = self.delivery_date
+        if self.grouped_lines:
+            out['grouped_lines'] = self.grouped_lines
+        if self.discounts:
+            out['discounts'] = self.discounts
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
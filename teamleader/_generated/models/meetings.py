@@ -0,0 +1,324 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _MeetingsCompleterequestBase:
+    """Auto-generated from schema: meetings.completerequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MeetingsCreatereportrequestBase:
+    """Auto-generated from schema: meetings.createReportrequest"""
+
+    id: str
+    attach_to: dict[str, Any]
+    summary: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            attach_to=data['attach_to'],
+            summary=data.get('summary'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'attach_to': self.attach_to,
+        }
+        if self.summary is not None:
+            out['summary'] = self.summary
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _MeetingsCreatereportresponseBase:
+    """Auto-generated from schema: meetings.createReportresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MeetingsDeleterequestBase:
+    """Auto-generated from schema: meetings.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _MeetingsInforequestBase:
+    """Auto-generated from schema: meetings.inforequest"""
+
+    id: str
+    includes: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            includes=data.get('includes'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.includes is not None:
+            out['includes'] = self.includes
+        return out
+
+
+@dataclass
+class _MeetingsInforesponseBase:
+    """Auto-generated from schema: meetings.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MeetingsListrequestBase:
+    """Auto-generated from schema: meetings.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    includes: str | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            includes=data.get('includes'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.includes is not None:
+            out['includes'] = self.includes
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _MeetingsListresponseBase:
+    """Auto-generated from schema: meetings.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MeetingsSchedulerequestBase:
+    """Auto-generated from schema: meetings.schedulerequest"""
+
+    title: str
+    starts_at: str
+    ends_at: str
+    description: str | None = None
+    customer: dict[str, Any] | None = None
+    location: dict[str, Any] | None = None
+    milestone_id: str | None = None
+    deal_id: str | None = None
+    work_order_id: str | None = None
+    attendees: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            title=data['title'],
+            starts_at=data['starts_at'],
+            ends_at=data['ends_at'],
+            description=data.get('description'),
+            customer=data.get('customer'),
+            location=data.get('location'),
+            milestone_id=data.get('milestone_id'),
+            deal_id=data.get('deal_id'),
+            work_order_id=data.get('work_order_id'),
+            attendees=data.get('attendees') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'title': self.title,
+            'starts_at': self.starts_at,
+            'ends_at': self.ends_at,
+            'attendees': self.attendees,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.location is not None:
+            out['location'] = self.location
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.work_order_id is not None:
+            out['work_order_id'] = self.work_order_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _MeetingsScheduleresponseBase:
+    """Auto-generated from schema: meetings.scheduleresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MeetingsUpdaterequestBase:
+    """Auto-generated from schema: meetings.updaterequest"""
+
+    id: str
+    title: str | None = None
+    starts_at: str | None = None
+    ends_at: str | None = None
+    description: str | None = None
+    customer: dict[str, Any] | None = None
+    location: dict[str, Any] | None = None
+    milestone_id: str | None = None
+    deal_id: str | None = None
+    attendees: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            starts_at=data.get('starts_at'),
+            ends_at=data.get('ends_at'),
+            description=data.get('description'),
+            customer=data.get('customer'),
+            location=data.get('location'),
+            milestone_id=data.get('milestone_id'),
+            deal_id=data.get('deal_id'),
+            attendees=data.get('attendees') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.starts_at is not None:
+            out['starts_at'] = self.starts_at
+        if self.ends_at is not None:
+            out['ends_at'] = self.ends_at
+        if self.description is not None:
+            out['description'] = self.description
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.location is not None:
+            out['location'] = self.location
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.attendees:
+            out['attendees'] = self.attendees
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
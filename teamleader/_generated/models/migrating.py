@@ -0,0 +1,133 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:50:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass
+class _MigrateActivitytyperequestBase:
+    """Auto-generated from schema: migrate.activityTyperequest"""
+
+    type: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        return out
+
+
+@dataclass
+class _MigrateActivitytyperesponseBase:
+    """Auto-generated from schema: migrate.activityTyperesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MigrateIdrequestBase:
+    """Auto-generated from schema: migrate.idrequest"""
+
+    type: str | None = None
+    id: float | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            type=data.get('type'),
+            id=data.get('id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.type is not None:
+            out['type'] = self.type
+        if self.id is not None:
+            out['id'] = self.id
+        return out
+
+
+@dataclass
+class _MigrateIdresponseBase:
+    """Auto-generated from schema: migrate.idresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _MigrateTaxraterequestBase:
+    """Auto-generated from schema: migrate.taxRaterequest"""
+
+    department_id: str | None = None
+    tax_rate: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            department_id=data.get('department_id'),
+            tax_rate=data.get('tax_rate'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.tax_rate is not None:
+            out['tax_rate'] = self.tax_rate
+        return out
+
+
+@dataclass
+class _MigrateTaxrateresponseBase:
+    """Auto-generated from schema: migrate.taxRateresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
@@ -0,0 +1,121 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _NotesCreaterequestBase:
+    """Auto-generated from schema: notes.createrequest"""
+
+    subject: dict[str, Any]
+    content: str
+    notify: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            subject=data['subject'],
+            content=data['content'],
+            notify=data.get('notify') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'subject': self.subject,
+            'content': self.content,
+        }
+        if self.notify:
+            out['notify'] = self.notify
+        return out
+
+
+@dataclass
+class _NotesCreateresponseBase:
+    """Auto-generated from schema: notes.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _NotesListrequestBase:
+    """Auto-generated from schema: notes.listrequest"""
+
+    filter: dict[str, Any]
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data['filter'],
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'filter': self.filter,
+        }
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _NotesListresponseBase:
+    """Auto-generated from schema: notes.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _NotesUpdaterequestBase:
+    """Auto-generated from schema: notes.updaterequest"""
+
+    id: str
+    content: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            content=data.get('content'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.content is not None:
+            out['content'] = self.content
+        return out
@@ -0,0 +1,271 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ProductsAddrequestBase:
+    """Auto-generated from schema: products.addrequest"""
+
+    name: str | None = None
+    code: str | None = None
+    description: str | None = None
+    purchase_price: dict[str, Any] | None = None
+    selling_price: dict[str, Any] | None = None
+    unit_of_measure_id: str | None = None
+    stock: dict[str, Any] | None = None
+    configuration: dict[str, Any] | None = None
+    department_id: str | None = None
+    product_category_id: str | None = None
+    tax_rate_id: str | None = None
+    price_list_prices: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            name=data.get('name'),
+            code=data.get('code'),
+            description=data.get('description'),
+            purchase_price=data.get('purchase_price'),
+            selling_price=data.get('selling_price'),
+            unit_of_measure_id=data.get('unit_of_measure_id'),
+            stock=data.get('stock'),
+            configuration=data.get('configuration'),
+            department_id=data.get('department_id'),
+            product_category_id=data.get('product_category_id'),
+            tax_rate_id=data.get('tax_rate_id'),
+            price_list_prices=data.get('price_list_prices') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.name is not None:
+            out['name'] = self.name
+        if self.code is not None:
+            out['code'] = self.code
+        if self.description is not None:
+            out['description'] = self.description
+        if self.purchase_price is not None:
+            out['purchase_price'] = self.purchase_price
+        if self.selling_price is not None:
+            out['selling_price'] = self.selling_price
+        if self.unit_of_measure_id is not None:
+            out['unit_of_measure_id'] = self.unit_of_measure_id
+        if self.stock is not None:
+            out['stock'] = self.stock
+        if self.configuration is not None:
+            out['configuration'] = self.configuration
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.product_category_id is not None:
+            out['product_category_id'] = self.product_category_id
+        if self.tax_rate_id is not None:
+            out['tax_rate_id'] = self.tax_rate_id
+        if self.price_list_prices:
+            out['price_list_prices'] = self.price_list_prices
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _ProductsAddresponseBase:
+    """Auto-generated from schema: products.addresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProductsDeleterequestBase:
+    """Auto-generated from schema: products.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ProductsInforequestBase:
+    """Auto-generated from schema: products.inforequest"""
+
+    id: str
+    includes: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            includes=data.get('includes'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.includes is not None:
+            out['includes'] = self.includes
+        return out
+
+
+@dataclass
+class _ProductsInforesponseBase:
+    """Auto-generated from schema: products.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProductsListrequestBase:
+    """Auto-generated from schema: products.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _ProductsListresponseBase:
+    """Auto-generated from schema: products.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ProductsUpdaterequestBase:
+    """Auto-generated from schema: products.updaterequest"""
+
+    id: str
+    name: str | None = None
+    code: str | None = None
+    purchase_price: dict[str, Any] | None = None
+    description: str | None = None
+    selling_price: dict[str, Any] | None = None
+    unit_of_measure_id: str | None = None
+    stock: dict[str, Any] | None = None
+    configuration: dict[str, Any] | None = None
+    department_id: str | None = None
+    product_category_id: str | None = None
+    tax_rate_id: str | None = None
+    price_list_prices: list[list[Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            name=data.get('name'),
+            code=data.get('code'),
+            purchase_price=data.get('purchase_price'),
+            description=data.get('description'),
+            selling_price=data.get('selling_price'),
+            unit_of_measure_id=data.get('unit_of_measure_id'),
+            stock=data.get('stock'),
+            configuration=data.get('configuration'),
+            department_id=data.get('department_id'),
+            product_category_id=data.get('product_category_id'),
+            tax_rate_id=data.get('tax_rate_id'),
+            price_list_prices=data.get('price_list_prices') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.name is not None:
+            out['name'] = self.name
+        if self.code is not None:
+            out['code'] = self.code
+        if self.purchase_price is not None:
+            out['purchase_price'] = self.purchase_price
+        if self.description is not None:
+            out['description'] = self.description
+        if self.selling_price is not None:
+            out['selling_price'] = self.selling_price
+        if self.unit_of_measure_id is not None:
+            out['unit_of_measure_id'] = self.unit_of_measure_id
+        if self.stock is not None:
+            out['stock'] = self.stock
+        if self.configuration is not None:
+            out['configuration'] = self.configuration
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.product_category_id is not None:
+            out['product_category_id'] = self.product_category_id
+        if self.tax_rate_id is not None:
+            out['tax_rate_id'] = self.tax_rate_id
+        if self.price_list_prices:
+            out['price_list_prices'] = self.price_list_prices
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
@@ -0,0 +1,314 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _QuotationsAcceptrequestBase:
+    """Auto-generated from schema: quotations.acceptrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _QuotationsCreaterequestBase:
+    """Auto-generated from schema: quotations.createrequest"""
+
+    deal_id: str
+    currency: dict[str, Any] | None = None
+    text: str | None = None
+    document_template_id: str | None = None
+    expiry: dict[str, Any] | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    discounts: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            deal_id=data['deal_id'],
+            currency=data.get('currency'),
+            text=data.get('text'),
+            document_template_id=data.get('document_template_id'),
+            expiry=data.get('expiry'),
+            grouped_lines=data.get('grouped_lines') or [],
+            discounts=data.get('discounts') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'deal_id': self.deal_id,
+        }
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.text is not None:
+            out['text'] = self.text
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.expiry is not None:
+            out['expiry'] = self.expiry
+        if self.grouped_lines:
+            out['grouped_lines'] = self.grouped_lines
+        if self.discounts:
+            out['discounts'] = self.discounts
+        return out
+
+
+@dataclass
+class _QuotationsCreateresponseBase:
+    """Auto-generated from schema: quotations.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _QuotationsDeleterequestBase:
+    """Auto-generated from schema: quotations.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _QuotationsDownloadrequestBase:
+    """Auto-generated from schema: quotations.downloadrequest"""
+
+    id: str
+    format: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            format=data['format'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'format': self.format,
+        }
+        return out
+
+
+@dataclass
+class _QuotationsDownloadresponseBase:
+    """Auto-generated from schema: quotations.downloadresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _QuotationsInforequestBase:
+    """Auto-generated from schema: quotations.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _QuotationsInforesponseBase:
+    """Auto-generated from schema: quotations.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _QuotationsListrequestBase:
+    """Auto-generated from schema: quotations.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _QuotationsListresponseBase:
+    """Auto-generated from schema: quotations.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _QuotationsSendrequestBase:
+    """Auto-generated from schema: quotations.sendrequest"""
+
+    recipients: dict[str, Any]
+    subject: str
+    content: str
+    language: str
+    from_: dict[str, Any] | None = None
+    quotations: list[str] = field(default_factory=list)
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            recipients=data['recipients'],
+            subject=data['subject'],
+            content=data['content'],
+            language=data['language'],
+            from_=data.get('from'),
+            quotations=data.get('quotations') or [],
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'recipients': self.recipients,
+            'subject': self.subject,
+            'content': self.content,
+            'language': self.language,
+            'quotations': self.quotations,
+        }
+        if self.from_ is not None:
+            out['from'] = self.from_
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _QuotationsUpdaterequestBase:
+    """Auto-generated from schema: quotations.updaterequest"""
+
+    id: str
+    currency: dict[str, Any] | None = None
+    text: str | None = None
+    document_template_id: str | None = None
+    expiry: dict[str, Any] | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    discounts: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            currency=data.get('currency'),
+            text=data.get('text'),
+            document_template_id=data.get('document_template_id'),
+            expiry=data.get('expiry'),
+            grouped_lines=data.get('grouped_lines') or [],
+            discounts=data.get('discounts') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.currency is not None:
+            out['currency'] = self.currency
+        if self.text is not None:
+            out['text'] = self.text
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.expiry is not None:
+            out['expiry'] = self.expiry
+        if self.grouped_lines:
+            out['grouped_lines'] = self.grouped_lines
+        if self.discounts:
+            out['discounts'] = self.discounts
+        return out
@@ -0,0 +1,165 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ReceiptsListpaymentsrequestBase:
+    """Auto-generated from schema: receipts.listPaymentsrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ReceiptsListpaymentsresponseBase:
+    """Auto-generated from schema: receipts.listPaymentsresponse"""
+
+    meta: dict[str, Any] | None = None
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            meta=data.get('meta'),
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.meta is not None:
+            out['meta'] = self.meta
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ReceiptsRegisterpaymentrequestBase:
+    """Auto-generated from schema: receipts.registerPaymentrequest"""
+
+    id: str
+    payment: dict[str, Any]
+    paid_at: str
+    payment_method_id: str | None = None
+    remark: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            payment=data['payment'],
+            paid_at=data['paid_at'],
+            payment_method_id=data.get('payment_method_id'),
+            remark=data.get('remark'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'payment': self.payment,
+            'paid_at': self.paid_at,
+        }
+        if self.payment_method_id is not None:
+            out['payment_method_id'] = self.payment_method_id
+        if self.remark is not None:
+            out['remark'] = self.remark
+        return out
+
+
+@dataclass
+class _ReceiptsRegisterpaymentresponseBase:
+    """Auto-generated from schema: receipts.registerPaymentresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ReceiptsRemovepaymentrequestBase:
+    """Auto-generated from schema: receipts.removePaymentrequest"""
+
+    id: str
+    payment_id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            payment_id=data['payment_id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'payment_id': self.payment_id,
+        }
+        return out
+
+
+@dataclass
+class _ReceiptsUpdatepaymentrequestBase:
+    """Auto-generated from schema: receipts.updatePaymentrequest"""
+
+    id: str
+    payment_id: str
+    payment: dict[str, Any] | None = None
+    paid_at: str | None = None
+    payment_method_id: str | None = None
+    remark: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            payment_id=data['payment_id'],
+            payment=data.get('payment'),
+            paid_at=data.get('paid_at'),
+            payment_method_id=data.get('payment_method_id'),
+            remark=data.get('remark'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'payment_id': self.payment_id,
+        }
+        if self.payment is not None:
+            out['payment'] = self.payment
+        if self.paid_at is not None:
+            out['paid_at'] = self.paid_at
+        if self.payment_method_id is not None:
+            out['payment_method_id'] = self.payment_method_id
+        if self.remark is not None:
+            out['remark'] = self.remark
+        return out
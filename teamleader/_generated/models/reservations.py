@@ -0,0 +1,150 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _ReservationsCreaterequestBase:
+    """Auto-generated from schema: reservations.createrequest"""
+
+    plannable_item_id: str
+    date: str
+    duration: dict[str, Any]
+    assignee: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            plannable_item_id=data['plannable_item_id'],
+            date=data['date'],
+            duration=data['duration'],
+            assignee=data['assignee'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'plannable_item_id': self.plannable_item_id,
+            'date': self.date,
+            'duration': self.duration,
+            'assignee': self.assignee,
+        }
+        return out
+
+
+@dataclass
+class _ReservationsCreateresponseBase:
+    """Auto-generated from schema: reservations.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ReservationsDeleterequestBase:
+    """Auto-generated from schema: reservations.deleterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _ReservationsListrequestBase:
+    """Auto-generated from schema: reservations.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _ReservationsListresponseBase:
+    """Auto-generated from schema: reservations.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _ReservationsUpdaterequestBase:
+    """Auto-generated from schema: reservations.updaterequest"""
+
+    id: str
+    date: str | None = None
+    duration: dict[str, Any] | None = None
+    assignee: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            date=data.get('date'),
+            duration=data.get('duration'),
+            assignee=data.get('assignee'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.date is not None:
+            out['date'] = self.date
+        if self.duration is not None:
+            out['duration'] = self.duration
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        return out
@@ -0,0 +1,272 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _SubscriptionsCreaterequestBase:
+    """Auto-generated from schema: subscriptions.createrequest"""
+
+    invoicee: dict[str, Any]
+    department_id: str
+    starts_on: str
+    billing_cycle: dict[str, Any]
+    title: str
+    payment_term: dict[str, Any]
+    invoice_generation: dict[str, Any]
+    ends_on: str | None = None
+    deal_id: str | None = None
+    project_id: str | None = None
+    note: str | None = None
+    document_template_id: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            invoicee=data['invoicee'],
+            department_id=data['department_id'],
+            starts_on=data['starts_on'],
+            billing_cycle=data['billing_cycle'],
+            title=data['title'],
+            payment_term=data['payment_term'],
+            invoice_generation=data['invoice_generation'],
+            ends_on=data.get('ends_on'),
+            deal_id=data.get('deal_id'),
+            project_id=data.get('project_id'),
+            note=data.get('note'),
+            document_template_id=data.get('document_template_id'),
+            grouped_lines=data.get('grouped_lines') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'invoicee': self.invoicee,
+            'department_id': self.department_id,
+            'starts_on': self.starts_on,
+            'billing_cycle': self.billing_cycle,
+            'title': self.title,
+            'payment_term': self.payment_term,
+            'invoice_generation': self.invoice_generation,
+            'grouped_lines': self.grouped_lines,
+        }
+        if self.ends_on is not None:
+            out['ends_on'] = self.ends_on
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.note is not None:
+            out['note'] = self.note
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _SubscriptionsCreateresponseBase:
+    """Auto-generated from schema: subscriptions.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _SubscriptionsDeactivaterequestBase:
+    """Auto-generated from schema: subscriptions.deactivaterequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _SubscriptionsInforequestBase:
+    """Auto-generated from schema: subscriptions.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _SubscriptionsInforesponseBase:
+    """Auto-generated from schema: subscriptions.inforesponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _SubscriptionsListrequestBase:
+    """Auto-generated from schema: subscriptions.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _SubscriptionsListresponseBase:
+    """Auto-generated from schema: subscriptions.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _SubscriptionsUpdaterequestBase:
+    """Auto-generated from schema: subscriptions.updaterequest"""
+
+    id: str
+    starts_on: str | None = None
+    billing_cycle: dict[str, Any] | None = None
+    ends_on: str | None = None
+    title: str | None = None
+    invoicee: dict[str, Any] | None = None
+    department_id: str | None = None
+    payment_term: dict[str, Any] | None = None
+    project_id: str | None = None
+    deal_id: str | None = None
+    note: str | None = None
+    invoice_generation: dict[str, Any] | None = None
+    document_template_id: str | None = None
+    grouped_lines: list[dict[str, Any]] = field(default_factory=list)
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            starts_on=data.get('starts_on'),
+            billing_cycle=data.get('billing_cycle'),
+            ends_on=data.get('ends_on'),
+            title=data.get('title'),
+            invoicee=data.get('invoicee'),
+            department_id=data.get('department_id'),
+            payment_term=data.get('payment_term'),
+            project_id=data.get('project_id'),
+            deal_id=data.get('deal_id'),
+            note=data.get('note'),
+            invoice_generation=data.get('invoice_generation'),
+            document_template_id=data.get('document_template_id'),
+            grouped_lines=data.get('grouped_lines') or [],
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.starts_on is not None:
+            out['starts_on'] = self.starts_on
+        if self.billing_cycle is not None:
+            out['billing_cycle'] = self.billing_cycle
+        if self.ends_on is not None:
+            out['ends_on'] = self.ends_on
+        if self.title is not None:
+            out['title'] = self.title
+        if self.invoicee is not None:
+            out['invoicee'] = self.invoicee
+        if self.department_id is not None:
+            out['department_id'] = self.department_id
+        if self.payment_term is not None:
+            out['payment_term'] = self.payment_term
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.note is not None:
+            out['note'] = self.note
+        if self.invoice_generation is not None:
+            out['invoice_generation'] = self.invoice_generation
+        if self.document_template_id is not None:
+            out['document_template_id'] = self.document_template_id
+        if self.grouped_lines:
+            out['grouped_lines'] = self.grouped_lines
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
@@ -0,0 +1,343 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _TasksCompleterequestBase:
+    """Auto-generated from schema: tasks.completerequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _TasksCreaterequestBase:
+    """Auto-generated from schema: tasks.createrequest1"""
+
+    title: str
+    due_on: str
+    work_type_id: str
+    description: str | None = None
+    milestone_id: str | None = None
+    project_id: str | None = None
+    deal_id: str | None = None
+    ticket_id: str | None = None
+    estimated_duration: dict[str, Any] | None = None
+    assignee: dict[str, Any] | None = None
+    customer: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            title=data['title'],
+            due_on=data['due_on'],
+            work_type_id=data['work_type_id'],
+            description=data.get('description'),
+            milestone_id=data.get('milestone_id'),
+            project_id=data.get('project_id'),
+            deal_id=data.get('deal_id'),
+            ticket_id=data.get('ticket_id'),
+            estimated_duration=data.get('estimated_duration'),
+            assignee=data.get('assignee'),
+            customer=data.get('customer'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'title': self.title,
+            'due_on': self.due_on,
+            'work_type_id': self.work_type_id,
+        }
+        if self.description is not None:
+            out['description'] = self.description
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.ticket_id is not None:
+            out['ticket_id'] = self.ticket_id
+        if self.estimated_duration is not None:
+            out['estimated_duration'] = self.estimated_duration
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _TasksCreateresponseBase:
+    """Auto-generated from schema: tasks.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TasksDeleterequestBase:
+    """Auto-generated from schema: tasks.deleterequest1"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _TasksInforequestBase:
+    """Auto-generated from schema: tasks.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _TasksInforesponseBase:
+    """Auto-generated from schema: tasks.inforesponse1"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TasksListrequestBase:
+    """Auto-generated from schema: tasks.listrequest1"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+    sort: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+            sort=data.get('sort') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        if self.sort:
+            out['sort'] = self.sort
+        return out
+
+
+@dataclass
+class _TasksListresponseBase:
+    """Auto-generated from schema: tasks.listresponse1"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TasksReopenrequestBase:
+    """Auto-generated from schema: tasks.reopenrequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _TasksSchedulerequestBase:
+    """Auto-generated from schema: tasks.schedulerequest"""
+
+    id: str
+    starts_at: str
+    ends_at: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            starts_at=data['starts_at'],
+            ends_at=data['ends_at'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'starts_at': self.starts_at,
+            'ends_at': self.ends_at,
+        }
+        return out
+
+
+@dataclass
+class _TasksScheduleresponseBase:
+    """Auto-generated from schema: tasks.scheduleresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TasksUpdaterequestBase:
+    """Auto-generated from schema: tasks.updaterequest1"""
+
+    id: str
+    title: str | None = None
+    description: str | None = None
+    due_on: str | None = None
+    work_type_id: str | None = None
+    milestone_id: str | None = None
+    project_id: str | None = None
+    deal_id: str | None = None
+    ticket_id: str | None = None
+    estimated_duration: dict[str, Any] | None = None
+    assignee: dict[str, Any] | None = None
+    customer: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            title=data.get('title'),
+            description=data.get('description'),
+            due_on=data.get('due_on'),
+            work_type_id=data.get('work_type_id'),
+            milestone_id=data.get('milestone_id'),
+            project_id=data.get('project_id'),
+            deal_id=data.get('deal_id'),
+            ticket_id=data.get('ticket_id'),
+            estimated_duration=data.get('estimated_duration'),
+            assignee=data.get('assignee'),
+            customer=data.get('customer'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.title is not None:
+            out['title'] = self.title
+        if self.description is not None:
+            out['description'] = self.description
+        if self.due_on is not None:
+            out['due_on'] = self.due_on
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.project_id is not None:
+            out['project_id'] = self.project_id
+        if self.deal_id is not None:
+            out['deal_id'] = self.deal_id
+        if self.ticket_id is not None:
+            out['ticket_id'] = self.ticket_id
+        if self.estimated_duration is not None:
+            out['estimated_duration'] = self.estimated_duration
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
@@ -0,0 +1,527 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:00:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass
+class _TicketsAddinternalmessagerequestBase:
+    """Auto-generated from schema: tickets.addInternalMessagerequest"""
+
+    id: str
+    body: str
+    ticket_status_id: str | None = None
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            body=data['body'],
+            ticket_status_id=data.get('ticket_status_id'),
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'body': self.body,
+        }
+        if self.ticket_status_id is not None:
+            out['ticket_status_id'] = self.ticket_status_id
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _TicketsAddinternalmessageresponseBase:
+    """Auto-generated from schema: tickets.addInternalMessageresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsAddreplyrequestBase:
+    """Auto-generated from schema: tickets.addReplyrequest"""
+
+    id: str
+    body: str
+    ticket_status_id: str | None = None
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            body=data['body'],
+            ticket_status_id=data.get('ticket_status_id'),
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'body': self.body,
+        }
+        if self.ticket_status_id is not None:
+            out['ticket_status_id'] = self.ticket_status_id
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _TicketsAddreplyresponseBase:
+    """Auto-generated from schema: tickets.addReplyresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsCreaterequestBase:
+    """Auto-generated from schema: tickets.createrequest"""
+
+    subject: str
+    customer: dict[str, Any]
+    ticket_status_id: str
+    assignee: dict[str, Any] | None = None
+    description: str | None = None
+    participant: dict[str, Any] | None = None
+    initial_reply: str | None = None
+    milestone_id: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            subject=data['subject'],
+            customer=data['customer'],
+            ticket_status_id=data['ticket_status_id'],
+            assignee=data.get('assignee'),
+            description=data.get('description'),
+            participant=data.get('participant'),
+            initial_reply=data.get('initial_reply'),
+            milestone_id=data.get('milestone_id'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'subject': self.subject,
+            'customer': self.customer,
+            'ticket_status_id': self.ticket_status_id,
+        }
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.description is not None:
+            out['description'] = self.description
+        if self.participant is not None:
+            out['participant'] = self.participant
+        if self.initial_reply is not None:
+            out['initial_reply'] = self.initial_reply
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _TicketsCreateresponseBase:
+    """Auto-generated from schema: tickets.createresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsGetmessagerequestBase:
+    """Auto-generated from schema: tickets.getMessagerequest"""
+
+    message_id: str | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            message_id=data.get('message_id'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.message_id is not None:
+            out['message_id'] = self.message_id
+        return out
+
+
+@dataclass
+class _TicketsGetmessageresponseBase:
+    """Auto-generated from schema: tickets.getMessageresponse"""
+
+    message_id: str | None = None
+    body: str | None = None
+    raw_body: str | None = None
+    created_at: str | None = None
+    sent_by: dict[str, Any] | None = None
+    ticket: dict[str, Any] | None = None
+    type: str | None = None
+    attachments: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            message_id=data.get('message_id'),
+            body=data.get('body'),
+            raw_body=data.get('raw_body'),
+            created_at=data.get('created_at'),
+            sent_by=data.get('sent_by'),
+            ticket=data.get('ticket'),
+            type=data.get('type'),
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.message_id is not None:
+            out['message_id'] = self.message_id
+        if self.body is not None:
+            out['body'] = self.body
+        if self.raw_body is not None:
+            out['raw_body'] = self.raw_body
+        if self.created_at is not None:
+            out['created_at'] = self.created_at
+        if self.sent_by is not None:
+            out['sent_by'] = self.sent_by
+        if self.ticket is not None:
+            out['ticket'] = self.ticket
+        if self.type is not None:
+            out['type'] = self.type
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _TicketsImportmessagerequestBase:
+    """Auto-generated from schema: tickets.importMessagerequest"""
+
+    id: str
+    body: str
+    sent_by: dict[str, Any]
+    sent_at: str
+    attachments: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            body=data['body'],
+            sent_by=data['sent_by'],
+            sent_at=data['sent_at'],
+            attachments=data.get('attachments') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+            'body': self.body,
+            'sent_by': self.sent_by,
+            'sent_at': self.sent_at,
+        }
+        if self.attachments:
+            out['attachments'] = self.attachments
+        return out
+
+
+@dataclass
+class _TicketsImportmessageresponseBase:
+    """Auto-generated from schema: tickets.importMessageresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsInforequestBase:
+    """Auto-generated from schema: tickets.inforequest"""
+
+    id: str
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        return out
+
+
+@dataclass
+class _TicketsInforesponseBase:
+    """Auto-generated from schema: tickets.inforesponse"""
+
+    id: str | None = None
+    reference: float | None = None
+    subject: str | None = None
+    status: dict[str, Any] | None = None
+    assignee: dict[str, Any] | None = None
+    created_at: str | None = None
+    closed_at: str | None = None
+    customer: dict[str, Any] | None = None
+    participant: dict[str, Any] | None = None
+    last_message_at: str | None = None
+    description: str | None = None
+    project: dict[str, Any] | None = None
+    milestone: dict[str, Any] | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            reference=data.get('reference'),
+            subject=data.get('subject'),
+            status=data.get('status'),
+            assignee=data.get('assignee'),
+            created_at=data.get('created_at'),
+            closed_at=data.get('closed_at'),
+            customer=data.get('customer'),
+            participant=data.get('participant'),
+            last_message_at=data.get('last_message_at'),
+            description=data.get('description'),
+            project=data.get('project'),
+            milestone=data.get('milestone'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.reference is not None:
+            out['reference'] = self.reference
+        if self.subject is not None:
+            out['subject'] = self.subject
+        if self.status is not None:
+            out['status'] = self.status
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.created_at is not None:
+            out['created_at'] = self.created_at
+        if self.closed_at is not None:
+            out['closed_at'] = self.closed_at
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.participant is not None:
+            out['participant'] = self.participant
+        if self.last_message_at is not None:
+            out['last_message_at'] = self.last_message_at
+        if self.description is not None:
+            out['description'] = self.description
+        if self.project is not None:
+            out['project'] = self.project
+        if self.milestone is not None:
+            out['milestone'] = self.milestone
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
+
+
+@dataclass
+class _TicketsListmessagesrequestBase:
+    """Auto-generated from schema: tickets.listMessagesrequest"""
+
+    id: str | None = None
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data.get('id'),
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.id is not None:
+            out['id'] = self.id
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _TicketsListmessagesresponseBase:
+    """Auto-generated from schema: tickets.listMessagesresponse"""
+
+    meta: dict[str, Any] | None = None
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            meta=data.get('meta'),
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.meta is not None:
+            out['meta'] = self.meta
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsListrequestBase:
+    """Auto-generated from schema: tickets.listrequest"""
+
+    filter: dict[str, Any] | None = None
+    page: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            filter=data.get('filter'),
+            page=data.get('page'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.filter is not None:
+            out['filter'] = self.filter
+        if self.page is not None:
+            out['page'] = self.page
+        return out
+
+
+@dataclass
+class _TicketsListresponseBase:
+    """Auto-generated from schema: tickets.listresponse"""
+
+    data: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TicketsUpdaterequestBase:
+    """Auto-generated from schema: tickets.updaterequest"""
+
+    id: str
+    subject: str | None = None
+    description: str | None = None
+    ticket_status_id: str | None = None
+    customer: dict[str, Any] | None = None
+    assignee: dict[str, Any] | None = None
+    participant: dict[str, Any] | None = None
+    milestone_id: str | None = None
+    custom_fields: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            id=data['id'],
+            subject=data.get('subject'),
+            description=data.get('description'),
+            ticket_status_id=data.get('ticket_status_id'),
+            customer=data.get('customer'),
+            assignee=data.get('assignee'),
+            participant=data.get('participant'),
+            milestone_id=data.get('milestone_id'),
+            custom_fields=data.get('custom_fields') or [],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            'id': self.id,
+        }
+        if self.subject is not None:
+            out['subject'] = self.subject
+        if self.description is not None:
+            out['description'] = self.description
+        if self.ticket_status_id is not None:
+            out['ticket_status_id'] = self.ticket_status_id
+        if self.customer is not None:
+            out['customer'] = self.customer
+        if self.assignee is not None:
+            out['assignee'] = self.assignee
+        if self.participant is not None:
+            out['participant'] = self.participant
+        if self.milestone_id is not None:
+            out['milestone_id'] = self.milestone_id
+        if self.custom_fields:
+            out['custom_fields'] = self.custom_fields
+        return out
@@ -0,0 +1,138 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:50:37Z
+# ============================================================
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass
+class _TimersCurrentresponseBase:
+    """Auto-generated from schema: timers.currentresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TimersStartrequestBase:
+    """Auto-generated from schema: timers.startrequest"""
+
+    work_type_id: str | None = None
+    started_at: str | None = None
+    description: str | None = None
+    subject: dict[str, Any] | None = None
+    invoiceable: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            work_type_id=data.get('work_type_id'),
+            started_at=data.get('started_at'),
+            description=data.get('description'),
+            subject=data.get('subject'),
+            invoiceable=data.get('invoiceable'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.started_at is not None:
+            out['started_at'] = self.started_at
+        if self.description is not None:
+            out['description'] = self.description
+        if self.subject is not None:
+            out['subject'] = self.subject
+        if self.invoiceable is not None:
+            out['invoiceable'] = self.invoiceable
+        return out
+
+
+@dataclass
+class _TimersStartresponseBase:
+    """Auto-generated from schema: timers.startresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TimersStopresponseBase:
+    """Auto-generated from schema: timers.stopresponse"""
+
+    data: dict[str, Any] | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            data=data.get('data'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.data is not None:
+            out['data'] = self.data
+        return out
+
+
+@dataclass
+class _TimersUpdaterequestBase:
+    """Auto-generated from schema: timers.updaterequest"""
+
+    work_type_id: str | None = None
+    started_at: str | None = None
+    description: str | None = None
+    subject: dict[str, Any] | None = None
+    invoiceable: bool | None = None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            work_type_id=data.get('work_type_id'),
+            started_at=data.get('started_at'),
+            description=data.get('description'),
+            subject=data.get('subject'),
+            invoiceable=data.get('invoiceable'),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        if self.work_type_id is not None:
+            out['work_type_id'] = self.work_type_id
+        if self.started_at is not None:
+            out['started_at'] = self.started_at
+        if self.description is not None:
+            out['description'] = self.description
+        if self.subject is not None:
+            out['subject'] = self.subject
+        if self.invoiceable is not None:
+            out['invoiceable'] = self.invoiceable
+        return out
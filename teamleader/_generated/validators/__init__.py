@@ -0,0 +1,44 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+from teamleader._generated.endpoints import _OPERATION_MODULES
+
+Validator = Callable[[dict[str, Any], list[str]], None]
+
+_loaded: dict[str, Validator] = {}
+
+
+def get_validator(operation_id: str) -> Validator:
+    """Return the compiled request-body validator for *operation_id*.
+
+    The tag module holding it is imported on first use.  Raises ``KeyError``
+    for an unknown operation.
+    """
+    validator = _loaded.get(operation_id)
+    if validator is None:
+        tag_module = _OPERATION_MODULES[operation_id]
+        module = importlib.import_module(f"{__name__}.{tag_module}")
+        _loaded.update(module.VALIDATORS)
+        validator = _loaded[operation_id]
+    return validator
+
+
+def validate_request(operation_id: str, body: dict[str, Any]) -> list[str]:
+    """Check *body* against the spec's request schema for *operation_id*.
+
+    Returns a list of ``"path: problem"`` messages — empty when the body is
+    valid.
+    """
+    errors: list[str] = []
+    get_validator(operation_id)(body, errors)
+    return errors
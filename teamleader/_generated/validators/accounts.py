@@ -0,0 +1,24 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0: frozenset[Any] = frozenset()
+
+
+def _accounts_projects_v2_status(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+VALIDATORS = {
+    'accounts.projects-v2-status': _accounts_projects_v2_status,
+}
+# fmt: on
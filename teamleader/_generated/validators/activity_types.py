@@ -0,0 +1,68 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page'})
+_KEYS_1 = frozenset({'ids'})
+_KEYS_2 = frozenset({'number', 'size'})
+
+
+def _activitytypes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+    if 'page' in body:
+        v3 = body['page']
+        if v3 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_2, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v3:
+                v4 = v3['number']
+                if v4 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v3:
+                v5 = v3['size']
+                if v5 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+VALIDATORS = {
+    'activityTypes.list': _activitytypes_list,
+}
+# fmt: on
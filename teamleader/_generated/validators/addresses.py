@@ -0,0 +1,38 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'country', 'language'})
+
+
+def _leveltwoareas_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'country' not in body:
+        errors.append("country: required")
+    if 'country' in body:
+        v0 = body['country']
+        if v0 is None:
+            errors.append("country: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("country: expected string")
+    if 'language' in body:
+        v1 = body['language']
+        if v1 is None:
+            errors.append("language: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("language: expected string")
+
+
+VALIDATORS = {
+    'levelTwoAreas.list': _leveltwoareas_list,
+}
+# fmt: on
@@ -0,0 +1,61 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter'})
+_KEYS_1 = frozenset({'subject'})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'incoming_credit_note', 'incoming_invoice', 'receipt'})
+
+
+def _bookkeepingsubmissions_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'subject' not in v0:
+                errors.append("filter.subject: required")
+            if 'subject' in v0:
+                v1 = v0['subject']
+                if v1 is None:
+                    errors.append("filter.subject: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.subject: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_2, key=str):
+                        errors.append(f"filter.subject.{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append("filter.subject.id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.subject.id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.subject.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.subject.type: expected string")
+                        elif v3 not in _ENUM_3:
+                            errors.append(f"filter.subject.type: must be one of {sorted(_ENUM_3)}")
+
+
+VALIDATORS = {
+    'bookkeepingSubmissions.list': _bookkeepingsubmissions_list,
+}
+# fmt: on
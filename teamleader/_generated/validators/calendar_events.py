@@ -0,0 +1,502 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({
+    'activity_type_id',
+    'attendees',
+    'description',
+    'ends_at',
+    'links',
+    'location',
+    'starts_at',
+    'title',
+    'work_type_id',
+})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'contact', 'user'})
+_ENUM_4 = frozenset({'company', 'contact', 'deal'})
+_KEYS_5 = frozenset({'filter', 'page', 'sort'})
+_KEYS_6 = frozenset({
+    'activity_type_id',
+    'attendee',
+    'done',
+    'ends_after',
+    'ids',
+    'link',
+    'starts_before',
+    'task_id',
+    'term',
+    'user_id',
+})
+_ENUM_7 = frozenset({'contact'})
+_KEYS_8 = frozenset({'number', 'size'})
+_KEYS_9 = frozenset({'field', 'order'})
+_ENUM_10 = frozenset({'starts_at'})
+_ENUM_11 = frozenset({'asc', 'desc'})
+_KEYS_12 = frozenset({
+    'attendees',
+    'description',
+    'ends_at',
+    'id',
+    'links',
+    'location',
+    'starts_at',
+    'title',
+    'work_type_id',
+})
+
+
+def _events_cancel(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _events_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'activity_type_id' not in body:
+        errors.append("activity_type_id: required")
+    if 'ends_at' not in body:
+        errors.append("ends_at: required")
+    if 'starts_at' not in body:
+        errors.append("starts_at: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'activity_type_id' in body:
+        v0 = body['activity_type_id']
+        if v0 is None:
+            errors.append("activity_type_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("activity_type_id: expected string")
+    if 'attendees' in body:
+        v1 = body['attendees']
+        if v1 is None:
+            errors.append("attendees: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("attendees: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"attendees[{i2}]: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append(f"attendees[{i2}]: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_2, key=str):
+                        errors.append(f"attendees[{i2}].{key}: unknown field")
+                    if 'id' not in v2:
+                        errors.append(f"attendees[{i2}].id: required")
+                    if 'type' not in v2:
+                        errors.append(f"attendees[{i2}].type: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append(f"attendees[{i2}].id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"attendees[{i2}].id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append(f"attendees[{i2}].type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"attendees[{i2}].type: expected string")
+                        elif v4 not in _ENUM_3:
+                            errors.append(f"attendees[{i2}].type: must be one of {sorted(_ENUM_3)}")
+    if 'description' in body:
+        v5 = body['description']
+        if v5 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("description: expected string")
+    if 'ends_at' in body:
+        v6 = body['ends_at']
+        if v6 is None:
+            errors.append("ends_at: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("ends_at: expected string")
+    if 'links' in body:
+        v7 = body['links']
+        if v7 is None:
+            errors.append("links: must not be null")
+        elif not isinstance(v7, (list, tuple)):
+            errors.append("links: expected array")
+        else:
+            for i8, v8 in enumerate(v7):
+                if v8 is None:
+                    errors.append(f"links[{i8}]: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append(f"links[{i8}]: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_2, key=str):
+                        errors.append(f"links[{i8}].{key}: unknown field")
+                    if 'id' not in v8:
+                        errors.append(f"links[{i8}].id: required")
+                    if 'type' not in v8:
+                        errors.append(f"links[{i8}].type: required")
+                    if 'id' in v8:
+                        v9 = v8['id']
+                        if v9 is None:
+                            errors.append(f"links[{i8}].id: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"links[{i8}].id: expected string")
+                    if 'type' in v8:
+                        v10 = v8['type']
+                        if v10 is None:
+                            errors.append(f"links[{i8}].type: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"links[{i8}].type: expected string")
+                        elif v10 not in _ENUM_4:
+                            errors.append(f"links[{i8}].type: must be one of {sorted(_ENUM_4)}")
+    if 'location' in body:
+        v11 = body['location']
+        if v11 is None:
+            errors.append("location: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("location: expected string")
+    if 'starts_at' in body:
+        v12 = body['starts_at']
+        if v12 is None:
+            errors.append("starts_at: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("starts_at: expected string")
+    if 'title' in body:
+        v13 = body['title']
+        if v13 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v14 = body['work_type_id']
+        if v14 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("work_type_id: expected string")
+
+
+def _events_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _events_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_6, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'activity_type_id' in v0:
+                v1 = v0['activity_type_id']
+                if v1 is None:
+                    errors.append("filter.activity_type_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.activity_type_id: expected string")
+            if 'attendee' in v0:
+                v2 = v0['attendee']
+                if v2 is None:
+                    errors.append("filter.attendee: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append("filter.attendee: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_2, key=str):
+                        errors.append(f"filter.attendee.{key}: unknown field")
+                    if 'type' not in v2:
+                        errors.append("filter.attendee.type: required")
+                    if 'id' not in v2:
+                        errors.append("filter.attendee.id: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append("filter.attendee.id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.attendee.id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append("filter.attendee.type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append("filter.attendee.type: expected string")
+                        elif v4 not in _ENUM_7:
+                            errors.append(f"filter.attendee.type: must be one of {sorted(_ENUM_7)}")
+            if 'done' in v0:
+                v5 = v0['done']
+                if v5 is None:
+                    errors.append("filter.done: must not be null")
+                elif not isinstance(v5, bool):
+                    errors.append("filter.done: expected boolean")
+            if 'ends_after' in v0:
+                v6 = v0['ends_after']
+                if v6 is None:
+                    errors.append("filter.ends_after: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.ends_after: expected string")
+            if 'ids' in v0:
+                v7 = v0['ids']
+                if v7 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v7, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i8, v8 in enumerate(v7):
+                        if v8 is None:
+                            errors.append(f"filter.ids[{i8}]: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"filter.ids[{i8}]: expected string")
+            if 'link' in v0:
+                v9 = v0['link']
+                if v9 is None:
+                    errors.append("filter.link: must not be null")
+                elif not isinstance(v9, dict):
+                    errors.append("filter.link: expected object")
+                else:
+                    for key in sorted(v9.keys() - _KEYS_2, key=str):
+                        errors.append(f"filter.link.{key}: unknown field")
+                    if 'id' not in v9:
+                        errors.append("filter.link.id: required")
+                    if 'type' not in v9:
+                        errors.append("filter.link.type: required")
+                    if 'id' in v9:
+                        v10 = v9['id']
+                        if v10 is None:
+                            errors.append("filter.link.id: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append("filter.link.id: expected string")
+                    if 'type' in v9:
+                        v11 = v9['type']
+                        if v11 is None:
+                            errors.append("filter.link.type: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append("filter.link.type: expected string")
+                        elif v11 not in _ENUM_4:
+                            errors.append(f"filter.link.type: must be one of {sorted(_ENUM_4)}")
+            if 'starts_before' in v0:
+                v12 = v0['starts_before']
+                if v12 is None:
+                    errors.append("filter.starts_before: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("filter.starts_before: expected string")
+            if 'task_id' in v0:
+                v13 = v0['task_id']
+                if v13 is None:
+                    errors.append("filter.task_id: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("filter.task_id: expected string")
+            if 'term' in v0:
+                v14 = v0['term']
+                if v14 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v14, str):
+                    errors.append("filter.term: expected string")
+            if 'user_id' in v0:
+                v15 = v0['user_id']
+                if v15 is None:
+                    errors.append("filter.user_id: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("filter.user_id: expected string")
+    if 'page' in body:
+        v16 = body['page']
+        if v16 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v16, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v16.keys() - _KEYS_8, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v16:
+                v17 = v16['number']
+                if v17 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v16:
+                v18 = v16['size']
+                if v18 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v18, bool) or not isinstance(v18, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v19 = body['sort']
+        if v19 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v19, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i20, v20 in enumerate(v19):
+                if v20 is None:
+                    errors.append(f"sort[{i20}]: must not be null")
+                elif not isinstance(v20, dict):
+                    errors.append(f"sort[{i20}]: expected object")
+                else:
+                    for key in sorted(v20.keys() - _KEYS_9, key=str):
+                        errors.append(f"sort[{i20}].{key}: unknown field")
+                    if 'field' not in v20:
+                        errors.append(f"sort[{i20}].field: required")
+                    if 'field' in v20:
+                        v21 = v20['field']
+                        if v21 is None:
+                            errors.append(f"sort[{i20}].field: must not be null")
+                        elif not isinstance(v21, str):
+                            errors.append(f"sort[{i20}].field: expected string")
+                        elif v21 not in _ENUM_10:
+                            errors.append(f"sort[{i20}].field: must be one of {sorted(_ENUM_10)}")
+                    if 'order' in v20:
+                        v22 = v20['order']
+                        if v22 is None:
+                            errors.append(f"sort[{i20}].order: must not be null")
+                        elif not isinstance(v22, str) or v22 not in _ENUM_11:
+                            errors.append(f"sort[{i20}].order: must be one of {sorted(_ENUM_11)}")
+
+
+def _events_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attendees' in body:
+        v0 = body['attendees']
+        if v0 is None:
+            errors.append("attendees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attendees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attendees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"attendees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_2, key=str):
+                        errors.append(f"attendees[{i1}].{key}: unknown field")
+                    if 'id' not in v1:
+                        errors.append(f"attendees[{i1}].id: required")
+                    if 'type' not in v1:
+                        errors.append(f"attendees[{i1}].type: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"attendees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"attendees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"attendees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"attendees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_3:
+                            errors.append(f"attendees[{i1}].type: must be one of {sorted(_ENUM_3)}")
+    if 'description' in body:
+        v4 = body['description']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("description: expected string")
+    if 'ends_at' in body:
+        v5 = body['ends_at']
+        if v5 is None:
+            errors.append("ends_at: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("ends_at: expected string")
+    if 'id' in body:
+        v6 = body['id']
+        if v6 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("id: expected string")
+    if 'links' in body:
+        v7 = body['links']
+        if v7 is None:
+            errors.append("links: must not be null")
+        elif not isinstance(v7, (list, tuple)):
+            errors.append("links: expected array")
+        else:
+            for i8, v8 in enumerate(v7):
+                if v8 is None:
+                    errors.append(f"links[{i8}]: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append(f"links[{i8}]: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_2, key=str):
+                        errors.append(f"links[{i8}].{key}: unknown field")
+                    if 'id' not in v8:
+                        errors.append(f"links[{i8}].id: required")
+                    if 'type' not in v8:
+                        errors.append(f"links[{i8}].type: required")
+                    if 'id' in v8:
+                        v9 = v8['id']
+                        if v9 is None:
+                            errors.append(f"links[{i8}].id: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"links[{i8}].id: expected string")
+                    if 'type' in v8:
+                        v10 = v8['type']
+                        if v10 is None:
+                            errors.append(f"links[{i8}].type: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"links[{i8}].type: expected string")
+                        elif v10 not in _ENUM_4:
+                            errors.append(f"links[{i8}].type: must be one of {sorted(_ENUM_4)}")
+    if 'location' in body:
+        v11 = body['location']
+        if v11 is None:
+            errors.append("location: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("location: expected string")
+    if 'starts_at' in body:
+        v12 = body['starts_at']
+        if v12 is None:
+            errors.append("starts_at: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("starts_at: expected string")
+    if 'title' in body:
+        v13 = body['title']
+        if v13 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v14 = body['work_type_id']
+        if v14 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("work_type_id: expected string")
+
+
+VALIDATORS = {
+    'events.cancel': _events_cancel,
+    'events.create': _events_create,
+    'events.info': _events_info,
+    'events.list': _events_list,
+    'events.update': _events_update,
+}
+# fmt: on
@@ -0,0 +1,46 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'page'})
+_KEYS_1 = frozenset({'number', 'size'})
+
+
+def _calloutcomes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'page' in body:
+        v0 = body['page']
+        if v0 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v0:
+                v1 = v0['number']
+                if v1 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v0:
+                v2 = v0['size']
+                if v2 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+VALIDATORS = {
+    'callOutcomes.list': _calloutcomes_list,
+}
+# fmt: on
@@ -0,0 +1,469 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'assignee',
+    'custom_fields',
+    'deal_id',
+    'description',
+    'due_at',
+    'participant',
+})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'user'})
+_KEYS_3 = frozenset({'id', 'value'})
+_ENUM_4 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_5 = frozenset({'customer'})
+_ENUM_6 = frozenset({'company', 'contact'})
+_KEYS_7 = frozenset({'call_outcome_id', 'id', 'outcome_summary'})
+_KEYS_8 = frozenset({'id'})
+_KEYS_9 = frozenset({'filter', 'page'})
+_KEYS_10 = frozenset({
+    'call_outcome_id',
+    'relates_to',
+    'scheduled_after',
+    'scheduled_before',
+})
+_KEYS_11 = frozenset({'number', 'size'})
+_KEYS_12 = frozenset({
+    'assignee',
+    'custom_fields',
+    'deal_id',
+    'description',
+    'due_at',
+    'id',
+    'participant',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_1, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_4:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_4)}")
+
+
+def _calls_add(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'due_at' not in body:
+        errors.append("due_at: required")
+    if 'participant' not in body:
+        errors.append("participant: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_3, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'deal_id' in body:
+        v8 = body['deal_id']
+        if v8 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v9 = body['description']
+        if v9 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("description: expected string")
+    if 'due_at' in body:
+        v10 = body['due_at']
+        if v10 is None:
+            errors.append("due_at: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("due_at: expected string")
+    if 'participant' in body:
+        v11 = body['participant']
+        if v11 is None:
+            errors.append("participant: must not be null")
+        elif not isinstance(v11, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_5, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'customer' not in v11:
+                errors.append("participant.customer: required")
+            if 'customer' in v11:
+                v12 = v11['customer']
+                if v12 is None:
+                    errors.append("participant.customer: must not be null")
+                elif not isinstance(v12, dict):
+                    errors.append("participant.customer: expected object")
+                else:
+                    for key in sorted(v12.keys() - _KEYS_1, key=str):
+                        errors.append(f"participant.customer.{key}: unknown field")
+                    if 'type' not in v12:
+                        errors.append("participant.customer.type: required")
+                    if 'id' not in v12:
+                        errors.append("participant.customer.id: required")
+                    if 'id' in v12:
+                        v13 = v12['id']
+                        if v13 is None:
+                            errors.append("participant.customer.id: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append("participant.customer.id: expected string")
+                    if 'type' in v12:
+                        v14 = v12['type']
+                        if v14 is None:
+                            errors.append("participant.customer.type: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append("participant.customer.type: expected string")
+                        elif v14 not in _ENUM_6:
+                            errors.append(f"participant.customer.type: must be one of {sorted(_ENUM_6)}")
+
+
+def _calls_complete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'call_outcome_id' in body:
+        v0 = body['call_outcome_id']
+        if v0 is None:
+            errors.append("call_outcome_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("call_outcome_id: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+    if 'outcome_summary' in body:
+        v2 = body['outcome_summary']
+        if v2 is None:
+            errors.append("outcome_summary: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("outcome_summary: expected string")
+
+
+def _calls_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _calls_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_10, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'call_outcome_id' in v0:
+                v1 = v0['call_outcome_id']
+                if v1 is None:
+                    errors.append("filter.call_outcome_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.call_outcome_id: expected string")
+            if 'relates_to' in v0:
+                v2 = v0['relates_to']
+                if v2 is None:
+                    errors.append("filter.relates_to: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append("filter.relates_to: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_1, key=str):
+                        errors.append(f"filter.relates_to.{key}: unknown field")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append("filter.relates_to.id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.relates_to.id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append("filter.relates_to.type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append("filter.relates_to.type: expected string")
+            if 'scheduled_after' in v0:
+                v5 = v0['scheduled_after']
+                if v5 is None:
+                    errors.append("filter.scheduled_after: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.scheduled_after: expected string")
+            if 'scheduled_before' in v0:
+                v6 = v0['scheduled_before']
+                if v6 is None:
+                    errors.append("filter.scheduled_before: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.scheduled_before: expected string")
+    if 'page' in body:
+        v7 = body['page']
+        if v7 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v7, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v7.keys() - _KEYS_11, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v7:
+                v8 = v7['number']
+                if v8 is None:
+                    errors.append("page.number: must not be null")
+            if 'size' in v7:
+                v9 = v7['size']
+                if v9 is None:
+                    errors.append("page.size: must not be null")
+
+
+def _calls_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_3, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'deal_id' in body:
+        v8 = body['deal_id']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v9 = body['description']
+        if v9 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("description: expected string")
+    if 'due_at' in body:
+        v10 = body['due_at']
+        if v10 is None:
+            errors.append("due_at: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("due_at: expected string")
+    if 'id' in body:
+        v11 = body['id']
+        if v11 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("id: expected string")
+    if 'participant' in body:
+        v12 = body['participant']
+        if v12 is None:
+            errors.append("participant: must not be null")
+        elif not isinstance(v12, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v12.keys() - _KEYS_5, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'customer' in v12:
+                v13 = v12['customer']
+                if v13 is None:
+                    errors.append("participant.customer: must not be null")
+                elif not isinstance(v13, dict):
+                    errors.append("participant.customer: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_1, key=str):
+                        errors.append(f"participant.customer.{key}: unknown field")
+                    if 'type' not in v13:
+                        errors.append("participant.customer.type: required")
+                    if 'id' not in v13:
+                        errors.append("participant.customer.id: required")
+                    if 'id' in v13:
+                        v14 = v13['id']
+                        if v14 is None:
+                            errors.append("participant.customer.id: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append("participant.customer.id: expected string")
+                    if 'type' in v13:
+                        v15 = v13['type']
+                        if v15 is None:
+                            errors.append("participant.customer.type: must not be null")
+                        elif not isinstance(v15, str):
+                            errors.append("participant.customer.type: expected string")
+                        elif v15 not in _ENUM_6:
+                            errors.append(f"participant.customer.type: must be one of {sorted(_ENUM_6)}")
+
+
+VALIDATORS = {
+    'calls.add': _calls_add,
+    'calls.complete': _calls_complete,
+    'calls.info': _calls_info,
+    'calls.list': _calls_list,
+    'calls.update': _calls_update,
+}
+# fmt: on
@@ -0,0 +1,43 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id', 'type'})
+_ENUM_1 = frozenset({'invoice', 'quotation', 'ticket'})
+
+
+def _cloudplatforms_url(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'type' not in body:
+        errors.append("type: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'type' in body:
+        v1 = body['type']
+        if v1 is None:
+            errors.append("type: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("type: expected string")
+        elif v1 not in _ENUM_1:
+            errors.append(f"type: must be one of {sorted(_ENUM_1)}")
+
+
+VALIDATORS = {
+    'cloudPlatforms.url': _cloudplatforms_url,
+}
+# fmt: on
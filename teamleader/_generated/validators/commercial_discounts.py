@@ -0,0 +1,40 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter'})
+_KEYS_1 = frozenset({'department_id'})
+
+
+def _commercialdiscounts_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'department_id' in v0:
+                v1 = v0['department_id']
+                if v1 is None:
+                    errors.append("filter.department_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.department_id: expected string")
+
+
+VALIDATORS = {
+    'commercialDiscounts.list': _commercialdiscounts_list,
+}
+# fmt: on
@@ -0,0 +1,1000 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'addresses',
+    'bic',
+    'business_type_id',
+    'custom_fields',
+    'emails',
+    'iban',
+    'language',
+    'marketing_mails_consent',
+    'name',
+    'national_identification_number',
+    'preferred_currency',
+    'remarks',
+    'responsible_user_id',
+    'tags',
+    'telephones',
+    'vat_number',
+    'website',
+})
+_KEYS_1 = frozenset({'address', 'type'})
+_KEYS_2 = frozenset({
+    'addressee',
+    'area_level_two_id',
+    'city',
+    'country',
+    'line_1',
+    'postal_code',
+})
+_ENUM_3 = frozenset({'delivery', 'invoicing', 'primary', 'visiting'})
+_KEYS_4 = frozenset({'id', 'value'})
+_KEYS_5 = frozenset({'id', 'type'})
+_ENUM_6 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_7 = frozenset({'email', 'type'})
+_ENUM_8 = frozenset({'invoicing', 'primary'})
+_ENUM_9 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_10 = frozenset({'number', 'type'})
+_ENUM_11 = frozenset({'fax', 'phone'})
+_KEYS_12 = frozenset({'id'})
+_KEYS_13 = frozenset({'id', 'includes'})
+_KEYS_14 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_15 = frozenset({
+    'email',
+    'ids',
+    'marketing_mails_consent',
+    'national_identification_number',
+    'status',
+    'tags',
+    'term',
+    'updated_since',
+    'vat_number',
+})
+_ENUM_16 = frozenset({'primary'})
+_ENUM_17 = frozenset({'active', 'deactivated'})
+_KEYS_18 = frozenset({'number', 'size'})
+_KEYS_19 = frozenset({'field', 'order'})
+_ENUM_20 = frozenset({'added_at', 'name', 'updated_at'})
+_ENUM_21 = frozenset({'asc', 'desc'})
+_KEYS_22 = frozenset({'id', 'tags'})
+_KEYS_23 = frozenset({
+    'addresses',
+    'bic',
+    'business_type_id',
+    'custom_fields',
+    'emails',
+    'iban',
+    'id',
+    'language',
+    'marketing_mails_consent',
+    'name',
+    'national_identification_number',
+    'preferred_currency',
+    'remarks',
+    'responsible_user_id',
+    'tags',
+    'telephones',
+    'vat_number',
+    'website',
+})
+_KEYS_24 = frozenset({'id', 'image'})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_5, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_6:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_6)}")
+
+
+def _companies_add(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'addresses' in body:
+        v0 = body['addresses']
+        if v0 is None:
+            errors.append("addresses: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("addresses: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"addresses[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"addresses[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"addresses[{i1}].{key}: unknown field")
+                    if 'address' not in v1:
+                        errors.append(f"addresses[{i1}].address: required")
+                    if 'type' not in v1:
+                        errors.append(f"addresses[{i1}].type: required")
+                    if 'address' in v1:
+                        v2 = v1['address']
+                        if v2 is None:
+                            errors.append(f"addresses[{i1}].address: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"addresses[{i1}].address: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_2, key=str):
+                                errors.append(f"addresses[{i1}].address.{key}: unknown field")
+                            if 'city' not in v2:
+                                errors.append(f"addresses[{i1}].address.city: required")
+                            if 'country' not in v2:
+                                errors.append(f"addresses[{i1}].address.country: required")
+                            if 'line_1' not in v2:
+                                errors.append(f"addresses[{i1}].address.line_1: required")
+                            if 'postal_code' not in v2:
+                                errors.append(f"addresses[{i1}].address.postal_code: required")
+                            if 'addressee' in v2:
+                                v3 = v2['addressee']
+                                if v3 is None:
+                                    errors.append(f"addresses[{i1}].address.addressee: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"addresses[{i1}].address.addressee: expected string")
+                            if 'area_level_two_id' in v2:
+                                v4 = v2['area_level_two_id']
+                                if v4 is None:
+                                    errors.append(f"addresses[{i1}].address.area_level_two_id: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"addresses[{i1}].address.area_level_two_id: expected string")
+                            if 'city' in v2:
+                                v5 = v2['city']
+                                if v5 is None:
+                                    pass
+                                elif not isinstance(v5, str):
+                                    errors.append(f"addresses[{i1}].address.city: expected string")
+                            if 'country' in v2:
+                                v6 = v2['country']
+                                if v6 is None:
+                                    errors.append(f"addresses[{i1}].address.country: must not be null")
+                                elif not isinstance(v6, str):
+                                    errors.append(f"addresses[{i1}].address.country: expected string")
+                            if 'line_1' in v2:
+                                v7 = v2['line_1']
+                                if v7 is None:
+                                    pass
+                                elif not isinstance(v7, str):
+                                    errors.append(f"addresses[{i1}].address.line_1: expected string")
+                            if 'postal_code' in v2:
+                                v8 = v2['postal_code']
+                                if v8 is None:
+                                    pass
+                                elif not isinstance(v8, str):
+                                    errors.append(f"addresses[{i1}].address.postal_code: expected string")
+                    if 'type' in v1:
+                        v9 = v1['type']
+                        if v9 is None:
+                            errors.append(f"addresses[{i1}].type: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"addresses[{i1}].type: expected string")
+                        elif v9 not in _ENUM_3:
+                            errors.append(f"addresses[{i1}].type: must be one of {sorted(_ENUM_3)}")
+    if 'bic' in body:
+        v10 = body['bic']
+        if v10 is None:
+            errors.append("bic: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("bic: expected string")
+    if 'business_type_id' in body:
+        v11 = body['business_type_id']
+        if v11 is None:
+            errors.append("business_type_id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("business_type_id: expected string")
+    if 'custom_fields' in body:
+        v12 = body['custom_fields']
+        if v12 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v12, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i13, v13 in enumerate(v12):
+                if v13 is None:
+                    errors.append(f"custom_fields[{i13}]: must not be null")
+                elif not isinstance(v13, dict):
+                    errors.append(f"custom_fields[{i13}]: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i13}].{key}: unknown field")
+                    if 'id' in v13:
+                        v14 = v13['id']
+                        if v14 is None:
+                            errors.append(f"custom_fields[{i13}].id: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append(f"custom_fields[{i13}].id: expected string")
+                    if 'value' in v13:
+                        v15 = v13['value']
+                        for check16 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors16: list[str] = []
+                            check16(v15, f"custom_fields[{i13}].value", branch_errors16)
+                            if not branch_errors16:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i13}].value: does not match any allowed shape")
+    if 'emails' in body:
+        v17 = body['emails']
+        if v17 is None:
+            errors.append("emails: must not be null")
+        elif not isinstance(v17, (list, tuple)):
+            errors.append("emails: expected array")
+        else:
+            for i18, v18 in enumerate(v17):
+                if v18 is None:
+                    errors.append(f"emails[{i18}]: must not be null")
+                elif not isinstance(v18, dict):
+                    errors.append(f"emails[{i18}]: expected object")
+                else:
+                    for key in sorted(v18.keys() - _KEYS_7, key=str):
+                        errors.append(f"emails[{i18}].{key}: unknown field")
+                    if 'email' not in v18:
+                        errors.append(f"emails[{i18}].email: required")
+                    if 'type' not in v18:
+                        errors.append(f"emails[{i18}].type: required")
+                    if 'email' in v18:
+                        v19 = v18['email']
+                        if v19 is None:
+                            errors.append(f"emails[{i18}].email: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append(f"emails[{i18}].email: expected string")
+                    if 'type' in v18:
+                        v20 = v18['type']
+                        if v20 is None:
+                            errors.append(f"emails[{i18}].type: must not be null")
+                        elif not isinstance(v20, str):
+                            errors.append(f"emails[{i18}].type: expected string")
+                        elif v20 not in _ENUM_8:
+                            errors.append(f"emails[{i18}].type: must be one of {sorted(_ENUM_8)}")
+    if 'iban' in body:
+        v21 = body['iban']
+        if v21 is None:
+            errors.append("iban: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("iban: expected string")
+    if 'language' in body:
+        v22 = body['language']
+        if v22 is None:
+            errors.append("language: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("language: expected string")
+    if 'marketing_mails_consent' in body:
+        v23 = body['marketing_mails_consent']
+        if v23 is None:
+            errors.append("marketing_mails_consent: must not be null")
+        elif not isinstance(v23, bool):
+            errors.append("marketing_mails_consent: expected boolean")
+    if 'name' in body:
+        v24 = body['name']
+        if v24 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v24, str):
+            errors.append("name: expected string")
+    if 'national_identification_number' in body:
+        v25 = body['national_identification_number']
+        if v25 is None:
+            errors.append("national_identification_number: must not be null")
+        elif not isinstance(v25, str):
+            errors.append("national_identification_number: expected string")
+    if 'preferred_currency' in body:
+        v26 = body['preferred_currency']
+        if v26 is None:
+            errors.append("preferred_currency: must not be null")
+        elif not isinstance(v26, str):
+            errors.append("preferred_currency: expected string")
+        elif v26 not in _ENUM_9:
+            errors.append(f"preferred_currency: must be one of {sorted(_ENUM_9)}")
+    if 'remarks' in body:
+        v27 = body['remarks']
+        if v27 is None:
+            errors.append("remarks: must not be null")
+        elif not isinstance(v27, str):
+            errors.append("remarks: expected string")
+    if 'responsible_user_id' in body:
+        v28 = body['responsible_user_id']
+        if v28 is None:
+            errors.append("responsible_user_id: must not be null")
+        elif not isinstance(v28, str):
+            errors.append("responsible_user_id: expected string")
+    if 'tags' in body:
+        v29 = body['tags']
+        if v29 is None:
+            errors.append("tags: must not be null")
+        elif not isinstance(v29, (list, tuple)):
+            errors.append("tags: expected array")
+        else:
+            for i30, v30 in enumerate(v29):
+                if v30 is None:
+                    errors.append(f"tags[{i30}]: must not be null")
+                elif not isinstance(v30, str):
+                    errors.append(f"tags[{i30}]: expected string")
+    if 'telephones' in body:
+        v31 = body['telephones']
+        if v31 is None:
+            errors.append("telephones: must not be null")
+        elif not isinstance(v31, (list, tuple)):
+            errors.append("telephones: expected array")
+        else:
+            for i32, v32 in enumerate(v31):
+                if v32 is None:
+                    errors.append(f"telephones[{i32}]: must not be null")
+                elif not isinstance(v32, dict):
+                    errors.append(f"telephones[{i32}]: expected object")
+                else:
+                    for key in sorted(v32.keys() - _KEYS_10, key=str):
+                        errors.append(f"telephones[{i32}].{key}: unknown field")
+                    if 'type' not in v32:
+                        errors.append(f"telephones[{i32}].type: required")
+                    if 'number' not in v32:
+                        errors.append(f"telephones[{i32}].number: required")
+                    if 'number' in v32:
+                        v33 = v32['number']
+                        if v33 is None:
+                            errors.append(f"telephones[{i32}].number: must not be null")
+                        elif not isinstance(v33, str):
+                            errors.append(f"telephones[{i32}].number: expected string")
+                    if 'type' in v32:
+                        v34 = v32['type']
+                        if v34 is None:
+                            errors.append(f"telephones[{i32}].type: must not be null")
+                        elif not isinstance(v34, str):
+                            errors.append(f"telephones[{i32}].type: expected string")
+                        elif v34 not in _ENUM_11:
+                            errors.append(f"telephones[{i32}].type: must be one of {sorted(_ENUM_11)}")
+    if 'vat_number' in body:
+        v35 = body['vat_number']
+        if v35 is None:
+            errors.append("vat_number: must not be null")
+        elif not isinstance(v35, str):
+            errors.append("vat_number: expected string")
+    if 'website' in body:
+        v36 = body['website']
+        if v36 is None:
+            errors.append("website: must not be null")
+        elif not isinstance(v36, str):
+            errors.append("website: expected string")
+
+
+def _companies_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _companies_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_13, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _companies_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_14, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_15, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'email' in v0:
+                v1 = v0['email']
+                if v1 is None:
+                    errors.append("filter.email: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.email: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_7, key=str):
+                        errors.append(f"filter.email.{key}: unknown field")
+                    if 'email' not in v1:
+                        errors.append("filter.email.email: required")
+                    if 'type' not in v1:
+                        errors.append("filter.email.type: required")
+                    if 'email' in v1:
+                        v2 = v1['email']
+                        if v2 is None:
+                            errors.append("filter.email.email: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.email.email: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.email.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.email.type: expected string")
+                        elif v3 not in _ENUM_16:
+                            errors.append(f"filter.email.type: must be one of {sorted(_ENUM_16)}")
+            if 'ids' in v0:
+                v4 = v0['ids']
+                if v4 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v4, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i5, v5 in enumerate(v4):
+                        if v5 is None:
+                            errors.append(f"filter.ids[{i5}]: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"filter.ids[{i5}]: expected string")
+            if 'marketing_mails_consent' in v0:
+                v6 = v0['marketing_mails_consent']
+                if v6 is None:
+                    errors.append("filter.marketing_mails_consent: must not be null")
+                elif not isinstance(v6, bool):
+                    errors.append("filter.marketing_mails_consent: expected boolean")
+            if 'national_identification_number' in v0:
+                v7 = v0['national_identification_number']
+                if v7 is None:
+                    errors.append("filter.national_identification_number: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.national_identification_number: expected string")
+            if 'status' in v0:
+                v8 = v0['status']
+                if v8 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("filter.status: expected string")
+                elif v8 not in _ENUM_17:
+                    errors.append(f"filter.status: must be one of {sorted(_ENUM_17)}")
+            if 'tags' in v0:
+                v9 = v0['tags']
+                if v9 is None:
+                    errors.append("filter.tags: must not be null")
+                elif not isinstance(v9, (list, tuple)):
+                    errors.append("filter.tags: expected array")
+                else:
+                    for i10, v10 in enumerate(v9):
+                        if v10 is None:
+                            errors.append(f"filter.tags[{i10}]: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"filter.tags[{i10}]: expected string")
+            if 'term' in v0:
+                v11 = v0['term']
+                if v11 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("filter.term: expected string")
+            if 'updated_since' in v0:
+                v12 = v0['updated_since']
+                if v12 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("filter.updated_since: expected string")
+            if 'vat_number' in v0:
+                v13 = v0['vat_number']
+                if v13 is None:
+                    errors.append("filter.vat_number: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("filter.vat_number: expected string")
+    if 'includes' in body:
+        v14 = body['includes']
+        if v14 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v15 = body['page']
+        if v15 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v15, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v15.keys() - _KEYS_18, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v15:
+                v16 = v15['number']
+                if v16 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v15:
+                v17 = v15['size']
+                if v17 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v18 = body['sort']
+        if v18 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v18, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i19, v19 in enumerate(v18):
+                if v19 is None:
+                    errors.append(f"sort[{i19}]: must not be null")
+                elif not isinstance(v19, dict):
+                    errors.append(f"sort[{i19}]: expected object")
+                else:
+                    for key in sorted(v19.keys() - _KEYS_19, key=str):
+                        errors.append(f"sort[{i19}].{key}: unknown field")
+                    if 'field' not in v19:
+                        errors.append(f"sort[{i19}].field: required")
+                    if 'field' in v19:
+                        v20 = v19['field']
+                        if v20 is None:
+                            errors.append(f"sort[{i19}].field: must not be null")
+                        elif not isinstance(v20, str):
+                            errors.append(f"sort[{i19}].field: expected string")
+                        elif v20 not in _ENUM_20:
+                            errors.append(f"sort[{i19}].field: must be one of {sorted(_ENUM_20)}")
+                    if 'order' in v19:
+                        v21 = v19['order']
+                        if v21 is None:
+                            errors.append(f"sort[{i19}].order: must not be null")
+                        elif not isinstance(v21, str):
+                            errors.append(f"sort[{i19}].order: expected string")
+                        elif v21 not in _ENUM_21:
+                            errors.append(f"sort[{i19}].order: must be one of {sorted(_ENUM_21)}")
+
+
+def _companies_tag(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_22, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'tags' not in body:
+        errors.append("tags: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'tags' in body:
+        v1 = body['tags']
+        if v1 is None:
+            errors.append("tags: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("tags: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"tags[{i2}]: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append(f"tags[{i2}]: expected string")
+
+
+def _companies_untag(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_22, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'tags' not in body:
+        errors.append("tags: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'tags' in body:
+        v1 = body['tags']
+        if v1 is None:
+            errors.append("tags: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("tags: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"tags[{i2}]: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append(f"tags[{i2}]: expected string")
+
+
+def _companies_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_23, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'addresses' in body:
+        v0 = body['addresses']
+        if v0 is None:
+            errors.append("addresses: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("addresses: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"addresses[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"addresses[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"addresses[{i1}].{key}: unknown field")
+                    if 'address' not in v1:
+                        errors.append(f"addresses[{i1}].address: required")
+                    if 'type' not in v1:
+                        errors.append(f"addresses[{i1}].type: required")
+                    if 'address' in v1:
+                        v2 = v1['address']
+                        if v2 is None:
+                            errors.append(f"addresses[{i1}].address: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"addresses[{i1}].address: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_2, key=str):
+                                errors.append(f"addresses[{i1}].address.{key}: unknown field")
+                            if 'city' not in v2:
+                                errors.append(f"addresses[{i1}].address.city: required")
+                            if 'country' not in v2:
+                                errors.append(f"addresses[{i1}].address.country: required")
+                            if 'line_1' not in v2:
+                                errors.append(f"addresses[{i1}].address.line_1: required")
+                            if 'postal_code' not in v2:
+                                errors.append(f"addresses[{i1}].address.postal_code: required")
+                            if 'addressee' in v2:
+                                v3 = v2['addressee']
+                                if v3 is None:
+                                    errors.append(f"addresses[{i1}].address.addressee: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"addresses[{i1}].address.addressee: expected string")
+                            if 'area_level_two_id' in v2:
+                                v4 = v2['area_level_two_id']
+                                if v4 is None:
+                                    errors.append(f"addresses[{i1}].address.area_level_two_id: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"addresses[{i1}].address.area_level_two_id: expected string")
+                            if 'city' in v2:
+                                v5 = v2['city']
+                                if v5 is None:
+                                    pass
+                                elif not isinstance(v5, str):
+                                    errors.append(f"addresses[{i1}].address.city: expected string")
+                            if 'country' in v2:
+                                v6 = v2['country']
+                                if v6 is None:
+                                    errors.append(f"addresses[{i1}].address.country: must not be null")
+                                elif not isinstance(v6, str):
+                                    errors.append(f"addresses[{i1}].address.country: expected string")
+                            if 'line_1' in v2:
+                                v7 = v2['line_1']
+                                if v7 is None:
+                                    pass
+                                elif not isinstance(v7, str):
+                                    errors.append(f"addresses[{i1}].address.line_1: expected string")
+                            if 'postal_code' in v2:
+                                v8 = v2['postal_code']
+                                if v8 is None:
+                                    pass
+                                elif not isinstance(v8, str):
+                                    errors.append(f"addresses[{i1}].address.postal_code: expected string")
+                    if 'type' in v1:
+                        v9 = v1['type']
+                        if v9 is None:
+                            errors.append(f"addresses[{i1}].type: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"addresses[{i1}].type: expected string")
+                        elif v9 not in _ENUM_3:
+                            errors.append(f"addresses[{i1}].type: must be one of {sorted(_ENUM_3)}")
+    if 'bic' in body:
+        v10 = body['bic']
+        if v10 is None:
+            pass
+        elif not isinstance(v10, str):
+            errors.append("bic: expected string")
+    if 'business_type_id' in body:
+        v11 = body['business_type_id']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, str):
+            errors.append("business_type_id: expected string")
+    if 'custom_fields' in body:
+        v12 = body['custom_fields']
+        if v12 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v12, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i13, v13 in enumerate(v12):
+                if v13 is None:
+                    errors.append(f"custom_fields[{i13}]: must not be null")
+                elif not isinstance(v13, dict):
+                    errors.append(f"custom_fields[{i13}]: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i13}].{key}: unknown field")
+                    if 'id' in v13:
+                        v14 = v13['id']
+                        if v14 is None:
+                            errors.append(f"custom_fields[{i13}].id: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append(f"custom_fields[{i13}].id: expected string")
+                    if 'value' in v13:
+                        v15 = v13['value']
+                        for check16 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors16: list[str] = []
+                            check16(v15, f"custom_fields[{i13}].value", branch_errors16)
+                            if not branch_errors16:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i13}].value: does not match any allowed shape")
+    if 'emails' in body:
+        v17 = body['emails']
+        if v17 is None:
+            errors.append("emails: must not be null")
+        elif not isinstance(v17, (list, tuple)):
+            errors.append("emails: expected array")
+        else:
+            for i18, v18 in enumerate(v17):
+                if v18 is None:
+                    errors.append(f"emails[{i18}]: must not be null")
+                elif not isinstance(v18, dict):
+                    errors.append(f"emails[{i18}]: expected object")
+                else:
+                    for key in sorted(v18.keys() - _KEYS_7, key=str):
+                        errors.append(f"emails[{i18}].{key}: unknown field")
+                    if 'email' not in v18:
+                        errors.append(f"emails[{i18}].email: required")
+                    if 'type' not in v18:
+                        errors.append(f"emails[{i18}].type: required")
+                    if 'email' in v18:
+                        v19 = v18['email']
+                        if v19 is None:
+                            errors.append(f"emails[{i18}].email: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append(f"emails[{i18}].email: expected string")
+                    if 'type' in v18:
+                        v20 = v18['type']
+                        if v20 is None:
+                            errors.append(f"emails[{i18}].type: must not be null")
+                        elif not isinstance(v20, str):
+                            errors.append(f"emails[{i18}].type: expected string")
+                        elif v20 not in _ENUM_8:
+                            errors.append(f"emails[{i18}].type: must be one of {sorted(_ENUM_8)}")
+    if 'iban' in body:
+        v21 = body['iban']
+        if v21 is None:
+            pass
+        elif not isinstance(v21, str):
+            errors.append("iban: expected string")
+    if 'id' in body:
+        v22 = body['id']
+        if v22 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("id: expected string")
+    if 'language' in body:
+        v23 = body['language']
+        if v23 is None:
+            pass
+        elif not isinstance(v23, str):
+            errors.append("language: expected string")
+    if 'marketing_mails_consent' in body:
+        v24 = body['marketing_mails_consent']
+        if v24 is None:
+            errors.append("marketing_mails_consent: must not be null")
+        elif not isinstance(v24, bool):
+            errors.append("marketing_mails_consent: expected boolean")
+    if 'name' in body:
+        v25 = body['name']
+        if v25 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v25, str):
+            errors.append("name: expected string")
+    if 'national_identification_number' in body:
+        v26 = body['national_identification_number']
+        if v26 is None:
+            pass
+        elif not isinstance(v26, str):
+            errors.append("national_identification_number: expected string")
+    if 'preferred_currency' in body:
+        v27 = body['preferred_currency']
+        if v27 is None:
+            pass
+        elif not isinstance(v27, str):
+            errors.append("preferred_currency: expected string")
+        elif v27 not in _ENUM_9:
+            errors.append(f"preferred_currency: must be one of {sorted(_ENUM_9)}")
+    if 'remarks' in body:
+        v28 = body['remarks']
+        if v28 is None:
+            pass
+        elif not isinstance(v28, str):
+            errors.append("remarks: expected string")
+    if 'responsible_user_id' in body:
+        v29 = body['responsible_user_id']
+        if v29 is None:
+            pass
+        elif not isinstance(v29, str):
+            errors.append("responsible_user_id: expected string")
+    if 'tags' in body:
+        v30 = body['tags']
+        if v30 is None:
+            errors.append("tags: must not be null")
+        elif not isinstance(v30, (list, tuple)):
+            errors.append("tags: expected array")
+        else:
+            for i31, v31 in enumerate(v30):
+                if v31 is None:
+                    errors.append(f"tags[{i31}]: must not be null")
+                elif not isinstance(v31, str):
+                    errors.append(f"tags[{i31}]: expected string")
+    if 'telephones' in body:
+        v32 = body['telephones']
+        if v32 is None:
+            errors.append("telephones: must not be null")
+        elif not isinstance(v32, (list, tuple)):
+            errors.append("telephones: expected array")
+        else:
+            for i33, v33 in enumerate(v32):
+                if v33 is None:
+                    errors.append(f"telephones[{i33}]: must not be null")
+                elif not isinstance(v33, dict):
+                    errors.append(f"telephones[{i33}]: expected object")
+                else:
+                    for key in sorted(v33.keys() - _KEYS_10, key=str):
+                        errors.append(f"telephones[{i33}].{key}: unknown field")
+                    if 'type' not in v33:
+                        errors.append(f"telephones[{i33}].type: required")
+                    if 'number' not in v33:
+                        errors.append(f"telephones[{i33}].number: required")
+                    if 'number' in v33:
+                        v34 = v33['number']
+                        if v34 is None:
+                            errors.append(f"telephones[{i33}].number: must not be null")
+                        elif not isinstance(v34, str):
+                            errors.append(f"telephones[{i33}].number: expected string")
+                    if 'type' in v33:
+                        v35 = v33['type']
+                        if v35 is None:
+                            errors.append(f"telephones[{i33}].type: must not be null")
+                        elif not isinstance(v35, str):
+                            errors.append(f"telephones[{i33}].type: expected string")
+                        elif v35 not in _ENUM_11:
+                            errors.append(f"telephones[{i33}].type: must be one of {sorted(_ENUM_11)}")
+    if 'vat_number' in body:
+        v36 = body['vat_number']
+        if v36 is None:
+            pass
+        elif not isinstance(v36, str):
+            errors.append("vat_number: expected string")
+    if 'website' in body:
+        v37 = body['website']
+        if v37 is None:
+            errors.append("website: must not be null")
+        elif not isinstance(v37, str):
+            errors.append("website: expected string")
+
+
+def _companies_uploadlogo(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_24, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'image' not in body:
+        errors.append("image: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'image' in body:
+        v1 = body['image']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, str):
+            errors.append("image: expected string")
+
+
+VALIDATORS = {
+    'companies.add': _companies_add,
+    'companies.delete': _companies_delete,
+    'companies.info': _companies_info,
+    'companies.list': _companies_list,
+    'companies.tag': _companies_tag,
+    'companies.untag': _companies_untag,
+    'companies.update': _companies_update,
+    'companies.uploadLogo': _companies_uploadlogo,
+}
+# fmt: on
@@ -0,0 +1,197 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'format', 'id'})
+_ENUM_1 = frozenset({'pdf', 'ubl/e-fff'})
+_KEYS_2 = frozenset({'id'})
+_KEYS_3 = frozenset({'filter', 'page'})
+_KEYS_4 = frozenset({
+    'credit_note_date_after',
+    'credit_note_date_before',
+    'customer',
+    'department_id',
+    'ids',
+    'invoice_id',
+    'project_id',
+    'updated_since',
+})
+_KEYS_5 = frozenset({'id', 'type'})
+_ENUM_6 = frozenset({'company', 'contact'})
+_KEYS_7 = frozenset({'number', 'size'})
+
+
+def _creditnotes_download(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'format' not in body:
+        errors.append("format: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'format' in body:
+        v0 = body['format']
+        if v0 is None:
+            errors.append("format: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("format: expected string")
+        elif v0 not in _ENUM_1:
+            errors.append(f"format: must be one of {sorted(_ENUM_1)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _creditnotes_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _creditnotes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_4, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'credit_note_date_after' in v0:
+                v1 = v0['credit_note_date_after']
+                if v1 is None:
+                    errors.append("filter.credit_note_date_after: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.credit_note_date_after: expected string")
+            if 'credit_note_date_before' in v0:
+                v2 = v0['credit_note_date_before']
+                if v2 is None:
+                    errors.append("filter.credit_note_date_before: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.credit_note_date_before: expected string")
+            if 'customer' in v0:
+                v3 = v0['customer']
+                if v3 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v3, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v3.keys() - _KEYS_5, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v3:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v3:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v3:
+                        v4 = v3['id']
+                        if v4 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v3:
+                        v5 = v3['type']
+                        if v5 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v5 not in _ENUM_6:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_6)}")
+            if 'department_id' in v0:
+                v6 = v0['department_id']
+                if v6 is None:
+                    errors.append("filter.department_id: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.department_id: expected string")
+            if 'ids' in v0:
+                v7 = v0['ids']
+                if v7 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v7, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i8, v8 in enumerate(v7):
+                        if v8 is None:
+                            errors.append(f"filter.ids[{i8}]: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"filter.ids[{i8}]: expected string")
+            if 'invoice_id' in v0:
+                v9 = v0['invoice_id']
+                if v9 is None:
+                    errors.append("filter.invoice_id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("filter.invoice_id: expected string")
+            if 'project_id' in v0:
+                v10 = v0['project_id']
+                if v10 is None:
+                    errors.append("filter.project_id: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("filter.project_id: expected string")
+            if 'updated_since' in v0:
+                v11 = v0['updated_since']
+                if v11 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("filter.updated_since: expected string")
+    if 'page' in body:
+        v12 = body['page']
+        if v12 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v12, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v12.keys() - _KEYS_7, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v12:
+                v13 = v12['number']
+                if v13 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v12:
+                v14 = v12['size']
+                if v14 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _creditnotes_sendviapeppol(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+VALIDATORS = {
+    'creditNotes.download': _creditnotes_download,
+    'creditNotes.info': _creditnotes_info,
+    'creditNotes.list': _creditnotes_list,
+    'creditNotes.sendViaPeppol': _creditnotes_sendviapeppol,
+}
+# fmt: on
@@ -0,0 +1,59 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'base'})
+_ENUM_1 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+
+
+def _currencies_exchangerates(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'base' not in body:
+        errors.append("base: required")
+    if 'base' in body:
+        v0 = body['base']
+        if v0 is None:
+            errors.append("base: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("base: expected string")
+        elif v0 not in _ENUM_1:
+            errors.append(f"base: must be one of {sorted(_ENUM_1)}")
+
+
+VALIDATORS = {
+    'currencies.exchangeRates': _currencies_exchangerates,
+}
+# fmt: on
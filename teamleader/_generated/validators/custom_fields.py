@@ -0,0 +1,258 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'configuration', 'context', 'label', 'type'})
+_KEYS_1 = frozenset({'options'})
+_KEYS_2 = frozenset({'default_value'})
+_KEYS_3 = frozenset({'searchable'})
+_ENUM_4 = frozenset({
+    'company',
+    'contact',
+    'deal',
+    'invoice',
+    'milestone',
+    'product',
+    'project',
+    'subscription',
+    'ticket',
+})
+_ENUM_5 = frozenset({
+    'auto_increment',
+    'boolean',
+    'company',
+    'contact',
+    'date',
+    'email',
+    'integer',
+    'money',
+    'multi_line',
+    'multi_select',
+    'number',
+    'product',
+    'single_line',
+    'single_select',
+    'telephone',
+    'url',
+    'user',
+})
+_KEYS_6 = frozenset({'id'})
+_KEYS_7 = frozenset({'filter', 'page', 'sort'})
+_KEYS_8 = frozenset({'context', 'ids'})
+_KEYS_9 = frozenset({'number', 'size'})
+_KEYS_10 = frozenset({'field', 'order'})
+_ENUM_11 = frozenset({'context', 'label'})
+_ENUM_12 = frozenset({'asc', 'desc'})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_1, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'options' in v0:
+            v1 = v0['options']
+            if v1 is None:
+                errors.append(f"{path}.options: must not be null")
+            elif not isinstance(v1, (list, tuple)):
+                errors.append(f"{path}.options: expected array")
+            else:
+                for i2, v2 in enumerate(v1):
+                    if v2 is None:
+                        errors.append(f"{path}.options[{i2}]: must not be null")
+                    elif not isinstance(v2, str):
+                        errors.append(f"{path}.options[{i2}]: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'default_value' in v0:
+            v1 = v0['default_value']
+            if v1 is None:
+                errors.append(f"{path}.default_value: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.default_value: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_3, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'searchable' in v0:
+            v1 = v0['searchable']
+            if v1 is None:
+                errors.append(f"{path}.searchable: must not be null")
+            elif not isinstance(v1, bool):
+                errors.append(f"{path}.searchable: expected boolean")
+
+
+def _customfielddefinitions_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'context' not in body:
+        errors.append("context: required")
+    if 'label' not in body:
+        errors.append("label: required")
+    if 'type' not in body:
+        errors.append("type: required")
+    if 'configuration' in body:
+        v0 = body['configuration']
+        for check1 in (_schema_0, _schema_1, _schema_2,):
+            branch_errors1: list[str] = []
+            check1(v0, "configuration", branch_errors1)
+            if not branch_errors1:
+                break
+        else:
+            errors.append("configuration: does not match any allowed shape")
+    if 'context' in body:
+        v2 = body['context']
+        if v2 is None:
+            errors.append("context: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("context: expected string")
+        elif v2 not in _ENUM_4:
+            errors.append(f"context: must be one of {sorted(_ENUM_4)}")
+    if 'label' in body:
+        v3 = body['label']
+        if v3 is None:
+            errors.append("label: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("label: expected string")
+    if 'type' in body:
+        v4 = body['type']
+        if v4 is None:
+            errors.append("type: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("type: expected string")
+        elif v4 not in _ENUM_5:
+            errors.append(f"type: must be one of {sorted(_ENUM_5)}")
+
+
+def _customfielddefinitions_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _customfielddefinitions_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_8, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'context' in v0:
+                v1 = v0['context']
+                if v1 is None:
+                    errors.append("filter.context: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.context: expected string")
+                elif v1 not in _ENUM_4:
+                    errors.append(f"filter.context: must be one of {sorted(_ENUM_4)}")
+            if 'ids' in v0:
+                v2 = v0['ids']
+                if v2 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v2, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i3, v3 in enumerate(v2):
+                        if v3 is None:
+                            errors.append(f"filter.ids[{i3}]: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"filter.ids[{i3}]: expected string")
+    if 'page' in body:
+        v4 = body['page']
+        if v4 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_9, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v4:
+                v5 = v4['number']
+                if v5 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v4:
+                v6 = v4['size']
+                if v6 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v7 = body['sort']
+        if v7 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v7, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i8, v8 in enumerate(v7):
+                if v8 is None:
+                    errors.append(f"sort[{i8}]: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append(f"sort[{i8}]: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_10, key=str):
+                        errors.append(f"sort[{i8}].{key}: unknown field")
+                    if 'field' not in v8:
+                        errors.append(f"sort[{i8}].field: required")
+                    if 'field' in v8:
+                        v9 = v8['field']
+                        if v9 is None:
+                            errors.append(f"sort[{i8}].field: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"sort[{i8}].field: expected string")
+                        elif v9 not in _ENUM_11:
+                            errors.append(f"sort[{i8}].field: must be one of {sorted(_ENUM_11)}")
+                    if 'order' in v8:
+                        v10 = v8['order']
+                        if v10 is None:
+                            errors.append(f"sort[{i8}].order: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"sort[{i8}].order: expected string")
+                        elif v10 not in _ENUM_12:
+                            errors.append(f"sort[{i8}].order: must be one of {sorted(_ENUM_12)}")
+
+
+VALIDATORS = {
+    'customFieldDefinitions.create': _customfielddefinitions_create,
+    'customFieldDefinitions.info': _customfielddefinitions_info,
+    'customFieldDefinitions.list': _customfielddefinitions_list,
+}
+# fmt: on
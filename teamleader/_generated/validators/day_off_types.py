@@ -0,0 +1,134 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'color', 'date_validity', 'name'})
+_KEYS_1 = frozenset({'from', 'until'})
+_KEYS_2 = frozenset({'id'})
+_KEYS_3: frozenset[Any] = frozenset()
+_KEYS_4 = frozenset({'color', 'date_validity', 'id', 'name'})
+
+
+def _dayofftypes_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'color' in body:
+        v0 = body['color']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, str):
+            errors.append("color: expected string")
+    if 'date_validity' in body:
+        v1 = body['date_validity']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, dict):
+            errors.append("date_validity: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"date_validity.{key}: unknown field")
+            if 'from' not in v1:
+                errors.append("date_validity.from: required")
+            if 'from' in v1:
+                v2 = v1['from']
+                if v2 is None:
+                    errors.append("date_validity.from: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("date_validity.from: expected string")
+            if 'until' in v1:
+                v3 = v1['until']
+                if v3 is None:
+                    errors.append("date_validity.until: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("date_validity.until: expected string")
+    if 'name' in body:
+        v4 = body['name']
+        if v4 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("name: expected string")
+
+
+def _dayofftypes_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _dayofftypes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+def _dayofftypes_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'color' in body:
+        v0 = body['color']
+        if v0 is None:
+            errors.append("color: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("color: expected string")
+    if 'date_validity' in body:
+        v1 = body['date_validity']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, dict):
+            errors.append("date_validity: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"date_validity.{key}: unknown field")
+            if 'from' not in v1:
+                errors.append("date_validity.from: required")
+            if 'from' in v1:
+                v2 = v1['from']
+                if v2 is None:
+                    errors.append("date_validity.from: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("date_validity.from: expected string")
+            if 'until' in v1:
+                v3 = v1['until']
+                if v3 is None:
+                    errors.append("date_validity.until: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("date_validity.until: expected string")
+    if 'id' in body:
+        v4 = body['id']
+        if v4 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("id: expected string")
+    if 'name' in body:
+        v5 = body['name']
+        if v5 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("name: expected string")
+
+
+VALIDATORS = {
+    'dayOffTypes.create': _dayofftypes_create,
+    'dayOffTypes.delete': _dayofftypes_delete,
+    'dayOffTypes.list': _dayofftypes_list,
+    'dayOffTypes.update': _dayofftypes_update,
+}
+# fmt: on
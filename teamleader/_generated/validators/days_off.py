@@ -0,0 +1,101 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'ids', 'user_id'})
+_KEYS_1 = frozenset({'days', 'leave_type_id', 'user_id'})
+_KEYS_2 = frozenset({'ends_at', 'starts_at'})
+
+
+def _daysoff_bulkdelete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'user_id' not in body:
+        errors.append("user_id: required")
+    if 'ids' in body:
+        v0 = body['ids']
+        if v0 is None:
+            errors.append("ids: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("ids: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"ids[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"ids[{i1}]: expected string")
+    if 'user_id' in body:
+        v2 = body['user_id']
+        if v2 is None:
+            errors.append("user_id: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("user_id: expected string")
+
+
+def _daysoff_import(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'days' not in body:
+        errors.append("days: required")
+    if 'leave_type_id' not in body:
+        errors.append("leave_type_id: required")
+    if 'user_id' not in body:
+        errors.append("user_id: required")
+    if 'days' in body:
+        v0 = body['days']
+        if v0 is None:
+            errors.append("days: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("days: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"days[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"days[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_2, key=str):
+                        errors.append(f"days[{i1}].{key}: unknown field")
+                    if 'starts_at' not in v1:
+                        errors.append(f"days[{i1}].starts_at: required")
+                    if 'ends_at' not in v1:
+                        errors.append(f"days[{i1}].ends_at: required")
+                    if 'ends_at' in v1:
+                        v2 = v1['ends_at']
+                        if v2 is None:
+                            errors.append(f"days[{i1}].ends_at: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"days[{i1}].ends_at: expected string")
+                    if 'starts_at' in v1:
+                        v3 = v1['starts_at']
+                        if v3 is None:
+                            errors.append(f"days[{i1}].starts_at: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"days[{i1}].starts_at: expected string")
+    if 'leave_type_id' in body:
+        v4 = body['leave_type_id']
+        if v4 is None:
+            errors.append("leave_type_id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("leave_type_id: expected string")
+    if 'user_id' in body:
+        v5 = body['user_id']
+        if v5 is None:
+            errors.append("user_id: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("user_id: expected string")
+
+
+VALIDATORS = {
+    'daysOff.bulkDelete': _daysoff_bulkdelete,
+    'daysOff.import': _daysoff_import,
+}
+# fmt: on
@@ -0,0 +1,290 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'deal_pipeline_id',
+    'estimated_probability',
+    'follow_up_actions',
+    'name',
+    'requires_attention_after',
+})
+_ENUM_1 = frozenset({'create_call', 'create_event', 'create_task'})
+_KEYS_2 = frozenset({'amount', 'unit'})
+_ENUM_3 = frozenset({'days', 'weeks'})
+_KEYS_4 = frozenset({'id', 'new_phase_id'})
+_KEYS_5 = frozenset({'id'})
+_KEYS_6 = frozenset({'filter', 'page'})
+_KEYS_7 = frozenset({'deal_pipeline_id', 'ids'})
+_KEYS_8 = frozenset({'number', 'size'})
+_KEYS_9 = frozenset({'after_phase_id', 'id'})
+_KEYS_10 = frozenset({
+    'estimated_probability',
+    'follow_up_actions',
+    'id',
+    'name',
+    'requires_attention_after',
+})
+
+
+def _dealphases_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'deal_pipeline_id' not in body:
+        errors.append("deal_pipeline_id: required")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'requires_attention_after' not in body:
+        errors.append("requires_attention_after: required")
+    if 'deal_pipeline_id' in body:
+        v0 = body['deal_pipeline_id']
+        if v0 is None:
+            errors.append("deal_pipeline_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("deal_pipeline_id: expected string")
+    if 'estimated_probability' in body:
+        v1 = body['estimated_probability']
+        if v1 is None:
+            errors.append("estimated_probability: must not be null")
+        elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+            errors.append("estimated_probability: expected number")
+    if 'follow_up_actions' in body:
+        v2 = body['follow_up_actions']
+        if v2 is None:
+            errors.append("follow_up_actions: must not be null")
+        elif not isinstance(v2, (list, tuple)):
+            errors.append("follow_up_actions: expected array")
+        else:
+            for i3, v3 in enumerate(v2):
+                if v3 is None:
+                    errors.append(f"follow_up_actions[{i3}]: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append(f"follow_up_actions[{i3}]: expected string")
+                elif v3 not in _ENUM_1:
+                    errors.append(f"follow_up_actions[{i3}]: must be one of {sorted(_ENUM_1)}")
+    if 'name' in body:
+        v4 = body['name']
+        if v4 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("name: expected string")
+    if 'requires_attention_after' in body:
+        v5 = body['requires_attention_after']
+        if v5 is None:
+            errors.append("requires_attention_after: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("requires_attention_after: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_2, key=str):
+                errors.append(f"requires_attention_after.{key}: unknown field")
+            if 'amount' not in v5:
+                errors.append("requires_attention_after.amount: required")
+            if 'unit' not in v5:
+                errors.append("requires_attention_after.unit: required")
+            if 'amount' in v5:
+                v6 = v5['amount']
+                if v6 is None:
+                    errors.append("requires_attention_after.amount: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("requires_attention_after.amount: expected number")
+            if 'unit' in v5:
+                v7 = v5['unit']
+                if v7 is None:
+                    errors.append("requires_attention_after.unit: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("requires_attention_after.unit: expected string")
+                elif v7 not in _ENUM_3:
+                    errors.append(f"requires_attention_after.unit: must be one of {sorted(_ENUM_3)}")
+
+
+def _dealphases_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'new_phase_id' in body:
+        v1 = body['new_phase_id']
+        if v1 is None:
+            errors.append("new_phase_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("new_phase_id: expected string")
+
+
+def _dealphases_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _dealphases_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_7, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'deal_pipeline_id' in v0:
+                v1 = v0['deal_pipeline_id']
+                if v1 is None:
+                    errors.append("filter.deal_pipeline_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.deal_pipeline_id: expected string")
+            if 'ids' in v0:
+                v2 = v0['ids']
+                if v2 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v2, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i3, v3 in enumerate(v2):
+                        if v3 is None:
+                            errors.append(f"filter.ids[{i3}]: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"filter.ids[{i3}]: expected string")
+    if 'page' in body:
+        v4 = body['page']
+        if v4 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_8, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v4:
+                v5 = v4['number']
+                if v5 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v4:
+                v6 = v4['size']
+                if v6 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _dealphases_move(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'after_phase_id' not in body:
+        errors.append("after_phase_id: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'after_phase_id' in body:
+        v0 = body['after_phase_id']
+        if v0 is None:
+            errors.append("after_phase_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("after_phase_id: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _dealphases_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'requires_attention_after' not in body:
+        errors.append("requires_attention_after: required")
+    if 'estimated_probability' in body:
+        v0 = body['estimated_probability']
+        if v0 is None:
+            errors.append("estimated_probability: must not be null")
+        elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+            errors.append("estimated_probability: expected number")
+    if 'follow_up_actions' in body:
+        v1 = body['follow_up_actions']
+        if v1 is None:
+            errors.append("follow_up_actions: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("follow_up_actions: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"follow_up_actions[{i2}]: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append(f"follow_up_actions[{i2}]: expected string")
+                elif v2 not in _ENUM_1:
+                    errors.append(f"follow_up_actions[{i2}]: must be one of {sorted(_ENUM_1)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+    if 'name' in body:
+        v4 = body['name']
+        if v4 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("name: expected string")
+    if 'requires_attention_after' in body:
+        v5 = body['requires_attention_after']
+        if v5 is None:
+            errors.append("requires_attention_after: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("requires_attention_after: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_2, key=str):
+                errors.append(f"requires_attention_after.{key}: unknown field")
+            if 'amount' not in v5:
+                errors.append("requires_attention_after.amount: required")
+            if 'unit' not in v5:
+                errors.append("requires_attention_after.unit: required")
+            if 'amount' in v5:
+                v6 = v5['amount']
+                if v6 is None:
+                    errors.append("requires_attention_after.amount: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("requires_attention_after.amount: expected number")
+            if 'unit' in v5:
+                v7 = v5['unit']
+                if v7 is None:
+                    errors.append("requires_attention_after.unit: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("requires_attention_after.unit: expected string")
+                elif v7 not in _ENUM_3:
+                    errors.append(f"requires_attention_after.unit: must be one of {sorted(_ENUM_3)}")
+
+
+VALIDATORS = {
+    'dealPhases.create': _dealphases_create,
+    'dealPhases.delete': _dealphases_delete,
+    'dealPhases.duplicate': _dealphases_duplicate,
+    'dealPhases.list': _dealphases_list,
+    'dealPhases.move': _dealphases_move,
+    'dealPhases.update': _dealphases_update,
+}
+# fmt: on
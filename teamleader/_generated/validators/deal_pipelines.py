@@ -0,0 +1,197 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'name'})
+_KEYS_1 = frozenset({'id', 'migrate_phases'})
+_KEYS_2 = frozenset({'new_phase_id', 'old_phase_id'})
+_KEYS_3 = frozenset({'id'})
+_KEYS_4 = frozenset({'filter', 'page'})
+_KEYS_5 = frozenset({'ids', 'status'})
+_ENUM_6 = frozenset({'open', 'pending_deletion'})
+_KEYS_7 = frozenset({'number', 'size'})
+_KEYS_8 = frozenset({'id', 'name'})
+
+
+def _dealpipelines_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'name' in body:
+        v0 = body['name']
+        if v0 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("name: expected string")
+
+
+def _dealpipelines_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'migrate_phases' in body:
+        v1 = body['migrate_phases']
+        if v1 is None:
+            errors.append("migrate_phases: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("migrate_phases: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"migrate_phases[{i2}]: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append(f"migrate_phases[{i2}]: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_2, key=str):
+                        errors.append(f"migrate_phases[{i2}].{key}: unknown field")
+                    if 'old_phase_id' not in v2:
+                        errors.append(f"migrate_phases[{i2}].old_phase_id: required")
+                    if 'new_phase_id' not in v2:
+                        errors.append(f"migrate_phases[{i2}].new_phase_id: required")
+                    if 'new_phase_id' in v2:
+                        v3 = v2['new_phase_id']
+                        if v3 is None:
+                            errors.append(f"migrate_phases[{i2}].new_phase_id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"migrate_phases[{i2}].new_phase_id: expected string")
+                    if 'old_phase_id' in v2:
+                        v4 = v2['old_phase_id']
+                        if v4 is None:
+                            errors.append(f"migrate_phases[{i2}].old_phase_id: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"migrate_phases[{i2}].old_phase_id: expected string")
+
+
+def _dealpipelines_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _dealpipelines_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_5, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'status' in v0:
+                v3 = v0['status']
+                if v3 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.status[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.status[{i4}]: expected string")
+                        elif v4 not in _ENUM_6:
+                            errors.append(f"filter.status[{i4}]: must be one of {sorted(_ENUM_6)}")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_7, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _dealpipelines_markasdefault(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _dealpipelines_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'name' in body:
+        v1 = body['name']
+        if v1 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("name: expected string")
+
+
+VALIDATORS = {
+    'dealPipelines.create': _dealpipelines_create,
+    'dealPipelines.delete': _dealpipelines_delete,
+    'dealPipelines.duplicate': _dealpipelines_duplicate,
+    'dealPipelines.list': _dealpipelines_list,
+    'dealPipelines.markAsDefault': _dealpipelines_markasdefault,
+    'dealPipelines.update': _dealpipelines_update,
+}
+# fmt: on
@@ -0,0 +1,914 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'currency',
+    'custom_fields',
+    'department_id',
+    'estimated_closing_date',
+    'estimated_probability',
+    'estimated_value',
+    'lead',
+    'phase_id',
+    'responsible_user_id',
+    'source_id',
+    'summary',
+    'title',
+})
+_KEYS_1 = frozenset({'code', 'exchange_rate'})
+_ENUM_2 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_3 = frozenset({'id', 'value'})
+_KEYS_4 = frozenset({'id', 'type'})
+_ENUM_5 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_6 = frozenset({'amount', 'currency'})
+_KEYS_7 = frozenset({'contact_person_id', 'customer'})
+_ENUM_8 = frozenset({'company', 'contact'})
+_KEYS_9 = frozenset({'id'})
+_KEYS_10 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_11 = frozenset({
+    'created_before',
+    'customer',
+    'estimated_closing_date',
+    'estimated_closing_date_from',
+    'estimated_closing_date_until',
+    'ids',
+    'phase_id',
+    'pipeline_ids',
+    'responsible_user_id',
+    'status',
+    'term',
+    'updated_since',
+})
+_ENUM_12 = frozenset({'lost', 'open', 'won'})
+_KEYS_13 = frozenset({'number', 'size'})
+_KEYS_14 = frozenset({'field', 'order'})
+_ENUM_15 = frozenset({'created_at', 'weighted_value'})
+_ENUM_16 = frozenset({'asc', 'desc'})
+_KEYS_17 = frozenset({'extra_info', 'id', 'reason_id'})
+_KEYS_18 = frozenset({'id', 'phase_id'})
+_KEYS_19 = frozenset({
+    'currency',
+    'custom_fields',
+    'department_id',
+    'estimated_closing_date',
+    'estimated_probability',
+    'estimated_value',
+    'id',
+    'lead',
+    'responsible_user_id',
+    'source_id',
+    'summary',
+    'title',
+})
+_KEYS_20 = frozenset({'filter', 'page', 'sort'})
+_KEYS_21 = frozenset({'ids'})
+_ENUM_22 = frozenset({'name'})
+_ENUM_23 = frozenset({'asc'})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_4, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_5:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_5)}")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _deals_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'lead' not in body:
+        errors.append("lead: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'exchange_rate' not in v0:
+                errors.append("currency.exchange_rate: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_3, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'department_id' in body:
+        v8 = body['department_id']
+        if v8 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("department_id: expected string")
+    if 'estimated_closing_date' in body:
+        v9 = body['estimated_closing_date']
+        if v9 is None:
+            errors.append("estimated_closing_date: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("estimated_closing_date: expected string")
+    if 'estimated_probability' in body:
+        v10 = body['estimated_probability']
+        if v10 is None:
+            errors.append("estimated_probability: must not be null")
+        elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+            errors.append("estimated_probability: expected number")
+    if 'estimated_value' in body:
+        v11 = body['estimated_value']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, dict):
+            errors.append("estimated_value: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_6, key=str):
+                errors.append(f"estimated_value.{key}: unknown field")
+            if 'amount' not in v11:
+                errors.append("estimated_value.amount: required")
+            if 'currency' not in v11:
+                errors.append("estimated_value.currency: required")
+            if 'amount' in v11:
+                v12 = v11['amount']
+                if v12 is None:
+                    errors.append("estimated_value.amount: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("estimated_value.amount: expected number")
+            if 'currency' in v11:
+                v13 = v11['currency']
+                if v13 is None:
+                    errors.append("estimated_value.currency: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("estimated_value.currency: expected string")
+                elif v13 not in _ENUM_2:
+                    errors.append(f"estimated_value.currency: must be one of {sorted(_ENUM_2)}")
+    if 'lead' in body:
+        v14 = body['lead']
+        if v14 is None:
+            errors.append("lead: must not be null")
+        elif not isinstance(v14, dict):
+            errors.append("lead: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_7, key=str):
+                errors.append(f"lead.{key}: unknown field")
+            if 'customer' not in v14:
+                errors.append("lead.customer: required")
+            if 'contact_person_id' in v14:
+                v15 = v14['contact_person_id']
+                if v15 is None:
+                    errors.append("lead.contact_person_id: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("lead.contact_person_id: expected string")
+            if 'customer' in v14:
+                v16 = v14['customer']
+                if v16 is None:
+                    errors.append("lead.customer: must not be null")
+                elif not isinstance(v16, dict):
+                    errors.append("lead.customer: expected object")
+                else:
+                    for key in sorted(v16.keys() - _KEYS_4, key=str):
+                        errors.append(f"lead.customer.{key}: unknown field")
+                    if 'type' not in v16:
+                        errors.append("lead.customer.type: required")
+                    if 'id' not in v16:
+                        errors.append("lead.customer.id: required")
+                    if 'id' in v16:
+                        v17 = v16['id']
+                        if v17 is None:
+                            errors.append("lead.customer.id: must not be null")
+                        elif not isinstance(v17, str):
+                            errors.append("lead.customer.id: expected string")
+                    if 'type' in v16:
+                        v18 = v16['type']
+                        if v18 is None:
+                            errors.append("lead.customer.type: must not be null")
+                        elif not isinstance(v18, str):
+                            errors.append("lead.customer.type: expected string")
+                        elif v18 not in _ENUM_8:
+                            errors.append(f"lead.customer.type: must be one of {sorted(_ENUM_8)}")
+    if 'phase_id' in body:
+        v19 = body['phase_id']
+        if v19 is None:
+            errors.append("phase_id: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("phase_id: expected string")
+    if 'responsible_user_id' in body:
+        v20 = body['responsible_user_id']
+        if v20 is None:
+            errors.append("responsible_user_id: must not be null")
+        elif not isinstance(v20, str):
+            errors.append("responsible_user_id: expected string")
+    if 'source_id' in body:
+        v21 = body['source_id']
+        if v21 is None:
+            errors.append("source_id: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("source_id: expected string")
+    if 'summary' in body:
+        v22 = body['summary']
+        if v22 is None:
+            errors.append("summary: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("summary: expected string")
+    if 'title' in body:
+        v23 = body['title']
+        if v23 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v23, str):
+            errors.append("title: expected string")
+
+
+def _deals_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _deals_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _deals_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_11, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'created_before' in v0:
+                v1 = v0['created_before']
+                if v1 is None:
+                    errors.append("filter.created_before: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.created_before: expected string")
+            if 'customer' in v0:
+                v2 = v0['customer']
+                if v2 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_4, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v2:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v2:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v4 not in _ENUM_8:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_8)}")
+            if 'estimated_closing_date' in v0:
+                v5 = v0['estimated_closing_date']
+                if v5 is None:
+                    pass
+                elif not isinstance(v5, str):
+                    errors.append("filter.estimated_closing_date: expected string")
+            if 'estimated_closing_date_from' in v0:
+                v6 = v0['estimated_closing_date_from']
+                if v6 is None:
+                    errors.append("filter.estimated_closing_date_from: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.estimated_closing_date_from: expected string")
+            if 'estimated_closing_date_until' in v0:
+                v7 = v0['estimated_closing_date_until']
+                if v7 is None:
+                    errors.append("filter.estimated_closing_date_until: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.estimated_closing_date_until: expected string")
+            if 'ids' in v0:
+                v8 = v0['ids']
+                if v8 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v8, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i9, v9 in enumerate(v8):
+                        if v9 is None:
+                            errors.append(f"filter.ids[{i9}]: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"filter.ids[{i9}]: expected string")
+            if 'phase_id' in v0:
+                v10 = v0['phase_id']
+                if v10 is None:
+                    errors.append("filter.phase_id: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("filter.phase_id: expected string")
+            if 'pipeline_ids' in v0:
+                v11 = v0['pipeline_ids']
+                if v11 is None:
+                    errors.append("filter.pipeline_ids: must not be null")
+                elif not isinstance(v11, (list, tuple)):
+                    errors.append("filter.pipeline_ids: expected array")
+                else:
+                    for i12, v12 in enumerate(v11):
+                        if v12 is None:
+                            errors.append(f"filter.pipeline_ids[{i12}]: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append(f"filter.pipeline_ids[{i12}]: expected string")
+            if 'responsible_user_id' in v0:
+                v13 = v0['responsible_user_id']
+                for check14 in (_schema_5, _schema_6,):
+                    branch_errors14: list[str] = []
+                    check14(v13, "filter.responsible_user_id", branch_errors14)
+                    if not branch_errors14:
+                        break
+                else:
+                    errors.append("filter.responsible_user_id: does not match any allowed shape")
+            if 'status' in v0:
+                v15 = v0['status']
+                if v15 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v15, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i16, v16 in enumerate(v15):
+                        if v16 is None:
+                            errors.append(f"filter.status[{i16}]: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append(f"filter.status[{i16}]: expected string")
+                        elif v16 not in _ENUM_12:
+                            errors.append(f"filter.status[{i16}]: must be one of {sorted(_ENUM_12)}")
+            if 'term' in v0:
+                v17 = v0['term']
+                if v17 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append("filter.term: expected string")
+            if 'updated_since' in v0:
+                v18 = v0['updated_since']
+                if v18 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v18, str):
+                    errors.append("filter.updated_since: expected string")
+    if 'includes' in body:
+        v19 = body['includes']
+        if v19 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v20 = body['page']
+        if v20 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v20, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v20.keys() - _KEYS_13, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v20:
+                v21 = v20['number']
+                if v21 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v20:
+                v22 = v20['size']
+                if v22 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v22, bool) or not isinstance(v22, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v23 = body['sort']
+        if v23 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v23, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i24, v24 in enumerate(v23):
+                if v24 is None:
+                    errors.append(f"sort[{i24}]: must not be null")
+                elif not isinstance(v24, dict):
+                    errors.append(f"sort[{i24}]: expected object")
+                else:
+                    for key in sorted(v24.keys() - _KEYS_14, key=str):
+                        errors.append(f"sort[{i24}].{key}: unknown field")
+                    if 'field' not in v24:
+                        errors.append(f"sort[{i24}].field: required")
+                    if 'field' in v24:
+                        v25 = v24['field']
+                        if v25 is None:
+                            errors.append(f"sort[{i24}].field: must not be null")
+                        elif not isinstance(v25, str):
+                            errors.append(f"sort[{i24}].field: expected string")
+                        elif v25 not in _ENUM_15:
+                            errors.append(f"sort[{i24}].field: must be one of {sorted(_ENUM_15)}")
+                    if 'order' in v24:
+                        v26 = v24['order']
+                        if v26 is None:
+                            errors.append(f"sort[{i24}].order: must not be null")
+                        elif not isinstance(v26, str):
+                            errors.append(f"sort[{i24}].order: expected string")
+                        elif v26 not in _ENUM_16:
+                            errors.append(f"sort[{i24}].order: must be one of {sorted(_ENUM_16)}")
+
+
+def _deals_lose(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_17, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'extra_info' in body:
+        v0 = body['extra_info']
+        if v0 is None:
+            errors.append("extra_info: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("extra_info: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+    if 'reason_id' in body:
+        v2 = body['reason_id']
+        if v2 is None:
+            errors.append("reason_id: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("reason_id: expected string")
+
+
+def _deals_move(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_18, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'phase_id' not in body:
+        errors.append("phase_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'phase_id' in body:
+        v1 = body['phase_id']
+        if v1 is None:
+            errors.append("phase_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("phase_id: expected string")
+
+
+def _deals_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_19, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'exchange_rate' not in v0:
+                errors.append("currency.exchange_rate: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_3, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'department_id' in body:
+        v8 = body['department_id']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("department_id: expected string")
+    if 'estimated_closing_date' in body:
+        v9 = body['estimated_closing_date']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, str):
+            errors.append("estimated_closing_date: expected string")
+    if 'estimated_probability' in body:
+        v10 = body['estimated_probability']
+        if v10 is None:
+            pass
+        elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+            errors.append("estimated_probability: expected number")
+    if 'estimated_value' in body:
+        v11 = body['estimated_value']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, dict):
+            errors.append("estimated_value: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_6, key=str):
+                errors.append(f"estimated_value.{key}: unknown field")
+            if 'amount' not in v11:
+                errors.append("estimated_value.amount: required")
+            if 'currency' not in v11:
+                errors.append("estimated_value.currency: required")
+            if 'amount' in v11:
+                v12 = v11['amount']
+                if v12 is None:
+                    errors.append("estimated_value.amount: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("estimated_value.amount: expected number")
+            if 'currency' in v11:
+                v13 = v11['currency']
+                if v13 is None:
+                    errors.append("estimated_value.currency: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("estimated_value.currency: expected string")
+                elif v13 not in _ENUM_2:
+                    errors.append(f"estimated_value.currency: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v14 = body['id']
+        if v14 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("id: expected string")
+    if 'lead' in body:
+        v15 = body['lead']
+        if v15 is None:
+            errors.append("lead: must not be null")
+        elif not isinstance(v15, dict):
+            errors.append("lead: expected object")
+        else:
+            for key in sorted(v15.keys() - _KEYS_7, key=str):
+                errors.append(f"lead.{key}: unknown field")
+            if 'customer' not in v15:
+                errors.append("lead.customer: required")
+            if 'contact_person_id' in v15:
+                v16 = v15['contact_person_id']
+                if v16 is None:
+                    errors.append("lead.contact_person_id: must not be null")
+                elif not isinstance(v16, str):
+                    errors.append("lead.contact_person_id: expected string")
+            if 'customer' in v15:
+                v17 = v15['customer']
+                if v17 is None:
+                    errors.append("lead.customer: must not be null")
+                elif not isinstance(v17, dict):
+                    errors.append("lead.customer: expected object")
+                else:
+                    for key in sorted(v17.keys() - _KEYS_4, key=str):
+                        errors.append(f"lead.customer.{key}: unknown field")
+                    if 'type' not in v17:
+                        errors.append("lead.customer.type: required")
+                    if 'id' not in v17:
+                        errors.append("lead.customer.id: required")
+                    if 'id' in v17:
+                        v18 = v17['id']
+                        if v18 is None:
+                            errors.append("lead.customer.id: must not be null")
+                        elif not isinstance(v18, str):
+                            errors.append("lead.customer.id: expected string")
+                    if 'type' in v17:
+                        v19 = v17['type']
+                        if v19 is None:
+                            errors.append("lead.customer.type: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append("lead.customer.type: expected string")
+                        elif v19 not in _ENUM_8:
+                            errors.append(f"lead.customer.type: must be one of {sorted(_ENUM_8)}")
+    if 'responsible_user_id' in body:
+        v20 = body['responsible_user_id']
+        if v20 is None:
+            pass
+        elif not isinstance(v20, str):
+            errors.append("responsible_user_id: expected string")
+    if 'source_id' in body:
+        v21 = body['source_id']
+        if v21 is None:
+            pass
+        elif not isinstance(v21, str):
+            errors.append("source_id: expected string")
+    if 'summary' in body:
+        v22 = body['summary']
+        if v22 is None:
+            pass
+        elif not isinstance(v22, str):
+            errors.append("summary: expected string")
+    if 'title' in body:
+        v23 = body['title']
+        if v23 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v23, str):
+            errors.append("title: expected string")
+
+
+def _deals_win(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _lostreasons_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_20, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_21, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+    if 'page' in body:
+        v3 = body['page']
+        if v3 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_13, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v3:
+                v4 = v3['number']
+                if v4 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v3:
+                v5 = v3['size']
+                if v5 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v6 = body['sort']
+        if v6 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v6, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i7, v7 in enumerate(v6):
+                if v7 is None:
+                    errors.append(f"sort[{i7}]: must not be null")
+                elif not isinstance(v7, dict):
+                    errors.append(f"sort[{i7}]: expected object")
+                else:
+                    for key in sorted(v7.keys() - _KEYS_14, key=str):
+                        errors.append(f"sort[{i7}].{key}: unknown field")
+                    if 'field' not in v7:
+                        errors.append(f"sort[{i7}].field: required")
+                    if 'field' in v7:
+                        v8 = v7['field']
+                        if v8 is None:
+                            errors.append(f"sort[{i7}].field: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"sort[{i7}].field: expected string")
+                        elif v8 not in _ENUM_22:
+                            errors.append(f"sort[{i7}].field: must be one of {sorted(_ENUM_22)}")
+                    if 'order' in v7:
+                        v9 = v7['order']
+                        if v9 is None:
+                            errors.append(f"sort[{i7}].order: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"sort[{i7}].order: expected string")
+                        elif v9 not in _ENUM_23:
+                            errors.append(f"sort[{i7}].order: must be one of {sorted(_ENUM_23)}")
+
+
+VALIDATORS = {
+    'deals.create': _deals_create,
+    'deals.delete': _deals_delete,
+    'deals.info': _deals_info,
+    'deals.list': _deals_list,
+    'deals.lose': _deals_lose,
+    'deals.move': _deals_move,
+    'deals.update': _deals_update,
+    'deals.win': _deals_win,
+    'lostReasons.list': _lostreasons_list,
+}
+# fmt: on
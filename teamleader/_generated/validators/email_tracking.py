@@ -0,0 +1,98 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'attachments', 'content', 'subject', 'title'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({
+    'company',
+    'contact',
+    'creditNote',
+    'deal',
+    'invoice',
+    'nextgenProject',
+    'product',
+    'quotation',
+    'subscription',
+})
+_KEYS_3: frozenset[Any] = frozenset()
+
+
+def _emailtracking_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'content' not in body:
+        errors.append("content: required")
+    if 'subject' not in body:
+        errors.append("subject: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'content' in body:
+        v2 = body['content']
+        if v2 is None:
+            errors.append("content: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("content: expected string")
+    if 'subject' in body:
+        v3 = body['subject']
+        if v3 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("subject: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_1, key=str):
+                errors.append(f"subject.{key}: unknown field")
+            if 'id' not in v3:
+                errors.append("subject.id: required")
+            if 'type' not in v3:
+                errors.append("subject.type: required")
+            if 'id' in v3:
+                v4 = v3['id']
+                if v4 is None:
+                    errors.append("subject.id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("subject.id: expected string")
+            if 'type' in v3:
+                v5 = v3['type']
+                if v5 is None:
+                    errors.append("subject.type: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("subject.type: expected string")
+                elif v5 not in _ENUM_2:
+                    errors.append(f"subject.type: must be one of {sorted(_ENUM_2)}")
+    if 'title' in body:
+        v6 = body['title']
+        if v6 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("title: expected string")
+
+
+def _emailtracking_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+VALIDATORS = {
+    'emailTracking.create': _emailtracking_create,
+    'emailTracking.list': _emailtracking_list,
+}
+# fmt: on
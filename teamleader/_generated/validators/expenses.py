@@ -0,0 +1,283 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page', 'sort'})
+_KEYS_1 = frozenset({
+    'bookkeeping_statuses',
+    'department_ids',
+    'document_date',
+    'paid_at',
+    'payment_statuses',
+    'review_statuses',
+    'source_types',
+    'supplier',
+    'term',
+})
+_ENUM_2 = frozenset({'not_sent', 'sent'})
+_KEYS_3 = frozenset({'end', 'operator', 'start', 'value'})
+_ENUM_4 = frozenset({'after', 'before', 'between', 'equals', 'is_empty'})
+_ENUM_5 = frozenset({'paid', 'unpaid'})
+_ENUM_6 = frozenset({'approved', 'pending', 'refused'})
+_ENUM_7 = frozenset({'incomingCreditNote', 'incomingInvoice', 'receipt'})
+_KEYS_8 = frozenset({'id', 'type'})
+_ENUM_9 = frozenset({'company', 'contact'})
+_KEYS_10 = frozenset({'number', 'size'})
+_KEYS_11 = frozenset({'field', 'order'})
+_ENUM_12 = frozenset({'document_date', 'due_date', 'supplier_name'})
+_ENUM_13 = frozenset({'asc', 'desc'})
+
+
+def _expenses_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'bookkeeping_statuses' in v0:
+                v1 = v0['bookkeeping_statuses']
+                if v1 is None:
+                    errors.append("filter.bookkeeping_statuses: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.bookkeeping_statuses: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.bookkeeping_statuses[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.bookkeeping_statuses[{i2}]: expected string")
+                        elif v2 not in _ENUM_2:
+                            errors.append(f"filter.bookkeeping_statuses[{i2}]: must be one of {sorted(_ENUM_2)}")
+            if 'department_ids' in v0:
+                v3 = v0['department_ids']
+                if v3 is None:
+                    errors.append("filter.department_ids: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.department_ids: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.department_ids[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.department_ids[{i4}]: expected string")
+            if 'document_date' in v0:
+                v5 = v0['document_date']
+                if v5 is None:
+                    errors.append("filter.document_date: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append("filter.document_date: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_3, key=str):
+                        errors.append(f"filter.document_date.{key}: unknown field")
+                    if 'operator' not in v5:
+                        errors.append("filter.document_date.operator: required")
+                    if 'end' in v5:
+                        v6 = v5['end']
+                        if v6 is None:
+                            errors.append("filter.document_date.end: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append("filter.document_date.end: expected string")
+                    if 'operator' in v5:
+                        v7 = v5['operator']
+                        if v7 is None:
+                            errors.append("filter.document_date.operator: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append("filter.document_date.operator: expected string")
+                        elif v7 not in _ENUM_4:
+                            errors.append(f"filter.document_date.operator: must be one of {sorted(_ENUM_4)}")
+                    if 'start' in v5:
+                        v8 = v5['start']
+                        if v8 is None:
+                            errors.append("filter.document_date.start: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append("filter.document_date.start: expected string")
+                    if 'value' in v5:
+                        v9 = v5['value']
+                        if v9 is None:
+                            errors.append("filter.document_date.value: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append("filter.document_date.value: expected string")
+            if 'paid_at' in v0:
+                v10 = v0['paid_at']
+                if v10 is None:
+                    errors.append("filter.paid_at: must not be null")
+                elif not isinstance(v10, dict):
+                    errors.append("filter.paid_at: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_3, key=str):
+                        errors.append(f"filter.paid_at.{key}: unknown field")
+                    if 'operator' not in v10:
+                        errors.append("filter.paid_at.operator: required")
+                    if 'end' in v10:
+                        v11 = v10['end']
+                        if v11 is None:
+                            errors.append("filter.paid_at.end: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append("filter.paid_at.end: expected string")
+                    if 'operator' in v10:
+                        v12 = v10['operator']
+                        if v12 is None:
+                            errors.append("filter.paid_at.operator: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append("filter.paid_at.operator: expected string")
+                        elif v12 not in _ENUM_4:
+                            errors.append(f"filter.paid_at.operator: must be one of {sorted(_ENUM_4)}")
+                    if 'start' in v10:
+                        v13 = v10['start']
+                        if v13 is None:
+                            errors.append("filter.paid_at.start: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append("filter.paid_at.start: expected string")
+                    if 'value' in v10:
+                        v14 = v10['value']
+                        if v14 is None:
+                            errors.append("filter.paid_at.value: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append("filter.paid_at.value: expected string")
+            if 'payment_statuses' in v0:
+                v15 = v0['payment_statuses']
+                if v15 is None:
+                    errors.append("filter.payment_statuses: must not be null")
+                elif not isinstance(v15, (list, tuple)):
+                    errors.append("filter.payment_statuses: expected array")
+                else:
+                    for i16, v16 in enumerate(v15):
+                        if v16 is None:
+                            errors.append(f"filter.payment_statuses[{i16}]: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append(f"filter.payment_statuses[{i16}]: expected string")
+                        elif v16 not in _ENUM_5:
+                            errors.append(f"filter.payment_statuses[{i16}]: must be one of {sorted(_ENUM_5)}")
+            if 'review_statuses' in v0:
+                v17 = v0['review_statuses']
+                if v17 is None:
+                    errors.append("filter.review_statuses: must not be null")
+                elif not isinstance(v17, (list, tuple)):
+                    errors.append("filter.review_statuses: expected array")
+                else:
+                    for i18, v18 in enumerate(v17):
+                        if v18 is None:
+                            errors.append(f"filter.review_statuses[{i18}]: must not be null")
+                        elif not isinstance(v18, str):
+                            errors.append(f"filter.review_statuses[{i18}]: expected string")
+                        elif v18 not in _ENUM_6:
+                            errors.append(f"filter.review_statuses[{i18}]: must be one of {sorted(_ENUM_6)}")
+            if 'source_types' in v0:
+                v19 = v0['source_types']
+                if v19 is None:
+                    errors.append("filter.source_types: must not be null")
+                elif not isinstance(v19, (list, tuple)):
+                    errors.append("filter.source_types: expected array")
+                else:
+                    for i20, v20 in enumerate(v19):
+                        if v20 is None:
+                            errors.append(f"filter.source_types[{i20}]: must not be null")
+                        elif not isinstance(v20, str):
+                            errors.append(f"filter.source_types[{i20}]: expected string")
+                        elif v20 not in _ENUM_7:
+                            errors.append(f"filter.source_types[{i20}]: must be one of {sorted(_ENUM_7)}")
+            if 'supplier' in v0:
+                v21 = v0['supplier']
+                if v21 is None:
+                    errors.append("filter.supplier: must not be null")
+                elif not isinstance(v21, dict):
+                    errors.append("filter.supplier: expected object")
+                else:
+                    for key in sorted(v21.keys() - _KEYS_8, key=str):
+                        errors.append(f"filter.supplier.{key}: unknown field")
+                    if 'type' not in v21:
+                        errors.append("filter.supplier.type: required")
+                    if 'id' not in v21:
+                        errors.append("filter.supplier.id: required")
+                    if 'id' in v21:
+                        v22 = v21['id']
+                        if v22 is None:
+                            errors.append("filter.supplier.id: must not be null")
+                        elif not isinstance(v22, str):
+                            errors.append("filter.supplier.id: expected string")
+                    if 'type' in v21:
+                        v23 = v21['type']
+                        if v23 is None:
+                            errors.append("filter.supplier.type: must not be null")
+                        elif not isinstance(v23, str):
+                            errors.append("filter.supplier.type: expected string")
+                        elif v23 not in _ENUM_9:
+                            errors.append(f"filter.supplier.type: must be one of {sorted(_ENUM_9)}")
+            if 'term' in v0:
+                v24 = v0['term']
+                if v24 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v24, str):
+                    errors.append("filter.term: expected string")
+    if 'page' in body:
+        v25 = body['page']
+        if v25 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v25, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v25.keys() - _KEYS_10, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v25:
+                v26 = v25['number']
+                if v26 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v26, bool) or not isinstance(v26, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v25:
+                v27 = v25['size']
+                if v27 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v27, bool) or not isinstance(v27, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v28 = body['sort']
+        if v28 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v28, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i29, v29 in enumerate(v28):
+                if v29 is None:
+                    errors.append(f"sort[{i29}]: must not be null")
+                elif not isinstance(v29, dict):
+                    errors.append(f"sort[{i29}]: expected object")
+                else:
+                    for key in sorted(v29.keys() - _KEYS_11, key=str):
+                        errors.append(f"sort[{i29}].{key}: unknown field")
+                    if 'field' not in v29:
+                        errors.append(f"sort[{i29}].field: required")
+                    if 'field' in v29:
+                        v30 = v29['field']
+                        if v30 is None:
+                            errors.append(f"sort[{i29}].field: must not be null")
+                        elif not isinstance(v30, str) or v30 not in _ENUM_12:
+                            errors.append(f"sort[{i29}].field: must be one of {sorted(_ENUM_12)}")
+                    if 'order' in v29:
+                        v31 = v29['order']
+                        if v31 is None:
+                            errors.append(f"sort[{i29}].order: must not be null")
+                        elif not isinstance(v31, str):
+                            errors.append(f"sort[{i29}].order: expected string")
+                        elif v31 not in _ENUM_13:
+                            errors.append(f"sort[{i29}].order: must be one of {sorted(_ENUM_13)}")
+
+
+VALIDATORS = {
+    'expenses.list': _expenses_list,
+}
+# fmt: on
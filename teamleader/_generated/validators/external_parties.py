@@ -0,0 +1,144 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'customer', 'function', 'project_id', 'sub_function'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'company', 'contact'})
+_KEYS_3 = frozenset({'id'})
+_KEYS_4 = frozenset({'customer', 'function', 'id', 'sub_function'})
+
+
+def _nextgenprojectsexternalparties_addtoproject(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'customer' not in body:
+        errors.append("customer: required")
+    if 'project_id' not in body:
+        errors.append("project_id: required")
+    if 'customer' in body:
+        v0 = body['customer']
+        if v0 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v0:
+                errors.append("customer.type: required")
+            if 'id' not in v0:
+                errors.append("customer.id: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("customer.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_2)}")
+    if 'function' in body:
+        v3 = body['function']
+        if v3 is None:
+            errors.append("function: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("function: expected string")
+    if 'project_id' in body:
+        v4 = body['project_id']
+        if v4 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("project_id: expected string")
+    if 'sub_function' in body:
+        v5 = body['sub_function']
+        if v5 is None:
+            errors.append("sub_function: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("sub_function: expected string")
+
+
+def _nextgenprojectsexternalparties_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectsexternalparties_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'customer' in body:
+        v0 = body['customer']
+        if v0 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v0:
+                errors.append("customer.type: required")
+            if 'id' not in v0:
+                errors.append("customer.id: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("customer.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_2)}")
+    if 'function' in body:
+        v3 = body['function']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, str):
+            errors.append("function: expected string")
+    if 'id' in body:
+        v4 = body['id']
+        if v4 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("id: expected string")
+    if 'sub_function' in body:
+        v5 = body['sub_function']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("sub_function: expected string")
+
+
+VALIDATORS = {
+    'NextgenProjectsExternalParties.addToProject': _nextgenprojectsexternalparties_addtoproject,
+    'NextgenProjectsExternalParties.delete': _nextgenprojectsexternalparties_delete,
+    'NextgenProjectsExternalParties.update': _nextgenprojectsexternalparties_update,
+}
+# fmt: on
@@ -0,0 +1,232 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({'filter', 'page', 'sort'})
+_KEYS_2 = frozenset({'subject'})
+_KEYS_3 = frozenset({'id', 'type'})
+_ENUM_4 = frozenset({
+    'company',
+    'contact',
+    'creditNote',
+    'deal',
+    'invoice',
+    'nextgenProject',
+    'product',
+    'project',
+    'ticket',
+})
+_KEYS_5 = frozenset({'number', 'size'})
+_KEYS_6 = frozenset({'field', 'order'})
+_ENUM_7 = frozenset({'updated_at'})
+_ENUM_8 = frozenset({'desc'})
+_KEYS_9 = frozenset({'folder', 'name', 'subject'})
+_ENUM_10 = frozenset({
+    'company',
+    'contact',
+    'creditNote',
+    'deal',
+    'invoice',
+    'nextgenProject',
+    'temporary',
+    'ticket',
+})
+
+
+def _files_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _files_download(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _files_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _files_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' not in body:
+        errors.append("filter: required")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'subject' not in v0:
+                errors.append("filter.subject: required")
+            if 'subject' in v0:
+                v1 = v0['subject']
+                if v1 is None:
+                    errors.append("filter.subject: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.subject: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_3, key=str):
+                        errors.append(f"filter.subject.{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append("filter.subject.id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.subject.id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.subject.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.subject.type: expected string")
+                        elif v3 not in _ENUM_4:
+                            errors.append(f"filter.subject.type: must be one of {sorted(_ENUM_4)}")
+    if 'page' in body:
+        v4 = body['page']
+        if v4 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_5, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v4:
+                v5 = v4['number']
+                if v5 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v4:
+                v6 = v4['size']
+                if v6 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v7 = body['sort']
+        if v7 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v7, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i8, v8 in enumerate(v7):
+                if v8 is None:
+                    errors.append(f"sort[{i8}]: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append(f"sort[{i8}]: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_6, key=str):
+                        errors.append(f"sort[{i8}].{key}: unknown field")
+                    if 'field' not in v8:
+                        errors.append(f"sort[{i8}].field: required")
+                    if 'field' in v8:
+                        v9 = v8['field']
+                        if v9 is None:
+                            errors.append(f"sort[{i8}].field: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"sort[{i8}].field: expected string")
+                        elif v9 not in _ENUM_7:
+                            errors.append(f"sort[{i8}].field: must be one of {sorted(_ENUM_7)}")
+                    if 'order' in v8:
+                        v10 = v8['order']
+                        if v10 is None:
+                            errors.append(f"sort[{i8}].order: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"sort[{i8}].order: expected string")
+                        elif v10 not in _ENUM_8:
+                            errors.append(f"sort[{i8}].order: must be one of {sorted(_ENUM_8)}")
+
+
+def _files_upload(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'name' not in body:
+        errors.append("name: required")
+    if 'subject' not in body:
+        errors.append("subject: required")
+    if 'folder' in body:
+        v0 = body['folder']
+        if v0 is None:
+            errors.append("folder: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("folder: expected string")
+    if 'name' in body:
+        v1 = body['name']
+        if v1 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("name: expected string")
+    if 'subject' in body:
+        v2 = body['subject']
+        if v2 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("subject: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_3, key=str):
+                errors.append(f"subject.{key}: unknown field")
+            if 'id' not in v2:
+                errors.append("subject.id: required")
+            if 'type' not in v2:
+                errors.append("subject.type: required")
+            if 'id' in v2:
+                v3 = v2['id']
+                if v3 is None:
+                    errors.append("subject.id: must not be null")
+            if 'type' in v2:
+                v4 = v2['type']
+                if v4 is None:
+                    errors.append("subject.type: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("subject.type: expected string")
+                elif v4 not in _ENUM_10:
+                    errors.append(f"subject.type: must be one of {sorted(_ENUM_10)}")
+
+
+VALIDATORS = {
+    'files.delete': _files_delete,
+    'files.download': _files_download,
+    'files.info': _files_info,
+    'files.list': _files_list,
+    'files.upload': _files_upload,
+}
+# fmt: on
@@ -0,0 +1,600 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'assignee', 'id'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'team', 'user'})
+_KEYS_3 = frozenset({
+    'assignees',
+    'billing_method',
+    'color',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'internal_budget',
+    'project_id',
+    'start_date',
+    'title',
+})
+_ENUM_4 = frozenset({
+    'fixed_price',
+    'non_billable',
+    'parent_fixed_price',
+    'time_and_materials',
+})
+_ENUM_5 = frozenset({
+    '#004DA6',
+    '#0071F2',
+    '#008A8C',
+    '#00B2B2',
+    '#1A1C20',
+    '#64788F',
+    '#82828C',
+    '#992600',
+    '#A400B2',
+    '#C0C0C4',
+    '#D157D3',
+    '#ED9E00',
+})
+_KEYS_6 = frozenset({'amount', 'currency'})
+_ENUM_7 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_8 = frozenset({'delete_strategy', 'id'})
+_ENUM_9 = frozenset({
+    'delete_tasks_and_materials',
+    'delete_tasks_materials_and_unbilled_timetrackings',
+    'ungroup_tasks_and_materials',
+})
+_KEYS_10 = frozenset({'origin_id'})
+_KEYS_11 = frozenset({'id'})
+_KEYS_12 = frozenset({'filter'})
+_KEYS_13 = frozenset({'ids', 'project_id'})
+_KEYS_14 = frozenset({
+    'billing_method',
+    'color',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'id',
+    'internal_budget',
+    'start_date',
+    'title',
+})
+_KEYS_15 = frozenset({'update_strategy', 'value'})
+_ENUM_16 = frozenset({'cascade', 'none'})
+
+
+def _projectgroups_assign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _projectgroups_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'project_id' not in body:
+        errors.append("project_id: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'assignees' in body:
+        v0 = body['assignees']
+        if v0 is None:
+            errors.append("assignees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("assignees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"assignees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"assignees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"assignees[{i1}].{key}: unknown field")
+                    if 'id' not in v1:
+                        errors.append(f"assignees[{i1}].id: required")
+                    if 'type' not in v1:
+                        errors.append(f"assignees[{i1}].type: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"assignees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"assignees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"assignees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"assignees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_2:
+                            errors.append(f"assignees[{i1}].type: must be one of {sorted(_ENUM_2)}")
+    if 'billing_method' in body:
+        v4 = body['billing_method']
+        if v4 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("billing_method: expected string")
+        elif v4 not in _ENUM_4:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_4)}")
+    if 'color' in body:
+        v5 = body['color']
+        if v5 is None:
+            errors.append("color: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("color: expected string")
+        elif v5 not in _ENUM_5:
+            errors.append(f"color: must be one of {sorted(_ENUM_5)}")
+    if 'description' in body:
+        v6 = body['description']
+        if v6 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v7 = body['end_date']
+        if v7 is None:
+            errors.append("end_date: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v8 = body['external_budget']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_6, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v8:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v8:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v8:
+                v9 = v8['amount']
+                if v9 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v9, bool) or not isinstance(v9, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v8:
+                v10 = v8['currency']
+                if v10 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v10 not in _ENUM_7:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_7)}")
+    if 'fixed_price' in body:
+        v11 = body['fixed_price']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_6, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v11:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v11:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v11:
+                v12 = v11['amount']
+                if v12 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v11:
+                v13 = v11['currency']
+                if v13 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v13 not in _ENUM_7:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_7)}")
+    if 'internal_budget' in body:
+        v14 = body['internal_budget']
+        if v14 is None:
+            pass
+        elif not isinstance(v14, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_6, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v14:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v14:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v14:
+                v15 = v14['amount']
+                if v15 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v15, bool) or not isinstance(v15, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v14:
+                v16 = v14['currency']
+                if v16 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v16, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v16 not in _ENUM_7:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_7)}")
+    if 'project_id' in body:
+        v17 = body['project_id']
+        if v17 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("project_id: expected string")
+    if 'start_date' in body:
+        v18 = body['start_date']
+        if v18 is None:
+            errors.append("start_date: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("start_date: expected string")
+    if 'title' in body:
+        v19 = body['title']
+        if v19 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("title: expected string")
+
+
+def _projectgroups_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'delete_strategy' not in body:
+        errors.append("delete_strategy: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'delete_strategy' in body:
+        v0 = body['delete_strategy']
+        if v0 is None:
+            errors.append("delete_strategy: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("delete_strategy: expected string")
+        elif v0 not in _ENUM_9:
+            errors.append(f"delete_strategy: must be one of {sorted(_ENUM_9)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _projectgroups_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'origin_id' not in body:
+        errors.append("origin_id: required")
+    if 'origin_id' in body:
+        v0 = body['origin_id']
+        if v0 is None:
+            errors.append("origin_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("origin_id: expected string")
+
+
+def _projectgroups_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _projectgroups_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_13, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'project_id' in v0:
+                v3 = v0['project_id']
+                if v3 is None:
+                    errors.append("filter.project_id: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("filter.project_id: expected string")
+
+
+def _projectgroups_unassign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _projectgroups_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_14, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'billing_method' in body:
+        v0 = body['billing_method']
+        if v0 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("billing_method: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_15, key=str):
+                errors.append(f"billing_method.{key}: unknown field")
+            if 'update_strategy' not in v0:
+                errors.append("billing_method.update_strategy: required")
+            if 'value' not in v0:
+                errors.append("billing_method.value: required")
+            if 'update_strategy' in v0:
+                v1 = v0['update_strategy']
+                if v1 is None:
+                    errors.append("billing_method.update_strategy: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("billing_method.update_strategy: expected string")
+                elif v1 not in _ENUM_16:
+                    errors.append(f"billing_method.update_strategy: must be one of {sorted(_ENUM_16)}")
+            if 'value' in v0:
+                v2 = v0['value']
+                if v2 is None:
+                    errors.append("billing_method.value: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("billing_method.value: expected string")
+                elif v2 not in _ENUM_4:
+                    errors.append(f"billing_method.value: must be one of {sorted(_ENUM_4)}")
+    if 'color' in body:
+        v3 = body['color']
+        if v3 is None:
+            errors.append("color: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("color: expected string")
+        elif v3 not in _ENUM_5:
+            errors.append(f"color: must be one of {sorted(_ENUM_5)}")
+    if 'description' in body:
+        v4 = body['description']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v5 = body['end_date']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v6 = body['external_budget']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v6.keys() - _KEYS_6, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v6:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v6:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v6:
+                v7 = v6['amount']
+                if v7 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v6:
+                v8 = v6['currency']
+                if v8 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v8 not in _ENUM_7:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_7)}")
+    if 'fixed_price' in body:
+        v9 = body['fixed_price']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_6, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v9:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v9:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v9:
+                v10 = v9['amount']
+                if v10 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v9:
+                v11 = v9['currency']
+                if v11 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v11 not in _ENUM_7:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_7)}")
+    if 'id' in body:
+        v12 = body['id']
+        if v12 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("id: expected string")
+    if 'internal_budget' in body:
+        v13 = body['internal_budget']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v13.keys() - _KEYS_6, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v13:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v13:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v13:
+                v14 = v13['amount']
+                if v14 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v13:
+                v15 = v13['currency']
+                if v15 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v15 not in _ENUM_7:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_7)}")
+    if 'start_date' in body:
+        v16 = body['start_date']
+        if v16 is None:
+            pass
+        elif not isinstance(v16, str):
+            errors.append("start_date: expected string")
+    if 'title' in body:
+        v17 = body['title']
+        if v17 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("title: expected string")
+
+
+VALIDATORS = {
+    'projectGroups.assign': _projectgroups_assign,
+    'projectGroups.create': _projectgroups_create,
+    'projectGroups.delete': _projectgroups_delete,
+    'projectGroups.duplicate': _projectgroups_duplicate,
+    'projectGroups.info': _projectgroups_info,
+    'projectGroups.list': _projectgroups_list,
+    'projectGroups.unassign': _projectgroups_unassign,
+    'projectGroups.update': _projectgroups_update,
+}
+# fmt: on
@@ -0,0 +1,590 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'company_entity_id',
+    'currency',
+    'document_number',
+    'due_date',
+    'file_id',
+    'iban_number',
+    'invoice_date',
+    'payment_reference',
+    'supplier_id',
+    'title',
+    'total',
+})
+_KEYS_1 = frozenset({'code'})
+_ENUM_2 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_3 = frozenset({'tax_exclusive', 'tax_inclusive'})
+_KEYS_4 = frozenset({'amount'})
+_KEYS_5 = frozenset({'id'})
+_KEYS_6 = frozenset({'id', 'paid_at', 'payment', 'payment_method_id', 'remark'})
+_KEYS_7 = frozenset({'amount', 'currency'})
+_KEYS_8 = frozenset({'id', 'payment_id'})
+_KEYS_9 = frozenset({
+    'company_entity_id',
+    'currency',
+    'document_number',
+    'due_date',
+    'file_id',
+    'iban_number',
+    'id',
+    'invoice_date',
+    'payment_reference',
+    'supplier_id',
+    'title',
+    'total',
+})
+_KEYS_10 = frozenset({
+    'id',
+    'paid_at',
+    'payment',
+    'payment_id',
+    'payment_method_id',
+    'remark',
+})
+
+
+def _incomingcreditnotes_add(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'currency' not in body:
+        errors.append("currency: required")
+    if 'company_entity_id' in body:
+        v0 = body['company_entity_id']
+        if v0 is None:
+            errors.append("company_entity_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("company_entity_id: expected string")
+    if 'currency' in body:
+        v1 = body['currency']
+        if v1 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v1:
+                errors.append("currency.code: required")
+            if 'code' in v1:
+                v2 = v1['code']
+                if v2 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("currency.code: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+    if 'document_number' in body:
+        v3 = body['document_number']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, str):
+            errors.append("document_number: expected string")
+    if 'due_date' in body:
+        v4 = body['due_date']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("due_date: expected string")
+    if 'file_id' in body:
+        v5 = body['file_id']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("file_id: expected string")
+    if 'iban_number' in body:
+        v6 = body['iban_number']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("iban_number: expected string")
+    if 'invoice_date' in body:
+        v7 = body['invoice_date']
+        if v7 is None:
+            pass
+        elif not isinstance(v7, str):
+            errors.append("invoice_date: expected string")
+    if 'payment_reference' in body:
+        v8 = body['payment_reference']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("payment_reference: expected string")
+    if 'supplier_id' in body:
+        v9 = body['supplier_id']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, str):
+            errors.append("supplier_id: expected string")
+    if 'title' in body:
+        v10 = body['title']
+        if v10 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("title: expected string")
+    if 'total' in body:
+        v11 = body['total']
+        if v11 is None:
+            errors.append("total: must not be null")
+        elif not isinstance(v11, dict):
+            errors.append("total: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_3, key=str):
+                errors.append(f"total.{key}: unknown field")
+            if 'tax_exclusive' in v11:
+                v12 = v11['tax_exclusive']
+                if v12 is None:
+                    pass
+                elif not isinstance(v12, dict):
+                    errors.append("total.tax_exclusive: expected object")
+                else:
+                    for key in sorted(v12.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_exclusive.{key}: unknown field")
+                    if 'amount' not in v12:
+                        errors.append("total.tax_exclusive.amount: required")
+                    if 'amount' in v12:
+                        v13 = v12['amount']
+                        if v13 is None:
+                            errors.append("total.tax_exclusive.amount: must not be null")
+                        elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                            errors.append("total.tax_exclusive.amount: expected number")
+            if 'tax_inclusive' in v11:
+                v14 = v11['tax_inclusive']
+                if v14 is None:
+                    pass
+                elif not isinstance(v14, dict):
+                    errors.append("total.tax_inclusive: expected object")
+                else:
+                    for key in sorted(v14.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_inclusive.{key}: unknown field")
+                    if 'amount' not in v14:
+                        errors.append("total.tax_inclusive.amount: required")
+                    if 'amount' in v14:
+                        v15 = v14['amount']
+                        if v15 is None:
+                            errors.append("total.tax_inclusive.amount: must not be null")
+                        elif isinstance(v15, bool) or not isinstance(v15, (int, float)):
+                            errors.append("total.tax_inclusive.amount: expected number")
+
+
+def _incomingcreditnotes_approve(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_listpayments(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_markaspendingreview(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_refuse(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_registerpayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment' not in body:
+        errors.append("payment: required")
+    if 'paid_at' not in body:
+        errors.append("paid_at: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'paid_at' in body:
+        v1 = body['paid_at']
+        if v1 is None:
+            errors.append("paid_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("paid_at: expected string")
+    if 'payment' in body:
+        v2 = body['payment']
+        if v2 is None:
+            errors.append("payment: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("payment: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_7, key=str):
+                errors.append(f"payment.{key}: unknown field")
+            if 'amount' not in v2:
+                errors.append("payment.amount: required")
+            if 'currency' not in v2:
+                errors.append("payment.currency: required")
+            if 'amount' in v2:
+                v3 = v2['amount']
+                if v3 is None:
+                    errors.append("payment.amount: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("payment.amount: expected number")
+            if 'currency' in v2:
+                v4 = v2['currency']
+                if v4 is None:
+                    errors.append("payment.currency: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("payment.currency: expected string")
+                elif v4 not in _ENUM_2:
+                    errors.append(f"payment.currency: must be one of {sorted(_ENUM_2)}")
+    if 'payment_method_id' in body:
+        v5 = body['payment_method_id']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("payment_method_id: expected string")
+    if 'remark' in body:
+        v6 = body['remark']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("remark: expected string")
+
+
+def _incomingcreditnotes_removepayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment_id' not in body:
+        errors.append("payment_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'payment_id' in body:
+        v1 = body['payment_id']
+        if v1 is None:
+            errors.append("payment_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("payment_id: expected string")
+
+
+def _incomingcreditnotes_sendtobookkeeping(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _incomingcreditnotes_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'company_entity_id' in body:
+        v0 = body['company_entity_id']
+        if v0 is None:
+            errors.append("company_entity_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("company_entity_id: expected string")
+    if 'currency' in body:
+        v1 = body['currency']
+        if v1 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v1:
+                errors.append("currency.code: required")
+            if 'code' in v1:
+                v2 = v1['code']
+                if v2 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("currency.code: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+    if 'document_number' in body:
+        v3 = body['document_number']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, str):
+            errors.append("document_number: expected string")
+    if 'due_date' in body:
+        v4 = body['due_date']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("due_date: expected string")
+    if 'file_id' in body:
+        v5 = body['file_id']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("file_id: expected string")
+    if 'iban_number' in body:
+        v6 = body['iban_number']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("iban_number: expected string")
+    if 'id' in body:
+        v7 = body['id']
+        if v7 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("id: expected string")
+    if 'invoice_date' in body:
+        v8 = body['invoice_date']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("invoice_date: expected string")
+    if 'payment_reference' in body:
+        v9 = body['payment_reference']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, str):
+            errors.append("payment_reference: expected string")
+    if 'supplier_id' in body:
+        v10 = body['supplier_id']
+        if v10 is None:
+            pass
+        elif not isinstance(v10, str):
+            errors.append("supplier_id: expected string")
+    if 'title' in body:
+        v11 = body['title']
+        if v11 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("title: expected string")
+    if 'total' in body:
+        v12 = body['total']
+        if v12 is None:
+            errors.append("total: must not be null")
+        elif not isinstance(v12, dict):
+            errors.append("total: expected object")
+        else:
+            for key in sorted(v12.keys() - _KEYS_3, key=str):
+                errors.append(f"total.{key}: unknown field")
+            if 'tax_exclusive' in v12:
+                v13 = v12['tax_exclusive']
+                if v13 is None:
+                    pass
+                elif not isinstance(v13, dict):
+                    errors.append("total.tax_exclusive: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_exclusive.{key}: unknown field")
+                    if 'amount' not in v13:
+                        errors.append("total.tax_exclusive.amount: required")
+                    if 'amount' in v13:
+                        v14 = v13['amount']
+                        if v14 is None:
+                            errors.append("total.tax_exclusive.amount: must not be null")
+                        elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                            errors.append("total.tax_exclusive.amount: expected number")
+            if 'tax_inclusive' in v12:
+                v15 = v12['tax_inclusive']
+                if v15 is None:
+                    pass
+                elif not isinstance(v15, dict):
+                    errors.append("total.tax_inclusive: expected object")
+                else:
+                    for key in sorted(v15.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_inclusive.{key}: unknown field")
+                    if 'amount' not in v15:
+                        errors.append("total.tax_inclusive.amount: required")
+                    if 'amount' in v15:
+                        v16 = v15['amount']
+                        if v16 is None:
+                            errors.append("total.tax_inclusive.amount: must not be null")
+                        elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                            errors.append("total.tax_inclusive.amount: expected number")
+
+
+def _incomingcreditnotes_updatepayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment_id' not in body:
+        errors.append("payment_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'paid_at' in body:
+        v1 = body['paid_at']
+        if v1 is None:
+            errors.append("paid_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("paid_at: expected string")
+    if 'payment' in body:
+        v2 = body['payment']
+        if v2 is None:
+            errors.append("payment: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("payment: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_7, key=str):
+                errors.append(f"payment.{key}: unknown field")
+            if 'amount' not in v2:
+                errors.append("payment.amount: required")
+            if 'currency' not in v2:
+                errors.append("payment.currency: required")
+            if 'amount' in v2:
+                v3 = v2['amount']
+                if v3 is None:
+                    errors.append("payment.amount: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("payment.amount: expected number")
+            if 'currency' in v2:
+                v4 = v2['currency']
+                if v4 is None:
+                    errors.append("payment.currency: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("payment.currency: expected string")
+                elif v4 not in _ENUM_2:
+                    errors.append(f"payment.currency: must be one of {sorted(_ENUM_2)}")
+    if 'payment_id' in body:
+        v5 = body['payment_id']
+        if v5 is None:
+            errors.append("payment_id: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("payment_id: expected string")
+    if 'payment_method_id' in body:
+        v6 = body['payment_method_id']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("payment_method_id: expected string")
+    if 'remark' in body:
+        v7 = body['remark']
+        if v7 is None:
+            pass
+        elif not isinstance(v7, str):
+            errors.append("remark: expected string")
+
+
+VALIDATORS = {
+    'incomingCreditNotes.add': _incomingcreditnotes_add,
+    'incomingCreditNotes.approve': _incomingcreditnotes_approve,
+    'incomingCreditNotes.delete': _incomingcreditnotes_delete,
+    'incomingCreditNotes.info': _incomingcreditnotes_info,
+    'incomingCreditNotes.listPayments': _incomingcreditnotes_listpayments,
+    'incomingCreditNotes.markAsPendingReview': _incomingcreditnotes_markaspendingreview,
+    'incomingCreditNotes.refuse': _incomingcreditnotes_refuse,
+    'incomingCreditNotes.registerPayment': _incomingcreditnotes_registerpayment,
+    'incomingCreditNotes.removePayment': _incomingcreditnotes_removepayment,
+    'incomingCreditNotes.sendToBookkeeping': _incomingcreditnotes_sendtobookkeeping,
+    'incomingCreditNotes.update': _incomingcreditnotes_update,
+    'incomingCreditNotes.updatePayment': _incomingcreditnotes_updatepayment,
+}
+# fmt: on
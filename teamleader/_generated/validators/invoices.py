@@ -0,0 +1,2164 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id', 'on'})
+_KEYS_1 = frozenset({'id'})
+_KEYS_2 = frozenset({'credit_note_date', 'id'})
+_KEYS_3 = frozenset({'credit_note_date', 'discounts', 'grouped_lines', 'id'})
+_KEYS_4 = frozenset({'description', 'type', 'value'})
+_ENUM_5 = frozenset({'percentage'})
+_KEYS_6 = frozenset({'line_items', 'section'})
+_KEYS_7 = frozenset({
+    'description',
+    'discount',
+    'extended_description',
+    'product_category_id',
+    'product_id',
+    'quantity',
+    'tax_rate_id',
+    'unit_of_measure_id',
+    'unit_price',
+    'withholding_tax_rate_id',
+})
+_KEYS_8 = frozenset({'type', 'value'})
+_KEYS_9 = frozenset({'amount', 'tax'})
+_ENUM_10 = frozenset({'excluding'})
+_KEYS_11 = frozenset({'title'})
+_KEYS_12 = frozenset({'format', 'id'})
+_ENUM_13 = frozenset({'pdf', 'ubl/e-fff', 'ubl/peppol_bis_3'})
+_KEYS_14 = frozenset({
+    'currency',
+    'custom_fields',
+    'delivery_date',
+    'department_id',
+    'discounts',
+    'document_template_id',
+    'expected_payment_method',
+    'grouped_lines',
+    'invoice_date',
+    'invoicee',
+    'note',
+    'payment_term',
+    'project_id',
+    'purchase_order_number',
+})
+_KEYS_15 = frozenset({'code', 'exchange_rate'})
+_ENUM_16 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_17 = frozenset({'id', 'value'})
+_KEYS_18 = frozenset({'id', 'type'})
+_ENUM_19 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_20 = frozenset({'method', 'reference'})
+_ENUM_21 = frozenset({'credit_card', 'direct_debit', 'sepa_direct_debit'})
+_KEYS_22 = frozenset({'method'})
+_ENUM_23 = frozenset({
+    'bank_transfer',
+    'bankers_draft',
+    'cash',
+    'cheque',
+    'payment_card',
+})
+_KEYS_24 = frozenset({'customer', 'for_attention_of'})
+_ENUM_25 = frozenset({'company', 'contact'})
+_KEYS_26 = frozenset({'name'})
+_KEYS_27 = frozenset({'contact_id'})
+_KEYS_28 = frozenset({'days', 'type'})
+_ENUM_29 = frozenset({'after_invoice_date', 'cash', 'end_of_month'})
+_KEYS_30 = frozenset({'id', 'includes'})
+_KEYS_31 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_32 = frozenset({
+    'customer',
+    'deal_id',
+    'department_id',
+    'ids',
+    'invoice_date_after',
+    'invoice_date_before',
+    'invoice_number',
+    'payment_reference',
+    'project_id',
+    'purchase_order_number',
+    'status',
+    'subscription_id',
+    'term',
+    'updated_since',
+})
+_ENUM_33 = frozenset({'draft', 'matched', 'outstanding'})
+_KEYS_34 = frozenset({'number', 'size'})
+_KEYS_35 = frozenset({'field', 'order'})
+_ENUM_36 = frozenset({'invoice_date', 'invoice_number'})
+_ENUM_37 = frozenset({'asc', 'desc'})
+_KEYS_38 = frozenset({'id', 'paid_at', 'payment', 'payment_method_id'})
+_KEYS_39 = frozenset({'amount', 'currency'})
+_KEYS_40 = frozenset({'attachments', 'content', 'id', 'recipients'})
+_KEYS_41 = frozenset({'body', 'mail_template_id', 'subject'})
+_KEYS_42 = frozenset({'bcc', 'cc', 'to'})
+_KEYS_43 = frozenset({'customer', 'email'})
+_KEYS_44 = frozenset({
+    'currency',
+    'custom_fields',
+    'delivery_date',
+    'discounts',
+    'document_template_id',
+    'expected_payment_method',
+    'grouped_lines',
+    'id',
+    'invoice_date',
+    'invoicee',
+    'note',
+    'payment_term',
+    'project_id',
+    'purchase_order_number',
+})
+_KEYS_45 = frozenset({
+    'custom_fields',
+    'grouped_lines',
+    'id',
+    'invoice_date',
+    'invoicee',
+    'note',
+    'payment_term',
+    'project_id',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_18, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_19:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_19)}")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        pass
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_20, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'method' in v0:
+            v1 = v0['method']
+            if v1 is None:
+                errors.append(f"{path}.method: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.method: expected string")
+            elif v1 not in _ENUM_21:
+                errors.append(f"{path}.method: must be one of {sorted(_ENUM_21)}")
+        if 'reference' in v0:
+            v2 = v0['reference']
+            if v2 is None:
+                pass
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.reference: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        pass
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_22, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'method' in v0:
+            v1 = v0['method']
+            if v1 is None:
+                errors.append(f"{path}.method: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.method: expected string")
+            elif v1 not in _ENUM_23:
+                errors.append(f"{path}.method: must be one of {sorted(_ENUM_23)}")
+
+
+def _schema_7(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_26, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'name' not in v0:
+            errors.append(f"{path}.name: required")
+        if 'name' in v0:
+            v1 = v0['name']
+            if v1 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.name: expected string")
+
+
+def _schema_8(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_27, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'contact_id' not in v0:
+            errors.append(f"{path}.contact_id: required")
+        if 'contact_id' in v0:
+            v1 = v0['contact_id']
+            if v1 is None:
+                errors.append(f"{path}.contact_id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.contact_id: expected string")
+
+
+def _invoices_book(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'on' not in body:
+        errors.append("on: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'on' in body:
+        v1 = body['on']
+        if v1 is None:
+            errors.append("on: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("on: expected string")
+
+
+def _invoices_copy(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _invoices_credit(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'credit_note_date' in body:
+        v0 = body['credit_note_date']
+        if v0 is None:
+            errors.append("credit_note_date: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("credit_note_date: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _invoices_creditpartially(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'grouped_lines' not in body:
+        errors.append("grouped_lines: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'credit_note_date' in body:
+        v0 = body['credit_note_date']
+        if v0 is None:
+            errors.append("credit_note_date: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("credit_note_date: expected string")
+    if 'discounts' in body:
+        v1 = body['discounts']
+        if v1 is None:
+            errors.append("discounts: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("discounts: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"discounts[{i2}]: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append(f"discounts[{i2}]: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_4, key=str):
+                        errors.append(f"discounts[{i2}].{key}: unknown field")
+                    if 'description' in v2:
+                        v3 = v2['description']
+                        if v3 is None:
+                            errors.append(f"discounts[{i2}].description: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"discounts[{i2}].description: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append(f"discounts[{i2}].type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"discounts[{i2}].type: expected string")
+                        elif v4 not in _ENUM_5:
+                            errors.append(f"discounts[{i2}].type: must be one of {sorted(_ENUM_5)}")
+                    if 'value' in v2:
+                        v5 = v2['value']
+                        if v5 is None:
+                            errors.append(f"discounts[{i2}].value: must not be null")
+                        elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                            errors.append(f"discounts[{i2}].value: expected number")
+    if 'grouped_lines' in body:
+        v6 = body['grouped_lines']
+        if v6 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v6, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i7, v7 in enumerate(v6):
+                if v7 is None:
+                    errors.append(f"grouped_lines[{i7}]: must not be null")
+                elif not isinstance(v7, dict):
+                    errors.append(f"grouped_lines[{i7}]: expected object")
+                else:
+                    for key in sorted(v7.keys() - _KEYS_6, key=str):
+                        errors.append(f"grouped_lines[{i7}].{key}: unknown field")
+                    if 'line_items' not in v7:
+                        errors.append(f"grouped_lines[{i7}].line_items: required")
+                    if 'line_items' in v7:
+                        v8 = v7['line_items']
+                        if v8 is None:
+                            errors.append(f"grouped_lines[{i7}].line_items: must not be null")
+                        elif not isinstance(v8, (list, tuple)):
+                            errors.append(f"grouped_lines[{i7}].line_items: expected array")
+                        else:
+                            for i9, v9 in enumerate(v8):
+                                if v9 is None:
+                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}]: must not be null")
+                                elif not isinstance(v9, dict):
+                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}]: expected object")
+                                else:
+                                    for key in sorted(v9.keys() - _KEYS_7, key=str):
+                                        errors.append(f"grouped_lines[{i7}].line_items[{i9}].{key}: unknown field")
+                                    if 'description' not in v9:
+                                        errors.append(f"grouped_lines[{i7}].line_items[{i9}].description: required")
+                                    if 'quantity' not in v9:
+                                        errors.append(f"grouped_lines[{i7}].line_items[{i9}].quantity: required")
+                                    if 'tax_rate_id' not in v9:
+                                        errors.append(f"grouped_lines[{i7}].line_items[{i9}].tax_rate_id: required")
+                                    if 'description' in v9:
+                                        v10 = v9['description']
+                                        if v10 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].description: must not be null")
+                                        elif not isinstance(v10, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].description: expected string")
+                                    if 'discount' in v9:
+                                        v11 = v9['discount']
+                                        if v11 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount: must not be null")
+                                        elif not isinstance(v11, dict):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount: expected object")
+                                        else:
+                                            for key in sorted(v11.keys() - _KEYS_8, key=str):
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.{key}: unknown field")
+                                            if 'type' not in v11:
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.type: required")
+                                            if 'value' not in v11:
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.value: required")
+                                            if 'type' in v11:
+                                                v12 = v11['type']
+                                                if v12 is None:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.type: must not be null")
+                                                elif not isinstance(v12, str):
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.type: expected string")
+                                                elif v12 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v11:
+                                                v13 = v11['value']
+                                                if v13 is None:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.value: must not be null")
+                                                elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].discount.value: expected number")
+                                    if 'extended_description' in v9:
+                                        v14 = v9['extended_description']
+                                        if v14 is None:
+                                            pass
+                                        elif not isinstance(v14, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].extended_description: expected string")
+                                    if 'product_category_id' in v9:
+                                        v15 = v9['product_category_id']
+                                        if v15 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].product_category_id: must not be null")
+                                        elif not isinstance(v15, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].product_category_id: expected string")
+                                    if 'product_id' in v9:
+                                        v16 = v9['product_id']
+                                        if v16 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].product_id: must not be null")
+                                        elif not isinstance(v16, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].product_id: expected string")
+                                    if 'quantity' in v9:
+                                        v17 = v9['quantity']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].quantity: must not be null")
+                                        elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].quantity: expected number")
+                                    if 'tax_rate_id' in v9:
+                                        v18 = v9['tax_rate_id']
+                                        if v18 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].tax_rate_id: must not be null")
+                                        elif not isinstance(v18, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v9:
+                                        v19 = v9['unit_of_measure_id']
+                                        if v19 is None:
+                                            pass
+                                        elif not isinstance(v19, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v9:
+                                        v20 = v9['unit_price']
+                                        if v20 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price: must not be null")
+                                        elif not isinstance(v20, dict):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v20.keys() - _KEYS_9, key=str):
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v20:
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.amount: required")
+                                            if 'tax' not in v20:
+                                                errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.tax: required")
+                                            if 'amount' in v20:
+                                                v21 = v20['amount']
+                                                if v21 is None:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.amount: must not be null")
+                                                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.amount: expected number")
+                                            if 'tax' in v20:
+                                                v22 = v20['tax']
+                                                if v22 is None:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.tax: must not be null")
+                                                elif not isinstance(v22, str):
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.tax: expected string")
+                                                elif v22 not in _ENUM_10:
+                                                    errors.append(f"grouped_lines[{i7}].line_items[{i9}].unit_price.tax: must be one of {sorted(_ENUM_10)}")
+                                    if 'withholding_tax_rate_id' in v9:
+                                        v23 = v9['withholding_tax_rate_id']
+                                        if v23 is None:
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v23, str):
+                                            errors.append(f"grouped_lines[{i7}].line_items[{i9}].withholding_tax_rate_id: expected string")
+                    if 'section' in v7:
+                        v24 = v7['section']
+                        if v24 is None:
+                            errors.append(f"grouped_lines[{i7}].section: must not be null")
+                        elif not isinstance(v24, dict):
+                            errors.append(f"grouped_lines[{i7}].section: expected object")
+                        else:
+                            for key in sorted(v24.keys() - _KEYS_11, key=str):
+                                errors.append(f"grouped_lines[{i7}].section.{key}: unknown field")
+                            if 'title' not in v24:
+                                errors.append(f"grouped_lines[{i7}].section.title: required")
+                            if 'title' in v24:
+                                v25 = v24['title']
+                                if v25 is None:
+                                    errors.append(f"grouped_lines[{i7}].section.title: must not be null")
+                                elif not isinstance(v25, str):
+                                    errors.append(f"grouped_lines[{i7}].section.title: expected string")
+    if 'id' in body:
+        v26 = body['id']
+        if v26 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v26, str):
+            errors.append("id: expected string")
+
+
+def _invoices_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _invoices_download(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'format' not in body:
+        errors.append("format: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'format' in body:
+        v0 = body['format']
+        if v0 is None:
+            errors.append("format: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("format: expected string")
+        elif v0 not in _ENUM_13:
+            errors.append(f"format: must be one of {sorted(_ENUM_13)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _invoices_draft(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_14, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'department_id' not in body:
+        errors.append("department_id: required")
+    if 'grouped_lines' not in body:
+        errors.append("grouped_lines: required")
+    if 'invoicee' not in body:
+        errors.append("invoicee: required")
+    if 'payment_term' not in body:
+        errors.append("payment_term: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_15, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_16:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_16)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_17, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'delivery_date' in body:
+        v8 = body['delivery_date']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("delivery_date: expected string")
+    if 'department_id' in body:
+        v9 = body['department_id']
+        if v9 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("department_id: expected string")
+    if 'discounts' in body:
+        v10 = body['discounts']
+        if v10 is None:
+            errors.append("discounts: must not be null")
+        elif not isinstance(v10, (list, tuple)):
+            errors.append("discounts: expected array")
+        else:
+            for i11, v11 in enumerate(v10):
+                if v11 is None:
+                    errors.append(f"discounts[{i11}]: must not be null")
+                elif not isinstance(v11, dict):
+                    errors.append(f"discounts[{i11}]: expected object")
+                else:
+                    for key in sorted(v11.keys() - _KEYS_4, key=str):
+                        errors.append(f"discounts[{i11}].{key}: unknown field")
+                    if 'description' in v11:
+                        v12 = v11['description']
+                        if v12 is None:
+                            errors.append(f"discounts[{i11}].description: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append(f"discounts[{i11}].description: expected string")
+                    if 'type' in v11:
+                        v13 = v11['type']
+                        if v13 is None:
+                            errors.append(f"discounts[{i11}].type: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append(f"discounts[{i11}].type: expected string")
+                        elif v13 not in _ENUM_5:
+                            errors.append(f"discounts[{i11}].type: must be one of {sorted(_ENUM_5)}")
+                    if 'value' in v11:
+                        v14 = v11['value']
+                        if v14 is None:
+                            errors.append(f"discounts[{i11}].value: must not be null")
+                        elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                            errors.append(f"discounts[{i11}].value: expected number")
+    if 'document_template_id' in body:
+        v15 = body['document_template_id']
+        if v15 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v15, str):
+            errors.append("document_template_id: expected string")
+    if 'expected_payment_method' in body:
+        v16 = body['expected_payment_method']
+        for check17 in (_schema_5, _schema_6,):
+            branch_errors17: list[str] = []
+            check17(v16, "expected_payment_method", branch_errors17)
+            if not branch_errors17:
+                break
+        else:
+            errors.append("expected_payment_method: does not match any allowed shape")
+    if 'grouped_lines' in body:
+        v18 = body['grouped_lines']
+        if v18 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v18, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i19, v19 in enumerate(v18):
+                if v19 is None:
+                    errors.append(f"grouped_lines[{i19}]: must not be null")
+                elif not isinstance(v19, dict):
+                    errors.append(f"grouped_lines[{i19}]: expected object")
+                else:
+                    for key in sorted(v19.keys() - _KEYS_6, key=str):
+                        errors.append(f"grouped_lines[{i19}].{key}: unknown field")
+                    if 'line_items' not in v19:
+                        errors.append(f"grouped_lines[{i19}].line_items: required")
+                    if 'line_items' in v19:
+                        v20 = v19['line_items']
+                        if v20 is None:
+                            errors.append(f"grouped_lines[{i19}].line_items: must not be null")
+                        elif not isinstance(v20, (list, tuple)):
+                            errors.append(f"grouped_lines[{i19}].line_items: expected array")
+                        else:
+                            for i21, v21 in enumerate(v20):
+                                if v21 is None:
+                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}]: must not be null")
+                                elif not isinstance(v21, dict):
+                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}]: expected object")
+                                else:
+                                    for key in sorted(v21.keys() - _KEYS_7, key=str):
+                                        errors.append(f"grouped_lines[{i19}].line_items[{i21}].{key}: unknown field")
+                                    if 'description' not in v21:
+                                        errors.append(f"grouped_lines[{i19}].line_items[{i21}].description: required")
+                                    if 'quantity' not in v21:
+                                        errors.append(f"grouped_lines[{i19}].line_items[{i21}].quantity: required")
+                                    if 'tax_rate_id' not in v21:
+                                        errors.append(f"grouped_lines[{i19}].line_items[{i21}].tax_rate_id: required")
+                                    if 'description' in v21:
+                                        v22 = v21['description']
+                                        if v22 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].description: must not be null")
+                                        elif not isinstance(v22, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].description: expected string")
+                                    if 'discount' in v21:
+                                        v23 = v21['discount']
+                                        if v23 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount: must not be null")
+                                        elif not isinstance(v23, dict):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount: expected object")
+                                        else:
+                                            for key in sorted(v23.keys() - _KEYS_8, key=str):
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.{key}: unknown field")
+                                            if 'type' not in v23:
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.type: required")
+                                            if 'value' not in v23:
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.value: required")
+                                            if 'type' in v23:
+                                                v24 = v23['type']
+                                                if v24 is None:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.type: must not be null")
+                                                elif not isinstance(v24, str):
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.type: expected string")
+                                                elif v24 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v23:
+                                                v25 = v23['value']
+                                                if v25 is None:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.value: must not be null")
+                                                elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].discount.value: expected number")
+                                    if 'extended_description' in v21:
+                                        v26 = v21['extended_description']
+                                        if v26 is None:
+                                            pass
+                                        elif not isinstance(v26, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].extended_description: expected string")
+                                    if 'product_category_id' in v21:
+                                        v27 = v21['product_category_id']
+                                        if v27 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].product_category_id: must not be null")
+                                        elif not isinstance(v27, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].product_category_id: expected string")
+                                    if 'product_id' in v21:
+                                        v28 = v21['product_id']
+                                        if v28 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].product_id: must not be null")
+                                        elif not isinstance(v28, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].product_id: expected string")
+                                    if 'quantity' in v21:
+                                        v29 = v21['quantity']
+                                        if v29 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].quantity: must not be null")
+                                        elif isinstance(v29, bool) or not isinstance(v29, (int, float)):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].quantity: expected number")
+                                    if 'tax_rate_id' in v21:
+                                        v30 = v21['tax_rate_id']
+                                        if v30 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].tax_rate_id: must not be null")
+                                        elif not isinstance(v30, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v21:
+                                        v31 = v21['unit_of_measure_id']
+                                        if v31 is None:
+                                            pass
+                                        elif not isinstance(v31, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v21:
+                                        v32 = v21['unit_price']
+                                        if v32 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price: must not be null")
+                                        elif not isinstance(v32, dict):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v32.keys() - _KEYS_9, key=str):
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v32:
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.amount: required")
+                                            if 'tax' not in v32:
+                                                errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.tax: required")
+                                            if 'amount' in v32:
+                                                v33 = v32['amount']
+                                                if v33 is None:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.amount: must not be null")
+                                                elif isinstance(v33, bool) or not isinstance(v33, (int, float)):
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.amount: expected number")
+                                            if 'tax' in v32:
+                                                v34 = v32['tax']
+                                                if v34 is None:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.tax: must not be null")
+                                                elif not isinstance(v34, str):
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.tax: expected string")
+                                                elif v34 not in _ENUM_10:
+                                                    errors.append(f"grouped_lines[{i19}].line_items[{i21}].unit_price.tax: must be one of {sorted(_ENUM_10)}")
+                                    if 'withholding_tax_rate_id' in v21:
+                                        v35 = v21['withholding_tax_rate_id']
+                                        if v35 is None:
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v35, str):
+                                            errors.append(f"grouped_lines[{i19}].line_items[{i21}].withholding_tax_rate_id: expected string")
+                    if 'section' in v19:
+                        v36 = v19['section']
+                        if v36 is None:
+                            errors.append(f"grouped_lines[{i19}].section: must not be null")
+                        elif not isinstance(v36, dict):
+                            errors.append(f"grouped_lines[{i19}].section: expected object")
+                        else:
+                            for key in sorted(v36.keys() - _KEYS_11, key=str):
+                                errors.append(f"grouped_lines[{i19}].section.{key}: unknown field")
+                            if 'title' not in v36:
+                                errors.append(f"grouped_lines[{i19}].section.title: required")
+                            if 'title' in v36:
+                                v37 = v36['title']
+                                if v37 is None:
+                                    errors.append(f"grouped_lines[{i19}].section.title: must not be null")
+                                elif not isinstance(v37, str):
+                                    errors.append(f"grouped_lines[{i19}].section.title: expected string")
+    if 'invoice_date' in body:
+        v38 = body['invoice_date']
+        if v38 is None:
+            errors.append("invoice_date: must not be null")
+        elif not isinstance(v38, str):
+            errors.append("invoice_date: expected string")
+    if 'invoicee' in body:
+        v39 = body['invoicee']
+        if v39 is None:
+            errors.append("invoicee: must not be null")
+        elif not isinstance(v39, dict):
+            errors.append("invoicee: expected object")
+        else:
+            for key in sorted(v39.keys() - _KEYS_24, key=str):
+                errors.append(f"invoicee.{key}: unknown field")
+            if 'customer' not in v39:
+                errors.append("invoicee.customer: required")
+            if 'customer' in v39:
+                v40 = v39['customer']
+                if v40 is None:
+                    errors.append("invoicee.customer: must not be null")
+                elif not isinstance(v40, dict):
+                    errors.append("invoicee.customer: expected object")
+                else:
+                    for key in sorted(v40.keys() - _KEYS_18, key=str):
+                        errors.append(f"invoicee.customer.{key}: unknown field")
+                    if 'type' not in v40:
+                        errors.append("invoicee.customer.type: required")
+                    if 'id' not in v40:
+                        errors.append("invoicee.customer.id: required")
+                    if 'id' in v40:
+                        v41 = v40['id']
+                        if v41 is None:
+                            errors.append("invoicee.customer.id: must not be null")
+                        elif not isinstance(v41, str):
+                            errors.append("invoicee.customer.id: expected string")
+                    if 'type' in v40:
+                        v42 = v40['type']
+                        if v42 is None:
+                            errors.append("invoicee.customer.type: must not be null")
+                        elif not isinstance(v42, str):
+                            errors.append("invoicee.customer.type: expected string")
+                        elif v42 not in _ENUM_25:
+                            errors.append(f"invoicee.customer.type: must be one of {sorted(_ENUM_25)}")
+            if 'for_attention_of' in v39:
+                v43 = v39['for_attention_of']
+                for check44 in (_schema_7, _schema_8,):
+                    branch_errors44: list[str] = []
+                    check44(v43, "invoicee.for_attention_of", branch_errors44)
+                    if not branch_errors44:
+                        break
+                else:
+                    errors.append("invoicee.for_attention_of: does not match any allowed shape")
+    if 'note' in body:
+        v45 = body['note']
+        if v45 is None:
+            errors.append("note: must not be null")
+        elif not isinstance(v45, str):
+            errors.append("note: expected string")
+    if 'payment_term' in body:
+        v46 = body['payment_term']
+        if v46 is None:
+            errors.append("payment_term: must not be null")
+        elif not isinstance(v46, dict):
+            errors.append("payment_term: expected object")
+        else:
+            for key in sorted(v46.keys() - _KEYS_28, key=str):
+                errors.append(f"payment_term.{key}: unknown field")
+            if 'days' in v46:
+                v47 = v46['days']
+                if v47 is None:
+                    errors.append("payment_term.days: must not be null")
+                elif isinstance(v47, bool) or not isinstance(v47, (int, float)):
+                    errors.append("payment_term.days: expected number")
+            if 'type' in v46:
+                v48 = v46['type']
+                if v48 is None:
+                    errors.append("payment_term.type: must not be null")
+                elif not isinstance(v48, str):
+                    errors.append("payment_term.type: expected string")
+                elif v48 not in _ENUM_29:
+                    errors.append(f"payment_term.type: must be one of {sorted(_ENUM_29)}")
+    if 'project_id' in body:
+        v49 = body['project_id']
+        if v49 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v49, str):
+            errors.append("project_id: expected string")
+    if 'purchase_order_number' in body:
+        v50 = body['purchase_order_number']
+        if v50 is None:
+            errors.append("purchase_order_number: must not be null")
+        elif not isinstance(v50, str):
+            errors.append("purchase_order_number: expected string")
+
+
+def _invoices_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_30, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _invoices_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_31, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_32, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'customer' in v0:
+                v1 = v0['customer']
+                if v1 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_18, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v1:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v1:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v3 not in _ENUM_25:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_25)}")
+            if 'deal_id' in v0:
+                v4 = v0['deal_id']
+                if v4 is None:
+                    errors.append("filter.deal_id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("filter.deal_id: expected string")
+            if 'department_id' in v0:
+                v5 = v0['department_id']
+                if v5 is None:
+                    errors.append("filter.department_id: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.department_id: expected string")
+            if 'ids' in v0:
+                v6 = v0['ids']
+                if v6 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v6, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i7, v7 in enumerate(v6):
+                        if v7 is None:
+                            errors.append(f"filter.ids[{i7}]: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"filter.ids[{i7}]: expected string")
+            if 'invoice_date_after' in v0:
+                v8 = v0['invoice_date_after']
+                if v8 is None:
+                    errors.append("filter.invoice_date_after: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("filter.invoice_date_after: expected string")
+            if 'invoice_date_before' in v0:
+                v9 = v0['invoice_date_before']
+                if v9 is None:
+                    errors.append("filter.invoice_date_before: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("filter.invoice_date_before: expected string")
+            if 'invoice_number' in v0:
+                v10 = v0['invoice_number']
+                if v10 is None:
+                    errors.append("filter.invoice_number: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("filter.invoice_number: expected string")
+            if 'payment_reference' in v0:
+                v11 = v0['payment_reference']
+                if v11 is None:
+                    errors.append("filter.payment_reference: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("filter.payment_reference: expected string")
+            if 'project_id' in v0:
+                v12 = v0['project_id']
+                if v12 is None:
+                    errors.append("filter.project_id: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("filter.project_id: expected string")
+            if 'purchase_order_number' in v0:
+                v13 = v0['purchase_order_number']
+                if v13 is None:
+                    errors.append("filter.purchase_order_number: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("filter.purchase_order_number: expected string")
+            if 'status' in v0:
+                v14 = v0['status']
+                if v14 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v14, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i15, v15 in enumerate(v14):
+                        if v15 is None:
+                            errors.append(f"filter.status[{i15}]: must not be null")
+                        elif not isinstance(v15, str):
+                            errors.append(f"filter.status[{i15}]: expected string")
+                        elif v15 not in _ENUM_33:
+                            errors.append(f"filter.status[{i15}]: must be one of {sorted(_ENUM_33)}")
+            if 'subscription_id' in v0:
+                v16 = v0['subscription_id']
+                if v16 is None:
+                    errors.append("filter.subscription_id: must not be null")
+                elif not isinstance(v16, str):
+                    errors.append("filter.subscription_id: expected string")
+            if 'term' in v0:
+                v17 = v0['term']
+                if v17 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append("filter.term: expected string")
+            if 'updated_since' in v0:
+                v18 = v0['updated_since']
+                if v18 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v18, str):
+                    errors.append("filter.updated_since: expected string")
+    if 'includes' in body:
+        v19 = body['includes']
+        if v19 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v20 = body['page']
+        if v20 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v20, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v20.keys() - _KEYS_34, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v20:
+                v21 = v20['number']
+                if v21 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v20:
+                v22 = v20['size']
+                if v22 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v22, bool) or not isinstance(v22, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v23 = body['sort']
+        if v23 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v23, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i24, v24 in enumerate(v23):
+                if v24 is None:
+                    errors.append(f"sort[{i24}]: must not be null")
+                elif not isinstance(v24, dict):
+                    errors.append(f"sort[{i24}]: expected object")
+                else:
+                    for key in sorted(v24.keys() - _KEYS_35, key=str):
+                        errors.append(f"sort[{i24}].{key}: unknown field")
+                    if 'field' not in v24:
+                        errors.append(f"sort[{i24}].field: required")
+                    if 'field' in v24:
+                        v25 = v24['field']
+                        if v25 is None:
+                            errors.append(f"sort[{i24}].field: must not be null")
+                        elif not isinstance(v25, str):
+                            errors.append(f"sort[{i24}].field: expected string")
+                        elif v25 not in _ENUM_36:
+                            errors.append(f"sort[{i24}].field: must be one of {sorted(_ENUM_36)}")
+                    if 'order' in v24:
+                        v26 = v24['order']
+                        if v26 is None:
+                            errors.append(f"sort[{i24}].order: must not be null")
+                        elif not isinstance(v26, str):
+                            errors.append(f"sort[{i24}].order: expected string")
+                        elif v26 not in _ENUM_37:
+                            errors.append(f"sort[{i24}].order: must be one of {sorted(_ENUM_37)}")
+
+
+def _invoices_registerpayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_38, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'paid_at' not in body:
+        errors.append("paid_at: required")
+    if 'payment' not in body:
+        errors.append("payment: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'paid_at' in body:
+        v1 = body['paid_at']
+        if v1 is None:
+            errors.append("paid_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("paid_at: expected string")
+    if 'payment' in body:
+        v2 = body['payment']
+        if v2 is None:
+            errors.append("payment: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("payment: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_39, key=str):
+                errors.append(f"payment.{key}: unknown field")
+            if 'amount' not in v2:
+                errors.append("payment.amount: required")
+            if 'currency' not in v2:
+                errors.append("payment.currency: required")
+            if 'amount' in v2:
+                v3 = v2['amount']
+                if v3 is None:
+                    errors.append("payment.amount: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("payment.amount: expected number")
+            if 'currency' in v2:
+                v4 = v2['currency']
+                if v4 is None:
+                    errors.append("payment.currency: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("payment.currency: expected string")
+                elif v4 not in _ENUM_16:
+                    errors.append(f"payment.currency: must be one of {sorted(_ENUM_16)}")
+    if 'payment_method_id' in body:
+        v5 = body['payment_method_id']
+        if v5 is None:
+            errors.append("payment_method_id: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("payment_method_id: expected string")
+
+
+def _invoices_removepayments(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _invoices_send(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_40, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'content' not in body:
+        errors.append("content: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'content' in body:
+        v2 = body['content']
+        if v2 is None:
+            errors.append("content: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("content: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_41, key=str):
+                errors.append(f"content.{key}: unknown field")
+            if 'subject' not in v2:
+                errors.append("content.subject: required")
+            if 'body' not in v2:
+                errors.append("content.body: required")
+            if 'body' in v2:
+                v3 = v2['body']
+                if v3 is None:
+                    errors.append("content.body: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("content.body: expected string")
+            if 'mail_template_id' in v2:
+                v4 = v2['mail_template_id']
+                if v4 is None:
+                    pass
+                elif not isinstance(v4, str):
+                    errors.append("content.mail_template_id: expected string")
+            if 'subject' in v2:
+                v5 = v2['subject']
+                if v5 is None:
+                    errors.append("content.subject: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("content.subject: expected string")
+    if 'id' in body:
+        v6 = body['id']
+        if v6 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("id: expected string")
+    if 'recipients' in body:
+        v7 = body['recipients']
+        if v7 is None:
+            errors.append("recipients: must not be null")
+        elif not isinstance(v7, dict):
+            errors.append("recipients: expected object")
+        else:
+            for key in sorted(v7.keys() - _KEYS_42, key=str):
+                errors.append(f"recipients.{key}: unknown field")
+            if 'bcc' in v7:
+                v8 = v7['bcc']
+                if v8 is None:
+                    errors.append("recipients.bcc: must not be null")
+                elif not isinstance(v8, (list, tuple)):
+                    errors.append("recipients.bcc: expected array")
+                else:
+                    for i9, v9 in enumerate(v8):
+                        if v9 is None:
+                            errors.append(f"recipients.bcc[{i9}]: must not be null")
+                        elif not isinstance(v9, dict):
+                            errors.append(f"recipients.bcc[{i9}]: expected object")
+                        else:
+                            for key in sorted(v9.keys() - _KEYS_43, key=str):
+                                errors.append(f"recipients.bcc[{i9}].{key}: unknown field")
+                            if 'email' not in v9:
+                                errors.append(f"recipients.bcc[{i9}].email: required")
+                            if 'customer' in v9:
+                                v10 = v9['customer']
+                                if v10 is None:
+                                    pass
+                                elif not isinstance(v10, dict):
+                                    errors.append(f"recipients.bcc[{i9}].customer: expected object")
+                                else:
+                                    for key in sorted(v10.keys() - _KEYS_18, key=str):
+                                        errors.append(f"recipients.bcc[{i9}].customer.{key}: unknown field")
+                                    if 'id' not in v10:
+                                        errors.append(f"recipients.bcc[{i9}].customer.id: required")
+                                    if 'type' not in v10:
+                                        errors.append(f"recipients.bcc[{i9}].customer.type: required")
+                                    if 'id' in v10:
+                                        v11 = v10['id']
+                                        if v11 is None:
+                                            errors.append(f"recipients.bcc[{i9}].customer.id: must not be null")
+                                        elif not isinstance(v11, str):
+                                            errors.append(f"recipients.bcc[{i9}].customer.id: expected string")
+                                    if 'type' in v10:
+                                        v12 = v10['type']
+                                        if v12 is None:
+                                            errors.append(f"recipients.bcc[{i9}].customer.type: must not be null")
+                                        elif not isinstance(v12, str):
+                                            errors.append(f"recipients.bcc[{i9}].customer.type: expected string")
+                                        elif v12 not in _ENUM_25:
+                                            errors.append(f"recipients.bcc[{i9}].customer.type: must be one of {sorted(_ENUM_25)}")
+                            if 'email' in v9:
+                                v13 = v9['email']
+                                if v13 is None:
+                                    errors.append(f"recipients.bcc[{i9}].email: must not be null")
+                                elif not isinstance(v13, str):
+                                    errors.append(f"recipients.bcc[{i9}].email: expected string")
+            if 'cc' in v7:
+                v14 = v7['cc']
+                if v14 is None:
+                    errors.append("recipients.cc: must not be null")
+                elif not isinstance(v14, (list, tuple)):
+                    errors.append("recipients.cc: expected array")
+                else:
+                    for i15, v15 in enumerate(v14):
+                        if v15 is None:
+                            errors.append(f"recipients.cc[{i15}]: must not be null")
+                        elif not isinstance(v15, dict):
+                            errors.append(f"recipients.cc[{i15}]: expected object")
+                        else:
+                            for key in sorted(v15.keys() - _KEYS_43, key=str):
+                                errors.append(f"recipients.cc[{i15}].{key}: unknown field")
+                            if 'email' not in v15:
+                                errors.append(f"recipients.cc[{i15}].email: required")
+                            if 'customer' in v15:
+                                v16 = v15['customer']
+                                if v16 is None:
+                                    pass
+                                elif not isinstance(v16, dict):
+                                    errors.append(f"recipients.cc[{i15}].customer: expected object")
+                                else:
+                                    for key in sorted(v16.keys() - _KEYS_18, key=str):
+                                        errors.append(f"recipients.cc[{i15}].customer.{key}: unknown field")
+                                    if 'id' not in v16:
+                                        errors.append(f"recipients.cc[{i15}].customer.id: required")
+                                    if 'type' not in v16:
+                                        errors.append(f"recipients.cc[{i15}].customer.type: required")
+                                    if 'id' in v16:
+                                        v17 = v16['id']
+                                        if v17 is None:
+                                            errors.append(f"recipients.cc[{i15}].customer.id: must not be null")
+                                        elif not isinstance(v17, str):
+                                            errors.append(f"recipients.cc[{i15}].customer.id: expected string")
+                                    if 'type' in v16:
+                                        v18 = v16['type']
+                                        if v18 is None:
+                                            errors.append(f"recipients.cc[{i15}].customer.type: must not be null")
+                                        elif not isinstance(v18, str):
+                                            errors.append(f"recipients.cc[{i15}].customer.type: expected string")
+                                        elif v18 not in _ENUM_25:
+                                            errors.append(f"recipients.cc[{i15}].customer.type: must be one of {sorted(_ENUM_25)}")
+                            if 'email' in v15:
+                                v19 = v15['email']
+                                if v19 is None:
+                                    errors.append(f"recipients.cc[{i15}].email: must not be null")
+                                elif not isinstance(v19, str):
+                                    errors.append(f"recipients.cc[{i15}].email: expected string")
+            if 'to' in v7:
+                v20 = v7['to']
+                if v20 is None:
+                    errors.append("recipients.to: must not be null")
+                elif not isinstance(v20, (list, tuple)):
+                    errors.append("recipients.to: expected array")
+                else:
+                    for i21, v21 in enumerate(v20):
+                        if v21 is None:
+                            errors.append(f"recipients.to[{i21}]: must not be null")
+                        elif not isinstance(v21, dict):
+                            errors.append(f"recipients.to[{i21}]: expected object")
+                        else:
+                            for key in sorted(v21.keys() - _KEYS_43, key=str):
+                                errors.append(f"recipients.to[{i21}].{key}: unknown field")
+                            if 'email' not in v21:
+                                errors.append(f"recipients.to[{i21}].email: required")
+                            if 'customer' in v21:
+                                v22 = v21['customer']
+                                if v22 is None:
+                                    pass
+                                elif not isinstance(v22, dict):
+                                    errors.append(f"recipients.to[{i21}].customer: expected object")
+                                else:
+                                    for key in sorted(v22.keys() - _KEYS_18, key=str):
+                                        errors.append(f"recipients.to[{i21}].customer.{key}: unknown field")
+                                    if 'id' not in v22:
+                                        errors.append(f"recipients.to[{i21}].customer.id: required")
+                                    if 'type' not in v22:
+                                        errors.append(f"recipients.to[{i21}].customer.type: required")
+                                    if 'id' in v22:
+                                        v23 = v22['id']
+                                        if v23 is None:
+                                            errors.append(f"recipients.to[{i21}].customer.id: must not be null")
+                                        elif not isinstance(v23, str):
+                                            errors.append(f"recipients.to[{i21}].customer.id: expected string")
+                                    if 'type' in v22:
+                                        v24 = v22['type']
+                                        if v24 is None:
+                                            errors.append(f"recipients.to[{i21}].customer.type: must not be null")
+                                        elif not isinstance(v24, str):
+                                            errors.append(f"recipients.to[{i21}].customer.type: expected string")
+                                        elif v24 not in _ENUM_25:
+                                            errors.append(f"recipients.to[{i21}].customer.type: must be one of {sorted(_ENUM_25)}")
+                            if 'email' in v21:
+                                v25 = v21['email']
+                                if v25 is None:
+                                    errors.append(f"recipients.to[{i21}].email: must not be null")
+                                elif not isinstance(v25, str):
+                                    errors.append(f"recipients.to[{i21}].email: expected string")
+
+
+def _invoices_sendviapeppol(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _invoices_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_44, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_15, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_16:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_16)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_17, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'delivery_date' in body:
+        v8 = body['delivery_date']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, str):
+            errors.append("delivery_date: expected string")
+    if 'discounts' in body:
+        v9 = body['discounts']
+        if v9 is None:
+            errors.append("discounts: must not be null")
+        elif not isinstance(v9, (list, tuple)):
+            errors.append("discounts: expected array")
+        else:
+            for i10, v10 in enumerate(v9):
+                if v10 is None:
+                    errors.append(f"discounts[{i10}]: must not be null")
+                elif not isinstance(v10, dict):
+                    errors.append(f"discounts[{i10}]: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_4, key=str):
+                        errors.append(f"discounts[{i10}].{key}: unknown field")
+                    if 'description' in v10:
+                        v11 = v10['description']
+                        if v11 is None:
+                            errors.append(f"discounts[{i10}].description: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append(f"discounts[{i10}].description: expected string")
+                    if 'type' in v10:
+                        v12 = v10['type']
+                        if v12 is None:
+                            errors.append(f"discounts[{i10}].type: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append(f"discounts[{i10}].type: expected string")
+                        elif v12 not in _ENUM_5:
+                            errors.append(f"discounts[{i10}].type: must be one of {sorted(_ENUM_5)}")
+                    if 'value' in v10:
+                        v13 = v10['value']
+                        if v13 is None:
+                            errors.append(f"discounts[{i10}].value: must not be null")
+                        elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                            errors.append(f"discounts[{i10}].value: expected number")
+    if 'document_template_id' in body:
+        v14 = body['document_template_id']
+        if v14 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("document_template_id: expected string")
+    if 'expected_payment_method' in body:
+        v15 = body['expected_payment_method']
+        for check16 in (_schema_5, _schema_6,):
+            branch_errors16: list[str] = []
+            check16(v15, "expected_payment_method", branch_errors16)
+            if not branch_errors16:
+                break
+        else:
+            errors.append("expected_payment_method: does not match any allowed shape")
+    if 'grouped_lines' in body:
+        v17 = body['grouped_lines']
+        if v17 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v17, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i18, v18 in enumerate(v17):
+                if v18 is None:
+                    errors.append(f"grouped_lines[{i18}]: must not be null")
+                elif not isinstance(v18, dict):
+                    errors.append(f"grouped_lines[{i18}]: expected object")
+                else:
+                    for key in sorted(v18.keys() - _KEYS_6, key=str):
+                        errors.append(f"grouped_lines[{i18}].{key}: unknown field")
+                    if 'line_items' not in v18:
+                        errors.append(f"grouped_lines[{i18}].line_items: required")
+                    if 'line_items' in v18:
+                        v19 = v18['line_items']
+                        if v19 is None:
+                            errors.append(f"grouped_lines[{i18}].line_items: must not be null")
+                        elif not isinstance(v19, (list, tuple)):
+                            errors.append(f"grouped_lines[{i18}].line_items: expected array")
+                        else:
+                            for i20, v20 in enumerate(v19):
+                                if v20 is None:
+                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}]: must not be null")
+                                elif not isinstance(v20, dict):
+                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}]: expected object")
+                                else:
+                                    for key in sorted(v20.keys() - _KEYS_7, key=str):
+                                        errors.append(f"grouped_lines[{i18}].line_items[{i20}].{key}: unknown field")
+                                    if 'description' not in v20:
+                                        errors.append(f"grouped_lines[{i18}].line_items[{i20}].description: required")
+                                    if 'quantity' not in v20:
+                                        errors.append(f"grouped_lines[{i18}].line_items[{i20}].quantity: required")
+                                    if 'tax_rate_id' not in v20:
+                                        errors.append(f"grouped_lines[{i18}].line_items[{i20}].tax_rate_id: required")
+                                    if 'description' in v20:
+                                        v21 = v20['description']
+                                        if v21 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].description: must not be null")
+                                        elif not isinstance(v21, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].description: expected string")
+                                    if 'discount' in v20:
+                                        v22 = v20['discount']
+                                        if v22 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount: must not be null")
+                                        elif not isinstance(v22, dict):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount: expected object")
+                                        else:
+                                            for key in sorted(v22.keys() - _KEYS_8, key=str):
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.{key}: unknown field")
+                                            if 'type' not in v22:
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.type: required")
+                                            if 'value' not in v22:
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.value: required")
+                                            if 'type' in v22:
+                                                v23 = v22['type']
+                                                if v23 is None:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.type: must not be null")
+                                                elif not isinstance(v23, str):
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.type: expected string")
+                                                elif v23 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v22:
+                                                v24 = v22['value']
+                                                if v24 is None:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.value: must not be null")
+                                                elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].discount.value: expected number")
+                                    if 'extended_description' in v20:
+                                        v25 = v20['extended_description']
+                                        if v25 is None:
+                                            pass
+                                        elif not isinstance(v25, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].extended_description: expected string")
+                                    if 'product_category_id' in v20:
+                                        v26 = v20['product_category_id']
+                                        if v26 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].product_category_id: must not be null")
+                                        elif not isinstance(v26, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].product_category_id: expected string")
+                                    if 'product_id' in v20:
+                                        v27 = v20['product_id']
+                                        if v27 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].product_id: must not be null")
+                                        elif not isinstance(v27, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].product_id: expected string")
+                                    if 'quantity' in v20:
+                                        v28 = v20['quantity']
+                                        if v28 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].quantity: must not be null")
+                                        elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].quantity: expected number")
+                                    if 'tax_rate_id' in v20:
+                                        v29 = v20['tax_rate_id']
+                                        if v29 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].tax_rate_id: must not be null")
+                                        elif not isinstance(v29, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v20:
+                                        v30 = v20['unit_of_measure_id']
+                                        if v30 is None:
+                                            pass
+                                        elif not isinstance(v30, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v20:
+                                        v31 = v20['unit_price']
+                                        if v31 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price: must not be null")
+                                        elif not isinstance(v31, dict):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v31.keys() - _KEYS_9, key=str):
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v31:
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.amount: required")
+                                            if 'tax' not in v31:
+                                                errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.tax: required")
+                                            if 'amount' in v31:
+                                                v32 = v31['amount']
+                                                if v32 is None:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.amount: must not be null")
+                                                elif isinstance(v32, bool) or not isinstance(v32, (int, float)):
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.amount: expected number")
+                                            if 'tax' in v31:
+                                                v33 = v31['tax']
+                                                if v33 is None:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.tax: must not be null")
+                                                elif not isinstance(v33, str):
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.tax: expected string")
+                                                elif v33 not in _ENUM_10:
+                                                    errors.append(f"grouped_lines[{i18}].line_items[{i20}].unit_price.tax: must be one of {sorted(_ENUM_10)}")
+                                    if 'withholding_tax_rate_id' in v20:
+                                        v34 = v20['withholding_tax_rate_id']
+                                        if v34 is None:
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v34, str):
+                                            errors.append(f"grouped_lines[{i18}].line_items[{i20}].withholding_tax_rate_id: expected string")
+                    if 'section' in v18:
+                        v35 = v18['section']
+                        if v35 is None:
+                            errors.append(f"grouped_lines[{i18}].section: must not be null")
+                        elif not isinstance(v35, dict):
+                            errors.append(f"grouped_lines[{i18}].section: expected object")
+                        else:
+                            for key in sorted(v35.keys() - _KEYS_11, key=str):
+                                errors.append(f"grouped_lines[{i18}].section.{key}: unknown field")
+                            if 'title' not in v35:
+                                errors.append(f"grouped_lines[{i18}].section.title: required")
+                            if 'title' in v35:
+                                v36 = v35['title']
+                                if v36 is None:
+                                    errors.append(f"grouped_lines[{i18}].section.title: must not be null")
+                                elif not isinstance(v36, str):
+                                    errors.append(f"grouped_lines[{i18}].section.title: expected string")
+    if 'id' in body:
+        v37 = body['id']
+        if v37 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v37, str):
+            errors.append("id: expected string")
+    if 'invoice_date' in body:
+        v38 = body['invoice_date']
+        if v38 is None:
+            errors.append("invoice_date: must not be null")
+        elif not isinstance(v38, str):
+            errors.append("invoice_date: expected string")
+    if 'invoicee' in body:
+        v39 = body['invoicee']
+        if v39 is None:
+            errors.append("invoicee: must not be null")
+        elif not isinstance(v39, dict):
+            errors.append("invoicee: expected object")
+        else:
+            for key in sorted(v39.keys() - _KEYS_24, key=str):
+                errors.append(f"invoicee.{key}: unknown field")
+            if 'customer' not in v39:
+                errors.append("invoicee.customer: required")
+            if 'customer' in v39:
+                v40 = v39['customer']
+                if v40 is None:
+                    errors.append("invoicee.customer: must not be null")
+                elif not isinstance(v40, dict):
+                    errors.append("invoicee.customer: expected object")
+                else:
+                    for key in sorted(v40.keys() - _KEYS_18, key=str):
+                        errors.append(f"invoicee.customer.{key}: unknown field")
+                    if 'type' not in v40:
+                        errors.append("invoicee.customer.type: required")
+                    if 'id' not in v40:
+                        errors.append("invoicee.customer.id: required")
+                    if 'id' in v40:
+                        v41 = v40['id']
+                        if v41 is None:
+                            errors.append("invoicee.customer.id: must not be null")
+                        elif not isinstance(v41, str):
+                            errors.append("invoicee.customer.id: expected string")
+                    if 'type' in v40:
+                        v42 = v40['type']
+                        if v42 is None:
+                            errors.append("invoicee.customer.type: must not be null")
+                        elif not isinstance(v42, str):
+                            errors.append("invoicee.customer.type: expected string")
+                        elif v42 not in _ENUM_25:
+                            errors.append(f"invoicee.customer.type: must be one of {sorted(_ENUM_25)}")
+            if 'for_attention_of' in v39:
+                v43 = v39['for_attention_of']
+                for check44 in (_schema_7, _schema_8,):
+                    branch_errors44: list[str] = []
+                    check44(v43, "invoicee.for_attention_of", branch_errors44)
+                    if not branch_errors44:
+                        break
+                else:
+                    errors.append("invoicee.for_attention_of: does not match any allowed shape")
+    if 'note' in body:
+        v45 = body['note']
+        if v45 is None:
+            pass
+        elif not isinstance(v45, str):
+            errors.append("note: expected string")
+    if 'payment_term' in body:
+        v46 = body['payment_term']
+        if v46 is None:
+            pass
+        elif not isinstance(v46, dict):
+            errors.append("payment_term: expected object")
+        else:
+            for key in sorted(v46.keys() - _KEYS_28, key=str):
+                errors.append(f"payment_term.{key}: unknown field")
+            if 'days' in v46:
+                v47 = v46['days']
+                if v47 is None:
+                    errors.append("payment_term.days: must not be null")
+                elif isinstance(v47, bool) or not isinstance(v47, (int, float)):
+                    errors.append("payment_term.days: expected number")
+            if 'type' in v46:
+                v48 = v46['type']
+                if v48 is None:
+                    errors.append("payment_term.type: must not be null")
+                elif not isinstance(v48, str):
+                    errors.append("payment_term.type: expected string")
+                elif v48 not in _ENUM_29:
+                    errors.append(f"payment_term.type: must be one of {sorted(_ENUM_29)}")
+    if 'project_id' in body:
+        v49 = body['project_id']
+        if v49 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v49, str):
+            errors.append("project_id: expected string")
+    if 'purchase_order_number' in body:
+        v50 = body['purchase_order_number']
+        if v50 is None:
+            errors.append("purchase_order_number: must not be null")
+        elif not isinstance(v50, str):
+            errors.append("purchase_order_number: expected string")
+
+
+def _invoices_updatebooked(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_45, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'custom_fields' in body:
+        v0 = body['custom_fields']
+        if v0 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"custom_fields[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"custom_fields[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_17, key=str):
+                        errors.append(f"custom_fields[{i1}].{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"custom_fields[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"custom_fields[{i1}].id: expected string")
+                    if 'value' in v1:
+                        v3 = v1['value']
+                        for check4 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors4: list[str] = []
+                            check4(v3, f"custom_fields[{i1}].value", branch_errors4)
+                            if not branch_errors4:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i1}].value: does not match any allowed shape")
+    if 'grouped_lines' in body:
+        v5 = body['grouped_lines']
+        if v5 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v5, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i6, v6 in enumerate(v5):
+                if v6 is None:
+                    errors.append(f"grouped_lines[{i6}]: must not be null")
+                elif not isinstance(v6, dict):
+                    errors.append(f"grouped_lines[{i6}]: expected object")
+                else:
+                    for key in sorted(v6.keys() - _KEYS_6, key=str):
+                        errors.append(f"grouped_lines[{i6}].{key}: unknown field")
+                    if 'line_items' not in v6:
+                        errors.append(f"grouped_lines[{i6}].line_items: required")
+                    if 'line_items' in v6:
+                        v7 = v6['line_items']
+                        if v7 is None:
+                            errors.append(f"grouped_lines[{i6}].line_items: must not be null")
+                        elif not isinstance(v7, (list, tuple)):
+                            errors.append(f"grouped_lines[{i6}].line_items: expected array")
+                        else:
+                            for i8, v8 in enumerate(v7):
+                                if v8 is None:
+                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}]: must not be null")
+                                elif not isinstance(v8, dict):
+                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}]: expected object")
+                                else:
+                                    for key in sorted(v8.keys() - _KEYS_7, key=str):
+                                        errors.append(f"grouped_lines[{i6}].line_items[{i8}].{key}: unknown field")
+                                    if 'description' not in v8:
+                                        errors.append(f"grouped_lines[{i6}].line_items[{i8}].description: required")
+                                    if 'quantity' not in v8:
+                                        errors.append(f"grouped_lines[{i6}].line_items[{i8}].quantity: required")
+                                    if 'tax_rate_id' not in v8:
+                                        errors.append(f"grouped_lines[{i6}].line_items[{i8}].tax_rate_id: required")
+                                    if 'description' in v8:
+                                        v9 = v8['description']
+                                        if v9 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].description: must not be null")
+                                        elif not isinstance(v9, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].description: expected string")
+                                    if 'discount' in v8:
+                                        v10 = v8['discount']
+                                        if v10 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount: must not be null")
+                                        elif not isinstance(v10, dict):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount: expected object")
+                                        else:
+                                            for key in sorted(v10.keys() - _KEYS_8, key=str):
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.{key}: unknown field")
+                                            if 'type' not in v10:
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.type: required")
+                                            if 'value' not in v10:
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.value: required")
+                                            if 'type' in v10:
+                                                v11 = v10['type']
+                                                if v11 is None:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.type: must not be null")
+                                                elif not isinstance(v11, str):
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.type: expected string")
+                                                elif v11 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v10:
+                                                v12 = v10['value']
+                                                if v12 is None:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.value: must not be null")
+                                                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].discount.value: expected number")
+                                    if 'extended_description' in v8:
+                                        v13 = v8['extended_description']
+                                        if v13 is None:
+                                            pass
+                                        elif not isinstance(v13, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].extended_description: expected string")
+                                    if 'product_category_id' in v8:
+                                        v14 = v8['product_category_id']
+                                        if v14 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].product_category_id: must not be null")
+                                        elif not isinstance(v14, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].product_category_id: expected string")
+                                    if 'product_id' in v8:
+                                        v15 = v8['product_id']
+                                        if v15 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].product_id: must not be null")
+                                        elif not isinstance(v15, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].product_id: expected string")
+                                    if 'quantity' in v8:
+                                        v16 = v8['quantity']
+                                        if v16 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].quantity: must not be null")
+                                        elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].quantity: expected number")
+                                    if 'tax_rate_id' in v8:
+                                        v17 = v8['tax_rate_id']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].tax_rate_id: must not be null")
+                                        elif not isinstance(v17, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v8:
+                                        v18 = v8['unit_of_measure_id']
+                                        if v18 is None:
+                                            pass
+                                        elif not isinstance(v18, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v8:
+                                        v19 = v8['unit_price']
+                                        if v19 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price: must not be null")
+                                        elif not isinstance(v19, dict):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v19.keys() - _KEYS_9, key=str):
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v19:
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.amount: required")
+                                            if 'tax' not in v19:
+                                                errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.tax: required")
+                                            if 'amount' in v19:
+                                                v20 = v19['amount']
+                                                if v20 is None:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.amount: must not be null")
+                                                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.amount: expected number")
+                                            if 'tax' in v19:
+                                                v21 = v19['tax']
+                                                if v21 is None:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.tax: must not be null")
+                                                elif not isinstance(v21, str):
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.tax: expected string")
+                                                elif v21 not in _ENUM_10:
+                                                    errors.append(f"grouped_lines[{i6}].line_items[{i8}].unit_price.tax: must be one of {sorted(_ENUM_10)}")
+                                    if 'withholding_tax_rate_id' in v8:
+                                        v22 = v8['withholding_tax_rate_id']
+                                        if v22 is None:
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v22, str):
+                                            errors.append(f"grouped_lines[{i6}].line_items[{i8}].withholding_tax_rate_id: expected string")
+                    if 'section' in v6:
+                        v23 = v6['section']
+                        if v23 is None:
+                            errors.append(f"grouped_lines[{i6}].section: must not be null")
+                        elif not isinstance(v23, dict):
+                            errors.append(f"grouped_lines[{i6}].section: expected object")
+                        else:
+                            for key in sorted(v23.keys() - _KEYS_11, key=str):
+                                errors.append(f"grouped_lines[{i6}].section.{key}: unknown field")
+                            if 'title' not in v23:
+                                errors.append(f"grouped_lines[{i6}].section.title: required")
+                            if 'title' in v23:
+                                v24 = v23['title']
+                                if v24 is None:
+                                    errors.append(f"grouped_lines[{i6}].section.title: must not be null")
+                                elif not isinstance(v24, str):
+                                    errors.append(f"grouped_lines[{i6}].section.title: expected string")
+    if 'id' in body:
+        v25 = body['id']
+        if v25 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v25, str):
+            errors.append("id: expected string")
+    if 'invoice_date' in body:
+        v26 = body['invoice_date']
+        if v26 is None:
+            errors.append("invoice_date: must not be null")
+        elif not isinstance(v26, str):
+            errors.append("invoice_date: expected string")
+    if 'invoicee' in body:
+        v27 = body['invoicee']
+        if v27 is None:
+            errors.append("invoicee: must not be null")
+        elif not isinstance(v27, dict):
+            errors.append("invoicee: expected object")
+        else:
+            for key in sorted(v27.keys() - _KEYS_24, key=str):
+                errors.append(f"invoicee.{key}: unknown field")
+            if 'customer' not in v27:
+                errors.append("invoicee.customer: required")
+            if 'customer' in v27:
+                v28 = v27['customer']
+                if v28 is None:
+                    errors.append("invoicee.customer: must not be null")
+                elif not isinstance(v28, dict):
+                    errors.append("invoicee.customer: expected object")
+                else:
+                    for key in sorted(v28.keys() - _KEYS_18, key=str):
+                        errors.append(f"invoicee.customer.{key}: unknown field")
+                    if 'type' not in v28:
+                        errors.append("invoicee.customer.type: required")
+                    if 'id' not in v28:
+                        errors.append("invoicee.customer.id: required")
+                    if 'id' in v28:
+                        v29 = v28['id']
+                        if v29 is None:
+                            errors.append("invoicee.customer.id: must not be null")
+                        elif not isinstance(v29, str):
+                            errors.append("invoicee.customer.id: expected string")
+                    if 'type' in v28:
+                        v30 = v28['type']
+                        if v30 is None:
+                            errors.append("invoicee.customer.type: must not be null")
+                        elif not isinstance(v30, str):
+                            errors.append("invoicee.customer.type: expected string")
+                        elif v30 not in _ENUM_25:
+                            errors.append(f"invoicee.customer.type: must be one of {sorted(_ENUM_25)}")
+            if 'for_attention_of' in v27:
+                v31 = v27['for_attention_of']
+                for check32 in (_schema_7, _schema_8,):
+                    branch_errors32: list[str] = []
+                    check32(v31, "invoicee.for_attention_of", branch_errors32)
+                    if not branch_errors32:
+                        break
+                else:
+                    errors.append("invoicee.for_attention_of: does not match any allowed shape")
+    if 'note' in body:
+        v33 = body['note']
+        if v33 is None:
+            pass
+        elif not isinstance(v33, str):
+            errors.append("note: expected string")
+    if 'payment_term' in body:
+        v34 = body['payment_term']
+        if v34 is None:
+            pass
+        elif not isinstance(v34, dict):
+            errors.append("payment_term: expected object")
+        else:
+            for key in sorted(v34.keys() - _KEYS_28, key=str):
+                errors.append(f"payment_term.{key}: unknown field")
+            if 'days' in v34:
+                v35 = v34['days']
+                if v35 is None:
+                    errors.append("payment_term.days: must not be null")
+                elif isinstance(v35, bool) or not isinstance(v35, (int, float)):
+                    errors.append("payment_term.days: expected number")
+            if 'type' in v34:
+                v36 = v34['type']
+                if v36 is None:
+                    errors.append("payment_term.type: must not be null")
+                elif not isinstance(v36, str):
+                    errors.append("payment_term.type: expected string")
+                elif v36 not in _ENUM_29:
+                    errors.append(f"payment_term.type: must be one of {sorted(_ENUM_29)}")
+    if 'project_id' in body:
+        v37 = body['project_id']
+        if v37 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v37, str):
+            errors.append("project_id: expected string")
+
+
+VALIDATORS = {
+    'invoices.book': _invoices_book,
+    'invoices.copy': _invoices_copy,
+    'invoices.credit': _invoices_credit,
+    'invoices.creditPartially': _invoices_creditpartially,
+    'invoices.delete': _invoices_delete,
+    'invoices.download': _invoices_download,
+    'invoices.draft': _invoices_draft,
+    'invoices.info': _invoices_info,
+    'invoices.list': _invoices_list,
+    'invoices.registerPayment': _invoices_registerpayment,
+    'invoices.removePayments': _invoices_removepayments,
+    'invoices.send': _invoices_send,
+    'invoices.sendViaPeppol': _invoices_sendviapeppol,
+    'invoices.update': _invoices_update,
+    'invoices.updateBooked': _invoices_updatebooked,
+}
+# fmt: on
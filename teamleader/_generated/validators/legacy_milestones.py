@@ -0,0 +1,661 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({
+    'billing_method',
+    'budget',
+    'custom_fields',
+    'depends_on',
+    'description',
+    'due_on',
+    'name',
+    'project_id',
+    'responsible_user_id',
+    'starts_on',
+})
+_ENUM_2 = frozenset({'non_invoiceable', 'time_and_materials'})
+_KEYS_3 = frozenset({'amount', 'currency'})
+_ENUM_4 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_5 = frozenset({'id', 'value'})
+_KEYS_6 = frozenset({'id', 'type'})
+_ENUM_7 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_8 = frozenset({
+    'billing_method',
+    'custom_fields',
+    'depends_on',
+    'description',
+    'due_on',
+    'name',
+    'price',
+    'project_id',
+    'responsible_user_id',
+    'starts_on',
+})
+_KEYS_9 = frozenset({'filter', 'page', 'sort'})
+_KEYS_10 = frozenset({'due_after', 'due_before', 'ids', 'project_id', 'status', 'term'})
+_ENUM_11 = frozenset({'closed', 'open'})
+_KEYS_12 = frozenset({'number', 'size'})
+_KEYS_13 = frozenset({'field', 'order'})
+_ENUM_14 = frozenset({'due_on', 'starts_on'})
+_KEYS_15 = frozenset({
+    'custom_fields',
+    'depends_on',
+    'description',
+    'due_on',
+    'id',
+    'name',
+    'propagate_date_changes',
+    'responsible_user_id',
+    'starts_on',
+})
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_6, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_7:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_7)}")
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_1, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'due_on' not in v0:
+            errors.append(f"{path}.due_on: required")
+        if 'name' not in v0:
+            errors.append(f"{path}.name: required")
+        if 'project_id' not in v0:
+            errors.append(f"{path}.project_id: required")
+        if 'responsible_user_id' not in v0:
+            errors.append(f"{path}.responsible_user_id: required")
+        if 'billing_method' in v0:
+            v1 = v0['billing_method']
+            if v1 is None:
+                errors.append(f"{path}.billing_method: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.billing_method: expected string")
+            elif v1 not in _ENUM_2:
+                errors.append(f"{path}.billing_method: must be one of {sorted(_ENUM_2)}")
+        if 'budget' in v0:
+            v2 = v0['budget']
+            if v2 is None:
+                errors.append(f"{path}.budget: must not be null")
+            elif not isinstance(v2, dict):
+                errors.append(f"{path}.budget: expected object")
+            else:
+                for key in sorted(v2.keys() - _KEYS_3, key=str):
+                    errors.append(f"{path}.budget.{key}: unknown field")
+                if 'amount' not in v2:
+                    errors.append(f"{path}.budget.amount: required")
+                if 'currency' not in v2:
+                    errors.append(f"{path}.budget.currency: required")
+                if 'amount' in v2:
+                    v3 = v2['amount']
+                    if v3 is None:
+                        errors.append(f"{path}.budget.amount: must not be null")
+                    elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                        errors.append(f"{path}.budget.amount: expected number")
+                if 'currency' in v2:
+                    v4 = v2['currency']
+                    if v4 is None:
+                        errors.append(f"{path}.budget.currency: must not be null")
+                    elif not isinstance(v4, str):
+                        errors.append(f"{path}.budget.currency: expected string")
+                    elif v4 not in _ENUM_4:
+                        errors.append(f"{path}.budget.currency: must be one of {sorted(_ENUM_4)}")
+        if 'custom_fields' in v0:
+            v5 = v0['custom_fields']
+            if v5 is None:
+                errors.append(f"{path}.custom_fields: must not be null")
+            elif not isinstance(v5, (list, tuple)):
+                errors.append(f"{path}.custom_fields: expected array")
+            else:
+                for i6, v6 in enumerate(v5):
+                    if v6 is None:
+                        errors.append(f"{path}.custom_fields[{i6}]: must not be null")
+                    elif not isinstance(v6, dict):
+                        errors.append(f"{path}.custom_fields[{i6}]: expected object")
+                    else:
+                        for key in sorted(v6.keys() - _KEYS_5, key=str):
+                            errors.append(f"{path}.custom_fields[{i6}].{key}: unknown field")
+                        if 'id' in v6:
+                            v7 = v6['id']
+                            if v7 is None:
+                                errors.append(f"{path}.custom_fields[{i6}].id: must not be null")
+                            elif not isinstance(v7, str):
+                                errors.append(f"{path}.custom_fields[{i6}].id: expected string")
+                        if 'value' in v6:
+                            v8 = v6['value']
+                            for check9 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                                branch_errors9: list[str] = []
+                                check9(v8, f"{path}.custom_fields[{i6}].value", branch_errors9)
+                                if not branch_errors9:
+                                    break
+                            else:
+                                errors.append(f"{path}.custom_fields[{i6}].value: does not match any allowed shape")
+        if 'depends_on' in v0:
+            v10 = v0['depends_on']
+            if v10 is None:
+                pass
+            elif not isinstance(v10, str):
+                errors.append(f"{path}.depends_on: expected string")
+        if 'description' in v0:
+            v11 = v0['description']
+            if v11 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v11, str):
+                errors.append(f"{path}.description: expected string")
+        if 'due_on' in v0:
+            v12 = v0['due_on']
+            if v12 is None:
+                errors.append(f"{path}.due_on: must not be null")
+            elif not isinstance(v12, str):
+                errors.append(f"{path}.due_on: expected string")
+        if 'name' in v0:
+            v13 = v0['name']
+            if v13 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v13, str):
+                errors.append(f"{path}.name: expected string")
+        if 'project_id' in v0:
+            v14 = v0['project_id']
+            if v14 is None:
+                errors.append(f"{path}.project_id: must not be null")
+            elif not isinstance(v14, str):
+                errors.append(f"{path}.project_id: expected string")
+        if 'responsible_user_id' in v0:
+            v15 = v0['responsible_user_id']
+            if v15 is None:
+                errors.append(f"{path}.responsible_user_id: must not be null")
+            elif not isinstance(v15, str):
+                errors.append(f"{path}.responsible_user_id: expected string")
+        if 'starts_on' in v0:
+            v16 = v0['starts_on']
+            if v16 is None:
+                pass
+            elif not isinstance(v16, str):
+                errors.append(f"{path}.starts_on: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_8, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'billing_method' not in v0:
+            errors.append(f"{path}.billing_method: required")
+        if 'due_on' not in v0:
+            errors.append(f"{path}.due_on: required")
+        if 'name' not in v0:
+            errors.append(f"{path}.name: required")
+        if 'price' not in v0:
+            errors.append(f"{path}.price: required")
+        if 'project_id' not in v0:
+            errors.append(f"{path}.project_id: required")
+        if 'responsible_user_id' not in v0:
+            errors.append(f"{path}.responsible_user_id: required")
+        if 'billing_method' in v0:
+            v1 = v0['billing_method']
+            if v1 is None:
+                errors.append(f"{path}.billing_method: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.billing_method: expected string")
+        if 'custom_fields' in v0:
+            v2 = v0['custom_fields']
+            if v2 is None:
+                errors.append(f"{path}.custom_fields: must not be null")
+            elif not isinstance(v2, (list, tuple)):
+                errors.append(f"{path}.custom_fields: expected array")
+            else:
+                for i3, v3 in enumerate(v2):
+                    if v3 is None:
+                        errors.append(f"{path}.custom_fields[{i3}]: must not be null")
+                    elif not isinstance(v3, dict):
+                        errors.append(f"{path}.custom_fields[{i3}]: expected object")
+                    else:
+                        for key in sorted(v3.keys() - _KEYS_5, key=str):
+                            errors.append(f"{path}.custom_fields[{i3}].{key}: unknown field")
+                        if 'id' in v3:
+                            v4 = v3['id']
+                            if v4 is None:
+                                errors.append(f"{path}.custom_fields[{i3}].id: must not be null")
+                            elif not isinstance(v4, str):
+                                errors.append(f"{path}.custom_fields[{i3}].id: expected string")
+                        if 'value' in v3:
+                            v5 = v3['value']
+                            for check6 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                                branch_errors6: list[str] = []
+                                check6(v5, f"{path}.custom_fields[{i3}].value", branch_errors6)
+                                if not branch_errors6:
+                                    break
+                            else:
+                                errors.append(f"{path}.custom_fields[{i3}].value: does not match any allowed shape")
+        if 'depends_on' in v0:
+            v7 = v0['depends_on']
+            if v7 is None:
+                pass
+            elif not isinstance(v7, str):
+                errors.append(f"{path}.depends_on: expected string")
+        if 'description' in v0:
+            v8 = v0['description']
+            if v8 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v8, str):
+                errors.append(f"{path}.description: expected string")
+        if 'due_on' in v0:
+            v9 = v0['due_on']
+            if v9 is None:
+                errors.append(f"{path}.due_on: must not be null")
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.due_on: expected string")
+        if 'name' in v0:
+            v10 = v0['name']
+            if v10 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v10, str):
+                errors.append(f"{path}.name: expected string")
+        if 'price' in v0:
+            v11 = v0['price']
+            if v11 is None:
+                errors.append(f"{path}.price: must not be null")
+            elif not isinstance(v11, dict):
+                errors.append(f"{path}.price: expected object")
+            else:
+                for key in sorted(v11.keys() - _KEYS_3, key=str):
+                    errors.append(f"{path}.price.{key}: unknown field")
+                if 'amount' not in v11:
+                    errors.append(f"{path}.price.amount: required")
+                if 'currency' not in v11:
+                    errors.append(f"{path}.price.currency: required")
+                if 'amount' in v11:
+                    v12 = v11['amount']
+                    if v12 is None:
+                        errors.append(f"{path}.price.amount: must not be null")
+                    elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                        errors.append(f"{path}.price.amount: expected number")
+                if 'currency' in v11:
+                    v13 = v11['currency']
+                    if v13 is None:
+                        errors.append(f"{path}.price.currency: must not be null")
+                    elif not isinstance(v13, str):
+                        errors.append(f"{path}.price.currency: expected string")
+                    elif v13 not in _ENUM_4:
+                        errors.append(f"{path}.price.currency: must be one of {sorted(_ENUM_4)}")
+        if 'project_id' in v0:
+            v14 = v0['project_id']
+            if v14 is None:
+                errors.append(f"{path}.project_id: must not be null")
+            elif not isinstance(v14, str):
+                errors.append(f"{path}.project_id: expected string")
+        if 'responsible_user_id' in v0:
+            v15 = v0['responsible_user_id']
+            if v15 is None:
+                errors.append(f"{path}.responsible_user_id: must not be null")
+            elif not isinstance(v15, str):
+                errors.append(f"{path}.responsible_user_id: expected string")
+        if 'starts_on' in v0:
+            v16 = v0['starts_on']
+            if v16 is None:
+                pass
+            elif not isinstance(v16, str):
+                errors.append(f"{path}.starts_on: expected string")
+
+
+def _legacymilestones_close(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacymilestones_create(body: dict[str, Any], errors: list[str]) -> None:
+    for check0 in (_schema_0, _schema_6,):
+        branch_errors0: list[str] = []
+        check0(body, "", branch_errors0)
+        if not branch_errors0:
+            break
+    else:
+        errors.append("body: does not match any allowed shape")
+
+
+def _legacymilestones_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacymilestones_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacymilestones_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_10, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'due_after' in v0:
+                v1 = v0['due_after']
+                if v1 is None:
+                    errors.append("filter.due_after: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.due_after: expected string")
+            if 'due_before' in v0:
+                v2 = v0['due_before']
+                if v2 is None:
+                    errors.append("filter.due_before: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.due_before: expected string")
+            if 'ids' in v0:
+                v3 = v0['ids']
+                if v3 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.ids[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.ids[{i4}]: expected string")
+            if 'project_id' in v0:
+                v5 = v0['project_id']
+                if v5 is None:
+                    errors.append("filter.project_id: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.project_id: expected string")
+            if 'status' in v0:
+                v6 = v0['status']
+                if v6 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.status: expected string")
+                elif v6 not in _ENUM_11:
+                    errors.append(f"filter.status: must be one of {sorted(_ENUM_11)}")
+            if 'term' in v0:
+                v7 = v0['term']
+                if v7 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.term: expected string")
+    if 'page' in body:
+        v8 = body['page']
+        if v8 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_12, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v8:
+                v9 = v8['number']
+                if v9 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v9, bool) or not isinstance(v9, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v8:
+                v10 = v8['size']
+                if v10 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v11 = body['sort']
+        if v11 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v11, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i12, v12 in enumerate(v11):
+                if v12 is None:
+                    errors.append(f"sort[{i12}]: must not be null")
+                elif not isinstance(v12, dict):
+                    errors.append(f"sort[{i12}]: expected object")
+                else:
+                    for key in sorted(v12.keys() - _KEYS_13, key=str):
+                        errors.append(f"sort[{i12}].{key}: unknown field")
+                    if 'field' not in v12:
+                        errors.append(f"sort[{i12}].field: required")
+                    if 'field' in v12:
+                        v13 = v12['field']
+                        if v13 is None:
+                            errors.append(f"sort[{i12}].field: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append(f"sort[{i12}].field: expected string")
+                        elif v13 not in _ENUM_14:
+                            errors.append(f"sort[{i12}].field: must be one of {sorted(_ENUM_14)}")
+                    if 'order' in v12:
+                        v14 = v12['order']
+                        if v14 is None:
+                            errors.append(f"sort[{i12}].order: must not be null")
+
+
+def _legacymilestones_open(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacymilestones_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_15, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'custom_fields' in body:
+        v0 = body['custom_fields']
+        if v0 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"custom_fields[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"custom_fields[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_5, key=str):
+                        errors.append(f"custom_fields[{i1}].{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"custom_fields[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"custom_fields[{i1}].id: expected string")
+                    if 'value' in v1:
+                        v3 = v1['value']
+                        for check4 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                            branch_errors4: list[str] = []
+                            check4(v3, f"custom_fields[{i1}].value", branch_errors4)
+                            if not branch_errors4:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i1}].value: does not match any allowed shape")
+    if 'depends_on' in body:
+        v5 = body['depends_on']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("depends_on: expected string")
+    if 'description' in body:
+        v6 = body['description']
+        if v6 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("description: expected string")
+    if 'due_on' in body:
+        v7 = body['due_on']
+        if v7 is None:
+            errors.append("due_on: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("due_on: expected string")
+    if 'id' in body:
+        v8 = body['id']
+        if v8 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("id: expected string")
+    if 'name' in body:
+        v9 = body['name']
+        if v9 is None:
+            errors.append("name: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("name: expected string")
+    if 'propagate_date_changes' in body:
+        v10 = body['propagate_date_changes']
+        if v10 is None:
+            errors.append("propagate_date_changes: must not be null")
+        elif not isinstance(v10, bool):
+            errors.append("propagate_date_changes: expected boolean")
+    if 'responsible_user_id' in body:
+        v11 = body['responsible_user_id']
+        if v11 is None:
+            errors.append("responsible_user_id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("responsible_user_id: expected string")
+    if 'starts_on' in body:
+        v12 = body['starts_on']
+        if v12 is None:
+            pass
+        elif not isinstance(v12, str):
+            errors.append("starts_on: expected string")
+
+
+VALIDATORS = {
+    'LegacyMilestones.close': _legacymilestones_close,
+    'LegacyMilestones.create': _legacymilestones_create,
+    'LegacyMilestones.delete': _legacymilestones_delete,
+    'LegacyMilestones.info': _legacymilestones_info,
+    'LegacyMilestones.list': _legacymilestones_list,
+    'LegacyMilestones.open': _legacymilestones_open,
+    'LegacyMilestones.update': _legacymilestones_update,
+}
+# fmt: on
@@ -0,0 +1,721 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id', 'participant', 'role'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'decision_maker', 'member'})
+_KEYS_3 = frozenset({'id'})
+_KEYS_4 = frozenset({
+    'custom_fields',
+    'customer',
+    'description',
+    'milestones',
+    'participants',
+    'purchase_order_number',
+    'starts_on',
+    'title',
+})
+_KEYS_5 = frozenset({'id', 'value'})
+_ENUM_6 = frozenset({'company', 'contact', 'product', 'user'})
+_ENUM_7 = frozenset({'company', 'contact'})
+_KEYS_8 = frozenset({'due_on', 'name', 'responsible_user_id', 'starts_on'})
+_KEYS_9 = frozenset({'participant', 'role'})
+_KEYS_10 = frozenset({'filter', 'page', 'sort'})
+_KEYS_11 = frozenset({'customer', 'participant_id', 'status', 'term', 'updated_since'})
+_ENUM_12 = frozenset({'active', 'cancelled', 'done', 'on_hold'})
+_KEYS_13 = frozenset({'number', 'size'})
+_KEYS_14 = frozenset({'field', 'order'})
+_ENUM_15 = frozenset({'created_at', 'due_on', 'title'})
+_KEYS_16 = frozenset({
+    'budget',
+    'custom_fields',
+    'customer',
+    'description',
+    'id',
+    'purchase_order_number',
+    'starts_on',
+    'status',
+    'title',
+})
+_KEYS_17 = frozenset({'amount', 'currency'})
+_ENUM_18 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_1, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_6:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_6)}")
+
+
+def _legacyprojects_addparticipant(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'participant' not in body:
+        errors.append("participant: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'participant' in body:
+        v1 = body['participant']
+        if v1 is None:
+            errors.append("participant: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'id' in v1:
+                v2 = v1['id']
+                if v2 is None:
+                    errors.append("participant.id: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("participant.id: expected string")
+            if 'type' in v1:
+                v3 = v1['type']
+                if v3 is None:
+                    errors.append("participant.type: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("participant.type: expected string")
+    if 'role' in body:
+        v4 = body['role']
+        if v4 is None:
+            errors.append("role: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("role: expected string")
+        elif v4 not in _ENUM_2:
+            errors.append(f"role: must be one of {sorted(_ENUM_2)}")
+
+
+def _legacyprojects_close(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacyprojects_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'milestones' not in body:
+        errors.append("milestones: required")
+    if 'participants' not in body:
+        errors.append("participants: required")
+    if 'starts_on' not in body:
+        errors.append("starts_on: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'custom_fields' in body:
+        v0 = body['custom_fields']
+        if v0 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"custom_fields[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"custom_fields[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_5, key=str):
+                        errors.append(f"custom_fields[{i1}].{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"custom_fields[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"custom_fields[{i1}].id: expected string")
+                    if 'value' in v1:
+                        v3 = v1['value']
+                        for check4 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors4: list[str] = []
+                            check4(v3, f"custom_fields[{i1}].value", branch_errors4)
+                            if not branch_errors4:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i1}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v5 = body['customer']
+        if v5 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v5:
+                errors.append("customer.type: required")
+            if 'id' not in v5:
+                errors.append("customer.id: required")
+            if 'id' in v5:
+                v6 = v5['id']
+                if v6 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v5:
+                v7 = v5['type']
+                if v7 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("customer.type: expected string")
+                elif v7 not in _ENUM_7:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_7)}")
+    if 'description' in body:
+        v8 = body['description']
+        if v8 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("description: expected string")
+    if 'milestones' in body:
+        v9 = body['milestones']
+        if v9 is None:
+            errors.append("milestones: must not be null")
+        elif not isinstance(v9, (list, tuple)):
+            errors.append("milestones: expected array")
+        else:
+            for i10, v10 in enumerate(v9):
+                if v10 is None:
+                    errors.append(f"milestones[{i10}]: must not be null")
+                elif not isinstance(v10, dict):
+                    errors.append(f"milestones[{i10}]: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_8, key=str):
+                        errors.append(f"milestones[{i10}].{key}: unknown field")
+                    if 'due_on' not in v10:
+                        errors.append(f"milestones[{i10}].due_on: required")
+                    if 'name' not in v10:
+                        errors.append(f"milestones[{i10}].name: required")
+                    if 'responsible_user_id' not in v10:
+                        errors.append(f"milestones[{i10}].responsible_user_id: required")
+                    if 'due_on' in v10:
+                        v11 = v10['due_on']
+                        if v11 is None:
+                            errors.append(f"milestones[{i10}].due_on: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append(f"milestones[{i10}].due_on: expected string")
+                    if 'name' in v10:
+                        v12 = v10['name']
+                        if v12 is None:
+                            errors.append(f"milestones[{i10}].name: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append(f"milestones[{i10}].name: expected string")
+                    if 'responsible_user_id' in v10:
+                        v13 = v10['responsible_user_id']
+                        if v13 is None:
+                            errors.append(f"milestones[{i10}].responsible_user_id: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append(f"milestones[{i10}].responsible_user_id: expected string")
+                    if 'starts_on' in v10:
+                        v14 = v10['starts_on']
+                        if v14 is None:
+                            pass
+                        elif not isinstance(v14, str):
+                            errors.append(f"milestones[{i10}].starts_on: expected string")
+    if 'participants' in body:
+        v15 = body['participants']
+        if v15 is None:
+            errors.append("participants: must not be null")
+        elif not isinstance(v15, (list, tuple)):
+            errors.append("participants: expected array")
+        else:
+            for i16, v16 in enumerate(v15):
+                if v16 is None:
+                    errors.append(f"participants[{i16}]: must not be null")
+                elif not isinstance(v16, dict):
+                    errors.append(f"participants[{i16}]: expected object")
+                else:
+                    for key in sorted(v16.keys() - _KEYS_9, key=str):
+                        errors.append(f"participants[{i16}].{key}: unknown field")
+                    if 'participant' not in v16:
+                        errors.append(f"participants[{i16}].participant: required")
+                    if 'participant' in v16:
+                        v17 = v16['participant']
+                        if v17 is None:
+                            errors.append(f"participants[{i16}].participant: must not be null")
+                        elif not isinstance(v17, dict):
+                            errors.append(f"participants[{i16}].participant: expected object")
+                        else:
+                            for key in sorted(v17.keys() - _KEYS_1, key=str):
+                                errors.append(f"participants[{i16}].participant.{key}: unknown field")
+                            if 'id' not in v17:
+                                errors.append(f"participants[{i16}].participant.id: required")
+                            if 'type' not in v17:
+                                errors.append(f"participants[{i16}].participant.type: required")
+                            if 'id' in v17:
+                                v18 = v17['id']
+                                if v18 is None:
+                                    errors.append(f"participants[{i16}].participant.id: must not be null")
+                                elif not isinstance(v18, str):
+                                    errors.append(f"participants[{i16}].participant.id: expected string")
+                            if 'type' in v17:
+                                v19 = v17['type']
+                                if v19 is None:
+                                    errors.append(f"participants[{i16}].participant.type: must not be null")
+                                elif not isinstance(v19, str):
+                                    errors.append(f"participants[{i16}].participant.type: expected string")
+                    if 'role' in v16:
+                        v20 = v16['role']
+                        if v20 is None:
+                            errors.append(f"participants[{i16}].role: must not be null")
+                        elif not isinstance(v20, str):
+                            errors.append(f"participants[{i16}].role: expected string")
+                        elif v20 not in _ENUM_2:
+                            errors.append(f"participants[{i16}].role: must be one of {sorted(_ENUM_2)}")
+    if 'purchase_order_number' in body:
+        v21 = body['purchase_order_number']
+        if v21 is None:
+            errors.append("purchase_order_number: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("purchase_order_number: expected string")
+    if 'starts_on' in body:
+        v22 = body['starts_on']
+        if v22 is None:
+            errors.append("starts_on: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("starts_on: expected string")
+    if 'title' in body:
+        v23 = body['title']
+        if v23 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v23, str):
+            errors.append("title: expected string")
+
+
+def _legacyprojects_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacyprojects_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacyprojects_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_11, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'customer' in v0:
+                v1 = v0['customer']
+                if v1 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v1:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v1:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v3 not in _ENUM_7:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_7)}")
+            if 'participant_id' in v0:
+                v4 = v0['participant_id']
+                if v4 is None:
+                    errors.append("filter.participant_id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("filter.participant_id: expected string")
+            if 'status' in v0:
+                v5 = v0['status']
+                if v5 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.status: expected string")
+                elif v5 not in _ENUM_12:
+                    errors.append(f"filter.status: must be one of {sorted(_ENUM_12)}")
+            if 'term' in v0:
+                v6 = v0['term']
+                if v6 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.term: expected string")
+            if 'updated_since' in v0:
+                v7 = v0['updated_since']
+                if v7 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.updated_since: expected string")
+    if 'page' in body:
+        v8 = body['page']
+        if v8 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_13, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v8:
+                v9 = v8['number']
+                if v9 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v9, bool) or not isinstance(v9, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v8:
+                v10 = v8['size']
+                if v10 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v11 = body['sort']
+        if v11 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v11, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i12, v12 in enumerate(v11):
+                if v12 is None:
+                    errors.append(f"sort[{i12}]: must not be null")
+                elif not isinstance(v12, dict):
+                    errors.append(f"sort[{i12}]: expected object")
+                else:
+                    for key in sorted(v12.keys() - _KEYS_14, key=str):
+                        errors.append(f"sort[{i12}].{key}: unknown field")
+                    if 'field' not in v12:
+                        errors.append(f"sort[{i12}].field: required")
+                    if 'field' in v12:
+                        v13 = v12['field']
+                        if v13 is None:
+                            errors.append(f"sort[{i12}].field: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append(f"sort[{i12}].field: expected string")
+                        elif v13 not in _ENUM_15:
+                            errors.append(f"sort[{i12}].field: must be one of {sorted(_ENUM_15)}")
+                    if 'order' in v12:
+                        v14 = v12['order']
+                        if v14 is None:
+                            errors.append(f"sort[{i12}].order: must not be null")
+
+
+def _legacyprojects_reopen(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _legacyprojects_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_16, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'budget' in body:
+        v0 = body['budget']
+        if v0 is None:
+            errors.append("budget: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("budget: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_17, key=str):
+                errors.append(f"budget.{key}: unknown field")
+            if 'amount' not in v0:
+                errors.append("budget.amount: required")
+            if 'currency' not in v0:
+                errors.append("budget.currency: required")
+            if 'amount' in v0:
+                v1 = v0['amount']
+                if v1 is None:
+                    errors.append("budget.amount: must not be null")
+                elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                    errors.append("budget.amount: expected number")
+            if 'currency' in v0:
+                v2 = v0['currency']
+                if v2 is None:
+                    errors.append("budget.currency: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("budget.currency: expected string")
+                elif v2 not in _ENUM_18:
+                    errors.append(f"budget.currency: must be one of {sorted(_ENUM_18)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_5, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v8 = body['customer']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'id' not in v8:
+                errors.append("customer.id: required")
+            if 'type' not in v8:
+                errors.append("customer.type: required")
+            if 'id' in v8:
+                v9 = v8['id']
+                if v9 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v8:
+                v10 = v8['type']
+                if v10 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.type: expected string")
+                elif v10 not in _ENUM_7:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_7)}")
+    if 'description' in body:
+        v11 = body['description']
+        if v11 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("description: expected string")
+    if 'id' in body:
+        v12 = body['id']
+        if v12 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("id: expected string")
+    if 'purchase_order_number' in body:
+        v13 = body['purchase_order_number']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, str):
+            errors.append("purchase_order_number: expected string")
+    if 'starts_on' in body:
+        v14 = body['starts_on']
+        if v14 is None:
+            errors.append("starts_on: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("starts_on: expected string")
+    if 'status' in body:
+        v15 = body['status']
+        if v15 is None:
+            errors.append("status: must not be null")
+        elif not isinstance(v15, str):
+            errors.append("status: expected string")
+        elif v15 not in _ENUM_12:
+            errors.append(f"status: must be one of {sorted(_ENUM_12)}")
+    if 'title' in body:
+        v16 = body['title']
+        if v16 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v16, str):
+            errors.append("title: expected string")
+
+
+def _legacyprojects_updateparticipant(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'role' not in body:
+        errors.append("role: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'participant' in body:
+        v1 = body['participant']
+        if v1 is None:
+            errors.append("participant: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'id' in v1:
+                v2 = v1['id']
+                if v2 is None:
+                    errors.append("participant.id: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("participant.id: expected string")
+            if 'type' in v1:
+                v3 = v1['type']
+                if v3 is None:
+                    errors.append("participant.type: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("participant.type: expected string")
+    if 'role' in body:
+        v4 = body['role']
+        if v4 is None:
+            errors.append("role: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("role: expected string")
+        elif v4 not in _ENUM_2:
+            errors.append(f"role: must be one of {sorted(_ENUM_2)}")
+
+
+VALIDATORS = {
+    'LegacyProjects.addParticipant': _legacyprojects_addparticipant,
+    'LegacyProjects.close': _legacyprojects_close,
+    'LegacyProjects.create': _legacyprojects_create,
+    'LegacyProjects.delete': _legacyprojects_delete,
+    'LegacyProjects.info': _legacyprojects_info,
+    'LegacyProjects.list': _legacyprojects_list,
+    'LegacyProjects.reopen': _legacyprojects_reopen,
+    'LegacyProjects.update': _legacyprojects_update,
+    'LegacyProjects.updateParticipant': _legacyprojects_updateparticipant,
+}
+# fmt: on
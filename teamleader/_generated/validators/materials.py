@@ -0,0 +1,710 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'assignee', 'id'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'team', 'user'})
+_KEYS_3 = frozenset({
+    'after_id',
+    'assignees',
+    'billing_method',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'group_id',
+    'internal_budget',
+    'product_id',
+    'project_id',
+    'quantity',
+    'quantity_estimated',
+    'start_date',
+    'title',
+    'unit_cost',
+    'unit_id',
+    'unit_price',
+})
+_ENUM_4 = frozenset({'fixed_price', 'non_billable', 'unit_price'})
+_KEYS_5 = frozenset({'amount', 'currency'})
+_ENUM_6 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_7 = frozenset({'id'})
+_KEYS_8 = frozenset({'origin_id'})
+_KEYS_9 = frozenset({'filter'})
+_KEYS_10 = frozenset({'ids'})
+_KEYS_11 = frozenset({
+    'billing_method',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'id',
+    'internal_budget',
+    'product_id',
+    'quantity',
+    'quantity_estimated',
+    'start_date',
+    'status',
+    'title',
+    'unit_cost',
+    'unit_id',
+    'unit_price',
+})
+_ENUM_12 = frozenset({'done', 'in_progress', 'on_hold', 'to_do'})
+
+
+def _nextgenprojectsmaterials_assign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectsmaterials_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'project_id' not in body:
+        errors.append("project_id: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'after_id' in body:
+        v0 = body['after_id']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, str):
+            errors.append("after_id: expected string")
+    if 'assignees' in body:
+        v1 = body['assignees']
+        if v1 is None:
+            errors.append("assignees: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("assignees: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"assignees[{i2}]: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append(f"assignees[{i2}]: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_1, key=str):
+                        errors.append(f"assignees[{i2}].{key}: unknown field")
+                    if 'id' not in v2:
+                        errors.append(f"assignees[{i2}].id: required")
+                    if 'type' not in v2:
+                        errors.append(f"assignees[{i2}].type: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append(f"assignees[{i2}].id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"assignees[{i2}].id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append(f"assignees[{i2}].type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"assignees[{i2}].type: expected string")
+                        elif v4 not in _ENUM_2:
+                            errors.append(f"assignees[{i2}].type: must be one of {sorted(_ENUM_2)}")
+    if 'billing_method' in body:
+        v5 = body['billing_method']
+        if v5 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("billing_method: expected string")
+        elif v5 not in _ENUM_4:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_4)}")
+    if 'description' in body:
+        v6 = body['description']
+        if v6 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v7 = body['end_date']
+        if v7 is None:
+            errors.append("end_date: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v8 = body['external_budget']
+        if v8 is None:
+            pass
+        elif not isinstance(v8, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_5, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v8:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v8:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v8:
+                v9 = v8['amount']
+                if v9 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v9, bool) or not isinstance(v9, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v8:
+                v10 = v8['currency']
+                if v10 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v10 not in _ENUM_6:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'fixed_price' in body:
+        v11 = body['fixed_price']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_5, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v11:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v11:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v11:
+                v12 = v11['amount']
+                if v12 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v11:
+                v13 = v11['currency']
+                if v13 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v13, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v13 not in _ENUM_6:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_6)}")
+    if 'group_id' in body:
+        v14 = body['group_id']
+        if v14 is None:
+            errors.append("group_id: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("group_id: expected string")
+    if 'internal_budget' in body:
+        v15 = body['internal_budget']
+        if v15 is None:
+            pass
+        elif not isinstance(v15, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v15.keys() - _KEYS_5, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v15:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v15:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v15:
+                v16 = v15['amount']
+                if v16 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v15:
+                v17 = v15['currency']
+                if v17 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v17 not in _ENUM_6:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'product_id' in body:
+        v18 = body['product_id']
+        if v18 is None:
+            errors.append("product_id: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("product_id: expected string")
+    if 'project_id' in body:
+        v19 = body['project_id']
+        if v19 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("project_id: expected string")
+    if 'quantity' in body:
+        v20 = body['quantity']
+        if v20 is None:
+            errors.append("quantity: must not be null")
+        elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+            errors.append("quantity: expected number")
+    if 'quantity_estimated' in body:
+        v21 = body['quantity_estimated']
+        if v21 is None:
+            errors.append("quantity_estimated: must not be null")
+        elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+            errors.append("quantity_estimated: expected number")
+    if 'start_date' in body:
+        v22 = body['start_date']
+        if v22 is None:
+            errors.append("start_date: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("start_date: expected string")
+    if 'title' in body:
+        v23 = body['title']
+        if v23 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v23, str):
+            errors.append("title: expected string")
+    if 'unit_cost' in body:
+        v24 = body['unit_cost']
+        if v24 is None:
+            pass
+        elif not isinstance(v24, dict):
+            errors.append("unit_cost: expected object")
+        else:
+            for key in sorted(v24.keys() - _KEYS_5, key=str):
+                errors.append(f"unit_cost.{key}: unknown field")
+            if 'amount' not in v24:
+                errors.append("unit_cost.amount: required")
+            if 'currency' not in v24:
+                errors.append("unit_cost.currency: required")
+            if 'amount' in v24:
+                v25 = v24['amount']
+                if v25 is None:
+                    errors.append("unit_cost.amount: must not be null")
+                elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                    errors.append("unit_cost.amount: expected number")
+            if 'currency' in v24:
+                v26 = v24['currency']
+                if v26 is None:
+                    errors.append("unit_cost.currency: must not be null")
+                elif not isinstance(v26, str):
+                    errors.append("unit_cost.currency: expected string")
+                elif v26 not in _ENUM_6:
+                    errors.append(f"unit_cost.currency: must be one of {sorted(_ENUM_6)}")
+    if 'unit_id' in body:
+        v27 = body['unit_id']
+        if v27 is None:
+            errors.append("unit_id: must not be null")
+        elif not isinstance(v27, str):
+            errors.append("unit_id: expected string")
+    if 'unit_price' in body:
+        v28 = body['unit_price']
+        if v28 is None:
+            pass
+        elif not isinstance(v28, dict):
+            errors.append("unit_price: expected object")
+        else:
+            for key in sorted(v28.keys() - _KEYS_5, key=str):
+                errors.append(f"unit_price.{key}: unknown field")
+            if 'amount' not in v28:
+                errors.append("unit_price.amount: required")
+            if 'currency' not in v28:
+                errors.append("unit_price.currency: required")
+            if 'amount' in v28:
+                v29 = v28['amount']
+                if v29 is None:
+                    errors.append("unit_price.amount: must not be null")
+                elif isinstance(v29, bool) or not isinstance(v29, (int, float)):
+                    errors.append("unit_price.amount: expected number")
+            if 'currency' in v28:
+                v30 = v28['currency']
+                if v30 is None:
+                    errors.append("unit_price.currency: must not be null")
+                elif not isinstance(v30, str):
+                    errors.append("unit_price.currency: expected string")
+                elif v30 not in _ENUM_6:
+                    errors.append(f"unit_price.currency: must be one of {sorted(_ENUM_6)}")
+
+
+def _nextgenprojectsmaterials_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectsmaterials_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'origin_id' not in body:
+        errors.append("origin_id: required")
+    if 'origin_id' in body:
+        v0 = body['origin_id']
+        if v0 is None:
+            errors.append("origin_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("origin_id: expected string")
+
+
+def _nextgenprojectsmaterials_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectsmaterials_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_10, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+
+
+def _nextgenprojectsmaterials_unassign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectsmaterials_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'billing_method' in body:
+        v0 = body['billing_method']
+        if v0 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("billing_method: expected string")
+        elif v0 not in _ENUM_4:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_4)}")
+    if 'description' in body:
+        v1 = body['description']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v2 = body['end_date']
+        if v2 is None:
+            pass
+        elif not isinstance(v2, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v3 = body['external_budget']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_5, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v3:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v3:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v3:
+                v4 = v3['amount']
+                if v4 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v3:
+                v5 = v3['currency']
+                if v5 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v5 not in _ENUM_6:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'fixed_price' in body:
+        v6 = body['fixed_price']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v6.keys() - _KEYS_5, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v6:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v6:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v6:
+                v7 = v6['amount']
+                if v7 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v6:
+                v8 = v6['currency']
+                if v8 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v8 not in _ENUM_6:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_6)}")
+    if 'id' in body:
+        v9 = body['id']
+        if v9 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("id: expected string")
+    if 'internal_budget' in body:
+        v10 = body['internal_budget']
+        if v10 is None:
+            pass
+        elif not isinstance(v10, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v10.keys() - _KEYS_5, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v10:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v10:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v10:
+                v11 = v10['amount']
+                if v11 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v11, bool) or not isinstance(v11, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v10:
+                v12 = v10['currency']
+                if v12 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v12 not in _ENUM_6:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'product_id' in body:
+        v13 = body['product_id']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, str):
+            errors.append("product_id: expected string")
+    if 'quantity' in body:
+        v14 = body['quantity']
+        if v14 is None:
+            pass
+        elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+            errors.append("quantity: expected number")
+    if 'quantity_estimated' in body:
+        v15 = body['quantity_estimated']
+        if v15 is None:
+            pass
+        elif isinstance(v15, bool) or not isinstance(v15, (int, float)):
+            errors.append("quantity_estimated: expected number")
+    if 'start_date' in body:
+        v16 = body['start_date']
+        if v16 is None:
+            pass
+        elif not isinstance(v16, str):
+            errors.append("start_date: expected string")
+    if 'status' in body:
+        v17 = body['status']
+        if v17 is None:
+            errors.append("status: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("status: expected string")
+        elif v17 not in _ENUM_12:
+            errors.append(f"status: must be one of {sorted(_ENUM_12)}")
+    if 'title' in body:
+        v18 = body['title']
+        if v18 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("title: expected string")
+    if 'unit_cost' in body:
+        v19 = body['unit_cost']
+        if v19 is None:
+            pass
+        elif not isinstance(v19, dict):
+            errors.append("unit_cost: expected object")
+        else:
+            for key in sorted(v19.keys() - _KEYS_5, key=str):
+                errors.append(f"unit_cost.{key}: unknown field")
+            if 'amount' not in v19:
+                errors.append("unit_cost.amount: required")
+            if 'currency' not in v19:
+                errors.append("unit_cost.currency: required")
+            if 'amount' in v19:
+                v20 = v19['amount']
+                if v20 is None:
+                    errors.append("unit_cost.amount: must not be null")
+                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                    errors.append("unit_cost.amount: expected number")
+            if 'currency' in v19:
+                v21 = v19['currency']
+                if v21 is None:
+                    errors.append("unit_cost.currency: must not be null")
+                elif not isinstance(v21, str):
+                    errors.append("unit_cost.currency: expected string")
+                elif v21 not in _ENUM_6:
+                    errors.append(f"unit_cost.currency: must be one of {sorted(_ENUM_6)}")
+    if 'unit_id' in body:
+        v22 = body['unit_id']
+        if v22 is None:
+            pass
+        elif not isinstance(v22, str):
+            errors.append("unit_id: expected string")
+    if 'unit_price' in body:
+        v23 = body['unit_price']
+        if v23 is None:
+            pass
+        elif not isinstance(v23, dict):
+            errors.append("unit_price: expected object")
+        else:
+            for key in sorted(v23.keys() - _KEYS_5, key=str):
+                errors.append(f"unit_price.{key}: unknown field")
+            if 'amount' not in v23:
+                errors.append("unit_price.amount: required")
+            if 'currency' not in v23:
+                errors.append("unit_price.currency: required")
+            if 'amount' in v23:
+                v24 = v23['amount']
+                if v24 is None:
+                    errors.append("unit_price.amount: must not be null")
+                elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                    errors.append("unit_price.amount: expected number")
+            if 'currency' in v23:
+                v25 = v23['currency']
+                if v25 is None:
+                    errors.append("unit_price.currency: must not be null")
+                elif not isinstance(v25, str):
+                    errors.append("unit_price.currency: expected string")
+                elif v25 not in _ENUM_6:
+                    errors.append(f"unit_price.currency: must be one of {sorted(_ENUM_6)}")
+
+
+VALIDATORS = {
+    'NextgenProjectsMaterials.assign': _nextgenprojectsmaterials_assign,
+    'NextgenProjectsMaterials.create': _nextgenprojectsmaterials_create,
+    'NextgenProjectsMaterials.delete': _nextgenprojectsmaterials_delete,
+    'NextgenProjectsMaterials.duplicate': _nextgenprojectsmaterials_duplicate,
+    'NextgenProjectsMaterials.info': _nextgenprojectsmaterials_info,
+    'NextgenProjectsMaterials.list': _nextgenprojectsmaterials_list,
+    'NextgenProjectsMaterials.unassign': _nextgenprojectsmaterials_unassign,
+    'NextgenProjectsMaterials.update': _nextgenprojectsmaterials_update,
+}
+# fmt: on
@@ -0,0 +1,853 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({'attach_to', 'custom_fields', 'id', 'summary'})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'company', 'contact', 'deal'})
+_KEYS_4 = frozenset({'id', 'value'})
+_ENUM_5 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_6 = frozenset({'id', 'includes'})
+_KEYS_7 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_8 = frozenset({
+    'employee_id',
+    'end_date',
+    'ids',
+    'milestone_id',
+    'recurrence_id',
+    'start_date',
+    'term',
+})
+_KEYS_9 = frozenset({'number', 'size'})
+_KEYS_10 = frozenset({'field', 'order'})
+_ENUM_11 = frozenset({'scheduled_at'})
+_KEYS_12 = frozenset({
+    'attendees',
+    'custom_fields',
+    'customer',
+    'deal_id',
+    'description',
+    'ends_at',
+    'location',
+    'milestone_id',
+    'starts_at',
+    'title',
+    'work_order_id',
+})
+_ENUM_13 = frozenset({'contact', 'user'})
+_ENUM_14 = frozenset({'company', 'contact'})
+_KEYS_15 = frozenset({'type'})
+_KEYS_16 = frozenset({'address', 'id', 'type'})
+_KEYS_17 = frozenset({'area_level_two_id', 'city', 'country', 'line_1', 'postal_code'})
+_KEYS_18 = frozenset({'address', 'type'})
+_KEYS_19 = frozenset({
+    'attendees',
+    'custom_fields',
+    'customer',
+    'deal_id',
+    'description',
+    'ends_at',
+    'id',
+    'location',
+    'milestone_id',
+    'starts_at',
+    'title',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_5:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_5)}")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_15, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'type' not in v0:
+            errors.append(f"{path}.type: required")
+        if 'type' in v0:
+            v1 = v0['type']
+            if v1 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.type: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'address' not in v0:
+            errors.append(f"{path}.address: required")
+        if 'id' not in v0:
+            errors.append(f"{path}.id: required")
+        if 'type' not in v0:
+            errors.append(f"{path}.type: required")
+        if 'address' in v0:
+            v1 = v0['address']
+            if v1 is None:
+                errors.append(f"{path}.address: must not be null")
+            elif not isinstance(v1, dict):
+                errors.append(f"{path}.address: expected object")
+            else:
+                for key in sorted(v1.keys() - _KEYS_17, key=str):
+                    errors.append(f"{path}.address.{key}: unknown field")
+                if 'line_1' not in v1:
+                    errors.append(f"{path}.address.line_1: required")
+                if 'postal_code' not in v1:
+                    errors.append(f"{path}.address.postal_code: required")
+                if 'city' not in v1:
+                    errors.append(f"{path}.address.city: required")
+                if 'country' not in v1:
+                    errors.append(f"{path}.address.country: required")
+                if 'area_level_two_id' in v1:
+                    v2 = v1['area_level_two_id']
+                    if v2 is None:
+                        errors.append(f"{path}.address.area_level_two_id: must not be null")
+                    elif not isinstance(v2, str):
+                        errors.append(f"{path}.address.area_level_two_id: expected string")
+                if 'city' in v1:
+                    v3 = v1['city']
+                    if v3 is None:
+                        pass
+                    elif not isinstance(v3, str):
+                        errors.append(f"{path}.address.city: expected string")
+                if 'country' in v1:
+                    v4 = v1['country']
+                    if v4 is None:
+                        errors.append(f"{path}.address.country: must not be null")
+                    elif not isinstance(v4, str):
+                        errors.append(f"{path}.address.country: expected string")
+                if 'line_1' in v1:
+                    v5 = v1['line_1']
+                    if v5 is None:
+                        pass
+                    elif not isinstance(v5, str):
+                        errors.append(f"{path}.address.line_1: expected string")
+                if 'postal_code' in v1:
+                    v6 = v1['postal_code']
+                    if v6 is None:
+                        pass
+                    elif not isinstance(v6, str):
+                        errors.append(f"{path}.address.postal_code: expected string")
+        if 'id' in v0:
+            v7 = v0['id']
+            if v7 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v7, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v8 = v0['type']
+            if v8 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v8, str):
+                errors.append(f"{path}.type: expected string")
+            elif v8 not in _ENUM_14:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_14)}")
+
+
+def _schema_7(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_18, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'address' not in v0:
+            errors.append(f"{path}.address: required")
+        if 'type' not in v0:
+            errors.append(f"{path}.type: required")
+        if 'address' in v0:
+            v1 = v0['address']
+            if v1 is None:
+                errors.append(f"{path}.address: must not be null")
+            elif not isinstance(v1, dict):
+                errors.append(f"{path}.address: expected object")
+            else:
+                for key in sorted(v1.keys() - _KEYS_17, key=str):
+                    errors.append(f"{path}.address.{key}: unknown field")
+                if 'line_1' not in v1:
+                    errors.append(f"{path}.address.line_1: required")
+                if 'postal_code' not in v1:
+                    errors.append(f"{path}.address.postal_code: required")
+                if 'city' not in v1:
+                    errors.append(f"{path}.address.city: required")
+                if 'country' not in v1:
+                    errors.append(f"{path}.address.country: required")
+                if 'area_level_two_id' in v1:
+                    v2 = v1['area_level_two_id']
+                    if v2 is None:
+                        errors.append(f"{path}.address.area_level_two_id: must not be null")
+                    elif not isinstance(v2, str):
+                        errors.append(f"{path}.address.area_level_two_id: expected string")
+                if 'city' in v1:
+                    v3 = v1['city']
+                    if v3 is None:
+                        pass
+                    elif not isinstance(v3, str):
+                        errors.append(f"{path}.address.city: expected string")
+                if 'country' in v1:
+                    v4 = v1['country']
+                    if v4 is None:
+                        errors.append(f"{path}.address.country: must not be null")
+                    elif not isinstance(v4, str):
+                        errors.append(f"{path}.address.country: expected string")
+                if 'line_1' in v1:
+                    v5 = v1['line_1']
+                    if v5 is None:
+                        pass
+                    elif not isinstance(v5, str):
+                        errors.append(f"{path}.address.line_1: expected string")
+                if 'postal_code' in v1:
+                    v6 = v1['postal_code']
+                    if v6 is None:
+                        pass
+                    elif not isinstance(v6, str):
+                        errors.append(f"{path}.address.postal_code: expected string")
+        if 'type' in v0:
+            v7 = v0['type']
+            if v7 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v7, str):
+                errors.append(f"{path}.type: expected string")
+
+
+def _schema_8(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'type' not in v0:
+            errors.append(f"{path}.type: required")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+
+
+def _meetings_complete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _meetings_createreport(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'attach_to' not in body:
+        errors.append("attach_to: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attach_to' in body:
+        v0 = body['attach_to']
+        if v0 is None:
+            errors.append("attach_to: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("attach_to: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"attach_to.{key}: unknown field")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("attach_to.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("attach_to.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("attach_to.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("attach_to.type: expected string")
+                elif v2 not in _ENUM_3:
+                    errors.append(f"attach_to.type: must be one of {sorted(_ENUM_3)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'id' in body:
+        v8 = body['id']
+        if v8 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("id: expected string")
+    if 'summary' in body:
+        v9 = body['summary']
+        if v9 is None:
+            errors.append("summary: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("summary: expected string")
+
+
+def _meetings_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _meetings_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _meetings_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_8, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'employee_id' in v0:
+                v1 = v0['employee_id']
+                if v1 is None:
+                    errors.append("filter.employee_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.employee_id: expected string")
+            if 'end_date' in v0:
+                v2 = v0['end_date']
+                if v2 is None:
+                    errors.append("filter.end_date: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.end_date: expected string")
+            if 'ids' in v0:
+                v3 = v0['ids']
+                if v3 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.ids[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.ids[{i4}]: expected string")
+            if 'milestone_id' in v0:
+                v5 = v0['milestone_id']
+                if v5 is None:
+                    errors.append("filter.milestone_id: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.milestone_id: expected string")
+            if 'recurrence_id' in v0:
+                v6 = v0['recurrence_id']
+                if v6 is None:
+                    errors.append("filter.recurrence_id: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.recurrence_id: expected string")
+            if 'start_date' in v0:
+                v7 = v0['start_date']
+                if v7 is None:
+                    errors.append("filter.start_date: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.start_date: expected string")
+            if 'term' in v0:
+                v8 = v0['term']
+                if v8 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("filter.term: expected string")
+    if 'includes' in body:
+        v9 = body['includes']
+        if v9 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v10 = body['page']
+        if v10 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v10, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v10.keys() - _KEYS_9, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v10:
+                v11 = v10['number']
+                if v11 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v11, bool) or not isinstance(v11, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v10:
+                v12 = v10['size']
+                if v12 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v13 = body['sort']
+        if v13 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v13, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i14, v14 in enumerate(v13):
+                if v14 is None:
+                    errors.append(f"sort[{i14}]: must not be null")
+                elif not isinstance(v14, dict):
+                    errors.append(f"sort[{i14}]: expected object")
+                else:
+                    for key in sorted(v14.keys() - _KEYS_10, key=str):
+                        errors.append(f"sort[{i14}].{key}: unknown field")
+                    if 'field' not in v14:
+                        errors.append(f"sort[{i14}].field: required")
+                    if 'field' in v14:
+                        v15 = v14['field']
+                        if v15 is None:
+                            errors.append(f"sort[{i14}].field: must not be null")
+                        elif not isinstance(v15, str):
+                            errors.append(f"sort[{i14}].field: expected string")
+                        elif v15 not in _ENUM_11:
+                            errors.append(f"sort[{i14}].field: must be one of {sorted(_ENUM_11)}")
+                    if 'order' in v14:
+                        v16 = v14['order']
+                        if v16 is None:
+                            errors.append(f"sort[{i14}].order: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append(f"sort[{i14}].order: expected string")
+
+
+def _meetings_schedule(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'starts_at' not in body:
+        errors.append("starts_at: required")
+    if 'ends_at' not in body:
+        errors.append("ends_at: required")
+    if 'attendees' not in body:
+        errors.append("attendees: required")
+    if 'attendees' in body:
+        v0 = body['attendees']
+        if v0 is None:
+            errors.append("attendees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attendees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attendees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"attendees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_2, key=str):
+                        errors.append(f"attendees[{i1}].{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"attendees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"attendees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"attendees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"attendees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_13:
+                            errors.append(f"attendees[{i1}].type: must be one of {sorted(_ENUM_13)}")
+    if 'custom_fields' in body:
+        v4 = body['custom_fields']
+        if v4 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v4, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i5, v5 in enumerate(v4):
+                if v5 is None:
+                    errors.append(f"custom_fields[{i5}]: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append(f"custom_fields[{i5}]: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i5}].{key}: unknown field")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append(f"custom_fields[{i5}].id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"custom_fields[{i5}].id: expected string")
+                    if 'value' in v5:
+                        v7 = v5['value']
+                        for check8 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors8: list[str] = []
+                            check8(v7, f"custom_fields[{i5}].value", branch_errors8)
+                            if not branch_errors8:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i5}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v9 = body['customer']
+        if v9 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v9, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v9:
+                errors.append("customer.type: required")
+            if 'id' not in v9:
+                errors.append("customer.id: required")
+            if 'id' in v9:
+                v10 = v9['id']
+                if v10 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v9:
+                v11 = v9['type']
+                if v11 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("customer.type: expected string")
+                elif v11 not in _ENUM_14:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_14)}")
+    if 'deal_id' in body:
+        v12 = body['deal_id']
+        if v12 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v13 = body['description']
+        if v13 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("description: expected string")
+    if 'ends_at' in body:
+        v14 = body['ends_at']
+        if v14 is None:
+            errors.append("ends_at: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("ends_at: expected string")
+    if 'location' in body:
+        v15 = body['location']
+        for check16 in (_schema_5, _schema_6, _schema_7, _schema_8,):
+            branch_errors16: list[str] = []
+            check16(v15, "location", branch_errors16)
+            if not branch_errors16:
+                break
+        else:
+            errors.append("location: does not match any allowed shape")
+    if 'milestone_id' in body:
+        v17 = body['milestone_id']
+        if v17 is None:
+            errors.append("milestone_id: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("milestone_id: expected string")
+    if 'starts_at' in body:
+        v18 = body['starts_at']
+        if v18 is None:
+            errors.append("starts_at: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("starts_at: expected string")
+    if 'title' in body:
+        v19 = body['title']
+        if v19 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("title: expected string")
+    if 'work_order_id' in body:
+        v20 = body['work_order_id']
+        if v20 is None:
+            errors.append("work_order_id: must not be null")
+        elif not isinstance(v20, str):
+            errors.append("work_order_id: expected string")
+
+
+def _meetings_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_19, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attendees' in body:
+        v0 = body['attendees']
+        if v0 is None:
+            errors.append("attendees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attendees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attendees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"attendees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_2, key=str):
+                        errors.append(f"attendees[{i1}].{key}: unknown field")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"attendees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"attendees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"attendees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"attendees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_13:
+                            errors.append(f"attendees[{i1}].type: must be one of {sorted(_ENUM_13)}")
+    if 'custom_fields' in body:
+        v4 = body['custom_fields']
+        if v4 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v4, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i5, v5 in enumerate(v4):
+                if v5 is None:
+                    errors.append(f"custom_fields[{i5}]: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append(f"custom_fields[{i5}]: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i5}].{key}: unknown field")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append(f"custom_fields[{i5}].id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"custom_fields[{i5}].id: expected string")
+                    if 'value' in v5:
+                        v7 = v5['value']
+                        for check8 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors8: list[str] = []
+                            check8(v7, f"custom_fields[{i5}].value", branch_errors8)
+                            if not branch_errors8:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i5}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v9 = body['customer']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'id' not in v9:
+                errors.append("customer.id: required")
+            if 'type' not in v9:
+                errors.append("customer.type: required")
+            if 'id' in v9:
+                v10 = v9['id']
+                if v10 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v9:
+                v11 = v9['type']
+                if v11 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("customer.type: expected string")
+                elif v11 not in _ENUM_14:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_14)}")
+    if 'deal_id' in body:
+        v12 = body['deal_id']
+        if v12 is None:
+            pass
+        elif not isinstance(v12, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v13 = body['description']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, str):
+            errors.append("description: expected string")
+    if 'ends_at' in body:
+        v14 = body['ends_at']
+        if v14 is None:
+            errors.append("ends_at: must not be null")
+        elif not isinstance(v14, str):
+            errors.append("ends_at: expected string")
+    if 'id' in body:
+        v15 = body['id']
+        if v15 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v15, str):
+            errors.append("id: expected string")
+    if 'location' in body:
+        v16 = body['location']
+        for check17 in (_schema_5, _schema_6, _schema_7, _schema_8,):
+            branch_errors17: list[str] = []
+            check17(v16, "location", branch_errors17)
+            if not branch_errors17:
+                break
+        else:
+            errors.append("location: does not match any allowed shape")
+    if 'milestone_id' in body:
+        v18 = body['milestone_id']
+        if v18 is None:
+            pass
+        elif not isinstance(v18, str):
+            errors.append("milestone_id: expected string")
+    if 'starts_at' in body:
+        v19 = body['starts_at']
+        if v19 is None:
+            errors.append("starts_at: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("starts_at: expected string")
+    if 'title' in body:
+        v20 = body['title']
+        if v20 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v20, str):
+            errors.append("title: expected string")
+
+
+VALIDATORS = {
+    'meetings.complete': _meetings_complete,
+    'meetings.createReport': _meetings_createreport,
+    'meetings.delete': _meetings_delete,
+    'meetings.info': _meetings_info,
+    'meetings.list': _meetings_list,
+    'meetings.schedule': _meetings_schedule,
+    'meetings.update': _meetings_update,
+}
+# fmt: on
@@ -0,0 +1,95 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'type'})
+_ENUM_1 = frozenset({'call', 'meeting', 'task'})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({
+    'account',
+    'call',
+    'company',
+    'contact',
+    'creditNote',
+    'customField',
+    'deal',
+    'dealPhase',
+    'department',
+    'invoice',
+    'meeting',
+    'milestone',
+    'product',
+    'project',
+    'quotation',
+    'subscription',
+    'task',
+    'ticket',
+    'timeTracking',
+    'user',
+})
+_KEYS_4 = frozenset({'department_id', 'tax_rate'})
+
+
+def _migrate_activitytype(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'type' in body:
+        v0 = body['type']
+        if v0 is None:
+            errors.append("type: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("type: expected string")
+        elif v0 not in _ENUM_1:
+            errors.append(f"type: must be one of {sorted(_ENUM_1)}")
+
+
+def _migrate_id(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+            errors.append("id: expected number")
+    if 'type' in body:
+        v1 = body['type']
+        if v1 is None:
+            errors.append("type: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("type: expected string")
+        elif v1 not in _ENUM_3:
+            errors.append(f"type: must be one of {sorted(_ENUM_3)}")
+
+
+def _migrate_taxrate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'department_id' in body:
+        v0 = body['department_id']
+        if v0 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("department_id: expected string")
+    if 'tax_rate' in body:
+        v1 = body['tax_rate']
+        if v1 is None:
+            errors.append("tax_rate: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("tax_rate: expected string")
+
+
+VALIDATORS = {
+    'migrate.activityType': _migrate_activitytype,
+    'migrate.id': _migrate_id,
+    'migrate.taxRate': _migrate_taxrate,
+}
+# fmt: on
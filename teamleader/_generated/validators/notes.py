@@ -0,0 +1,135 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'content', 'notify', 'subject'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'user'})
+_ENUM_3 = frozenset({
+    'company',
+    'contact',
+    'creditNote',
+    'deal',
+    'invoice',
+    'nextgenProject',
+    'product',
+    'quotation',
+    'subscription',
+})
+_KEYS_4: frozenset[Any] = frozenset()
+_KEYS_5 = frozenset({'content', 'id'})
+
+
+def _notes_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'content' not in body:
+        errors.append("content: required")
+    if 'subject' not in body:
+        errors.append("subject: required")
+    if 'content' in body:
+        v0 = body['content']
+        if v0 is None:
+            errors.append("content: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("content: expected string")
+    if 'notify' in body:
+        v1 = body['notify']
+        if v1 is None:
+            errors.append("notify: must not be null")
+        elif not isinstance(v1, (list, tuple)):
+            errors.append("notify: expected array")
+        else:
+            for i2, v2 in enumerate(v1):
+                if v2 is None:
+                    errors.append(f"notify[{i2}]: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append(f"notify[{i2}]: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_1, key=str):
+                        errors.append(f"notify[{i2}].{key}: unknown field")
+                    if 'id' not in v2:
+                        errors.append(f"notify[{i2}].id: required")
+                    if 'type' not in v2:
+                        errors.append(f"notify[{i2}].type: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append(f"notify[{i2}].id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"notify[{i2}].id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append(f"notify[{i2}].type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"notify[{i2}].type: expected string")
+                        elif v4 not in _ENUM_2:
+                            errors.append(f"notify[{i2}].type: must be one of {sorted(_ENUM_2)}")
+    if 'subject' in body:
+        v5 = body['subject']
+        if v5 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("subject: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_1, key=str):
+                errors.append(f"subject.{key}: unknown field")
+            if 'id' not in v5:
+                errors.append("subject.id: required")
+            if 'type' not in v5:
+                errors.append("subject.type: required")
+            if 'id' in v5:
+                v6 = v5['id']
+                if v6 is None:
+                    errors.append("subject.id: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("subject.id: expected string")
+            if 'type' in v5:
+                v7 = v5['type']
+                if v7 is None:
+                    errors.append("subject.type: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("subject.type: expected string")
+                elif v7 not in _ENUM_3:
+                    errors.append(f"subject.type: must be one of {sorted(_ENUM_3)}")
+
+
+def _notes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+def _notes_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'content' in body:
+        v0 = body['content']
+        if v0 is None:
+            errors.append("content: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("content: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+VALIDATORS = {
+    'notes.create': _notes_create,
+    'notes.list': _notes_list,
+    'notes.update': _notes_update,
+}
+# fmt: on
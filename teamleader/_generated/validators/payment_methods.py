@@ -0,0 +1,83 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page'})
+_KEYS_1 = frozenset({'ids', 'status'})
+_ENUM_2 = frozenset({'active', 'archived'})
+_KEYS_3 = frozenset({'number', 'size'})
+
+
+def _paymentmethods_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'status' in v0:
+                v3 = v0['status']
+                if v3 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.status[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.status[{i4}]: expected string")
+                        elif v4 not in _ENUM_2:
+                            errors.append(f"filter.status[{i4}]: must be one of {sorted(_ENUM_2)}")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_3, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+VALIDATORS = {
+    'paymentMethods.list': _paymentmethods_list,
+}
+# fmt: on
@@ -0,0 +1,266 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id', 'source'})
+_KEYS_1 = frozenset({'id', 'type'})
+_KEYS_2 = frozenset({'filter', 'page', 'sort'})
+_KEYS_3 = frozenset({
+    'assignees',
+    'completion_statuses',
+    'end_date',
+    'ids',
+    'planned_time_statuses',
+    'project_ids',
+    'start_date',
+    'status',
+    'term',
+    'work_type_ids',
+})
+_ENUM_4 = frozenset({'team', 'user'})
+_ENUM_5 = frozenset({'done', 'to_do'})
+_ENUM_6 = frozenset({'fully_planned', 'overbooked', 'partially_planned', 'unplanned'})
+_ENUM_7 = frozenset({'active', 'deactivated'})
+_KEYS_8 = frozenset({'number', 'size'})
+_KEYS_9 = frozenset({'field', 'order'})
+_ENUM_10 = frozenset({'end_date', 'id', 'total_duration'})
+
+
+def _plannableitems_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'source' in body:
+        v1 = body['source']
+        if v1 is None:
+            errors.append("source: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("source: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"source.{key}: unknown field")
+            if 'id' in v1:
+                v2 = v1['id']
+                if v2 is None:
+                    errors.append("source.id: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("source.id: expected string")
+            if 'type' in v1:
+                v3 = v1['type']
+                if v3 is None:
+                    errors.append("source.type: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("source.type: expected string")
+
+
+def _plannableitems_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_3, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'assignees' in v0:
+                v1 = v0['assignees']
+                if v1 is None:
+                    errors.append("filter.assignees: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.assignees: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.assignees[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.assignees[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_1, key=str):
+                                errors.append(f"filter.assignees[{i2}].{key}: unknown field")
+                            if 'id' not in v2:
+                                errors.append(f"filter.assignees[{i2}].id: required")
+                            if 'type' not in v2:
+                                errors.append(f"filter.assignees[{i2}].type: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.assignees[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.assignees[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.assignees[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.assignees[{i2}].type: expected string")
+                                elif v4 not in _ENUM_4:
+                                    errors.append(f"filter.assignees[{i2}].type: must be one of {sorted(_ENUM_4)}")
+            if 'completion_statuses' in v0:
+                v5 = v0['completion_statuses']
+                if v5 is None:
+                    errors.append("filter.completion_statuses: must not be null")
+                elif not isinstance(v5, (list, tuple)):
+                    errors.append("filter.completion_statuses: expected array")
+                else:
+                    for i6, v6 in enumerate(v5):
+                        if v6 is None:
+                            errors.append(f"filter.completion_statuses[{i6}]: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"filter.completion_statuses[{i6}]: expected string")
+                        elif v6 not in _ENUM_5:
+                            errors.append(f"filter.completion_statuses[{i6}]: must be one of {sorted(_ENUM_5)}")
+            if 'end_date' in v0:
+                v7 = v0['end_date']
+                if v7 is None:
+                    errors.append("filter.end_date: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("filter.end_date: expected string")
+            if 'ids' in v0:
+                v8 = v0['ids']
+                if v8 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v8, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i9, v9 in enumerate(v8):
+                        if v9 is None:
+                            errors.append(f"filter.ids[{i9}]: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"filter.ids[{i9}]: expected string")
+            if 'planned_time_statuses' in v0:
+                v10 = v0['planned_time_statuses']
+                if v10 is None:
+                    errors.append("filter.planned_time_statuses: must not be null")
+                elif not isinstance(v10, (list, tuple)):
+                    errors.append("filter.planned_time_statuses: expected array")
+                else:
+                    for i11, v11 in enumerate(v10):
+                        if v11 is None:
+                            errors.append(f"filter.planned_time_statuses[{i11}]: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append(f"filter.planned_time_statuses[{i11}]: expected string")
+                        elif v11 not in _ENUM_6:
+                            errors.append(f"filter.planned_time_statuses[{i11}]: must be one of {sorted(_ENUM_6)}")
+            if 'project_ids' in v0:
+                v12 = v0['project_ids']
+                if v12 is None:
+                    errors.append("filter.project_ids: must not be null")
+                elif not isinstance(v12, (list, tuple)):
+                    errors.append("filter.project_ids: expected array")
+                else:
+                    for i13, v13 in enumerate(v12):
+                        if v13 is None:
+                            errors.append(f"filter.project_ids[{i13}]: must not be null")
+                        elif not isinstance(v13, str):
+                            errors.append(f"filter.project_ids[{i13}]: expected string")
+            if 'start_date' in v0:
+                v14 = v0['start_date']
+                if v14 is None:
+                    errors.append("filter.start_date: must not be null")
+                elif not isinstance(v14, str):
+                    errors.append("filter.start_date: expected string")
+            if 'status' in v0:
+                v15 = v0['status']
+                if v15 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v15, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i16, v16 in enumerate(v15):
+                        if v16 is None:
+                            errors.append(f"filter.status[{i16}]: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append(f"filter.status[{i16}]: expected string")
+                        elif v16 not in _ENUM_7:
+                            errors.append(f"filter.status[{i16}]: must be one of {sorted(_ENUM_7)}")
+            if 'term' in v0:
+                v17 = v0['term']
+                if v17 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append("filter.term: expected string")
+            if 'work_type_ids' in v0:
+                v18 = v0['work_type_ids']
+                if v18 is None:
+                    errors.append("filter.work_type_ids: must not be null")
+                elif not isinstance(v18, (list, tuple)):
+                    errors.append("filter.work_type_ids: expected array")
+                else:
+                    for i19, v19 in enumerate(v18):
+                        if v19 is None:
+                            errors.append(f"filter.work_type_ids[{i19}]: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append(f"filter.work_type_ids[{i19}]: expected string")
+    if 'page' in body:
+        v20 = body['page']
+        if v20 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v20, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v20.keys() - _KEYS_8, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v20:
+                v21 = v20['number']
+                if v21 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v20:
+                v22 = v20['size']
+                if v22 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v22, bool) or not isinstance(v22, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v23 = body['sort']
+        if v23 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v23, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i24, v24 in enumerate(v23):
+                if v24 is None:
+                    errors.append(f"sort[{i24}]: must not be null")
+                elif not isinstance(v24, dict):
+                    errors.append(f"sort[{i24}]: expected object")
+                else:
+                    for key in sorted(v24.keys() - _KEYS_9, key=str):
+                        errors.append(f"sort[{i24}].{key}: unknown field")
+                    if 'field' not in v24:
+                        errors.append(f"sort[{i24}].field: required")
+                    if 'field' in v24:
+                        v25 = v24['field']
+                        if v25 is None:
+                            errors.append(f"sort[{i24}].field: must not be null")
+                        elif not isinstance(v25, str):
+                            errors.append(f"sort[{i24}].field: expected string")
+                        elif v25 not in _ENUM_10:
+                            errors.append(f"sort[{i24}].field: must be one of {sorted(_ENUM_10)}")
+                    if 'order' in v24:
+                        v26 = v24['order']
+                        if v26 is None:
+                            errors.append(f"sort[{i24}].order: must not be null")
+
+
+VALIDATORS = {
+    'plannableItems.info': _plannableitems_info,
+    'plannableItems.list': _plannableitems_list,
+}
+# fmt: on
@@ -0,0 +1,931 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'code',
+    'configuration',
+    'custom_fields',
+    'department_id',
+    'description',
+    'name',
+    'price_list_prices',
+    'product_category_id',
+    'purchase_price',
+    'selling_price',
+    'stock',
+    'tax_rate_id',
+    'unit_of_measure_id',
+})
+_KEYS_1 = frozenset({'stock_threshold'})
+_KEYS_2 = frozenset({'action', 'minimum'})
+_ENUM_3 = frozenset({'notify'})
+_KEYS_4 = frozenset({'id', 'value'})
+_KEYS_5 = frozenset({'id', 'type'})
+_ENUM_6 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_7 = frozenset({'price', 'price_list_id'})
+_KEYS_8 = frozenset({'amount', 'currency'})
+_ENUM_9 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_10 = frozenset({'amount'})
+_KEYS_11 = frozenset({'id'})
+_KEYS_12 = frozenset({'id', 'includes'})
+_KEYS_13 = frozenset({'filter', 'page'})
+_KEYS_14 = frozenset({'ids', 'term', 'updated_since'})
+_KEYS_15 = frozenset({'number', 'size'})
+_KEYS_16 = frozenset({
+    'code',
+    'configuration',
+    'custom_fields',
+    'department_id',
+    'description',
+    'id',
+    'name',
+    'price_list_prices',
+    'product_category_id',
+    'purchase_price',
+    'selling_price',
+    'stock',
+    'tax_rate_id',
+    'unit_of_measure_id',
+})
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_5, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_6:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_6)}")
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_0, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'name' not in v0:
+            errors.append(f"{path}.name: required")
+        if 'code' in v0:
+            v1 = v0['code']
+            if v1 is None:
+                errors.append(f"{path}.code: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.code: expected string")
+        if 'configuration' in v0:
+            v2 = v0['configuration']
+            if v2 is None:
+                pass
+            elif not isinstance(v2, dict):
+                errors.append(f"{path}.configuration: expected object")
+            else:
+                for key in sorted(v2.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.configuration.{key}: unknown field")
+                if 'stock_threshold' in v2:
+                    v3 = v2['stock_threshold']
+                    if v3 is None:
+                        pass
+                    elif not isinstance(v3, dict):
+                        errors.append(f"{path}.configuration.stock_threshold: expected object")
+                    else:
+                        for key in sorted(v3.keys() - _KEYS_2, key=str):
+                            errors.append(f"{path}.configuration.stock_threshold.{key}: unknown field")
+                        if 'action' not in v3:
+                            errors.append(f"{path}.configuration.stock_threshold.action: required")
+                        if 'minimum' not in v3:
+                            errors.append(f"{path}.configuration.stock_threshold.minimum: required")
+                        if 'action' in v3:
+                            v4 = v3['action']
+                            if v4 is None:
+                                errors.append(f"{path}.configuration.stock_threshold.action: must not be null")
+                            elif not isinstance(v4, str):
+                                errors.append(f"{path}.configuration.stock_threshold.action: expected string")
+                            elif v4 not in _ENUM_3:
+                                errors.append(f"{path}.configuration.stock_threshold.action: must be one of {sorted(_ENUM_3)}")
+                        if 'minimum' in v3:
+                            v5 = v3['minimum']
+                            if v5 is None:
+                                errors.append(f"{path}.configuration.stock_threshold.minimum: must not be null")
+                            elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                                errors.append(f"{path}.configuration.stock_threshold.minimum: expected number")
+        if 'custom_fields' in v0:
+            v6 = v0['custom_fields']
+            if v6 is None:
+                errors.append(f"{path}.custom_fields: must not be null")
+            elif not isinstance(v6, (list, tuple)):
+                errors.append(f"{path}.custom_fields: expected array")
+            else:
+                for i7, v7 in enumerate(v6):
+                    if v7 is None:
+                        errors.append(f"{path}.custom_fields[{i7}]: must not be null")
+                    elif not isinstance(v7, dict):
+                        errors.append(f"{path}.custom_fields[{i7}]: expected object")
+                    else:
+                        for key in sorted(v7.keys() - _KEYS_4, key=str):
+                            errors.append(f"{path}.custom_fields[{i7}].{key}: unknown field")
+                        if 'id' in v7:
+                            v8 = v7['id']
+                            if v8 is None:
+                                errors.append(f"{path}.custom_fields[{i7}].id: must not be null")
+                            elif not isinstance(v8, str):
+                                errors.append(f"{path}.custom_fields[{i7}].id: expected string")
+                        if 'value' in v7:
+                            v9 = v7['value']
+                            for check10 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                                branch_errors10: list[str] = []
+                                check10(v9, f"{path}.custom_fields[{i7}].value", branch_errors10)
+                                if not branch_errors10:
+                                    break
+                            else:
+                                errors.append(f"{path}.custom_fields[{i7}].value: does not match any allowed shape")
+        if 'department_id' in v0:
+            v11 = v0['department_id']
+            if v11 is None:
+                errors.append(f"{path}.department_id: must not be null")
+            elif not isinstance(v11, str):
+                errors.append(f"{path}.department_id: expected string")
+        if 'description' in v0:
+            v12 = v0['description']
+            if v12 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v12, str):
+                errors.append(f"{path}.description: expected string")
+        if 'name' in v0:
+            v13 = v0['name']
+            if v13 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v13, str):
+                errors.append(f"{path}.name: expected string")
+        if 'price_list_prices' in v0:
+            v14 = v0['price_list_prices']
+            if v14 is None:
+                errors.append(f"{path}.price_list_prices: must not be null")
+            elif not isinstance(v14, (list, tuple)):
+                errors.append(f"{path}.price_list_prices: expected array")
+            else:
+                for i15, v15 in enumerate(v14):
+                    if v15 is None:
+                        errors.append(f"{path}.price_list_prices[{i15}]: must not be null")
+                    elif not isinstance(v15, dict):
+                        errors.append(f"{path}.price_list_prices[{i15}]: expected object")
+                    else:
+                        for key in sorted(v15.keys() - _KEYS_7, key=str):
+                            errors.append(f"{path}.price_list_prices[{i15}].{key}: unknown field")
+                        if 'price_list_id' not in v15:
+                            errors.append(f"{path}.price_list_prices[{i15}].price_list_id: required")
+                        if 'price' not in v15:
+                            errors.append(f"{path}.price_list_prices[{i15}].price: required")
+                        if 'price' in v15:
+                            v16 = v15['price']
+                            if v16 is None:
+                                errors.append(f"{path}.price_list_prices[{i15}].price: must not be null")
+                            elif not isinstance(v16, dict):
+                                errors.append(f"{path}.price_list_prices[{i15}].price: expected object")
+                            else:
+                                for key in sorted(v16.keys() - _KEYS_8, key=str):
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.{key}: unknown field")
+                                if 'amount' not in v16:
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.amount: required")
+                                if 'currency' not in v16:
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.currency: required")
+                                if 'amount' in v16:
+                                    v17 = v16['amount']
+                                    if v17 is None:
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.amount: must not be null")
+                                    elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.amount: expected number")
+                                if 'currency' in v16:
+                                    v18 = v16['currency']
+                                    if v18 is None:
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.currency: must not be null")
+                                    elif not isinstance(v18, str):
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.currency: expected string")
+                        if 'price_list_id' in v15:
+                            v19 = v15['price_list_id']
+                            if v19 is None:
+                                errors.append(f"{path}.price_list_prices[{i15}].price_list_id: must not be null")
+                            elif not isinstance(v19, str):
+                                errors.append(f"{path}.price_list_prices[{i15}].price_list_id: expected string")
+        if 'product_category_id' in v0:
+            v20 = v0['product_category_id']
+            if v20 is None:
+                errors.append(f"{path}.product_category_id: must not be null")
+            elif not isinstance(v20, str):
+                errors.append(f"{path}.product_category_id: expected string")
+        if 'purchase_price' in v0:
+            v21 = v0['purchase_price']
+            if v21 is None:
+                pass
+            elif not isinstance(v21, dict):
+                errors.append(f"{path}.purchase_price: expected object")
+            else:
+                for key in sorted(v21.keys() - _KEYS_8, key=str):
+                    errors.append(f"{path}.purchase_price.{key}: unknown field")
+                if 'amount' not in v21:
+                    errors.append(f"{path}.purchase_price.amount: required")
+                if 'currency' not in v21:
+                    errors.append(f"{path}.purchase_price.currency: required")
+                if 'amount' in v21:
+                    v22 = v21['amount']
+                    if v22 is None:
+                        errors.append(f"{path}.purchase_price.amount: must not be null")
+                    elif isinstance(v22, bool) or not isinstance(v22, (int, float)):
+                        errors.append(f"{path}.purchase_price.amount: expected number")
+                if 'currency' in v21:
+                    v23 = v21['currency']
+                    if v23 is None:
+                        errors.append(f"{path}.purchase_price.currency: must not be null")
+                    elif not isinstance(v23, str):
+                        errors.append(f"{path}.purchase_price.currency: expected string")
+                    elif v23 not in _ENUM_9:
+                        errors.append(f"{path}.purchase_price.currency: must be one of {sorted(_ENUM_9)}")
+        if 'selling_price' in v0:
+            v24 = v0['selling_price']
+            if v24 is None:
+                pass
+            elif not isinstance(v24, dict):
+                errors.append(f"{path}.selling_price: expected object")
+            else:
+                for key in sorted(v24.keys() - _KEYS_8, key=str):
+                    errors.append(f"{path}.selling_price.{key}: unknown field")
+                if 'amount' not in v24:
+                    errors.append(f"{path}.selling_price.amount: required")
+                if 'currency' not in v24:
+                    errors.append(f"{path}.selling_price.currency: required")
+                if 'amount' in v24:
+                    v25 = v24['amount']
+                    if v25 is None:
+                        errors.append(f"{path}.selling_price.amount: must not be null")
+                    elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                        errors.append(f"{path}.selling_price.amount: expected number")
+                if 'currency' in v24:
+                    v26 = v24['currency']
+                    if v26 is None:
+                        errors.append(f"{path}.selling_price.currency: must not be null")
+                    elif not isinstance(v26, str):
+                        errors.append(f"{path}.selling_price.currency: expected string")
+                    elif v26 not in _ENUM_9:
+                        errors.append(f"{path}.selling_price.currency: must be one of {sorted(_ENUM_9)}")
+        if 'stock' in v0:
+            v27 = v0['stock']
+            if v27 is None:
+                errors.append(f"{path}.stock: must not be null")
+            elif not isinstance(v27, dict):
+                errors.append(f"{path}.stock: expected object")
+            else:
+                for key in sorted(v27.keys() - _KEYS_10, key=str):
+                    errors.append(f"{path}.stock.{key}: unknown field")
+                if 'amount' in v27:
+                    v28 = v27['amount']
+                    if v28 is None:
+                        pass
+                    elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                        errors.append(f"{path}.stock.amount: expected number")
+        if 'tax_rate_id' in v0:
+            v29 = v0['tax_rate_id']
+            if v29 is None:
+                errors.append(f"{path}.tax_rate_id: must not be null")
+            elif not isinstance(v29, str):
+                errors.append(f"{path}.tax_rate_id: expected string")
+        if 'unit_of_measure_id' in v0:
+            v30 = v0['unit_of_measure_id']
+            if v30 is None:
+                pass
+            elif not isinstance(v30, str):
+                errors.append(f"{path}.unit_of_measure_id: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_0, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'code' not in v0:
+            errors.append(f"{path}.code: required")
+        if 'code' in v0:
+            v1 = v0['code']
+            if v1 is None:
+                errors.append(f"{path}.code: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.code: expected string")
+        if 'configuration' in v0:
+            v2 = v0['configuration']
+            if v2 is None:
+                pass
+            elif not isinstance(v2, dict):
+                errors.append(f"{path}.configuration: expected object")
+            else:
+                for key in sorted(v2.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.configuration.{key}: unknown field")
+                if 'stock_threshold' in v2:
+                    v3 = v2['stock_threshold']
+                    if v3 is None:
+                        pass
+                    elif not isinstance(v3, dict):
+                        errors.append(f"{path}.configuration.stock_threshold: expected object")
+                    else:
+                        for key in sorted(v3.keys() - _KEYS_2, key=str):
+                            errors.append(f"{path}.configuration.stock_threshold.{key}: unknown field")
+                        if 'action' not in v3:
+                            errors.append(f"{path}.configuration.stock_threshold.action: required")
+                        if 'minimum' not in v3:
+                            errors.append(f"{path}.configuration.stock_threshold.minimum: required")
+                        if 'action' in v3:
+                            v4 = v3['action']
+                            if v4 is None:
+                                errors.append(f"{path}.configuration.stock_threshold.action: must not be null")
+                            elif not isinstance(v4, str):
+                                errors.append(f"{path}.configuration.stock_threshold.action: expected string")
+                            elif v4 not in _ENUM_3:
+                                errors.append(f"{path}.configuration.stock_threshold.action: must be one of {sorted(_ENUM_3)}")
+                        if 'minimum' in v3:
+                            v5 = v3['minimum']
+                            if v5 is None:
+                                errors.append(f"{path}.configuration.stock_threshold.minimum: must not be null")
+                            elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                                errors.append(f"{path}.configuration.stock_threshold.minimum: expected number")
+        if 'custom_fields' in v0:
+            v6 = v0['custom_fields']
+            if v6 is None:
+                errors.append(f"{path}.custom_fields: must not be null")
+            elif not isinstance(v6, (list, tuple)):
+                errors.append(f"{path}.custom_fields: expected array")
+            else:
+                for i7, v7 in enumerate(v6):
+                    if v7 is None:
+                        errors.append(f"{path}.custom_fields[{i7}]: must not be null")
+                    elif not isinstance(v7, dict):
+                        errors.append(f"{path}.custom_fields[{i7}]: expected object")
+                    else:
+                        for key in sorted(v7.keys() - _KEYS_4, key=str):
+                            errors.append(f"{path}.custom_fields[{i7}].{key}: unknown field")
+                        if 'id' in v7:
+                            v8 = v7['id']
+                            if v8 is None:
+                                errors.append(f"{path}.custom_fields[{i7}].id: must not be null")
+                            elif not isinstance(v8, str):
+                                errors.append(f"{path}.custom_fields[{i7}].id: expected string")
+                        if 'value' in v7:
+                            v9 = v7['value']
+                            for check10 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                                branch_errors10: list[str] = []
+                                check10(v9, f"{path}.custom_fields[{i7}].value", branch_errors10)
+                                if not branch_errors10:
+                                    break
+                            else:
+                                errors.append(f"{path}.custom_fields[{i7}].value: does not match any allowed shape")
+        if 'department_id' in v0:
+            v11 = v0['department_id']
+            if v11 is None:
+                errors.append(f"{path}.department_id: must not be null")
+            elif not isinstance(v11, str):
+                errors.append(f"{path}.department_id: expected string")
+        if 'description' in v0:
+            v12 = v0['description']
+            if v12 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v12, str):
+                errors.append(f"{path}.description: expected string")
+        if 'name' in v0:
+            v13 = v0['name']
+            if v13 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v13, str):
+                errors.append(f"{path}.name: expected string")
+        if 'price_list_prices' in v0:
+            v14 = v0['price_list_prices']
+            if v14 is None:
+                errors.append(f"{path}.price_list_prices: must not be null")
+            elif not isinstance(v14, (list, tuple)):
+                errors.append(f"{path}.price_list_prices: expected array")
+            else:
+                for i15, v15 in enumerate(v14):
+                    if v15 is None:
+                        errors.append(f"{path}.price_list_prices[{i15}]: must not be null")
+                    elif not isinstance(v15, dict):
+                        errors.append(f"{path}.price_list_prices[{i15}]: expected object")
+                    else:
+                        for key in sorted(v15.keys() - _KEYS_7, key=str):
+                            errors.append(f"{path}.price_list_prices[{i15}].{key}: unknown field")
+                        if 'price_list_id' not in v15:
+                            errors.append(f"{path}.price_list_prices[{i15}].price_list_id: required")
+                        if 'price' not in v15:
+                            errors.append(f"{path}.price_list_prices[{i15}].price: required")
+                        if 'price' in v15:
+                            v16 = v15['price']
+                            if v16 is None:
+                                errors.append(f"{path}.price_list_prices[{i15}].price: must not be null")
+                            elif not isinstance(v16, dict):
+                                errors.append(f"{path}.price_list_prices[{i15}].price: expected object")
+                            else:
+                                for key in sorted(v16.keys() - _KEYS_8, key=str):
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.{key}: unknown field")
+                                if 'amount' not in v16:
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.amount: required")
+                                if 'currency' not in v16:
+                                    errors.append(f"{path}.price_list_prices[{i15}].price.currency: required")
+                                if 'amount' in v16:
+                                    v17 = v16['amount']
+                                    if v17 is None:
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.amount: must not be null")
+                                    elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.amount: expected number")
+                                if 'currency' in v16:
+                                    v18 = v16['currency']
+                                    if v18 is None:
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.currency: must not be null")
+                                    elif not isinstance(v18, str):
+                                        errors.append(f"{path}.price_list_prices[{i15}].price.currency: expected string")
+                        if 'price_list_id' in v15:
+                            v19 = v15['price_list_id']
+                            if v19 is None:
+                                errors.append(f"{path}.price_list_prices[{i15}].price_list_id: must not be null")
+                            elif not isinstance(v19, str):
+                                errors.append(f"{path}.price_list_prices[{i15}].price_list_id: expected string")
+        if 'product_category_id' in v0:
+            v20 = v0['product_category_id']
+            if v20 is None:
+                errors.append(f"{path}.product_category_id: must not be null")
+            elif not isinstance(v20, str):
+                errors.append(f"{path}.product_category_id: expected string")
+        if 'purchase_price' in v0:
+            v21 = v0['purchase_price']
+            if v21 is None:
+                pass
+            elif not isinstance(v21, dict):
+                errors.append(f"{path}.purchase_price: expected object")
+            else:
+                for key in sorted(v21.keys() - _KEYS_8, key=str):
+                    errors.append(f"{path}.purchase_price.{key}: unknown field")
+                if 'amount' not in v21:
+                    errors.append(f"{path}.purchase_price.amount: required")
+                if 'currency' not in v21:
+                    errors.append(f"{path}.purchase_price.currency: required")
+                if 'amount' in v21:
+                    v22 = v21['amount']
+                    if v22 is None:
+                        errors.append(f"{path}.purchase_price.amount: must not be null")
+                    elif isinstance(v22, bool) or not isinstance(v22, (int, float)):
+                        errors.append(f"{path}.purchase_price.amount: expected number")
+                if 'currency' in v21:
+                    v23 = v21['currency']
+                    if v23 is None:
+                        errors.append(f"{path}.purchase_price.currency: must not be null")
+                    elif not isinstance(v23, str):
+                        errors.append(f"{path}.purchase_price.currency: expected string")
+                    elif v23 not in _ENUM_9:
+                        errors.append(f"{path}.purchase_price.currency: must be one of {sorted(_ENUM_9)}")
+        if 'selling_price' in v0:
+            v24 = v0['selling_price']
+            if v24 is None:
+                pass
+            elif not isinstance(v24, dict):
+                errors.append(f"{path}.selling_price: expected object")
+            else:
+                for key in sorted(v24.keys() - _KEYS_8, key=str):
+                    errors.append(f"{path}.selling_price.{key}: unknown field")
+                if 'amount' not in v24:
+                    errors.append(f"{path}.selling_price.amount: required")
+                if 'currency' not in v24:
+                    errors.append(f"{path}.selling_price.currency: required")
+                if 'amount' in v24:
+                    v25 = v24['amount']
+                    if v25 is None:
+                        errors.append(f"{path}.selling_price.amount: must not be null")
+                    elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                        errors.append(f"{path}.selling_price.amount: expected number")
+                if 'currency' in v24:
+                    v26 = v24['currency']
+                    if v26 is None:
+                        errors.append(f"{path}.selling_price.currency: must not be null")
+                    elif not isinstance(v26, str):
+                        errors.append(f"{path}.selling_price.currency: expected string")
+                    elif v26 not in _ENUM_9:
+                        errors.append(f"{path}.selling_price.currency: must be one of {sorted(_ENUM_9)}")
+        if 'stock' in v0:
+            v27 = v0['stock']
+            if v27 is None:
+                errors.append(f"{path}.stock: must not be null")
+            elif not isinstance(v27, dict):
+                errors.append(f"{path}.stock: expected object")
+            else:
+                for key in sorted(v27.keys() - _KEYS_10, key=str):
+                    errors.append(f"{path}.stock.{key}: unknown field")
+                if 'amount' in v27:
+                    v28 = v27['amount']
+                    if v28 is None:
+                        pass
+                    elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                        errors.append(f"{path}.stock.amount: expected number")
+        if 'tax_rate_id' in v0:
+            v29 = v0['tax_rate_id']
+            if v29 is None:
+                errors.append(f"{path}.tax_rate_id: must not be null")
+            elif not isinstance(v29, str):
+                errors.append(f"{path}.tax_rate_id: expected string")
+        if 'unit_of_measure_id' in v0:
+            v30 = v0['unit_of_measure_id']
+            if v30 is None:
+                pass
+            elif not isinstance(v30, str):
+                errors.append(f"{path}.unit_of_measure_id: expected string")
+
+
+def _products_add(body: dict[str, Any], errors: list[str]) -> None:
+    for check0 in (_schema_0, _schema_6,):
+        branch_errors0: list[str] = []
+        check0(body, "", branch_errors0)
+        if not branch_errors0:
+            break
+    else:
+        errors.append("body: does not match any allowed shape")
+
+
+def _products_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _products_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _products_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_13, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_14, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'term' in v0:
+                v3 = v0['term']
+                if v3 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("filter.term: expected string")
+            if 'updated_since' in v0:
+                v4 = v0['updated_since']
+                if v4 is None:
+                    errors.append("filter.updated_since: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("filter.updated_since: expected string")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_15, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _products_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_16, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'code' in body:
+        v0 = body['code']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, str):
+            errors.append("code: expected string")
+    if 'configuration' in body:
+        v1 = body['configuration']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, dict):
+            errors.append("configuration: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"configuration.{key}: unknown field")
+            if 'stock_threshold' in v1:
+                v2 = v1['stock_threshold']
+                if v2 is None:
+                    pass
+                elif not isinstance(v2, dict):
+                    errors.append("configuration.stock_threshold: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_2, key=str):
+                        errors.append(f"configuration.stock_threshold.{key}: unknown field")
+                    if 'action' not in v2:
+                        errors.append("configuration.stock_threshold.action: required")
+                    if 'minimum' not in v2:
+                        errors.append("configuration.stock_threshold.minimum: required")
+                    if 'action' in v2:
+                        v3 = v2['action']
+                        if v3 is None:
+                            errors.append("configuration.stock_threshold.action: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("configuration.stock_threshold.action: expected string")
+                        elif v3 not in _ENUM_3:
+                            errors.append(f"configuration.stock_threshold.action: must be one of {sorted(_ENUM_3)}")
+                    if 'minimum' in v2:
+                        v4 = v2['minimum']
+                        if v4 is None:
+                            errors.append("configuration.stock_threshold.minimum: must not be null")
+                        elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                            errors.append("configuration.stock_threshold.minimum: expected number")
+    if 'custom_fields' in body:
+        v5 = body['custom_fields']
+        if v5 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v5, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i6, v6 in enumerate(v5):
+                if v6 is None:
+                    errors.append(f"custom_fields[{i6}]: must not be null")
+                elif not isinstance(v6, dict):
+                    errors.append(f"custom_fields[{i6}]: expected object")
+                else:
+                    for key in sorted(v6.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i6}].{key}: unknown field")
+                    if 'id' in v6:
+                        v7 = v6['id']
+                        if v7 is None:
+                            errors.append(f"custom_fields[{i6}].id: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"custom_fields[{i6}].id: expected string")
+                    if 'value' in v6:
+                        v8 = v6['value']
+                        for check9 in (_schema_1, _schema_2, _schema_3, _schema_4, _schema_5,):
+                            branch_errors9: list[str] = []
+                            check9(v8, f"custom_fields[{i6}].value", branch_errors9)
+                            if not branch_errors9:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i6}].value: does not match any allowed shape")
+    if 'department_id' in body:
+        v10 = body['department_id']
+        if v10 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("department_id: expected string")
+    if 'description' in body:
+        v11 = body['description']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, str):
+            errors.append("description: expected string")
+    if 'id' in body:
+        v12 = body['id']
+        if v12 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("id: expected string")
+    if 'name' in body:
+        v13 = body['name']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, str):
+            errors.append("name: expected string")
+    if 'price_list_prices' in body:
+        v14 = body['price_list_prices']
+        if v14 is None:
+            errors.append("price_list_prices: must not be null")
+        elif not isinstance(v14, (list, tuple)):
+            errors.append("price_list_prices: expected array")
+        else:
+            for i15, v15 in enumerate(v14):
+                if v15 is None:
+                    errors.append(f"price_list_prices[{i15}]: must not be null")
+                elif not isinstance(v15, (list, tuple)):
+                    errors.append(f"price_list_prices[{i15}]: expected array")
+    if 'product_category_id' in body:
+        v16 = body['product_category_id']
+        if v16 is None:
+            errors.append("product_category_id: must not be null")
+        elif not isinstance(v16, str):
+            errors.append("product_category_id: expected string")
+    if 'purchase_price' in body:
+        v17 = body['purchase_price']
+        if v17 is None:
+            pass
+        elif not isinstance(v17, dict):
+            errors.append("purchase_price: expected object")
+        else:
+            for key in sorted(v17.keys() - _KEYS_8, key=str):
+                errors.append(f"purchase_price.{key}: unknown field")
+            if 'amount' not in v17:
+                errors.append("purchase_price.amount: required")
+            if 'currency' not in v17:
+                errors.append("purchase_price.currency: required")
+            if 'amount' in v17:
+                v18 = v17['amount']
+                if v18 is None:
+                    errors.append("purchase_price.amount: must not be null")
+                elif isinstance(v18, bool) or not isinstance(v18, (int, float)):
+                    errors.append("purchase_price.amount: expected number")
+            if 'currency' in v17:
+                v19 = v17['currency']
+                if v19 is None:
+                    errors.append("purchase_price.currency: must not be null")
+                elif not isinstance(v19, str):
+                    errors.append("purchase_price.currency: expected string")
+                elif v19 not in _ENUM_9:
+                    errors.append(f"purchase_price.currency: must be one of {sorted(_ENUM_9)}")
+    if 'selling_price' in body:
+        v20 = body['selling_price']
+        if v20 is None:
+            pass
+        elif not isinstance(v20, dict):
+            errors.append("selling_price: expected object")
+        else:
+            for key in sorted(v20.keys() - _KEYS_8, key=str):
+                errors.append(f"selling_price.{key}: unknown field")
+            if 'amount' not in v20:
+                errors.append("selling_price.amount: required")
+            if 'currency' not in v20:
+                errors.append("selling_price.currency: required")
+            if 'amount' in v20:
+                v21 = v20['amount']
+                if v21 is None:
+                    errors.append("selling_price.amount: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("selling_price.amount: expected number")
+            if 'currency' in v20:
+                v22 = v20['currency']
+                if v22 is None:
+                    errors.append("selling_price.currency: must not be null")
+                elif not isinstance(v22, str):
+                    errors.append("selling_price.currency: expected string")
+                elif v22 not in _ENUM_9:
+                    errors.append(f"selling_price.currency: must be one of {sorted(_ENUM_9)}")
+    if 'stock' in body:
+        v23 = body['stock']
+        if v23 is None:
+            errors.append("stock: must not be null")
+        elif not isinstance(v23, dict):
+            errors.append("stock: expected object")
+        else:
+            for key in sorted(v23.keys() - _KEYS_10, key=str):
+                errors.append(f"stock.{key}: unknown field")
+            if 'amount' in v23:
+                v24 = v23['amount']
+                if v24 is None:
+                    pass
+                elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                    errors.append("stock.amount: expected number")
+    if 'tax_rate_id' in body:
+        v25 = body['tax_rate_id']
+        if v25 is None:
+            errors.append("tax_rate_id: must not be null")
+        elif not isinstance(v25, str):
+            errors.append("tax_rate_id: expected string")
+    if 'unit_of_measure_id' in body:
+        v26 = body['unit_of_measure_id']
+        if v26 is None:
+            pass
+        elif not isinstance(v26, str):
+            errors.append("unit_of_measure_id: expected string")
+
+
+VALIDATORS = {
+    'products.add': _products_add,
+    'products.delete': _products_delete,
+    'products.info': _products_info,
+    'products.list': _products_list,
+    'products.update': _products_update,
+}
+# fmt: on
@@ -0,0 +1,130 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'group_id', 'line_id'})
+_KEYS_1 = frozenset({'filter', 'project_id'})
+_KEYS_2 = frozenset({'assignees', 'types'})
+_KEYS_3 = frozenset({'id', 'type'})
+_ENUM_4 = frozenset({'team', 'user'})
+_ENUM_5 = frozenset({'nextgenMaterial', 'nextgenProjectGroup', 'nextgenTask'})
+_KEYS_6 = frozenset({'line_id'})
+
+
+def _projectlines_addtogroup(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'group_id' not in body:
+        errors.append("group_id: required")
+    if 'line_id' not in body:
+        errors.append("line_id: required")
+    if 'group_id' in body:
+        v0 = body['group_id']
+        if v0 is None:
+            errors.append("group_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("group_id: expected string")
+    if 'line_id' in body:
+        v1 = body['line_id']
+        if v1 is None:
+            errors.append("line_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("line_id: expected string")
+
+
+def _projectlines_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'project_id' not in body:
+        errors.append("project_id: required")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'assignees' in v0:
+                v1 = v0['assignees']
+                if v1 is None:
+                    errors.append("filter.assignees: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.assignees: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.assignees[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.assignees[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_3, key=str):
+                                errors.append(f"filter.assignees[{i2}].{key}: unknown field")
+                            if 'id' not in v2:
+                                errors.append(f"filter.assignees[{i2}].id: required")
+                            if 'type' not in v2:
+                                errors.append(f"filter.assignees[{i2}].type: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.assignees[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.assignees[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.assignees[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.assignees[{i2}].type: expected string")
+                                elif v4 not in _ENUM_4:
+                                    errors.append(f"filter.assignees[{i2}].type: must be one of {sorted(_ENUM_4)}")
+            if 'types' in v0:
+                v5 = v0['types']
+                if v5 is None:
+                    errors.append("filter.types: must not be null")
+                elif not isinstance(v5, (list, tuple)):
+                    errors.append("filter.types: expected array")
+                else:
+                    for i6, v6 in enumerate(v5):
+                        if v6 is None:
+                            errors.append(f"filter.types[{i6}]: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"filter.types[{i6}]: expected string")
+                        elif v6 not in _ENUM_5:
+                            errors.append(f"filter.types[{i6}]: must be one of {sorted(_ENUM_5)}")
+    if 'project_id' in body:
+        v7 = body['project_id']
+        if v7 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("project_id: expected string")
+
+
+def _projectlines_removefromgroup(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'line_id' not in body:
+        errors.append("line_id: required")
+    if 'line_id' in body:
+        v0 = body['line_id']
+        if v0 is None:
+            errors.append("line_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("line_id: expected string")
+
+
+VALIDATORS = {
+    'projectLines.addToGroup': _projectlines_addtogroup,
+    'projectLines.list': _projectlines_list,
+    'projectLines.removeFromGroup': _projectlines_removefromgroup,
+}
+# fmt: on
@@ -0,0 +1,1436 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'customer', 'id'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'company', 'contact'})
+_KEYS_3 = frozenset({'deal_id', 'id'})
+_KEYS_4 = frozenset({'id', 'user_id'})
+_KEYS_5 = frozenset({'id', 'quotation_id'})
+_KEYS_6 = frozenset({'assignee', 'id'})
+_ENUM_7 = frozenset({'team', 'user'})
+_KEYS_8 = frozenset({'closing_strategy', 'id'})
+_ENUM_9 = frozenset({'mark_tasks_and_materials_as_done', 'none'})
+_KEYS_10 = frozenset({
+    'assignees',
+    'billing_method',
+    'color',
+    'company_entity_id',
+    'custom_fields',
+    'customers',
+    'deal_ids',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'initial_amount_billed',
+    'initial_amount_paid',
+    'initial_cost',
+    'initial_price',
+    'initial_time_tracked',
+    'internal_budget',
+    'owner_ids',
+    'purchase_order_number',
+    'quotation_ids',
+    'start_date',
+    'time_budget',
+    'title',
+})
+_ENUM_11 = frozenset({'fixed_price', 'non_billable', 'time_and_materials'})
+_ENUM_12 = frozenset({
+    '#004DA6',
+    '#0071F2',
+    '#008A8C',
+    '#00B2B2',
+    '#1A1C20',
+    '#64788F',
+    '#82828C',
+    '#992600',
+    '#A400B2',
+    '#C0C0C4',
+    '#D157D3',
+    '#ED9E00',
+})
+_KEYS_13 = frozenset({'id', 'value'})
+_ENUM_14 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_15 = frozenset({'amount', 'currency'})
+_ENUM_16 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_17 = frozenset({'unit', 'value'})
+_ENUM_18 = frozenset({'hours', 'minutes', 'seconds'})
+_KEYS_19 = frozenset({'delete_strategy', 'id'})
+_ENUM_20 = frozenset({
+    'delete_tasks_and_time_trackings',
+    'delete_tasks_unlink_time_trackings',
+    'unlink_tasks_and_time_trackings',
+})
+_KEYS_21 = frozenset({'id', 'title'})
+_KEYS_22 = frozenset({'id', 'includes'})
+_KEYS_23 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_24 = frozenset({
+    'customers',
+    'deal_ids',
+    'ids',
+    'quotation_ids',
+    'status',
+    'term',
+})
+_ENUM_25 = frozenset({'closed', 'open', 'over_budget', 'overdue', 'planned', 'running'})
+_KEYS_26 = frozenset({'number', 'size'})
+_KEYS_27 = frozenset({'field', 'order'})
+_ENUM_28 = frozenset({
+    'amount_billed',
+    'amount_paid',
+    'amount_unbilled',
+    'cost',
+    'customer',
+    'end_date',
+    'external_budget',
+    'external_budget_spent',
+    'internal_budget',
+    'margin',
+    'price',
+    'project_key',
+    'start_date',
+    'status',
+    'time_budget',
+    'time_estimated',
+    'time_tracked',
+    'title',
+})
+_KEYS_29 = frozenset({'id'})
+_KEYS_30 = frozenset({
+    'billing_method',
+    'color',
+    'company_entity_id',
+    'custom_fields',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'id',
+    'internal_budget',
+    'purchase_order_number',
+    'start_date',
+    'time_budget',
+    'title',
+})
+_KEYS_31 = frozenset({'update_strategy', 'value'})
+_ENUM_32 = frozenset({'cascade', 'none'})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_1, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_14:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_14)}")
+
+
+def _nextgenprojects_addcustomer(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'customer' not in body:
+        errors.append("customer: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'customer' in body:
+        v0 = body['customer']
+        if v0 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v0:
+                errors.append("customer.type: required")
+            if 'id' not in v0:
+                errors.append("customer.id: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("customer.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_adddeal(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'deal_id' not in body:
+        errors.append("deal_id: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'deal_id' in body:
+        v0 = body['deal_id']
+        if v0 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("deal_id: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_addowner(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'user_id' not in body:
+        errors.append("user_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'user_id' in body:
+        v1 = body['user_id']
+        if v1 is None:
+            errors.append("user_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("user_id: expected string")
+
+
+def _nextgenprojects_addquotation(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'quotation_id' not in body:
+        errors.append("quotation_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'quotation_id' in body:
+        v1 = body['quotation_id']
+        if v1 is None:
+            errors.append("quotation_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("quotation_id: expected string")
+
+
+def _nextgenprojects_assign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_7:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_7)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_close(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'closing_strategy' not in body:
+        errors.append("closing_strategy: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'closing_strategy' in body:
+        v0 = body['closing_strategy']
+        if v0 is None:
+            errors.append("closing_strategy: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("closing_strategy: expected string")
+        elif v0 not in _ENUM_9:
+            errors.append(f"closing_strategy: must be one of {sorted(_ENUM_9)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'assignees' in body:
+        v0 = body['assignees']
+        if v0 is None:
+            errors.append("assignees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("assignees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"assignees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"assignees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"assignees[{i1}].{key}: unknown field")
+                    if 'id' not in v1:
+                        errors.append(f"assignees[{i1}].id: required")
+                    if 'type' not in v1:
+                        errors.append(f"assignees[{i1}].type: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"assignees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"assignees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"assignees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"assignees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_7:
+                            errors.append(f"assignees[{i1}].type: must be one of {sorted(_ENUM_7)}")
+    if 'billing_method' in body:
+        v4 = body['billing_method']
+        if v4 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("billing_method: expected string")
+        elif v4 not in _ENUM_11:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_11)}")
+    if 'color' in body:
+        v5 = body['color']
+        if v5 is None:
+            errors.append("color: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("color: expected string")
+        elif v5 not in _ENUM_12:
+            errors.append(f"color: must be one of {sorted(_ENUM_12)}")
+    if 'company_entity_id' in body:
+        v6 = body['company_entity_id']
+        if v6 is None:
+            errors.append("company_entity_id: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("company_entity_id: expected string")
+    if 'custom_fields' in body:
+        v7 = body['custom_fields']
+        if v7 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v7, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i8, v8 in enumerate(v7):
+                if v8 is None:
+                    errors.append(f"custom_fields[{i8}]: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append(f"custom_fields[{i8}]: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_13, key=str):
+                        errors.append(f"custom_fields[{i8}].{key}: unknown field")
+                    if 'id' in v8:
+                        v9 = v8['id']
+                        if v9 is None:
+                            errors.append(f"custom_fields[{i8}].id: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"custom_fields[{i8}].id: expected string")
+                    if 'value' in v8:
+                        v10 = v8['value']
+                        for check11 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors11: list[str] = []
+                            check11(v10, f"custom_fields[{i8}].value", branch_errors11)
+                            if not branch_errors11:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i8}].value: does not match any allowed shape")
+    if 'customers' in body:
+        v12 = body['customers']
+        if v12 is None:
+            errors.append("customers: must not be null")
+        elif not isinstance(v12, (list, tuple)):
+            errors.append("customers: expected array")
+        else:
+            for i13, v13 in enumerate(v12):
+                if v13 is None:
+                    errors.append(f"customers[{i13}]: must not be null")
+                elif not isinstance(v13, dict):
+                    errors.append(f"customers[{i13}]: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_1, key=str):
+                        errors.append(f"customers[{i13}].{key}: unknown field")
+                    if 'type' not in v13:
+                        errors.append(f"customers[{i13}].type: required")
+                    if 'id' not in v13:
+                        errors.append(f"customers[{i13}].id: required")
+                    if 'id' in v13:
+                        v14 = v13['id']
+                        if v14 is None:
+                            errors.append(f"customers[{i13}].id: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append(f"customers[{i13}].id: expected string")
+                    if 'type' in v13:
+                        v15 = v13['type']
+                        if v15 is None:
+                            errors.append(f"customers[{i13}].type: must not be null")
+                        elif not isinstance(v15, str):
+                            errors.append(f"customers[{i13}].type: expected string")
+                        elif v15 not in _ENUM_2:
+                            errors.append(f"customers[{i13}].type: must be one of {sorted(_ENUM_2)}")
+    if 'deal_ids' in body:
+        v16 = body['deal_ids']
+        if v16 is None:
+            errors.append("deal_ids: must not be null")
+        elif not isinstance(v16, (list, tuple)):
+            errors.append("deal_ids: expected array")
+        else:
+            for i17, v17 in enumerate(v16):
+                if v17 is None:
+                    errors.append(f"deal_ids[{i17}]: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append(f"deal_ids[{i17}]: expected string")
+    if 'description' in body:
+        v18 = body['description']
+        if v18 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v19 = body['end_date']
+        if v19 is None:
+            errors.append("end_date: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v20 = body['external_budget']
+        if v20 is None:
+            pass
+        elif not isinstance(v20, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v20.keys() - _KEYS_15, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v20:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v20:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v20:
+                v21 = v20['amount']
+                if v21 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v20:
+                v22 = v20['currency']
+                if v22 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v22, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v22 not in _ENUM_16:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_16)}")
+    if 'fixed_price' in body:
+        v23 = body['fixed_price']
+        if v23 is None:
+            pass
+        elif not isinstance(v23, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v23.keys() - _KEYS_15, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v23:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v23:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v23:
+                v24 = v23['amount']
+                if v24 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v23:
+                v25 = v23['currency']
+                if v25 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v25, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v25 not in _ENUM_16:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_16)}")
+    if 'initial_amount_billed' in body:
+        v26 = body['initial_amount_billed']
+        if v26 is None:
+            errors.append("initial_amount_billed: must not be null")
+        elif not isinstance(v26, dict):
+            errors.append("initial_amount_billed: expected object")
+        else:
+            for key in sorted(v26.keys() - _KEYS_15, key=str):
+                errors.append(f"initial_amount_billed.{key}: unknown field")
+            if 'amount' not in v26:
+                errors.append("initial_amount_billed.amount: required")
+            if 'currency' not in v26:
+                errors.append("initial_amount_billed.currency: required")
+            if 'amount' in v26:
+                v27 = v26['amount']
+                if v27 is None:
+                    errors.append("initial_amount_billed.amount: must not be null")
+                elif isinstance(v27, bool) or not isinstance(v27, (int, float)):
+                    errors.append("initial_amount_billed.amount: expected number")
+            if 'currency' in v26:
+                v28 = v26['currency']
+                if v28 is None:
+                    errors.append("initial_amount_billed.currency: must not be null")
+                elif not isinstance(v28, str):
+                    errors.append("initial_amount_billed.currency: expected string")
+                elif v28 not in _ENUM_16:
+                    errors.append(f"initial_amount_billed.currency: must be one of {sorted(_ENUM_16)}")
+    if 'initial_amount_paid' in body:
+        v29 = body['initial_amount_paid']
+        if v29 is None:
+            errors.append("initial_amount_paid: must not be null")
+        elif not isinstance(v29, dict):
+            errors.append("initial_amount_paid: expected object")
+        else:
+            for key in sorted(v29.keys() - _KEYS_15, key=str):
+                errors.append(f"initial_amount_paid.{key}: unknown field")
+            if 'amount' not in v29:
+                errors.append("initial_amount_paid.amount: required")
+            if 'currency' not in v29:
+                errors.append("initial_amount_paid.currency: required")
+            if 'amount' in v29:
+                v30 = v29['amount']
+                if v30 is None:
+                    errors.append("initial_amount_paid.amount: must not be null")
+                elif isinstance(v30, bool) or not isinstance(v30, (int, float)):
+                    errors.append("initial_amount_paid.amount: expected number")
+            if 'currency' in v29:
+                v31 = v29['currency']
+                if v31 is None:
+                    errors.append("initial_amount_paid.currency: must not be null")
+                elif not isinstance(v31, str):
+                    errors.append("initial_amount_paid.currency: expected string")
+                elif v31 not in _ENUM_16:
+                    errors.append(f"initial_amount_paid.currency: must be one of {sorted(_ENUM_16)}")
+    if 'initial_cost' in body:
+        v32 = body['initial_cost']
+        if v32 is None:
+            errors.append("initial_cost: must not be null")
+        elif not isinstance(v32, dict):
+            errors.append("initial_cost: expected object")
+        else:
+            for key in sorted(v32.keys() - _KEYS_15, key=str):
+                errors.append(f"initial_cost.{key}: unknown field")
+            if 'amount' not in v32:
+                errors.append("initial_cost.amount: required")
+            if 'currency' not in v32:
+                errors.append("initial_cost.currency: required")
+            if 'amount' in v32:
+                v33 = v32['amount']
+                if v33 is None:
+                    errors.append("initial_cost.amount: must not be null")
+                elif isinstance(v33, bool) or not isinstance(v33, (int, float)):
+                    errors.append("initial_cost.amount: expected number")
+            if 'currency' in v32:
+                v34 = v32['currency']
+                if v34 is None:
+                    errors.append("initial_cost.currency: must not be null")
+                elif not isinstance(v34, str):
+                    errors.append("initial_cost.currency: expected string")
+                elif v34 not in _ENUM_16:
+                    errors.append(f"initial_cost.currency: must be one of {sorted(_ENUM_16)}")
+    if 'initial_price' in body:
+        v35 = body['initial_price']
+        if v35 is None:
+            errors.append("initial_price: must not be null")
+        elif not isinstance(v35, dict):
+            errors.append("initial_price: expected object")
+        else:
+            for key in sorted(v35.keys() - _KEYS_15, key=str):
+                errors.append(f"initial_price.{key}: unknown field")
+            if 'amount' not in v35:
+                errors.append("initial_price.amount: required")
+            if 'currency' not in v35:
+                errors.append("initial_price.currency: required")
+            if 'amount' in v35:
+                v36 = v35['amount']
+                if v36 is None:
+                    errors.append("initial_price.amount: must not be null")
+                elif isinstance(v36, bool) or not isinstance(v36, (int, float)):
+                    errors.append("initial_price.amount: expected number")
+            if 'currency' in v35:
+                v37 = v35['currency']
+                if v37 is None:
+                    errors.append("initial_price.currency: must not be null")
+                elif not isinstance(v37, str):
+                    errors.append("initial_price.currency: expected string")
+                elif v37 not in _ENUM_16:
+                    errors.append(f"initial_price.currency: must be one of {sorted(_ENUM_16)}")
+    if 'initial_time_tracked' in body:
+        v38 = body['initial_time_tracked']
+        if v38 is None:
+            errors.append("initial_time_tracked: must not be null")
+        elif not isinstance(v38, dict):
+            errors.append("initial_time_tracked: expected object")
+        else:
+            for key in sorted(v38.keys() - _KEYS_17, key=str):
+                errors.append(f"initial_time_tracked.{key}: unknown field")
+            if 'unit' not in v38:
+                errors.append("initial_time_tracked.unit: required")
+            if 'value' not in v38:
+                errors.append("initial_time_tracked.value: required")
+            if 'unit' in v38:
+                v39 = v38['unit']
+                if v39 is None:
+                    errors.append("initial_time_tracked.unit: must not be null")
+                elif not isinstance(v39, str):
+                    errors.append("initial_time_tracked.unit: expected string")
+                elif v39 not in _ENUM_18:
+                    errors.append(f"initial_time_tracked.unit: must be one of {sorted(_ENUM_18)}")
+            if 'value' in v38:
+                v40 = v38['value']
+                if v40 is None:
+                    errors.append("initial_time_tracked.value: must not be null")
+                elif isinstance(v40, bool) or not isinstance(v40, (int, float)):
+                    errors.append("initial_time_tracked.value: expected number")
+    if 'internal_budget' in body:
+        v41 = body['internal_budget']
+        if v41 is None:
+            pass
+        elif not isinstance(v41, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v41.keys() - _KEYS_15, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v41:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v41:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v41:
+                v42 = v41['amount']
+                if v42 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v42, bool) or not isinstance(v42, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v41:
+                v43 = v41['currency']
+                if v43 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v43, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v43 not in _ENUM_16:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_16)}")
+    if 'owner_ids' in body:
+        v44 = body['owner_ids']
+        if v44 is None:
+            errors.append("owner_ids: must not be null")
+        elif not isinstance(v44, (list, tuple)):
+            errors.append("owner_ids: expected array")
+        else:
+            for i45, v45 in enumerate(v44):
+                if v45 is None:
+                    errors.append(f"owner_ids[{i45}]: must not be null")
+                elif not isinstance(v45, str):
+                    errors.append(f"owner_ids[{i45}]: expected string")
+    if 'purchase_order_number' in body:
+        v46 = body['purchase_order_number']
+        if v46 is None:
+            errors.append("purchase_order_number: must not be null")
+        elif not isinstance(v46, str):
+            errors.append("purchase_order_number: expected string")
+    if 'quotation_ids' in body:
+        v47 = body['quotation_ids']
+        if v47 is None:
+            errors.append("quotation_ids: must not be null")
+        elif not isinstance(v47, (list, tuple)):
+            errors.append("quotation_ids: expected array")
+        else:
+            for i48, v48 in enumerate(v47):
+                if v48 is None:
+                    errors.append(f"quotation_ids[{i48}]: must not be null")
+                elif not isinstance(v48, str):
+                    errors.append(f"quotation_ids[{i48}]: expected string")
+    if 'start_date' in body:
+        v49 = body['start_date']
+        if v49 is None:
+            errors.append("start_date: must not be null")
+        elif not isinstance(v49, str):
+            errors.append("start_date: expected string")
+    if 'time_budget' in body:
+        v50 = body['time_budget']
+        if v50 is None:
+            errors.append("time_budget: must not be null")
+        elif not isinstance(v50, dict):
+            errors.append("time_budget: expected object")
+        else:
+            for key in sorted(v50.keys() - _KEYS_17, key=str):
+                errors.append(f"time_budget.{key}: unknown field")
+            if 'unit' not in v50:
+                errors.append("time_budget.unit: required")
+            if 'value' not in v50:
+                errors.append("time_budget.value: required")
+            if 'unit' in v50:
+                v51 = v50['unit']
+                if v51 is None:
+                    errors.append("time_budget.unit: must not be null")
+                elif not isinstance(v51, str):
+                    errors.append("time_budget.unit: expected string")
+                elif v51 not in _ENUM_18:
+                    errors.append(f"time_budget.unit: must be one of {sorted(_ENUM_18)}")
+            if 'value' in v50:
+                v52 = v50['value']
+                if v52 is None:
+                    errors.append("time_budget.value: must not be null")
+                elif isinstance(v52, bool) or not isinstance(v52, (int, float)):
+                    errors.append("time_budget.value: expected number")
+    if 'title' in body:
+        v53 = body['title']
+        if v53 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v53, str):
+            errors.append("title: expected string")
+
+
+def _nextgenprojects_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_19, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'delete_strategy' not in body:
+        errors.append("delete_strategy: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'delete_strategy' in body:
+        v0 = body['delete_strategy']
+        if v0 is None:
+            errors.append("delete_strategy: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("delete_strategy: expected string")
+        elif v0 not in _ENUM_20:
+            errors.append(f"delete_strategy: must be one of {sorted(_ENUM_20)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_21, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'title' in body:
+        v1 = body['title']
+        if v1 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("title: expected string")
+
+
+def _nextgenprojects_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_22, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _nextgenprojects_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_23, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_24, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'customers' in v0:
+                v1 = v0['customers']
+                if v1 is None:
+                    errors.append("filter.customers: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.customers: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.customers[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.customers[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_1, key=str):
+                                errors.append(f"filter.customers[{i2}].{key}: unknown field")
+                            if 'type' not in v2:
+                                errors.append(f"filter.customers[{i2}].type: required")
+                            if 'id' not in v2:
+                                errors.append(f"filter.customers[{i2}].id: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.customers[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.customers[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.customers[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.customers[{i2}].type: expected string")
+                                elif v4 not in _ENUM_2:
+                                    errors.append(f"filter.customers[{i2}].type: must be one of {sorted(_ENUM_2)}")
+            if 'deal_ids' in v0:
+                v5 = v0['deal_ids']
+                if v5 is None:
+                    errors.append("filter.deal_ids: must not be null")
+                elif not isinstance(v5, (list, tuple)):
+                    errors.append("filter.deal_ids: expected array")
+                else:
+                    for i6, v6 in enumerate(v5):
+                        if v6 is None:
+                            errors.append(f"filter.deal_ids[{i6}]: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"filter.deal_ids[{i6}]: expected string")
+            if 'ids' in v0:
+                v7 = v0['ids']
+                if v7 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v7, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i8, v8 in enumerate(v7):
+                        if v8 is None:
+                            errors.append(f"filter.ids[{i8}]: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"filter.ids[{i8}]: expected string")
+            if 'quotation_ids' in v0:
+                v9 = v0['quotation_ids']
+                if v9 is None:
+                    errors.append("filter.quotation_ids: must not be null")
+                elif not isinstance(v9, (list, tuple)):
+                    errors.append("filter.quotation_ids: expected array")
+                else:
+                    for i10, v10 in enumerate(v9):
+                        if v10 is None:
+                            errors.append(f"filter.quotation_ids[{i10}]: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"filter.quotation_ids[{i10}]: expected string")
+            if 'status' in v0:
+                v11 = v0['status']
+                if v11 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("filter.status: expected string")
+                elif v11 not in _ENUM_25:
+                    errors.append(f"filter.status: must be one of {sorted(_ENUM_25)}")
+            if 'term' in v0:
+                v12 = v0['term']
+                if v12 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("filter.term: expected string")
+    if 'includes' in body:
+        v13 = body['includes']
+        if v13 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v14 = body['page']
+        if v14 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v14, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_26, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v14:
+                v15 = v14['number']
+                if v15 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v15, bool) or not isinstance(v15, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v14:
+                v16 = v14['size']
+                if v16 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v17 = body['sort']
+        if v17 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v17, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i18, v18 in enumerate(v17):
+                if v18 is None:
+                    errors.append(f"sort[{i18}]: must not be null")
+                elif not isinstance(v18, dict):
+                    errors.append(f"sort[{i18}]: expected object")
+                else:
+                    for key in sorted(v18.keys() - _KEYS_27, key=str):
+                        errors.append(f"sort[{i18}].{key}: unknown field")
+                    if 'field' not in v18:
+                        errors.append(f"sort[{i18}].field: required")
+                    if 'field' in v18:
+                        v19 = v18['field']
+                        if v19 is None:
+                            errors.append(f"sort[{i18}].field: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append(f"sort[{i18}].field: expected string")
+                        elif v19 not in _ENUM_28:
+                            errors.append(f"sort[{i18}].field: must be one of {sorted(_ENUM_28)}")
+                    if 'order' in v18:
+                        v20 = v18['order']
+                        if v20 is None:
+                            errors.append(f"sort[{i18}].order: must not be null")
+
+
+def _nextgenprojects_removecustomer(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'customer' not in body:
+        errors.append("customer: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'customer' in body:
+        v0 = body['customer']
+        if v0 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v0:
+                errors.append("customer.type: required")
+            if 'id' not in v0:
+                errors.append("customer.id: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("customer.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_removedeal(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'deal_id' not in body:
+        errors.append("deal_id: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'deal_id' in body:
+        v0 = body['deal_id']
+        if v0 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("deal_id: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_removeowner(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_4, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'user_id' not in body:
+        errors.append("user_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'user_id' in body:
+        v1 = body['user_id']
+        if v1 is None:
+            errors.append("user_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("user_id: expected string")
+
+
+def _nextgenprojects_removequotation(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'quotation_id' not in body:
+        errors.append("quotation_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'quotation_id' in body:
+        v1 = body['quotation_id']
+        if v1 is None:
+            errors.append("quotation_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("quotation_id: expected string")
+
+
+def _nextgenprojects_reopen(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_29, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_unassign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_7:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_7)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojects_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_30, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'billing_method' in body:
+        v0 = body['billing_method']
+        if v0 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("billing_method: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_31, key=str):
+                errors.append(f"billing_method.{key}: unknown field")
+            if 'update_strategy' not in v0:
+                errors.append("billing_method.update_strategy: required")
+            if 'value' not in v0:
+                errors.append("billing_method.value: required")
+            if 'update_strategy' in v0:
+                v1 = v0['update_strategy']
+                if v1 is None:
+                    errors.append("billing_method.update_strategy: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("billing_method.update_strategy: expected string")
+                elif v1 not in _ENUM_32:
+                    errors.append(f"billing_method.update_strategy: must be one of {sorted(_ENUM_32)}")
+            if 'value' in v0:
+                v2 = v0['value']
+                if v2 is None:
+                    errors.append("billing_method.value: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("billing_method.value: expected string")
+                elif v2 not in _ENUM_11:
+                    errors.append(f"billing_method.value: must be one of {sorted(_ENUM_11)}")
+    if 'color' in body:
+        v3 = body['color']
+        if v3 is None:
+            errors.append("color: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("color: expected string")
+        elif v3 not in _ENUM_12:
+            errors.append(f"color: must be one of {sorted(_ENUM_12)}")
+    if 'company_entity_id' in body:
+        v4 = body['company_entity_id']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("company_entity_id: expected string")
+    if 'custom_fields' in body:
+        v5 = body['custom_fields']
+        if v5 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v5, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i6, v6 in enumerate(v5):
+                if v6 is None:
+                    errors.append(f"custom_fields[{i6}]: must not be null")
+                elif not isinstance(v6, dict):
+                    errors.append(f"custom_fields[{i6}]: expected object")
+                else:
+                    for key in sorted(v6.keys() - _KEYS_13, key=str):
+                        errors.append(f"custom_fields[{i6}].{key}: unknown field")
+                    if 'id' in v6:
+                        v7 = v6['id']
+                        if v7 is None:
+                            errors.append(f"custom_fields[{i6}].id: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"custom_fields[{i6}].id: expected string")
+                    if 'value' in v6:
+                        v8 = v6['value']
+                        for check9 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors9: list[str] = []
+                            check9(v8, f"custom_fields[{i6}].value", branch_errors9)
+                            if not branch_errors9:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i6}].value: does not match any allowed shape")
+    if 'description' in body:
+        v10 = body['description']
+        if v10 is None:
+            pass
+        elif not isinstance(v10, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v11 = body['end_date']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v12 = body['external_budget']
+        if v12 is None:
+            pass
+        elif not isinstance(v12, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v12.keys() - _KEYS_15, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v12:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v12:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v12:
+                v13 = v12['amount']
+                if v13 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v12:
+                v14 = v12['currency']
+                if v14 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v14, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v14 not in _ENUM_16:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_16)}")
+    if 'fixed_price' in body:
+        v15 = body['fixed_price']
+        if v15 is None:
+            pass
+        elif not isinstance(v15, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v15.keys() - _KEYS_15, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v15:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v15:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v15:
+                v16 = v15['amount']
+                if v16 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v15:
+                v17 = v15['currency']
+                if v17 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v17, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v17 not in _ENUM_16:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_16)}")
+    if 'id' in body:
+        v18 = body['id']
+        if v18 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("id: expected string")
+    if 'internal_budget' in body:
+        v19 = body['internal_budget']
+        if v19 is None:
+            pass
+        elif not isinstance(v19, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v19.keys() - _KEYS_15, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v19:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v19:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v19:
+                v20 = v19['amount']
+                if v20 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v19:
+                v21 = v19['currency']
+                if v21 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v21, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v21 not in _ENUM_16:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_16)}")
+    if 'purchase_order_number' in body:
+        v22 = body['purchase_order_number']
+        if v22 is None:
+            pass
+        elif not isinstance(v22, str):
+            errors.append("purchase_order_number: expected string")
+    if 'start_date' in body:
+        v23 = body['start_date']
+        if v23 is None:
+            pass
+        elif not isinstance(v23, str):
+            errors.append("start_date: expected string")
+    if 'time_budget' in body:
+        v24 = body['time_budget']
+        if v24 is None:
+            pass
+        elif not isinstance(v24, dict):
+            errors.append("time_budget: expected object")
+        else:
+            for key in sorted(v24.keys() - _KEYS_17, key=str):
+                errors.append(f"time_budget.{key}: unknown field")
+            if 'unit' not in v24:
+                errors.append("time_budget.unit: required")
+            if 'value' not in v24:
+                errors.append("time_budget.value: required")
+            if 'unit' in v24:
+                v25 = v24['unit']
+                if v25 is None:
+                    errors.append("time_budget.unit: must not be null")
+                elif not isinstance(v25, str):
+                    errors.append("time_budget.unit: expected string")
+                elif v25 not in _ENUM_18:
+                    errors.append(f"time_budget.unit: must be one of {sorted(_ENUM_18)}")
+            if 'value' in v24:
+                v26 = v24['value']
+                if v26 is None:
+                    errors.append("time_budget.value: must not be null")
+                elif isinstance(v26, bool) or not isinstance(v26, (int, float)):
+                    errors.append("time_budget.value: expected number")
+    if 'title' in body:
+        v27 = body['title']
+        if v27 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v27, str):
+            errors.append("title: expected string")
+
+
+VALIDATORS = {
+    'NextgenProjects.addCustomer': _nextgenprojects_addcustomer,
+    'NextgenProjects.addDeal': _nextgenprojects_adddeal,
+    'NextgenProjects.addOwner': _nextgenprojects_addowner,
+    'NextgenProjects.addQuotation': _nextgenprojects_addquotation,
+    'NextgenProjects.assign': _nextgenprojects_assign,
+    'NextgenProjects.close': _nextgenprojects_close,
+    'NextgenProjects.create': _nextgenprojects_create,
+    'NextgenProjects.delete': _nextgenprojects_delete,
+    'NextgenProjects.duplicate': _nextgenprojects_duplicate,
+    'NextgenProjects.info': _nextgenprojects_info,
+    'NextgenProjects.list': _nextgenprojects_list,
+    'NextgenProjects.removeCustomer': _nextgenprojects_removecustomer,
+    'NextgenProjects.removeDeal': _nextgenprojects_removedeal,
+    'NextgenProjects.removeOwner': _nextgenprojects_removeowner,
+    'NextgenProjects.removeQuotation': _nextgenprojects_removequotation,
+    'NextgenProjects.reopen': _nextgenprojects_reopen,
+    'NextgenProjects.unassign': _nextgenprojects_unassign,
+    'NextgenProjects.update': _nextgenprojects_update,
+}
+# fmt: on
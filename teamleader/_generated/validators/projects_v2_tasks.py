@@ -0,0 +1,718 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'assignee', 'id'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'team', 'user'})
+_KEYS_3 = frozenset({
+    'assignees',
+    'billing_method',
+    'custom_rate',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'group_id',
+    'internal_budget',
+    'project_id',
+    'start_date',
+    'task_type_id',
+    'time_estimated',
+    'title',
+    'work_type_id',
+})
+_ENUM_4 = frozenset({
+    'custom_rate',
+    'fixed_price',
+    'non_billable',
+    'parent_fixed_price',
+    'user_rate',
+    'work_type_rate',
+})
+_KEYS_5 = frozenset({'amount', 'currency'})
+_ENUM_6 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_7 = frozenset({'unit', 'value'})
+_ENUM_8 = frozenset({'hours', 'minutes', 'seconds'})
+_KEYS_9 = frozenset({'delete_strategy', 'id'})
+_ENUM_10 = frozenset({'delete_time_tracking', 'unlink_time_tracking'})
+_KEYS_11 = frozenset({'origin_id'})
+_KEYS_12 = frozenset({'id'})
+_KEYS_13 = frozenset({'filter', 'page'})
+_KEYS_14 = frozenset({'ids'})
+_KEYS_15 = frozenset({'number', 'size'})
+_KEYS_16 = frozenset({
+    'billing_method',
+    'custom_rate',
+    'description',
+    'end_date',
+    'external_budget',
+    'fixed_price',
+    'id',
+    'internal_budget',
+    'start_date',
+    'status',
+    'task_type_id',
+    'time_estimated',
+    'title',
+    'work_type_id',
+})
+_ENUM_17 = frozenset({'done', 'in_progress', 'on_hold', 'to_do'})
+
+
+def _nextgenprojectstasks_assign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectstasks_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_3, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'project_id' not in body:
+        errors.append("project_id: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'assignees' in body:
+        v0 = body['assignees']
+        if v0 is None:
+            errors.append("assignees: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("assignees: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"assignees[{i1}]: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append(f"assignees[{i1}]: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_1, key=str):
+                        errors.append(f"assignees[{i1}].{key}: unknown field")
+                    if 'id' not in v1:
+                        errors.append(f"assignees[{i1}].id: required")
+                    if 'type' not in v1:
+                        errors.append(f"assignees[{i1}].type: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append(f"assignees[{i1}].id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"assignees[{i1}].id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append(f"assignees[{i1}].type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append(f"assignees[{i1}].type: expected string")
+                        elif v3 not in _ENUM_2:
+                            errors.append(f"assignees[{i1}].type: must be one of {sorted(_ENUM_2)}")
+    if 'billing_method' in body:
+        v4 = body['billing_method']
+        if v4 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("billing_method: expected string")
+        elif v4 not in _ENUM_4:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_4)}")
+    if 'custom_rate' in body:
+        v5 = body['custom_rate']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, dict):
+            errors.append("custom_rate: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_5, key=str):
+                errors.append(f"custom_rate.{key}: unknown field")
+            if 'amount' not in v5:
+                errors.append("custom_rate.amount: required")
+            if 'currency' not in v5:
+                errors.append("custom_rate.currency: required")
+            if 'amount' in v5:
+                v6 = v5['amount']
+                if v6 is None:
+                    errors.append("custom_rate.amount: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("custom_rate.amount: expected number")
+            if 'currency' in v5:
+                v7 = v5['currency']
+                if v7 is None:
+                    errors.append("custom_rate.currency: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("custom_rate.currency: expected string")
+                elif v7 not in _ENUM_6:
+                    errors.append(f"custom_rate.currency: must be one of {sorted(_ENUM_6)}")
+    if 'description' in body:
+        v8 = body['description']
+        if v8 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v9 = body['end_date']
+        if v9 is None:
+            errors.append("end_date: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v10 = body['external_budget']
+        if v10 is None:
+            pass
+        elif not isinstance(v10, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v10.keys() - _KEYS_5, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v10:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v10:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v10:
+                v11 = v10['amount']
+                if v11 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v11, bool) or not isinstance(v11, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v10:
+                v12 = v10['currency']
+                if v12 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v12, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v12 not in _ENUM_6:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'fixed_price' in body:
+        v13 = body['fixed_price']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v13.keys() - _KEYS_5, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v13:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v13:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v13:
+                v14 = v13['amount']
+                if v14 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v13:
+                v15 = v13['currency']
+                if v15 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v15 not in _ENUM_6:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_6)}")
+    if 'group_id' in body:
+        v16 = body['group_id']
+        if v16 is None:
+            errors.append("group_id: must not be null")
+        elif not isinstance(v16, str):
+            errors.append("group_id: expected string")
+    if 'internal_budget' in body:
+        v17 = body['internal_budget']
+        if v17 is None:
+            pass
+        elif not isinstance(v17, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v17.keys() - _KEYS_5, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v17:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v17:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v17:
+                v18 = v17['amount']
+                if v18 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v18, bool) or not isinstance(v18, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v17:
+                v19 = v17['currency']
+                if v19 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v19, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v19 not in _ENUM_6:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'project_id' in body:
+        v20 = body['project_id']
+        if v20 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v20, str):
+            errors.append("project_id: expected string")
+    if 'start_date' in body:
+        v21 = body['start_date']
+        if v21 is None:
+            errors.append("start_date: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("start_date: expected string")
+    if 'task_type_id' in body:
+        v22 = body['task_type_id']
+        if v22 is None:
+            errors.append("task_type_id: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("task_type_id: expected string")
+    if 'time_estimated' in body:
+        v23 = body['time_estimated']
+        if v23 is None:
+            errors.append("time_estimated: must not be null")
+        elif not isinstance(v23, dict):
+            errors.append("time_estimated: expected object")
+        else:
+            for key in sorted(v23.keys() - _KEYS_7, key=str):
+                errors.append(f"time_estimated.{key}: unknown field")
+            if 'unit' not in v23:
+                errors.append("time_estimated.unit: required")
+            if 'value' not in v23:
+                errors.append("time_estimated.value: required")
+            if 'unit' in v23:
+                v24 = v23['unit']
+                if v24 is None:
+                    errors.append("time_estimated.unit: must not be null")
+                elif not isinstance(v24, str):
+                    errors.append("time_estimated.unit: expected string")
+                elif v24 not in _ENUM_8:
+                    errors.append(f"time_estimated.unit: must be one of {sorted(_ENUM_8)}")
+            if 'value' in v23:
+                v25 = v23['value']
+                if v25 is None:
+                    errors.append("time_estimated.value: must not be null")
+                elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                    errors.append("time_estimated.value: expected number")
+    if 'title' in body:
+        v26 = body['title']
+        if v26 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v26, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v27 = body['work_type_id']
+        if v27 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v27, str):
+            errors.append("work_type_id: expected string")
+
+
+def _nextgenprojectstasks_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'delete_strategy' not in body:
+        errors.append("delete_strategy: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'delete_strategy' in body:
+        v0 = body['delete_strategy']
+        if v0 is None:
+            errors.append("delete_strategy: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("delete_strategy: expected string")
+        elif v0 not in _ENUM_10:
+            errors.append(f"delete_strategy: must be one of {sorted(_ENUM_10)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectstasks_duplicate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'origin_id' not in body:
+        errors.append("origin_id: required")
+    if 'origin_id' in body:
+        v0 = body['origin_id']
+        if v0 is None:
+            errors.append("origin_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("origin_id: expected string")
+
+
+def _nextgenprojectstasks_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_12, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectstasks_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_13, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_14, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+    if 'page' in body:
+        v3 = body['page']
+        if v3 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_15, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v3:
+                v4 = v3['number']
+                if v4 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v3:
+                v5 = v3['size']
+                if v5 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _nextgenprojectstasks_unassign(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+
+
+def _nextgenprojectstasks_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_16, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'billing_method' in body:
+        v0 = body['billing_method']
+        if v0 is None:
+            errors.append("billing_method: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("billing_method: expected string")
+        elif v0 not in _ENUM_4:
+            errors.append(f"billing_method: must be one of {sorted(_ENUM_4)}")
+    if 'custom_rate' in body:
+        v1 = body['custom_rate']
+        if v1 is None:
+            pass
+        elif not isinstance(v1, dict):
+            errors.append("custom_rate: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_5, key=str):
+                errors.append(f"custom_rate.{key}: unknown field")
+            if 'amount' not in v1:
+                errors.append("custom_rate.amount: required")
+            if 'currency' not in v1:
+                errors.append("custom_rate.currency: required")
+            if 'amount' in v1:
+                v2 = v1['amount']
+                if v2 is None:
+                    errors.append("custom_rate.amount: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("custom_rate.amount: expected number")
+            if 'currency' in v1:
+                v3 = v1['currency']
+                if v3 is None:
+                    errors.append("custom_rate.currency: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("custom_rate.currency: expected string")
+                elif v3 not in _ENUM_6:
+                    errors.append(f"custom_rate.currency: must be one of {sorted(_ENUM_6)}")
+    if 'description' in body:
+        v4 = body['description']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("description: expected string")
+    if 'end_date' in body:
+        v5 = body['end_date']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("end_date: expected string")
+    if 'external_budget' in body:
+        v6 = body['external_budget']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, dict):
+            errors.append("external_budget: expected object")
+        else:
+            for key in sorted(v6.keys() - _KEYS_5, key=str):
+                errors.append(f"external_budget.{key}: unknown field")
+            if 'amount' not in v6:
+                errors.append("external_budget.amount: required")
+            if 'currency' not in v6:
+                errors.append("external_budget.currency: required")
+            if 'amount' in v6:
+                v7 = v6['amount']
+                if v7 is None:
+                    errors.append("external_budget.amount: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("external_budget.amount: expected number")
+            if 'currency' in v6:
+                v8 = v6['currency']
+                if v8 is None:
+                    errors.append("external_budget.currency: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("external_budget.currency: expected string")
+                elif v8 not in _ENUM_6:
+                    errors.append(f"external_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'fixed_price' in body:
+        v9 = body['fixed_price']
+        if v9 is None:
+            pass
+        elif not isinstance(v9, dict):
+            errors.append("fixed_price: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_5, key=str):
+                errors.append(f"fixed_price.{key}: unknown field")
+            if 'amount' not in v9:
+                errors.append("fixed_price.amount: required")
+            if 'currency' not in v9:
+                errors.append("fixed_price.currency: required")
+            if 'amount' in v9:
+                v10 = v9['amount']
+                if v10 is None:
+                    errors.append("fixed_price.amount: must not be null")
+                elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+                    errors.append("fixed_price.amount: expected number")
+            if 'currency' in v9:
+                v11 = v9['currency']
+                if v11 is None:
+                    errors.append("fixed_price.currency: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("fixed_price.currency: expected string")
+                elif v11 not in _ENUM_6:
+                    errors.append(f"fixed_price.currency: must be one of {sorted(_ENUM_6)}")
+    if 'id' in body:
+        v12 = body['id']
+        if v12 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("id: expected string")
+    if 'internal_budget' in body:
+        v13 = body['internal_budget']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, dict):
+            errors.append("internal_budget: expected object")
+        else:
+            for key in sorted(v13.keys() - _KEYS_5, key=str):
+                errors.append(f"internal_budget.{key}: unknown field")
+            if 'amount' not in v13:
+                errors.append("internal_budget.amount: required")
+            if 'currency' not in v13:
+                errors.append("internal_budget.currency: required")
+            if 'amount' in v13:
+                v14 = v13['amount']
+                if v14 is None:
+                    errors.append("internal_budget.amount: must not be null")
+                elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                    errors.append("internal_budget.amount: expected number")
+            if 'currency' in v13:
+                v15 = v13['currency']
+                if v15 is None:
+                    errors.append("internal_budget.currency: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("internal_budget.currency: expected string")
+                elif v15 not in _ENUM_6:
+                    errors.append(f"internal_budget.currency: must be one of {sorted(_ENUM_6)}")
+    if 'start_date' in body:
+        v16 = body['start_date']
+        if v16 is None:
+            pass
+        elif not isinstance(v16, str):
+            errors.append("start_date: expected string")
+    if 'status' in body:
+        v17 = body['status']
+        if v17 is None:
+            errors.append("status: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("status: expected string")
+        elif v17 not in _ENUM_17:
+            errors.append(f"status: must be one of {sorted(_ENUM_17)}")
+    if 'task_type_id' in body:
+        v18 = body['task_type_id']
+        if v18 is None:
+            pass
+        elif not isinstance(v18, str):
+            errors.append("task_type_id: expected string")
+    if 'time_estimated' in body:
+        v19 = body['time_estimated']
+        if v19 is None:
+            pass
+        elif not isinstance(v19, dict):
+            errors.append("time_estimated: expected object")
+        else:
+            for key in sorted(v19.keys() - _KEYS_7, key=str):
+                errors.append(f"time_estimated.{key}: unknown field")
+            if 'unit' not in v19:
+                errors.append("time_estimated.unit: required")
+            if 'value' not in v19:
+                errors.append("time_estimated.value: required")
+            if 'unit' in v19:
+                v20 = v19['unit']
+                if v20 is None:
+                    errors.append("time_estimated.unit: must not be null")
+                elif not isinstance(v20, str):
+                    errors.append("time_estimated.unit: expected string")
+                elif v20 not in _ENUM_8:
+                    errors.append(f"time_estimated.unit: must be one of {sorted(_ENUM_8)}")
+            if 'value' in v19:
+                v21 = v19['value']
+                if v21 is None:
+                    errors.append("time_estimated.value: must not be null")
+                elif isinstance(v21, bool) or not isinstance(v21, (int, float)):
+                    errors.append("time_estimated.value: expected number")
+    if 'title' in body:
+        v22 = body['title']
+        if v22 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v23 = body['work_type_id']
+        if v23 is None:
+            pass
+        elif not isinstance(v23, str):
+            errors.append("work_type_id: expected string")
+
+
+VALIDATORS = {
+    'NextgenProjectsTasks.assign': _nextgenprojectstasks_assign,
+    'NextgenProjectsTasks.create': _nextgenprojectstasks_create,
+    'NextgenProjectsTasks.delete': _nextgenprojectstasks_delete,
+    'NextgenProjectsTasks.duplicate': _nextgenprojectstasks_duplicate,
+    'NextgenProjectsTasks.info': _nextgenprojectstasks_info,
+    'NextgenProjectsTasks.list': _nextgenprojectstasks_list,
+    'NextgenProjectsTasks.unassign': _nextgenprojectstasks_unassign,
+    'NextgenProjectsTasks.update': _nextgenprojectstasks_update,
+}
+# fmt: on
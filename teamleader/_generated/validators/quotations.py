@@ -0,0 +1,1204 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({
+    'currency',
+    'deal_id',
+    'discounts',
+    'document_template_id',
+    'expiry',
+    'grouped_lines',
+    'text',
+})
+_KEYS_2 = frozenset({'code', 'exchange_rate'})
+_ENUM_3 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_4 = frozenset({'description', 'type', 'value'})
+_ENUM_5 = frozenset({'percentage'})
+_KEYS_6 = frozenset({'action_after_expiry', 'expires_after'})
+_ENUM_7 = frozenset({'lock', 'none'})
+_KEYS_8 = frozenset({'line_items', 'section'})
+_KEYS_9 = frozenset({
+    'description',
+    'discount',
+    'extended_description',
+    'periodicity',
+    'product_id',
+    'purchase_price',
+    'quantity',
+    'tax_rate_id',
+    'unit_of_measure_id',
+    'unit_price',
+})
+_KEYS_10 = frozenset({'type', 'value'})
+_KEYS_11 = frozenset({'period', 'unit'})
+_ENUM_12 = frozenset({'week'})
+_ENUM_13 = frozenset({'month'})
+_ENUM_14 = frozenset({'year'})
+_KEYS_15 = frozenset({'amount', 'currency'})
+_KEYS_16 = frozenset({'amount', 'tax'})
+_ENUM_17 = frozenset({'excluding'})
+_KEYS_18 = frozenset({'title'})
+_KEYS_19 = frozenset({'format', 'id'})
+_ENUM_20 = frozenset({'pdf'})
+_KEYS_21 = frozenset({'filter', 'page'})
+_KEYS_22 = frozenset({'ids'})
+_KEYS_23 = frozenset({'number', 'size'})
+_KEYS_24 = frozenset({
+    'attachments',
+    'content',
+    'from',
+    'language',
+    'quotations',
+    'recipients',
+    'subject',
+})
+_KEYS_25 = frozenset({'email_address', 'sender'})
+_KEYS_26 = frozenset({'id', 'type'})
+_ENUM_27 = frozenset({'department', 'user'})
+_ENUM_28 = frozenset({
+    'af',
+    'ag',
+    'al',
+    'ar',
+    'bg',
+    'br',
+    'bs',
+    'ca',
+    'ch',
+    'cs',
+    'da',
+    'de',
+    'en',
+    'es',
+    'fi',
+    'fr',
+    'gh',
+    'gr',
+    'hu',
+    'iq',
+    'ir',
+    'it',
+    'jp',
+    'ko',
+    'nl',
+    'no',
+    'pl',
+    'pt',
+    'ro',
+    'ru',
+    'sk',
+    'so',
+    'sv',
+    'tr',
+    'uk',
+})
+_KEYS_29 = frozenset({'bcc', 'cc', 'to'})
+_KEYS_30 = frozenset({'customer', 'email_address'})
+_ENUM_31 = frozenset({'company', 'contact'})
+_KEYS_32 = frozenset({
+    'currency',
+    'discounts',
+    'document_template_id',
+    'expiry',
+    'grouped_lines',
+    'id',
+    'text',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        pass
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_11, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2):
+                errors.append(f"{path}.period: must be one of [1, 2]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_12:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_12)}")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        pass
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_11, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2, 3, 4, 6):
+                errors.append(f"{path}.period: must be one of [1, 2, 3, 4, 6]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_13:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_13)}")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        pass
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_11, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10):
+                errors.append(f"{path}.period: must be one of [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_14:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_14)}")
+
+
+def _quotations_accept(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _quotations_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'deal_id' not in body:
+        errors.append("deal_id: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_3:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_3)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'deal_id' in body:
+        v3 = body['deal_id']
+        if v3 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("deal_id: expected string")
+    if 'discounts' in body:
+        v4 = body['discounts']
+        if v4 is None:
+            errors.append("discounts: must not be null")
+        elif not isinstance(v4, (list, tuple)):
+            errors.append("discounts: expected array")
+        else:
+            for i5, v5 in enumerate(v4):
+                if v5 is None:
+                    errors.append(f"discounts[{i5}]: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append(f"discounts[{i5}]: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_4, key=str):
+                        errors.append(f"discounts[{i5}].{key}: unknown field")
+                    if 'description' in v5:
+                        v6 = v5['description']
+                        if v6 is None:
+                            errors.append(f"discounts[{i5}].description: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"discounts[{i5}].description: expected string")
+                    if 'type' in v5:
+                        v7 = v5['type']
+                        if v7 is None:
+                            errors.append(f"discounts[{i5}].type: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"discounts[{i5}].type: expected string")
+                        elif v7 not in _ENUM_5:
+                            errors.append(f"discounts[{i5}].type: must be one of {sorted(_ENUM_5)}")
+                    if 'value' in v5:
+                        v8 = v5['value']
+                        if v8 is None:
+                            errors.append(f"discounts[{i5}].value: must not be null")
+                        elif isinstance(v8, bool) or not isinstance(v8, (int, float)):
+                            errors.append(f"discounts[{i5}].value: expected number")
+    if 'document_template_id' in body:
+        v9 = body['document_template_id']
+        if v9 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("document_template_id: expected string")
+    if 'expiry' in body:
+        v10 = body['expiry']
+        if v10 is None:
+            errors.append("expiry: must not be null")
+        elif not isinstance(v10, dict):
+            errors.append("expiry: expected object")
+        else:
+            for key in sorted(v10.keys() - _KEYS_6, key=str):
+                errors.append(f"expiry.{key}: unknown field")
+            if 'action_after_expiry' not in v10:
+                errors.append("expiry.action_after_expiry: required")
+            if 'action_after_expiry' in v10:
+                v11 = v10['action_after_expiry']
+                if v11 is None:
+                    errors.append("expiry.action_after_expiry: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("expiry.action_after_expiry: expected string")
+                elif v11 not in _ENUM_7:
+                    errors.append(f"expiry.action_after_expiry: must be one of {sorted(_ENUM_7)}")
+            if 'expires_after' in v10:
+                v12 = v10['expires_after']
+                if v12 is None:
+                    pass
+                elif not isinstance(v12, str):
+                    errors.append("expiry.expires_after: expected string")
+    if 'grouped_lines' in body:
+        v13 = body['grouped_lines']
+        if v13 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v13, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i14, v14 in enumerate(v13):
+                if v14 is None:
+                    errors.append(f"grouped_lines[{i14}]: must not be null")
+                elif not isinstance(v14, dict):
+                    errors.append(f"grouped_lines[{i14}]: expected object")
+                else:
+                    for key in sorted(v14.keys() - _KEYS_8, key=str):
+                        errors.append(f"grouped_lines[{i14}].{key}: unknown field")
+                    if 'line_items' not in v14:
+                        errors.append(f"grouped_lines[{i14}].line_items: required")
+                    if 'line_items' in v14:
+                        v15 = v14['line_items']
+                        if v15 is None:
+                            errors.append(f"grouped_lines[{i14}].line_items: must not be null")
+                        elif not isinstance(v15, (list, tuple)):
+                            errors.append(f"grouped_lines[{i14}].line_items: expected array")
+                        else:
+                            for i16, v16 in enumerate(v15):
+                                if v16 is None:
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: must not be null")
+                                elif not isinstance(v16, dict):
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: expected object")
+                                else:
+                                    for key in sorted(v16.keys() - _KEYS_9, key=str):
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].{key}: unknown field")
+                                    if 'description' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: required")
+                                    if 'quantity' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: required")
+                                    if 'tax_rate_id' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: required")
+                                    if 'unit_price' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: required")
+                                    if 'description' in v16:
+                                        v17 = v16['description']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: must not be null")
+                                        elif not isinstance(v17, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: expected string")
+                                    if 'discount' in v16:
+                                        v18 = v16['discount']
+                                        if v18 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: must not be null")
+                                        elif not isinstance(v18, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: expected object")
+                                        else:
+                                            for key in sorted(v18.keys() - _KEYS_10, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.{key}: unknown field")
+                                            if 'type' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: required")
+                                            if 'value' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: required")
+                                            if 'type' in v18:
+                                                v19 = v18['type']
+                                                if v19 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must not be null")
+                                                elif not isinstance(v19, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: expected string")
+                                                elif v19 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v18:
+                                                v20 = v18['value']
+                                                if v20 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: must not be null")
+                                                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: expected number")
+                                    if 'extended_description' in v16:
+                                        v21 = v16['extended_description']
+                                        if v21 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].extended_description: must not be null")
+                                        elif not isinstance(v21, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].extended_description: expected string")
+                                    if 'periodicity' in v16:
+                                        v22 = v16['periodicity']
+                                        for check23 in (_schema_0, _schema_1, _schema_2,):
+                                            branch_errors23: list[str] = []
+                                            check23(v22, f"grouped_lines[{i14}].line_items[{i16}].periodicity", branch_errors23)
+                                            if not branch_errors23:
+                                                break
+                                        else:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].periodicity: does not match any allowed shape")
+                                    if 'product_id' in v16:
+                                        v24 = v16['product_id']
+                                        if v24 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: must not be null")
+                                        elif not isinstance(v24, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: expected string")
+                                    if 'purchase_price' in v16:
+                                        v25 = v16['purchase_price']
+                                        if v25 is None:
+                                            pass
+                                        elif not isinstance(v25, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price: expected object")
+                                        else:
+                                            for key in sorted(v25.keys() - _KEYS_15, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.{key}: unknown field")
+                                            if 'amount' not in v25:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.amount: required")
+                                            if 'currency' not in v25:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.currency: required")
+                                            if 'amount' in v25:
+                                                v26 = v25['amount']
+                                                if v26 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.amount: must not be null")
+                                                elif isinstance(v26, bool) or not isinstance(v26, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.amount: expected number")
+                                            if 'currency' in v25:
+                                                v27 = v25['currency']
+                                                if v27 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.currency: must not be null")
+                                                elif not isinstance(v27, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.currency: expected string")
+                                                elif v27 not in _ENUM_3:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].purchase_price.currency: must be one of {sorted(_ENUM_3)}")
+                                    if 'quantity' in v16:
+                                        v28 = v16['quantity']
+                                        if v28 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: must not be null")
+                                        elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: expected number")
+                                    if 'tax_rate_id' in v16:
+                                        v29 = v16['tax_rate_id']
+                                        if v29 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: must not be null")
+                                        elif not isinstance(v29, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v16:
+                                        v30 = v16['unit_of_measure_id']
+                                        if v30 is None:
+                                            pass
+                                        elif not isinstance(v30, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v16:
+                                        v31 = v16['unit_price']
+                                        if v31 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: must not be null")
+                                        elif not isinstance(v31, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v31.keys() - _KEYS_16, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v31:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: required")
+                                            if 'tax' not in v31:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: required")
+                                            if 'amount' in v31:
+                                                v32 = v31['amount']
+                                                if v32 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: must not be null")
+                                                elif isinstance(v32, bool) or not isinstance(v32, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: expected number")
+                                            if 'tax' in v31:
+                                                v33 = v31['tax']
+                                                if v33 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must not be null")
+                                                elif not isinstance(v33, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: expected string")
+                                                elif v33 not in _ENUM_17:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must be one of {sorted(_ENUM_17)}")
+                    if 'section' in v14:
+                        v34 = v14['section']
+                        if v34 is None:
+                            errors.append(f"grouped_lines[{i14}].section: must not be null")
+                        elif not isinstance(v34, dict):
+                            errors.append(f"grouped_lines[{i14}].section: expected object")
+                        else:
+                            for key in sorted(v34.keys() - _KEYS_18, key=str):
+                                errors.append(f"grouped_lines[{i14}].section.{key}: unknown field")
+                            if 'title' not in v34:
+                                errors.append(f"grouped_lines[{i14}].section.title: required")
+                            if 'title' in v34:
+                                v35 = v34['title']
+                                if v35 is None:
+                                    errors.append(f"grouped_lines[{i14}].section.title: must not be null")
+                                elif not isinstance(v35, str):
+                                    errors.append(f"grouped_lines[{i14}].section.title: expected string")
+    if 'text' in body:
+        v36 = body['text']
+        if v36 is None:
+            errors.append("text: must not be null")
+        elif not isinstance(v36, str):
+            errors.append("text: expected string")
+
+
+def _quotations_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _quotations_download(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_19, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'format' not in body:
+        errors.append("format: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'format' in body:
+        v0 = body['format']
+        if v0 is None:
+            errors.append("format: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("format: expected string")
+        elif v0 not in _ENUM_20:
+            errors.append(f"format: must be one of {sorted(_ENUM_20)}")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+
+
+def _quotations_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _quotations_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_21, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_22, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+    if 'page' in body:
+        v3 = body['page']
+        if v3 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_23, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v3:
+                v4 = v3['number']
+                if v4 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v3:
+                v5 = v3['size']
+                if v5 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _quotations_send(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_24, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'content' not in body:
+        errors.append("content: required")
+    if 'language' not in body:
+        errors.append("language: required")
+    if 'quotations' not in body:
+        errors.append("quotations: required")
+    if 'recipients' not in body:
+        errors.append("recipients: required")
+    if 'subject' not in body:
+        errors.append("subject: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'content' in body:
+        v2 = body['content']
+        if v2 is None:
+            errors.append("content: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("content: expected string")
+    if 'from' in body:
+        v3 = body['from']
+        if v3 is None:
+            errors.append("from: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("from: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_25, key=str):
+                errors.append(f"from.{key}: unknown field")
+            if 'sender' not in v3:
+                errors.append("from.sender: required")
+            if 'email_address' not in v3:
+                errors.append("from.email_address: required")
+            if 'email_address' in v3:
+                v4 = v3['email_address']
+                if v4 is None:
+                    errors.append("from.email_address: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("from.email_address: expected string")
+            if 'sender' in v3:
+                v5 = v3['sender']
+                if v5 is None:
+                    errors.append("from.sender: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append("from.sender: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_26, key=str):
+                        errors.append(f"from.sender.{key}: unknown field")
+                    if 'type' not in v5:
+                        errors.append("from.sender.type: required")
+                    if 'id' not in v5:
+                        errors.append("from.sender.id: required")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append("from.sender.id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append("from.sender.id: expected string")
+                    if 'type' in v5:
+                        v7 = v5['type']
+                        if v7 is None:
+                            errors.append("from.sender.type: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append("from.sender.type: expected string")
+                        elif v7 not in _ENUM_27:
+                            errors.append(f"from.sender.type: must be one of {sorted(_ENUM_27)}")
+    if 'language' in body:
+        v8 = body['language']
+        if v8 is None:
+            errors.append("language: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("language: expected string")
+        elif v8 not in _ENUM_28:
+            errors.append(f"language: must be one of {sorted(_ENUM_28)}")
+    if 'quotations' in body:
+        v9 = body['quotations']
+        if v9 is None:
+            errors.append("quotations: must not be null")
+        elif not isinstance(v9, (list, tuple)):
+            errors.append("quotations: expected array")
+        else:
+            for i10, v10 in enumerate(v9):
+                if v10 is None:
+                    errors.append(f"quotations[{i10}]: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append(f"quotations[{i10}]: expected string")
+    if 'recipients' in body:
+        v11 = body['recipients']
+        if v11 is None:
+            errors.append("recipients: must not be null")
+        elif not isinstance(v11, dict):
+            errors.append("recipients: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_29, key=str):
+                errors.append(f"recipients.{key}: unknown field")
+            if 'to' not in v11:
+                errors.append("recipients.to: required")
+            if 'bcc' in v11:
+                v12 = v11['bcc']
+                if v12 is None:
+                    errors.append("recipients.bcc: must not be null")
+                elif not isinstance(v12, (list, tuple)):
+                    errors.append("recipients.bcc: expected array")
+                else:
+                    for i13, v13 in enumerate(v12):
+                        if v13 is None:
+                            errors.append(f"recipients.bcc[{i13}]: must not be null")
+                        elif not isinstance(v13, dict):
+                            errors.append(f"recipients.bcc[{i13}]: expected object")
+                        else:
+                            for key in sorted(v13.keys() - _KEYS_30, key=str):
+                                errors.append(f"recipients.bcc[{i13}].{key}: unknown field")
+                            if 'email_address' not in v13:
+                                errors.append(f"recipients.bcc[{i13}].email_address: required")
+                            if 'customer' in v13:
+                                v14 = v13['customer']
+                                if v14 is None:
+                                    pass
+                                elif not isinstance(v14, dict):
+                                    errors.append(f"recipients.bcc[{i13}].customer: expected object")
+                                else:
+                                    for key in sorted(v14.keys() - _KEYS_26, key=str):
+                                        errors.append(f"recipients.bcc[{i13}].customer.{key}: unknown field")
+                                    if 'id' not in v14:
+                                        errors.append(f"recipients.bcc[{i13}].customer.id: required")
+                                    if 'type' not in v14:
+                                        errors.append(f"recipients.bcc[{i13}].customer.type: required")
+                                    if 'id' in v14:
+                                        v15 = v14['id']
+                                        if v15 is None:
+                                            errors.append(f"recipients.bcc[{i13}].customer.id: must not be null")
+                                        elif not isinstance(v15, str):
+                                            errors.append(f"recipients.bcc[{i13}].customer.id: expected string")
+                                    if 'type' in v14:
+                                        v16 = v14['type']
+                                        if v16 is None:
+                                            errors.append(f"recipients.bcc[{i13}].customer.type: must not be null")
+                                        elif not isinstance(v16, str):
+                                            errors.append(f"recipients.bcc[{i13}].customer.type: expected string")
+                                        elif v16 not in _ENUM_31:
+                                            errors.append(f"recipients.bcc[{i13}].customer.type: must be one of {sorted(_ENUM_31)}")
+                            if 'email_address' in v13:
+                                v17 = v13['email_address']
+                                if v17 is None:
+                                    errors.append(f"recipients.bcc[{i13}].email_address: must not be null")
+                                elif not isinstance(v17, str):
+                                    errors.append(f"recipients.bcc[{i13}].email_address: expected string")
+            if 'cc' in v11:
+                v18 = v11['cc']
+                if v18 is None:
+                    errors.append("recipients.cc: must not be null")
+                elif not isinstance(v18, (list, tuple)):
+                    errors.append("recipients.cc: expected array")
+                else:
+                    for i19, v19 in enumerate(v18):
+                        if v19 is None:
+                            errors.append(f"recipients.cc[{i19}]: must not be null")
+                        elif not isinstance(v19, dict):
+                            errors.append(f"recipients.cc[{i19}]: expected object")
+                        else:
+                            for key in sorted(v19.keys() - _KEYS_30, key=str):
+                                errors.append(f"recipients.cc[{i19}].{key}: unknown field")
+                            if 'email_address' not in v19:
+                                errors.append(f"recipients.cc[{i19}].email_address: required")
+                            if 'customer' in v19:
+                                v20 = v19['customer']
+                                if v20 is None:
+                                    pass
+                                elif not isinstance(v20, dict):
+                                    errors.append(f"recipients.cc[{i19}].customer: expected object")
+                                else:
+                                    for key in sorted(v20.keys() - _KEYS_26, key=str):
+                                        errors.append(f"recipients.cc[{i19}].customer.{key}: unknown field")
+                                    if 'id' not in v20:
+                                        errors.append(f"recipients.cc[{i19}].customer.id: required")
+                                    if 'type' not in v20:
+                                        errors.append(f"recipients.cc[{i19}].customer.type: required")
+                                    if 'id' in v20:
+                                        v21 = v20['id']
+                                        if v21 is None:
+                                            errors.append(f"recipients.cc[{i19}].customer.id: must not be null")
+                                        elif not isinstance(v21, str):
+                                            errors.append(f"recipients.cc[{i19}].customer.id: expected string")
+                                    if 'type' in v20:
+                                        v22 = v20['type']
+                                        if v22 is None:
+                                            errors.append(f"recipients.cc[{i19}].customer.type: must not be null")
+                                        elif not isinstance(v22, str):
+                                            errors.append(f"recipients.cc[{i19}].customer.type: expected string")
+                                        elif v22 not in _ENUM_31:
+                                            errors.append(f"recipients.cc[{i19}].customer.type: must be one of {sorted(_ENUM_31)}")
+                            if 'email_address' in v19:
+                                v23 = v19['email_address']
+                                if v23 is None:
+                                    errors.append(f"recipients.cc[{i19}].email_address: must not be null")
+                                elif not isinstance(v23, str):
+                                    errors.append(f"recipients.cc[{i19}].email_address: expected string")
+            if 'to' in v11:
+                v24 = v11['to']
+                if v24 is None:
+                    errors.append("recipients.to: must not be null")
+                elif not isinstance(v24, (list, tuple)):
+                    errors.append("recipients.to: expected array")
+                else:
+                    for i25, v25 in enumerate(v24):
+                        if v25 is None:
+                            errors.append(f"recipients.to[{i25}]: must not be null")
+                        elif not isinstance(v25, dict):
+                            errors.append(f"recipients.to[{i25}]: expected object")
+                        else:
+                            for key in sorted(v25.keys() - _KEYS_30, key=str):
+                                errors.append(f"recipients.to[{i25}].{key}: unknown field")
+                            if 'email_address' not in v25:
+                                errors.append(f"recipients.to[{i25}].email_address: required")
+                            if 'customer' in v25:
+                                v26 = v25['customer']
+                                if v26 is None:
+                                    pass
+                                elif not isinstance(v26, dict):
+                                    errors.append(f"recipients.to[{i25}].customer: expected object")
+                                else:
+                                    for key in sorted(v26.keys() - _KEYS_26, key=str):
+                                        errors.append(f"recipients.to[{i25}].customer.{key}: unknown field")
+                                    if 'id' not in v26:
+                                        errors.append(f"recipients.to[{i25}].customer.id: required")
+                                    if 'type' not in v26:
+                                        errors.append(f"recipients.to[{i25}].customer.type: required")
+                                    if 'id' in v26:
+                                        v27 = v26['id']
+                                        if v27 is None:
+                                            errors.append(f"recipients.to[{i25}].customer.id: must not be null")
+                                        elif not isinstance(v27, str):
+                                            errors.append(f"recipients.to[{i25}].customer.id: expected string")
+                                    if 'type' in v26:
+                                        v28 = v26['type']
+                                        if v28 is None:
+                                            errors.append(f"recipients.to[{i25}].customer.type: must not be null")
+                                        elif not isinstance(v28, str):
+                                            errors.append(f"recipients.to[{i25}].customer.type: expected string")
+                                        elif v28 not in _ENUM_31:
+                                            errors.append(f"recipients.to[{i25}].customer.type: must be one of {sorted(_ENUM_31)}")
+                            if 'email_address' in v25:
+                                v29 = v25['email_address']
+                                if v29 is None:
+                                    errors.append(f"recipients.to[{i25}].email_address: must not be null")
+                                elif not isinstance(v29, str):
+                                    errors.append(f"recipients.to[{i25}].email_address: expected string")
+    if 'subject' in body:
+        v30 = body['subject']
+        if v30 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v30, str):
+            errors.append("subject: expected string")
+
+
+def _quotations_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_32, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'currency' in body:
+        v0 = body['currency']
+        if v0 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v0:
+                errors.append("currency.code: required")
+            if 'code' in v0:
+                v1 = v0['code']
+                if v1 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("currency.code: expected string")
+                elif v1 not in _ENUM_3:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_3)}")
+            if 'exchange_rate' in v0:
+                v2 = v0['exchange_rate']
+                if v2 is None:
+                    errors.append("currency.exchange_rate: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("currency.exchange_rate: expected number")
+    if 'discounts' in body:
+        v3 = body['discounts']
+        if v3 is None:
+            errors.append("discounts: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("discounts: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"discounts[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"discounts[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"discounts[{i4}].{key}: unknown field")
+                    if 'description' in v4:
+                        v5 = v4['description']
+                        if v5 is None:
+                            errors.append(f"discounts[{i4}].description: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"discounts[{i4}].description: expected string")
+                    if 'type' in v4:
+                        v6 = v4['type']
+                        if v6 is None:
+                            errors.append(f"discounts[{i4}].type: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"discounts[{i4}].type: expected string")
+                        elif v6 not in _ENUM_5:
+                            errors.append(f"discounts[{i4}].type: must be one of {sorted(_ENUM_5)}")
+                    if 'value' in v4:
+                        v7 = v4['value']
+                        if v7 is None:
+                            errors.append(f"discounts[{i4}].value: must not be null")
+                        elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                            errors.append(f"discounts[{i4}].value: expected number")
+    if 'document_template_id' in body:
+        v8 = body['document_template_id']
+        if v8 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("document_template_id: expected string")
+    if 'expiry' in body:
+        v9 = body['expiry']
+        if v9 is None:
+            errors.append("expiry: must not be null")
+        elif not isinstance(v9, dict):
+            errors.append("expiry: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_6, key=str):
+                errors.append(f"expiry.{key}: unknown field")
+            if 'action_after_expiry' not in v9:
+                errors.append("expiry.action_after_expiry: required")
+            if 'action_after_expiry' in v9:
+                v10 = v9['action_after_expiry']
+                if v10 is None:
+                    errors.append("expiry.action_after_expiry: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("expiry.action_after_expiry: expected string")
+                elif v10 not in _ENUM_7:
+                    errors.append(f"expiry.action_after_expiry: must be one of {sorted(_ENUM_7)}")
+            if 'expires_after' in v9:
+                v11 = v9['expires_after']
+                if v11 is None:
+                    pass
+                elif not isinstance(v11, str):
+                    errors.append("expiry.expires_after: expected string")
+    if 'grouped_lines' in body:
+        v12 = body['grouped_lines']
+        if v12 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v12, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i13, v13 in enumerate(v12):
+                if v13 is None:
+                    errors.append(f"grouped_lines[{i13}]: must not be null")
+                elif not isinstance(v13, dict):
+                    errors.append(f"grouped_lines[{i13}]: expected object")
+                else:
+                    for key in sorted(v13.keys() - _KEYS_8, key=str):
+                        errors.append(f"grouped_lines[{i13}].{key}: unknown field")
+                    if 'line_items' not in v13:
+                        errors.append(f"grouped_lines[{i13}].line_items: required")
+                    if 'line_items' in v13:
+                        v14 = v13['line_items']
+                        if v14 is None:
+                            errors.append(f"grouped_lines[{i13}].line_items: must not be null")
+                        elif not isinstance(v14, (list, tuple)):
+                            errors.append(f"grouped_lines[{i13}].line_items: expected array")
+                        else:
+                            for i15, v15 in enumerate(v14):
+                                if v15 is None:
+                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}]: must not be null")
+                                elif not isinstance(v15, dict):
+                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}]: expected object")
+                                else:
+                                    for key in sorted(v15.keys() - _KEYS_9, key=str):
+                                        errors.append(f"grouped_lines[{i13}].line_items[{i15}].{key}: unknown field")
+                                    if 'description' not in v15:
+                                        errors.append(f"grouped_lines[{i13}].line_items[{i15}].description: required")
+                                    if 'quantity' not in v15:
+                                        errors.append(f"grouped_lines[{i13}].line_items[{i15}].quantity: required")
+                                    if 'tax_rate_id' not in v15:
+                                        errors.append(f"grouped_lines[{i13}].line_items[{i15}].tax_rate_id: required")
+                                    if 'unit_price' not in v15:
+                                        errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price: required")
+                                    if 'description' in v15:
+                                        v16 = v15['description']
+                                        if v16 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].description: must not be null")
+                                        elif not isinstance(v16, str):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].description: expected string")
+                                    if 'discount' in v15:
+                                        v17 = v15['discount']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount: must not be null")
+                                        elif not isinstance(v17, dict):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount: expected object")
+                                        else:
+                                            for key in sorted(v17.keys() - _KEYS_10, key=str):
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.{key}: unknown field")
+                                            if 'type' not in v17:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.type: required")
+                                            if 'value' not in v17:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.value: required")
+                                            if 'type' in v17:
+                                                v18 = v17['type']
+                                                if v18 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.type: must not be null")
+                                                elif not isinstance(v18, str):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.type: expected string")
+                                                elif v18 not in _ENUM_5:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.type: must be one of {sorted(_ENUM_5)}")
+                                            if 'value' in v17:
+                                                v19 = v17['value']
+                                                if v19 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.value: must not be null")
+                                                elif isinstance(v19, bool) or not isinstance(v19, (int, float)):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].discount.value: expected number")
+                                    if 'extended_description' in v15:
+                                        v20 = v15['extended_description']
+                                        if v20 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].extended_description: must not be null")
+                                        elif not isinstance(v20, str):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].extended_description: expected string")
+                                    if 'periodicity' in v15:
+                                        v21 = v15['periodicity']
+                                        for check22 in (_schema_0, _schema_1, _schema_2,):
+                                            branch_errors22: list[str] = []
+                                            check22(v21, f"grouped_lines[{i13}].line_items[{i15}].periodicity", branch_errors22)
+                                            if not branch_errors22:
+                                                break
+                                        else:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].periodicity: does not match any allowed shape")
+                                    if 'product_id' in v15:
+                                        v23 = v15['product_id']
+                                        if v23 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].product_id: must not be null")
+                                        elif not isinstance(v23, str):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].product_id: expected string")
+                                    if 'purchase_price' in v15:
+                                        v24 = v15['purchase_price']
+                                        if v24 is None:
+                                            pass
+                                        elif not isinstance(v24, dict):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price: expected object")
+                                        else:
+                                            for key in sorted(v24.keys() - _KEYS_15, key=str):
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.{key}: unknown field")
+                                            if 'amount' not in v24:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.amount: required")
+                                            if 'currency' not in v24:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.currency: required")
+                                            if 'amount' in v24:
+                                                v25 = v24['amount']
+                                                if v25 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.amount: must not be null")
+                                                elif isinstance(v25, bool) or not isinstance(v25, (int, float)):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.amount: expected number")
+                                            if 'currency' in v24:
+                                                v26 = v24['currency']
+                                                if v26 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.currency: must not be null")
+                                                elif not isinstance(v26, str):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.currency: expected string")
+                                                elif v26 not in _ENUM_3:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].purchase_price.currency: must be one of {sorted(_ENUM_3)}")
+                                    if 'quantity' in v15:
+                                        v27 = v15['quantity']
+                                        if v27 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].quantity: must not be null")
+                                        elif isinstance(v27, bool) or not isinstance(v27, (int, float)):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].quantity: expected number")
+                                    if 'tax_rate_id' in v15:
+                                        v28 = v15['tax_rate_id']
+                                        if v28 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].tax_rate_id: must not be null")
+                                        elif not isinstance(v28, str):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v15:
+                                        v29 = v15['unit_of_measure_id']
+                                        if v29 is None:
+                                            pass
+                                        elif not isinstance(v29, str):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v15:
+                                        v30 = v15['unit_price']
+                                        if v30 is None:
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price: must not be null")
+                                        elif not isinstance(v30, dict):
+                                            errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v30.keys() - _KEYS_16, key=str):
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v30:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.amount: required")
+                                            if 'tax' not in v30:
+                                                errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.tax: required")
+                                            if 'amount' in v30:
+                                                v31 = v30['amount']
+                                                if v31 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.amount: must not be null")
+                                                elif isinstance(v31, bool) or not isinstance(v31, (int, float)):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.amount: expected number")
+                                            if 'tax' in v30:
+                                                v32 = v30['tax']
+                                                if v32 is None:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.tax: must not be null")
+                                                elif not isinstance(v32, str):
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.tax: expected string")
+                                                elif v32 not in _ENUM_17:
+                                                    errors.append(f"grouped_lines[{i13}].line_items[{i15}].unit_price.tax: must be one of {sorted(_ENUM_17)}")
+                    if 'section' in v13:
+                        v33 = v13['section']
+                        if v33 is None:
+                            errors.append(f"grouped_lines[{i13}].section: must not be null")
+                        elif not isinstance(v33, dict):
+                            errors.append(f"grouped_lines[{i13}].section: expected object")
+                        else:
+                            for key in sorted(v33.keys() - _KEYS_18, key=str):
+                                errors.append(f"grouped_lines[{i13}].section.{key}: unknown field")
+                            if 'title' not in v33:
+                                errors.append(f"grouped_lines[{i13}].section.title: required")
+                            if 'title' in v33:
+                                v34 = v33['title']
+                                if v34 is None:
+                                    errors.append(f"grouped_lines[{i13}].section.title: must not be null")
+                                elif not isinstance(v34, str):
+                                    errors.append(f"grouped_lines[{i13}].section.title: expected string")
+    if 'id' in body:
+        v35 = body['id']
+        if v35 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v35, str):
+            errors.append("id: expected string")
+    if 'text' in body:
+        v36 = body['text']
+        if v36 is None:
+            pass
+        elif not isinstance(v36, str):
+            errors.append("text: expected string")
+
+
+VALIDATORS = {
+    'quotations.accept': _quotations_accept,
+    'quotations.create': _quotations_create,
+    'quotations.delete': _quotations_delete,
+    'quotations.download': _quotations_download,
+    'quotations.info': _quotations_info,
+    'quotations.list': _quotations_list,
+    'quotations.send': _quotations_send,
+    'quotations.update': _quotations_update,
+}
+# fmt: on
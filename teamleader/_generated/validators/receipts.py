@@ -0,0 +1,514 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'company_entity_id',
+    'currency',
+    'document_number',
+    'file_id',
+    'receipt_date',
+    'supplier_id',
+    'title',
+    'total',
+})
+_KEYS_1 = frozenset({'code'})
+_ENUM_2 = frozenset({
+    'BAM',
+    'CAD',
+    'CHF',
+    'CLP',
+    'CNY',
+    'COP',
+    'CZK',
+    'DKK',
+    'EUR',
+    'GBP',
+    'INR',
+    'ISK',
+    'JPY',
+    'MAD',
+    'MXN',
+    'NOK',
+    'PEN',
+    'PLN',
+    'RON',
+    'SEK',
+    'TRY',
+    'USD',
+    'ZAR',
+})
+_KEYS_3 = frozenset({'tax_inclusive'})
+_KEYS_4 = frozenset({'amount'})
+_KEYS_5 = frozenset({'id'})
+_KEYS_6 = frozenset({'id', 'paid_at', 'payment', 'payment_method_id', 'remark'})
+_KEYS_7 = frozenset({'amount', 'currency'})
+_KEYS_8 = frozenset({'id', 'payment_id'})
+_KEYS_9 = frozenset({
+    'company_entity_id',
+    'currency',
+    'document_number',
+    'file_id',
+    'id',
+    'receipt_date',
+    'supplier_id',
+    'title',
+    'total',
+})
+_KEYS_10 = frozenset({
+    'id',
+    'paid_at',
+    'payment',
+    'payment_id',
+    'payment_method_id',
+    'remark',
+})
+
+
+def _receipts_add(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'currency' not in body:
+        errors.append("currency: required")
+    if 'company_entity_id' in body:
+        v0 = body['company_entity_id']
+        if v0 is None:
+            errors.append("company_entity_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("company_entity_id: expected string")
+    if 'currency' in body:
+        v1 = body['currency']
+        if v1 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v1:
+                errors.append("currency.code: required")
+            if 'code' in v1:
+                v2 = v1['code']
+                if v2 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("currency.code: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+    if 'document_number' in body:
+        v3 = body['document_number']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, str):
+            errors.append("document_number: expected string")
+    if 'file_id' in body:
+        v4 = body['file_id']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("file_id: expected string")
+    if 'receipt_date' in body:
+        v5 = body['receipt_date']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("receipt_date: expected string")
+    if 'supplier_id' in body:
+        v6 = body['supplier_id']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("supplier_id: expected string")
+    if 'title' in body:
+        v7 = body['title']
+        if v7 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("title: expected string")
+    if 'total' in body:
+        v8 = body['total']
+        if v8 is None:
+            errors.append("total: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("total: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_3, key=str):
+                errors.append(f"total.{key}: unknown field")
+            if 'tax_inclusive' in v8:
+                v9 = v8['tax_inclusive']
+                if v9 is None:
+                    pass
+                elif not isinstance(v9, dict):
+                    errors.append("total.tax_inclusive: expected object")
+                else:
+                    for key in sorted(v9.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_inclusive.{key}: unknown field")
+                    if 'amount' not in v9:
+                        errors.append("total.tax_inclusive.amount: required")
+                    if 'amount' in v9:
+                        v10 = v9['amount']
+                        if v10 is None:
+                            errors.append("total.tax_inclusive.amount: must not be null")
+                        elif isinstance(v10, bool) or not isinstance(v10, (int, float)):
+                            errors.append("total.tax_inclusive.amount: expected number")
+
+
+def _receipts_approve(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_listpayments(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_markaspendingreview(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_refuse(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_registerpayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment' not in body:
+        errors.append("payment: required")
+    if 'paid_at' not in body:
+        errors.append("paid_at: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'paid_at' in body:
+        v1 = body['paid_at']
+        if v1 is None:
+            errors.append("paid_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("paid_at: expected string")
+    if 'payment' in body:
+        v2 = body['payment']
+        if v2 is None:
+            errors.append("payment: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("payment: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_7, key=str):
+                errors.append(f"payment.{key}: unknown field")
+            if 'amount' not in v2:
+                errors.append("payment.amount: required")
+            if 'currency' not in v2:
+                errors.append("payment.currency: required")
+            if 'amount' in v2:
+                v3 = v2['amount']
+                if v3 is None:
+                    errors.append("payment.amount: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("payment.amount: expected number")
+            if 'currency' in v2:
+                v4 = v2['currency']
+                if v4 is None:
+                    errors.append("payment.currency: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("payment.currency: expected string")
+                elif v4 not in _ENUM_2:
+                    errors.append(f"payment.currency: must be one of {sorted(_ENUM_2)}")
+    if 'payment_method_id' in body:
+        v5 = body['payment_method_id']
+        if v5 is None:
+            pass
+        elif not isinstance(v5, str):
+            errors.append("payment_method_id: expected string")
+    if 'remark' in body:
+        v6 = body['remark']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("remark: expected string")
+
+
+def _receipts_removepayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_8, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment_id' not in body:
+        errors.append("payment_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'payment_id' in body:
+        v1 = body['payment_id']
+        if v1 is None:
+            errors.append("payment_id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("payment_id: expected string")
+
+
+def _receipts_sendtobookkeeping(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _receipts_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'company_entity_id' in body:
+        v0 = body['company_entity_id']
+        if v0 is None:
+            errors.append("company_entity_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("company_entity_id: expected string")
+    if 'currency' in body:
+        v1 = body['currency']
+        if v1 is None:
+            errors.append("currency: must not be null")
+        elif not isinstance(v1, dict):
+            errors.append("currency: expected object")
+        else:
+            for key in sorted(v1.keys() - _KEYS_1, key=str):
+                errors.append(f"currency.{key}: unknown field")
+            if 'code' not in v1:
+                errors.append("currency.code: required")
+            if 'code' in v1:
+                v2 = v1['code']
+                if v2 is None:
+                    errors.append("currency.code: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("currency.code: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"currency.code: must be one of {sorted(_ENUM_2)}")
+    if 'document_number' in body:
+        v3 = body['document_number']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, str):
+            errors.append("document_number: expected string")
+    if 'file_id' in body:
+        v4 = body['file_id']
+        if v4 is None:
+            pass
+        elif not isinstance(v4, str):
+            errors.append("file_id: expected string")
+    if 'id' in body:
+        v5 = body['id']
+        if v5 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("id: expected string")
+    if 'receipt_date' in body:
+        v6 = body['receipt_date']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("receipt_date: expected string")
+    if 'supplier_id' in body:
+        v7 = body['supplier_id']
+        if v7 is None:
+            pass
+        elif not isinstance(v7, str):
+            errors.append("supplier_id: expected string")
+    if 'title' in body:
+        v8 = body['title']
+        if v8 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v8, str):
+            errors.append("title: expected string")
+    if 'total' in body:
+        v9 = body['total']
+        if v9 is None:
+            errors.append("total: must not be null")
+        elif not isinstance(v9, dict):
+            errors.append("total: expected object")
+        else:
+            for key in sorted(v9.keys() - _KEYS_3, key=str):
+                errors.append(f"total.{key}: unknown field")
+            if 'tax_inclusive' in v9:
+                v10 = v9['tax_inclusive']
+                if v10 is None:
+                    pass
+                elif not isinstance(v10, dict):
+                    errors.append("total.tax_inclusive: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_4, key=str):
+                        errors.append(f"total.tax_inclusive.{key}: unknown field")
+                    if 'amount' not in v10:
+                        errors.append("total.tax_inclusive.amount: required")
+                    if 'amount' in v10:
+                        v11 = v10['amount']
+                        if v11 is None:
+                            errors.append("total.tax_inclusive.amount: must not be null")
+                        elif isinstance(v11, bool) or not isinstance(v11, (int, float)):
+                            errors.append("total.tax_inclusive.amount: expected number")
+
+
+def _receipts_updatepayment(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'payment_id' not in body:
+        errors.append("payment_id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'paid_at' in body:
+        v1 = body['paid_at']
+        if v1 is None:
+            errors.append("paid_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("paid_at: expected string")
+    if 'payment' in body:
+        v2 = body['payment']
+        if v2 is None:
+            errors.append("payment: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("payment: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_7, key=str):
+                errors.append(f"payment.{key}: unknown field")
+            if 'amount' not in v2:
+                errors.append("payment.amount: required")
+            if 'currency' not in v2:
+                errors.append("payment.currency: required")
+            if 'amount' in v2:
+                v3 = v2['amount']
+                if v3 is None:
+                    errors.append("payment.amount: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("payment.amount: expected number")
+            if 'currency' in v2:
+                v4 = v2['currency']
+                if v4 is None:
+                    errors.append("payment.currency: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("payment.currency: expected string")
+                elif v4 not in _ENUM_2:
+                    errors.append(f"payment.currency: must be one of {sorted(_ENUM_2)}")
+    if 'payment_id' in body:
+        v5 = body['payment_id']
+        if v5 is None:
+            errors.append("payment_id: must not be null")
+        elif not isinstance(v5, str):
+            errors.append("payment_id: expected string")
+    if 'payment_method_id' in body:
+        v6 = body['payment_method_id']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("payment_method_id: expected string")
+    if 'remark' in body:
+        v7 = body['remark']
+        if v7 is None:
+            pass
+        elif not isinstance(v7, str):
+            errors.append("remark: expected string")
+
+
+VALIDATORS = {
+    'receipts.add': _receipts_add,
+    'receipts.approve': _receipts_approve,
+    'receipts.delete': _receipts_delete,
+    'receipts.info': _receipts_info,
+    'receipts.listPayments': _receipts_listpayments,
+    'receipts.markAsPendingReview': _receipts_markaspendingreview,
+    'receipts.refuse': _receipts_refuse,
+    'receipts.registerPayment': _receipts_registerpayment,
+    'receipts.removePayment': _receipts_removepayment,
+    'receipts.sendToBookkeeping': _receipts_sendtobookkeeping,
+    'receipts.update': _receipts_update,
+    'receipts.updatePayment': _receipts_updatepayment,
+}
+# fmt: on
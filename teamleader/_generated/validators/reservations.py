@@ -0,0 +1,338 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'assignee', 'date', 'duration', 'plannable_item_id'})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({'team', 'user'})
+_KEYS_3 = frozenset({'unit', 'value'})
+_ENUM_4 = frozenset({'minutes'})
+_KEYS_5 = frozenset({'id'})
+_KEYS_6 = frozenset({'filter', 'page'})
+_KEYS_7 = frozenset({
+    'assignees',
+    'end_date',
+    'plannable_item_ids',
+    'source_types',
+    'sources',
+    'start_date',
+})
+_ENUM_8 = frozenset({
+    'call',
+    'closingDay',
+    'dayOffType',
+    'externalEvent',
+    'meeting',
+    'task',
+})
+_KEYS_9 = frozenset({'number', 'size'})
+_KEYS_10 = frozenset({'assignee', 'date', 'duration', 'id'})
+
+
+def _reservations_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'assignee' not in body:
+        errors.append("assignee: required")
+    if 'date' not in body:
+        errors.append("date: required")
+    if 'duration' not in body:
+        errors.append("duration: required")
+    if 'plannable_item_id' not in body:
+        errors.append("plannable_item_id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'date' in body:
+        v3 = body['date']
+        if v3 is None:
+            errors.append("date: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("date: expected string")
+    if 'duration' in body:
+        v4 = body['duration']
+        if v4 is None:
+            errors.append("duration: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("duration: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_3, key=str):
+                errors.append(f"duration.{key}: unknown field")
+            if 'unit' in v4:
+                v5 = v4['unit']
+                if v5 is None:
+                    errors.append("duration.unit: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("duration.unit: expected string")
+                elif v5 not in _ENUM_4:
+                    errors.append(f"duration.unit: must be one of {sorted(_ENUM_4)}")
+            if 'value' in v4:
+                v6 = v4['value']
+                if v6 is None:
+                    errors.append("duration.value: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("duration.value: expected number")
+    if 'plannable_item_id' in body:
+        v7 = body['plannable_item_id']
+        if v7 is None:
+            errors.append("plannable_item_id: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("plannable_item_id: expected string")
+
+
+def _reservations_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _reservations_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_7, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'assignees' in v0:
+                v1 = v0['assignees']
+                if v1 is None:
+                    errors.append("filter.assignees: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.assignees: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.assignees[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.assignees[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_1, key=str):
+                                errors.append(f"filter.assignees[{i2}].{key}: unknown field")
+                            if 'id' not in v2:
+                                errors.append(f"filter.assignees[{i2}].id: required")
+                            if 'type' not in v2:
+                                errors.append(f"filter.assignees[{i2}].type: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.assignees[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.assignees[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.assignees[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.assignees[{i2}].type: expected string")
+                                elif v4 not in _ENUM_2:
+                                    errors.append(f"filter.assignees[{i2}].type: must be one of {sorted(_ENUM_2)}")
+            if 'end_date' in v0:
+                v5 = v0['end_date']
+                if v5 is None:
+                    errors.append("filter.end_date: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.end_date: expected string")
+            if 'plannable_item_ids' in v0:
+                v6 = v0['plannable_item_ids']
+                if v6 is None:
+                    errors.append("filter.plannable_item_ids: must not be null")
+                elif not isinstance(v6, (list, tuple)):
+                    errors.append("filter.plannable_item_ids: expected array")
+                else:
+                    for i7, v7 in enumerate(v6):
+                        if v7 is None:
+                            errors.append(f"filter.plannable_item_ids[{i7}]: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"filter.plannable_item_ids[{i7}]: expected string")
+            if 'source_types' in v0:
+                v8 = v0['source_types']
+                if v8 is None:
+                    errors.append("filter.source_types: must not be null")
+                elif not isinstance(v8, (list, tuple)):
+                    errors.append("filter.source_types: expected array")
+                else:
+                    for i9, v9 in enumerate(v8):
+                        if v9 is None:
+                            errors.append(f"filter.source_types[{i9}]: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append(f"filter.source_types[{i9}]: expected string")
+                        elif v9 not in _ENUM_8:
+                            errors.append(f"filter.source_types[{i9}]: must be one of {sorted(_ENUM_8)}")
+            if 'sources' in v0:
+                v10 = v0['sources']
+                if v10 is None:
+                    errors.append("filter.sources: must not be null")
+                elif not isinstance(v10, (list, tuple)):
+                    errors.append("filter.sources: expected array")
+                else:
+                    for i11, v11 in enumerate(v10):
+                        if v11 is None:
+                            errors.append(f"filter.sources[{i11}]: must not be null")
+                        elif not isinstance(v11, dict):
+                            errors.append(f"filter.sources[{i11}]: expected object")
+                        else:
+                            for key in sorted(v11.keys() - _KEYS_1, key=str):
+                                errors.append(f"filter.sources[{i11}].{key}: unknown field")
+                            if 'id' in v11:
+                                v12 = v11['id']
+                                if v12 is None:
+                                    errors.append(f"filter.sources[{i11}].id: must not be null")
+                                elif not isinstance(v12, str):
+                                    errors.append(f"filter.sources[{i11}].id: expected string")
+                            if 'type' in v11:
+                                v13 = v11['type']
+                                if v13 is None:
+                                    errors.append(f"filter.sources[{i11}].type: must not be null")
+                                elif not isinstance(v13, str):
+                                    errors.append(f"filter.sources[{i11}].type: expected string")
+                                elif v13 not in _ENUM_8:
+                                    errors.append(f"filter.sources[{i11}].type: must be one of {sorted(_ENUM_8)}")
+            if 'start_date' in v0:
+                v14 = v0['start_date']
+                if v14 is None:
+                    errors.append("filter.start_date: must not be null")
+                elif not isinstance(v14, str):
+                    errors.append("filter.start_date: expected string")
+    if 'page' in body:
+        v15 = body['page']
+        if v15 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v15, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v15.keys() - _KEYS_9, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v15:
+                v16 = v15['number']
+                if v16 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v15:
+                v17 = v15['size']
+                if v17 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v17, bool) or not isinstance(v17, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _reservations_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_2:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_2)}")
+    if 'date' in body:
+        v3 = body['date']
+        if v3 is None:
+            errors.append("date: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("date: expected string")
+    if 'duration' in body:
+        v4 = body['duration']
+        if v4 is None:
+            errors.append("duration: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("duration: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_3, key=str):
+                errors.append(f"duration.{key}: unknown field")
+            if 'unit' in v4:
+                v5 = v4['unit']
+                if v5 is None:
+                    errors.append("duration.unit: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("duration.unit: expected string")
+                elif v5 not in _ENUM_4:
+                    errors.append(f"duration.unit: must be one of {sorted(_ENUM_4)}")
+            if 'value' in v4:
+                v6 = v4['value']
+                if v6 is None:
+                    errors.append("duration.value: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("duration.value: expected number")
+    if 'id' in body:
+        v7 = body['id']
+        if v7 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v7, str):
+            errors.append("id: expected string")
+
+
+VALIDATORS = {
+    'reservations.create': _reservations_create,
+    'reservations.delete': _reservations_delete,
+    'reservations.list': _reservations_list,
+    'reservations.update': _reservations_update,
+}
+# fmt: on
@@ -0,0 +1,1388 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'billing_cycle',
+    'custom_fields',
+    'deal_id',
+    'department_id',
+    'document_template_id',
+    'ends_on',
+    'grouped_lines',
+    'invoice_generation',
+    'invoicee',
+    'note',
+    'payment_term',
+    'project_id',
+    'starts_on',
+    'title',
+})
+_KEYS_1 = frozenset({'days_in_advance', 'periodicity'})
+_KEYS_2 = frozenset({'period', 'unit'})
+_ENUM_3 = frozenset({'week'})
+_ENUM_4 = frozenset({'month'})
+_ENUM_5 = frozenset({'year'})
+_KEYS_6 = frozenset({'id', 'value'})
+_KEYS_7 = frozenset({'id', 'type'})
+_ENUM_8 = frozenset({'company', 'contact', 'product', 'user'})
+_KEYS_9 = frozenset({'line_items', 'section'})
+_KEYS_10 = frozenset({
+    'description',
+    'discount',
+    'extended_description',
+    'product_category_id',
+    'product_id',
+    'quantity',
+    'tax_rate_id',
+    'unit_of_measure_id',
+    'unit_price',
+    'withholding_tax_rate_id',
+})
+_KEYS_11 = frozenset({'type', 'value'})
+_ENUM_12 = frozenset({'percentage'})
+_KEYS_13 = frozenset({'amount', 'tax'})
+_ENUM_14 = frozenset({'excluding'})
+_KEYS_15 = frozenset({'title'})
+_KEYS_16 = frozenset({'action', 'payment_method'})
+_ENUM_17 = frozenset({'direct_debit'})
+_KEYS_18 = frozenset({'action', 'payment_method', 'sending_methods'})
+_KEYS_19 = frozenset({'method'})
+_ENUM_20 = frozenset({'email', 'peppol', 'postal_service'})
+_KEYS_21 = frozenset({'customer', 'for_attention_of'})
+_ENUM_22 = frozenset({'company', 'contact'})
+_KEYS_23 = frozenset({'name'})
+_KEYS_24 = frozenset({'contact_id'})
+_KEYS_25 = frozenset({'days', 'type'})
+_ENUM_26 = frozenset({'after_invoice_date', 'cash', 'end_of_month'})
+_KEYS_27 = frozenset({'id'})
+_KEYS_28 = frozenset({'filter', 'page', 'sort'})
+_KEYS_29 = frozenset({
+    'customer',
+    'deal_id',
+    'department_id',
+    'ids',
+    'invoice_id',
+    'status',
+})
+_ENUM_30 = frozenset({'active', 'deactivated'})
+_KEYS_31 = frozenset({'number', 'size'})
+_KEYS_32 = frozenset({'field', 'order'})
+_ENUM_33 = frozenset({'created_at', 'status', 'title'})
+_ENUM_34 = frozenset({'asc', 'desc'})
+_KEYS_35 = frozenset({
+    'billing_cycle',
+    'custom_fields',
+    'deal_id',
+    'department_id',
+    'document_template_id',
+    'ends_on',
+    'grouped_lines',
+    'id',
+    'invoice_generation',
+    'invoicee',
+    'note',
+    'payment_term',
+    'project_id',
+    'starts_on',
+    'title',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2):
+                errors.append(f"{path}.period: must be one of [1, 2]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_3:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_3)}")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2, 3, 4, 6):
+                errors.append(f"{path}.period: must be one of [1, 2, 3, 4, 6]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_4:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_4)}")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'period' not in v0:
+            errors.append(f"{path}.period: required")
+        if 'unit' not in v0:
+            errors.append(f"{path}.unit: required")
+        if 'period' in v0:
+            v1 = v0['period']
+            if v1 is None:
+                errors.append(f"{path}.period: must not be null")
+            elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                errors.append(f"{path}.period: expected number")
+            elif v1 not in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10):
+                errors.append(f"{path}.period: must be one of [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]")
+        if 'unit' in v0:
+            v2 = v0['unit']
+            if v2 is None:
+                errors.append(f"{path}.unit: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.unit: expected string")
+            elif v2 not in _ENUM_5:
+                errors.append(f"{path}.unit: must be one of {sorted(_ENUM_5)}")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_5(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_6(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_7(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_7, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_8:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_8)}")
+
+
+def _schema_8(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                errors.append(f"{path}.payment_method: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+
+
+def _schema_9(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                errors.append(f"{path}.payment_method: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+
+
+def _schema_10(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_18, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'sending_methods' not in v0:
+            errors.append(f"{path}.sending_methods: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                errors.append(f"{path}.payment_method: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+        if 'sending_methods' in v0:
+            v3 = v0['sending_methods']
+            if v3 is None:
+                errors.append(f"{path}.sending_methods: must not be null")
+            elif not isinstance(v3, (list, tuple)):
+                errors.append(f"{path}.sending_methods: expected array")
+            else:
+                for i4, v4 in enumerate(v3):
+                    if v4 is None:
+                        errors.append(f"{path}.sending_methods[{i4}]: must not be null")
+                    elif not isinstance(v4, dict):
+                        errors.append(f"{path}.sending_methods[{i4}]: expected object")
+                    else:
+                        for key in sorted(v4.keys() - _KEYS_19, key=str):
+                            errors.append(f"{path}.sending_methods[{i4}].{key}: unknown field")
+                        if 'method' not in v4:
+                            errors.append(f"{path}.sending_methods[{i4}].method: required")
+                        if 'method' in v4:
+                            v5 = v4['method']
+                            if v5 is None:
+                                errors.append(f"{path}.sending_methods[{i4}].method: must not be null")
+                            elif not isinstance(v5, str):
+                                errors.append(f"{path}.sending_methods[{i4}].method: expected string")
+                            elif v5 not in _ENUM_20:
+                                errors.append(f"{path}.sending_methods[{i4}].method: must be one of {sorted(_ENUM_20)}")
+
+
+def _schema_11(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_23, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'name' not in v0:
+            errors.append(f"{path}.name: required")
+        if 'name' in v0:
+            v1 = v0['name']
+            if v1 is None:
+                errors.append(f"{path}.name: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.name: expected string")
+
+
+def _schema_12(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_24, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'contact_id' not in v0:
+            errors.append(f"{path}.contact_id: required")
+        if 'contact_id' in v0:
+            v1 = v0['contact_id']
+            if v1 is None:
+                errors.append(f"{path}.contact_id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.contact_id: expected string")
+
+
+def _schema_13(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                errors.append(f"{path}.payment_method: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+
+
+def _schema_14(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                errors.append(f"{path}.payment_method: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+
+
+def _schema_15(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_18, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'action' not in v0:
+            errors.append(f"{path}.action: required")
+        if 'sending_methods' not in v0:
+            errors.append(f"{path}.sending_methods: required")
+        if 'action' in v0:
+            v1 = v0['action']
+            if v1 is None:
+                errors.append(f"{path}.action: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.action: expected string")
+        if 'payment_method' in v0:
+            v2 = v0['payment_method']
+            if v2 is None:
+                pass
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.payment_method: expected string")
+            elif v2 not in _ENUM_17:
+                errors.append(f"{path}.payment_method: must be one of {sorted(_ENUM_17)}")
+        if 'sending_methods' in v0:
+            v3 = v0['sending_methods']
+            if v3 is None:
+                errors.append(f"{path}.sending_methods: must not be null")
+            elif not isinstance(v3, (list, tuple)):
+                errors.append(f"{path}.sending_methods: expected array")
+            else:
+                for i4, v4 in enumerate(v3):
+                    if v4 is None:
+                        errors.append(f"{path}.sending_methods[{i4}]: must not be null")
+                    elif not isinstance(v4, dict):
+                        errors.append(f"{path}.sending_methods[{i4}]: expected object")
+                    else:
+                        for key in sorted(v4.keys() - _KEYS_19, key=str):
+                            errors.append(f"{path}.sending_methods[{i4}].{key}: unknown field")
+                        if 'method' not in v4:
+                            errors.append(f"{path}.sending_methods[{i4}].method: required")
+                        if 'method' in v4:
+                            v5 = v4['method']
+                            if v5 is None:
+                                errors.append(f"{path}.sending_methods[{i4}].method: must not be null")
+                            elif not isinstance(v5, str):
+                                errors.append(f"{path}.sending_methods[{i4}].method: expected string")
+                            elif v5 not in _ENUM_20:
+                                errors.append(f"{path}.sending_methods[{i4}].method: must be one of {sorted(_ENUM_20)}")
+
+
+def _subscriptions_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'billing_cycle' not in body:
+        errors.append("billing_cycle: required")
+    if 'department_id' not in body:
+        errors.append("department_id: required")
+    if 'grouped_lines' not in body:
+        errors.append("grouped_lines: required")
+    if 'invoice_generation' not in body:
+        errors.append("invoice_generation: required")
+    if 'invoicee' not in body:
+        errors.append("invoicee: required")
+    if 'payment_term' not in body:
+        errors.append("payment_term: required")
+    if 'starts_on' not in body:
+        errors.append("starts_on: required")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'billing_cycle' in body:
+        v0 = body['billing_cycle']
+        if v0 is None:
+            errors.append("billing_cycle: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("billing_cycle: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"billing_cycle.{key}: unknown field")
+            if 'days_in_advance' not in v0:
+                errors.append("billing_cycle.days_in_advance: required")
+            if 'periodicity' not in v0:
+                errors.append("billing_cycle.periodicity: required")
+            if 'days_in_advance' in v0:
+                v1 = v0['days_in_advance']
+                if v1 is None:
+                    errors.append("billing_cycle.days_in_advance: must not be null")
+                elif isinstance(v1, bool) or not isinstance(v1, int):
+                    errors.append("billing_cycle.days_in_advance: expected integer")
+                elif v1 not in (0, 7, 14, 21, 28):
+                    errors.append("billing_cycle.days_in_advance: must be one of [0, 7, 14, 21, 28]")
+            if 'periodicity' in v0:
+                v2 = v0['periodicity']
+                for check3 in (_schema_0, _schema_1, _schema_2,):
+                    branch_errors3: list[str] = []
+                    check3(v2, "billing_cycle.periodicity", branch_errors3)
+                    if not branch_errors3:
+                        break
+                else:
+                    errors.append("billing_cycle.periodicity: does not match any allowed shape")
+    if 'custom_fields' in body:
+        v4 = body['custom_fields']
+        if v4 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v4, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i5, v5 in enumerate(v4):
+                if v5 is None:
+                    errors.append(f"custom_fields[{i5}]: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append(f"custom_fields[{i5}]: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_6, key=str):
+                        errors.append(f"custom_fields[{i5}].{key}: unknown field")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append(f"custom_fields[{i5}].id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"custom_fields[{i5}].id: expected string")
+                    if 'value' in v5:
+                        v7 = v5['value']
+                        for check8 in (_schema_3, _schema_4, _schema_5, _schema_6, _schema_7,):
+                            branch_errors8: list[str] = []
+                            check8(v7, f"custom_fields[{i5}].value", branch_errors8)
+                            if not branch_errors8:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i5}].value: does not match any allowed shape")
+    if 'deal_id' in body:
+        v9 = body['deal_id']
+        if v9 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("deal_id: expected string")
+    if 'department_id' in body:
+        v10 = body['department_id']
+        if v10 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("department_id: expected string")
+    if 'document_template_id' in body:
+        v11 = body['document_template_id']
+        if v11 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("document_template_id: expected string")
+    if 'ends_on' in body:
+        v12 = body['ends_on']
+        if v12 is None:
+            pass
+        elif not isinstance(v12, str):
+            errors.append("ends_on: expected string")
+    if 'grouped_lines' in body:
+        v13 = body['grouped_lines']
+        if v13 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v13, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i14, v14 in enumerate(v13):
+                if v14 is None:
+                    errors.append(f"grouped_lines[{i14}]: must not be null")
+                elif not isinstance(v14, dict):
+                    errors.append(f"grouped_lines[{i14}]: expected object")
+                else:
+                    for key in sorted(v14.keys() - _KEYS_9, key=str):
+                        errors.append(f"grouped_lines[{i14}].{key}: unknown field")
+                    if 'line_items' not in v14:
+                        errors.append(f"grouped_lines[{i14}].line_items: required")
+                    if 'line_items' in v14:
+                        v15 = v14['line_items']
+                        if v15 is None:
+                            errors.append(f"grouped_lines[{i14}].line_items: must not be null")
+                        elif not isinstance(v15, (list, tuple)):
+                            errors.append(f"grouped_lines[{i14}].line_items: expected array")
+                        else:
+                            for i16, v16 in enumerate(v15):
+                                if v16 is None:
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: must not be null")
+                                elif not isinstance(v16, dict):
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: expected object")
+                                else:
+                                    for key in sorted(v16.keys() - _KEYS_10, key=str):
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].{key}: unknown field")
+                                    if 'description' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: required")
+                                    if 'quantity' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: required")
+                                    if 'tax_rate_id' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: required")
+                                    if 'unit_price' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: required")
+                                    if 'description' in v16:
+                                        v17 = v16['description']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: must not be null")
+                                        elif not isinstance(v17, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: expected string")
+                                    if 'discount' in v16:
+                                        v18 = v16['discount']
+                                        if v18 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: must not be null")
+                                        elif not isinstance(v18, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: expected object")
+                                        else:
+                                            for key in sorted(v18.keys() - _KEYS_11, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.{key}: unknown field")
+                                            if 'type' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: required")
+                                            if 'value' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: required")
+                                            if 'type' in v18:
+                                                v19 = v18['type']
+                                                if v19 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must not be null")
+                                                elif not isinstance(v19, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: expected string")
+                                                elif v19 not in _ENUM_12:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must be one of {sorted(_ENUM_12)}")
+                                            if 'value' in v18:
+                                                v20 = v18['value']
+                                                if v20 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: must not be null")
+                                                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: expected number")
+                                    if 'extended_description' in v16:
+                                        v21 = v16['extended_description']
+                                        if v21 is None:
+                                            pass
+                                        elif not isinstance(v21, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].extended_description: expected string")
+                                    if 'product_category_id' in v16:
+                                        v22 = v16['product_category_id']
+                                        if v22 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_category_id: must not be null")
+                                        elif not isinstance(v22, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_category_id: expected string")
+                                    if 'product_id' in v16:
+                                        v23 = v16['product_id']
+                                        if v23 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: must not be null")
+                                        elif not isinstance(v23, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: expected string")
+                                    if 'quantity' in v16:
+                                        v24 = v16['quantity']
+                                        if v24 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: must not be null")
+                                        elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: expected number")
+                                    if 'tax_rate_id' in v16:
+                                        v25 = v16['tax_rate_id']
+                                        if v25 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: must not be null")
+                                        elif not isinstance(v25, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v16:
+                                        v26 = v16['unit_of_measure_id']
+                                        if v26 is None:
+                                            pass
+                                        elif not isinstance(v26, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v16:
+                                        v27 = v16['unit_price']
+                                        if v27 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: must not be null")
+                                        elif not isinstance(v27, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v27.keys() - _KEYS_13, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v27:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: required")
+                                            if 'tax' not in v27:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: required")
+                                            if 'amount' in v27:
+                                                v28 = v27['amount']
+                                                if v28 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: must not be null")
+                                                elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: expected number")
+                                            if 'tax' in v27:
+                                                v29 = v27['tax']
+                                                if v29 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must not be null")
+                                                elif not isinstance(v29, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: expected string")
+                                                elif v29 not in _ENUM_14:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must be one of {sorted(_ENUM_14)}")
+                                    if 'withholding_tax_rate_id' in v16:
+                                        v30 = v16['withholding_tax_rate_id']
+                                        if v30 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v30, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].withholding_tax_rate_id: expected string")
+                    if 'section' in v14:
+                        v31 = v14['section']
+                        if v31 is None:
+                            errors.append(f"grouped_lines[{i14}].section: must not be null")
+                        elif not isinstance(v31, dict):
+                            errors.append(f"grouped_lines[{i14}].section: expected object")
+                        else:
+                            for key in sorted(v31.keys() - _KEYS_15, key=str):
+                                errors.append(f"grouped_lines[{i14}].section.{key}: unknown field")
+                            if 'title' in v31:
+                                v32 = v31['title']
+                                if v32 is None:
+                                    errors.append(f"grouped_lines[{i14}].section.title: must not be null")
+                                elif not isinstance(v32, str):
+                                    errors.append(f"grouped_lines[{i14}].section.title: expected string")
+    if 'invoice_generation' in body:
+        v33 = body['invoice_generation']
+        for check34 in (_schema_8, _schema_9, _schema_10,):
+            branch_errors34: list[str] = []
+            check34(v33, "invoice_generation", branch_errors34)
+            if not branch_errors34:
+                break
+        else:
+            errors.append("invoice_generation: does not match any allowed shape")
+    if 'invoicee' in body:
+        v35 = body['invoicee']
+        if v35 is None:
+            errors.append("invoicee: must not be null")
+        elif not isinstance(v35, dict):
+            errors.append("invoicee: expected object")
+        else:
+            for key in sorted(v35.keys() - _KEYS_21, key=str):
+                errors.append(f"invoicee.{key}: unknown field")
+            if 'customer' not in v35:
+                errors.append("invoicee.customer: required")
+            if 'customer' in v35:
+                v36 = v35['customer']
+                if v36 is None:
+                    errors.append("invoicee.customer: must not be null")
+                elif not isinstance(v36, dict):
+                    errors.append("invoicee.customer: expected object")
+                else:
+                    for key in sorted(v36.keys() - _KEYS_7, key=str):
+                        errors.append(f"invoicee.customer.{key}: unknown field")
+                    if 'type' not in v36:
+                        errors.append("invoicee.customer.type: required")
+                    if 'id' not in v36:
+                        errors.append("invoicee.customer.id: required")
+                    if 'id' in v36:
+                        v37 = v36['id']
+                        if v37 is None:
+                            errors.append("invoicee.customer.id: must not be null")
+                        elif not isinstance(v37, str):
+                            errors.append("invoicee.customer.id: expected string")
+                    if 'type' in v36:
+                        v38 = v36['type']
+                        if v38 is None:
+                            errors.append("invoicee.customer.type: must not be null")
+                        elif not isinstance(v38, str):
+                            errors.append("invoicee.customer.type: expected string")
+                        elif v38 not in _ENUM_22:
+                            errors.append(f"invoicee.customer.type: must be one of {sorted(_ENUM_22)}")
+            if 'for_attention_of' in v35:
+                v39 = v35['for_attention_of']
+                for check40 in (_schema_11, _schema_12,):
+                    branch_errors40: list[str] = []
+                    check40(v39, "invoicee.for_attention_of", branch_errors40)
+                    if not branch_errors40:
+                        break
+                else:
+                    errors.append("invoicee.for_attention_of: does not match any allowed shape")
+    if 'note' in body:
+        v41 = body['note']
+        if v41 is None:
+            errors.append("note: must not be null")
+        elif not isinstance(v41, str):
+            errors.append("note: expected string")
+    if 'payment_term' in body:
+        v42 = body['payment_term']
+        if v42 is None:
+            errors.append("payment_term: must not be null")
+        elif not isinstance(v42, dict):
+            errors.append("payment_term: expected object")
+        else:
+            for key in sorted(v42.keys() - _KEYS_25, key=str):
+                errors.append(f"payment_term.{key}: unknown field")
+            if 'days' in v42:
+                v43 = v42['days']
+                if v43 is None:
+                    errors.append("payment_term.days: must not be null")
+                elif isinstance(v43, bool) or not isinstance(v43, (int, float)):
+                    errors.append("payment_term.days: expected number")
+            if 'type' in v42:
+                v44 = v42['type']
+                if v44 is None:
+                    errors.append("payment_term.type: must not be null")
+                elif not isinstance(v44, str):
+                    errors.append("payment_term.type: expected string")
+                elif v44 not in _ENUM_26:
+                    errors.append(f"payment_term.type: must be one of {sorted(_ENUM_26)}")
+    if 'project_id' in body:
+        v45 = body['project_id']
+        if v45 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v45, str):
+            errors.append("project_id: expected string")
+    if 'starts_on' in body:
+        v46 = body['starts_on']
+        if v46 is None:
+            errors.append("starts_on: must not be null")
+        elif not isinstance(v46, str):
+            errors.append("starts_on: expected string")
+    if 'title' in body:
+        v47 = body['title']
+        if v47 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v47, str):
+            errors.append("title: expected string")
+
+
+def _subscriptions_deactivate(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_27, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _subscriptions_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_27, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _subscriptions_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_28, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_29, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'customer' in v0:
+                v1 = v0['customer']
+                if v1 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_7, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v1:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v1:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v1:
+                        v2 = v1['id']
+                        if v2 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v1:
+                        v3 = v1['type']
+                        if v3 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v3 not in _ENUM_22:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_22)}")
+            if 'deal_id' in v0:
+                v4 = v0['deal_id']
+                if v4 is None:
+                    errors.append("filter.deal_id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("filter.deal_id: expected string")
+            if 'department_id' in v0:
+                v5 = v0['department_id']
+                if v5 is None:
+                    errors.append("filter.department_id: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.department_id: expected string")
+            if 'ids' in v0:
+                v6 = v0['ids']
+                if v6 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v6, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i7, v7 in enumerate(v6):
+                        if v7 is None:
+                            errors.append(f"filter.ids[{i7}]: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"filter.ids[{i7}]: expected string")
+            if 'invoice_id' in v0:
+                v8 = v0['invoice_id']
+                if v8 is None:
+                    errors.append("filter.invoice_id: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("filter.invoice_id: expected string")
+            if 'status' in v0:
+                v9 = v0['status']
+                if v9 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v9, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i10, v10 in enumerate(v9):
+                        if v10 is None:
+                            errors.append(f"filter.status[{i10}]: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append(f"filter.status[{i10}]: expected string")
+                        elif v10 not in _ENUM_30:
+                            errors.append(f"filter.status[{i10}]: must be one of {sorted(_ENUM_30)}")
+    if 'page' in body:
+        v11 = body['page']
+        if v11 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v11, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_31, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v11:
+                v12 = v11['number']
+                if v12 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v11:
+                v13 = v11['size']
+                if v13 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v14 = body['sort']
+        if v14 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v14, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i15, v15 in enumerate(v14):
+                if v15 is None:
+                    errors.append(f"sort[{i15}]: must not be null")
+                elif not isinstance(v15, dict):
+                    errors.append(f"sort[{i15}]: expected object")
+                else:
+                    for key in sorted(v15.keys() - _KEYS_32, key=str):
+                        errors.append(f"sort[{i15}].{key}: unknown field")
+                    if 'field' not in v15:
+                        errors.append(f"sort[{i15}].field: required")
+                    if 'field' in v15:
+                        v16 = v15['field']
+                        if v16 is None:
+                            errors.append(f"sort[{i15}].field: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append(f"sort[{i15}].field: expected string")
+                        elif v16 not in _ENUM_33:
+                            errors.append(f"sort[{i15}].field: must be one of {sorted(_ENUM_33)}")
+                    if 'order' in v15:
+                        v17 = v15['order']
+                        if v17 is None:
+                            errors.append(f"sort[{i15}].order: must not be null")
+                        elif not isinstance(v17, str):
+                            errors.append(f"sort[{i15}].order: expected string")
+                        elif v17 not in _ENUM_34:
+                            errors.append(f"sort[{i15}].order: must be one of {sorted(_ENUM_34)}")
+
+
+def _subscriptions_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_35, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'billing_cycle' in body:
+        v0 = body['billing_cycle']
+        if v0 is None:
+            errors.append("billing_cycle: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("billing_cycle: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"billing_cycle.{key}: unknown field")
+            if 'days_in_advance' not in v0:
+                errors.append("billing_cycle.days_in_advance: required")
+            if 'periodicity' not in v0:
+                errors.append("billing_cycle.periodicity: required")
+            if 'days_in_advance' in v0:
+                v1 = v0['days_in_advance']
+                if v1 is None:
+                    errors.append("billing_cycle.days_in_advance: must not be null")
+                elif isinstance(v1, bool) or not isinstance(v1, int):
+                    errors.append("billing_cycle.days_in_advance: expected integer")
+                elif v1 not in (0, 7, 14, 21, 28):
+                    errors.append("billing_cycle.days_in_advance: must be one of [0, 7, 14, 21, 28]")
+            if 'periodicity' in v0:
+                v2 = v0['periodicity']
+                for check3 in (_schema_0, _schema_1, _schema_2,):
+                    branch_errors3: list[str] = []
+                    check3(v2, "billing_cycle.periodicity", branch_errors3)
+                    if not branch_errors3:
+                        break
+                else:
+                    errors.append("billing_cycle.periodicity: does not match any allowed shape")
+    if 'custom_fields' in body:
+        v4 = body['custom_fields']
+        if v4 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v4, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i5, v5 in enumerate(v4):
+                if v5 is None:
+                    errors.append(f"custom_fields[{i5}]: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append(f"custom_fields[{i5}]: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_6, key=str):
+                        errors.append(f"custom_fields[{i5}].{key}: unknown field")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append(f"custom_fields[{i5}].id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"custom_fields[{i5}].id: expected string")
+                    if 'value' in v5:
+                        v7 = v5['value']
+                        for check8 in (_schema_3, _schema_4, _schema_5, _schema_6, _schema_7,):
+                            branch_errors8: list[str] = []
+                            check8(v7, f"custom_fields[{i5}].value", branch_errors8)
+                            if not branch_errors8:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i5}].value: does not match any allowed shape")
+    if 'deal_id' in body:
+        v9 = body['deal_id']
+        if v9 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v9, str):
+            errors.append("deal_id: expected string")
+    if 'department_id' in body:
+        v10 = body['department_id']
+        if v10 is None:
+            errors.append("department_id: must not be null")
+        elif not isinstance(v10, str):
+            errors.append("department_id: expected string")
+    if 'document_template_id' in body:
+        v11 = body['document_template_id']
+        if v11 is None:
+            errors.append("document_template_id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("document_template_id: expected string")
+    if 'ends_on' in body:
+        v12 = body['ends_on']
+        if v12 is None:
+            pass
+        elif not isinstance(v12, str):
+            errors.append("ends_on: expected string")
+    if 'grouped_lines' in body:
+        v13 = body['grouped_lines']
+        if v13 is None:
+            errors.append("grouped_lines: must not be null")
+        elif not isinstance(v13, (list, tuple)):
+            errors.append("grouped_lines: expected array")
+        else:
+            for i14, v14 in enumerate(v13):
+                if v14 is None:
+                    errors.append(f"grouped_lines[{i14}]: must not be null")
+                elif not isinstance(v14, dict):
+                    errors.append(f"grouped_lines[{i14}]: expected object")
+                else:
+                    for key in sorted(v14.keys() - _KEYS_9, key=str):
+                        errors.append(f"grouped_lines[{i14}].{key}: unknown field")
+                    if 'line_items' not in v14:
+                        errors.append(f"grouped_lines[{i14}].line_items: required")
+                    if 'line_items' in v14:
+                        v15 = v14['line_items']
+                        if v15 is None:
+                            errors.append(f"grouped_lines[{i14}].line_items: must not be null")
+                        elif not isinstance(v15, (list, tuple)):
+                            errors.append(f"grouped_lines[{i14}].line_items: expected array")
+                        else:
+                            for i16, v16 in enumerate(v15):
+                                if v16 is None:
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: must not be null")
+                                elif not isinstance(v16, dict):
+                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}]: expected object")
+                                else:
+                                    for key in sorted(v16.keys() - _KEYS_10, key=str):
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].{key}: unknown field")
+                                    if 'description' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: required")
+                                    if 'quantity' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: required")
+                                    if 'tax_rate_id' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: required")
+                                    if 'unit_price' not in v16:
+                                        errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: required")
+                                    if 'description' in v16:
+                                        v17 = v16['description']
+                                        if v17 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: must not be null")
+                                        elif not isinstance(v17, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].description: expected string")
+                                    if 'discount' in v16:
+                                        v18 = v16['discount']
+                                        if v18 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: must not be null")
+                                        elif not isinstance(v18, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount: expected object")
+                                        else:
+                                            for key in sorted(v18.keys() - _KEYS_11, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.{key}: unknown field")
+                                            if 'type' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: required")
+                                            if 'value' not in v18:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: required")
+                                            if 'type' in v18:
+                                                v19 = v18['type']
+                                                if v19 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must not be null")
+                                                elif not isinstance(v19, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: expected string")
+                                                elif v19 not in _ENUM_12:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.type: must be one of {sorted(_ENUM_12)}")
+                                            if 'value' in v18:
+                                                v20 = v18['value']
+                                                if v20 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: must not be null")
+                                                elif isinstance(v20, bool) or not isinstance(v20, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].discount.value: expected number")
+                                    if 'extended_description' in v16:
+                                        v21 = v16['extended_description']
+                                        if v21 is None:
+                                            pass
+                                        elif not isinstance(v21, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].extended_description: expected string")
+                                    if 'product_category_id' in v16:
+                                        v22 = v16['product_category_id']
+                                        if v22 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_category_id: must not be null")
+                                        elif not isinstance(v22, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_category_id: expected string")
+                                    if 'product_id' in v16:
+                                        v23 = v16['product_id']
+                                        if v23 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: must not be null")
+                                        elif not isinstance(v23, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].product_id: expected string")
+                                    if 'quantity' in v16:
+                                        v24 = v16['quantity']
+                                        if v24 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: must not be null")
+                                        elif isinstance(v24, bool) or not isinstance(v24, (int, float)):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].quantity: expected number")
+                                    if 'tax_rate_id' in v16:
+                                        v25 = v16['tax_rate_id']
+                                        if v25 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: must not be null")
+                                        elif not isinstance(v25, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].tax_rate_id: expected string")
+                                    if 'unit_of_measure_id' in v16:
+                                        v26 = v16['unit_of_measure_id']
+                                        if v26 is None:
+                                            pass
+                                        elif not isinstance(v26, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_of_measure_id: expected string")
+                                    if 'unit_price' in v16:
+                                        v27 = v16['unit_price']
+                                        if v27 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: must not be null")
+                                        elif not isinstance(v27, dict):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price: expected object")
+                                        else:
+                                            for key in sorted(v27.keys() - _KEYS_13, key=str):
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.{key}: unknown field")
+                                            if 'amount' not in v27:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: required")
+                                            if 'tax' not in v27:
+                                                errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: required")
+                                            if 'amount' in v27:
+                                                v28 = v27['amount']
+                                                if v28 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: must not be null")
+                                                elif isinstance(v28, bool) or not isinstance(v28, (int, float)):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.amount: expected number")
+                                            if 'tax' in v27:
+                                                v29 = v27['tax']
+                                                if v29 is None:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must not be null")
+                                                elif not isinstance(v29, str):
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: expected string")
+                                                elif v29 not in _ENUM_14:
+                                                    errors.append(f"grouped_lines[{i14}].line_items[{i16}].unit_price.tax: must be one of {sorted(_ENUM_14)}")
+                                    if 'withholding_tax_rate_id' in v16:
+                                        v30 = v16['withholding_tax_rate_id']
+                                        if v30 is None:
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].withholding_tax_rate_id: must not be null")
+                                        elif not isinstance(v30, str):
+                                            errors.append(f"grouped_lines[{i14}].line_items[{i16}].withholding_tax_rate_id: expected string")
+                    if 'section' in v14:
+                        v31 = v14['section']
+                        if v31 is None:
+                            errors.append(f"grouped_lines[{i14}].section: must not be null")
+                        elif not isinstance(v31, dict):
+                            errors.append(f"grouped_lines[{i14}].section: expected object")
+                        else:
+                            for key in sorted(v31.keys() - _KEYS_15, key=str):
+                                errors.append(f"grouped_lines[{i14}].section.{key}: unknown field")
+                            if 'title' in v31:
+                                v32 = v31['title']
+                                if v32 is None:
+                                    errors.append(f"grouped_lines[{i14}].section.title: must not be null")
+                                elif not isinstance(v32, str):
+                                    errors.append(f"grouped_lines[{i14}].section.title: expected string")
+    if 'id' in body:
+        v33 = body['id']
+        if v33 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v33, str):
+            errors.append("id: expected string")
+    if 'invoice_generation' in body:
+        v34 = body['invoice_generation']
+        for check35 in (_schema_13, _schema_14, _schema_15,):
+            branch_errors35: list[str] = []
+            check35(v34, "invoice_generation", branch_errors35)
+            if not branch_errors35:
+                break
+        else:
+            errors.append("invoice_generation: does not match any allowed shape")
+    if 'invoicee' in body:
+        v36 = body['invoicee']
+        if v36 is None:
+            errors.append("invoicee: must not be null")
+        elif not isinstance(v36, dict):
+            errors.append("invoicee: expected object")
+        else:
+            for key in sorted(v36.keys() - _KEYS_21, key=str):
+                errors.append(f"invoicee.{key}: unknown field")
+            if 'customer' not in v36:
+                errors.append("invoicee.customer: required")
+            if 'customer' in v36:
+                v37 = v36['customer']
+                if v37 is None:
+                    errors.append("invoicee.customer: must not be null")
+                elif not isinstance(v37, dict):
+                    errors.append("invoicee.customer: expected object")
+                else:
+                    for key in sorted(v37.keys() - _KEYS_7, key=str):
+                        errors.append(f"invoicee.customer.{key}: unknown field")
+                    if 'type' not in v37:
+                        errors.append("invoicee.customer.type: required")
+                    if 'id' not in v37:
+                        errors.append("invoicee.customer.id: required")
+                    if 'id' in v37:
+                        v38 = v37['id']
+                        if v38 is None:
+                            errors.append("invoicee.customer.id: must not be null")
+                        elif not isinstance(v38, str):
+                            errors.append("invoicee.customer.id: expected string")
+                    if 'type' in v37:
+                        v39 = v37['type']
+                        if v39 is None:
+                            errors.append("invoicee.customer.type: must not be null")
+                        elif not isinstance(v39, str):
+                            errors.append("invoicee.customer.type: expected string")
+                        elif v39 not in _ENUM_22:
+                            errors.append(f"invoicee.customer.type: must be one of {sorted(_ENUM_22)}")
+            if 'for_attention_of' in v36:
+                v40 = v36['for_attention_of']
+                for check41 in (_schema_11, _schema_12,):
+                    branch_errors41: list[str] = []
+                    check41(v40, "invoicee.for_attention_of", branch_errors41)
+                    if not branch_errors41:
+                        break
+                else:
+                    errors.append("invoicee.for_attention_of: does not match any allowed shape")
+    if 'note' in body:
+        v42 = body['note']
+        if v42 is None:
+            pass
+        elif not isinstance(v42, str):
+            errors.append("note: expected string")
+    if 'payment_term' in body:
+        v43 = body['payment_term']
+        if v43 is None:
+            pass
+        elif not isinstance(v43, dict):
+            errors.append("payment_term: expected object")
+        else:
+            for key in sorted(v43.keys() - _KEYS_25, key=str):
+                errors.append(f"payment_term.{key}: unknown field")
+            if 'days' in v43:
+                v44 = v43['days']
+                if v44 is None:
+                    errors.append("payment_term.days: must not be null")
+                elif isinstance(v44, bool) or not isinstance(v44, (int, float)):
+                    errors.append("payment_term.days: expected number")
+            if 'type' in v43:
+                v45 = v43['type']
+                if v45 is None:
+                    errors.append("payment_term.type: must not be null")
+                elif not isinstance(v45, str):
+                    errors.append("payment_term.type: expected string")
+                elif v45 not in _ENUM_26:
+                    errors.append(f"payment_term.type: must be one of {sorted(_ENUM_26)}")
+    if 'project_id' in body:
+        v46 = body['project_id']
+        if v46 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v46, str):
+            errors.append("project_id: expected string")
+    if 'starts_on' in body:
+        v47 = body['starts_on']
+        if v47 is None:
+            errors.append("starts_on: must not be null")
+        elif not isinstance(v47, str):
+            errors.append("starts_on: expected string")
+    if 'title' in body:
+        v48 = body['title']
+        if v48 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v48, str):
+            errors.append("title: expected string")
+
+
+VALIDATORS = {
+    'subscriptions.create': _subscriptions_create,
+    'subscriptions.deactivate': _subscriptions_deactivate,
+    'subscriptions.info': _subscriptions_info,
+    'subscriptions.list': _subscriptions_list,
+    'subscriptions.update': _subscriptions_update,
+}
+# fmt: on
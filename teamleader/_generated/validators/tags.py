@@ -0,0 +1,82 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'page', 'sort'})
+_KEYS_1 = frozenset({'number', 'size'})
+_KEYS_2 = frozenset({'field', 'order'})
+_ENUM_3 = frozenset({'tag'})
+_ENUM_4 = frozenset({'asc'})
+
+
+def _tags_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'page' in body:
+        v0 = body['page']
+        if v0 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v0:
+                v1 = v0['number']
+                if v1 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v1, bool) or not isinstance(v1, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v0:
+                v2 = v0['size']
+                if v2 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v3 = body['sort']
+        if v3 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"sort[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"sort[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_2, key=str):
+                        errors.append(f"sort[{i4}].{key}: unknown field")
+                    if 'field' not in v4:
+                        errors.append(f"sort[{i4}].field: required")
+                    if 'field' in v4:
+                        v5 = v4['field']
+                        if v5 is None:
+                            errors.append(f"sort[{i4}].field: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"sort[{i4}].field: expected string")
+                        elif v5 not in _ENUM_3:
+                            errors.append(f"sort[{i4}].field: must be one of {sorted(_ENUM_3)}")
+                    if 'order' in v4:
+                        v6 = v4['order']
+                        if v6 is None:
+                            errors.append(f"sort[{i4}].order: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append(f"sort[{i4}].order: expected string")
+                        elif v6 not in _ENUM_4:
+                            errors.append(f"sort[{i4}].order: must be one of {sorted(_ENUM_4)}")
+
+
+VALIDATORS = {
+    'tags.list': _tags_list,
+}
+# fmt: on
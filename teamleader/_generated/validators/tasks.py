@@ -0,0 +1,693 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({
+    'assignee',
+    'custom_fields',
+    'customer',
+    'deal_id',
+    'description',
+    'due_on',
+    'estimated_duration',
+    'milestone_id',
+    'project_id',
+    'ticket_id',
+    'title',
+    'work_type_id',
+})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'team', 'user'})
+_KEYS_4 = frozenset({'id', 'value'})
+_ENUM_5 = frozenset({'company', 'contact', 'product', 'user'})
+_ENUM_6 = frozenset({'company', 'contact'})
+_KEYS_7 = frozenset({'unit', 'value'})
+_ENUM_8 = frozenset({'min'})
+_KEYS_9 = frozenset({'filter', 'page', 'sort'})
+_KEYS_10 = frozenset({
+    'completed',
+    'customer',
+    'due_by',
+    'due_from',
+    'ids',
+    'milestone_id',
+    'scheduled',
+    'term',
+    'user_id',
+})
+_KEYS_11 = frozenset({'number', 'size'})
+_KEYS_12 = frozenset({'field', 'order'})
+_ENUM_13 = frozenset({'name'})
+_ENUM_14 = frozenset({'asc', 'desc'})
+_KEYS_15 = frozenset({'ends_at', 'id', 'starts_at'})
+_KEYS_16 = frozenset({
+    'assignee',
+    'custom_fields',
+    'customer',
+    'deal_id',
+    'description',
+    'due_on',
+    'estimated_duration',
+    'id',
+    'milestone_id',
+    'project_id',
+    'ticket_id',
+    'title',
+    'work_type_id',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_5:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_5)}")
+
+
+def _tasks_complete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _tasks_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'title' not in body:
+        errors.append("title: required")
+    if 'due_on' not in body:
+        errors.append("due_on: required")
+    if 'work_type_id' not in body:
+        errors.append("work_type_id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_3:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_3)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v8 = body['customer']
+        if v8 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v8:
+                errors.append("customer.type: required")
+            if 'id' not in v8:
+                errors.append("customer.id: required")
+            if 'id' in v8:
+                v9 = v8['id']
+                if v9 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v8:
+                v10 = v8['type']
+                if v10 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.type: expected string")
+                elif v10 not in _ENUM_6:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_6)}")
+    if 'deal_id' in body:
+        v11 = body['deal_id']
+        if v11 is None:
+            errors.append("deal_id: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v12 = body['description']
+        if v12 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("description: expected string")
+    if 'due_on' in body:
+        v13 = body['due_on']
+        if v13 is None:
+            errors.append("due_on: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("due_on: expected string")
+    if 'estimated_duration' in body:
+        v14 = body['estimated_duration']
+        if v14 is None:
+            errors.append("estimated_duration: must not be null")
+        elif not isinstance(v14, dict):
+            errors.append("estimated_duration: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_7, key=str):
+                errors.append(f"estimated_duration.{key}: unknown field")
+            if 'unit' in v14:
+                v15 = v14['unit']
+                if v15 is None:
+                    errors.append("estimated_duration.unit: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("estimated_duration.unit: expected string")
+                elif v15 not in _ENUM_8:
+                    errors.append(f"estimated_duration.unit: must be one of {sorted(_ENUM_8)}")
+            if 'value' in v14:
+                v16 = v14['value']
+                if v16 is None:
+                    errors.append("estimated_duration.value: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("estimated_duration.value: expected number")
+    if 'milestone_id' in body:
+        v17 = body['milestone_id']
+        if v17 is None:
+            errors.append("milestone_id: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("milestone_id: expected string")
+    if 'project_id' in body:
+        v18 = body['project_id']
+        if v18 is None:
+            errors.append("project_id: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("project_id: expected string")
+    if 'ticket_id' in body:
+        v19 = body['ticket_id']
+        if v19 is None:
+            errors.append("ticket_id: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("ticket_id: expected string")
+    if 'title' in body:
+        v20 = body['title']
+        if v20 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v20, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v21 = body['work_type_id']
+        if v21 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("work_type_id: expected string")
+
+
+def _tasks_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _tasks_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _tasks_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_10, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'completed' in v0:
+                v1 = v0['completed']
+                if v1 is None:
+                    errors.append("filter.completed: must not be null")
+                elif not isinstance(v1, bool):
+                    errors.append("filter.completed: expected boolean")
+            if 'customer' in v0:
+                v2 = v0['customer']
+                if v2 is None:
+                    errors.append("filter.customer: must not be null")
+                elif not isinstance(v2, dict):
+                    errors.append("filter.customer: expected object")
+                else:
+                    for key in sorted(v2.keys() - _KEYS_2, key=str):
+                        errors.append(f"filter.customer.{key}: unknown field")
+                    if 'type' not in v2:
+                        errors.append("filter.customer.type: required")
+                    if 'id' not in v2:
+                        errors.append("filter.customer.id: required")
+                    if 'id' in v2:
+                        v3 = v2['id']
+                        if v3 is None:
+                            errors.append("filter.customer.id: must not be null")
+                        elif not isinstance(v3, str):
+                            errors.append("filter.customer.id: expected string")
+                    if 'type' in v2:
+                        v4 = v2['type']
+                        if v4 is None:
+                            errors.append("filter.customer.type: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append("filter.customer.type: expected string")
+                        elif v4 not in _ENUM_6:
+                            errors.append(f"filter.customer.type: must be one of {sorted(_ENUM_6)}")
+            if 'due_by' in v0:
+                v5 = v0['due_by']
+                if v5 is None:
+                    errors.append("filter.due_by: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.due_by: expected string")
+            if 'due_from' in v0:
+                v6 = v0['due_from']
+                if v6 is None:
+                    errors.append("filter.due_from: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("filter.due_from: expected string")
+            if 'ids' in v0:
+                v7 = v0['ids']
+                if v7 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v7, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i8, v8 in enumerate(v7):
+                        if v8 is None:
+                            errors.append(f"filter.ids[{i8}]: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"filter.ids[{i8}]: expected string")
+            if 'milestone_id' in v0:
+                v9 = v0['milestone_id']
+                if v9 is None:
+                    errors.append("filter.milestone_id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("filter.milestone_id: expected string")
+            if 'scheduled' in v0:
+                v10 = v0['scheduled']
+                if v10 is None:
+                    errors.append("filter.scheduled: must not be null")
+                elif not isinstance(v10, bool):
+                    errors.append("filter.scheduled: expected boolean")
+            if 'term' in v0:
+                v11 = v0['term']
+                if v11 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v11, str):
+                    errors.append("filter.term: expected string")
+            if 'user_id' in v0:
+                v12 = v0['user_id']
+                if v12 is None:
+                    pass
+                elif not isinstance(v12, str):
+                    errors.append("filter.user_id: expected string")
+    if 'page' in body:
+        v13 = body['page']
+        if v13 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v13, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v13.keys() - _KEYS_11, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v13:
+                v14 = v13['number']
+                if v14 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v14, bool) or not isinstance(v14, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v13:
+                v15 = v13['size']
+                if v15 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v15, bool) or not isinstance(v15, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v16 = body['sort']
+        if v16 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v16, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i17, v17 in enumerate(v16):
+                if v17 is None:
+                    errors.append(f"sort[{i17}]: must not be null")
+                elif not isinstance(v17, dict):
+                    errors.append(f"sort[{i17}]: expected object")
+                else:
+                    for key in sorted(v17.keys() - _KEYS_12, key=str):
+                        errors.append(f"sort[{i17}].{key}: unknown field")
+                    if 'field' not in v17:
+                        errors.append(f"sort[{i17}].field: required")
+                    if 'field' in v17:
+                        v18 = v17['field']
+                        if v18 is None:
+                            errors.append(f"sort[{i17}].field: must not be null")
+                        elif not isinstance(v18, str):
+                            errors.append(f"sort[{i17}].field: expected string")
+                        elif v18 not in _ENUM_13:
+                            errors.append(f"sort[{i17}].field: must be one of {sorted(_ENUM_13)}")
+                    if 'order' in v17:
+                        v19 = v17['order']
+                        if v19 is None:
+                            errors.append(f"sort[{i17}].order: must not be null")
+                        elif not isinstance(v19, str):
+                            errors.append(f"sort[{i17}].order: expected string")
+                        elif v19 not in _ENUM_14:
+                            errors.append(f"sort[{i17}].order: must be one of {sorted(_ENUM_14)}")
+
+
+def _tasks_reopen(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _tasks_schedule(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_15, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'ends_at' not in body:
+        errors.append("ends_at: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'starts_at' not in body:
+        errors.append("starts_at: required")
+    if 'ends_at' in body:
+        v0 = body['ends_at']
+        if v0 is None:
+            errors.append("ends_at: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("ends_at: expected string")
+    if 'id' in body:
+        v1 = body['id']
+        if v1 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("id: expected string")
+    if 'starts_at' in body:
+        v2 = body['starts_at']
+        if v2 is None:
+            errors.append("starts_at: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("starts_at: expected string")
+
+
+def _tasks_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_16, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_3:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_3)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v8 = body['customer']
+        if v8 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v8:
+                errors.append("customer.type: required")
+            if 'id' not in v8:
+                errors.append("customer.id: required")
+            if 'id' in v8:
+                v9 = v8['id']
+                if v9 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v8:
+                v10 = v8['type']
+                if v10 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.type: expected string")
+                elif v10 not in _ENUM_6:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_6)}")
+    if 'deal_id' in body:
+        v11 = body['deal_id']
+        if v11 is None:
+            pass
+        elif not isinstance(v11, str):
+            errors.append("deal_id: expected string")
+    if 'description' in body:
+        v12 = body['description']
+        if v12 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("description: expected string")
+    if 'due_on' in body:
+        v13 = body['due_on']
+        if v13 is None:
+            errors.append("due_on: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("due_on: expected string")
+    if 'estimated_duration' in body:
+        v14 = body['estimated_duration']
+        if v14 is None:
+            errors.append("estimated_duration: must not be null")
+        elif not isinstance(v14, dict):
+            errors.append("estimated_duration: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_7, key=str):
+                errors.append(f"estimated_duration.{key}: unknown field")
+            if 'unit' in v14:
+                v15 = v14['unit']
+                if v15 is None:
+                    errors.append("estimated_duration.unit: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("estimated_duration.unit: expected string")
+                elif v15 not in _ENUM_8:
+                    errors.append(f"estimated_duration.unit: must be one of {sorted(_ENUM_8)}")
+            if 'value' in v14:
+                v16 = v14['value']
+                if v16 is None:
+                    errors.append("estimated_duration.value: must not be null")
+                elif isinstance(v16, bool) or not isinstance(v16, (int, float)):
+                    errors.append("estimated_duration.value: expected number")
+    if 'id' in body:
+        v17 = body['id']
+        if v17 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v17, str):
+            errors.append("id: expected string")
+    if 'milestone_id' in body:
+        v18 = body['milestone_id']
+        if v18 is None:
+            pass
+        elif not isinstance(v18, str):
+            errors.append("milestone_id: expected string")
+    if 'project_id' in body:
+        v19 = body['project_id']
+        if v19 is None:
+            pass
+        elif not isinstance(v19, str):
+            errors.append("project_id: expected string")
+    if 'ticket_id' in body:
+        v20 = body['ticket_id']
+        if v20 is None:
+            pass
+        elif not isinstance(v20, str):
+            errors.append("ticket_id: expected string")
+    if 'title' in body:
+        v21 = body['title']
+        if v21 is None:
+            errors.append("title: must not be null")
+        elif not isinstance(v21, str):
+            errors.append("title: expected string")
+    if 'work_type_id' in body:
+        v22 = body['work_type_id']
+        if v22 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v22, str):
+            errors.append("work_type_id: expected string")
+
+
+VALIDATORS = {
+    'tasks.complete': _tasks_complete,
+    'tasks.create': _tasks_create,
+    'tasks.delete': _tasks_delete,
+    'tasks.info': _tasks_info,
+    'tasks.list': _tasks_list,
+    'tasks.reopen': _tasks_reopen,
+    'tasks.schedule': _tasks_schedule,
+    'tasks.update': _tasks_update,
+}
+# fmt: on
@@ -0,0 +1,98 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page', 'sort'})
+_KEYS_1 = frozenset({'department_id'})
+_KEYS_2 = frozenset({'number', 'size'})
+_KEYS_3 = frozenset({'field', 'order'})
+_ENUM_4 = frozenset({'department_id', 'description', 'rate'})
+_ENUM_5 = frozenset({'asc', 'desc'})
+
+
+def _taxrates_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'department_id' in v0:
+                v1 = v0['department_id']
+                if v1 is None:
+                    errors.append("filter.department_id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.department_id: expected string")
+    if 'page' in body:
+        v2 = body['page']
+        if v2 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v2, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v2.keys() - _KEYS_2, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v2:
+                v3 = v2['number']
+                if v3 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v3, bool) or not isinstance(v3, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v2:
+                v4 = v2['size']
+                if v4 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v4, bool) or not isinstance(v4, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v5 = body['sort']
+        if v5 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v5, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i6, v6 in enumerate(v5):
+                if v6 is None:
+                    errors.append(f"sort[{i6}]: must not be null")
+                elif not isinstance(v6, dict):
+                    errors.append(f"sort[{i6}]: expected object")
+                else:
+                    for key in sorted(v6.keys() - _KEYS_3, key=str):
+                        errors.append(f"sort[{i6}].{key}: unknown field")
+                    if 'field' not in v6:
+                        errors.append(f"sort[{i6}].field: required")
+                    if 'field' in v6:
+                        v7 = v6['field']
+                        if v7 is None:
+                            errors.append(f"sort[{i6}].field: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"sort[{i6}].field: expected string")
+                        elif v7 not in _ENUM_4:
+                            errors.append(f"sort[{i6}].field: must be one of {sorted(_ENUM_4)}")
+                    if 'order' in v6:
+                        v8 = v6['order']
+                        if v8 is None:
+                            errors.append(f"sort[{i6}].order: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"sort[{i6}].order: expected string")
+                        elif v8 not in _ENUM_5:
+                            errors.append(f"sort[{i6}].order: must be one of {sorted(_ENUM_5)}")
+
+
+VALIDATORS = {
+    'taxRates.list': _taxrates_list,
+}
+# fmt: on
@@ -0,0 +1,94 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'sort'})
+_KEYS_1 = frozenset({'ids', 'team_lead_id', 'term'})
+_KEYS_2 = frozenset({'field', 'order'})
+_ENUM_3 = frozenset({'name'})
+_ENUM_4 = frozenset({'asc', 'desc'})
+
+
+def _teams_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'team_lead_id' in v0:
+                v3 = v0['team_lead_id']
+                if v3 is None:
+                    errors.append("filter.team_lead_id: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("filter.team_lead_id: expected string")
+            if 'term' in v0:
+                v4 = v0['term']
+                if v4 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("filter.term: expected string")
+    if 'sort' in body:
+        v5 = body['sort']
+        if v5 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v5, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i6, v6 in enumerate(v5):
+                if v6 is None:
+                    errors.append(f"sort[{i6}]: must not be null")
+                elif not isinstance(v6, dict):
+                    errors.append(f"sort[{i6}]: expected object")
+                else:
+                    for key in sorted(v6.keys() - _KEYS_2, key=str):
+                        errors.append(f"sort[{i6}].{key}: unknown field")
+                    if 'field' not in v6:
+                        errors.append(f"sort[{i6}].field: required")
+                    if 'field' in v6:
+                        v7 = v6['field']
+                        if v7 is None:
+                            errors.append(f"sort[{i6}].field: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"sort[{i6}].field: expected string")
+                        elif v7 not in _ENUM_3:
+                            errors.append(f"sort[{i6}].field: must be one of {sorted(_ENUM_3)}")
+                    if 'order' in v6:
+                        v8 = v6['order']
+                        if v8 is None:
+                            errors.append(f"sort[{i6}].order: must not be null")
+                        elif not isinstance(v8, str):
+                            errors.append(f"sort[{i6}].order: expected string")
+                        elif v8 not in _ENUM_4:
+                            errors.append(f"sort[{i6}].order: must be one of {sorted(_ENUM_4)}")
+
+
+VALIDATORS = {
+    'teams.list': _teams_list,
+}
+# fmt: on
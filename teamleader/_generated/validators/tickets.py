@@ -0,0 +1,790 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'attachments', 'body', 'id', 'ticket_status_id'})
+_KEYS_1 = frozenset({
+    'assignee',
+    'custom_fields',
+    'customer',
+    'description',
+    'initial_reply',
+    'milestone_id',
+    'participant',
+    'subject',
+    'ticket_status_id',
+})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'user'})
+_KEYS_4 = frozenset({'id', 'value'})
+_ENUM_5 = frozenset({'company', 'contact', 'product', 'user'})
+_ENUM_6 = frozenset({'company', 'contact'})
+_ENUM_7 = frozenset({'automatic', 'disabled'})
+_KEYS_8 = frozenset({'customer'})
+_ENUM_9 = frozenset({'company'})
+_KEYS_10 = frozenset({'message_id'})
+_KEYS_11 = frozenset({'attachments', 'body', 'id', 'sent_at', 'sent_by'})
+_ENUM_12 = frozenset({'company', 'contact', 'user'})
+_KEYS_13 = frozenset({'id'})
+_KEYS_14 = frozenset({'filter', 'page'})
+_KEYS_15 = frozenset({'exclude', 'ids', 'project_ids', 'relates_to'})
+_KEYS_16 = frozenset({'status_ids'})
+_KEYS_17 = frozenset({'number', 'size'})
+_KEYS_18 = frozenset({'filter', 'id', 'page'})
+_KEYS_19 = frozenset({'created_after', 'created_before', 'type'})
+_ENUM_20 = frozenset({'customer', 'internal', 'thirdParty'})
+_KEYS_21 = frozenset({
+    'assignee',
+    'custom_fields',
+    'customer',
+    'description',
+    'id',
+    'milestone_id',
+    'participant',
+    'subject',
+    'ticket_status_id',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, str):
+        errors.append(f"{path}: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif isinstance(v0, bool) or not isinstance(v0, (int, float)):
+        errors.append(f"{path}: expected number")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, (list, tuple)):
+        errors.append(f"{path}: expected array")
+    else:
+        for i1, v1 in enumerate(v0):
+            if v1 is None:
+                errors.append(f"{path}[{i1}]: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}[{i1}]: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, bool):
+        errors.append(f"{path}: expected boolean")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_2, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'id' in v0:
+            v1 = v0['id']
+            if v1 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.id: expected string")
+        if 'type' in v0:
+            v2 = v0['type']
+            if v2 is None:
+                errors.append(f"{path}.type: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.type: expected string")
+            elif v2 not in _ENUM_5:
+                errors.append(f"{path}.type: must be one of {sorted(_ENUM_5)}")
+
+
+def _tickets_addinternalmessage(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'body' not in body:
+        errors.append("body: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'body' in body:
+        v2 = body['body']
+        if v2 is None:
+            errors.append("body: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("body: expected string")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+    if 'ticket_status_id' in body:
+        v4 = body['ticket_status_id']
+        if v4 is None:
+            errors.append("ticket_status_id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("ticket_status_id: expected string")
+
+
+def _tickets_addreply(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'body' not in body:
+        errors.append("body: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'body' in body:
+        v2 = body['body']
+        if v2 is None:
+            errors.append("body: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("body: expected string")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+    if 'ticket_status_id' in body:
+        v4 = body['ticket_status_id']
+        if v4 is None:
+            errors.append("ticket_status_id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("ticket_status_id: expected string")
+
+
+def _tickets_create(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'customer' not in body:
+        errors.append("customer: required")
+    if 'subject' not in body:
+        errors.append("subject: required")
+    if 'ticket_status_id' not in body:
+        errors.append("ticket_status_id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            errors.append("assignee: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_3:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_3)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v8 = body['customer']
+        if v8 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v8:
+                errors.append("customer.type: required")
+            if 'id' not in v8:
+                errors.append("customer.id: required")
+            if 'id' in v8:
+                v9 = v8['id']
+                if v9 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v8:
+                v10 = v8['type']
+                if v10 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.type: expected string")
+                elif v10 not in _ENUM_6:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_6)}")
+    if 'description' in body:
+        v11 = body['description']
+        if v11 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("description: expected string")
+    if 'initial_reply' in body:
+        v12 = body['initial_reply']
+        if v12 is None:
+            errors.append("initial_reply: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("initial_reply: expected string")
+        elif v12 not in _ENUM_7:
+            errors.append(f"initial_reply: must be one of {sorted(_ENUM_7)}")
+    if 'milestone_id' in body:
+        v13 = body['milestone_id']
+        if v13 is None:
+            errors.append("milestone_id: must not be null")
+        elif not isinstance(v13, str):
+            errors.append("milestone_id: expected string")
+    if 'participant' in body:
+        v14 = body['participant']
+        if v14 is None:
+            errors.append("participant: must not be null")
+        elif not isinstance(v14, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_8, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'customer' not in v14:
+                errors.append("participant.customer: required")
+            if 'customer' in v14:
+                v15 = v14['customer']
+                if v15 is None:
+                    errors.append("participant.customer: must not be null")
+                elif not isinstance(v15, dict):
+                    errors.append("participant.customer: expected object")
+                else:
+                    for key in sorted(v15.keys() - _KEYS_2, key=str):
+                        errors.append(f"participant.customer.{key}: unknown field")
+                    if 'type' not in v15:
+                        errors.append("participant.customer.type: required")
+                    if 'id' not in v15:
+                        errors.append("participant.customer.id: required")
+                    if 'id' in v15:
+                        v16 = v15['id']
+                        if v16 is None:
+                            errors.append("participant.customer.id: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append("participant.customer.id: expected string")
+                    if 'type' in v15:
+                        v17 = v15['type']
+                        if v17 is None:
+                            errors.append("participant.customer.type: must not be null")
+                        elif not isinstance(v17, str):
+                            errors.append("participant.customer.type: expected string")
+                        elif v17 not in _ENUM_9:
+                            errors.append(f"participant.customer.type: must be one of {sorted(_ENUM_9)}")
+    if 'subject' in body:
+        v18 = body['subject']
+        if v18 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("subject: expected string")
+    if 'ticket_status_id' in body:
+        v19 = body['ticket_status_id']
+        if v19 is None:
+            errors.append("ticket_status_id: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("ticket_status_id: expected string")
+
+
+def _tickets_getmessage(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_10, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'message_id' in body:
+        v0 = body['message_id']
+        if v0 is None:
+            errors.append("message_id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("message_id: expected string")
+
+
+def _tickets_importmessage(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'body' not in body:
+        errors.append("body: required")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'sent_at' not in body:
+        errors.append("sent_at: required")
+    if 'sent_by' not in body:
+        errors.append("sent_by: required")
+    if 'attachments' in body:
+        v0 = body['attachments']
+        if v0 is None:
+            errors.append("attachments: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("attachments: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"attachments[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"attachments[{i1}]: expected string")
+    if 'body' in body:
+        v2 = body['body']
+        if v2 is None:
+            errors.append("body: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("body: expected string")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+    if 'sent_at' in body:
+        v4 = body['sent_at']
+        if v4 is None:
+            errors.append("sent_at: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("sent_at: expected string")
+    if 'sent_by' in body:
+        v5 = body['sent_by']
+        if v5 is None:
+            errors.append("sent_by: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("sent_by: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_2, key=str):
+                errors.append(f"sent_by.{key}: unknown field")
+            if 'id' not in v5:
+                errors.append("sent_by.id: required")
+            if 'type' not in v5:
+                errors.append("sent_by.type: required")
+            if 'id' in v5:
+                v6 = v5['id']
+                if v6 is None:
+                    errors.append("sent_by.id: must not be null")
+                elif not isinstance(v6, str):
+                    errors.append("sent_by.id: expected string")
+            if 'type' in v5:
+                v7 = v5['type']
+                if v7 is None:
+                    errors.append("sent_by.type: must not be null")
+                elif not isinstance(v7, str):
+                    errors.append("sent_by.type: expected string")
+                elif v7 not in _ENUM_12:
+                    errors.append(f"sent_by.type: must be one of {sorted(_ENUM_12)}")
+
+
+def _tickets_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_13, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _tickets_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_14, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_15, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'exclude' in v0:
+                v1 = v0['exclude']
+                if v1 is None:
+                    errors.append("filter.exclude: must not be null")
+                elif not isinstance(v1, dict):
+                    errors.append("filter.exclude: expected object")
+                else:
+                    for key in sorted(v1.keys() - _KEYS_16, key=str):
+                        errors.append(f"filter.exclude.{key}: unknown field")
+                    if 'status_ids' in v1:
+                        v2 = v1['status_ids']
+                        if v2 is None:
+                            errors.append("filter.exclude.status_ids: must not be null")
+                        elif not isinstance(v2, (list, tuple)):
+                            errors.append("filter.exclude.status_ids: expected array")
+                        else:
+                            for i3, v3 in enumerate(v2):
+                                if v3 is None:
+                                    errors.append(f"filter.exclude.status_ids[{i3}]: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.exclude.status_ids[{i3}]: expected string")
+            if 'ids' in v0:
+                v4 = v0['ids']
+                if v4 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v4, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i5, v5 in enumerate(v4):
+                        if v5 is None:
+                            errors.append(f"filter.ids[{i5}]: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"filter.ids[{i5}]: expected string")
+            if 'project_ids' in v0:
+                v6 = v0['project_ids']
+                if v6 is None:
+                    errors.append("filter.project_ids: must not be null")
+                elif not isinstance(v6, (list, tuple)):
+                    errors.append("filter.project_ids: expected array")
+                else:
+                    for i7, v7 in enumerate(v6):
+                        if v7 is None:
+                            errors.append(f"filter.project_ids[{i7}]: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append(f"filter.project_ids[{i7}]: expected string")
+            if 'relates_to' in v0:
+                v8 = v0['relates_to']
+                if v8 is None:
+                    errors.append("filter.relates_to: must not be null")
+                elif not isinstance(v8, dict):
+                    errors.append("filter.relates_to: expected object")
+                else:
+                    for key in sorted(v8.keys() - _KEYS_2, key=str):
+                        errors.append(f"filter.relates_to.{key}: unknown field")
+                    if 'id' not in v8:
+                        errors.append("filter.relates_to.id: required")
+                    if 'type' not in v8:
+                        errors.append("filter.relates_to.type: required")
+                    if 'id' in v8:
+                        v9 = v8['id']
+                        if v9 is None:
+                            errors.append("filter.relates_to.id: must not be null")
+                        elif not isinstance(v9, str):
+                            errors.append("filter.relates_to.id: expected string")
+                    if 'type' in v8:
+                        v10 = v8['type']
+                        if v10 is None:
+                            errors.append("filter.relates_to.type: must not be null")
+                        elif not isinstance(v10, str):
+                            errors.append("filter.relates_to.type: expected string")
+                        elif v10 not in _ENUM_6:
+                            errors.append(f"filter.relates_to.type: must be one of {sorted(_ENUM_6)}")
+    if 'page' in body:
+        v11 = body['page']
+        if v11 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v11, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v11.keys() - _KEYS_17, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v11:
+                v12 = v11['number']
+                if v12 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v12, bool) or not isinstance(v12, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v11:
+                v13 = v11['size']
+                if v13 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v13, bool) or not isinstance(v13, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _tickets_listmessages(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_18, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_19, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'created_after' in v0:
+                v1 = v0['created_after']
+                if v1 is None:
+                    errors.append("filter.created_after: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.created_after: expected string")
+            if 'created_before' in v0:
+                v2 = v0['created_before']
+                if v2 is None:
+                    errors.append("filter.created_before: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.created_before: expected string")
+            if 'type' in v0:
+                v3 = v0['type']
+                if v3 is None:
+                    errors.append("filter.type: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("filter.type: expected string")
+                elif v3 not in _ENUM_20:
+                    errors.append(f"filter.type: must be one of {sorted(_ENUM_20)}")
+    if 'id' in body:
+        v4 = body['id']
+        if v4 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v4, str):
+            errors.append("id: expected string")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_17, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _tickets_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_21, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'assignee' in body:
+        v0 = body['assignee']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, dict):
+            errors.append("assignee: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_2, key=str):
+                errors.append(f"assignee.{key}: unknown field")
+            if 'id' not in v0:
+                errors.append("assignee.id: required")
+            if 'type' not in v0:
+                errors.append("assignee.type: required")
+            if 'id' in v0:
+                v1 = v0['id']
+                if v1 is None:
+                    errors.append("assignee.id: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("assignee.id: expected string")
+            if 'type' in v0:
+                v2 = v0['type']
+                if v2 is None:
+                    errors.append("assignee.type: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("assignee.type: expected string")
+                elif v2 not in _ENUM_3:
+                    errors.append(f"assignee.type: must be one of {sorted(_ENUM_3)}")
+    if 'custom_fields' in body:
+        v3 = body['custom_fields']
+        if v3 is None:
+            errors.append("custom_fields: must not be null")
+        elif not isinstance(v3, (list, tuple)):
+            errors.append("custom_fields: expected array")
+        else:
+            for i4, v4 in enumerate(v3):
+                if v4 is None:
+                    errors.append(f"custom_fields[{i4}]: must not be null")
+                elif not isinstance(v4, dict):
+                    errors.append(f"custom_fields[{i4}]: expected object")
+                else:
+                    for key in sorted(v4.keys() - _KEYS_4, key=str):
+                        errors.append(f"custom_fields[{i4}].{key}: unknown field")
+                    if 'id' in v4:
+                        v5 = v4['id']
+                        if v5 is None:
+                            errors.append(f"custom_fields[{i4}].id: must not be null")
+                        elif not isinstance(v5, str):
+                            errors.append(f"custom_fields[{i4}].id: expected string")
+                    if 'value' in v4:
+                        v6 = v4['value']
+                        for check7 in (_schema_0, _schema_1, _schema_2, _schema_3, _schema_4,):
+                            branch_errors7: list[str] = []
+                            check7(v6, f"custom_fields[{i4}].value", branch_errors7)
+                            if not branch_errors7:
+                                break
+                        else:
+                            errors.append(f"custom_fields[{i4}].value: does not match any allowed shape")
+    if 'customer' in body:
+        v8 = body['customer']
+        if v8 is None:
+            errors.append("customer: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("customer: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_2, key=str):
+                errors.append(f"customer.{key}: unknown field")
+            if 'type' not in v8:
+                errors.append("customer.type: required")
+            if 'id' not in v8:
+                errors.append("customer.id: required")
+            if 'id' in v8:
+                v9 = v8['id']
+                if v9 is None:
+                    errors.append("customer.id: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("customer.id: expected string")
+            if 'type' in v8:
+                v10 = v8['type']
+                if v10 is None:
+                    errors.append("customer.type: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("customer.type: expected string")
+                elif v10 not in _ENUM_6:
+                    errors.append(f"customer.type: must be one of {sorted(_ENUM_6)}")
+    if 'description' in body:
+        v11 = body['description']
+        if v11 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v11, str):
+            errors.append("description: expected string")
+    if 'id' in body:
+        v12 = body['id']
+        if v12 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v12, str):
+            errors.append("id: expected string")
+    if 'milestone_id' in body:
+        v13 = body['milestone_id']
+        if v13 is None:
+            pass
+        elif not isinstance(v13, str):
+            errors.append("milestone_id: expected string")
+    if 'participant' in body:
+        v14 = body['participant']
+        if v14 is None:
+            pass
+        elif not isinstance(v14, dict):
+            errors.append("participant: expected object")
+        else:
+            for key in sorted(v14.keys() - _KEYS_8, key=str):
+                errors.append(f"participant.{key}: unknown field")
+            if 'customer' not in v14:
+                errors.append("participant.customer: required")
+            if 'customer' in v14:
+                v15 = v14['customer']
+                if v15 is None:
+                    pass
+                elif not isinstance(v15, dict):
+                    errors.append("participant.customer: expected object")
+                else:
+                    for key in sorted(v15.keys() - _KEYS_2, key=str):
+                        errors.append(f"participant.customer.{key}: unknown field")
+                    if 'id' not in v15:
+                        errors.append("participant.customer.id: required")
+                    if 'type' not in v15:
+                        errors.append("participant.customer.type: required")
+                    if 'id' in v15:
+                        v16 = v15['id']
+                        if v16 is None:
+                            errors.append("participant.customer.id: must not be null")
+                        elif not isinstance(v16, str):
+                            errors.append("participant.customer.id: expected string")
+                    if 'type' in v15:
+                        v17 = v15['type']
+                        if v17 is None:
+                            errors.append("participant.customer.type: must not be null")
+                        elif not isinstance(v17, str):
+                            errors.append("participant.customer.type: expected string")
+                        elif v17 not in _ENUM_9:
+                            errors.append(f"participant.customer.type: must be one of {sorted(_ENUM_9)}")
+    if 'subject' in body:
+        v18 = body['subject']
+        if v18 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v18, str):
+            errors.append("subject: expected string")
+    if 'ticket_status_id' in body:
+        v19 = body['ticket_status_id']
+        if v19 is None:
+            errors.append("ticket_status_id: must not be null")
+        elif not isinstance(v19, str):
+            errors.append("ticket_status_id: expected string")
+
+
+VALIDATORS = {
+    'tickets.addInternalMessage': _tickets_addinternalmessage,
+    'tickets.addReply': _tickets_addreply,
+    'tickets.create': _tickets_create,
+    'tickets.getMessage': _tickets_getmessage,
+    'tickets.importMessage': _tickets_importmessage,
+    'tickets.info': _tickets_info,
+    'tickets.list': _tickets_list,
+    'tickets.listMessages': _tickets_listmessages,
+    'tickets.update': _tickets_update,
+}
+# fmt: on
@@ -0,0 +1,743 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({
+    'description',
+    'duration',
+    'invoiceable',
+    'started_at',
+    'subject',
+    'user_id',
+    'work_type_id',
+})
+_KEYS_1 = frozenset({'id', 'type'})
+_ENUM_2 = frozenset({
+    'company',
+    'contact',
+    'event',
+    'milestone',
+    'nextgenTask',
+    'ticket',
+    'todo',
+})
+_KEYS_3 = frozenset({
+    'description',
+    'ended_at',
+    'invoiceable',
+    'started_at',
+    'subject',
+    'user_id',
+    'work_type_id',
+})
+_KEYS_4 = frozenset({
+    'description',
+    'duration',
+    'invoiceable',
+    'started_on',
+    'subject',
+    'user_id',
+    'work_type_id',
+})
+_KEYS_5 = frozenset({'id'})
+_KEYS_6 = frozenset({'id', 'includes'})
+_KEYS_7 = frozenset({'filter', 'includes', 'page', 'sort'})
+_KEYS_8 = frozenset({
+    'ended_after',
+    'ended_before',
+    'ids',
+    'relates_to',
+    'started_after',
+    'started_before',
+    'subject',
+    'subject_types',
+    'user_id',
+})
+_ENUM_9 = frozenset({'milestone', 'project'})
+_ENUM_10 = frozenset({'company', 'contact', 'event', 'milestone', 'ticket', 'todo'})
+_KEYS_11 = frozenset({'number', 'size'})
+_KEYS_12 = frozenset({'field', 'order'})
+_ENUM_13 = frozenset({'starts_on'})
+_ENUM_14 = frozenset({'asc', 'desc'})
+_KEYS_15 = frozenset({'id', 'started_at'})
+_KEYS_16 = frozenset({
+    'description',
+    'duration',
+    'id',
+    'invoiceable',
+    'started_at',
+    'subject',
+    'work_type_id',
+})
+_KEYS_17 = frozenset({
+    'description',
+    'duration',
+    'id',
+    'invoiceable',
+    'started_on',
+    'subject',
+    'work_type_id',
+})
+
+
+def _schema_0(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_0, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'duration' not in v0:
+            errors.append(f"{path}.duration: required")
+        if 'started_at' not in v0:
+            errors.append(f"{path}.started_at: required")
+        if 'description' in v0:
+            v1 = v0['description']
+            if v1 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.description: expected string")
+        if 'duration' in v0:
+            v2 = v0['duration']
+            if v2 is None:
+                errors.append(f"{path}.duration: must not be null")
+            elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                errors.append(f"{path}.duration: expected number")
+        if 'invoiceable' in v0:
+            v3 = v0['invoiceable']
+            if v3 is None:
+                errors.append(f"{path}.invoiceable: must not be null")
+            elif not isinstance(v3, bool):
+                errors.append(f"{path}.invoiceable: expected boolean")
+        if 'started_at' in v0:
+            v4 = v0['started_at']
+            if v4 is None:
+                errors.append(f"{path}.started_at: must not be null")
+            elif not isinstance(v4, str):
+                errors.append(f"{path}.started_at: expected string")
+        if 'subject' in v0:
+            v5 = v0['subject']
+            if v5 is None:
+                errors.append(f"{path}.subject: must not be null")
+            elif not isinstance(v5, dict):
+                errors.append(f"{path}.subject: expected object")
+            else:
+                for key in sorted(v5.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.subject.{key}: unknown field")
+                if 'id' not in v5:
+                    errors.append(f"{path}.subject.id: required")
+                if 'type' not in v5:
+                    errors.append(f"{path}.subject.type: required")
+                if 'id' in v5:
+                    v6 = v5['id']
+                    if v6 is None:
+                        errors.append(f"{path}.subject.id: must not be null")
+                    elif not isinstance(v6, str):
+                        errors.append(f"{path}.subject.id: expected string")
+                if 'type' in v5:
+                    v7 = v5['type']
+                    if v7 is None:
+                        errors.append(f"{path}.subject.type: must not be null")
+                    elif not isinstance(v7, str):
+                        errors.append(f"{path}.subject.type: expected string")
+                    elif v7 not in _ENUM_2:
+                        errors.append(f"{path}.subject.type: must be one of {sorted(_ENUM_2)}")
+        if 'user_id' in v0:
+            v8 = v0['user_id']
+            if v8 is None:
+                errors.append(f"{path}.user_id: must not be null")
+            elif not isinstance(v8, str):
+                errors.append(f"{path}.user_id: expected string")
+        if 'work_type_id' in v0:
+            v9 = v0['work_type_id']
+            if v9 is None:
+                errors.append(f"{path}.work_type_id: must not be null")
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.work_type_id: expected string")
+
+
+def _schema_1(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_3, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'ended_at' not in v0:
+            errors.append(f"{path}.ended_at: required")
+        if 'started_at' not in v0:
+            errors.append(f"{path}.started_at: required")
+        if 'description' in v0:
+            v1 = v0['description']
+            if v1 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.description: expected string")
+        if 'ended_at' in v0:
+            v2 = v0['ended_at']
+            if v2 is None:
+                errors.append(f"{path}.ended_at: must not be null")
+            elif not isinstance(v2, str):
+                errors.append(f"{path}.ended_at: expected string")
+        if 'invoiceable' in v0:
+            v3 = v0['invoiceable']
+            if v3 is None:
+                errors.append(f"{path}.invoiceable: must not be null")
+            elif not isinstance(v3, bool):
+                errors.append(f"{path}.invoiceable: expected boolean")
+        if 'started_at' in v0:
+            v4 = v0['started_at']
+            if v4 is None:
+                errors.append(f"{path}.started_at: must not be null")
+            elif not isinstance(v4, str):
+                errors.append(f"{path}.started_at: expected string")
+        if 'subject' in v0:
+            v5 = v0['subject']
+            if v5 is None:
+                errors.append(f"{path}.subject: must not be null")
+            elif not isinstance(v5, dict):
+                errors.append(f"{path}.subject: expected object")
+            else:
+                for key in sorted(v5.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.subject.{key}: unknown field")
+                if 'id' not in v5:
+                    errors.append(f"{path}.subject.id: required")
+                if 'type' not in v5:
+                    errors.append(f"{path}.subject.type: required")
+                if 'id' in v5:
+                    v6 = v5['id']
+                    if v6 is None:
+                        errors.append(f"{path}.subject.id: must not be null")
+                    elif not isinstance(v6, str):
+                        errors.append(f"{path}.subject.id: expected string")
+                if 'type' in v5:
+                    v7 = v5['type']
+                    if v7 is None:
+                        errors.append(f"{path}.subject.type: must not be null")
+                    elif not isinstance(v7, str):
+                        errors.append(f"{path}.subject.type: expected string")
+                    elif v7 not in _ENUM_2:
+                        errors.append(f"{path}.subject.type: must be one of {sorted(_ENUM_2)}")
+        if 'user_id' in v0:
+            v8 = v0['user_id']
+            if v8 is None:
+                errors.append(f"{path}.user_id: must not be null")
+            elif not isinstance(v8, str):
+                errors.append(f"{path}.user_id: expected string")
+        if 'work_type_id' in v0:
+            v9 = v0['work_type_id']
+            if v9 is None:
+                errors.append(f"{path}.work_type_id: must not be null")
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.work_type_id: expected string")
+
+
+def _schema_2(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_4, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'duration' not in v0:
+            errors.append(f"{path}.duration: required")
+        if 'started_on' not in v0:
+            errors.append(f"{path}.started_on: required")
+        if 'description' in v0:
+            v1 = v0['description']
+            if v1 is None:
+                errors.append(f"{path}.description: must not be null")
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.description: expected string")
+        if 'duration' in v0:
+            v2 = v0['duration']
+            if v2 is None:
+                errors.append(f"{path}.duration: must not be null")
+            elif isinstance(v2, bool) or not isinstance(v2, (int, float)):
+                errors.append(f"{path}.duration: expected number")
+        if 'invoiceable' in v0:
+            v3 = v0['invoiceable']
+            if v3 is None:
+                errors.append(f"{path}.invoiceable: must not be null")
+            elif not isinstance(v3, bool):
+                errors.append(f"{path}.invoiceable: expected boolean")
+        if 'started_on' in v0:
+            v4 = v0['started_on']
+            if v4 is None:
+                errors.append(f"{path}.started_on: must not be null")
+            elif not isinstance(v4, str):
+                errors.append(f"{path}.started_on: expected string")
+        if 'subject' in v0:
+            v5 = v0['subject']
+            if v5 is None:
+                errors.append(f"{path}.subject: must not be null")
+            elif not isinstance(v5, dict):
+                errors.append(f"{path}.subject: expected object")
+            else:
+                for key in sorted(v5.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.subject.{key}: unknown field")
+                if 'id' not in v5:
+                    errors.append(f"{path}.subject.id: required")
+                if 'type' not in v5:
+                    errors.append(f"{path}.subject.type: required")
+                if 'id' in v5:
+                    v6 = v5['id']
+                    if v6 is None:
+                        errors.append(f"{path}.subject.id: must not be null")
+                    elif not isinstance(v6, str):
+                        errors.append(f"{path}.subject.id: expected string")
+                if 'type' in v5:
+                    v7 = v5['type']
+                    if v7 is None:
+                        errors.append(f"{path}.subject.type: must not be null")
+                    elif not isinstance(v7, str):
+                        errors.append(f"{path}.subject.type: expected string")
+                    elif v7 not in _ENUM_2:
+                        errors.append(f"{path}.subject.type: must be one of {sorted(_ENUM_2)}")
+        if 'user_id' in v0:
+            v8 = v0['user_id']
+            if v8 is None:
+                errors.append(f"{path}.user_id: must not be null")
+            elif not isinstance(v8, str):
+                errors.append(f"{path}.user_id: expected string")
+        if 'work_type_id' in v0:
+            v9 = v0['work_type_id']
+            if v9 is None:
+                errors.append(f"{path}.work_type_id: must not be null")
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.work_type_id: expected string")
+
+
+def _schema_3(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_16, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'duration' not in v0:
+            errors.append(f"{path}.duration: required")
+        if 'id' not in v0:
+            errors.append(f"{path}.id: required")
+        if 'started_at' not in v0:
+            errors.append(f"{path}.started_at: required")
+        if 'description' in v0:
+            v1 = v0['description']
+            if v1 is None:
+                pass
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.description: expected string")
+        if 'duration' in v0:
+            v2 = v0['duration']
+            if v2 is None:
+                errors.append(f"{path}.duration: must not be null")
+            elif isinstance(v2, bool) or not isinstance(v2, int):
+                errors.append(f"{path}.duration: expected integer")
+        if 'id' in v0:
+            v3 = v0['id']
+            if v3 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v3, str):
+                errors.append(f"{path}.id: expected string")
+        if 'invoiceable' in v0:
+            v4 = v0['invoiceable']
+            if v4 is None:
+                errors.append(f"{path}.invoiceable: must not be null")
+            elif not isinstance(v4, bool):
+                errors.append(f"{path}.invoiceable: expected boolean")
+        if 'started_at' in v0:
+            v5 = v0['started_at']
+            if v5 is None:
+                errors.append(f"{path}.started_at: must not be null")
+            elif not isinstance(v5, str):
+                errors.append(f"{path}.started_at: expected string")
+        if 'subject' in v0:
+            v6 = v0['subject']
+            if v6 is None:
+                pass
+            elif not isinstance(v6, dict):
+                errors.append(f"{path}.subject: expected object")
+            else:
+                for key in sorted(v6.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.subject.{key}: unknown field")
+                if 'id' not in v6:
+                    errors.append(f"{path}.subject.id: required")
+                if 'type' not in v6:
+                    errors.append(f"{path}.subject.type: required")
+                if 'id' in v6:
+                    v7 = v6['id']
+                    if v7 is None:
+                        errors.append(f"{path}.subject.id: must not be null")
+                    elif not isinstance(v7, str):
+                        errors.append(f"{path}.subject.id: expected string")
+                if 'type' in v6:
+                    v8 = v6['type']
+                    if v8 is None:
+                        errors.append(f"{path}.subject.type: must not be null")
+                    elif not isinstance(v8, str):
+                        errors.append(f"{path}.subject.type: expected string")
+                    elif v8 not in _ENUM_10:
+                        errors.append(f"{path}.subject.type: must be one of {sorted(_ENUM_10)}")
+        if 'work_type_id' in v0:
+            v9 = v0['work_type_id']
+            if v9 is None:
+                pass
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.work_type_id: expected string")
+
+
+def _schema_4(v0: Any, path: str, errors: list[str]) -> None:
+    if v0 is None:
+        errors.append(f"{path}: must not be null")
+    elif not isinstance(v0, dict):
+        errors.append(f"{path}: expected object")
+    else:
+        for key in sorted(v0.keys() - _KEYS_17, key=str):
+            errors.append(f"{path}.{key}: unknown field")
+        if 'duration' not in v0:
+            errors.append(f"{path}.duration: required")
+        if 'id' not in v0:
+            errors.append(f"{path}.id: required")
+        if 'started_on' not in v0:
+            errors.append(f"{path}.started_on: required")
+        if 'description' in v0:
+            v1 = v0['description']
+            if v1 is None:
+                pass
+            elif not isinstance(v1, str):
+                errors.append(f"{path}.description: expected string")
+        if 'duration' in v0:
+            v2 = v0['duration']
+            if v2 is None:
+                errors.append(f"{path}.duration: must not be null")
+            elif isinstance(v2, bool) or not isinstance(v2, int):
+                errors.append(f"{path}.duration: expected integer")
+        if 'id' in v0:
+            v3 = v0['id']
+            if v3 is None:
+                errors.append(f"{path}.id: must not be null")
+            elif not isinstance(v3, str):
+                errors.append(f"{path}.id: expected string")
+        if 'invoiceable' in v0:
+            v4 = v0['invoiceable']
+            if v4 is None:
+                errors.append(f"{path}.invoiceable: must not be null")
+            elif not isinstance(v4, bool):
+                errors.append(f"{path}.invoiceable: expected boolean")
+        if 'started_on' in v0:
+            v5 = v0['started_on']
+            if v5 is None:
+                errors.append(f"{path}.started_on: must not be null")
+            elif not isinstance(v5, str):
+                errors.append(f"{path}.started_on: expected string")
+        if 'subject' in v0:
+            v6 = v0['subject']
+            if v6 is None:
+                pass
+            elif not isinstance(v6, dict):
+                errors.append(f"{path}.subject: expected object")
+            else:
+                for key in sorted(v6.keys() - _KEYS_1, key=str):
+                    errors.append(f"{path}.subject.{key}: unknown field")
+                if 'id' not in v6:
+                    errors.append(f"{path}.subject.id: required")
+                if 'type' not in v6:
+                    errors.append(f"{path}.subject.type: required")
+                if 'id' in v6:
+                    v7 = v6['id']
+                    if v7 is None:
+                        errors.append(f"{path}.subject.id: must not be null")
+                    elif not isinstance(v7, str):
+                        errors.append(f"{path}.subject.id: expected string")
+                if 'type' in v6:
+                    v8 = v6['type']
+                    if v8 is None:
+                        errors.append(f"{path}.subject.type: must not be null")
+                    elif not isinstance(v8, str):
+                        errors.append(f"{path}.subject.type: expected string")
+                    elif v8 not in _ENUM_10:
+                        errors.append(f"{path}.subject.type: must be one of {sorted(_ENUM_10)}")
+        if 'work_type_id' in v0:
+            v9 = v0['work_type_id']
+            if v9 is None:
+                pass
+            elif not isinstance(v9, str):
+                errors.append(f"{path}.work_type_id: expected string")
+
+
+def _timetracking_add(body: dict[str, Any], errors: list[str]) -> None:
+    for check0 in (_schema_0, _schema_1, _schema_2,):
+        branch_errors0: list[str] = []
+        check0(body, "", branch_errors0)
+        if not branch_errors0:
+            break
+    else:
+        errors.append("body: does not match any allowed shape")
+
+
+def _timetracking_delete(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_5, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _timetracking_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_6, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _timetracking_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_7, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_8, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ended_after' in v0:
+                v1 = v0['ended_after']
+                if v1 is None:
+                    errors.append("filter.ended_after: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.ended_after: expected string")
+            if 'ended_before' in v0:
+                v2 = v0['ended_before']
+                if v2 is None:
+                    errors.append("filter.ended_before: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.ended_before: expected string")
+            if 'ids' in v0:
+                v3 = v0['ids']
+                if v3 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.ids[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.ids[{i4}]: expected string")
+            if 'relates_to' in v0:
+                v5 = v0['relates_to']
+                if v5 is None:
+                    errors.append("filter.relates_to: must not be null")
+                elif not isinstance(v5, dict):
+                    errors.append("filter.relates_to: expected object")
+                else:
+                    for key in sorted(v5.keys() - _KEYS_1, key=str):
+                        errors.append(f"filter.relates_to.{key}: unknown field")
+                    if 'id' not in v5:
+                        errors.append("filter.relates_to.id: required")
+                    if 'type' not in v5:
+                        errors.append("filter.relates_to.type: required")
+                    if 'id' in v5:
+                        v6 = v5['id']
+                        if v6 is None:
+                            errors.append("filter.relates_to.id: must not be null")
+                        elif not isinstance(v6, str):
+                            errors.append("filter.relates_to.id: expected string")
+                    if 'type' in v5:
+                        v7 = v5['type']
+                        if v7 is None:
+                            errors.append("filter.relates_to.type: must not be null")
+                        elif not isinstance(v7, str):
+                            errors.append("filter.relates_to.type: expected string")
+                        elif v7 not in _ENUM_9:
+                            errors.append(f"filter.relates_to.type: must be one of {sorted(_ENUM_9)}")
+            if 'started_after' in v0:
+                v8 = v0['started_after']
+                if v8 is None:
+                    errors.append("filter.started_after: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("filter.started_after: expected string")
+            if 'started_before' in v0:
+                v9 = v0['started_before']
+                if v9 is None:
+                    errors.append("filter.started_before: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("filter.started_before: expected string")
+            if 'subject' in v0:
+                v10 = v0['subject']
+                if v10 is None:
+                    errors.append("filter.subject: must not be null")
+                elif not isinstance(v10, dict):
+                    errors.append("filter.subject: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_1, key=str):
+                        errors.append(f"filter.subject.{key}: unknown field")
+                    if 'id' not in v10:
+                        errors.append("filter.subject.id: required")
+                    if 'type' not in v10:
+                        errors.append("filter.subject.type: required")
+                    if 'id' in v10:
+                        v11 = v10['id']
+                        if v11 is None:
+                            errors.append("filter.subject.id: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append("filter.subject.id: expected string")
+                    if 'type' in v10:
+                        v12 = v10['type']
+                        if v12 is None:
+                            errors.append("filter.subject.type: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append("filter.subject.type: expected string")
+                        elif v12 not in _ENUM_10:
+                            errors.append(f"filter.subject.type: must be one of {sorted(_ENUM_10)}")
+            if 'subject_types' in v0:
+                v13 = v0['subject_types']
+                if v13 is None:
+                    errors.append("filter.subject_types: must not be null")
+                elif not isinstance(v13, (list, tuple)):
+                    errors.append("filter.subject_types: expected array")
+                else:
+                    for i14, v14 in enumerate(v13):
+                        if v14 is None:
+                            errors.append(f"filter.subject_types[{i14}]: must not be null")
+                        elif not isinstance(v14, str):
+                            errors.append(f"filter.subject_types[{i14}]: expected string")
+                        elif v14 not in _ENUM_10:
+                            errors.append(f"filter.subject_types[{i14}]: must be one of {sorted(_ENUM_10)}")
+            if 'user_id' in v0:
+                v15 = v0['user_id']
+                if v15 is None:
+                    errors.append("filter.user_id: must not be null")
+                elif not isinstance(v15, str):
+                    errors.append("filter.user_id: expected string")
+    if 'includes' in body:
+        v16 = body['includes']
+        if v16 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v16, str):
+            errors.append("includes: expected string")
+    if 'page' in body:
+        v17 = body['page']
+        if v17 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v17, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v17.keys() - _KEYS_11, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v17:
+                v18 = v17['number']
+                if v18 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v18, bool) or not isinstance(v18, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v17:
+                v19 = v17['size']
+                if v19 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v19, bool) or not isinstance(v19, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v20 = body['sort']
+        if v20 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v20, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i21, v21 in enumerate(v20):
+                if v21 is None:
+                    errors.append(f"sort[{i21}]: must not be null")
+                elif not isinstance(v21, dict):
+                    errors.append(f"sort[{i21}]: expected object")
+                else:
+                    for key in sorted(v21.keys() - _KEYS_12, key=str):
+                        errors.append(f"sort[{i21}].{key}: unknown field")
+                    if 'field' not in v21:
+                        errors.append(f"sort[{i21}].field: required")
+                    if 'field' in v21:
+                        v22 = v21['field']
+                        if v22 is None:
+                            errors.append(f"sort[{i21}].field: must not be null")
+                        elif not isinstance(v22, str):
+                            errors.append(f"sort[{i21}].field: expected string")
+                        elif v22 not in _ENUM_13:
+                            errors.append(f"sort[{i21}].field: must be one of {sorted(_ENUM_13)}")
+                    if 'order' in v21:
+                        v23 = v21['order']
+                        if v23 is None:
+                            errors.append(f"sort[{i21}].order: must not be null")
+                        elif not isinstance(v23, str):
+                            errors.append(f"sort[{i21}].order: expected string")
+                        elif v23 not in _ENUM_14:
+                            errors.append(f"sort[{i21}].order: must be one of {sorted(_ENUM_14)}")
+
+
+def _timetracking_resume(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_15, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'started_at' in body:
+        v1 = body['started_at']
+        if v1 is None:
+            errors.append("started_at: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("started_at: expected string")
+
+
+def _timetracking_update(body: dict[str, Any], errors: list[str]) -> None:
+    for check0 in (_schema_3, _schema_4,):
+        branch_errors0: list[str] = []
+        check0(body, "", branch_errors0)
+        if not branch_errors0:
+            break
+    else:
+        errors.append("body: does not match any allowed shape")
+
+
+VALIDATORS = {
+    'timeTracking.add': _timetracking_add,
+    'timeTracking.delete': _timetracking_delete,
+    'timeTracking.info': _timetracking_info,
+    'timeTracking.list': _timetracking_list,
+    'timeTracking.resume': _timetracking_resume,
+    'timeTracking.update': _timetracking_update,
+}
+# fmt: on
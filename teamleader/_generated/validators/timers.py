@@ -0,0 +1,153 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0: frozenset[Any] = frozenset()
+_KEYS_1 = frozenset({
+    'description',
+    'invoiceable',
+    'started_at',
+    'subject',
+    'work_type_id',
+})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'company', 'contact', 'event', 'milestone', 'ticket', 'todo'})
+
+
+def _timers_current(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+def _timers_start(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'description' in body:
+        v0 = body['description']
+        if v0 is None:
+            errors.append("description: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("description: expected string")
+    if 'invoiceable' in body:
+        v1 = body['invoiceable']
+        if v1 is None:
+            errors.append("invoiceable: must not be null")
+        elif not isinstance(v1, bool):
+            errors.append("invoiceable: expected boolean")
+    if 'started_at' in body:
+        v2 = body['started_at']
+        if v2 is None:
+            errors.append("started_at: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("started_at: expected string")
+    if 'subject' in body:
+        v3 = body['subject']
+        if v3 is None:
+            errors.append("subject: must not be null")
+        elif not isinstance(v3, dict):
+            errors.append("subject: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_2, key=str):
+                errors.append(f"subject.{key}: unknown field")
+            if 'id' not in v3:
+                errors.append("subject.id: required")
+            if 'type' not in v3:
+                errors.append("subject.type: required")
+            if 'id' in v3:
+                v4 = v3['id']
+                if v4 is None:
+                    errors.append("subject.id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("subject.id: expected string")
+            if 'type' in v3:
+                v5 = v3['type']
+                if v5 is None:
+                    errors.append("subject.type: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("subject.type: expected string")
+                elif v5 not in _ENUM_3:
+                    errors.append(f"subject.type: must be one of {sorted(_ENUM_3)}")
+    if 'work_type_id' in body:
+        v6 = body['work_type_id']
+        if v6 is None:
+            errors.append("work_type_id: must not be null")
+        elif not isinstance(v6, str):
+            errors.append("work_type_id: expected string")
+
+
+def _timers_stop(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+def _timers_update(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'description' in body:
+        v0 = body['description']
+        if v0 is None:
+            pass
+        elif not isinstance(v0, str):
+            errors.append("description: expected string")
+    if 'invoiceable' in body:
+        v1 = body['invoiceable']
+        if v1 is None:
+            errors.append("invoiceable: must not be null")
+        elif not isinstance(v1, bool):
+            errors.append("invoiceable: expected boolean")
+    if 'started_at' in body:
+        v2 = body['started_at']
+        if v2 is None:
+            errors.append("started_at: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("started_at: expected string")
+    if 'subject' in body:
+        v3 = body['subject']
+        if v3 is None:
+            pass
+        elif not isinstance(v3, dict):
+            errors.append("subject: expected object")
+        else:
+            for key in sorted(v3.keys() - _KEYS_2, key=str):
+                errors.append(f"subject.{key}: unknown field")
+            if 'id' not in v3:
+                errors.append("subject.id: required")
+            if 'type' not in v3:
+                errors.append("subject.type: required")
+            if 'id' in v3:
+                v4 = v3['id']
+                if v4 is None:
+                    errors.append("subject.id: must not be null")
+                elif not isinstance(v4, str):
+                    errors.append("subject.id: expected string")
+            if 'type' in v3:
+                v5 = v3['type']
+                if v5 is None:
+                    errors.append("subject.type: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("subject.type: expected string")
+                elif v5 not in _ENUM_3:
+                    errors.append(f"subject.type: must be one of {sorted(_ENUM_3)}")
+    if 'work_type_id' in body:
+        v6 = body['work_type_id']
+        if v6 is None:
+            pass
+        elif not isinstance(v6, str):
+            errors.append("work_type_id: expected string")
+
+
+VALIDATORS = {
+    'timers.current': _timers_current,
+    'timers.start': _timers_start,
+    'timers.stop': _timers_stop,
+    'timers.update': _timers_update,
+}
+# fmt: on
@@ -0,0 +1,207 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page', 'period'})
+_KEYS_1 = frozenset({'assignees'})
+_KEYS_2 = frozenset({'id', 'type'})
+_ENUM_3 = frozenset({'team', 'user'})
+_KEYS_4 = frozenset({'number', 'size'})
+_KEYS_5 = frozenset({'end_date', 'start_date'})
+
+
+def _useravailability_daily(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'period' not in body:
+        errors.append("period: required")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'assignees' in v0:
+                v1 = v0['assignees']
+                if v1 is None:
+                    errors.append("filter.assignees: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.assignees: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.assignees[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.assignees[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_2, key=str):
+                                errors.append(f"filter.assignees[{i2}].{key}: unknown field")
+                            if 'id' not in v2:
+                                errors.append(f"filter.assignees[{i2}].id: required")
+                            if 'type' not in v2:
+                                errors.append(f"filter.assignees[{i2}].type: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.assignees[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.assignees[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.assignees[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.assignees[{i2}].type: expected string")
+                                elif v4 not in _ENUM_3:
+                                    errors.append(f"filter.assignees[{i2}].type: must be one of {sorted(_ENUM_3)}")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_4, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'period' in body:
+        v8 = body['period']
+        if v8 is None:
+            errors.append("period: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("period: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_5, key=str):
+                errors.append(f"period.{key}: unknown field")
+            if 'end_date' in v8:
+                v9 = v8['end_date']
+                if v9 is None:
+                    errors.append("period.end_date: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("period.end_date: expected string")
+            if 'start_date' in v8:
+                v10 = v8['start_date']
+                if v10 is None:
+                    errors.append("period.start_date: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("period.start_date: expected string")
+
+
+def _useravailability_total(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'period' not in body:
+        errors.append("period: required")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'assignees' in v0:
+                v1 = v0['assignees']
+                if v1 is None:
+                    errors.append("filter.assignees: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.assignees: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.assignees[{i2}]: must not be null")
+                        elif not isinstance(v2, dict):
+                            errors.append(f"filter.assignees[{i2}]: expected object")
+                        else:
+                            for key in sorted(v2.keys() - _KEYS_2, key=str):
+                                errors.append(f"filter.assignees[{i2}].{key}: unknown field")
+                            if 'id' not in v2:
+                                errors.append(f"filter.assignees[{i2}].id: required")
+                            if 'type' not in v2:
+                                errors.append(f"filter.assignees[{i2}].type: required")
+                            if 'id' in v2:
+                                v3 = v2['id']
+                                if v3 is None:
+                                    errors.append(f"filter.assignees[{i2}].id: must not be null")
+                                elif not isinstance(v3, str):
+                                    errors.append(f"filter.assignees[{i2}].id: expected string")
+                            if 'type' in v2:
+                                v4 = v2['type']
+                                if v4 is None:
+                                    errors.append(f"filter.assignees[{i2}].type: must not be null")
+                                elif not isinstance(v4, str):
+                                    errors.append(f"filter.assignees[{i2}].type: expected string")
+                                elif v4 not in _ENUM_3:
+                                    errors.append(f"filter.assignees[{i2}].type: must be one of {sorted(_ENUM_3)}")
+    if 'page' in body:
+        v5 = body['page']
+        if v5 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v5, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v5.keys() - _KEYS_4, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v5:
+                v6 = v5['number']
+                if v6 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v5:
+                v7 = v5['size']
+                if v7 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'period' in body:
+        v8 = body['period']
+        if v8 is None:
+            errors.append("period: must not be null")
+        elif not isinstance(v8, dict):
+            errors.append("period: expected object")
+        else:
+            for key in sorted(v8.keys() - _KEYS_5, key=str):
+                errors.append(f"period.{key}: unknown field")
+            if 'end_date' in v8:
+                v9 = v8['end_date']
+                if v9 is None:
+                    errors.append("period.end_date: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("period.end_date: expected string")
+            if 'start_date' in v8:
+                v10 = v8['start_date']
+                if v10 is None:
+                    errors.append("period.start_date: must not be null")
+                elif not isinstance(v10, str):
+                    errors.append("period.start_date: expected string")
+
+
+VALIDATORS = {
+    'userAvailability.daily': _useravailability_daily,
+    'userAvailability.total': _useravailability_total,
+}
+# fmt: on
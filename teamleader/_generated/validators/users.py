@@ -0,0 +1,226 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'id'})
+_KEYS_1 = frozenset({'id', 'includes'})
+_KEYS_2 = frozenset({'filter', 'page', 'sort'})
+_KEYS_3 = frozenset({'ids', 'status', 'term'})
+_ENUM_4 = frozenset({'active', 'deactivated'})
+_KEYS_5 = frozenset({'number', 'size'})
+_KEYS_6 = frozenset({'field', 'order'})
+_ENUM_7 = frozenset({'email', 'first_name', 'function', 'last_name'})
+_ENUM_8 = frozenset({'asc', 'desc'})
+_KEYS_9 = frozenset({'filter', 'id', 'page'})
+_KEYS_10 = frozenset({'ends_before', 'starts_after'})
+_KEYS_11: frozenset[Any] = frozenset()
+
+
+def _users_getweekschedule(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+
+
+def _users_info(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'id' in body:
+        v0 = body['id']
+        if v0 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v0, str):
+            errors.append("id: expected string")
+    if 'includes' in body:
+        v1 = body['includes']
+        if v1 is None:
+            errors.append("includes: must not be null")
+        elif not isinstance(v1, str):
+            errors.append("includes: expected string")
+
+
+def _users_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_2, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_3, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'status' in v0:
+                v3 = v0['status']
+                if v3 is None:
+                    errors.append("filter.status: must not be null")
+                elif not isinstance(v3, (list, tuple)):
+                    errors.append("filter.status: expected array")
+                else:
+                    for i4, v4 in enumerate(v3):
+                        if v4 is None:
+                            errors.append(f"filter.status[{i4}]: must not be null")
+                        elif not isinstance(v4, str):
+                            errors.append(f"filter.status[{i4}]: expected string")
+                        elif v4 not in _ENUM_4:
+                            errors.append(f"filter.status[{i4}]: must be one of {sorted(_ENUM_4)}")
+            if 'term' in v0:
+                v5 = v0['term']
+                if v5 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v5, str):
+                    errors.append("filter.term: expected string")
+    if 'page' in body:
+        v6 = body['page']
+        if v6 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v6, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v6.keys() - _KEYS_5, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v6:
+                v7 = v6['number']
+                if v7 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v7, bool) or not isinstance(v7, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v6:
+                v8 = v6['size']
+                if v8 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v8, bool) or not isinstance(v8, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v9 = body['sort']
+        if v9 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v9, (list, tuple)):
+            errors.append("sort: expected array")
+        else:
+            for i10, v10 in enumerate(v9):
+                if v10 is None:
+                    errors.append(f"sort[{i10}]: must not be null")
+                elif not isinstance(v10, dict):
+                    errors.append(f"sort[{i10}]: expected object")
+                else:
+                    for key in sorted(v10.keys() - _KEYS_6, key=str):
+                        errors.append(f"sort[{i10}].{key}: unknown field")
+                    if 'field' not in v10:
+                        errors.append(f"sort[{i10}].field: required")
+                    if 'field' in v10:
+                        v11 = v10['field']
+                        if v11 is None:
+                            errors.append(f"sort[{i10}].field: must not be null")
+                        elif not isinstance(v11, str):
+                            errors.append(f"sort[{i10}].field: expected string")
+                        elif v11 not in _ENUM_7:
+                            errors.append(f"sort[{i10}].field: must be one of {sorted(_ENUM_7)}")
+                    if 'order' in v10:
+                        v12 = v10['order']
+                        if v12 is None:
+                            errors.append(f"sort[{i10}].order: must not be null")
+                        elif not isinstance(v12, str):
+                            errors.append(f"sort[{i10}].order: expected string")
+                        elif v12 not in _ENUM_8:
+                            errors.append(f"sort[{i10}].order: must be one of {sorted(_ENUM_8)}")
+
+
+def _users_listdaysoff(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_9, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'id' not in body:
+        errors.append("id: required")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_10, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ends_before' in v0:
+                v1 = v0['ends_before']
+                if v1 is None:
+                    errors.append("filter.ends_before: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append("filter.ends_before: expected string")
+            if 'starts_after' in v0:
+                v2 = v0['starts_after']
+                if v2 is None:
+                    errors.append("filter.starts_after: must not be null")
+                elif not isinstance(v2, str):
+                    errors.append("filter.starts_after: expected string")
+    if 'id' in body:
+        v3 = body['id']
+        if v3 is None:
+            errors.append("id: must not be null")
+        elif not isinstance(v3, str):
+            errors.append("id: expected string")
+    if 'page' in body:
+        v4 = body['page']
+        if v4 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_5, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v4:
+                v5 = v4['number']
+                if v5 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v4:
+                v6 = v4['size']
+                if v6 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.size: expected number")
+
+
+def _users_me(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_11, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+VALIDATORS = {
+    'users.getWeekSchedule': _users_getweekschedule,
+    'users.info': _users_info,
+    'users.list': _users_list,
+    'users.listDaysOff': _users_listdaysoff,
+    'users.me': _users_me,
+}
+# fmt: on
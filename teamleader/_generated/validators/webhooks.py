@@ -0,0 +1,182 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-19T00:01:54Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0: frozenset[Any] = frozenset()
+_KEYS_1 = frozenset({'types', 'url'})
+_ENUM_2 = frozenset({
+    'account.deactivated',
+    'account.deleted',
+    'call.added',
+    'call.completed',
+    'call.deleted',
+    'call.updated',
+    'company.added',
+    'company.deleted',
+    'company.updated',
+    'contact.added',
+    'contact.deleted',
+    'contact.linkedToCompany',
+    'contact.unlinkedFromCompany',
+    'contact.updated',
+    'contact.updatedLinkToCompany',
+    'creditNote.booked',
+    'creditNote.deleted',
+    'creditNote.peppolSubmissionFailed',
+    'creditNote.peppolSubmissionSucceeded',
+    'creditNote.sent',
+    'creditNote.updated',
+    'deal.created',
+    'deal.deleted',
+    'deal.lost',
+    'deal.moved',
+    'deal.updated',
+    'deal.won',
+    'incomingCreditNote.added',
+    'incomingCreditNote.approved',
+    'incomingCreditNote.bookkeepingSubmissionFailed',
+    'incomingCreditNote.bookkeepingSubmissionSucceeded',
+    'incomingCreditNote.deleted',
+    'incomingCreditNote.refused',
+    'incomingCreditNote.updated',
+    'incomingInvoice.added',
+    'incomingInvoice.approved',
+    'incomingInvoice.bookkeepingSubmissionFailed',
+    'incomingInvoice.bookkeepingSubmissionSucceeded',
+    'incomingInvoice.deleted',
+    'incomingInvoice.refused',
+    'incomingInvoice.updated',
+    'invoice.booked',
+    'invoice.deleted',
+    'invoice.drafted',
+    'invoice.paymentRegistered',
+    'invoice.paymentRemoved',
+    'invoice.peppolSubmissionFailed',
+    'invoice.peppolSubmissionSucceeded',
+    'invoice.sent',
+    'invoice.updated',
+    'meeting.completed',
+    'meeting.created',
+    'meeting.deleted',
+    'meeting.updated',
+    'milestone.created',
+    'milestone.updated',
+    'nextgenProject.closed',
+    'nextgenProject.created',
+    'nextgenProject.deleted',
+    'nextgenProject.updated',
+    'nextgenTask.completed',
+    'nextgenTask.created',
+    'nextgenTask.deleted',
+    'nextgenTask.updated',
+    'product.added',
+    'product.deleted',
+    'product.updated',
+    'project.created',
+    'project.deleted',
+    'project.updated',
+    'receipt.added',
+    'receipt.approved',
+    'receipt.bookkeepingSubmissionFailed',
+    'receipt.bookkeepingSubmissionSucceeded',
+    'receipt.deleted',
+    'receipt.refused',
+    'receipt.updated',
+    'subscription.added',
+    'subscription.deactivated',
+    'subscription.deleted',
+    'subscription.updated',
+    'task.completed',
+    'task.created',
+    'task.deleted',
+    'task.updated',
+    'ticket.closed',
+    'ticket.created',
+    'ticket.deleted',
+    'ticket.reopened',
+    'ticket.updated',
+    'ticketMessage.added',
+    'timeTracking.added',
+    'timeTracking.deleted',
+    'timeTracking.updated',
+    'user.deactivated',
+})
+
+
+def _webhooks_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+
+
+def _webhooks_register(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'url' not in body:
+        errors.append("url: required")
+    if 'types' not in body:
+        errors.append("types: required")
+    if 'types' in body:
+        v0 = body['types']
+        if v0 is None:
+            errors.append("types: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("types: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"types[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"types[{i1}]: expected string")
+                elif v1 not in _ENUM_2:
+                    errors.append(f"types[{i1}]: must be one of {sorted(_ENUM_2)}")
+    if 'url' in body:
+        v2 = body['url']
+        if v2 is None:
+            errors.append("url: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("url: expected string")
+
+
+def _webhooks_unregister(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_1, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'url' not in body:
+        errors.append("url: required")
+    if 'types' not in body:
+        errors.append("types: required")
+    if 'types' in body:
+        v0 = body['types']
+        if v0 is None:
+            errors.append("types: must not be null")
+        elif not isinstance(v0, (list, tuple)):
+            errors.append("types: expected array")
+        else:
+            for i1, v1 in enumerate(v0):
+                if v1 is None:
+                    errors.append(f"types[{i1}]: must not be null")
+                elif not isinstance(v1, str):
+                    errors.append(f"types[{i1}]: expected string")
+                elif v1 not in _ENUM_2:
+                    errors.append(f"types[{i1}]: must be one of {sorted(_ENUM_2)}")
+    if 'url' in body:
+        v2 = body['url']
+        if v2 is None:
+            errors.append("url: must not be null")
+        elif not isinstance(v2, str):
+            errors.append("url: expected string")
+
+
+VALIDATORS = {
+    'webhooks.list': _webhooks_list,
+    'webhooks.register': _webhooks_register,
+    'webhooks.unregister': _webhooks_unregister,
+}
+# fmt: on
@@ -0,0 +1,98 @@
+# ============================================================
+# AUTO-GENERATED — DO NOT EDIT BY HAND
+# Run `python codegen/generate.py` to regenerate.
+# Spec version: 1.112.0
+# Generated at: 2026-10-18T23:42:51Z
+# ============================================================
+
+from __future__ import annotations
+
+from typing import Any
+
+# fmt: off
+_KEYS_0 = frozenset({'filter', 'page', 'sort'})
+_KEYS_1 = frozenset({'ids', 'term'})
+_KEYS_2 = frozenset({'number', 'size'})
+_KEYS_3 = frozenset({'field', 'order'})
+
+
+def _worktypes_list(body: dict[str, Any], errors: list[str]) -> None:
+    for key in sorted(body.keys() - _KEYS_0, key=str):
+        errors.append(f"{key}: unknown field")
+    if 'filter' in body:
+        v0 = body['filter']
+        if v0 is None:
+            errors.append("filter: must not be null")
+        elif not isinstance(v0, dict):
+            errors.append("filter: expected object")
+        else:
+            for key in sorted(v0.keys() - _KEYS_1, key=str):
+                errors.append(f"filter.{key}: unknown field")
+            if 'ids' in v0:
+                v1 = v0['ids']
+                if v1 is None:
+                    errors.append("filter.ids: must not be null")
+                elif not isinstance(v1, (list, tuple)):
+                    errors.append("filter.ids: expected array")
+                else:
+                    for i2, v2 in enumerate(v1):
+                        if v2 is None:
+                            errors.append(f"filter.ids[{i2}]: must not be null")
+                        elif not isinstance(v2, str):
+                            errors.append(f"filter.ids[{i2}]: expected string")
+            if 'term' in v0:
+                v3 = v0['term']
+                if v3 is None:
+                    errors.append("filter.term: must not be null")
+                elif not isinstance(v3, str):
+                    errors.append("filter.term: expected string")
+    if 'page' in body:
+        v4 = body['page']
+        if v4 is None:
+            errors.append("page: must not be null")
+        elif not isinstance(v4, dict):
+            errors.append("page: expected object")
+        else:
+            for key in sorted(v4.keys() - _KEYS_2, key=str):
+                errors.append(f"page.{key}: unknown field")
+            if 'number' in v4:
+                v5 = v4['number']
+                if v5 is None:
+                    errors.append("page.number: must not be null")
+                elif isinstance(v5, bool) or not isinstance(v5, (int, float)):
+                    errors.append("page.number: expected number")
+            if 'size' in v4:
+                v6 = v4['size']
+                if v6 is None:
+                    errors.append("page.size: must not be null")
+                elif isinstance(v6, bool) or not isinstance(v6, (int, float)):
+                    errors.append("page.size: expected number")
+    if 'sort' in body:
+        v7 = body['sort']
+        if v7 is None:
+            errors.append("sort: must not be null")
+        elif not isinstance(v7, dict):
+            errors.append("sort: expected object")
+        else:
+            for key in sorted(v7.keys() - _KEYS_3, key=str):
+                errors.append(f"sort.{key}: unknown field")
+            if 'field' not in v7:
+                errors.append("sort.field: required")
+            if 'field' in v7:
+                v8 = v7['field']
+                if v8 is None:
+                    errors.append("sort.field: must not be null")
+                elif not isinstance(v8, str):
+                    errors.append("sort.field: expected string")
+            if 'order' in v7:
+                v9 = v7['order']
+                if v9 is None:
+                    errors.append("sort.order: must not be null")
+                elif not isinstance(v9, str):
+                    errors.append("sort.order: expected string")
+
+
+VALIDATORS = {
+    'workTypes.list': _worktypes_list,
+}
+# fmt: on
@@ -0,0 +1,157 @@
+"""Asyncio front end for :class:`~teamleader.client.TeamleaderClient`.
+
+Implements:
+- AsyncTeamleaderClient — awaitable :meth:`~AsyncTeamleaderClient.call` and
+  curated resources over one shared :class:`~teamleader.client.TeamleaderClient`
+- AsyncResource         — awaitable resource methods and an async
+  :meth:`~AsyncResource.iterate`
+
+Usage::
+
+    from teamleader.aio import AsyncTeamleaderClient
+
+    aclient = AsyncTeamleaderClient(client)
+    deal = await aclient.deals.get("some-uuid")
+    async for contact in aclient.contacts.iterate(page_size=100):
+        print(contact.full_name)
+
+Each call reads the access token on the event loop with
+:meth:`~teamleader.auth.OAuth2Handler.aget_valid_token` (so backends with
+native async storage, such as the Django ORM, never block the loop), then
+sends the request from a worker thread of a pool sized like the client's
+connection pool.  Many coroutines can therefore share the one pooled client:
+at most *max_workers* requests are in flight, and the others wait their turn
+without holding the event loop or opening extra connections.
+
+Context variables — :func:`teamleader.memo.memoize` blocks, the Django call
+log, tracing spans — are copied into the worker thread, so they see calls
+made through the async client exactly like synchronous ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from teamleader.client import TeamleaderClient, _access_token
+from teamleader.constants import DEFAULT_PAGE_SIZE
+
+T = TypeVar("T")
+
+#: Default number of requests an :class:`AsyncTeamleaderClient` sends at once.
+DEFAULT_MAX_WORKERS = 10
+
+
+class AsyncTeamleaderClient:
+    """Awaitable API over a :class:`~teamleader.client.TeamleaderClient`.
+
+    Parameters
+    ----------
+    client:
+        The synchronous client whose transport, hooks, codec and token
+        handler are used.  It stays usable from synchronous code.
+    max_workers:
+        Requests sent at once.  Match it to the transport's connection pool
+        size so every in-flight request can reuse a pooled connection.
+        Defaults to :data:`DEFAULT_MAX_WORKERS`.
+    """
+
+    def __init__(
+        self, client: TeamleaderClient, *, max_workers: int | None = None
+    ) -> None:
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_MAX_WORKERS,
+            thread_name_prefix="teamleader-async",
+        )
+        self.contacts = AsyncResource(self, client.contacts)
+        self.companies = AsyncResource(self, client.companies)
+        self.deals = AsyncResource(self, client.deals)
+        self.invoices = AsyncResource(self, client.invoices)
+        self.quotations = AsyncResource(self, client.quotations)
+
+    async def call(self, operation_id: str, **kwargs: Any) -> dict[str, Any]:
+        """Async :meth:`~teamleader.client.TeamleaderClient.call`."""
+        return await self.run(self.client.call, operation_id, **kwargs)
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run ``fn(*args, **kwargs)`` — any method of :attr:`client` or its
+        resources — in a worker thread with a valid access token.
+
+        The token is fetched here, on the event loop; requests *fn* makes in
+        the worker thread use it instead of reading the token backend.
+        """
+        client = self.client
+        token = await client._auth.aget_valid_token(
+            on_refresh=client._emit_token_refresh if client.hooks else None
+        )
+        context = contextvars.copy_context()
+        context.run(_access_token.set, token)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(context.run, fn, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Stop the worker threads and close :attr:`client`.
+
+        Requests already queued are still sent.
+        """
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+
+class AsyncResource:
+    """Awaitable counterpart of one curated resource, e.g. ``client.deals``.
+
+    Every public method of the wrapped resource — ``get``, ``list``,
+    ``create``, ``update``, ``delete`` and resource-specific ones such as
+    ``deals.win`` — is available as a coroutine function with the same
+    parameters.  :meth:`iterate` is an async iterator.
+    """
+
+    def __init__(self, aclient: AsyncTeamleaderClient, resource: Any) -> None:
+        self._aclient = aclient
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self._resource, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._aclient.run(method, *args, **kwargs)
+
+        # Cache on the instance so the wrapper is built once per method.
+        setattr(self, name, call)
+        return call
+
+    async def iterate(
+        self, page_size: int = DEFAULT_PAGE_SIZE, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Yield every matching object, one awaited page request at a time.
+
+        Same parameters as the resource's ``iterate()``; ``stream`` is not
+        supported.
+        """
+        resource = self._resource
+        run = self._aclient.run
+        pages = 0
+        try:
+            page = await run(resource.list, page=1, page_size=page_size, **kwargs)
+            pages += 1
+            while True:
+                for item in page.data:
+                    yield item
+                if not page.has_next:
+                    break
+                page = await run(page.next)
+                pages += 1
+        finally:
+            client = self._aclient.client
+            client._emit_iterate_finished(resource._path("list"), pages)
@@ -4,26 +4,35 @@ Implements:
 - Token          — dataclass holding an access/refresh token pair + expiry
 - TokenBackend   — abstract storage interface
 - MemoryTokenBackend — in-process backend for tests and non-Django use
+- FileTokenBackend   — JSON file shared by the processes on one host
 - OAuth2Handler  — full OAuth2 lifecycle (authorize → exchange → refresh)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
 import urllib.parse
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
-import requests
-
 from teamleader.constants import (
     AUTHORIZATION_URL,
     TOKEN_EXPIRY_MARGIN_SECONDS,
     TOKEN_URL,
 )
 from teamleader.exceptions import TeamleaderAuthError, TeamleaderAuthExpiredError
-
+from teamleader.hooks import TokenRefreshEvent
+from teamleader.transport import RequestsTransport, Transport
 
 # ---------------------------------------------------------------------------
 # Token dataclass
@@ -76,6 +85,29 @@ class TokenBackend(ABC):
     def clear(self) -> None:
         """Delete any stored token."""
 
+    async def aget(self) -> Token | None:
+        """Async :meth:`get`; runs it in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.get)
+
+    async def asave(self, token: Token) -> None:
+        """Async :meth:`save`; runs it in a worker thread unless overridden."""
+        await asyncio.to_thread(self.save, token)
+
+    async def aclear(self) -> None:
+        """Async :meth:`clear`; runs it in a worker thread unless overridden."""
+        await asyncio.to_thread(self.clear)
+
+    def refresh_lock(self) -> AbstractContextManager[object]:
+        """Return a context manager held while the token is refreshed.
+
+        :class:`OAuth2Handler` re-reads the token inside it and only calls
+        the token endpoint if it is still expired, so backends shared by
+        several workers should return a lock that excludes the others —
+        Teamleader rotates the refresh token, and a second refresh with the
+        old one fails.  The default does not lock.
+        """
+        return nullcontext()
+
 
 # ---------------------------------------------------------------------------
 # MemoryTokenBackend — in-process implementation
@@ -97,6 +129,132 @@ class MemoryTokenBackend(TokenBackend):
     def clear(self) -> None:
         self._token = None
 
+    async def aget(self) -> Token | None:
+        return self._token
+
+    async def asave(self, token: Token) -> None:
+        self._token = token
+
+    async def aclear(self) -> None:
+        self._token = None
+
+
+# ---------------------------------------------------------------------------
+# FileTokenBackend — shared by the processes on one host
+# ---------------------------------------------------------------------------
+
+
+class FileTokenBackend(TokenBackend):
+    """Token stored as JSON in a file, for several processes on one host.
+
+    :meth:`save` writes a temporary file next to *path* and renames it over
+    *path*, so readers see either the old or the new token, never a partial
+    one.  :meth:`get` keeps the last token read in memory together with the
+    file's inode, mtime and size: while those are unchanged a read costs one
+    :func:`os.stat`.  Every save creates a new inode, so a token written by
+    another process is picked up on the next read.
+
+    :meth:`refresh_lock` takes an exclusive :func:`fcntl.flock` on
+    ``<path>.lock``, so only one process (or thread) refreshes the token at
+    a time; the others wait and reuse the token it saved.  The lock is
+    released by the kernel if its holder dies.  On platforms without
+    :mod:`fcntl` (Windows) refreshes are not serialised.
+
+    Parameters
+    ----------
+    path:
+        Token file; its directory must exist.  Created on the first save.
+    mode:
+        Permission bits of the token file and the lock file (default
+        ``0o600``: the file holds credentials).
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, mode: int = 0o600) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._cached: tuple[tuple[int, int, int], Token] | None = None
+
+    @staticmethod
+    def _identity(st: os.stat_result) -> tuple[int, int, int]:
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def get(self) -> Token | None:
+        """Return the token, re-reading the file only if it was replaced."""
+        try:
+            identity = self._identity(os.stat(self.path))
+        except FileNotFoundError:
+            return None
+        cached = self._cached
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        try:
+            with open(self.path, "rb") as fh:
+                # Identify what was actually opened; the path may have been
+                # replaced again since the stat() above.
+                identity = self._identity(os.fstat(fh.fileno()))
+                data = json.loads(fh.read())
+        except FileNotFoundError:
+            return None
+        token = Token(
+            access_token=data["access_token"],
+            refresh_token=data["refresh_token"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+        )
+        with self._lock:
+            self._cached = (identity, token)
+        return token
+
+    def save(self, token: Token) -> None:
+        """Atomically replace the token file with *token*."""
+        payload = json.dumps(
+            {
+                "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
+                "expires_at": token.expires_at.isoformat(),
+            }
+        ).encode()
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, self.mode)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+                identity = self._identity(os.fstat(fh.fileno()))
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._cached = (identity, token)
+
+    def clear(self) -> None:
+        """Delete the token file."""
+        self.path.unlink(missing_ok=True)
+        with self._lock:
+            self._cached = None
+
+    def refresh_lock(self) -> AbstractContextManager[object]:
+        """Exclusive ``flock`` on ``<path>.lock``, shared by all processes."""
+        return self._flock()
+
+    @contextmanager
+    def _flock(self) -> Iterator[None]:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            yield
+            return
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, self.mode)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
 
 # ---------------------------------------------------------------------------
 # OAuth2Handler
@@ -125,6 +283,9 @@ class OAuth2Handler:
 
         # Step 3 — use in every API call
         access_token = handler.get_valid_token()
+
+    Token requests go through *transport* (a
+    :class:`~teamleader.transport.RequestsTransport` by default).
     """
 
     def __init__(
@@ -134,12 +295,16 @@ class OAuth2Handler:
         redirect_uri: str,
         token_backend: TokenBackend,
         scopes: list[str] | None = None,
+        transport: Transport | None = None,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.token_backend = token_backend
         self.scopes = scopes or []
+        self.transport: Transport = (
+            transport if transport is not None else RequestsTransport()
+        )
 
     # ------------------------------------------------------------------
     # Public interface
@@ -178,9 +343,15 @@ class OAuth2Handler:
         self.token_backend.save(token)
         return token
 
-    def get_valid_token(self) -> str:
+    def get_valid_token(
+        self, *, on_refresh: Callable[[TokenRefreshEvent], None] | None = None
+    ) -> str:
         """Return a valid access token, refreshing if necessary.
 
+        *on_refresh*, if given, is called with a
+        :class:`~teamleader.hooks.TokenRefreshEvent` after every refresh
+        attempt (successful or not).
+
         Raises:
             TeamleaderAuthError: if no token is stored (authorisation has
                 never been performed).
@@ -195,10 +366,48 @@ class OAuth2Handler:
             )
 
         if token.is_expired:
-            token = self._refresh(token)
+            if on_refresh is None:
+                token = self._refresh(token)
+            else:
+                started = time.perf_counter()
+                error: str | None = None
+                try:
+                    token = self._refresh(token)
+                except Exception as exc:
+                    error = type(exc).__name__
+                    raise
+                finally:
+                    on_refresh(
+                        TokenRefreshEvent((time.perf_counter() - started) * 1000, error)
+                    )
 
         return token.access_token
 
+    async def aget_valid_token(
+        self, *, on_refresh: Callable[[TokenRefreshEvent], None] | None = None
+    ) -> str:
+        """Async :meth:`get_valid_token`.
+
+        The stored token is read with the backend's
+        :meth:`~TokenBackend.aget`; only a refresh, which needs the token
+        endpoint and the backend's :meth:`~TokenBackend.refresh_lock`, runs
+        in a worker thread.
+
+        Raises:
+            TeamleaderAuthError: if no token is stored.
+            TeamleaderAuthExpiredError: if the refresh token has been
+                revoked and the user must re-authorise.
+        """
+        token = await self.token_backend.aget()
+        if token is None:
+            raise TeamleaderAuthError(
+                "No token stored. Run `python manage.py teamleader_setup` to "
+                "authorise this application with Teamleader.",
+            )
+        if not token.is_expired:
+            return token.access_token
+        return await asyncio.to_thread(self.get_valid_token, on_refresh=on_refresh)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -206,30 +415,41 @@ class OAuth2Handler:
     def _refresh(self, token: Token) -> Token:
         """Use the refresh token to obtain a new access/refresh token pair.
 
-        Persists the new token via the backend on success.
+        Runs under the backend's :meth:`~TokenBackend.refresh_lock`; if the
+        stored token was already refreshed by someone else, that token is
+        returned without a request.  Persists the new token via the backend
+        on success.
 
         Raises:
             TeamleaderAuthExpiredError: if Teamleader rejects the refresh
                 token (revoked or expired).
         """
-        payload: dict[str, str] = {
-            "grant_type": "refresh_token",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "refresh_token": token.refresh_token,
-        }
-        try:
-            new_token = self._request_token(payload)
-        except TeamleaderAuthError as exc:
-            raise TeamleaderAuthExpiredError(
-                "The Teamleader refresh token has been revoked or has expired. "
-                "Re-authorise by running `python manage.py teamleader_setup`.",
-                status_code=exc.status_code,
-                raw_response=exc.raw_response,
-            ) from exc
-
-        self.token_backend.save(new_token)
-        return new_token
+        with self.token_backend.refresh_lock():
+            # Another worker may have refreshed while we waited for the lock.
+            current = self.token_backend.get()
+            if current is not None and not current.is_expired:
+                return current
+            if current is not None:
+                token = current
+
+            payload: dict[str, str] = {
+                "grant_type": "refresh_token",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": token.refresh_token,
+            }
+            try:
+                new_token = self._request_token(payload)
+            except TeamleaderAuthError as exc:
+                raise TeamleaderAuthExpiredError(
+                    "The Teamleader refresh token has been revoked or has expired. "
+                    "Re-authorise by running `python manage.py teamleader_setup`.",
+                    status_code=exc.status_code,
+                    raw_response=exc.raw_response,
+                ) from exc
+
+            self.token_backend.save(new_token)
+            return new_token
 
     def _request_token(self, payload: dict[str, Any]) -> Token:
         """POST *payload* to TOKEN_URL and parse the response into a Token.
@@ -237,7 +457,7 @@ class OAuth2Handler:
         Raises:
             TeamleaderAuthError: on any non-2xx HTTP response.
         """
-        response = requests.post(TOKEN_URL, data=payload, timeout=30)
+        response = self.transport.request("POST", TOKEN_URL, data=payload, timeout=30)
 
         if not response.ok:
             raise TeamleaderAuthError(
@@ -0,0 +1,370 @@
+"""Record real API traffic to a cassette and replay it offline.
+
+Implements:
+- Interaction            — one recorded request/response pair
+- Cassette               — an ordered list of interactions, saved as JSON
+  Lines (gzip-compressed when the path ends in ``.gz``)
+- RecordingTransport     — a :class:`~teamleader.transport.Transport` that
+  forwards to a real transport and records every exchange, with secrets
+  redacted
+- ReplayTransport        — a transport that answers from a cassette, at full
+  speed or at the recorded timing
+- CassetteMismatchError  — raised on replay when no recorded interaction
+  matches a request
+
+Record once against the real API, with the same transport for the OAuth
+handler so token exchanges are captured too::
+
+    cassette = Cassette()
+    transport = RecordingTransport(cassette)
+    handler = OAuth2Handler(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, backend,
+                            transport=transport)
+    client = TeamleaderClient(handler, transport=transport)
+    invoices = list(client.invoices.iterate(page_size=100))
+    cassette.save("invoices.jsonl.gz")
+
+Then replay it anywhere — no network, no credentials::
+
+    transport = ReplayTransport(Cassette.load("invoices.jsonl.gz"))
+    client = TeamleaderClient(handler, transport=transport)
+    assert len(list(client.invoices.iterate(page_size=100))) == len(invoices)
+
+Requests are matched on method, URL and (redacted, key-sorted) body, so
+every ``iterate()`` page replays its own response regardless of the JSON
+codec in use.  Identical requests get their recorded responses in order;
+with ``cycle=True`` they start over once exhausted, which lets benchmarks
+replay the same traffic any number of times.
+
+Redaction
+---------
+Request headers are never stored, so ``Authorization`` never reaches disk.
+In exchanges with the OAuth token endpoint, the request fields in
+:data:`REDACTED_FORM_KEYS` (``client_secret``, ``code``, ``refresh_token``)
+and the response fields in :data:`REDACTED_TOKEN_KEYS` (``access_token``,
+``refresh_token``) are replaced with ``"REDACTED"``.  Only the response
+headers the client reads are kept (``Content-Type``, ``Retry-After`` and
+``X-RateLimit-*``).  API bodies, business data included, are kept as-is
+(a ``code`` field in a payload too): treat cassettes recorded against
+production like any other export of that data.
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+import requests
+
+from teamleader.constants import TOKEN_URL
+from teamleader.transport import RequestsTransport, Transport, make_response
+
+#: Token-endpoint request fields whose values are replaced before storing.
+REDACTED_FORM_KEYS = frozenset({"client_secret", "code", "refresh_token"})
+
+#: Token-endpoint response fields whose values are replaced before storing.
+REDACTED_TOKEN_KEYS = frozenset({"access_token", "refresh_token"})
+
+REDACTED = "REDACTED"
+
+#: Response headers kept in the cassette (lower-case); ``x-ratelimit-*`` too.
+_KEPT_HEADERS = frozenset({"content-type", "retry-after"})
+
+
+class CassetteMismatchError(LookupError):
+    """A replayed request has no (remaining) recorded interaction."""
+
+
+# ---------------------------------------------------------------------------
+# Cassette
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair.
+
+    Attributes
+    ----------
+    method / url:
+        The request line.
+    body:
+        The redacted request body: decoded JSON for API calls, the form
+        fields for OAuth token requests, ``None`` without a body.
+    status:
+        HTTP status of the response.
+    headers:
+        The kept response headers.
+    content:
+        Response body — text, or base64 when ``binary`` is true.
+    binary:
+        ``True`` when the body was not UTF-8 (e.g. a PDF download).
+    elapsed_ms:
+        Time the real transport took, including reading the body.
+    """
+
+    method: str
+    url: str
+    body: Any
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    content: str = ""
+    binary: bool = False
+    elapsed_ms: float = 0.0
+
+    def response_bytes(self) -> bytes:
+        """The recorded response body as bytes."""
+        if self.binary:
+            return base64.b64decode(self.content)
+        return self.content.encode()
+
+    def key(self) -> tuple[str, str, str]:
+        """``(method, url, body)`` used to match a replayed request."""
+        return _key(self.method, self.url, self.body)
+
+
+class Cassette:
+    """An ordered, thread-safe list of :class:`Interaction`\\ s.
+
+    Parameters
+    ----------
+    interactions:
+        Interactions to start with, e.g. from another cassette.
+    """
+
+    def __init__(self, interactions: Iterable[Interaction] = ()) -> None:
+        self.interactions: list[Interaction] = list(interactions)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __iter__(self) -> Iterator[Interaction]:
+        return iter(self.interactions)
+
+    def append(self, interaction: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: str | Path) -> None:
+        """Write one JSON object per interaction; gzip when *path* ends in ``.gz``."""
+        with _open(Path(path), "wt") as fh:
+            for interaction in self.interactions:
+                fh.write(json.dumps(asdict(interaction), separators=(",", ":")))
+                fh.write("\n")
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Read a cassette written by :meth:`save`."""
+        with _open(Path(path), "rt") as fh:
+            return cls(Interaction(**json.loads(line)) for line in fh if line.strip())
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode.replace("t", ""), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Redaction and matching
+# ---------------------------------------------------------------------------
+
+
+def _redact(value: Any, keys: frozenset[str]) -> Any:
+    """Replace the values of the top-level *keys* of a dict *value*."""
+    if not isinstance(value, dict):
+        return value
+    return {k: REDACTED if k in keys and v else v for k, v in value.items()}
+
+
+def _request_body(url: str, data: bytes | dict[str, Any] | None) -> Any:
+    """Decode a transport ``data`` argument, redacting token requests."""
+    if isinstance(data, dict):
+        body: Any = copy.deepcopy(data)
+    elif not data:
+        return None
+    else:
+        try:
+            body = json.loads(data)
+        except ValueError:
+            return base64.b64encode(data).decode()
+    return _redact(body, REDACTED_FORM_KEYS) if url == TOKEN_URL else body
+
+
+def _key(method: str, url: str, body: Any) -> tuple[str, str, str]:
+    return method.upper(), url, json.dumps(body, sort_keys=True)
+
+
+def _kept_headers(headers: Any) -> dict[str, str]:
+    return {
+        k: v
+        for k, v in headers.items()
+        if k.lower() in _KEPT_HEADERS or k.lower().startswith("x-ratelimit-")
+    }
+
+
+def _response_content(url: str, content: bytes) -> tuple[str, bool]:
+    """Return ``(content, binary)`` for storage, redacting token responses."""
+    try:
+        text = content.decode()
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode(), True
+    if url == TOKEN_URL:
+        try:
+            token = _redact(json.loads(text), REDACTED_TOKEN_KEYS)
+        except ValueError:
+            pass
+        else:
+            text = json.dumps(token, separators=(",", ":"))
+    return text, False
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+
+class RecordingTransport(Transport):
+    """Forwards requests to *transport* and appends each exchange to *cassette*.
+
+    Streamed responses are read in full before they are returned — the
+    client still iterates them in chunks, but recording gives up the memory
+    bound of streaming.
+
+    Parameters
+    ----------
+    cassette:
+        Where interactions are recorded.
+    transport:
+        The transport that really sends the requests.  Defaults to a new
+        :class:`~teamleader.transport.RequestsTransport`.
+    """
+
+    def __init__(self, cassette: Cassette, transport: Transport | None = None) -> None:
+        self.cassette = cassette
+        self.transport = transport if transport is not None else RequestsTransport()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        start = time.perf_counter()
+        response = self.transport.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+        content = response.content  # iter_content() still works afterwards
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if params:
+            url = requests.Request(method, url, params=params).prepare().url or url
+        text, binary = _response_content(url, content)
+        self.cassette.append(
+            Interaction(
+                method=method.upper(),
+                url=url,
+                body=_request_body(url, data),
+                status=response.status_code,
+                headers=_kept_headers(response.headers),
+                content=text,
+                binary=binary,
+                elapsed_ms=round(elapsed_ms, 3),
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests from a :class:`Cassette` instead of the network.
+
+    Parameters
+    ----------
+    cassette:
+        The recorded interactions.
+    time_scale:
+        Multiplier for each interaction's recorded ``elapsed_ms``: ``0``
+        (the default) replays at full speed, ``1.0`` at the recorded timing,
+        ``0.5`` twice as fast.
+    cycle:
+        Start over with the first recorded response for a request once all
+        of them have been replayed, instead of raising
+        :class:`CassetteMismatchError`.
+    """
+
+    def __init__(
+        self, cassette: Cassette, *, time_scale: float = 0.0, cycle: bool = False
+    ) -> None:
+        self.time_scale = time_scale
+        self.cycle = cycle
+        self._recorded: dict[tuple[str, str, str], list[Interaction]] = {}
+        for interaction in cassette:
+            self._recorded.setdefault(interaction.key(), []).append(interaction)
+        self._pending = {k: deque(v) for k, v in self._recorded.items()}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        if params:
+            url = requests.Request(method, url, params=params).prepare().url or url
+        key = _key(method, url, _request_body(url, data))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                raise CassetteMismatchError(
+                    f"No recorded interaction for {method.upper()} {url} "
+                    f"with body {key[2]}"
+                )
+            if not pending:
+                if not self.cycle:
+                    raise CassetteMismatchError(
+                        f"All {len(self._recorded[key])} recorded interaction(s) "
+                        f"for {method.upper()} {url} with body {key[2]} were "
+                        "already replayed"
+                    )
+                pending.extend(self._recorded[key])
+            interaction = pending.popleft()
+        if self.time_scale:
+            time.sleep(interaction.elapsed_ms / 1000 * self.time_scale)
+        return make_response(
+            interaction.status,
+            interaction.response_bytes(),
+            headers=interaction.headers,
+            url=url,
+        )
+
+    def remaining(self) -> int:
+        """Number of recorded interactions not replayed yet (this cycle)."""
+        with self._lock:
+            return sum(len(pending) for pending in self._pending.values())
@@ -27,12 +27,18 @@ Usage (Django)::
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
 
 import requests
 
-from teamleader._generated.endpoints import ENDPOINTS
+from teamleader import memo, tracing
+from teamleader._generated.endpoints import ENDPOINTS, Endpoint
 from teamleader.auth import OAuth2Handler
+from teamleader.codecs import JSONCodec, StdlibJSONCodec
 from teamleader.constants import BASE_URL, DEFAULT_TIMEOUT
 from teamleader.exceptions import (
     TeamleaderAPIError,
@@ -40,14 +46,30 @@ from teamleader.exceptions import (
     TeamleaderNotFoundError,
     TeamleaderPermissionError,
     TeamleaderRateLimitError,
+    TeamleaderRequestValidationError,
     TeamleaderServerError,
     TeamleaderValidationError,
 )
+from teamleader.hooks import ClientHooks, RequestEvent, TokenRefreshEvent
 from teamleader.resources.companies import CompaniesResource
 from teamleader.resources.contacts import ContactsResource
 from teamleader.resources.deals import DealsResource
 from teamleader.resources.invoices import InvoicesResource
 from teamleader.resources.quotations import QuotationsResource
+from teamleader.streaming import DEFAULT_CHUNK_SIZE, ListStream
+from teamleader.transport import RequestsTransport, Transport
+
+if TYPE_CHECKING:
+    from teamleader.profiling import CallProfiler
+
+_NOT_PROFILED: AbstractContextManager[None] = nullcontext()
+
+# Access token already obtained for the current call.  Set by
+# AsyncTeamleaderClient, which reads the token on the event loop before
+# handing the call to a worker thread.
+_access_token: ContextVar[str | None] = ContextVar(
+    "teamleader_access_token", default=None
+)
 
 
 class TeamleaderClient:
@@ -63,6 +85,38 @@ class TeamleaderClient:
     timeout:
         HTTP request timeout in seconds.  Defaults to
         :data:`~teamleader.constants.DEFAULT_TIMEOUT` (30 s).
+    validate_requests:
+        When ``True``, :meth:`call` and the resources' ``create``/``update``
+        check every request body against the spec-derived validator for its
+        operation (types, enum values, required and unknown keys) and raise
+        :class:`~teamleader.exceptions.TeamleaderRequestValidationError`
+        without sending anything if it does not match.  Off by default.
+    codec:
+        :class:`~teamleader.codecs.JSONCodec` used to encode request bodies
+        and decode responses.  Defaults to
+        :class:`~teamleader.codecs.StdlibJSONCodec`; pass
+        :func:`~teamleader.codecs.default_codec` to use ``orjson`` when it is
+        installed.
+    transport:
+        :class:`~teamleader.transport.Transport` that sends the HTTP
+        requests.  Defaults to a
+        :class:`~teamleader.transport.RequestsTransport` (one pooled
+        ``requests.Session`` per client).
+    hooks:
+        :class:`~teamleader.hooks.ClientHooks` notified of every request's
+        lifecycle (start, response, retry, finish, token refresh), e.g. a
+        :class:`~teamleader.hooks.MetricsCollector`.  Stored in
+        :attr:`hooks`, which may be modified later.
+    max_retries:
+        How many times a request answered with 429 Too Many Requests is
+        retried after sleeping for its ``Retry-After`` seconds.  Defaults to
+        ``0`` — the :class:`~teamleader.exceptions.TeamleaderRateLimitError`
+        is raised straight away.
+    profiler:
+        :class:`~teamleader.profiling.CallProfiler` that profiles a sample
+        of :meth:`call` and resource ``iterate()`` operations.  Stored in
+        :attr:`profiler`, which may be set later.  ``None`` (the default)
+        disables profiling.
     """
 
     def __init__(
@@ -70,10 +124,28 @@ class TeamleaderClient:
         auth_handler: OAuth2Handler,
         *,
         timeout: int = DEFAULT_TIMEOUT,
+        validate_requests: bool = False,
+        codec: JSONCodec | None = None,
+        transport: Transport | None = None,
+        hooks: Iterable[ClientHooks] = (),
+        max_retries: int = 0,
+        profiler: CallProfiler | None = None,
     ) -> None:
         self._auth = auth_handler
         self._timeout = timeout
-        self._session = requests.Session()
+        self._transport: Transport = (
+            transport if transport is not None else RequestsTransport()
+        )
+        self._codec: JSONCodec = codec if codec is not None else StdlibJSONCodec()
+        self.hooks: list[ClientHooks] = list(hooks)
+        self._max_retries = max_retries
+        self.profiler = profiler
+        self._validate: Callable[[str, dict[str, Any]], list[str]] | None = None
+        if validate_requests:
+            # Imported here so clients that never validate never load it.
+            from teamleader._generated.validators import validate_request
+
+            self._validate = validate_request
 
         # Typed resource attributes — available immediately after construction.
         # Concrete methods raise NotImplementedError until Phase 7/9.
@@ -118,6 +190,9 @@ class TeamleaderClient:
         ValueError
             If *operation_id* is not in ``ENDPOINTS``, or if one or more
             required parameters are absent from *kwargs*.
+        TeamleaderRequestValidationError
+            If the client was created with ``validate_requests=True`` and
+            *kwargs* does not match the operation's request schema.
         TeamleaderError
             Any HTTP-level error raised by the underlying transport layer
             (same exceptions as the curated resources).
@@ -139,6 +214,74 @@ class TeamleaderClient:
             dept = client.call("departments.info", id="67c576e7-7e6f-465d-b6ab-a864f6e5e95b")
             print(dept["data"]["name"])
         """
+        endpoint = self._resolve(operation_id, kwargs)
+        with self._profile(endpoint.operation_id), tracing.span(
+            f"teamleader {endpoint.operation_id}",
+            {tracing.OPERATION_ID: endpoint.operation_id},
+        ) as span:
+            # request_path is endpoint.path without its leading "/", precomputed
+            result = self._post(
+                endpoint.request_path,
+                kwargs if kwargs else None,
+                operation_id=endpoint.operation_id,
+            )
+            data = result.get("data")
+            if isinstance(data, list):
+                span.set_attribute(tracing.ITEM_COUNT, len(data))
+            return result
+
+    def stream(self, operation_id: str, **kwargs: Any) -> ListStream:
+        """Call a list endpoint and iterate its ``data`` items as they arrive.
+
+        Same lookup and validation as :meth:`call`, but the response body is
+        parsed incrementally: each item is yielded as a ``dict`` as soon as it
+        has been received, so memory stays bounded by one item rather than
+        one page.
+
+        .. code-block:: python
+
+            stream = client.stream("invoices.list", page={"size": 100, "number": 1})
+            for invoice in stream:
+                process(invoice)
+            print(stream.meta)  # available once every item has been read
+
+        Returns
+        -------
+        ListStream
+            Iterator of raw item dicts; close it (or exhaust it) to release
+            the connection.
+
+        Raises
+        ------
+        ValueError, TeamleaderRequestValidationError, TeamleaderError
+            As for :meth:`call`; HTTP errors are raised before the first item.
+        """
+        endpoint = self._resolve(operation_id, kwargs)
+        return self._post_stream(
+            endpoint.request_path,
+            kwargs if kwargs else None,
+            operation_id=endpoint.operation_id,
+        )
+
+    def close(self) -> None:
+        """Close the transport's pooled connections.
+
+        The client must not be used afterwards.
+        """
+        self._transport.close()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _profile(self, operation: str) -> AbstractContextManager[None]:
+        """Profile the enclosed block if :attr:`profiler` samples *operation*."""
+        if self.profiler is None:
+            return _NOT_PROFILED
+        return self.profiler.profile(operation)
+
+    def _resolve(self, operation_id: str, kwargs: dict[str, Any]) -> Endpoint:
+        """Look up *operation_id* and check *kwargs* for :meth:`call`/:meth:`stream`."""
         endpoint = ENDPOINTS.get(operation_id)
         if endpoint is None:
             raise ValueError(
@@ -147,8 +290,8 @@ class TeamleaderClient:
                 f"full list of {len(ENDPOINTS)} available operation IDs."
             )
 
-        missing = [p for p in endpoint.required_params if p not in kwargs]
-        if missing:
+        if not endpoint.required <= kwargs.keys():
+            missing = [p for p in endpoint.required_params if p not in kwargs]
             raise ValueError(
                 f"Missing required parameter(s) for {operation_id!r}: "
                 f"{missing}. "
@@ -156,12 +299,23 @@ class TeamleaderClient:
                 f"optional: {list(endpoint.optional_params)}."
             )
 
-        # endpoint.path is "/contacts.list"; _post expects "contacts.list"
-        return self._post(endpoint.path.lstrip("/"), kwargs if kwargs else None)
+        self._check_body(operation_id, kwargs)
+        return endpoint
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+    def _check_body(self, operation_id: str, body: dict[str, Any]) -> None:
+        """Validate *body* when ``validate_requests`` is on.
+
+        Also used by the curated resources' ``create``/``update``, which
+        post directly.  Operations missing from the spec are not checked.
+        """
+        if self._validate is None or operation_id not in ENDPOINTS:
+            return
+        errors = self._validate(operation_id, body)
+        if errors:
+            raise TeamleaderRequestValidationError(
+                f"Invalid request body for {operation_id!r}: " + "; ".join(errors),
+                errors=errors,
+            )
 
     def _auth_headers(self) -> dict[str, str]:
         """Return an ``Authorization`` header with a fresh Bearer token.
@@ -169,9 +323,30 @@ class TeamleaderClient:
         Calls :meth:`~teamleader.auth.OAuth2Handler.get_valid_token`, which
         transparently refreshes the token if it is within the expiry margin.
         """
-        token = self._auth.get_valid_token()
+        token = _access_token.get()
+        if token is not None:
+            return {"Authorization": f"Bearer {token}"}
+        if self.hooks:
+            token = self._auth.get_valid_token(on_refresh=self._emit_token_refresh)
+        else:
+            token = self._auth.get_valid_token()
         return {"Authorization": f"Bearer {token}"}
 
+    def _emit_token_refresh(self, event: TokenRefreshEvent) -> None:
+        for hook in self.hooks:
+            hook.token_refresh(event)
+
+    def _emit_request_finished(self, event: RequestEvent) -> None:
+        scope = memo.current()
+        if scope is not None:
+            scope.record(event)
+        for hook in self.hooks:
+            hook.request_finished(event)
+
+    def _emit_iterate_finished(self, operation_id: str, pages: int) -> None:
+        for hook in self.hooks:
+            hook.iterate_finished(operation_id, pages)
+
     # ------------------------------------------------------------------
     # Internal HTTP helpers
     # ------------------------------------------------------------------
@@ -191,18 +366,15 @@ class TeamleaderClient:
         params:
             Optional query-string parameters.
         """
-        response = self._session.get(
-            f"{BASE_URL}/{path}",
-            headers=self._auth_headers(),
-            params=params,
-            timeout=self._timeout,
-        )
-        return self._handle_response(response)
+        response, event = self._send("GET", path, params=params)
+        return self._finish(response, event)
 
     def _post(
         self,
         path: str,
         json: dict[str, Any] | None = None,
+        *,
+        operation_id: str | None = None,
     ) -> dict[str, Any]:
         """Make an authenticated POST request and return the parsed JSON body.
 
@@ -212,16 +384,180 @@ class TeamleaderClient:
             API path segment, e.g. ``"contacts.list"``.  Appended to
             :data:`~teamleader.constants.BASE_URL` with a ``/`` separator.
         json:
-            Request body serialised as JSON.  Pass ``None`` for endpoints
-            that take no body.
+            Request body, encoded once to bytes with the client's codec.
+            Pass ``None`` for endpoints that take no body.
+        operation_id:
+            Name reported to hooks; defaults to *path*.
+        """
+        scope = memo.current()
+        if scope is not None and scope.deduplicate:
+            return self._post_memoized(scope, path, json, operation_id)
+        response, event = self._send("POST", path, json=json, operation_id=operation_id)
+        return self._finish(response, event)
+
+    def _post_memoized(
+        self,
+        scope: memo.RequestMemo,
+        path: str,
+        json: dict[str, Any] | None,
+        operation_id: str | None,
+    ) -> dict[str, Any]:
+        """:meth:`_post` inside :func:`~teamleader.memo.memoize`.
+
+        Reads are answered from *scope* when an identical one was sent
+        before through this client; any other request forgets everything
+        *scope* remembered.
         """
-        response = self._session.post(
-            f"{BASE_URL}/{path}",
-            headers=self._auth_headers(),
-            json=json,
-            timeout=self._timeout,
+        operation = operation_id or path
+        body = None if json is None else self._codec.encode(json)
+        if not memo.is_read(operation):
+            try:
+                response, event = self._send(
+                    "POST", path, body=body, operation_id=operation
+                )
+                return self._finish(response, event)
+            finally:
+                scope.invalidate()
+
+        # The client is part of the key: two clients (say, two pool tenants)
+        # must never be served each other's responses.
+        key = (self, operation, body)
+        content = scope.get(key)
+        for hook in self.hooks:
+            hook.cache_lookup("requests", content is not None)
+            if content is not None:
+                hook.memo_hit(operation)
+        if content is not None:
+            return self._codec.decode(content) if content else {}
+        response, event = self._send("POST", path, body=body, operation_id=operation)
+        result = self._finish(response, event)
+        scope.put(key, response.content)
+        return result
+
+    def _post_stream(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        *,
+        operation_id: str | None = None,
+    ) -> ListStream:
+        """Like :meth:`_post`, but return a :class:`~teamleader.streaming.ListStream`.
+
+        The body is read from the socket in
+        :data:`~teamleader.streaming.DEFAULT_CHUNK_SIZE` chunks while the
+        caller iterates.  Error responses are read in full and raised
+        immediately, exactly as :meth:`_post` would.  Hooks get
+        ``request_finished`` when the stream is exhausted or closed.
+        """
+        response, event = self._send(
+            "POST", path, json=json, operation_id=operation_id, stream=True
         )
-        return self._handle_response(response)
+        if response.status_code >= 300:
+            self._finish(response, event)
+        chunks = response.iter_content(DEFAULT_CHUNK_SIZE)
+        if not self.hooks and memo.current() is None:
+            return ListStream(chunks, close=response.close)
+
+        started = time.perf_counter()
+
+        def counted() -> Iterator[bytes]:
+            for chunk in chunks:
+                event.bytes_in += len(chunk)
+                yield chunk
+
+        def close() -> None:
+            response.close()
+            event.decode_ms = (time.perf_counter() - started) * 1000
+            self._emit_request_finished(event)
+
+        return ListStream(counted(), close=close)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        body: bytes | None = None,
+        params: dict[str, Any] | None = None,
+        operation_id: str | None = None,
+        stream: bool = False,
+    ) -> tuple[requests.Response, RequestEvent]:
+        """Send one request, retrying 429s up to ``max_retries`` times.
+
+        *json* is encoded once with the codec (or pass the encoded *body*);
+        every attempt gets a fresh ``Authorization`` header.  Returns the
+        final response (any status) and its
+        :class:`~teamleader.hooks.RequestEvent`.
+        """
+        if json is not None:
+            body = self._codec.encode(json)
+        event = RequestEvent(operation_id or path, method)
+        while True:
+            started = time.perf_counter()
+            headers = self._auth_headers()
+            if body is not None:
+                headers["Content-Type"] = "application/json"
+                event.bytes_out = len(body)
+            sent = time.perf_counter()
+            event.auth_ms = (sent - started) * 1000
+            for hook in self.hooks:
+                hook.request_start(event)
+
+            try:
+                response = self._transport.request(
+                    method,
+                    f"{BASE_URL}/{path}",
+                    headers=headers,
+                    data=body,
+                    params=params,
+                    timeout=self._timeout,
+                    stream=stream,
+                )
+            except Exception as exc:
+                event.network_ms = (time.perf_counter() - sent) * 1000
+                event.error = type(exc).__name__
+                self._emit_request_finished(event)
+                raise
+            event.network_ms = (time.perf_counter() - sent) * 1000
+            event.status_code = response.status_code
+            if not stream:
+                event.bytes_in = len(response.content)
+            if response.status_code == 429:
+                event.retry_after = self._retry_after(response)
+            for hook in self.hooks:
+                hook.response_received(event)
+
+            if response.status_code != 429 or event.attempt > self._max_retries:
+                return response, event
+            delay = 1.0 if event.retry_after is None else event.retry_after
+            for hook in self.hooks:
+                hook.retry(event, delay)
+            response.close()
+            time.sleep(delay)
+            event = RequestEvent(event.operation_id, method, attempt=event.attempt + 1)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        """``Retry-After`` in seconds, or ``None`` if absent or not a number."""
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    def _finish(
+        self, response: requests.Response, event: RequestEvent
+    ) -> dict[str, Any]:
+        """Decode *response* with :meth:`_handle_response`; report *event* to hooks."""
+        started = time.perf_counter()
+        try:
+            return self._handle_response(response)
+        except Exception as exc:
+            event.error = type(exc).__name__
+            raise
+        finally:
+            event.decode_ms = (time.perf_counter() - started) * 1000
+            self._emit_request_finished(event)
 
     def _handle_response(self, response: requests.Response) -> dict[str, Any]:
         """Map HTTP status codes to SDK exceptions; return the body on success.
@@ -251,7 +587,7 @@ class TeamleaderClient:
         if status < 300:
             if not response.content:
                 return {}
-            return response.json()  # type: ignore[no-any-return]
+            return self._codec.decode(response.content)  # type: ignore[no-any-return]
 
         # ---- error — shared keyword args ----------------------------
         message = self._extract_message(response)
@@ -282,8 +618,7 @@ class TeamleaderClient:
         # Unexpected 4xx (e.g. 400, 409)
         raise TeamleaderAPIError(message, **err_kwargs)
 
-    @staticmethod
-    def _extract_message(response: requests.Response) -> str:
+    def _extract_message(self, response: requests.Response) -> str:
         """Best-effort extraction of an error message from the response body.
 
         Understands two common Teamleader error shapes:
@@ -300,7 +635,7 @@ class TeamleaderClient:
         body is empty.
         """
         try:
-            body: dict[str, Any] = response.json()
+            body: dict[str, Any] = self._codec.decode(response.content)
         except ValueError:
             return response.text or f"HTTP {response.status_code}"
 
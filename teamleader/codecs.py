@@ -0,0 +1,121 @@
+"""Pluggable JSON encoding and decoding for request and response bodies.
+
+Implements:
+- JSONCodec         — abstract encode-to-bytes / decode-from-bytes interface
+- StdlibJSONCodec   — the standard library :mod:`json` module (default)
+- OrjsonCodec       — `orjson <https://github.com/ijl/orjson>`_, several
+  times faster on large list pages; needs ``pip install teamleader-sdk[fast]``
+- default_codec     — the fastest codec available in this environment
+
+Pass a codec to :class:`~teamleader.client.TeamleaderClient`::
+
+    from teamleader.codecs import default_codec
+
+    client = TeamleaderClient(handler, codec=default_codec())
+
+Request bodies are encoded to ``bytes`` exactly once and sent as-is;
+responses are decoded straight from the raw body bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class JSONCodec(ABC):
+    """Encodes request bodies to bytes and decodes response bodies from bytes.
+
+    ``decode`` must raise :exc:`ValueError` (or a subclass) on malformed
+    input — the client relies on that to fall back to the raw response text
+    for error messages.
+    """
+
+    #: Short identifier used in benchmarks and logs.
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Serialise *obj* to UTF-8 JSON bytes."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Parse UTF-8 JSON *data*."""
+
+
+class StdlibJSONCodec(JSONCodec):
+    """Codec backed by the standard library :mod:`json` module.
+
+    :meth:`encode` raises ``ValueError`` for ``NaN`` and infinities, which
+    are not valid JSON and which the API would reject.
+    """
+
+    name = "json"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(
+            separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        )
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by :mod:`orjson`.
+
+    orjson silently writes ``NaN`` and infinities as ``null``; :meth:`encode`
+    raises ``ValueError`` for them instead, like :class:`StdlibJSONCodec`.
+    The extra check only walks bodies whose output contains ``null``.
+
+    Raises
+    ------
+    ImportError
+        If ``orjson`` is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "OrjsonCodec requires orjson.  Install it with: "
+                "pip install teamleader-sdk[fast]"
+            ) from exc
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, obj: Any) -> bytes:
+        data = self._dumps(obj)
+        if b"null" in data and _has_non_finite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return data
+
+    def decode(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return ``True`` if *obj* contains a ``NaN`` or infinite float."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def default_codec() -> JSONCodec:
+    """Return :class:`OrjsonCodec` if ``orjson`` is installed, else the stdlib codec."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
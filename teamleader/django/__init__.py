@@ -16,6 +16,8 @@ Usage in Django projects::
         "CLIENT_SECRET": "...",
         "REDIRECT_URI": "http://localhost:9999/callback",
         "SCOPES": ["contacts", "deals"],
+        # optional: profile 5 % of calls, see get_client()
+        "PROFILING": {"RATE": 0.05, "DIRECTORY": "/var/tmp/teamleader-profiles"},
     }
 
     # anywhere in your code
@@ -24,12 +26,16 @@ Usage in Django projects::
     client = get_client()
     deal = client.deals.get("some-uuid")
 
-Full implementation in Phase 5.
+:func:`get_client` returns one shared, lazily built client per process;
+``await aget_client()`` wraps it for ``async def`` views.  Integrations
+serving many Teamleader accounts use :func:`get_client_pool` instead.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+import threading
+from typing import TYPE_CHECKING, Any
 
 # ---------------------------------------------------------------------------
 # Django availability guard — must run before any django import elsewhere
@@ -46,15 +52,71 @@ except ImportError as _exc:
     ) from _exc
 
 if TYPE_CHECKING:
+    from teamleader.aio import AsyncTeamleaderClient
+    from teamleader.auth import TokenBackend
     from teamleader.client import TeamleaderClient
+    from teamleader.hooks import ClientHooks
+    from teamleader.pool import TeamleaderClientPool
+    from teamleader.profiling import CallProfiler
+
+#: Default ``TEAMLEADER["POOL_SIZE"]``: pooled connections to the API host.
+DEFAULT_POOL_SIZE = 10
+
+_shared_client: TeamleaderClient | None = None
+_shared_async_client: AsyncTeamleaderClient | None = None
+_shared_pool: TeamleaderClientPool | None = None
+_shared_lock = threading.Lock()
 
 
 def get_client() -> TeamleaderClient:
-    """Return a configured :class:`~teamleader.client.TeamleaderClient`.
+    """Return the process-wide :class:`~teamleader.client.TeamleaderClient`.
+
+    The client is built from ``settings.TEAMLEADER`` on first use and then
+    shared by every caller in the process, so its pooled HTTPS connections
+    stay warm across requests.  It is safe to use from several threads.
+    The shared client is dropped, and rebuilt on the next call, when
+    ``settings.TEAMLEADER`` changes (``override_settings``), in a child
+    process after ``fork()``, and by :func:`reset_client`.
 
-    Reads ``settings.TEAMLEADER``, constructs a
-    :class:`~teamleader.django.token_store.DatabaseTokenBackend`, and
-    returns a ready-to-use client.
+    Optional ``settings.TEAMLEADER`` keys:
+
+    ``TIMEOUT``
+        HTTP timeout in seconds (default ``30``).
+    ``POOL_SIZE``
+        Maximum pooled connections to the API, i.e. the number of threads
+        that can hold a connection at once (default ``10``).
+    ``MAX_RETRIES``
+        How often a request rate-limited with 429 is retried after its
+        ``Retry-After`` delay (default ``0``).
+    ``TOKEN_BACKEND``
+        Dotted path of the :class:`~teamleader.auth.TokenBackend` class
+        (default :class:`~teamleader.django.token_store.DatabaseTokenBackend`).
+    ``TOKEN_BACKEND_OPTIONS``
+        Keyword arguments for the ``TOKEN_BACKEND`` class (default ``{}``).
+    ``SHARED_CLIENT``
+        ``False`` builds a new client on every call, as before (default
+        ``True``).
+    ``METRICS``
+        Report to :data:`teamleader.metrics.DEFAULT_COLLECTOR`, which
+        :func:`teamleader.django.views.metrics` serves.  Token backends with
+        a ``hooks`` list, such as
+        :class:`~teamleader.django.token_store.TieredTokenBackend`, report
+        their cache hits there too.
+    ``PROFILING``
+        Attach a :class:`~teamleader.profiling.CallProfiler`: a dict with
+        the keys ``RATE`` (fraction of calls to profile, default ``0.01``),
+        ``DIRECTORY`` (default ``<tempdir>/teamleader-profiles``), ``MEMORY``
+        (tracemalloc diffs, default ``True``) and ``TOP`` (lines per diff,
+        default ``25``).  Leave it unset, or set ``RATE`` to ``0``, to
+        disable profiling.
+    ``CALL_LOG``
+        Record each request's calls for
+        :class:`~teamleader.django.panels.TeamleaderPanel` and
+        :class:`~teamleader.django.middleware.TeamleaderMiddleware` (default
+        ``settings.DEBUG``).
+    ``SLOW_CALL_MS``
+        Log a warning on the ``teamleader.calls`` logger for every call
+        taking at least this many milliseconds (default ``None``: off).
 
     Example::
 
@@ -63,20 +125,266 @@ def get_client() -> TeamleaderClient:
         client = get_client()
         deals = client.deals.list()
     """
+    global _shared_client
+    from django.conf import settings
+
+    conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+    if not conf.get("SHARED_CLIENT", True):
+        return build_client(conf)
+
+    client = _shared_client
+    if client is None:
+        with _shared_lock:
+            client = _shared_client
+            if client is None:
+                client = _shared_client = build_client(conf)
+    return client
+
+
+async def aget_client() -> AsyncTeamleaderClient:
+    """Return the process-wide :class:`~teamleader.aio.AsyncTeamleaderClient`.
+
+    For ``async def`` views::
+
+        from teamleader.django import aget_client
+
+        async def deal_detail(request, deal_id):
+            client = await aget_client()
+            deal = await client.deals.get(deal_id)
+            ...
+
+    It wraps the client of :func:`get_client`, so sync and async code share
+    one connection pool, and is rebuilt with it.  Access tokens are read
+    with the token backend's async methods (``aget()``: Django's async ORM
+    and cache API for the backends in
+    :mod:`~teamleader.django.token_store`); requests are sent by at most
+    ``TEAMLEADER["POOL_SIZE"]`` worker threads, one per pooled connection,
+    and the others wait without blocking the event loop.
+
+    With ``SHARED_CLIENT`` set to ``False`` every call returns a new client,
+    with its own worker threads and connections: the caller owns it and
+    must :meth:`~teamleader.aio.AsyncTeamleaderClient.close` it.
+    """
+    global _shared_async_client
+    from django.conf import settings
+
+    from teamleader.aio import AsyncTeamleaderClient
+
+    conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+    pool_size = conf.get("POOL_SIZE", DEFAULT_POOL_SIZE)
+    client = get_client()
+    if not conf.get("SHARED_CLIENT", True):
+        return AsyncTeamleaderClient(client, max_workers=pool_size)
+
+    aclient = _shared_async_client
+    if aclient is None or aclient.client is not client:
+        with _shared_lock:
+            aclient = _shared_async_client
+            if aclient is None or aclient.client is not client:
+                aclient = _shared_async_client = AsyncTeamleaderClient(
+                    client, max_workers=pool_size
+                )
+    return aclient
+
+
+def get_client_pool() -> TeamleaderClientPool:
+    """Return the process-wide :class:`~teamleader.pool.TeamleaderClientPool`.
+
+    For integrations serving many Teamleader accounts: each tenant gets its
+    own client, token and rate limit, and all of them share one connection
+    pool of ``TEAMLEADER["POOL_SIZE"]`` connections::
+
+        from teamleader.django import get_client_pool
+
+        client = get_client_pool().get(request.user.organisation.tenant_id)
+        deals = client.deals.list()
+
+    Each tenant's token backend is ``TEAMLEADER["TOKEN_BACKEND"]`` built
+    with ``tenant_id=`` and ``TOKEN_BACKEND_OPTIONS``; the backends in
+    :mod:`~teamleader.django.token_store` then keep the token in that
+    tenant's ``TeamleaderTenantToken`` row.  Like the shared client, the pool
+    is rebuilt when ``settings.TEAMLEADER`` changes, after ``fork()`` and by
+    :func:`reset_client`.
+
+    ``TEAMLEADER["TENANTS"]`` is an optional dict with the keys:
+
+    ``MAX_CLIENTS``
+        Tenant clients kept at most (default ``100``).
+    ``IDLE_TIMEOUT``
+        Seconds after which an unused tenant client is dropped (default
+        ``600``; ``None`` keeps them until ``MAX_CLIENTS`` is reached).
+    ``RATE_LIMIT``
+        Requests each tenant may send per ``RATE_WINDOW`` seconds; further
+        requests wait (default ``None``: no limit).
+    ``RATE_WINDOW``
+        Default ``60``.
+
+    ``TIMEOUT``, ``MAX_RETRIES``, ``METRICS``, ``PROFILING``, ``CALL_LOG``
+    and ``SLOW_CALL_MS`` apply to every tenant as in :func:`get_client`.
+    """
+    global _shared_pool
     from django.conf import settings
 
+    pool = _shared_pool
+    if pool is None:
+        with _shared_lock:
+            pool = _shared_pool
+            if pool is None:
+                conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+                pool = _shared_pool = build_client_pool(conf)
+    return pool
+
+
+def reset_client() -> None:
+    """Close the shared clients and client pool; the next :func:`get_client`
+    or :func:`get_client_pool` builds a new one."""
+    global _shared_client, _shared_async_client, _shared_pool
+    with _shared_lock:
+        client, _shared_client = _shared_client, None
+        aclient, _shared_async_client = _shared_async_client, None
+        pool, _shared_pool = _shared_pool, None
+    if aclient is not None:
+        aclient.close()
+    if client is not None:
+        client.close()
+    if pool is not None:
+        pool.close()
+
+
+def _after_fork_in_child() -> None:
+    # The parent's sockets and lock state must not be used by the child;
+    # drop them without closing anything the parent still owns.
+    global _shared_client, _shared_async_client, _shared_pool, _shared_lock
+    _shared_client = None
+    _shared_async_client = None
+    _shared_pool = None
+    _shared_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def build_client(conf: dict[str, Any]) -> TeamleaderClient:
+    """Build a new client from a ``settings.TEAMLEADER``-style dict.
+
+    :func:`get_client` uses this; call it directly for a client that is not
+    shared, e.g. one with its own hooks.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
     from teamleader.auth import OAuth2Handler
     from teamleader.client import TeamleaderClient
-    from teamleader.django.token_store import DatabaseTokenBackend
-
-    conf: dict = getattr(settings, "TEAMLEADER", {})
+    from teamleader.constants import BASE_URL
+    from teamleader.transport import RequestsTransport
 
-    backend = DatabaseTokenBackend()
+    token_backend = _token_backend(conf)
     auth_handler = OAuth2Handler(
         client_id=conf["CLIENT_ID"],
         client_secret=conf["CLIENT_SECRET"],
         redirect_uri=conf["REDIRECT_URI"],
-        token_backend=backend,
+        token_backend=token_backend,
         scopes=conf.get("SCOPES", []),
     )
-    return TeamleaderClient(auth_handler=auth_handler)
+    pool_size = conf.get("POOL_SIZE", DEFAULT_POOL_SIZE)
+    session = requests.Session()
+    session.mount(
+        f"{BASE_URL}/", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    )
+    return TeamleaderClient(
+        auth_handler=auth_handler,
+        transport=RequestsTransport(session),
+        **_client_options(conf),
+    )
+
+
+def build_client_pool(conf: dict[str, Any]) -> TeamleaderClientPool:
+    """Build a new client pool from a ``settings.TEAMLEADER``-style dict.
+
+    :func:`get_client_pool` uses this.
+    """
+    from teamleader.pool import (
+        DEFAULT_IDLE_TIMEOUT,
+        DEFAULT_MAX_CLIENTS,
+        TeamleaderClientPool,
+    )
+
+    tenants = conf.get("TENANTS", {})
+    return TeamleaderClientPool(
+        client_id=conf["CLIENT_ID"],
+        client_secret=conf["CLIENT_SECRET"],
+        redirect_uri=conf["REDIRECT_URI"],
+        scopes=conf.get("SCOPES", []),
+        token_backend=lambda tenant_id: _token_backend(conf, tenant_id=tenant_id),
+        max_clients=tenants.get("MAX_CLIENTS", DEFAULT_MAX_CLIENTS),
+        idle_timeout=tenants.get("IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT),
+        rate_limit=tenants.get("RATE_LIMIT"),
+        rate_window=tenants.get("RATE_WINDOW", 60.0),
+        pool_size=conf.get("POOL_SIZE", DEFAULT_POOL_SIZE),
+        **_client_options(conf),
+    )
+
+
+def _client_options(conf: dict[str, Any]) -> dict[str, Any]:
+    """``TeamleaderClient`` keyword arguments shared by every Django client."""
+    from django.conf import settings
+
+    from teamleader.constants import DEFAULT_TIMEOUT
+
+    hooks: list[ClientHooks] = []
+    if conf.get("METRICS", False):
+        from teamleader.metrics import DEFAULT_COLLECTOR
+
+        hooks.append(DEFAULT_COLLECTOR)
+    slow_ms = conf.get("SLOW_CALL_MS")
+    if slow_ms is not None or conf.get("CALL_LOG", settings.DEBUG):
+        from teamleader.django.debug import CallRecorder
+
+        hooks.append(CallRecorder(slow_ms=slow_ms))
+    profiling = conf.get("PROFILING")
+    return {
+        "timeout": conf.get("TIMEOUT", DEFAULT_TIMEOUT),
+        "max_retries": conf.get("MAX_RETRIES", 0),
+        "hooks": hooks,
+        "profiler": _profiler(profiling) if profiling else None,
+    }
+
+
+def _token_backend(conf: dict[str, Any], **kwargs: str) -> TokenBackend:
+    """Instantiate ``TEAMLEADER["TOKEN_BACKEND"]`` with its options.
+
+    With ``METRICS`` on, backends with a ``hooks`` list report to
+    :data:`teamleader.metrics.DEFAULT_COLLECTOR`.
+    """
+    from django.utils.module_loading import import_string
+
+    path = conf.get(
+        "TOKEN_BACKEND", "teamleader.django.token_store.DatabaseTokenBackend"
+    )
+    options = {**conf.get("TOKEN_BACKEND_OPTIONS", {}), **kwargs}
+    backend: TokenBackend = import_string(path)(**options)
+    if conf.get("METRICS", False):
+        from teamleader.metrics import DEFAULT_COLLECTOR
+
+        backend_hooks = getattr(backend, "hooks", None)
+        if isinstance(backend_hooks, list):
+            backend_hooks.append(DEFAULT_COLLECTOR)
+    return backend
+
+
+def _profiler(conf: dict[str, Any]) -> CallProfiler:
+    """Build the profiler described by ``TEAMLEADER["PROFILING"]``."""
+    import tempfile
+    from pathlib import Path
+
+    from teamleader.profiling import CallProfiler
+
+    default = Path(tempfile.gettempdir()) / "teamleader-profiles"
+    directory = conf.get("DIRECTORY") or default
+    return CallProfiler(
+        directory,
+        rate=conf.get("RATE", 0.01),
+        memory=conf.get("MEMORY", True),
+        top=conf.get("TOP", 25),
+    )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from django.apps import AppConfig
 
 #: Keys that *must* be present in ``settings.TEAMLEADER``.
@@ -37,6 +39,10 @@ class TeamleaderConfig(AppConfig):
     def ready(self) -> None:
         """Validate required ``settings.TEAMLEADER`` keys on startup.
 
+        Also arranges for the shared client of
+        :func:`~teamleader.django.get_client` to be rebuilt whenever
+        ``settings.TEAMLEADER`` is changed (e.g. by ``override_settings``).
+
         Raises
         ------
         django.core.exceptions.ImproperlyConfigured
@@ -45,6 +51,9 @@ class TeamleaderConfig(AppConfig):
         """
         from django.conf import settings
         from django.core.exceptions import ImproperlyConfigured
+        from django.core.signals import setting_changed
+
+        setting_changed.connect(_reset_shared_client, dispatch_uid=__name__)
 
         cfg = getattr(settings, "TEAMLEADER", None)
 
@@ -70,4 +79,11 @@ class TeamleaderConfig(AppConfig):
             )
 
 
+def _reset_shared_client(*, setting: str, **kwargs: Any) -> None:
+    if setting == "TEAMLEADER":
+        from teamleader.django import reset_client
+
+        reset_client()
+
+
 default_app_config = "teamleader.django.apps.TeamleaderConfig"
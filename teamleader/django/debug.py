@@ -0,0 +1,274 @@
+"""Per-request log of Teamleader calls, N+1 detection and slow-call warnings.
+
+Implements:
+- CallRecord     — one Teamleader call: operation, duration, sizes, whether
+  it was answered from the request memo, and the calling code
+- CallLog        — the calls made while one request was handled, plus
+  :meth:`~CallLog.repeated` to spot N+1 patterns
+- CallRecorder   — :class:`~teamleader.hooks.ClientHooks` that fills the
+  active :class:`CallLog` and logs calls slower than a threshold
+- record_calls() — context manager making a :class:`CallLog` active
+- log_summary()  — writes a :class:`CallLog` to the ``teamleader.calls``
+  logger
+
+:func:`~teamleader.django.get_client` attaches a :class:`CallRecorder` when
+``TEAMLEADER["CALL_LOG"]`` (default: ``settings.DEBUG``) or
+``TEAMLEADER["SLOW_CALL_MS"]`` is set.  The calls are then shown by
+:class:`teamleader.django.panels.TeamleaderPanel` in Django Debug Toolbar,
+or logged per request by
+:class:`~teamleader.django.middleware.TeamleaderMiddleware` without it.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import teamleader
+from teamleader.hooks import ClientHooks, RequestEvent
+
+logger = logging.getLogger("teamleader.calls")
+
+#: Default :meth:`CallLog.repeated` threshold: sent ``*.info`` calls of one
+#: operation per request.
+DEFAULT_REPEAT_THRESHOLD = 3
+
+_current: ContextVar[CallLog | None] = ContextVar("teamleader_call_log", default=None)
+
+# Frames under these directories are not "our code" for the caller column.
+_LIBRARY_DIRS = tuple(
+    os.path.join(os.path.realpath(path), "")
+    for path in {
+        os.path.dirname(teamleader.__file__),
+        *(
+            sysconfig.get_paths().get(key, "")
+            for key in ("stdlib", "purelib", "platlib")
+        ),
+    }
+    if path
+)
+
+
+@dataclass(slots=True)
+class CallRecord:
+    """One Teamleader call made while a :class:`CallLog` was active.
+
+    Attributes
+    ----------
+    operation_id:
+        Operation ID, e.g. ``"deals.info"``.
+    duration_ms:
+        :attr:`~teamleader.hooks.RequestEvent.total_ms`; ``0.0`` for
+        memoised calls.
+    status_code / bytes_out / bytes_in / error:
+        As on :class:`~teamleader.hooks.RequestEvent`.
+    memoised:
+        ``True`` if :func:`teamleader.memo.memoize` answered the call and
+        nothing was sent.
+    stack:
+        ``"file:line in function"`` of the innermost calling frames outside
+        the SDK, Django and the standard library, outermost first.
+    """
+
+    operation_id: str
+    duration_ms: float = 0.0
+    status_code: int | None = None
+    bytes_out: int = 0
+    bytes_in: int = 0
+    error: str | None = None
+    memoised: bool = False
+    stack: tuple[str, ...] = ()
+
+    @property
+    def caller(self) -> str:
+        """The innermost frame of :attr:`stack`, or ``""``."""
+        return self.stack[-1] if self.stack else ""
+
+
+@dataclass
+class CallLog:
+    """The Teamleader calls made while one request was handled."""
+
+    records: list[CallRecord] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, record: CallRecord) -> None:
+        """Append *record*."""
+        with self._lock:
+            self.records.append(record)
+
+    @property
+    def duration_ms(self) -> float:
+        """Total time of the calls that were sent."""
+        return sum(record.duration_ms for record in self.records)
+
+    @property
+    def sent(self) -> int:
+        """Number of calls that reached the API."""
+        return sum(not record.memoised for record in self.records)
+
+    def repeated(self, threshold: int = DEFAULT_REPEAT_THRESHOLD) -> dict[str, int]:
+        """Return ``{operation: count}`` of N+1 suspects.
+
+        A suspect is a ``*.info`` operation sent at least *threshold* times,
+        typically one per item of a list — fetch those records with one
+        ``*.list`` call filtered on their IDs instead.  Memoised calls are
+        not counted.
+        """
+        counts = Counter(
+            record.operation_id
+            for record in self.records
+            if not record.memoised and record.operation_id.endswith(".info")
+        )
+        return {op: n for op, n in counts.most_common() if n >= threshold}
+
+
+def current() -> CallLog | None:
+    """Return the active :class:`CallLog`, if inside :func:`record_calls`."""
+    return _current.get()
+
+
+@contextmanager
+def record_calls() -> Iterator[CallLog]:
+    """Make a new :class:`CallLog` active for the block and yield it.
+
+    A block inside another one shares the outer block's log.
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+    log = CallLog()
+    token = _current.set(log)
+    try:
+        yield log
+    finally:
+        _current.reset(token)
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_library(filename: str) -> bool:
+    if filename.startswith("<"):  # <frozen ...>, <string>
+        return True
+    return os.path.realpath(filename).startswith(_LIBRARY_DIRS)
+
+
+def _caller_stack(depth: int) -> tuple[str, ...]:
+    """Innermost *depth* frames of the current stack outside library code."""
+    stack: list[str] = []
+    frame = sys._getframe(1)
+    while frame is not None and len(stack) < depth:
+        code = frame.f_code
+        if not _is_library(code.co_filename):
+            stack.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back  # type: ignore[assignment]
+    stack.reverse()
+    return tuple(stack)
+
+
+class CallRecorder(ClientHooks):
+    """Records calls into the active :class:`CallLog`; logs slow calls.
+
+    Outside :func:`record_calls` it only compares each call's duration with
+    *slow_ms*, so it is cheap enough to stay attached in production.
+
+    Parameters
+    ----------
+    slow_ms:
+        Calls taking at least this many milliseconds are logged as a
+        warning on the ``teamleader.calls`` logger, with their caller.
+        ``None`` (the default) disables the warning.
+    stack_depth:
+        Number of calling frames kept per :class:`CallRecord`.
+    """
+
+    def __init__(self, *, slow_ms: float | None = None, stack_depth: int = 5) -> None:
+        self.slow_ms = slow_ms
+        self.stack_depth = stack_depth
+
+    def request_finished(self, event: RequestEvent) -> None:
+        log = _current.get()
+        slow = self.slow_ms is not None and event.total_ms >= self.slow_ms
+        if log is None and not slow:
+            return
+        stack = _caller_stack(self.stack_depth)
+        if slow:
+            logger.warning(
+                "Slow Teamleader call %s: %.1f ms (status %s, %d bytes in) at %s",
+                event.operation_id,
+                event.total_ms,
+                event.status_code,
+                event.bytes_in,
+                stack[-1] if stack else "?",
+            )
+        if log is not None:
+            log.add(
+                CallRecord(
+                    event.operation_id,
+                    duration_ms=event.total_ms,
+                    status_code=event.status_code,
+                    bytes_out=event.bytes_out,
+                    bytes_in=event.bytes_in,
+                    error=event.error,
+                    stack=stack,
+                )
+            )
+
+    def memo_hit(self, operation_id: str) -> None:
+        log = _current.get()
+        if log is not None:
+            log.add(
+                CallRecord(
+                    operation_id,
+                    memoised=True,
+                    stack=_caller_stack(self.stack_depth),
+                )
+            )
+
+
+def log_summary(
+    log: CallLog, label: str, *, threshold: int = DEFAULT_REPEAT_THRESHOLD
+) -> None:
+    """Log *log*'s calls for the request described by *label*.
+
+    One ``DEBUG`` line per call and a ``WARNING`` per N+1 suspect (see
+    :meth:`CallLog.repeated`), on the ``teamleader.calls`` logger.
+    """
+    if not log.records:
+        return
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "%s: %d Teamleader calls (%d sent) in %.1f ms",
+            label,
+            len(log.records),
+            log.sent,
+            log.duration_ms,
+        )
+        for record in log.records:
+            logger.debug(
+                "  %s %s %.1f ms %d/%d bytes at %s",
+                record.operation_id,
+                "memoised" if record.memoised else record.status_code,
+                record.duration_ms,
+                record.bytes_out,
+                record.bytes_in,
+                record.caller or "?",
+            )
+    for operation, count in log.repeated(threshold).items():
+        logger.warning(
+            "%s: %s was called %d times — possible N+1; fetch these records "
+            "with one %s call filtered on their IDs",
+            label,
+            operation,
+            count,
+            operation.rpartition(".")[0] + ".list",
+        )
@@ -7,7 +7,8 @@ Walks the user through the OAuth2 authorization flow:
 3. Starts a temporary local HTTP server on OAUTH_CALLBACK_PORT (default 9999).
 4. Waits for Teamleader to redirect back with ``?code=...``.
 5. Exchanges the code for tokens via OAuth2Handler.
-6. Persists the tokens with DatabaseTokenBackend.
+6. Persists the tokens with DatabaseTokenBackend (for the ``--tenant`` ID,
+   if given).
 7. Prints a confirmation with the access-token expiry time.
 8. Shuts down the temporary server.
 """
@@ -19,7 +20,7 @@ import urllib.parse
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from django.conf import settings
-from django.core.management.base import BaseCommand, CommandError
+from django.core.management.base import BaseCommand, CommandError, CommandParser
 
 from teamleader.auth import OAuth2Handler
 from teamleader.constants import DEFAULT_OAUTH_CALLBACK_PORT
@@ -65,6 +66,13 @@ class Command(BaseCommand):
         "Run this once per environment after initial deployment."
     )
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--tenant",
+            help="Store the token for this tenant ID (see get_client_pool()) "
+            "instead of the installation's single token.",
+        )
+
     def handle(self, *args: object, **options: object) -> None:
         conf: dict = getattr(settings, "TEAMLEADER", {})
 
@@ -76,7 +84,8 @@ class Command(BaseCommand):
 
         port: int = conf.get("OAUTH_CALLBACK_PORT", DEFAULT_OAUTH_CALLBACK_PORT)
 
-        backend = DatabaseTokenBackend()
+        tenant = options.get("tenant")
+        backend = DatabaseTokenBackend(tenant_id=str(tenant) if tenant else None)
         handler = OAuth2Handler(
             client_id=conf["CLIENT_ID"],
             client_secret=conf["CLIENT_SECRET"],
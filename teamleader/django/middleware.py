@@ -1,23 +1,132 @@
-"""Optional Django middleware for the Teamleader SDK.
+"""Django middleware for the Teamleader SDK.
 
-Placeholder for Phase 5 / future use.
+Implements:
+- TeamleaderMiddleware — memoises identical Teamleader reads for the
+  duration of one HTTP request, reports the request's Teamleader time in a
+  ``Server-Timing`` header and, with ``TEAMLEADER["CALL_LOG"]``, logs the
+  request's calls (see :mod:`teamleader.django.debug`)
+
+It supports both synchronous and ``async def`` views.  Enable it in your
+settings::
+
+    MIDDLEWARE = [
+        ...
+        "teamleader.django.middleware.TeamleaderMiddleware",
+    ]
 """
 
 from __future__ import annotations
 
-from typing import Callable
+from collections.abc import Awaitable, Callable
+from contextlib import ExitStack, nullcontext
+from typing import Any
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
+from teamleader.django.debug import (
+    DEFAULT_REPEAT_THRESHOLD,
+    CallLog,
+    log_summary,
+    record_calls,
+)
+from teamleader.memo import RequestMemo, memoize
+
+#: ``Server-Timing`` metric name used for Teamleader calls.
+SERVER_TIMING_METRIC = "teamleader"
+
 
 class TeamleaderMiddleware:
-    """Placeholder middleware — extend as needed.
+    """Runs each request inside :func:`teamleader.memo.memoize`.
+
+    While the view (and its templates) run, identical read calls —
+    ``deals.info`` for the same deal, the same ``contacts.list`` page, … —
+    made through any SDK client in the request's thread are sent once; a
+    write call forgets the remembered responses.  See :mod:`teamleader.memo`.
+
+    When the request made (or deduplicated) Teamleader calls, the response
+    gets a ``Server-Timing`` entry with their total time, e.g.
+    ``teamleader;dur=84.2;desc="3 calls, 2 deduplicated"``, which browser
+    developer tools show in the request's timing breakdown.
+
+    Optional ``settings.TEAMLEADER`` keys:
 
-    Currently a no-op pass-through.
+    ``MEMOIZE``
+        ``False`` sends every call, still counting them for
+        ``Server-Timing`` (default ``True``).
+    ``SERVER_TIMING``
+        ``False`` omits the header, e.g. to keep API timings private
+        (default ``True``).
+    ``CALL_LOG``
+        Log every call of the request to the ``teamleader.calls`` logger
+        (``DEBUG``), and warn about N+1 patterns (default
+        ``settings.DEBUG``).  See :func:`teamleader.django.debug.log_summary`.
+    ``REPEAT_THRESHOLD``
+        Sends of one ``*.info`` operation per request from which an N+1
+        warning is logged (default ``3``).
     """
 
-    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse]
+        | Callable[[HttpRequest], Awaitable[HttpResponse]],
+    ) -> None:
         self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with ExitStack() as stack:
+            memo, log, conf = self._enter(stack)
+            response = self.get_response(request)
+        return self._finish(request, response, memo, log, conf)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # The scopes are context variables: asyncio tasks and the worker
+        # threads of AsyncTeamleaderClient started from the view see them.
+        with ExitStack() as stack:
+            memo, log, conf = self._enter(stack)
+            response = await self.get_response(request)
+        return self._finish(request, response, memo, log, conf)
+
+    @staticmethod
+    def _enter(stack: ExitStack) -> tuple[RequestMemo, CallLog | None, dict[str, Any]]:
+        from django.conf import settings
+
+        conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+        memo = stack.enter_context(memoize(deduplicate=conf.get("MEMOIZE", True)))
+        recording = conf.get("CALL_LOG", settings.DEBUG)
+        log = stack.enter_context(record_calls() if recording else nullcontext())
+        return memo, log, conf
+
+    @staticmethod
+    def _finish(
+        request: HttpRequest,
+        response: HttpResponse,
+        memo: RequestMemo,
+        log: CallLog | None,
+        conf: dict[str, Any],
+    ) -> HttpResponse:
+        if conf.get("SERVER_TIMING", True) and (memo.calls or memo.hits):
+            _add_server_timing(response, memo)
+        if log is not None:
+            log_summary(
+                log,
+                f"{request.method} {request.path}",
+                threshold=conf.get("REPEAT_THRESHOLD", DEFAULT_REPEAT_THRESHOLD),
+            )
+        return response
+
 
-    def __call__(self, request: HttpRequest) -> HttpResponse:
-        return self.get_response(request)
+def _add_server_timing(response: HttpResponse, memo: RequestMemo) -> None:
+    calls = f"{memo.calls} call{'' if memo.calls == 1 else 's'}"
+    if memo.hits:
+        calls += f", {memo.hits} deduplicated"
+    entry = f'{SERVER_TIMING_METRIC};dur={memo.duration_ms:.1f};desc="{calls}"'
+    existing = response.get("Server-Timing")
+    response["Server-Timing"] = f"{existing}, {entry}" if existing else entry
@@ -1,4 +1,13 @@
-"""Django ORM model for persisting the Teamleader OAuth2 token.
+"""Django ORM models for the Teamleader OAuth2 token and mirrored records.
+
+Implements:
+- TeamleaderToken     — singleton holding the active OAuth2 token
+- TeamleaderTenantToken — one OAuth2 token per tenant, for integrations
+  serving many Teamleader accounts (see :mod:`teamleader.pool`)
+- TeamleaderContact, TeamleaderCompany, TeamleaderDeal, TeamleaderInvoice,
+  TeamleaderQuotation — local copies of Teamleader records, filled by
+  ``python manage.py teamleader_sync`` (see :mod:`teamleader.django.sync`)
+- TeamleaderSyncState — per-resource checkpoint of incremental syncs
 
 No migrations are shipped with this package.  After adding
 ``"teamleader.django"`` to ``INSTALLED_APPS`` run::
@@ -35,3 +44,120 @@ class TeamleaderToken(models.Model):
 
     def __str__(self) -> str:
         return f"TeamleaderToken(expires_at={self.expires_at})"
+
+
+class TeamleaderTenantToken(models.Model):
+    """The OAuth2 token of one tenant — one Teamleader account.
+
+    Used instead of the :class:`TeamleaderToken` singleton by token backends
+    given a ``tenant_id``, e.g. ``DatabaseTokenBackend(tenant_id="acme")``.
+    """
+
+    tenant_id = models.CharField(max_length=255, unique=True)
+    access_token = models.TextField()
+    refresh_token = models.TextField()
+    expires_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "teamleader_django"
+
+    def __str__(self) -> str:
+        return (
+            f"TeamleaderTenantToken(tenant_id={self.tenant_id!r}, "
+            f"expires_at={self.expires_at})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Mirrored records
+# ---------------------------------------------------------------------------
+
+
+class MirroredRecord(models.Model):
+    """Columns shared by every mirrored Teamleader record.
+
+    ``data`` holds the whole record as returned by the API; the concrete
+    models add indexed columns for the fields most often filtered on.
+    """
+
+    id = models.CharField(max_length=36, primary_key=True)
+    data = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(null=True, db_index=True)
+    synced_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        abstract = True
+        app_label = "teamleader_django"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self.id})"
+
+
+class TeamleaderContact(MirroredRecord):
+    """A mirrored ``contacts.list`` record."""
+
+    first_name = models.CharField(max_length=255, blank=True)
+    last_name = models.CharField(max_length=255, blank=True)
+    email = models.CharField(max_length=255, blank=True, db_index=True)
+    status = models.CharField(max_length=20, blank=True)
+
+
+class TeamleaderCompany(MirroredRecord):
+    """A mirrored ``companies.list`` record."""
+
+    name = models.CharField(max_length=255, blank=True, db_index=True)
+    vat_number = models.CharField(max_length=50, blank=True)
+    status = models.CharField(max_length=20, blank=True)
+
+    class Meta(MirroredRecord.Meta):
+        verbose_name_plural = "teamleader companies"
+
+
+class TeamleaderDeal(MirroredRecord):
+    """A mirrored ``deals.list`` record."""
+
+    title = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, blank=True, db_index=True)
+    phase_id = models.CharField(max_length=36, blank=True, db_index=True)
+    responsible_user_id = models.CharField(max_length=36, blank=True)
+    estimated_value = models.DecimalField(max_digits=18, decimal_places=2, null=True)
+    currency = models.CharField(max_length=3, blank=True)
+
+
+class TeamleaderInvoice(MirroredRecord):
+    """A mirrored ``invoices.list`` record."""
+
+    invoice_number = models.CharField(max_length=50, blank=True, db_index=True)
+    invoice_date = models.DateField(null=True)
+    status = models.CharField(max_length=20, blank=True, db_index=True)
+    paid = models.BooleanField(default=False)
+    deal_id = models.CharField(max_length=36, blank=True)
+
+
+class TeamleaderQuotation(MirroredRecord):
+    """A mirrored ``quotations.list`` record."""
+
+    name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, blank=True, db_index=True)
+    deal_id = models.CharField(max_length=36, blank=True, db_index=True)
+
+
+class TeamleaderSyncState(models.Model):
+    """Progress of ``teamleader_sync`` for one resource.
+
+    ``updated_since`` is the newest ``updated_at`` mirrored by the last
+    complete run; the next incremental run asks only for records updated
+    since then.  ``records`` is the number of mirrored rows after that run.
+    """
+
+    resource = models.CharField(max_length=50, primary_key=True)
+    updated_since = models.DateTimeField(null=True)
+    synced_at = models.DateTimeField()
+    records = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        app_label = "teamleader_django"
+
+    def __str__(self) -> str:
+        return f"TeamleaderSyncState({self.resource}, {self.updated_since})"
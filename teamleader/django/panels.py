@@ -0,0 +1,125 @@
+"""Django Debug Toolbar panel listing the Teamleader calls of a request.
+
+Requires ``django-debug-toolbar``.  Add the panel next to the default ones::
+
+    DEBUG_TOOLBAR_PANELS = [
+        *debug_toolbar.settings.PANELS_DEFAULTS,
+        "teamleader.django.panels.TeamleaderPanel",
+    ]
+
+It shows every call made while the view ran — operation ID, duration,
+status, bytes sent and received, whether the request memo answered it, and
+the code that made it — and flags N+1 patterns.  Calls are recorded by the
+:class:`~teamleader.django.debug.CallRecorder` that
+:func:`~teamleader.django.get_client` attaches when
+``TEAMLEADER["CALL_LOG"]`` is true, which it is by default when
+``settings.DEBUG`` is.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from debug_toolbar.panels import Panel
+from django.http import HttpRequest, HttpResponse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString
+
+from teamleader.django.debug import DEFAULT_REPEAT_THRESHOLD, CallLog, record_calls
+
+
+class TeamleaderPanel(Panel):  # type: ignore[misc]
+    """Lists the request's Teamleader calls and flags N+1 patterns."""
+
+    title = "Teamleader"
+
+    _log: CallLog | None = None
+
+    @property
+    def nav_subtitle(self) -> str:
+        stats = self.get_stats()
+        if not stats:
+            return ""
+        count = len(stats["calls"])
+        return (
+            f"{count} call{'' if count == 1 else 's'} in {stats['duration_ms']:.1f} ms"
+        )
+
+    def process_request(self, request: HttpRequest) -> HttpResponse:
+        with record_calls() as log:
+            self._log = log
+            return super().process_request(request)
+
+    def generate_stats(self, request: HttpRequest, response: HttpResponse) -> None:
+        from django.conf import settings
+
+        log = self._log if self._log is not None else CallLog()
+        conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+        threshold = conf.get("REPEAT_THRESHOLD", DEFAULT_REPEAT_THRESHOLD)
+        # Stats may be serialised by the toolbar's store: plain types only.
+        self.record_stats(
+            {
+                "calls": [
+                    {
+                        "operation_id": r.operation_id,
+                        "duration_ms": r.duration_ms,
+                        "status_code": r.status_code,
+                        "bytes_out": r.bytes_out,
+                        "bytes_in": r.bytes_in,
+                        "error": r.error,
+                        "memoised": r.memoised,
+                        "stack": list(r.stack),
+                    }
+                    for r in log.records
+                ],
+                "sent": log.sent,
+                "duration_ms": log.duration_ms,
+                "repeated": list(log.repeated(threshold).items()),
+            }
+        )
+
+    @property
+    def content(self) -> SafeString:
+        stats = self.get_stats()
+        calls: list[dict[str, Any]] = stats.get("calls", [])
+        warnings = format_html_join(
+            "",
+            "<p><strong>Possible N+1:</strong> <code>{}</code> was called {} "
+            "times. Fetch these records with one <code>{}</code> call "
+            "filtered on their IDs.</p>",
+            (
+                (op, count, op.rpartition(".")[0] + ".list")
+                for op, count in stats.get("repeated", [])
+            ),
+        )
+        rows = format_html_join(
+            "",
+            "<tr><td>{}</td><td><code>{}</code></td><td>{}</td><td>{}</td>"
+            '<td>{}</td><td>{}</td><td>{}</td><td title="{}">{}</td></tr>',
+            (
+                (
+                    index,
+                    call["operation_id"],
+                    f"{call['duration_ms']:.1f}",
+                    call["error"] or call["status_code"] or "",
+                    call["bytes_out"],
+                    call["bytes_in"],
+                    "hit" if call["memoised"] else "miss",
+                    "\n".join(call["stack"]),
+                    call["stack"][-1] if call["stack"] else "",
+                )
+                for index, call in enumerate(calls, 1)
+            ),
+        )
+        return format_html(
+            "<p>{} calls, {} sent to the API, {} ms.</p>{}"
+            "<table><thead><tr><th>#</th><th>Operation</th><th>Time (ms)</th>"
+            "<th>Status</th><th>Bytes sent</th><th>Bytes received</th>"
+            "<th>Memo</th><th>Called from</th></tr></thead>"
+            "<tbody>{}</tbody></table>",
+            len(calls),
+            stats.get("sent", 0),
+            f"{stats.get('duration_ms', 0.0):.1f}",
+            warnings,
+            rows,
+        )
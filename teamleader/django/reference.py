@@ -0,0 +1,141 @@
+"""Cached Teamleader reference data: deal phases and sources, users, departments.
+
+Implements:
+- REFERENCE_DATA         — the cached lists, by name, with their operation
+- get_reference_data()   — one list, from ``django.core.cache`` or the API
+- preload_reference_data() — fetch lists into the cache ahead of use
+- deal_phases(), deal_sources(), users(), departments() — shortcuts
+
+Reference data changes rarely but is read on many pages (phase names on a
+deal list, user names on an activity feed).  Lists are kept in the cache
+named by ``TEAMLEADER["REFERENCE_CACHE"]`` (default ``"default"``) for
+``TEAMLEADER["REFERENCE_TIMEOUT"]`` seconds (default ``3600``), so a shared
+cache serves every worker after one of them fetched it;
+:mod:`teamleader.django.warmup` fills it when a worker starts.
+
+Each lookup is reported to the client's hooks as
+``cache_lookup("reference", hit)``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from teamleader.constants import MAX_PAGE_SIZE
+
+if TYPE_CHECKING:
+    from teamleader.client import TeamleaderClient
+
+#: Name → (operation, whether it is paginated).
+REFERENCE_DATA: dict[str, tuple[str, bool]] = {
+    "deal_phases": ("dealPhases.list", True),
+    "deal_sources": ("dealSources.list", True),
+    "users": ("users.list", True),
+    "departments": ("departments.list", False),
+}
+
+#: Default ``TEAMLEADER["REFERENCE_TIMEOUT"]``, in seconds.
+DEFAULT_REFERENCE_TIMEOUT = 3600
+
+_KEY_PREFIX = "teamleader:reference:"
+
+
+def _fetch(client: TeamleaderClient, operation: str, paginated: bool) -> list[Any]:
+    """Every item of *operation*, following pages when it is *paginated*."""
+    if not paginated:
+        return list(client.call(operation).get("data", []))
+    items: list[Any] = []
+    number = 1
+    while True:
+        page = client.call(
+            operation, page={"size": MAX_PAGE_SIZE, "number": number}
+        ).get("data", [])
+        items.extend(page)
+        if len(page) < MAX_PAGE_SIZE:
+            return items
+        number += 1
+
+
+def get_reference_data(
+    name: str,
+    *,
+    client: TeamleaderClient | None = None,
+    refresh: bool = False,
+) -> list[dict[str, Any]]:
+    """Return the reference list *name* (a key of :data:`REFERENCE_DATA`).
+
+    Answered from the cache when possible; otherwise every page is fetched
+    and cached.
+
+    Parameters
+    ----------
+    name:
+        E.g. ``"deal_phases"``.
+    client:
+        Client to fetch with (default :func:`~teamleader.django.get_client`).
+    refresh:
+        Fetch and re-cache even if the list is cached.
+
+    Raises
+    ------
+    KeyError
+        If *name* is not in :data:`REFERENCE_DATA`.
+    """
+    from django.conf import settings
+    from django.core.cache import caches
+
+    operation, paginated = REFERENCE_DATA[name]
+    if client is None:
+        from teamleader.django import get_client
+
+        client = get_client()
+    conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+    cache = caches[conf.get("REFERENCE_CACHE", "default")]
+    key = _KEY_PREFIX + name
+    if not refresh:
+        data = cache.get(key)
+        for hook in client.hooks:
+            hook.cache_lookup("reference", data is not None)
+        if data is not None:
+            return data  # type: ignore[no-any-return]
+    data = _fetch(client, operation, paginated)
+    cache.set(
+        key, data, timeout=conf.get("REFERENCE_TIMEOUT", DEFAULT_REFERENCE_TIMEOUT)
+    )
+    return data
+
+
+def preload_reference_data(
+    names: Iterable[str] | None = None,
+    *,
+    client: TeamleaderClient | None = None,
+) -> dict[str, int]:
+    """Fetch *names* (default: all of :data:`REFERENCE_DATA`) into the cache.
+
+    Returns ``{name: number of items}``.
+    """
+    return {
+        name: len(get_reference_data(name, client=client, refresh=True))
+        for name in (REFERENCE_DATA if names is None else names)
+    }
+
+
+def deal_phases(*, client: TeamleaderClient | None = None) -> list[dict[str, Any]]:
+    """Cached ``dealPhases.list``."""
+    return get_reference_data("deal_phases", client=client)
+
+
+def deal_sources(*, client: TeamleaderClient | None = None) -> list[dict[str, Any]]:
+    """Cached ``dealSources.list``."""
+    return get_reference_data("deal_sources", client=client)
+
+
+def users(*, client: TeamleaderClient | None = None) -> list[dict[str, Any]]:
+    """Cached ``users.list``."""
+    return get_reference_data("users", client=client)
+
+
+def departments(*, client: TeamleaderClient | None = None) -> list[dict[str, Any]]:
+    """Cached ``departments.list``."""
+    return get_reference_data("departments", client=client)
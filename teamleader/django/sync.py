@@ -0,0 +1,331 @@
+"""Mirror Teamleader records into the local database.
+
+Implements:
+- Mirror        — how one resource maps onto its
+  :class:`~teamleader.django.models.MirroredRecord` model
+- MIRRORS       — the mirrored resources, by client attribute name
+- SyncResult    — what one :func:`sync_resource` run did
+- sync_resource() — mirror one resource, incrementally when possible
+- sync()        — mirror several resources, in parallel threads
+
+``python manage.py teamleader_sync`` is a thin wrapper around :func:`sync`;
+call it directly from a task queue to keep the mirror fresh on a schedule.
+
+Records are read with :meth:`~teamleader.resources.base.CrudResource.iterate`
+in streaming mode inside :func:`~teamleader.models.interning.interning`, so
+memory stays bounded by one batch of records sharing their repeated values,
+and written with
+one ``bulk_create(update_conflicts=True)`` upsert per batch.  Resources whose
+``*.list`` accepts ``filter.updated_since`` are synced incrementally from the
+checkpoint in :class:`~teamleader.django.models.TeamleaderSyncState`; the
+others, and every ``full`` run, fetch everything and delete the local rows
+that were not returned.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from django.db import connections
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import now
+
+from teamleader.django.models import (
+    MirroredRecord,
+    TeamleaderCompany,
+    TeamleaderContact,
+    TeamleaderDeal,
+    TeamleaderInvoice,
+    TeamleaderQuotation,
+    TeamleaderSyncState,
+)
+from teamleader.models.interning import interning
+
+if TYPE_CHECKING:
+    from teamleader.client import TeamleaderClient
+
+#: Default rows per ``bulk_create`` upsert.
+DEFAULT_BATCH_SIZE = 500
+
+#: Default ``*.list`` page size; the API's maximum.
+DEFAULT_SYNC_PAGE_SIZE = 100
+
+#: Default number of resources synced at once.
+DEFAULT_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Mirror:
+    """How the records of one resource are stored.
+
+    Attributes
+    ----------
+    resource:
+        Client attribute and :class:`TeamleaderSyncState` key, e.g.
+        ``"deals"``.
+    model:
+        The :class:`MirroredRecord` subclass holding the records.
+    columns:
+        Returns the model's typed columns for one curated record.
+    incremental:
+        ``True`` if ``{resource}.list`` accepts ``filter.updated_since``.
+    """
+
+    resource: str
+    model: type[MirroredRecord]
+    columns: Callable[[Any], dict[str, Any]]
+    incremental: bool = True
+
+
+def _id(ref: Any) -> str:
+    return ref.id if ref is not None else ""
+
+
+def _contact_columns(contact: Any) -> dict[str, Any]:
+    return {
+        "first_name": contact.first_name or "",
+        "last_name": contact.last_name or "",
+        "email": contact.primary_email or "",
+        "status": contact.status or "",
+    }
+
+
+def _company_columns(company: Any) -> dict[str, Any]:
+    return {
+        "name": company.name or "",
+        "vat_number": company.vat_number or "",
+        "status": company.status or "",
+    }
+
+
+def _deal_columns(deal: Any) -> dict[str, Any]:
+    value = deal.estimated_value
+    return {
+        "title": deal.title or "",
+        "status": deal.status or "",
+        "phase_id": _id(deal.current_phase),
+        "responsible_user_id": _id(deal.responsible_user),
+        "estimated_value": Decimal(str(value.amount)) if value else None,
+        "currency": value.currency if value else "",
+    }
+
+
+def _invoice_columns(invoice: Any) -> dict[str, Any]:
+    return {
+        "invoice_number": invoice.invoice_number or "",
+        "invoice_date": parse_date(invoice.invoice_date or ""),
+        "status": invoice.status or "",
+        "paid": invoice.paid,
+        "deal_id": _id(invoice.deal),
+    }
+
+
+def _quotation_columns(quotation: Any) -> dict[str, Any]:
+    return {
+        "name": quotation.name or "",
+        "status": quotation.status or "",
+        "deal_id": _id(quotation.deal),
+    }
+
+
+MIRRORS: dict[str, Mirror] = {
+    mirror.resource: mirror
+    for mirror in (
+        Mirror("contacts", TeamleaderContact, _contact_columns),
+        Mirror("companies", TeamleaderCompany, _company_columns),
+        Mirror("deals", TeamleaderDeal, _deal_columns),
+        Mirror("invoices", TeamleaderInvoice, _invoice_columns),
+        # quotations.list has no updated_since filter.
+        Mirror("quotations", TeamleaderQuotation, _quotation_columns, False),
+    )
+}
+
+
+@dataclass
+class SyncResult:
+    """What one :func:`sync_resource` run did.
+
+    Attributes
+    ----------
+    resource:
+        The synced resource.
+    records:
+        Records fetched and upserted.
+    deleted:
+        Local rows removed because a full run no longer returned them.
+    updated_since:
+        Checkpoint the run started from; ``None`` for a full run.
+    duration_ms:
+        Wall-clock time of the run.
+    """
+
+    resource: str
+    records: int = 0
+    deleted: int = 0
+    updated_since: datetime | None = None
+    duration_ms: float = 0.0
+
+    @property
+    def full(self) -> bool:
+        """``True`` if every record was fetched."""
+        return self.updated_since is None
+
+
+def _upsert(model: type[MirroredRecord], rows: Iterable[MirroredRecord]) -> None:
+    model.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=[
+            f.name for f in model._meta.concrete_fields if not f.primary_key
+        ],
+    )
+
+
+def sync_resource(
+    client: TeamleaderClient,
+    resource: str,
+    *,
+    full: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    page_size: int = DEFAULT_SYNC_PAGE_SIZE,
+) -> SyncResult:
+    """Mirror *resource* (a key of :data:`MIRRORS`) into its model.
+
+    Parameters
+    ----------
+    client:
+        Client to read with.
+    resource:
+        E.g. ``"deals"``.
+    full:
+        Fetch every record even if a checkpoint exists.
+    batch_size:
+        Rows per ``bulk_create`` upsert.
+    page_size:
+        Records per ``*.list`` request.
+    """
+    mirror = MIRRORS[resource]
+    model = mirror.model
+    started = time.perf_counter()
+    synced_at = now()
+    state = TeamleaderSyncState.objects.filter(resource=resource).first()
+    since = None
+    if not full and mirror.incremental and state is not None:
+        since = state.updated_since
+    filters: dict[str, Any] = {}
+    if since is not None:
+        # The API's updated_at has second precision; whole seconds keep the
+        # filter inclusive of the checkpoint.
+        stamp = since.astimezone(timezone.utc).isoformat(timespec="seconds")
+        filters["filter"] = {"updated_since": stamp}
+
+    result = SyncResult(resource, updated_since=since)
+    newest = since
+    # Keyed by id: a record moving between pages mid-sync can be returned
+    # twice, and one upsert must not touch a row twice.
+    batch: dict[str, MirroredRecord] = {}
+    # Records of one resource repeat the same users, phases, currencies and
+    # custom-field definitions; share them while the batch is held.
+    with interning():
+        for record in getattr(client, resource).iterate(
+            page_size, stream=True, **filters
+        ):
+            updated_at = parse_datetime(record.updated_at or "")
+            if updated_at is not None:
+                newest = updated_at if newest is None else max(newest, updated_at)
+            batch[record.id] = model(
+                id=record.id,
+                data=dataclasses.asdict(record),
+                updated_at=updated_at,
+                synced_at=synced_at,
+                **mirror.columns(record),
+            )
+            if len(batch) >= batch_size:
+                _upsert(model, batch.values())
+                result.records += len(batch)
+                batch = {}
+    if batch:
+        _upsert(model, batch.values())
+        result.records += len(batch)
+
+    if since is None:
+        result.deleted, _ = model.objects.filter(synced_at__lt=synced_at).delete()
+    # Records changed while the run was paging may have been missed; never
+    # move the checkpoint past the run's start so the next run re-reads them.
+    if newest is not None:
+        newest = min(newest, synced_at)
+    TeamleaderSyncState.objects.update_or_create(
+        resource=resource,
+        defaults={
+            "updated_since": newest,
+            "synced_at": synced_at,
+            "records": model.objects.count(),
+        },
+    )
+    result.duration_ms = (time.perf_counter() - started) * 1000
+    return result
+
+
+def _sync_in_thread(
+    client: TeamleaderClient, resource: str, **options: Any
+) -> SyncResult:
+    try:
+        return sync_resource(client, resource, **options)
+    finally:
+        # Worker threads open their own connections; don't leak them.
+        connections.close_all()
+
+
+def sync(
+    resources: Iterable[str] | None = None,
+    *,
+    client: TeamleaderClient | None = None,
+    full: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    page_size: int = DEFAULT_SYNC_PAGE_SIZE,
+    workers: int = DEFAULT_WORKERS,
+) -> list[SyncResult]:
+    """Mirror *resources* (default: all of :data:`MIRRORS`).
+
+    Up to *workers* resources are synced at once, each in its own thread
+    with its own database connection.  The other options are passed to
+    :func:`sync_resource`.  If a resource fails, the others still finish
+    and the first error is raised afterwards.
+
+    Parameters
+    ----------
+    resources:
+        Keys of :data:`MIRRORS`.
+    client:
+        Client to read with (default :func:`~teamleader.django.get_client`).
+    """
+    if client is None:
+        from teamleader.django import get_client
+
+        client = get_client()
+    names = list(MIRRORS if resources is None else resources)
+    unknown = sorted(set(names) - MIRRORS.keys())
+    if unknown:
+        raise ValueError(f"Unknown resources: {', '.join(unknown)}")
+    options: dict[str, Any] = {
+        "full": full,
+        "batch_size": batch_size,
+        "page_size": page_size,
+    }
+    if workers <= 1 or len(names) <= 1:
+        return [sync_resource(client, name, **options) for name in names]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="teamleader-sync"
+    ) as pool:
+        futures = [
+            pool.submit(_sync_in_thread, client, name, **options) for name in names
+        ]
+    return [future.result() for future in futures]
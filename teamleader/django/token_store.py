@@ -1,33 +1,86 @@
-"""DatabaseTokenBackend — Django ORM implementation of TokenBackend.
+"""Django implementations of TokenBackend.
 
-Stores and retrieves the OAuth2 token from the ``TeamleaderToken``
-singleton model.  All writes go through ``transaction.atomic()`` with
-``select_for_update()`` to prevent double-saves in multi-worker
-deployments (e.g. gunicorn with multiple workers).
+Implements:
+- DatabaseTokenBackend — stores the OAuth2 token in the ``TeamleaderToken``
+  singleton model, or a tenant's ``TeamleaderTenantToken`` row.  All writes
+  go through ``transaction.atomic()`` with ``select_for_update()`` to
+  prevent double-saves in multi-worker deployments (e.g. gunicorn with
+  multiple workers).
+- TieredTokenBackend   — keeps the token in process memory (L1) over
+  another backend (L2, the database by default) and only re-reads L2 when
+  a version marker in ``django.core.cache`` changes or the token nears
+  expiry.
+- CacheTokenBackend    — reads the token from ``django.core.cache`` (one
+  cache GET), writes through to the database, and serialises refreshes
+  with an ``add()``-based lock in the cache.
+
+Every backend here also implements the async ``aget()``, ``asave()`` and
+``aclear()`` with Django's async ORM and cache methods, for
+:class:`~teamleader.aio.AsyncTeamleaderClient` in async views.
+
+Every backend takes a ``tenant_id`` too.  Without one it holds the single
+token of the installation; with one it holds that tenant's token, under
+tenant-specific cache keys, for :class:`~teamleader.pool.TeamleaderClientPool`.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
 from teamleader.auth import Token, TokenBackend
 
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+    from django.db.models import Model
+
+    from teamleader.hooks import ClientHooks
+
+#: ``django.core.cache`` key holding the token version marker.
+TOKEN_VERSION_KEY = "teamleader:token-version"
+
+#: ``django.core.cache`` key holding the token for :class:`CacheTokenBackend`.
+TOKEN_CACHE_KEY = "teamleader:token"
+
 
 class DatabaseTokenBackend(TokenBackend):
     """Stores the OAuth2 token in the ``TeamleaderToken`` Django model.
 
     Uses ``select_for_update()`` inside ``transaction.atomic()`` to
     prevent race conditions in multi-worker deployments.
+
+    Parameters
+    ----------
+    tenant_id:
+        Store this tenant's token in its ``TeamleaderTenantToken`` row
+        instead of the ``TeamleaderToken`` singleton.
     """
 
-    def get(self) -> Token | None:
-        """Return the stored token, or ``None`` if no row exists yet."""
+    def __init__(self, tenant_id: str | None = None) -> None:
+        self.tenant_id = tenant_id
+
+    def _row(self) -> tuple[type[Model], dict[str, Any]]:
+        """The model holding the token and the lookup of its row."""
         # Import here to avoid Django app-registry issues at module load time.
-        from teamleader.django.models import TeamleaderToken
+        from teamleader.django.models import TeamleaderTenantToken, TeamleaderToken
 
-        try:
-            obj = TeamleaderToken.objects.get(pk=1)
-        except TeamleaderToken.DoesNotExist:
-            return None
+        if self.tenant_id is None:
+            return TeamleaderToken, {"pk": 1}
+        return TeamleaderTenantToken, {"tenant_id": self.tenant_id}
 
+    def get(self) -> Token | None:
+        """Return the stored token, or ``None`` if no row exists yet."""
+        model, lookup = self._row()
+        obj = model._default_manager.filter(**lookup).first()
+        return None if obj is None else self._token(obj)
+
+    @staticmethod
+    def _token(obj: Any) -> Token:
         return Token(
             access_token=obj.access_token,
             refresh_token=obj.refresh_token,
@@ -35,23 +88,377 @@ class DatabaseTokenBackend(TokenBackend):
         )
 
     def save(self, token: Token) -> None:
-        """Upsert the singleton row inside a serialisable transaction."""
+        """Upsert the token's row inside a serialisable transaction."""
         from django.db import transaction
 
-        from teamleader.django.models import TeamleaderToken
-
+        model, lookup = self._row()
         with transaction.atomic():
             # Lock the row (or the gap) so concurrent workers don't race.
-            obj = TeamleaderToken.objects.select_for_update().filter(pk=1).first()
+            obj = model._default_manager.select_for_update().filter(**lookup).first()
             if obj is None:
-                obj = TeamleaderToken(pk=1)
+                obj = model(**lookup)
             obj.access_token = token.access_token
             obj.refresh_token = token.refresh_token
             obj.expires_at = token.expires_at
             obj.save()
 
     def clear(self) -> None:
-        """Delete the singleton row (no-op if it does not exist)."""
-        from teamleader.django.models import TeamleaderToken
+        """Delete the token's row (no-op if it does not exist)."""
+        model, lookup = self._row()
+        model._default_manager.filter(**lookup).delete()
+
+    async def aget(self) -> Token | None:
+        """Async :meth:`get`, using ``afirst()``."""
+        model, lookup = self._row()
+        obj = await model._default_manager.filter(**lookup).afirst()
+        return None if obj is None else self._token(obj)
+
+    async def asave(self, token: Token) -> None:
+        """Async :meth:`save`; ``aupdate_or_create()`` locks the row too."""
+        model, lookup = self._row()
+        await model._default_manager.aupdate_or_create(
+            **lookup,
+            defaults={
+                "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
+                "expires_at": token.expires_at,
+            },
+        )
+
+    async def aclear(self) -> None:
+        """Async :meth:`clear`."""
+        model, lookup = self._row()
+        await model._default_manager.filter(**lookup).adelete()
+
+
+def _tenant_key(key: str, tenant_id: str | None) -> str:
+    """*key*, made specific to *tenant_id* when one is given."""
+    return key if tenant_id is None else f"{key}:{tenant_id}"
+
+
+class TieredTokenBackend(TokenBackend):
+    """In-process L1 token cache over an L2 backend, invalidated by version.
+
+    :meth:`get` answers from memory while the version marker stored in
+    ``django.core.cache`` is unchanged, costing one cache lookup instead of
+    a database query.  :meth:`save` and :meth:`clear` write through to L2
+    and set a new, random version, so every other worker sharing the cache
+    re-reads L2 on its next :meth:`get` and picks up the rotated token.
+
+    L2 is also re-read while the token is within *recheck_within* seconds of
+    expiry — by then another worker may already have refreshed it, and with
+    a per-process cache (``LocMemCache``) the version marker is not shared.
+    A missing marker (cold or flushed cache) counts as a change.
+
+    :meth:`refresh_lock` is L2's own lock when it has one; otherwise (the
+    database default) it is an ``add()`` lock in the same cache as the
+    version marker, as in :class:`CacheTokenBackend`, so only one worker
+    sharing that cache refreshes the token at a time.
+
+    Use it as ``TEAMLEADER["TOKEN_BACKEND"] =
+    "teamleader.django.token_store.TieredTokenBackend"``.
+
+    Parameters
+    ----------
+    l2:
+        Backend holding the token of record.  Defaults to a
+        :class:`DatabaseTokenBackend` for *tenant_id*.
+    cache_alias:
+        ``settings.CACHES`` alias holding the version marker.  Use a cache
+        shared by all workers (Redis, Memcached, database) for cross-worker
+        invalidation.
+    version_key:
+        Cache key of the version marker, default :data:`TOKEN_VERSION_KEY`.
+        Suffixed with ``:<tenant_id>`` for a tenant, even when given, so
+        tenants never share it.
+    recheck_within:
+        Seconds before expiry from which L2 is re-read on every call.
+    lock_timeout, poll_interval:
+        For the cache refresh lock, see :class:`CacheTokenBackend`; the lock
+        uses ``f"{version_key}:refresh-lock"``.
+    hooks:
+        :class:`~teamleader.hooks.ClientHooks` told about every lookup via
+        ``cache_lookup("tokens", hit)``; hits are answered from L1.
+    tenant_id:
+        Hold this tenant's token, see :class:`DatabaseTokenBackend`.
+    """
+
+    def __init__(
+        self,
+        l2: TokenBackend | None = None,
+        *,
+        cache_alias: str = "default",
+        version_key: str | None = None,
+        recheck_within: float = 300.0,
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        hooks: Iterable[ClientHooks] = (),
+        tenant_id: str | None = None,
+    ) -> None:
+        self.l2 = l2 if l2 is not None else DatabaseTokenBackend(tenant_id)
+        self.cache_alias = cache_alias
+        self.version_key = _tenant_key(version_key or TOKEN_VERSION_KEY, tenant_id)
+        self.recheck_within = recheck_within
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.hooks: list[ClientHooks] = list(hooks)
+        self._token: Token | None = None
+        self._version: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def _cache(self) -> BaseCache:
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+    def _fresh(self, token: Token) -> bool:
+        expires_at = token.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        remaining = (expires_at - datetime.now(tz=timezone.utc)).total_seconds()
+        return remaining > self.recheck_within
+
+    def _report(self, hit: bool) -> None:
+        for hook in self.hooks:
+            hook.cache_lookup("tokens", hit)
+
+    def get(self) -> Token | None:
+        """Return the token from L1, re-reading L2 if it may be stale."""
+        cache = self._cache
+        version = cache.get(self.version_key)
+        token = self._l1(version)
+        if token is not None:
+            return token
+        if version is None:
+            # Cold cache: publish a marker so the next call can hit L1.
+            cache.add(self.version_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(self.version_key)
+        return self._store(self.l2.get(), version)
+
+    async def aget(self) -> Token | None:
+        """Async :meth:`get`, using the async cache API and L2's ``aget()``."""
+        cache = self._cache
+        version = await cache.aget(self.version_key)
+        token = self._l1(version)
+        if token is not None:
+            return token
+        if version is None:
+            await cache.aadd(self.version_key, uuid.uuid4().hex, timeout=None)
+            version = await cache.aget(self.version_key)
+        return self._store(await self.l2.aget(), version)
+
+    def _l1(self, version: str | None) -> Token | None:
+        """The L1 token if *version* is current and it is fresh; reports the lookup."""
+        with self._lock:
+            token = self._token
+            hit = (
+                token is not None
+                and version is not None
+                and version == self._version
+                and self._fresh(token)
+            )
+        self._report(hit)
+        return token if hit else None
+
+    def _store(self, token: Token | None, version: str | None) -> Token | None:
+        with self._lock:
+            self._token = token
+            self._version = version
+        return token
 
-        TeamleaderToken.objects.filter(pk=1).delete()
+    def save(self, token: Token) -> None:
+        """Save *token* to L2 and L1, and announce a new version."""
+        self.l2.save(token)
+        self._bump(token)
+
+    def clear(self) -> None:
+        """Delete the token from L2 and L1, and announce a new version."""
+        self.l2.clear()
+        self._bump(None)
+
+    async def asave(self, token: Token) -> None:
+        """Async :meth:`save`."""
+        await self.l2.asave(token)
+        await self._cache.aset(self.version_key, self._new_version(token), timeout=None)
+
+    async def aclear(self) -> None:
+        """Async :meth:`clear`."""
+        await self.l2.aclear()
+        await self._cache.aset(self.version_key, self._new_version(None), timeout=None)
+
+    def refresh_lock(self) -> AbstractContextManager[object]:
+        """L2's refresh lock, or a cache lock if L2 does not lock."""
+        if type(self.l2).refresh_lock is not TokenBackend.refresh_lock:
+            return self.l2.refresh_lock()
+        return _cache_lock(
+            self._cache,
+            f"{self.version_key}:refresh-lock",
+            self.lock_timeout,
+            self.poll_interval,
+        )
+
+    def _bump(self, token: Token | None) -> None:
+        self._cache.set(self.version_key, self._new_version(token), timeout=None)
+
+    def _new_version(self, token: Token | None) -> str:
+        """Store *token* in L1 under a new version and return the version."""
+        version = uuid.uuid4().hex
+        self._store(token, version)
+        return version
+
+
+class CacheTokenBackend(TokenBackend):
+    """Token in ``django.core.cache``, written through to the database.
+
+    :meth:`get` costs one cache GET; on a miss (cold or evicted cache) it
+    reads the :class:`DatabaseTokenBackend` row and puts it back in the
+    cache.  :meth:`save` writes the database first, so the row stays the
+    source of truth, then the cache.
+
+    :meth:`refresh_lock` is a lock in the same cache, taken with the atomic
+    ``cache.add()``: across every worker that shares the cache only one
+    refreshes the token at a time, and the others wait and then reuse the
+    token it saved.  The lock expires after *lock_timeout* seconds, so a
+    worker that dies mid-refresh cannot block the others for longer.
+
+    Requires a cache shared by all workers with an atomic ``add()`` —
+    Redis, Memcached or the database cache, not ``LocMemCache`` or
+    ``DummyCache`` across processes.  Use it as
+    ``TEAMLEADER["TOKEN_BACKEND"] =
+    "teamleader.django.token_store.CacheTokenBackend"``.
+
+    Parameters
+    ----------
+    cache_alias:
+        ``settings.CACHES`` alias to use.
+    key:
+        Cache key of the token, default :data:`TOKEN_CACHE_KEY`; the lock
+        uses ``f"{key}:refresh-lock"``.  Suffixed with ``:<tenant_id>`` for
+        a tenant, even when given, so tenants never share a token.
+    lock_timeout:
+        Seconds after which a held refresh lock expires.
+    poll_interval:
+        Seconds between attempts to take a held refresh lock.
+    hooks:
+        :class:`~teamleader.hooks.ClientHooks` told about every lookup via
+        ``cache_lookup("tokens", hit)``.
+    tenant_id:
+        Hold this tenant's token, see :class:`DatabaseTokenBackend`.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_alias: str = "default",
+        key: str | None = None,
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        hooks: Iterable[ClientHooks] = (),
+        tenant_id: str | None = None,
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.key = _tenant_key(key or TOKEN_CACHE_KEY, tenant_id)
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.hooks: list[ClientHooks] = list(hooks)
+        self.database = DatabaseTokenBackend(tenant_id)
+
+    @property
+    def _cache(self) -> BaseCache:
+        from django.core.cache import caches
+
+        return caches[self.cache_alias]
+
+    @staticmethod
+    def _dump(token: Token) -> dict[str, Any]:
+        return {
+            "access_token": token.access_token,
+            "refresh_token": token.refresh_token,
+            "expires_at": token.expires_at.isoformat(),
+        }
+
+    @staticmethod
+    def _load(data: dict[str, Any]) -> Token:
+        return Token(
+            access_token=data["access_token"],
+            refresh_token=data["refresh_token"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+        )
+
+    def get(self) -> Token | None:
+        """Return the cached token, falling back to (and re-caching) the database."""
+        cache = self._cache
+        data = cache.get(self.key)
+        hit = data is not None
+        for hook in self.hooks:
+            hook.cache_lookup("tokens", hit)
+        if hit:
+            return self._load(data)
+        token = self.database.get()
+        if token is not None:
+            cache.add(self.key, self._dump(token), timeout=None)
+        return token
+
+    def save(self, token: Token) -> None:
+        """Write *token* to the database, then to the cache."""
+        self.database.save(token)
+        self._cache.set(self.key, self._dump(token), timeout=None)
+
+    def clear(self) -> None:
+        """Delete the token from the database and the cache."""
+        self.database.clear()
+        self._cache.delete(self.key)
+
+    async def aget(self) -> Token | None:
+        """Async :meth:`get`."""
+        cache = self._cache
+        data = await cache.aget(self.key)
+        hit = data is not None
+        for hook in self.hooks:
+            hook.cache_lookup("tokens", hit)
+        if hit:
+            return self._load(data)
+        token = await self.database.aget()
+        if token is not None:
+            await cache.aadd(self.key, self._dump(token), timeout=None)
+        return token
+
+    async def asave(self, token: Token) -> None:
+        """Async :meth:`save`."""
+        await self.database.asave(token)
+        await self._cache.aset(self.key, self._dump(token), timeout=None)
+
+    async def aclear(self) -> None:
+        """Async :meth:`clear`."""
+        await self.database.aclear()
+        await self._cache.adelete(self.key)
+
+    def refresh_lock(self) -> AbstractContextManager[object]:
+        """Cache lock shared by every worker, taken with ``cache.add()``."""
+        return _cache_lock(
+            self._cache,
+            f"{self.key}:refresh-lock",
+            self.lock_timeout,
+            self.poll_interval,
+        )
+
+
+@contextmanager
+def _cache_lock(
+    cache: BaseCache, key: str, timeout: float, poll_interval: float
+) -> Iterator[None]:
+    """Hold *key* in *cache* for the block; wait while another owner holds it.
+
+    ``add()`` only stores the key if it is absent, atomically on shared
+    caches.  The key expires after *timeout* seconds, which bounds the wait
+    if its owner died.  It is only deleted by its owner.
+    """
+    owner = uuid.uuid4().hex
+    while not cache.add(key, owner, timeout=timeout):
+        time.sleep(poll_interval)
+    try:
+        yield
+    finally:
+        if cache.get(key) == owner:
+            cache.delete(key)
@@ -0,0 +1,37 @@
+"""Django views for the Teamleader SDK.
+
+Implements:
+- metrics — serves SDK metrics in the OpenMetrics text format for Prometheus
+
+Wire it into your URLconf (and keep it off the public internet)::
+
+    from teamleader.django.views import metrics
+
+    urlpatterns = [
+        path("internal/teamleader-metrics", metrics),
+    ]
+
+Clients from :func:`~teamleader.django.get_client` report to the served
+collector when ``TEAMLEADER["METRICS"]`` is true.
+"""
+
+from __future__ import annotations
+
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_safe
+
+from teamleader.hooks import MetricsCollector
+from teamleader.metrics import CONTENT_TYPE, render
+
+
+@require_safe  # type: ignore[untyped-decorator]
+def metrics(
+    request: HttpRequest, collector: MetricsCollector | None = None
+) -> HttpResponse:
+    """Return *collector*'s metrics (default: ``DEFAULT_COLLECTOR``) as OpenMetrics.
+
+    Pass a different collector through the URLconf's extra kwargs::
+
+        path("metrics", metrics, {"collector": my_collector})
+    """
+    return HttpResponse(render(collector), content_type=CONTENT_TYPE)
@@ -0,0 +1,162 @@
+"""Warm a freshly started worker before its first request.
+
+Implements:
+- warm_up()       — load the token, open pooled connections, preload
+  reference data; returns how long each step took
+- start_warm_up() — run :func:`warm_up` in a background thread when
+  ``TEAMLEADER["WARM_UP"]`` is set
+
+Enabled with ``TEAMLEADER["WARM_UP"]``, either ``True`` or a dict::
+
+    TEAMLEADER = {
+        ...,
+        "WARM_UP": {
+            "CONNECTIONS": 4,                      # default 2
+            "REFERENCE_DATA": ["deal_phases", "users"],  # default: all
+        },
+    }
+
+and started by the process that serves requests, not on import, so
+management commands and the autoreloader's parent process do not warm up::
+
+    # wsgi.py (or asgi.py)
+    application = get_wsgi_application()
+    start_warm_up()
+
+With gunicorn ``--preload`` the application is loaded once in the master
+process; call :func:`start_warm_up` from a ``post_fork`` hook instead, so
+each worker warms itself.  The first request a worker serves then does not
+pay for reading the token, the TLS handshakes and the reference lists.
+Each step is independent: one failing is logged as a warning and the others
+still run.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from teamleader.constants import BASE_URL
+
+if TYPE_CHECKING:
+    from teamleader.client import TeamleaderClient
+
+logger = logging.getLogger(__name__)
+
+#: Default ``TEAMLEADER["WARM_UP"]["CONNECTIONS"]``.
+DEFAULT_WARM_UP_CONNECTIONS = 2
+
+
+def _options(conf: dict[str, Any]) -> dict[str, Any]:
+    options = conf.get("WARM_UP")
+    return options if isinstance(options, dict) else {}
+
+
+def _open_connections(client: TeamleaderClient, count: int) -> None:
+    """Send *count* concurrent ``HEAD`` requests to the API host.
+
+    Concurrent so that each opens its own connection, which then stays in
+    the transport's pool.  The answer is irrelevant and no API call (nor
+    rate-limit budget) is spent.
+    """
+    barrier = threading.Barrier(count, timeout=client._timeout)
+
+    def head(_: int) -> None:
+        barrier.wait()
+        client._transport.request(
+            "HEAD", f"{BASE_URL}/", timeout=client._timeout
+        ).close()
+
+    with ThreadPoolExecutor(count, thread_name_prefix="teamleader-warm-up") as pool:
+        list(pool.map(head, range(count)))
+
+
+def warm_up(client: TeamleaderClient | None = None) -> dict[str, float]:
+    """Prepare *client* (default :func:`~teamleader.django.get_client`).
+
+    Steps, each timed and run even if an earlier one failed:
+
+    ``token``
+        Read (or refresh) the access token, filling in-process token caches
+        such as :class:`~teamleader.django.token_store.TieredTokenBackend`'s.
+    ``connections``
+        Open ``WARM_UP["CONNECTIONS"]`` pooled connections to the API host
+        (at most ``POOL_SIZE``).
+    ``reference:<name>``
+        :func:`~teamleader.django.reference.get_reference_data` for each of
+        ``WARM_UP["REFERENCE_DATA"]``; lists already cached are not fetched
+        again.
+
+    Returns ``{step: milliseconds}`` for the steps that succeeded.
+    """
+    from django.conf import settings
+
+    from teamleader.django import DEFAULT_POOL_SIZE, get_client
+    from teamleader.django.reference import REFERENCE_DATA, get_reference_data
+
+    conf: dict[str, Any] = getattr(settings, "TEAMLEADER", {})
+    options = _options(conf)
+    if client is None:
+        client = get_client()
+    connections = min(
+        options.get("CONNECTIONS", DEFAULT_WARM_UP_CONNECTIONS),
+        conf.get("POOL_SIZE", DEFAULT_POOL_SIZE),
+    )
+
+    steps: list[tuple[str, Callable[[], object]]] = [
+        ("token", client._auth_headers),
+    ]
+    if connections > 0:
+        steps.append(("connections", partial(_open_connections, client, connections)))
+    for name in options.get("REFERENCE_DATA", REFERENCE_DATA):
+        steps.append(
+            (f"reference:{name}", partial(get_reference_data, name, client=client))
+        )
+
+    timings: dict[str, float] = {}
+    for step, run in steps:
+        started = time.perf_counter()
+        try:
+            run()
+        except Exception:
+            logger.warning("Teamleader warm-up step %r failed", step, exc_info=True)
+            continue
+        timings[step] = (time.perf_counter() - started) * 1000
+    logger.info(
+        "Teamleader warm-up finished: %s",
+        ", ".join(f"{step} {ms:.0f} ms" for step, ms in timings.items()) or "nothing",
+    )
+    return timings
+
+
+def _run() -> None:
+    from django.db import connections
+
+    try:
+        warm_up()
+    except Exception:
+        logger.warning("Teamleader warm-up failed", exc_info=True)
+    finally:
+        # Token backends may have opened a connection in this thread.
+        connections.close_all()
+
+
+def start_warm_up() -> threading.Thread | None:
+    """Run :func:`warm_up` in a daemon thread if ``TEAMLEADER["WARM_UP"]`` is set.
+
+    Call it from the WSGI/ASGI entry point, or from gunicorn's ``post_fork``
+    hook with ``--preload``.  Returns the thread, or ``None`` when warm-up
+    is off.
+    """
+    from django.conf import settings
+
+    if not getattr(settings, "TEAMLEADER", {}).get("WARM_UP"):
+        return None
+    thread = threading.Thread(target=_run, name="teamleader-warm-up", daemon=True)
+    thread.start()
+    return thread
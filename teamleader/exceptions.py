@@ -101,5 +101,25 @@ class TeamleaderValidationError(TeamleaderError):
     """422 — the request body failed server-side validation."""
 
 
+class TeamleaderRequestValidationError(TeamleaderValidationError):
+    """The request body was rejected locally, before any HTTP request.
+
+    Raised by :meth:`~teamleader.client.TeamleaderClient.call` when the client
+    was created with ``validate_requests=True`` and the body does not match
+    the spec's request schema.  Subclasses :class:`TeamleaderValidationError`
+    so code handling server-side 422s also handles local rejections.
+
+    Attributes
+    ----------
+    errors:
+        One ``"path: problem"`` message per violation, e.g.
+        ``"lead.customer.type: must be one of ['company', 'contact']"``.
+    """
+
+    def __init__(self, message: str = "", *, errors: list[str] | None = None) -> None:
+        super().__init__(message)
+        self.errors = errors or []
+
+
 class TeamleaderPermissionError(TeamleaderError):
     """403 — the OAuth token lacks the required scope for this operation."""
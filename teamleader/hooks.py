@@ -0,0 +1,369 @@
+"""Request lifecycle hooks and an in-memory metrics collector.
+
+Implements:
+- RequestEvent       — one API request: operation, status, bytes, timings
+- TokenRefreshEvent  — one access-token refresh
+- ClientHooks        — base class with a no-op method per lifecycle event;
+  subclass it and override what you need
+- MetricsCollector   — ClientHooks that aggregates per-operation latency
+  histograms, status and error counts, bytes, 429s, retries, pages per
+  ``iterate()`` and cache hits in memory; export it with
+  :mod:`teamleader.metrics`
+
+Register hooks when building the client (or append to ``client.hooks``)::
+
+    from teamleader.hooks import MetricsCollector
+
+    metrics = MetricsCollector()
+    client = TeamleaderClient(handler, hooks=[metrics])
+    ...
+    print(metrics.snapshot()["operations"]["deals.list"])
+
+Event order for one request::
+
+    request_start → response_received → [retry → request_start → …]
+                  → request_finished
+
+``token_refresh`` fires just before ``request_start`` whenever the access
+token had to be refreshed to build the ``Authorization`` header.
+``iterate_finished`` fires once per curated ``iterate()`` call,
+``cache_lookup`` whenever an SDK cache is consulted, and ``memo_hit``
+(instead of the request events) for a read answered from memory.  Hooks run
+synchronously on the calling thread; an exception raised by a hook
+propagates to the caller.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+#: Upper bounds (milliseconds) of the :class:`MetricsCollector` latency
+#: histogram buckets; a final ``+Inf`` bucket catches the rest.
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+#: Upper bounds of the pages-per-``iterate()`` histogram buckets.
+DEFAULT_PAGE_BUCKETS: tuple[float, ...] = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """State of one API request, updated as it progresses.
+
+    The same instance is passed to every hook for a given attempt; fields
+    that are not known yet keep their defaults (``None`` / ``0``).
+
+    Attributes
+    ----------
+    operation_id:
+        Operation ID, e.g. ``"deals.list"``.
+    method:
+        HTTP method (``"POST"`` for nearly every endpoint).
+    attempt:
+        ``1`` for the first attempt, incremented on every retry.
+    status_code:
+        HTTP status, or ``None`` until the response has arrived (and when
+        the transport raised).
+    bytes_out / bytes_in:
+        Size of the encoded request body / the response body.  For streamed
+        responses ``bytes_in`` is counted as the body is consumed.
+    auth_ms / network_ms / decode_ms:
+        Time spent obtaining the ``Authorization`` header (including any
+        token refresh), waiting for the transport, and decoding the body
+        (mapping errors included).
+    retry_after:
+        ``Retry-After`` seconds of a 429 response, else ``None``.
+    error:
+        Exception class name if the request failed, else ``None``.
+    """
+
+    operation_id: str
+    method: str = "POST"
+    attempt: int = 1
+    status_code: int | None = None
+    bytes_out: int = 0
+    bytes_in: int = 0
+    auth_ms: float = 0.0
+    network_ms: float = 0.0
+    decode_ms: float = 0.0
+    retry_after: float | None = None
+    error: str | None = None
+
+    @property
+    def total_ms(self) -> float:
+        """``auth_ms + network_ms + decode_ms``."""
+        return self.auth_ms + self.network_ms + self.decode_ms
+
+
+@dataclass(slots=True)
+class TokenRefreshEvent:
+    """One refresh of the OAuth2 access token.
+
+    Attributes
+    ----------
+    duration_ms:
+        Time spent on the token request and saving the new token.
+    error:
+        Exception class name if the refresh failed, else ``None``.
+    """
+
+    duration_ms: float
+    error: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Hook interface
+# ---------------------------------------------------------------------------
+
+
+class ClientHooks:
+    """Receives lifecycle events from :class:`~teamleader.client.TeamleaderClient`.
+
+    Every method is a no-op; override the ones you need.
+    """
+
+    def request_start(self, event: RequestEvent) -> None:
+        """The request body is encoded and about to be sent."""
+
+    def response_received(self, event: RequestEvent) -> None:
+        """Response headers arrived; ``status_code`` and ``network_ms`` are set."""
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        """*event*'s attempt was rate-limited and will be retried in *delay* seconds."""
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """The body was decoded (or the request failed); all fields are final."""
+
+    def token_refresh(self, event: TokenRefreshEvent) -> None:
+        """The access token was refreshed before sending a request."""
+
+    def iterate_finished(self, operation_id: str, pages: int) -> None:
+        """A resource ``iterate()`` over *operation_id* ended after *pages* pages.
+
+        Also fires when the caller stops iterating early.
+        """
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        """The SDK cache named *cache* was consulted; *hit* if it had the value."""
+
+    def memo_hit(self, operation_id: str) -> None:
+        """A read was answered by :func:`teamleader.memo.memoize`, not the API."""
+
+
+# ---------------------------------------------------------------------------
+# Collector
+# ---------------------------------------------------------------------------
+
+
+class _OperationStats:
+    __slots__ = (
+        "count",
+        "statuses",
+        "errors",
+        "buckets",
+        "sum_ms",
+        "bytes_in",
+        "bytes_out",
+        "rate_limited",
+        "retry_after_s",
+        "retries",
+        "iterations",
+        "page_buckets",
+        "pages",
+    )
+
+    def __init__(self, n_buckets: int, n_page_buckets: int) -> None:
+        self.count = 0
+        self.statuses: dict[int | None, int] = {}
+        self.errors: dict[str, int] = {}
+        self.buckets = [0] * (n_buckets + 1)
+        self.sum_ms = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.rate_limited = 0
+        self.retry_after_s = 0.0
+        self.retries = 0
+        self.iterations = 0
+        self.page_buckets = [0] * (n_page_buckets + 1)
+        self.pages = 0
+
+
+class MetricsCollector(ClientHooks):
+    """Aggregates request metrics per operation, in memory and thread-safe.
+
+    Parameters
+    ----------
+    buckets_ms:
+        Upper bounds of the latency histogram buckets in milliseconds.
+        Defaults to :data:`DEFAULT_BUCKETS_MS`.
+    page_buckets:
+        Upper bounds of the pages-per-``iterate()`` histogram buckets.
+        Defaults to :data:`DEFAULT_PAGE_BUCKETS`.
+
+    Notes
+    -----
+    Latency is :attr:`RequestEvent.total_ms` of each finished request.
+    Every 429 response counts under ``rate_limited`` (with its
+    ``Retry-After``); attempts that were then retried count under
+    ``retries``, not as errors or requests.
+    """
+
+    def __init__(
+        self,
+        buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS,
+        page_buckets: tuple[float, ...] = DEFAULT_PAGE_BUCKETS,
+    ) -> None:
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self.page_buckets = tuple(sorted(page_buckets))
+        self._operations: dict[str, _OperationStats] = {}
+        self._caches: dict[str, list[int]] = {}
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._refresh_ms = 0.0
+        self._lock = threading.Lock()
+
+    def _stats(self, operation_id: str) -> _OperationStats:
+        stats = self._operations.get(operation_id)
+        if stats is None:
+            stats = self._operations[operation_id] = _OperationStats(
+                len(self.buckets_ms), len(self.page_buckets)
+            )
+        return stats
+
+    def response_received(self, event: RequestEvent) -> None:
+        if event.status_code != 429:
+            return
+        with self._lock:
+            stats = self._stats(event.operation_id)
+            stats.rate_limited += 1
+            stats.retry_after_s += event.retry_after or 0.0
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        with self._lock:
+            self._stats(event.operation_id).retries += 1
+
+    def request_finished(self, event: RequestEvent) -> None:
+        total = event.total_ms
+        index = bisect.bisect_left(self.buckets_ms, total)
+        with self._lock:
+            stats = self._stats(event.operation_id)
+            stats.count += 1
+            stats.statuses[event.status_code] = (
+                stats.statuses.get(event.status_code, 0) + 1
+            )
+            stats.buckets[index] += 1
+            stats.sum_ms += total
+            stats.bytes_in += event.bytes_in
+            stats.bytes_out += event.bytes_out
+            if event.error is not None:
+                stats.errors[event.error] = stats.errors.get(event.error, 0) + 1
+
+    def token_refresh(self, event: TokenRefreshEvent) -> None:
+        with self._lock:
+            self._refreshes += 1
+            self._refresh_ms += event.duration_ms
+            if event.error is not None:
+                self._refresh_errors += 1
+
+    def iterate_finished(self, operation_id: str, pages: int) -> None:
+        index = bisect.bisect_left(self.page_buckets, pages)
+        with self._lock:
+            stats = self._stats(operation_id)
+            stats.iterations += 1
+            stats.page_buckets[index] += 1
+            stats.pages += pages
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._caches.setdefault(cache, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return every metric as a JSON-serialisable ``dict``.
+
+        Layout::
+
+            {
+              "buckets_ms": [5.0, 10.0, …],
+              "page_buckets": [1.0, 2.0, …],
+              "operations": {
+                "deals.list": {
+                  "count": 12,
+                  "statuses": {"200": 11, "404": 1},   # "none": transport failed
+                  "errors": {"TeamleaderNotFoundError": 1},
+                  "histogram": [0, 3, 8, …, 0],   # per bucket, last is +Inf
+                  "sum_ms": 812.4, "bytes_in": 120345, "bytes_out": 480,
+                  "rate_limited": 2, "retry_after_s": 4.0, "retries": 2,
+                  "iterations": 1, "pages_histogram": [0, 0, 1, …, 0],
+                  "pages": 3
+                }
+              },
+              "token_refresh": {"count": 1, "errors": 0, "sum_ms": 140.2},
+              "caches": {"tokens": {"hits": 40, "misses": 1}}
+            }
+        """
+        with self._lock:
+            return {
+                "buckets_ms": list(self.buckets_ms),
+                "page_buckets": list(self.page_buckets),
+                "operations": {
+                    operation_id: {
+                        "count": stats.count,
+                        "statuses": {
+                            "none" if status is None else str(status): n
+                            for status, n in sorted(
+                                stats.statuses.items(), key=lambda item: item[0] or 0
+                            )
+                        },
+                        "errors": dict(stats.errors),
+                        "histogram": list(stats.buckets),
+                        "sum_ms": stats.sum_ms,
+                        "bytes_in": stats.bytes_in,
+                        "bytes_out": stats.bytes_out,
+                        "rate_limited": stats.rate_limited,
+                        "retry_after_s": stats.retry_after_s,
+                        "retries": stats.retries,
+                        "iterations": stats.iterations,
+                        "pages_histogram": list(stats.page_buckets),
+                        "pages": stats.pages,
+                    }
+                    for operation_id, stats in sorted(self._operations.items())
+                },
+                "token_refresh": {
+                    "count": self._refreshes,
+                    "errors": self._refresh_errors,
+                    "sum_ms": self._refresh_ms,
+                },
+                "caches": {
+                    name: {"hits": hits, "misses": misses}
+                    for name, (hits, misses) in sorted(self._caches.items())
+                },
+            }
+
+    def reset(self) -> None:
+        """Discard everything collected so far."""
+        with self._lock:
+            self._operations.clear()
+            self._caches.clear()
+            self._refreshes = 0
+            self._refresh_errors = 0
+            self._refresh_ms = 0.0
@@ -0,0 +1,131 @@
+"""Request-scoped memoisation of read calls.
+
+Implements:
+- memoize()    — context manager; inside it, identical read requests made
+  through the same :class:`~teamleader.client.TeamleaderClient` in the
+  same thread (or asyncio task) are sent once
+- RequestMemo  — what one :func:`memoize` block remembered, and how many
+  requests it sent, how long they took and how many it served from memory
+- is_read()    — whether an operation is memoised
+
+Typical use is one block per web request, so templates and services that
+each fetch the same deal cost one API call (see
+:class:`teamleader.django.middleware.TeamleaderMiddleware`)::
+
+    from teamleader.memo import memoize
+
+    with memoize() as memo:
+        client.deals.get(deal_id)
+        client.deals.get(deal_id)  # served from memory
+    print(memo.calls, memo.hits, memo.duration_ms)  # 1 1 42.0
+
+Reads are ``*.list``, ``*.listSomething``, ``*.info`` and ``users.me``;
+two reads are identical when they go through the same client and their
+operation and encoded request body match.  Clients never share remembered
+responses, so one block can safely span several accounts (the tenants of
+a :class:`~teamleader.pool.TeamleaderClientPool`, say).  Any other
+request sent inside the block (a create, update, move, …) forgets every
+remembered response, since it may have changed them.  Responses are kept
+as the raw body bytes and decoded again on every hit, so callers never
+share (and cannot corrupt) a returned ``dict``.  Streamed requests
+(``stream=True``) are counted but not memoised.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from teamleader.hooks import RequestEvent
+
+_current: ContextVar[RequestMemo | None] = ContextVar(
+    "teamleader_request_memo", default=None
+)
+
+
+def is_read(operation_id: str) -> bool:
+    """Return ``True`` if *operation_id* only reads, and may be memoised."""
+    action = operation_id.rpartition(".")[2]
+    return action.startswith("list") or action in ("info", "me")
+
+
+class RequestMemo:
+    """Responses remembered by one :func:`memoize` block, plus totals.
+
+    Attributes
+    ----------
+    deduplicate:
+        ``False`` when the block only counts requests and sends every one.
+    calls:
+        Requests sent to the API inside the block (memoised or not).
+    hits:
+        Reads answered from memory instead.
+    duration_ms:
+        Sum of :attr:`~teamleader.hooks.RequestEvent.total_ms` of the
+        requests sent.
+    """
+
+    def __init__(self, *, deduplicate: bool = True) -> None:
+        self.deduplicate = deduplicate
+        self._responses: dict[tuple[object, str, bytes | None], bytes] = {}
+        # Threads started with a copy of the context (see
+        # teamleader.tracing.propagate_context) share this memo.
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+        self.duration_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: tuple[object, str, bytes | None]) -> bytes | None:
+        """Return the remembered body for *key*, counting a hit, or ``None``."""
+        content = self._responses.get(key)
+        if content is not None:
+            with self._lock:
+                self.hits += 1
+        return content
+
+    def put(self, key: tuple[object, str, bytes | None], content: bytes) -> None:
+        """Remember the response body *content* for *key*."""
+        self._responses[key] = content
+
+    def invalidate(self) -> None:
+        """Forget every remembered response."""
+        self._responses.clear()
+
+    def record(self, event: RequestEvent) -> None:
+        """Count the finished request *event*."""
+        with self._lock:
+            self.calls += 1
+            self.duration_ms += event.total_ms
+
+
+def current() -> RequestMemo | None:
+    """Return the active :class:`RequestMemo`, if inside :func:`memoize`."""
+    return _current.get()
+
+
+@contextmanager
+def memoize(*, deduplicate: bool = True) -> Iterator[RequestMemo]:
+    """Memoise identical reads until the block exits; yield its :class:`RequestMemo`.
+
+    With ``deduplicate=False`` every request is sent and only the totals
+    are kept.  A block inside another one shares the outer block's memo
+    (and its *deduplicate*), so the outer totals cover every request made
+    within it.
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+    memo = RequestMemo(deduplicate=deduplicate)
+    token = _current.set(memo)
+    try:
+        yield memo
+    finally:
+        _current.reset(token)
@@ -0,0 +1,235 @@
+"""OpenMetrics (Prometheus) exposition of SDK metrics.
+
+Implements:
+- DEFAULT_COLLECTOR — process-wide :class:`~teamleader.hooks.MetricsCollector`
+  that the Django integration registers on its clients when
+  ``TEAMLEADER["METRICS"]`` is true
+- render          — a collector's metrics in the OpenMetrics text format
+- make_wsgi_app   — a standalone WSGI app serving :func:`render`
+- CONTENT_TYPE    — the OpenMetrics ``Content-Type`` header value
+
+Uses only the standard library — ``prometheus_client`` is not needed.  The
+Django view lives in :mod:`teamleader.django.views`.
+
+Standalone usage::
+
+    from wsgiref.simple_server import make_server
+    from teamleader.metrics import DEFAULT_COLLECTOR, make_wsgi_app
+
+    client = TeamleaderClient(handler, hooks=[DEFAULT_COLLECTOR])
+    make_server("", 9464, make_wsgi_app()).serve_forever()
+
+Exposed metric families (all labelled by ``operation_id`` unless noted):
+
+=============================================  =========  ==========================
+``teamleader_requests_total``                  counter    + ``status`` label
+``teamleader_request_errors_total``            counter    + ``error`` label
+``teamleader_request_duration_seconds``        histogram
+``teamleader_request_bytes_total``             counter    request bodies
+``teamleader_response_bytes_total``            counter    response bodies
+``teamleader_rate_limited_total``              counter    429 responses
+``teamleader_rate_limit_retry_after_seconds``  counter    summed ``Retry-After``
+``teamleader_retries_total``                   counter
+``teamleader_iterate_pages``                   histogram  pages per ``iterate()``
+``teamleader_token_refreshes_total``           counter    no labels
+``teamleader_token_refresh_errors_total``      counter    no labels
+``teamleader_token_refresh_duration_seconds``  summary    no labels
+``teamleader_cache_lookups_total``             counter    ``cache`` and ``result``
+=============================================  =========  ==========================
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from teamleader.hooks import MetricsCollector
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+#: Collector shared by everything in this process that opts into metrics.
+DEFAULT_COLLECTOR = MetricsCollector()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _family(name: str, kind: str, help_text: str, unit: str = "") -> Iterator[str]:
+    yield f"# TYPE {name} {kind}"
+    if unit:
+        yield f"# UNIT {name} {unit}"
+    yield f"# HELP {name} {help_text}"
+
+
+def _histogram(
+    name: str,
+    bounds: Iterable[float],
+    counts: list[int],
+    total: float,
+    divisor: float = 1.0,
+    **labels: str,
+) -> Iterator[str]:
+    """Cumulative ``_bucket`` samples, ``_count`` and ``_sum``; bounds ÷ *divisor*."""
+    cumulative = 0
+    for bound, count in zip([*bounds, float("inf")], counts):
+        cumulative += count
+        le = "+Inf" if bound == float("inf") else repr(bound / divisor)
+        yield f"{name}_bucket{_labels(**labels, le=le)} {cumulative}"
+    yield f"{name}_count{_labels(**labels)} {cumulative}"
+    yield f"{name}_sum{_labels(**labels)} {_number(total)}"
+
+
+def render(collector: MetricsCollector | None = None) -> str:
+    """Return *collector*'s metrics in the OpenMetrics text format.
+
+    Parameters
+    ----------
+    collector:
+        Defaults to :data:`DEFAULT_COLLECTOR`.
+    """
+    snap = (collector if collector is not None else DEFAULT_COLLECTOR).snapshot()
+    ops: dict[str, dict[str, Any]] = snap["operations"]
+    lines: list[str] = []
+    add = lines.extend
+
+    def per_op(name: str, key: str) -> None:
+        for op, stats in ops.items():
+            lines.append(f"{name}{_labels(operation_id=op)} {_number(stats[key])}")
+
+    add(_family("teamleader_requests", "counter", "Finished API requests."))
+    for op, stats in ops.items():
+        for status, n in stats["statuses"].items():
+            labels = _labels(operation_id=op, status=status)
+            lines.append(f"teamleader_requests_total{labels} {n}")
+
+    add(
+        _family(
+            "teamleader_request_errors", "counter", "Failed API requests by exception."
+        )
+    )
+    for op, stats in ops.items():
+        for error, n in stats["errors"].items():
+            labels = _labels(operation_id=op, error=error)
+            lines.append(f"teamleader_request_errors_total{labels} {n}")
+
+    name = "teamleader_request_duration_seconds"
+    add(
+        _family(
+            name, "histogram", "Auth, network and decode time per request.", "seconds"
+        )
+    )
+    for op, stats in ops.items():
+        if stats["count"]:
+            add(
+                _histogram(
+                    name,
+                    snap["buckets_ms"],
+                    stats["histogram"],
+                    stats["sum_ms"] / 1000,
+                    divisor=1000,
+                    operation_id=op,
+                )
+            )
+
+    add(
+        _family(
+            "teamleader_request_bytes", "counter", "Request body bytes sent.", "bytes"
+        )
+    )
+    per_op("teamleader_request_bytes_total", "bytes_out")
+    add(
+        _family(
+            "teamleader_response_bytes", "counter", "Response body bytes read.", "bytes"
+        )
+    )
+    per_op("teamleader_response_bytes_total", "bytes_in")
+
+    add(
+        _family(
+            "teamleader_rate_limited", "counter", "429 Too Many Requests responses."
+        )
+    )
+    per_op("teamleader_rate_limited_total", "rate_limited")
+    name = "teamleader_rate_limit_retry_after_seconds"
+    add(_family(name, "counter", "Sum of Retry-After on 429 responses.", "seconds"))
+    per_op(f"{name}_total", "retry_after_s")
+    add(_family("teamleader_retries", "counter", "Rate-limited requests retried."))
+    per_op("teamleader_retries_total", "retries")
+
+    add(
+        _family(
+            "teamleader_iterate_pages", "histogram", "Pages fetched per iterate() call."
+        )
+    )
+    for op, stats in ops.items():
+        if stats["iterations"]:
+            add(
+                _histogram(
+                    "teamleader_iterate_pages",
+                    snap["page_buckets"],
+                    stats["pages_histogram"],
+                    stats["pages"],
+                    operation_id=op,
+                )
+            )
+
+    refresh = snap["token_refresh"]
+    add(_family("teamleader_token_refreshes", "counter", "Access-token refreshes."))
+    lines.append(f"teamleader_token_refreshes_total {refresh['count']}")
+    add(
+        _family(
+            "teamleader_token_refresh_errors",
+            "counter",
+            "Failed access-token refreshes.",
+        )
+    )
+    lines.append(f"teamleader_token_refresh_errors_total {refresh['errors']}")
+    name = "teamleader_token_refresh_duration_seconds"
+    add(_family(name, "summary", "Time spent refreshing the access token.", "seconds"))
+    lines.append(f"{name}_count {refresh['count']}")
+    lines.append(f"{name}_sum {_number(refresh['sum_ms'] / 1000)}")
+
+    add(_family("teamleader_cache_lookups", "counter", "SDK cache lookups by result."))
+    for cache, counts in snap["caches"].items():
+        for result, key in (("hit", "hits"), ("miss", "misses")):
+            labels = _labels(cache=cache, result=result)
+            lines.append(f"teamleader_cache_lookups_total{labels} {counts[key]}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def make_wsgi_app(
+    collector: MetricsCollector | None = None,
+) -> Callable[[dict[str, Any], Callable[..., Any]], list[bytes]]:
+    """Return a WSGI app that serves :func:`render` for *collector* on every path.
+
+    ``GET`` and ``HEAD`` get the metrics; other methods get 405.
+    """
+
+    def app(environ: dict[str, Any], start_response: Callable[..., Any]) -> list[bytes]:
+        method = environ.get("REQUEST_METHOD", "GET")
+        if method not in ("GET", "HEAD"):
+            start_response("405 Method Not Allowed", [("Allow", "GET, HEAD")])
+            return [b""]
+        body = render(collector).encode()
+        start_response(
+            "200 OK",
+            [("Content-Type", CONTENT_TYPE), ("Content-Length", str(len(body)))],
+        )
+        return [b""] if method == "HEAD" else [body]
+
+    return app
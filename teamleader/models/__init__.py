@@ -20,6 +20,7 @@ from teamleader.models.common import (
 from teamleader.models.company import Company
 from teamleader.models.contact import Contact
 from teamleader.models.deal import Deal
+from teamleader.models.interning import Interner, interning
 from teamleader.models.invoice import Invoice
 from teamleader.models.quotation import Quotation
 
@@ -40,4 +41,7 @@ __all__ = [
     "Deal",
     "Invoice",
     "Quotation",
+    # deserialisation helpers
+    "Interner",
+    "interning",
 ]
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Self
 
+from teamleader.models.interning import active_interner, intern_str
+
 
 @dataclass
 class TypeAndId:
@@ -15,9 +17,12 @@ class TypeAndId:
 
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Self:
+        interner = active_interner()
+        if interner is not None:
+            return interner.ref(cls, data)
         return cls(
             id=data.get("id", ""),
-            type=data.get("type", ""),
+            type=intern_str(data.get("type", "")),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -144,7 +149,7 @@ class Money:
     def from_api(cls, data: dict[str, Any]) -> Self:
         return cls(
             amount=float(data.get("amount", 0.0)),
-            currency=data.get("currency", ""),
+            currency=intern_str(data.get("currency", "")),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -165,6 +170,9 @@ class CustomField:
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Self:
         definition = data.get("definition") or {}
+        interner = active_interner()
+        if interner is not None and definition:
+            definition = interner.definition(definition)
         return cls(
             id=definition.get("id", ""),
             value=data.get("value"),
@@ -0,0 +1,131 @@
+"""Value interning for large deserialisation scans.
+
+Long ``iterate()`` scans decode the same small strings over and over: every
+deal carries ``"type": "user"`` references, ``"EUR"`` currency codes, the same
+handful of department and user UUIDs, and identical custom-field definition
+dicts.  The JSON decoder hands back a fresh object for each occurrence.
+
+An :class:`Interner` collapses those duplicates so that every repeated value
+shares a single object.  Activate one for the duration of a scan with
+:func:`interning`; every ``from_api()`` call made inside the block picks it up::
+
+    from teamleader.models.interning import interning
+
+    with interning():
+        deals = list(client.deals.iterate())
+
+Outside an ``interning()`` block deserialisation behaves exactly as before,
+except that short vocabulary strings (``TypeAndId.type``, ``Money.currency``)
+are always passed through :func:`sys.intern`.
+
+Notes
+-----
+Deduplicated :class:`~teamleader.models.common.TypeAndId` references are
+**shared** between the models of one scan.  Treat them as read-only — mutating
+``deal.department.id`` would change the department of every deal in the scan
+that points at the same department.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_active: ContextVar[Interner | None] = ContextVar("teamleader_interner", default=None)
+
+
+class Interner:
+    """Per-scan table of shared strings, references and definition dicts.
+
+    A fresh interner is cheap; create one per scan so its tables are released
+    together with the scan's results.
+    """
+
+    __slots__ = ("_strings", "_refs", "_definitions")
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._refs: dict[tuple[type, str, str], Any] = {}
+        self._definitions: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def intern(self, value: str) -> str:
+        """Return the canonical copy of *value* for this scan."""
+        return self._strings.setdefault(value, value)
+
+    def ref(self, cls: type[T], data: dict[str, Any]) -> T:
+        """Return the shared ``cls(id=..., type=...)`` instance for *data*.
+
+        *cls* is any class constructed from ``id`` and ``type`` keyword
+        arguments — in practice :class:`~teamleader.models.common.TypeAndId`.
+        """
+        id_ = data.get("id", "")
+        type_ = data.get("type", "")
+        key = (cls, id_, type_)
+        ref = self._refs.get(key)
+        if ref is None:
+            ref = cls(id=self.intern(id_), type=intern_str(type_))  # type: ignore[call-arg]
+            self._refs[key] = ref
+        return ref
+
+    def definition(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the shared copy of a flat definition dict.
+
+        Dicts holding unhashable values (nested lists or dicts) are returned
+        unchanged.
+        """
+        try:
+            key = tuple(sorted(data.items()))
+            return self._definitions.setdefault(key, data)
+        except TypeError:
+            return data
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of distinct strings, references and definitions held."""
+        return {
+            "strings": len(self._strings),
+            "refs": len(self._refs),
+            "definitions": len(self._definitions),
+        }
+
+
+def intern_str(value: Any) -> Any:
+    """Pass *value* through :func:`sys.intern` if it is a ``str``.
+
+    Any other value (``None`` for a missing field, say) is returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def active_interner() -> Interner | None:
+    """Return the interner activated by the innermost :func:`interning` block."""
+    return _active.get()
+
+
+@contextmanager
+def interning(interner: Interner | None = None) -> Iterator[Interner]:
+    """Activate *interner* (or a fresh one) for every ``from_api()`` in the block.
+
+    Parameters
+    ----------
+    interner:
+        An existing :class:`Interner` to reuse — e.g. to share one table
+        across several resources in a mirror job.  A new one is created when
+        omitted.
+
+    Yields
+    ------
+    Interner
+        The active interner, handy for :meth:`Interner.stats`.
+    """
+    if interner is None:
+        interner = Interner()
+    token = _active.set(interner)
+    try:
+        yield interner
+    finally:
+        _active.reset(token)
@@ -0,0 +1,319 @@
+"""Clients for many Teamleader accounts in one process.
+
+Implements:
+- TeamleaderClientPool — one :class:`~teamleader.client.TeamleaderClient`
+  per tenant, built on first use, all sending through one shared connection
+  pool; least recently used and idle clients are evicted
+- RateLimiter          — client-side sliding-window request limit
+
+Usage::
+
+    from teamleader.pool import TeamleaderClientPool
+
+    pool = TeamleaderClientPool(
+        client_id="...",
+        client_secret="...",
+        redirect_uri="https://example.com/teamleader/callback",
+        token_backend=lambda tenant_id: FileTokenBackend(f"tokens/{tenant_id}.json"),
+        rate_limit=200,
+    )
+    deal = pool.get("acme").deals.get("some-uuid")
+
+Every tenant has its own :class:`~teamleader.auth.OAuth2Handler` and token
+backend, and its own :class:`RateLimiter`, so one busy tenant cannot use up
+another's API budget.  The clients share the Marketplace app credentials,
+the hooks and a single :class:`~teamleader.transport.Transport`: hundreds of
+tenants need no more sockets than *pool_size*.
+
+A tenant's client is cheap to build (no request is sent), so the pool keeps
+at most *max_clients* of them and drops those unused for *idle_timeout*
+seconds; the next :meth:`~TeamleaderClientPool.get` builds a new one.  Rate
+limiters belong to the pool and outlive eviction, so a rebuilt client does
+not start with a fresh window.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+import requests
+
+from teamleader.auth import OAuth2Handler, TokenBackend
+from teamleader.client import TeamleaderClient
+from teamleader.constants import BASE_URL
+from teamleader.transport import RequestsTransport, Transport
+
+#: Default number of pooled connections shared by every tenant.
+DEFAULT_POOL_SIZE = 10
+
+#: Default *max_clients* of :class:`TeamleaderClientPool`.
+DEFAULT_MAX_CLIENTS = 100
+
+#: Default *idle_timeout* of :class:`TeamleaderClientPool`, in seconds.
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+class RateLimiter:
+    """Allows at most *limit* requests in any *window* seconds.
+
+    :meth:`acquire` blocks until a request may be sent.  Thread-safe.
+    """
+
+    def __init__(self, limit: int, window: float = 60.0) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.window = window
+        self._sent: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Wait for a free slot and take it; return the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._expire(now)
+                if len(self._sent) < self.limit:
+                    self._sent.append(now)
+                    return waited
+                delay = self.window - (now - self._sent[0])
+            time.sleep(delay)
+            waited += delay
+
+    def empty(self) -> bool:
+        """Whether no request was sent in the last *window* seconds."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return not self._sent
+
+    def _expire(self, now: float) -> None:
+        """Forget requests older than the window; caller holds the lock."""
+        while self._sent and now - self._sent[0] >= self.window:
+            self._sent.popleft()
+
+
+class _TenantTransport(Transport):
+    """A tenant's view of the shared transport, throttled by its limiter.
+
+    :meth:`close` does nothing: the shared transport belongs to the pool.
+    """
+
+    def __init__(self, transport: Transport, limiter: RateLimiter | None) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        if self._limiter is not None:
+            self._limiter.acquire()
+        return self._transport.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+
+
+class _Tenant:
+    __slots__ = ("client", "last_used")
+
+    def __init__(self, client: TeamleaderClient) -> None:
+        self.client = client
+        self.last_used = time.monotonic()
+
+
+class TeamleaderClientPool:
+    """Per-tenant clients over one shared connection pool.
+
+    Parameters
+    ----------
+    client_id, client_secret, redirect_uri, scopes:
+        The Marketplace app, the same for every tenant.
+    token_backend:
+        Called with a tenant ID, returns the
+        :class:`~teamleader.auth.TokenBackend` holding that tenant's token.
+    max_clients:
+        Clients kept at most; the least recently used one is dropped to
+        make room.  Defaults to :data:`DEFAULT_MAX_CLIENTS`.
+    idle_timeout:
+        Seconds after which an unused client is dropped, or ``None`` to keep
+        clients until *max_clients* forces them out.  Defaults to
+        :data:`DEFAULT_IDLE_TIMEOUT`.
+    rate_limit:
+        Requests each tenant may send per *rate_window* seconds; more wait
+        for a free slot instead of being rejected with 429.  A tenant's
+        window is kept when its client is evicted.  ``None`` (the default)
+        does not limit.
+    rate_window:
+        Length of the rate-limit window in seconds (default ``60``).
+    pool_size:
+        Pooled connections to the API host, shared by every tenant.
+        Ignored when *transport* is given.  Defaults to
+        :data:`DEFAULT_POOL_SIZE`.
+    transport:
+        :class:`~teamleader.transport.Transport` shared by every tenant's
+        client and token handler.  Defaults to a
+        :class:`~teamleader.transport.RequestsTransport` whose session
+        pools *pool_size* connections.
+    **client_options:
+        Passed to every :class:`~teamleader.client.TeamleaderClient`, e.g.
+        ``timeout``, ``max_retries``, ``hooks`` or ``codec``.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        token_backend: Callable[[str], TokenBackend],
+        scopes: list[str] | None = None,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+        rate_limit: int | None = None,
+        rate_window: float = 60.0,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        transport: Transport | None = None,
+        **client_options: Any,
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.redirect_uri = redirect_uri
+        self.scopes = scopes or []
+        self.token_backend = token_backend
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.transport: Transport = (
+            transport if transport is not None else _pooled_transport(pool_size)
+        )
+        if "hooks" in client_options:
+            client_options["hooks"] = list(client_options["hooks"])
+        self._client_options = client_options
+        self._tenants: OrderedDict[str, _Tenant] = OrderedDict()
+        self._limiters: dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, tenant_id: str) -> TeamleaderClient:
+        """Return *tenant_id*'s client, building it if it is not pooled."""
+        with self._lock:
+            self._evict_idle()
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                while len(self._tenants) >= self.max_clients:
+                    self._tenants.popitem(last=False)
+                tenant = self._tenants[tenant_id] = _Tenant(self._build(tenant_id))
+            else:
+                self._tenants.move_to_end(tenant_id)
+                tenant.last_used = time.monotonic()
+            return tenant.client
+
+    def auth_handler(self, tenant_id: str) -> OAuth2Handler:
+        """*tenant_id*'s :class:`~teamleader.auth.OAuth2Handler`.
+
+        Use it to connect a new tenant: send the user to
+        :meth:`~teamleader.auth.OAuth2Handler.get_authorization_url` and pass
+        the code Teamleader redirects back with to
+        :meth:`~teamleader.auth.OAuth2Handler.exchange_code`, which saves
+        the token in the tenant's backend.
+        """
+        return self.get(tenant_id)._auth
+
+    def evict(self, tenant_id: str) -> bool:
+        """Drop *tenant_id*'s client; return whether it was pooled."""
+        with self._lock:
+            return self._tenants.pop(tenant_id, None) is not None
+
+    def close(self) -> None:
+        """Drop every client and close the shared transport."""
+        with self._lock:
+            self._tenants.clear()
+            self._limiters.clear()
+        self.transport.close()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._tenants
+
+    def _evict_idle(self) -> None:
+        """Drop clients unused for :attr:`idle_timeout`; caller holds the lock."""
+        if self.idle_timeout is None:
+            return
+        cutoff = time.monotonic() - self.idle_timeout
+        # Least recently used first, so stop at the first recent one.
+        while self._tenants:
+            tenant_id, tenant = next(iter(self._tenants.items()))
+            if tenant.last_used > cutoff:
+                break
+            del self._tenants[tenant_id]
+
+    def _limiter(self, tenant_id: str) -> RateLimiter | None:
+        """*tenant_id*'s limiter, kept across clients; caller holds the lock.
+
+        Limiters of tenants no longer pooled are dropped once their window
+        is empty, when nothing is lost by starting a new one.
+        """
+        if self.rate_limit is None:
+            return None
+        idle = [
+            other
+            for other, limiter in self._limiters.items()
+            if other not in self._tenants and limiter.empty()
+        ]
+        for other in idle:
+            del self._limiters[other]
+        limiter = self._limiters.get(tenant_id)
+        if limiter is None:
+            limiter = RateLimiter(self.rate_limit, self.rate_window)
+            self._limiters[tenant_id] = limiter
+        return limiter
+
+    def _build(self, tenant_id: str) -> TeamleaderClient:
+        limiter = self._limiter(tenant_id)
+        handler = OAuth2Handler(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            redirect_uri=self.redirect_uri,
+            token_backend=self.token_backend(tenant_id),
+            scopes=self.scopes,
+            transport=self.transport,
+        )
+        return TeamleaderClient(
+            handler,
+            transport=_TenantTransport(self.transport, limiter),
+            **self._client_options,
+        )
+
+
+def _pooled_transport(pool_size: int) -> Transport:
+    """A :class:`~teamleader.transport.RequestsTransport` pooling *pool_size*
+    connections to the API host."""
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount(
+        f"{BASE_URL}/", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    )
+    return RequestsTransport(session)
@@ -0,0 +1,260 @@
+"""Sampled cProfile and tracemalloc capture for individual SDK calls.
+
+Implements:
+- CallProfiler   — profiles a random sample of :meth:`TeamleaderClient.call
+  <teamleader.client.TeamleaderClient.call>` and ``CrudResource.iterate()``
+  operations, writing one cProfile stats file and one tracemalloc diff per
+  profiled operation
+- ProfileResult  — where a profiled operation's files went, and how long it
+  took
+
+Attach a profiler to a client (or set ``TEAMLEADER["PROFILING"]`` in Django,
+see :func:`teamleader.django.get_client`)::
+
+    from teamleader.profiling import CallProfiler
+
+    client.profiler = CallProfiler("/var/tmp/teamleader-profiles", rate=0.05)
+
+Each profiled operation writes, in *directory*::
+
+    20250101T120000-4242-1-deals.iterate.prof          # pstats / snakeviz
+    20250101T120000-4242-1-deals.iterate.tracemalloc.txt
+
+The ``.prof`` file loads with ``python -m pstats`` or ``snakeviz``; the text
+file lists the source lines whose allocations grew the most between the
+start and the end of the operation.
+
+For ``iterate()`` the profiler is only enabled while the SDK produces the
+next item — the caller's loop body is not profiled — but the memory diff
+covers everything the iteration kept alive, including what the caller held
+on to.  cProfile and tracemalloc are process-wide, so at most one operation
+is profiled at a time; calls sampled while another is being profiled run
+unprofiled.  Unsampled calls cost one :func:`random.random` call.  Files
+that cannot be written are logged as a warning; the operation itself is
+unaffected.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Held while an operation is profiled, in any thread.
+_ACTIVE = threading.Lock()
+
+_NOT_PROFILED: AbstractContextManager[None] = nullcontext()
+
+_sequence = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Files written for one profiled operation.
+
+    Attributes
+    ----------
+    operation:
+        Operation ID (``"deals.list"``) or ``"<prefix>.iterate"``.
+    stats_path:
+        cProfile stats, loadable with :class:`pstats.Stats`.
+    memory_path:
+        tracemalloc top-allocations diff, or ``None`` when memory capture
+        is off.
+    duration_ms:
+        Wall time from start to end of the operation.
+    """
+
+    operation: str
+    stats_path: Path
+    memory_path: Path | None
+    duration_ms: float
+
+
+class _Run:
+    """One profiled operation: the profiler plus the memory baseline."""
+
+    def __init__(self, owner: CallProfiler, operation: str) -> None:
+        self.owner = owner
+        self.operation = operation
+        self.profile = cProfile.Profile()
+        self.started_tracemalloc = False
+        self.before: tracemalloc.Snapshot | None = None
+        if owner.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(owner.frames)
+                self.started_tracemalloc = True
+            self.before = tracemalloc.take_snapshot()
+        self.start = time.perf_counter()
+
+    def finish(self) -> ProfileResult:
+        duration_ms = (time.perf_counter() - self.start) * 1000
+        owner = self.owner
+        # Stop tracemalloc before writing anything, so a failed write
+        # cannot leave it running.
+        after = None
+        if self.before is not None:
+            after = tracemalloc.take_snapshot()
+            if self.started_tracemalloc:
+                tracemalloc.stop()
+
+        owner.directory.mkdir(parents=True, exist_ok=True)
+        stem = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{next(_sequence)}"
+            f"-{self.operation}"
+        )
+        stats_path = owner.directory / f"{stem}.prof"
+        self.profile.dump_stats(stats_path)
+
+        memory_path = None
+        if self.before is not None and after is not None:
+            ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+            diff = after.filter_traces(ignore).compare_to(
+                self.before.filter_traces(ignore), "lineno"
+            )
+            memory_path = owner.directory / f"{stem}.tracemalloc.txt"
+            lines = [
+                f"# {self.operation}: top {owner.top} allocation changes "
+                f"over {duration_ms:.1f} ms",
+                *(str(stat) for stat in diff[: owner.top]),
+            ]
+            memory_path.write_text("\n".join(lines) + "\n")
+
+        result = ProfileResult(self.operation, stats_path, memory_path, duration_ms)
+        owner.results.append(result)
+        return result
+
+
+class CallProfiler:
+    """Profiles a random fraction of SDK operations.
+
+    Parameters
+    ----------
+    directory:
+        Where stats files are written; created on first use.
+    rate:
+        Fraction of operations to profile, from ``0.0`` (none) to ``1.0``
+        (all).  Defaults to ``0.01``.
+    memory:
+        Also capture a tracemalloc diff.  Starts tracemalloc for the
+        duration of the operation unless it is already running, which
+        slows the profiled operation down noticeably.  Defaults to ``True``.
+    frames:
+        Stack depth recorded by tracemalloc when this profiler starts it.
+    top:
+        Number of lines in each tracemalloc diff.
+    sample:
+        Returns a float in ``[0, 1)`` per operation; defaults to
+        :func:`random.random`.  Replace it for deterministic tests.
+
+    Attributes
+    ----------
+    results:
+        The last 100 :class:`ProfileResult`\\ s, oldest first.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        rate: float = 0.01,
+        memory: bool = True,
+        frames: int = 10,
+        top: int = 25,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"rate must be between 0 and 1, got {rate!r}")
+        self.directory = Path(directory)
+        self.rate = rate
+        self.memory = memory
+        self.frames = frames
+        self.top = top
+        self._sample = sample
+        self.results: deque[ProfileResult] = deque(maxlen=100)
+
+    def _start(self, operation: str) -> _Run | None:
+        """Start profiling *operation* if it is sampled and nothing else is."""
+        if self.rate <= 0.0 or self._sample() >= self.rate:
+            return None
+        if not _ACTIVE.acquire(blocking=False):
+            return None
+        try:
+            return _Run(self, operation)
+        except BaseException:
+            _ACTIVE.release()
+            raise
+
+    def _finish(self, run: _Run) -> None:
+        """Write *run*'s files; a write error is logged, not raised."""
+        try:
+            run.finish()
+        except OSError:
+            logger.warning(
+                "Could not write the profile of %s to %s",
+                run.operation,
+                self.directory,
+                exc_info=True,
+            )
+
+    def profile(self, operation: str) -> AbstractContextManager[None]:
+        """Context manager profiling the enclosed block if *operation* is sampled."""
+        run = self._start(operation)
+        if run is None:
+            return _NOT_PROFILED
+        return self._profiled_block(run)
+
+    @contextmanager
+    def _profiled_block(self, run: _Run) -> Iterator[None]:
+        try:
+            run.profile.enable()
+            try:
+                yield
+            finally:
+                run.profile.disable()
+                self._finish(run)
+        finally:
+            _ACTIVE.release()
+
+    def profile_iterator(self, operation: str, iterator: Iterator[T]) -> Iterator[T]:
+        """Return *iterator*, profiled while it produces items if sampled.
+
+        Sampling is decided when iteration starts, not when this is called.
+        """
+        run = self._start(operation)
+        if run is None:
+            yield from iterator
+            return
+        try:
+            while True:
+                run.profile.enable()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    run.profile.disable()
+                yield item
+        finally:
+            try:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+                self._finish(run)
+            finally:
+                _ACTIVE.release()
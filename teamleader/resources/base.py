@@ -13,9 +13,13 @@ exposes lazy forward-pagination via :meth:`Page.next`.
 
 from __future__ import annotations
 
+import builtins
+import dataclasses
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, Generic, Iterator, TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from teamleader import tracing
 from teamleader.constants import DEFAULT_PAGE_SIZE
 
 if TYPE_CHECKING:
@@ -42,10 +46,11 @@ class Page(Generic[M]):
 
     Notes
     -----
-    After construction :class:`CrudResource` injects two private attributes used
-    for forward-pagination.  ``_resource`` is a back-reference to the
+    After construction :class:`CrudResource` injects three private attributes
+    used for forward-pagination.  ``_resource`` is a back-reference to the
     :class:`CrudResource` that produced this page; ``_filters`` are the extra
-    ``**filters`` kwargs forwarded verbatim when fetching the next page.
+    ``**filters`` kwargs forwarded verbatim when fetching the next page;
+    ``_fields`` is the field projection (``None`` for full models).
     """
 
     data: list[M]
@@ -58,6 +63,9 @@ class Page(Generic[M]):
     _filters: dict[str, Any] = field(
         default_factory=dict, init=False, repr=False, compare=False
     )
+    _fields: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def has_next(self) -> bool:
@@ -82,7 +90,15 @@ class Page(Generic[M]):
                 f"No more pages: page {self.current_page} * size {self.page_size}"
                 f" >= total {self.total_count}"
             )
-        return self._resource.list(
+        resource: CrudResource[M] = self._resource
+        if self._fields is not None:
+            return resource.list(
+                page=self.current_page + 1,
+                page_size=self.page_size,
+                fields=self._fields,
+                **self._filters,
+            )
+        return resource.list(
             page=self.current_page + 1,
             page_size=self.page_size,
             **self._filters,
@@ -113,7 +129,7 @@ class CrudResource(Generic[M]):
     """
 
     prefix: str = ""
-    model: type[M]  # type: ignore[misc]
+    model: type[M]
 
     def __init__(self, client: TeamleaderClient) -> None:
         self._client = client
@@ -133,12 +149,104 @@ class CrudResource(Generic[M]):
         """
         return f"{self.prefix}.{operation}"
 
-    def _deserialise(self, data: dict[str, Any]) -> M:
+    def _deserialise(
+        self,
+        data: dict[str, Any],
+        fields: tuple[str, ...] | None = None,
+    ) -> M:
         """Deserialise a single API object dict into a model instance.
 
-        Delegates to ``model.from_api(data)``.
+        Delegates to ``model.from_api(data)``.  When *fields* is given, only
+        those keys are handed to ``from_api``; every other attribute keeps its
+        dataclass default and its raw value is never turned into an object.
+        """
+        if fields is not None:
+            data = {k: data[k] for k in fields if k in data}
+        # M is unbounded, so mypy cannot see the from_api contract above.
+        model: Any = self.model
+        instance: M = model.from_api(data)
+        return instance
+
+    def _projection(self, fields: Iterable[str] | None) -> tuple[str, ...] | None:
+        """Normalise a ``fields=[...]`` argument into a projection tuple.
+
+        ``id`` is always included so projected models stay addressable.
+
+        Raises
+        ------
+        ValueError
+            If a requested field is not an attribute of :attr:`model`.
+        """
+        if fields is None:
+            return None
+        projection = tuple(dict.fromkeys(["id", *fields]))
+        if dataclasses.is_dataclass(self.model):
+            known = {f.name for f in dataclasses.fields(self.model)}
+            unknown = [f for f in projection if f not in known]
+            if unknown:
+                raise ValueError(
+                    f"Unknown field(s) for {self.model.__name__}: {unknown}. "
+                    f"Available: {sorted(known)}."
+                )
+        return projection
+
+    @staticmethod
+    def _list_body(
+        page: int, page_size: int, filters: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the ``{prefix}.list`` request body for one page."""
+        body: dict[str, Any] = {
+            "page": {"size": page_size, "number": page},
+            **filters,
+        }
+
+        # Always request the pagination include so the API returns meta.matches
+        # for endpoints that support it (companies, deals, invoices, …).
+        # Merge with any caller-supplied includes without mutating the original
+        # ``filters`` dict — that dict is stored verbatim on ``page._filters``
+        # so that ``Page.next()`` replays the user-visible includes on every page.
+        user_includes = body.get("includes", "") or ""
+        body["includes"] = ",".join(filter(None, [user_includes, "pagination"]))
+        return body
+
+    def _span(self, operation: str, **attributes: Any) -> Any:
+        """Open a tracing span for one ``{prefix}.{operation}`` call.
+
+        See :mod:`teamleader.tracing`; a no-op without OpenTelemetry.
+        """
+        path = self._path(operation)
+        return tracing.span(
+            f"teamleader {path}", {tracing.OPERATION_ID: path, **attributes}
+        )
+
+    @staticmethod
+    def _page_attributes(page: int, page_size: int) -> dict[str, Any]:
+        return {tracing.PAGE_NUMBER: page, tracing.PAGE_SIZE: page_size}
+
+    @staticmethod
+    def _total_count(
+        meta: dict[str, Any] | None, page: int, page_size: int, count: int
+    ) -> int:
+        """Return the total number of matches across all pages.
+
+        meta.matches is returned only when the endpoint supports
+        ``includes=pagination`` (contacts.list does not; companies and deals
+        do).  Fall back to a length-based heuristic when it is absent:
+
+        - fewer items than page_size  → definitely last page
+        - exactly page_size items     → assume at least one more page exists
+
+        The heuristic causes one extra empty request at the end of iteration,
+        which ``iterate()`` handles gracefully.
         """
-        return self.model.from_api(data)  # type: ignore[return-value]
+        meta = meta or {}
+        if "matches" in meta:
+            return int(meta["matches"])
+        if count < page_size:
+            # Partial page — we know the exact total
+            return (page - 1) * page_size + count
+        # Full page — signal "might have more" with one item over the threshold
+        return page * page_size + 1
 
     # ------------------------------------------------------------------
     # CRUD operations
@@ -149,6 +257,7 @@ class CrudResource(Generic[M]):
         *,
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
+        fields: Iterable[str] | None = None,
         **filters: Any,
     ) -> Page[M]:
         """Return a single page of results.
@@ -160,6 +269,17 @@ class CrudResource(Generic[M]):
         page_size:
             Number of items per page.  Defaults to
             :data:`~teamleader.constants.DEFAULT_PAGE_SIZE` (20).
+        fields:
+            Optional field projection, e.g. ``["title", "status"]``.  Only
+            these attributes (plus ``id``) are parsed from each record; all
+            others keep their defaults.  Use it to skip heavy fields such as
+            ``grouped_lines`` or ``custom_fields`` on large exports.  The
+            projection is carried over to :meth:`Page.next`.
+
+            Projected models are for reading only: their other attributes
+            hold defaults, not the record's values (e.g. ``Deal.status ==
+            "open"``), so passing one to ``to_dict()`` or :meth:`update`
+            would overwrite real data with those defaults.
         **filters:
             Extra top-level body parameters forwarded to the API, e.g.
             ``filter={"email": "..."}``, ``sort=[...]``, ``includes=[...]``.
@@ -172,47 +292,24 @@ class CrudResource(Generic[M]):
             A page whose ``total_count`` reflects ``meta.matches`` from the
             API response — the total across **all** pages, not just this one.
         """
-        body: dict[str, Any] = {
-            "page": {"size": page_size, "number": page},
-            **filters,
-        }
-
-        # Always request the pagination include so the API returns meta.matches
-        # for endpoints that support it (companies, deals, invoices, …).
-        # Merge with any caller-supplied includes without mutating the original
-        # ``filters`` dict — that dict is stored verbatim on ``page._filters``
-        # so that ``Page.next()`` replays the user-visible includes on every page.
-        user_includes = body.get("includes", "") or ""
-        body["includes"] = ",".join(filter(None, [user_includes, "pagination"]))
-
-        resp = self._client._post(self._path("list"), body)
-        items = [self._deserialise(d) for d in resp["data"]]
-
-        # meta.matches is returned only when the endpoint supports
-        # ``includes=pagination`` (contacts.list does not; companies and deals do).
-        # Fall back to a length-based heuristic when it is absent:
-        #   • fewer items than page_size  → definitely last page
-        #   • exactly page_size items     → assume at least one more page exists
-        # The heuristic causes one extra empty request at the end of iteration,
-        # which ``iterate()`` handles gracefully.
-        meta: dict[str, Any] = resp.get("meta") or {}
-        if "matches" in meta:
-            total_count = int(meta["matches"])
-        elif len(items) < page_size:
-            # Partial page — we know the exact total
-            total_count = (page - 1) * page_size + len(items)
-        else:
-            # Full page — signal "might have more" with one item over the threshold
-            total_count = page * page_size + 1
+        projection = self._projection(fields)
+        body = self._list_body(page, page_size, filters)
+        with self._span("list", **self._page_attributes(page, page_size)) as span:
+            resp = self._client._post(self._path("list"), body)
+            items = [self._deserialise(d, projection) for d in resp["data"]]
+            span.set_attribute(tracing.ITEM_COUNT, len(items))
 
         page_obj = Page(
             data=items,
-            total_count=total_count,
+            total_count=self._total_count(
+                resp.get("meta"), page, page_size, len(items)
+            ),
             current_page=page,
             page_size=page_size,
         )
         page_obj._resource = self
         page_obj._filters = filters
+        page_obj._fields = projection
         return page_obj
 
     def get(self, id: str) -> M:
@@ -226,8 +323,9 @@ class CrudResource(Generic[M]):
         id:
             The UUID of the object to retrieve.
         """
-        resp = self._client._post(self._path("info"), {"id": id})
-        return self._deserialise(resp["data"])
+        with self._span("info"):
+            resp = self._client._post(self._path("info"), {"id": id})
+            return self._deserialise(resp["data"])
 
     def create(self, **kwargs: Any) -> M:
         """Create a new object and return the fully-populated model.
@@ -242,9 +340,11 @@ class CrudResource(Generic[M]):
             Fields to set on the new object, as accepted by the ``add``
             endpoint for this resource.
         """
-        resp = self._client._post(self._path("add"), kwargs)
-        new_id: str = resp["data"]["id"]
-        return self.get(new_id)
+        with self._span("add"):
+            self._client._check_body(self._path("add"), kwargs)
+            resp = self._client._post(self._path("add"), kwargs)
+            new_id: str = resp["data"]["id"]
+            return self.get(new_id)
 
     def update(self, id: str, **kwargs: Any) -> M:
         """Update an existing object and return the refreshed model.
@@ -260,8 +360,11 @@ class CrudResource(Generic[M]):
         **kwargs:
             Fields to change, as accepted by the ``update`` endpoint.
         """
-        self._client._post(self._path("update"), {"id": id, **kwargs})
-        return self.get(id)
+        with self._span("update"):
+            body = {"id": id, **kwargs}
+            self._client._check_body(self._path("update"), body)
+            self._client._post(self._path("update"), body)
+            return self.get(id)
 
     def delete(self, id: str) -> None:
         """Delete an object by ID.
@@ -275,9 +378,17 @@ class CrudResource(Generic[M]):
         id:
             The UUID of the object to delete.
         """
-        self._client._post(self._path("delete"), {"id": id})
+        with self._span("delete"):
+            self._client._post(self._path("delete"), {"id": id})
 
-    def iterate(self, page_size: int = DEFAULT_PAGE_SIZE, **filters: Any) -> Iterator[M]:
+    def iterate(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        *,
+        fields: Iterable[str] | None = None,
+        stream: bool = False,
+        **filters: Any,
+    ) -> Iterator[M]:
         """Yield every matching object, transparently fetching additional pages.
 
         This is the preferred way to consume a full result set without dealing
@@ -291,13 +402,94 @@ class CrudResource(Generic[M]):
         page_size:
             Items per page for each underlying :meth:`list` call.  Defaults to
             :data:`~teamleader.constants.DEFAULT_PAGE_SIZE` (20).
+        fields:
+            Optional field projection applied to every page (same semantics
+            as :meth:`list`'s ``fields``)::
+
+                for inv in client.invoices.iterate(fields=["invoice_number", "total"]):
+                    ...
+        stream:
+            Parse each page incrementally (see :mod:`teamleader.streaming`):
+            models are yielded as soon as their JSON has arrived instead of
+            after the whole page is downloaded and decoded, and peak memory
+            is bounded by one item instead of one page.  Recommended for
+            large pages of heavy records such as invoices with
+            ``grouped_lines``.
         **filters:
             Forwarded to every :meth:`list` call (same semantics as
             :meth:`list`'s ``**filters``).
         """
-        current = self.list(page=1, page_size=page_size, **filters)
+        items = self._iterate(page_size, fields, stream, filters)
+        profiler = self._client.profiler
+        if profiler is None:
+            return items
+        return profiler.profile_iterator(self._path("iterate"), items)
+
+    def _iterate(
+        self,
+        page_size: int,
+        fields: Iterable[str] | None,
+        stream: bool,
+        filters: dict[str, Any],
+    ) -> Iterator[M]:
+        """Generator behind :meth:`iterate`."""
+        pages = [0]
+        try:
+            if stream:
+                yield from self._iterate_stream(
+                    page_size, self._projection(fields), filters, pages
+                )
+                return
+            current = self.list(page=1, page_size=page_size, fields=fields, **filters)
+            pages[0] += 1
+            while True:
+                yield from current.data
+                if not current.has_next:
+                    break
+                current = current.next()
+                pages[0] += 1
+        finally:
+            self._client._emit_iterate_finished(self._path("list"), pages[0])
+
+    def _iterate_stream(
+        self,
+        page_size: int,
+        projection: tuple[str, ...] | None,
+        filters: dict[str, Any],
+        pages: builtins.list[int],
+    ) -> Iterator[M]:
+        """Streaming counterpart of :meth:`iterate` — one ``ListStream`` per page.
+
+        Increments ``pages[0]`` for every page requested.  Each page gets a
+        tracing span that stays open until its last item has been consumed;
+        it is not made current, because it stays open across ``yield``.
+        """
+        path = self._path("list")
+        page = 1
         while True:
-            yield from current.data
-            if not current.has_next:
+            span = tracing.start_span(
+                f"teamleader {path}",
+                {tracing.OPERATION_ID: path, **self._page_attributes(page, page_size)},
+            )
+            count = 0
+            try:
+                items = self._client._post_stream(
+                    path, self._list_body(page, page_size, filters)
+                )
+                pages[0] += 1
+                try:
+                    for data in items:
+                        count += 1
+                        yield self._deserialise(data, projection)
+                finally:
+                    items.close()
+            except Exception as exc:
+                tracing.record_error(span, exc)
+                raise
+            finally:
+                span.set_attribute(tracing.ITEM_COUNT, count)
+                span.end()
+            total_count = self._total_count(items.meta, page, page_size, count)
+            if page * page_size >= total_count:
                 break
-            current = current.next()
+            page += 1
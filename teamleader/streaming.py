@@ -0,0 +1,195 @@
+"""Incremental parsing of large ``*.list`` responses.
+
+A list response is a single JSON object::
+
+    {"data": [{...}, {...}, ...], "meta": {"page": {...}, "matches": 1234}}
+
+:class:`ListStream` parses it straight off the socket: every element of
+``data`` is decoded and handed to the consumer as soon as its closing brace
+has arrived, and the bytes it came from are dropped.  Peak memory is bounded
+by one item (plus one network chunk) instead of one page, and the first
+item reaches the consumer before the rest of the page has been downloaded.
+
+The other top-level members (``meta``, ``included``…) are collected as they
+pass and are available from :attr:`ListStream.rest` once the stream is
+exhausted.
+
+Used by :meth:`~teamleader.client.TeamleaderClient.stream` and
+``iterate(stream=True)`` on every resource.
+
+Notes
+-----
+Each item is decoded with :meth:`json.JSONDecoder.raw_decode`, which can
+stop at the end of one value inside a larger buffer; the client's
+:class:`~teamleader.codecs.JSONCodec` is not used here because codecs only
+decode complete documents.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Generator, Iterable, Iterator
+from typing import Any
+
+#: Bytes requested from the socket per read.
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _Reader:
+    """Character buffer over a byte-chunk iterator that discards what it has parsed."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer; ``False`` once input is exhausted."""
+        if self.exhausted:
+            return False
+        # Drop everything already parsed so the buffer holds ~one item.
+        if self.pos:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.buf += self._utf8.decode(b"", final=True)
+            self.exhausted = True
+            return False
+        self.buf += self._utf8.decode(chunk)
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character (``""`` at end of input)."""
+        while True:
+            match = _WHITESPACE.match(self.buf, self.pos)
+            self.pos = match.end()  # type: ignore[union-attr]
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, allowed: str) -> str:
+        """Consume the next structural character, which must be one of *allowed*."""
+        char = self.peek()
+        if not char or char not in allowed:
+            found = repr(char) if char else "end of input"
+            raise ValueError(
+                f"Malformed list response: expected one of {allowed!r}, found {found}"
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number or literal may continue in the next chunk; only accept
+            # the value once the character after it has arrived.
+            match = _WHITESPACE.match(self.buf, end)
+            following = match.end()  # type: ignore[union-attr]
+            if following == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+class ListStream(Iterator[dict[str, Any]]):
+    """Iterator over the items of a streamed ``{"data": [...], ...}`` response.
+
+    Parameters
+    ----------
+    chunks:
+        The response body as an iterable of byte chunks, e.g.
+        ``response.iter_content(DEFAULT_CHUNK_SIZE)``.
+    key:
+        Name of the top-level array to stream.  Defaults to ``"data"``.
+    close:
+        Called once when the stream is exhausted, fails, or is closed early —
+        typically ``response.close`` to release the connection.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        key: str = "data",
+        close: Callable[[], None] | None = None,
+    ) -> None:
+        self._key = key
+        self._close = close
+        self._finished = False
+        self.rest: dict[str, Any] = {}
+        self._items: Generator[dict[str, Any], None, None] = self._parse(
+            _Reader(chunks)
+        )
+
+    def __iter__(self) -> ListStream:
+        return self
+
+    def __next__(self) -> dict[str, Any]:
+        return next(self._items)
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        """The ``meta`` member of the response.
+
+        Raises
+        ------
+        RuntimeError
+            If the stream has not been consumed to the end yet — ``meta``
+            follows ``data`` on the wire.
+        """
+        if not self._finished:
+            raise RuntimeError(
+                "ListStream.meta is only available once every item has been read"
+            )
+        return self.rest.get("meta") or {}
+
+    def close(self) -> None:
+        """Stop reading and release the underlying response."""
+        self._items.close()
+
+    def _parse(self, reader: _Reader) -> Generator[dict[str, Any], None, None]:
+        try:
+            if not reader.peek():
+                # Empty body (e.g. 204) — nothing to stream.
+                self._finished = True
+                return
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.pos += 1
+            else:
+                while True:
+                    name = reader.value()
+                    reader.expect(":")
+                    if name == self._key:
+                        reader.expect("[")
+                        if reader.peek() == "]":
+                            reader.pos += 1
+                        else:
+                            while True:
+                                yield reader.value()
+                                if reader.expect(",]") == "]":
+                                    break
+                    else:
+                        self.rest[name] = reader.value()
+                    if reader.expect(",}") == "}":
+                        break
+            self._finished = True
+        finally:
+            if self._close is not None:
+                self._close()
@@ -0,0 +1,355 @@
+"""In-process fake Teamleader API for offline tests and load benchmarks.
+
+Implements:
+- FakeTeamleader — in-memory implementation of every operation in
+  :data:`~teamleader._generated.endpoints.ENDPOINTS` plus the OAuth token
+  endpoint, with configurable latency, rate limiting and 429 bursts
+- FakeTransport  — a :class:`~teamleader.transport.Transport` that routes
+  requests to a :class:`FakeTeamleader` instead of the network
+
+Operations are served generically from the last segment of their request
+path:
+
+=========================  =================================================
+``*.list``                 paginated records; ``meta.matches`` included when
+                           ``includes`` asks for ``pagination`` (except for
+                           prefixes in ``without_matches``, like the real
+                           ``contacts.list``)
+``*.info``                 ``{"data": record}`` or 404
+``*.add`` / ``*.create``   stores the body, 201 with ``{"data": {type, id}}``
+``*.update``               merges the body into the record, 204
+``*.delete``               removes the record, 204
+anything else              404 if the body's ``id`` is unknown, else 204
+=========================  =================================================
+
+Usage::
+
+    server = FakeTeamleader(latency=0.02)
+    server.seed("deals", [{"title": f"Deal {i}"} for i in range(500)])
+    client = server.client()
+
+    assert sum(1 for _ in client.deals.iterate(page_size=100)) == 500
+    print(len(server.calls))  # 5 list requests
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from teamleader._generated.endpoints import ENDPOINTS, Endpoint
+from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token
+from teamleader.constants import BASE_URL, TOKEN_URL
+from teamleader.transport import Transport, make_response
+
+if TYPE_CHECKING:
+    from teamleader.client import TeamleaderClient
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _singular(prefix: str) -> str:
+    """``"companies"`` → ``"company"``, ``"deals"`` → ``"deal"``."""
+    if prefix.endswith("ies"):
+        return prefix[:-3] + "y"
+    return prefix[:-1] if prefix.endswith("s") else prefix
+
+
+class FakeTeamleader:
+    """In-memory Teamleader Focus API.
+
+    Thread-safe: one instance can serve many concurrent clients.
+
+    Parameters
+    ----------
+    latency:
+        Seconds every request takes before it is answered.
+    rate_limit:
+        Maximum requests accepted per *rate_window* seconds; further
+        requests get a 429 with ``Retry-After``.  ``None`` disables it.
+    rate_window:
+        Length of the rate-limit window in seconds.  Defaults to 60, like
+        the real API.
+    without_matches:
+        Prefixes whose ``*.list`` responses never include ``meta.matches``.
+        Defaults to ``("contacts",)``, matching the real API.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        rate_limit: int | None = None,
+        rate_window: float = 60.0,
+        without_matches: Iterable[str] = ("contacts",),
+    ) -> None:
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.without_matches = frozenset(without_matches)
+        #: ``(operation_id, body)`` for every API request received, in order.
+        self.calls: list[tuple[str, dict[str, Any] | None]] = []
+        self._records: dict[str, dict[str, dict[str, Any]]] = {}
+        self._routes: dict[str, Endpoint] | None = None
+        self._recent: deque[float] = deque()
+        self._burst = 0
+        self._burst_retry_after = 1
+        self._tokens_issued = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Data
+    # ------------------------------------------------------------------
+
+    def seed(self, prefix: str, records: Iterable[dict[str, Any]]) -> list[str]:
+        """Store *records* under *prefix* (e.g. ``"deals"``) and return their ids.
+
+        Records without an ``id`` get a fresh UUID.
+        """
+        ids: list[str] = []
+        with self._lock:
+            table = self._records.setdefault(prefix, {})
+            for record in records:
+                record = {"id": str(uuid.uuid4()), **record}
+                table[record["id"]] = record
+                ids.append(record["id"])
+        return ids
+
+    def records(self, prefix: str) -> list[dict[str, Any]]:
+        """Return a snapshot of every record stored under *prefix*."""
+        with self._lock:
+            return [dict(r) for r in self._records.get(prefix, {}).values()]
+
+    # ------------------------------------------------------------------
+    # Failure injection
+    # ------------------------------------------------------------------
+
+    def burst_429(self, count: int, *, retry_after: int = 1) -> None:
+        """Answer the next *count* API requests with 429 Too Many Requests."""
+        with self._lock:
+            self._burst = count
+            self._burst_retry_after = retry_after
+
+    # ------------------------------------------------------------------
+    # Convenience
+    # ------------------------------------------------------------------
+
+    def client(self, **client_kwargs: Any) -> TeamleaderClient:
+        """Return a :class:`~teamleader.client.TeamleaderClient` wired to this server.
+
+        The client holds a valid access token; refreshes are served by the
+        fake token endpoint.  *client_kwargs* are forwarded to the client.
+        """
+        from teamleader.client import TeamleaderClient
+
+        transport = FakeTransport(self)
+        backend = MemoryTokenBackend()
+        backend.save(
+            Token(
+                access_token="fake-access",
+                refresh_token="fake-refresh",
+                expires_at=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+            )
+        )
+        handler = OAuth2Handler(
+            "fake-client-id",
+            "fake-client-secret",
+            "http://localhost/callback",
+            backend,
+            transport=transport,
+        )
+        return TeamleaderClient(handler, transport=transport, **client_kwargs)
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: dict[str, Any] | None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer one request with ``(status, headers, body bytes)``."""
+        if url == TOKEN_URL:
+            return self._token()
+        if not url.startswith(f"{BASE_URL}/"):
+            return self._error(404, f"Unknown URL {url}")
+        path = url[len(BASE_URL) + 1 :]
+        endpoint = self._route(path)
+        if endpoint is None:
+            return self._error(404, f"Unknown operation {path}")
+
+        with self._lock:
+            self.calls.append((endpoint.operation_id, body))
+            limited = self._rate_limited()
+            if limited is not None:
+                return limited
+
+        if not headers.get("Authorization", "").startswith("Bearer "):
+            return self._error(401, "Missing access token")
+        body = body or {}
+        missing = sorted(endpoint.required - body.keys())
+        if missing:
+            return self._error(
+                422, f"Missing required parameter(s): {', '.join(missing)}"
+            )
+
+        prefix, _, action = path.partition(".")
+        with self._lock:
+            table = self._records.setdefault(prefix, {})
+            if action == "list":
+                return self._list(prefix, table, body)
+            if action in ("add", "create"):
+                record = {"id": str(uuid.uuid4()), **body}
+                table[record["id"]] = record
+                return self._json(
+                    201, {"data": {"type": _singular(prefix), "id": record["id"]}}
+                )
+            if "id" in body and body["id"] not in table:
+                return self._error(404, f"{_singular(prefix).capitalize()} not found")
+            if action == "info":
+                return self._json(200, {"data": dict(table[body["id"]])})
+            if action == "update":
+                table[body["id"]].update(body)
+            elif action == "delete":
+                del table[body["id"]]
+        return 204, {}, b""
+
+    def _route(self, path: str) -> Endpoint | None:
+        if self._routes is None:
+            self._routes = {
+                ENDPOINTS[op].request_path: ENDPOINTS[op] for op in ENDPOINTS
+            }
+        return self._routes.get(path)
+
+    def _rate_limited(self) -> tuple[int, dict[str, str], bytes] | None:
+        """Return a 429 answer if this request exceeds a burst or the rate limit."""
+        if self._burst > 0:
+            self._burst -= 1
+            return self._error(
+                429, "Too many requests", retry_after=self._burst_retry_after
+            )
+        if self.rate_limit is None:
+            return None
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= self.rate_window:
+            self._recent.popleft()
+        if len(self._recent) >= self.rate_limit:
+            retry_after = max(
+                1, int(self.rate_window - (now - self._recent[0]) + 0.999)
+            )
+            return self._error(429, "Too many requests", retry_after=retry_after)
+        self._recent.append(now)
+        return None
+
+    def _list(
+        self, prefix: str, table: dict[str, dict[str, Any]], body: dict[str, Any]
+    ) -> tuple[int, dict[str, str], bytes]:
+        matching = [
+            r for r in table.values() if self._matches(r, body.get("filter") or {})
+        ]
+        page = body.get("page") or {}
+        size = int(page.get("size", 20))
+        number = int(page.get("number", 1))
+        start = (number - 1) * size
+        meta: dict[str, Any] = {"page": {"size": size, "number": number}}
+        includes = str(body.get("includes") or "").split(",")
+        if "pagination" in includes and prefix not in self.without_matches:
+            meta["matches"] = len(matching)
+        return self._json(200, {"data": matching[start : start + size], "meta": meta})
+
+    @staticmethod
+    def _matches(record: dict[str, Any], filters: dict[str, Any]) -> bool:
+        """``filter.ids``, ``filter.term`` and ``filter.updated_since`` plus
+        exact matches on record keys."""
+        for key, value in filters.items():
+            if key == "ids":
+                if record.get("id") not in value:
+                    return False
+            elif key == "updated_since":
+                # ISO 8601 strings in one offset compare chronologically.
+                if str(record.get("updated_at") or "") < str(value):
+                    return False
+            elif key == "term":
+                term = str(value).lower()
+                if not any(
+                    isinstance(v, str) and term in v.lower() for v in record.values()
+                ):
+                    return False
+            elif key in record and record[key] != value:
+                return False
+        return True
+
+    def _token(self) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            self._tokens_issued += 1
+            n = self._tokens_issued
+        return self._json(
+            200,
+            {
+                "token_type": "Bearer",
+                "access_token": f"fake-access-{n}",
+                "refresh_token": f"fake-refresh-{n}",
+                "expires_in": 3600,
+            },
+        )
+
+    @staticmethod
+    def _json(status: int, payload: Any) -> tuple[int, dict[str, str], bytes]:
+        return status, dict(_JSON_HEADERS), json.dumps(payload).encode()
+
+    @classmethod
+    def _error(
+        cls, status: int, title: str, *, retry_after: int | None = None
+    ) -> tuple[int, dict[str, str], bytes]:
+        status, headers, content = cls._json(status, {"errors": [{"title": title}]})
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
+        return status, headers, content
+
+
+class FakeTransport(Transport):
+    """Routes requests to a :class:`FakeTeamleader` instead of the network.
+
+    Parameters
+    ----------
+    server:
+        The fake API to answer requests.
+    """
+
+    def __init__(self, server: FakeTeamleader) -> None:
+        self.server = server
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        # dict bodies are OAuth form posts; bytes are JSON from the client.
+        body: dict[str, Any] | None
+        if isinstance(data, dict):
+            body = data
+        else:
+            body = json.loads(data) if data else None
+        status, response_headers, content = self.server.handle(
+            method, url, headers or {}, body
+        )
+        return make_response(status, content, headers=response_headers, url=url)
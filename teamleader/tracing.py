@@ -0,0 +1,206 @@
+"""Optional OpenTelemetry tracing for API calls and pagination.
+
+Implements:
+- span                — context manager opening a current span (no-op
+  without OpenTelemetry)
+- start_span          — a span that is *not* made current, for work that
+  spans generator ``yield``s (streamed pages)
+- record_error        — mark a :func:`start_span` span as failed
+- inject_traceparent  — the current context as W3C ``traceparent`` /
+  ``tracestate`` headers
+- use_traceparent     — context manager making such headers the current
+  context, e.g. inside a worker thread
+- propagate_context   — wrap a callable so it runs in the caller's trace
+  context, wherever it is executed
+
+Spans are only recorded when ``opentelemetry-api`` is installed (``pip
+install teamleader-sdk[tracing]``) and the application has configured a
+tracer provider; otherwise every function here is a cheap no-op.  The
+package is imported lazily, on the first span, so ``import teamleader``
+stays fast.
+
+The SDK emits one ``CLIENT`` span per :meth:`TeamleaderClient.call
+<teamleader.client.TeamleaderClient.call>` and per curated ``list`` /
+``get`` / ``create`` / ``update`` / ``delete`` — so each page fetched by ``iterate()``
+gets its own span — named ``"teamleader <operation_id>"`` and carrying:
+
+==========================  ==============================================
+``teamleader.operation_id`` e.g. ``"deals.list"``
+``teamleader.page.number``  ``list`` / ``iterate()`` pages only
+``teamleader.page.size``    ``list`` / ``iterate()`` pages only
+``teamleader.item_count``   items returned by list operations
+==========================  ==============================================
+
+Thread pools do not inherit the caller's context; wrap the submitted
+callable::
+
+    from teamleader.tracing import propagate_context
+
+    with tracer.start_as_current_span("crm-sync"):
+        futures = [
+            pool.submit(propagate_context(sync_page), n) for n in range(1, 11)
+        ]
+
+Because the context travels as W3C ``traceparent`` headers, the same works
+for process pools and task queues: send ``inject_traceparent()`` along with
+the job and run it under ``with use_traceparent(headers):``.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+#: Span attribute names.
+OPERATION_ID = "teamleader.operation_id"
+PAGE_NUMBER = "teamleader.page.number"
+PAGE_SIZE = "teamleader.page.size"
+ITEM_COUNT = "teamleader.item_count"
+
+
+class _NoopSpan:
+    """Stands in for both a span and its context manager when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _OpenTelemetry:
+    """The bits of ``opentelemetry-api`` the SDK uses, resolved once."""
+
+    def __init__(self) -> None:
+        from opentelemetry import context, propagate, trace
+
+        from teamleader import __version__
+
+        self.context = context
+        self.propagate = propagate
+        self.client_kind = trace.SpanKind.CLIENT
+        self.error_status = trace.Status(trace.StatusCode.ERROR)
+        # A ProxyTracer until the application installs a provider.
+        self.tracer = trace.get_tracer("teamleader", __version__)
+
+
+_api: _OpenTelemetry | None = None
+_resolved = False
+
+
+def _opentelemetry() -> _OpenTelemetry | None:
+    """Return the OpenTelemetry API, or ``None`` if it is not installed."""
+    global _api, _resolved
+    if not _resolved:
+        try:
+            _api = _OpenTelemetry()
+        except ImportError:
+            _api = None
+        _resolved = True
+    return _api
+
+
+def span(
+    name: str, attributes: Mapping[str, Any] | None = None
+) -> AbstractContextManager[Any]:
+    """Open a ``CLIENT`` span named *name* and make it current.
+
+    The context manager yields the span; call ``set_attribute`` on it to
+    add results such as :data:`ITEM_COUNT`.  Exceptions are recorded on the
+    span and re-raised.
+    """
+    api = _opentelemetry()
+    if api is None:
+        return _NOOP_SPAN
+    current: AbstractContextManager[Any] = api.tracer.start_as_current_span(
+        name, kind=api.client_kind, attributes=attributes
+    )
+    return current
+
+
+def start_span(name: str, attributes: Mapping[str, Any] | None = None) -> Any:
+    """Start a ``CLIENT`` span without making it current; call ``end()`` on it.
+
+    Use this instead of :func:`span` when the work crosses generator
+    ``yield``\\ s — attaching a context in one frame and detaching it after
+    the consumer resumed the generator elsewhere is not allowed.
+    """
+    api = _opentelemetry()
+    if api is None:
+        return _NOOP_SPAN
+    return api.tracer.start_span(name, kind=api.client_kind, attributes=attributes)
+
+
+def record_error(span: Any, exc: BaseException) -> None:
+    """Record *exc* on a :func:`start_span` span and mark the span as failed.
+
+    :func:`span` does this by itself when the exception leaves the block.
+    """
+    api = _opentelemetry()
+    if api is None:
+        return
+    span.record_exception(exc)
+    span.set_status(api.error_status)
+
+
+def inject_traceparent() -> dict[str, str]:
+    """Return the current trace context as W3C ``traceparent``/``tracestate`` headers.
+
+    Empty without OpenTelemetry or outside a recording span.
+    """
+    api = _opentelemetry()
+    carrier: dict[str, str] = {}
+    if api is not None:
+        api.propagate.inject(carrier)
+    return carrier
+
+
+@contextmanager
+def use_traceparent(carrier: Mapping[str, str]) -> Iterator[None]:
+    """Make the trace context in *carrier* (W3C headers) current for the block."""
+    api = _opentelemetry()
+    if api is None or not carrier:
+        yield
+        return
+    token = api.context.attach(api.propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        api.context.detach(token)
+
+
+def propagate_context(fn: F) -> F:
+    """Bind *fn* to the current trace context.
+
+    The context is captured now, as ``traceparent`` headers, and restored
+    around every call of the returned function — on whichever thread runs
+    it.  Returns *fn* unchanged when there is nothing to propagate.
+    """
+    carrier = inject_traceparent()
+    if not carrier:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with use_traceparent(carrier):
+            return fn(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
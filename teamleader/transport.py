@@ -0,0 +1,121 @@
+"""HTTP transport abstraction.
+
+Implements:
+- Transport          — abstract interface: one ``request()`` method returning a
+  :class:`requests.Response`
+- RequestsTransport  — the default, backed by a :class:`requests.Session`
+- make_response      — build a :class:`requests.Response` from raw parts, for
+  transports that do not talk to the network
+
+Both :class:`~teamleader.client.TeamleaderClient` and
+:class:`~teamleader.auth.OAuth2Handler` send every request through a
+transport, so swapping it (e.g. for
+:class:`~teamleader.testing.FakeTransport`) takes the real API out of the
+loop entirely::
+
+    transport = RequestsTransport(my_session_with_retries)
+    client = TeamleaderClient(handler, transport=transport)
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport(ABC):
+    """Sends one HTTP request and returns the response.
+
+    Implementations must not raise for HTTP error statuses — status mapping
+    is the client's job.  Network failures may raise any exception.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send the request and return the response.
+
+        Parameters
+        ----------
+        data:
+            Raw body bytes, or a ``dict`` to be form-encoded (used by the
+            OAuth token endpoint).
+        stream:
+            When ``True`` the body may be read lazily through
+            :meth:`requests.Response.iter_content`.
+        """
+
+    def close(self) -> None:
+        """Release any pooled connections.  The default does nothing."""
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a :class:`requests.Session` (connection pooling).
+
+    Parameters
+    ----------
+    session:
+        Session to send requests with — pass your own to mount adapters,
+        proxies or retries.  A new one is created when omitted.
+    """
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        self.session = session if session is not None else requests.Session()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def make_response(
+    status_code: int,
+    content: bytes = b"",
+    *,
+    headers: dict[str, str] | None = None,
+    url: str = "",
+) -> requests.Response:
+    """Build a fully-read :class:`requests.Response` from raw parts.
+
+    The result behaves like one returned by ``requests`` — ``content``,
+    ``text``, ``json()``, ``ok`` and ``iter_content()`` all work.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = "utf-8"
+    response.url = url
+    return response
@@ -0,0 +1,203 @@
+"""Tests for the asyncio front end (teamleader.aio).
+
+Covers:
+- AsyncTeamleaderClient.call() and awaitable resource methods (get, create,
+  resource-specific ones), errors raised from the awaited call
+- AsyncResource.iterate(): every page, iterate_finished hook
+- Access token read with the backend's aget() on the event loop, refreshed
+  when expired, never read in the worker thread
+- At most max_workers requests in flight; the event loop keeps running
+  while requests wait
+- memoize() blocks around awaited calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from teamleader.aio import AsyncTeamleaderClient
+from teamleader.auth import Token
+from teamleader.exceptions import TeamleaderNotFoundError
+from teamleader.hooks import ClientHooks, RequestEvent
+from teamleader.memo import memoize
+from teamleader.testing import FakeTeamleader
+
+
+class _InFlight(ClientHooks):
+    """Tracks the highest number of requests sent at once."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self.operations: list[str] = []
+        self.iterations: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+
+    def request_start(self, event: RequestEvent) -> None:
+        with self._lock:
+            self.operations.append(event.operation_id)
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def request_finished(self, event: RequestEvent) -> None:
+        with self._lock:
+            self.current -= 1
+
+    def iterate_finished(self, operation_id: str, pages: int) -> None:
+        self.iterations.append((operation_id, pages))
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": f"Deal {i}"} for i in range(5)])
+    return server
+
+
+@pytest.fixture()
+def hooks() -> _InFlight:
+    return _InFlight()
+
+
+@pytest.fixture()
+def aclient(server: FakeTeamleader, hooks: _InFlight) -> Any:
+    aclient = AsyncTeamleaderClient(server.client(hooks=[hooks]), max_workers=2)
+    yield aclient
+    aclient.close()
+
+
+def _deal_id(server: FakeTeamleader) -> str:
+    return str(server.records("deals")[0]["id"])
+
+
+# ---------------------------------------------------------------------------
+# Calls
+# ---------------------------------------------------------------------------
+
+
+class TestCalls:
+    def test_call(self, aclient: AsyncTeamleaderClient) -> None:
+        result = asyncio.run(aclient.call("deals.list"))
+        assert len(result["data"]) == 5
+
+    def test_get(self, server: FakeTeamleader, aclient: AsyncTeamleaderClient) -> None:
+        deal = asyncio.run(aclient.deals.get(_deal_id(server)))
+        assert deal.title == "Deal 0"
+
+    def test_create_fetches_created_record(
+        self, aclient: AsyncTeamleaderClient, hooks: _InFlight
+    ) -> None:
+        company = asyncio.run(aclient.companies.create(name="Acme"))
+        assert company.name == "Acme"
+        assert hooks.operations == ["companies.add", "companies.info"]
+
+    def test_resource_specific_method(
+        self, server: FakeTeamleader, aclient: AsyncTeamleaderClient, hooks: _InFlight
+    ) -> None:
+        asyncio.run(aclient.deals.win(_deal_id(server)))
+        assert hooks.operations == ["deals.win"]
+
+    def test_errors_raised(self, aclient: AsyncTeamleaderClient) -> None:
+        with pytest.raises(TeamleaderNotFoundError):
+            asyncio.run(aclient.deals.get("missing"))
+
+    def test_private_attributes_not_wrapped(
+        self, aclient: AsyncTeamleaderClient
+    ) -> None:
+        with pytest.raises(AttributeError):
+            aclient.deals._path  # noqa: B018
+
+
+class TestIterate:
+    def test_every_page(self, aclient: AsyncTeamleaderClient, hooks: _InFlight) -> None:
+        async def titles() -> list[str]:
+            return [deal.title async for deal in aclient.deals.iterate(page_size=2)]
+
+        assert asyncio.run(titles()) == [f"Deal {i}" for i in range(5)]
+        assert hooks.operations == ["deals.list"] * 3
+        assert hooks.iterations == [("deals.list", 3)]
+
+
+# ---------------------------------------------------------------------------
+# Token
+# ---------------------------------------------------------------------------
+
+
+class TestToken:
+    def test_read_on_event_loop(
+        self,
+        server: FakeTeamleader,
+        aclient: AsyncTeamleaderClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        backend = aclient.client._auth.token_backend
+        monkeypatch.setattr(backend, "get", pytest.fail)
+        asyncio.run(aclient.deals.get(_deal_id(server)))
+
+    def test_expired_token_refreshed(
+        self, server: FakeTeamleader, aclient: AsyncTeamleaderClient
+    ) -> None:
+        backend = aclient.client._auth.token_backend
+        backend.save(
+            Token("old", "fake-refresh", datetime.now(tz=timezone.utc) - timedelta(1))
+        )
+        asyncio.run(aclient.call("deals.list"))
+        assert server._tokens_issued == 1
+        assert backend.get().access_token == "fake-access-1"  # type: ignore[union-attr]
+
+
+# ---------------------------------------------------------------------------
+# Concurrency and context
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrency:
+    def test_bounded_by_max_workers(
+        self, server: FakeTeamleader, aclient: AsyncTeamleaderClient, hooks: _InFlight
+    ) -> None:
+        server.latency = 0.02
+
+        async def main() -> None:
+            await asyncio.gather(*(aclient.call("users.me") for _ in range(8)))
+
+        asyncio.run(main())
+        assert len(hooks.operations) == 8
+        assert hooks.peak == 2
+
+    def test_event_loop_not_blocked(
+        self, server: FakeTeamleader, aclient: AsyncTeamleaderClient
+    ) -> None:
+        server.latency = 0.1
+        ticks: list[float] = []
+
+        async def ticker() -> None:
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def main() -> None:
+            await asyncio.gather(aclient.call("users.me"), ticker())
+
+        asyncio.run(main())
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.09
+
+    def test_memoize_applies(
+        self, server: FakeTeamleader, aclient: AsyncTeamleaderClient, hooks: _InFlight
+    ) -> None:
+        deal_id = _deal_id(server)
+
+        async def main() -> None:
+            with memoize() as memo:
+                await aclient.deals.get(deal_id)
+                await aclient.deals.get(deal_id)
+            assert (memo.calls, memo.hits) == (1, 1)
+
+        asyncio.run(main())
+        assert hooks.operations == ["deals.info"]
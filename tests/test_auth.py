@@ -3,24 +3,35 @@
 Coverage targets:
 - Token.is_expired             — boundary conditions, naive datetime normalisation
 - MemoryTokenBackend           — get / save / clear / overwrite
+- FileTokenBackend             — atomic writes, stat()-keyed cache, flock refresh lock
 - OAuth2Handler.get_authorization_url()
 - OAuth2Handler.exchange_code()
 - OAuth2Handler.get_valid_token()
-- OAuth2Handler._refresh()
+- TokenBackend.aget/asave/aclear, OAuth2Handler.aget_valid_token()
+- OAuth2Handler._refresh()   — incl. refresh_lock() and the re-read inside it
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import responses
 from freezegun import freeze_time
 
-from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token
+from teamleader.auth import FileTokenBackend, MemoryTokenBackend, OAuth2Handler, Token
 from teamleader.constants import AUTHORIZATION_URL, TOKEN_URL
 from teamleader.exceptions import TeamleaderAuthError, TeamleaderAuthExpiredError
+from teamleader.testing import FakeTeamleader, FakeTransport
 from tests.conftest import FROZEN_NOW, token_response_body
 
 
@@ -101,6 +112,111 @@ class TestMemoryTokenBackend:
         assert backend.get() is token
 
 
+# ===========================================================================
+# FileTokenBackend
+# ===========================================================================
+
+
+def _file_token(name: str, *, hours: float = 1) -> Token:
+    return Token(
+        access_token=f"acc_{name}",
+        refresh_token=f"ref_{name}",
+        expires_at=datetime.now(tz=timezone.utc) + timedelta(hours=hours),
+    )
+
+
+class TestFileTokenBackend:
+    def test_get_returns_none_without_file(self, tmp_path: Path) -> None:
+        assert FileTokenBackend(tmp_path / "token.json").get() is None
+
+    def test_round_trip_across_instances(self, tmp_path: Path) -> None:
+        token = _file_token("a")
+        FileTokenBackend(tmp_path / "token.json").save(token)
+        assert FileTokenBackend(tmp_path / "token.json").get() == token
+
+    def test_file_is_private_and_no_temp_files_remain(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        backend.save(_file_token("a"))
+        backend.save(_file_token("b"))
+        assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+        assert (tmp_path / "token.json").stat().st_mode & 0o777 == 0o600
+
+    def test_unchanged_file_is_not_reread(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        backend.save(_file_token("a"))
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert backend.get().access_token == "acc_a"  # type: ignore[union-attr]
+
+    def test_sees_token_saved_by_another_instance(self, tmp_path: Path) -> None:
+        reader = FileTokenBackend(tmp_path / "token.json")
+        writer = FileTokenBackend(tmp_path / "token.json")
+        writer.save(_file_token("a"))
+        assert reader.get().access_token == "acc_a"  # type: ignore[union-attr]
+        writer.save(_file_token("b"))
+        assert reader.get().access_token == "acc_b"  # type: ignore[union-attr]
+
+    def test_clear(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        backend.save(_file_token("a"))
+        FileTokenBackend(tmp_path / "token.json").clear()
+        assert backend.get() is None
+        assert not (tmp_path / "token.json").exists()
+
+    def test_failed_write_keeps_old_token(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        backend.save(_file_token("a"))
+        with (
+            patch("teamleader.auth.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            backend.save(_file_token("b"))
+        assert FileTokenBackend(tmp_path / "token.json").get().access_token == "acc_a"  # type: ignore[union-attr]
+        assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+    def test_refresh_lock_excludes_other_processes(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            with backend.refresh_lock():
+                os.write(write, b"1")
+                time.sleep(0.2)
+            os._exit(0)
+        os.read(read, 1)
+        start = time.monotonic()
+        with backend.refresh_lock():
+            waited = time.monotonic() - start
+        os.waitpid(pid, 0)
+        assert waited >= 0.1
+
+    def test_concurrent_refresh_requests_one_token(self, tmp_path: Path) -> None:
+        server = FakeTeamleader(latency=0.05)
+        path = tmp_path / "token.json"
+        FileTokenBackend(path).save(_file_token("stale", hours=-1))
+        results: list[str] = []
+        barrier = threading.Barrier(4)
+
+        def worker() -> None:
+            handler = OAuth2Handler(
+                "id",
+                "secret",
+                "http://localhost/callback",
+                FileTokenBackend(path),
+                transport=FakeTransport(server),
+            )
+            barrier.wait()
+            results.append(handler.get_valid_token())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server._tokens_issued == 1
+        assert results == ["fake-access-1"] * 4
+
+
 # ===========================================================================
 # OAuth2Handler.get_authorization_url()
 # ===========================================================================
@@ -247,6 +363,52 @@ class TestGetValidToken:
             handler.get_valid_token()
 
 
+class TestAsyncTokenAccess:
+    def test_memory_backend(self, backend: MemoryTokenBackend) -> None:
+        token = Token("acc", "ref", FROZEN_NOW + timedelta(seconds=300))
+        asyncio.run(backend.asave(token))
+        assert asyncio.run(backend.aget()) is token
+        asyncio.run(backend.aclear())
+        assert backend.get() is None
+
+    def test_default_methods_run_sync_ones(self, tmp_path: Path) -> None:
+        backend = FileTokenBackend(tmp_path / "token.json")
+        token = _file_token("a")
+        asyncio.run(backend.asave(token))
+        assert asyncio.run(backend.aget()) == token
+        asyncio.run(backend.aclear())
+        assert not (tmp_path / "token.json").exists()
+
+    def test_no_token_stored_raises_auth_error(self, handler: OAuth2Handler) -> None:
+        with pytest.raises(TeamleaderAuthError):
+            asyncio.run(handler.aget_valid_token())
+
+    @freeze_time(FROZEN_NOW)
+    def test_valid_token_read_asynchronously(
+        self, handler: OAuth2Handler, valid_token: Token, backend: MemoryTokenBackend
+    ) -> None:
+        with patch.object(backend, "get", side_effect=AssertionError):
+            assert asyncio.run(handler.aget_valid_token()) == "acc_valid"
+
+    @responses.activate
+    @freeze_time(FROZEN_NOW)
+    def test_expired_token_refreshed(
+        self, handler: OAuth2Handler, expired_token: Token, backend: MemoryTokenBackend
+    ) -> None:
+        responses.add(
+            responses.POST,
+            TOKEN_URL,
+            body=token_response_body(access_token="acc_refreshed"),
+            content_type="application/json",
+            status=200,
+        )
+        events: list[object] = []
+        result = asyncio.run(handler.aget_valid_token(on_refresh=events.append))
+        assert result == "acc_refreshed"
+        assert backend.get().access_token == "acc_refreshed"  # type: ignore[union-attr]
+        assert len(events) == 1
+
+
 # ===========================================================================
 # OAuth2Handler._refresh()
 # ===========================================================================
@@ -322,3 +484,59 @@ class TestRefresh:
         responses.add(responses.POST, TOKEN_URL, status=401, body="Unauthorized")
         with pytest.raises(TeamleaderAuthError):
             handler._refresh(expired_token)
+
+    @responses.activate
+    def test_already_refreshed_token_is_reused(
+        self, handler: OAuth2Handler, expired_token: Token, backend: MemoryTokenBackend
+    ) -> None:
+        """A token refreshed elsewhere meanwhile is returned without a request."""
+        fresh = Token(
+            "acc_other", "ref_other", datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        )
+        backend.save(fresh)
+        assert handler._refresh(expired_token) == fresh
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_stored_refresh_token_is_used(
+        self, handler: OAuth2Handler, expired_token: Token, backend: MemoryTokenBackend
+    ) -> None:
+        """The stored (possibly rotated) refresh token wins over the caller's."""
+        backend.save(
+            Token(
+                "acc_old", "ref_rotated", datetime.now(tz=timezone.utc) - timedelta(1)
+            )
+        )
+        responses.add(
+            responses.POST,
+            TOKEN_URL,
+            body=token_response_body(),
+            content_type="application/json",
+            status=200,
+        )
+        handler._refresh(expired_token)
+        assert "ref_rotated" in responses.calls[0].request.body
+
+    @responses.activate
+    def test_runs_under_refresh_lock(
+        self, handler: OAuth2Handler, expired_token: Token, backend: MemoryTokenBackend
+    ) -> None:
+        events: list[str] = []
+
+        @contextmanager
+        def lock() -> Iterator[None]:
+            events.append("acquire")
+            yield
+            events.append("release")
+
+        backend.refresh_lock = lock  # type: ignore[method-assign]
+        responses.add_callback(
+            responses.POST,
+            TOKEN_URL,
+            callback=lambda request: (
+                events.append("request") or (200, {}, token_response_body())
+            ),
+            content_type="application/json",
+        )
+        handler._refresh(expired_token)
+        assert events == ["acquire", "request", "release"]
@@ -0,0 +1,78 @@
+"""Tests for the benchmark suite runner (``benchmarks/suite.py``).
+
+Covers:
+- run() produces a JSON-serialisable document with best/median timings
+- compare() classifies cases as regression / improvement / ok / new
+- main() writes --output and exits 1 when a case regressed against --baseline
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks import suite
+
+
+def _doc(**best: float) -> dict[str, Any]:
+    return {"results": {name: {"best_us": us} for name, us in best.items()}}
+
+
+class TestRun:
+    def test_results_document(self) -> None:
+        doc = suite.run([suite.Case("noop", lambda: None, 10)], repeat=2)
+        json.dumps(doc)
+        assert doc["schema"] == suite.SCHEMA_VERSION
+        result = doc["results"]["noop"]
+        assert result["number"] == 10
+        assert result["repeat"] == 2
+        assert 0 <= result["best_us"] <= result["median_us"]
+
+    def test_scale_never_drops_below_one(self) -> None:
+        doc = suite.run([suite.Case("noop", lambda: None, 3)], repeat=1, scale=0.1)
+        assert doc["results"]["noop"]["number"] == 1
+
+
+class TestCompare:
+    def test_statuses(self) -> None:
+        rows = suite.compare(
+            _doc(slow=13.0, fast=7.0, same=10.5, added=1.0),
+            _doc(slow=10.0, fast=10.0, same=10.0),
+            threshold=0.2,
+        )
+        assert {name: status for name, _, _, status in rows} == {
+            "slow": "regression",
+            "fast": "improvement",
+            "same": "ok",
+            "added": "new",
+        }
+
+    def test_baseline_value_reported(self) -> None:
+        ((_, base, now, _),) = suite.compare(_doc(a=2.0), _doc(a=1.0))
+        assert (base, now) == (1.0, 2.0)
+
+
+class TestMain:
+    @pytest.fixture(autouse=True)
+    def _one_case(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            suite, "cases", lambda: [suite.Case("noop", lambda: None, 10)]
+        )
+
+    def test_writes_output(self, tmp_path: Path) -> None:
+        out = tmp_path / "results.json"
+        assert suite.main(["--output", str(out), "--repeat", "1"]) == 0
+        assert "noop" in json.loads(out.read_text())["results"]
+
+    def test_regression_exit_status(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_doc(noop=0.0)))
+        assert suite.main(["--baseline", str(baseline), "--repeat", "1"]) == 1
+
+    def test_no_regression(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_doc(noop=1e9)))
+        assert suite.main(["--baseline", str(baseline), "--repeat", "1"]) == 0
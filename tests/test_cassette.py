@@ -0,0 +1,213 @@
+"""Tests for cassette record/replay.
+
+Covers:
+- RecordingTransport: interactions recorded in order, elapsed time, token
+  exchange and Authorization redaction, API payloads (``code`` fields
+  included) stored unchanged, kept response headers, binary bodies
+- Cassette.save/load: JSON Lines and gzip round-trip, nothing secret on disk
+- ReplayTransport: buffered and streamed iterate() and token refresh replay
+  against a client with different credentials; JSON codec independence;
+  recorded timing via time_scale; cycle; CassetteMismatchError
+"""
+
+from __future__ import annotations
+
+import gzip
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token
+from teamleader.cassette import (
+    REDACTED,
+    Cassette,
+    CassetteMismatchError,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+)
+from teamleader.client import TeamleaderClient
+from teamleader.testing import FakeTeamleader, FakeTransport
+from teamleader.transport import Transport
+
+
+def _client(
+    transport: Transport, *, expired: bool = False, **kwargs: Any
+) -> TeamleaderClient:
+    """A client whose token is valid, or expired so the first call refreshes it."""
+    backend = MemoryTokenBackend()
+    backend.save(
+        Token(
+            access_token="secret-access",
+            refresh_token="secret-refresh",
+            expires_at=datetime.now(tz=timezone.utc)
+            + (timedelta(hours=-1) if expired else timedelta(hours=1)),
+        )
+    )
+    handler = OAuth2Handler(
+        "client-id",
+        "secret-client",
+        "http://localhost/cb",
+        backend,
+        transport=transport,
+    )
+    return TeamleaderClient(handler, transport=transport, **kwargs)
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": f"Deal {i}"} for i in range(45)])
+    return server
+
+
+@pytest.fixture()
+def cassette(server: FakeTeamleader) -> Cassette:
+    """Token refresh plus a three-page ``deals.iterate(page_size=20)``."""
+    cassette = Cassette()
+    client = _client(RecordingTransport(cassette, FakeTransport(server)), expired=True)
+    list(client.deals.iterate(page_size=20))
+    return cassette
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+
+class TestRecording:
+    def test_interactions(self, cassette: Cassette) -> None:
+        assert [(i.method, i.url.rsplit("/", 1)[-1]) for i in cassette] == [
+            ("POST", "access_token"),
+            ("POST", "deals.list"),
+            ("POST", "deals.list"),
+            ("POST", "deals.list"),
+        ]
+        pages = [i.body["page"]["number"] for i in list(cassette)[1:]]
+        assert pages == [1, 2, 3]
+        assert all(i.elapsed_ms >= 0 for i in cassette)
+
+    def test_token_exchange_redacted(self, cassette: Cassette) -> None:
+        token = cassette.interactions[0]
+        assert token.body["refresh_token"] == REDACTED
+        assert token.body["client_secret"] == REDACTED
+        assert token.body["client_id"] == "client-id"
+        assert '"access_token":"REDACTED"' in token.content
+        assert '"expires_in":3600' in token.content
+
+    def test_api_payload_not_redacted(self) -> None:
+        server = FakeTeamleader()
+        server.seed("deals", [{"currency": {"code": "EUR"}}])
+        cassette = Cassette()
+        client = _client(RecordingTransport(cassette, FakeTransport(server)))
+        client.call("deals.list", filter={"code": "D-1"})
+        (interaction,) = cassette
+        assert interaction.body["filter"] == {"code": "D-1"}
+        assert '"currency":{"code":"EUR"}' in interaction.content.replace(" ", "")
+        replay = _client(ReplayTransport(cassette))
+        response = replay.call("deals.list", filter={"code": "D-1"})
+        assert response["data"][0]["currency"] == {"code": "EUR"}
+
+    def test_kept_headers(self, server: FakeTeamleader) -> None:
+        server.burst_429(1, retry_after=3)
+        cassette = Cassette()
+        client = _client(RecordingTransport(cassette, FakeTransport(server)))
+        with pytest.raises(Exception):
+            client.call("users.me")
+        (interaction,) = cassette
+        assert interaction.status == 429
+        assert interaction.headers == {
+            "Content-Type": "application/json",
+            "Retry-After": "3",
+        }
+
+    def test_binary_body(self) -> None:
+        interaction = Interaction("GET", "u", None, 200, content="AAEC", binary=True)
+        assert interaction.response_bytes() == b"\x00\x01\x02"
+
+
+# ---------------------------------------------------------------------------
+# Files
+# ---------------------------------------------------------------------------
+
+
+class TestFiles:
+    @pytest.mark.parametrize("name", ["traffic.jsonl", "traffic.jsonl.gz"])
+    def test_round_trip(self, cassette: Cassette, tmp_path: Path, name: str) -> None:
+        path = tmp_path / name
+        cassette.save(path)
+        assert Cassette.load(path).interactions == cassette.interactions
+
+    def test_gzip(self, cassette: Cassette, tmp_path: Path) -> None:
+        path = tmp_path / "traffic.jsonl.gz"
+        cassette.save(path)
+        lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+        assert len(lines) == 4
+
+    def test_no_secrets_on_disk(self, cassette: Cassette, tmp_path: Path) -> None:
+        path = tmp_path / "traffic.jsonl"
+        cassette.save(path)
+        text = path.read_text()
+        for secret in ("secret-", "fake-access", "fake-refresh"):
+            assert secret not in text
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+
+class TestReplay:
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iterate_with_refresh(self, cassette: Cassette, stream: bool) -> None:
+        replay = ReplayTransport(cassette)
+        client = _client(replay, expired=True)
+        titles = [d.title for d in client.deals.iterate(page_size=20, stream=stream)]
+        assert titles == [f"Deal {i}" for i in range(45)]
+        assert client._auth.token_backend.get().access_token == REDACTED
+        assert replay.remaining() == 0
+
+    def test_codec_independent(self, cassette: Cassette) -> None:
+        pytest.importorskip("orjson")
+        from teamleader.codecs import OrjsonCodec
+
+        client = _client(ReplayTransport(cassette), expired=True, codec=OrjsonCodec())
+        assert len(list(client.deals.iterate(page_size=20))) == 45
+
+    def test_recorded_timing(
+        self, cassette: Cassette, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        slept: list[float] = []
+        monkeypatch.setattr("teamleader.cassette.time.sleep", slept.append)
+        for interaction in cassette:
+            interaction.elapsed_ms = 100.0
+
+        client = _client(ReplayTransport(cassette, time_scale=0.5), expired=True)
+        list(client.deals.iterate(page_size=20))
+        assert slept == [0.05] * 4
+
+    def test_full_speed(
+        self, cassette: Cassette, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("teamleader.cassette.time.sleep", pytest.fail)
+        list(
+            _client(ReplayTransport(cassette), expired=True).deals.iterate(page_size=20)
+        )
+
+    def test_exhausted(self, cassette: Cassette) -> None:
+        client = _client(ReplayTransport(cassette))
+        list(client.deals.iterate(page_size=20))
+        with pytest.raises(CassetteMismatchError, match="already replayed"):
+            client.deals.list(page_size=20)
+
+    def test_cycle(self, cassette: Cassette) -> None:
+        client = _client(ReplayTransport(cassette, cycle=True))
+        for _ in range(3):
+            assert len(list(client.deals.iterate(page_size=20))) == 45
+
+    def test_unrecorded_request(self, cassette: Cassette) -> None:
+        client = _client(ReplayTransport(cassette))
+        with pytest.raises(CassetteMismatchError, match="No recorded interaction"):
+            client.deals.list(page_size=50)
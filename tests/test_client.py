@@ -12,6 +12,8 @@ Covers:
 - _extract_message falls back to response.text for non-JSON and unknown bodies
 - Resource attributes are the correct types
 - Custom timeout is stored and passed through
+- validate_requests=True rejects bad call() and resource create()/update()
+  bodies locally, before any HTTP
 """
 
 from __future__ import annotations
@@ -29,6 +31,7 @@ from teamleader.exceptions import (
     TeamleaderNotFoundError,
     TeamleaderPermissionError,
     TeamleaderRateLimitError,
+    TeamleaderRequestValidationError,
     TeamleaderServerError,
     TeamleaderValidationError,
 )
@@ -38,7 +41,6 @@ from teamleader.resources.deals import DealsResource
 from teamleader.resources.invoices import InvoicesResource
 from teamleader.resources.quotations import QuotationsResource
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -523,3 +525,57 @@ class TestClientCall:
         sent_body = responses.calls[0].request.body
         # kwargs is empty → body should be None (no JSON body sent)
         assert sent_body is None
+
+
+class TestClientCallValidation:
+    @pytest.fixture()
+    def validating_client(self, client: TeamleaderClient) -> TeamleaderClient:
+        return TeamleaderClient(client._auth, validate_requests=True)
+
+    @responses.activate
+    def test_invalid_body_raises_without_http(
+        self, validating_client: TeamleaderClient
+    ) -> None:
+        with pytest.raises(TeamleaderRequestValidationError) as exc_info:
+            validating_client.call("departments.info", id=123)
+        assert exc_info.value.errors == ["id: expected string"]
+        assert len(responses.calls) == 0
+
+    def test_unknown_key_rejected(self, validating_client: TeamleaderClient) -> None:
+        with pytest.raises(
+            TeamleaderRequestValidationError, match="bogus: unknown field"
+        ):
+            validating_client.call("departments.info", id="x", bogus=1)
+
+    def test_is_a_validation_error(self, validating_client: TeamleaderClient) -> None:
+        with pytest.raises(TeamleaderValidationError):
+            validating_client.call("departments.info", id=None)
+
+    @responses.activate
+    def test_valid_body_is_sent(self, validating_client: TeamleaderClient) -> None:
+        responses.add(
+            responses.POST, _DEPARTMENTS_INFO_URL, json={"data": {}}, status=200
+        )
+        validating_client.call("departments.info", id="x")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_validation_off_by_default(self, client: TeamleaderClient) -> None:
+        responses.add(
+            responses.POST, _DEPARTMENTS_INFO_URL, json={"data": {}}, status=200
+        )
+        client.call("departments.info", id=123)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_resource_create_and_update(
+        self, validating_client: TeamleaderClient
+    ) -> None:
+        with pytest.raises(TeamleaderRequestValidationError) as exc_info:
+            validating_client.contacts.create(last_name=1)
+        assert exc_info.value.errors == ["last_name: expected string"]
+        with pytest.raises(
+            TeamleaderRequestValidationError, match="bogus: unknown field"
+        ):
+            validating_client.contacts.update("x", bogus=1)
+        assert len(responses.calls) == 0
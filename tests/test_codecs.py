@@ -0,0 +1,126 @@
+"""Unit tests for the pluggable JSON codecs.
+
+Covers:
+- StdlibJSONCodec and OrjsonCodec round-trip the same payloads to compact bytes
+- decode raises ValueError on malformed input
+- encode raises ValueError for NaN and infinities, even nested, in both codecs
+- default_codec picks orjson when installed
+- TeamleaderClient encodes request bodies with its codec, sends them as bytes
+  with a JSON Content-Type, and decodes responses and error bodies with it
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+import responses
+
+from teamleader.client import TeamleaderClient
+from teamleader.codecs import JSONCodec, OrjsonCodec, StdlibJSONCodec, default_codec
+from teamleader.constants import BASE_URL
+from teamleader.exceptions import TeamleaderNotFoundError
+
+_PAYLOAD = {
+    "data": [{"id": "a", "name": "Café", "amount": 12.5, "tags": [], "x": None}]
+}
+
+
+def _codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        pass
+    return codecs
+
+
+class _CountingCodec(StdlibJSONCodec):
+    name = "counting"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.encoded = 0
+        self.decoded = 0
+
+    def encode(self, obj: Any) -> bytes:
+        self.encoded += 1
+        return super().encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        self.decoded += 1
+        return super().decode(data)
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+class TestCodecs:
+    def test_round_trip(self, codec: JSONCodec) -> None:
+        assert codec.decode(codec.encode(_PAYLOAD)) == _PAYLOAD
+
+    def test_encode_is_compact_utf8_bytes(self, codec: JSONCodec) -> None:
+        encoded = codec.encode({"a": "é"})
+        assert encoded == '{"a":"é"}'.encode()
+
+    def test_decode_malformed_raises_value_error(self, codec: JSONCodec) -> None:
+        with pytest.raises(ValueError):
+            codec.decode(b"{not json")
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda c: c.name)
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_rejects_non_finite_floats(codec: JSONCodec, value: float) -> None:
+    with pytest.raises(ValueError):
+        codec.encode({"amount": value})
+    with pytest.raises(ValueError):
+        codec.encode({"lines": [{"amount": value}]})
+
+
+def test_default_codec_prefers_orjson() -> None:
+    pytest.importorskip("orjson")
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+class TestClientCodec:
+    @pytest.fixture()
+    def codec(self) -> _CountingCodec:
+        return _CountingCodec()
+
+    @pytest.fixture()
+    def codec_client(
+        self, client: TeamleaderClient, codec: _CountingCodec
+    ) -> TeamleaderClient:
+        return TeamleaderClient(client._auth, codec=codec)
+
+    @responses.activate
+    def test_request_body_encoded_once_as_bytes(
+        self, codec_client: TeamleaderClient, codec: _CountingCodec
+    ) -> None:
+        responses.add(responses.POST, f"{BASE_URL}/deals.info", json={"data": {}})
+        codec_client._post("deals.info", {"id": "x"})
+        request = responses.calls[0].request
+        assert codec.encoded == 1
+        assert request.body == b'{"id":"x"}'
+        assert request.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    def test_response_decoded_with_codec(
+        self, codec_client: TeamleaderClient, codec: _CountingCodec
+    ) -> None:
+        responses.add(responses.POST, f"{BASE_URL}/deals.list", json=_PAYLOAD)
+        assert codec_client._post("deals.list") == _PAYLOAD
+        assert codec.decoded == 1
+
+    @responses.activate
+    def test_error_body_decoded_with_codec(
+        self, codec_client: TeamleaderClient, codec: _CountingCodec
+    ) -> None:
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/deals.info",
+            body=json.dumps({"errors": [{"title": "Not found"}]}),
+            status=404,
+        )
+        with pytest.raises(TeamleaderNotFoundError, match="Not found"):
+            codec_client._post("deals.info", {"id": "x"})
+        assert codec.decoded == 1
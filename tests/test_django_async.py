@@ -0,0 +1,165 @@
+"""Tests for the async-aware parts of the Django integration.
+
+Covers:
+- aget()/asave()/aclear() of DatabaseTokenBackend, TieredTokenBackend and
+  CacheTokenBackend, interoperating with their sync counterparts
+- aget_client(): wraps the shared get_client() client, reused, rebuilt with
+  it, sized by POOL_SIZE, SHARED_CLIENT=False
+- TeamleaderMiddleware with async views: memoisation and Server-Timing
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+
+import teamleader.django as integration
+from teamleader.aio import AsyncTeamleaderClient
+from teamleader.auth import Token
+from teamleader.django import aget_client, get_client, reset_client
+from teamleader.django.middleware import TeamleaderMiddleware
+from teamleader.django.token_store import (
+    CacheTokenBackend,
+    DatabaseTokenBackend,
+    TieredTokenBackend,
+)
+from teamleader.testing import FakeTeamleader
+
+pytestmark = pytest.mark.django_db
+
+
+def _token(name: str) -> Token:
+    return Token(
+        access_token=f"access_{name}",
+        refresh_token=f"refresh_{name}",
+        expires_at=datetime.now(tz=timezone.utc).replace(microsecond=0)
+        + timedelta(hours=1),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh() -> Iterator[None]:
+    cache.clear()
+    reset_client()
+    yield
+    reset_client()
+
+
+# ---------------------------------------------------------------------------
+# Token backends
+# ---------------------------------------------------------------------------
+
+
+class TestDatabaseTokenBackend:
+    def test_round_trip(self) -> None:
+        backend = DatabaseTokenBackend()
+        assert async_to_sync(backend.aget)() is None
+        async_to_sync(backend.asave)(_token("a"))
+        assert backend.get() == _token("a")
+        backend.save(_token("b"))
+        assert async_to_sync(backend.aget)() == _token("b")
+        async_to_sync(backend.aclear)()
+        assert backend.get() is None
+
+
+class TestTieredTokenBackend:
+    def test_hit_skips_database(self, django_assert_num_queries: Any) -> None:
+        backend = TieredTokenBackend()
+        async_to_sync(backend.asave)(_token("a"))
+        with django_assert_num_queries(0):
+            assert async_to_sync(backend.aget)() == _token("a")
+
+    def test_asave_seen_by_other_worker(self) -> None:
+        worker, other = TieredTokenBackend(), TieredTokenBackend()
+        worker.save(_token("a"))
+        assert other.get() == _token("a")
+        async_to_sync(worker.asave)(_token("b"))
+        assert other.get() == _token("b")
+        async_to_sync(worker.aclear)()
+        assert async_to_sync(other.aget)() is None
+
+
+class TestCacheTokenBackend:
+    def test_round_trip(self, django_assert_num_queries: Any) -> None:
+        backend = CacheTokenBackend()
+        async_to_sync(backend.asave)(_token("a"))
+        with django_assert_num_queries(0):
+            assert async_to_sync(backend.aget)() == _token("a")
+        assert DatabaseTokenBackend().get() == _token("a")
+        async_to_sync(backend.aclear)()
+        assert backend.get() is None
+
+    def test_miss_refills_cache(self) -> None:
+        DatabaseTokenBackend().save(_token("a"))
+        backend = CacheTokenBackend()
+        assert async_to_sync(backend.aget)() == _token("a")
+        assert cache.get(backend.key) is not None
+
+
+# ---------------------------------------------------------------------------
+# aget_client()
+# ---------------------------------------------------------------------------
+
+
+class TestAgetClient:
+    def test_wraps_shared_client(self) -> None:
+        aclient = async_to_sync(aget_client)()
+        assert isinstance(aclient, AsyncTeamleaderClient)
+        assert aclient.client is get_client()
+        assert async_to_sync(aget_client)() is aclient
+
+    def test_rebuilt_with_shared_client(self, settings: Any) -> None:
+        before = async_to_sync(aget_client)()
+        reset_client()
+        after = async_to_sync(aget_client)()
+        assert after is not before
+        assert after.client is get_client()
+        assert before._executor._shutdown
+
+    def test_pool_size(self, settings: Any) -> None:
+        with override_settings(TEAMLEADER={**settings.TEAMLEADER, "POOL_SIZE": 3}):
+            assert async_to_sync(aget_client)()._executor._max_workers == 3
+
+    def test_not_shared(self, settings: Any) -> None:
+        conf = {**settings.TEAMLEADER, "SHARED_CLIENT": False}
+        with override_settings(TEAMLEADER=conf):
+            assert async_to_sync(aget_client)() is not async_to_sync(aget_client)()
+            assert integration._shared_async_client is None
+
+
+# ---------------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncMiddleware:
+    def test_async_view(self) -> None:
+        server = FakeTeamleader()
+        (deal_id,) = server.seed("deals", [{"title": "Deal"}])
+        aclient = AsyncTeamleaderClient(server.client())
+
+        async def view(request: HttpRequest) -> HttpResponse:
+            first = await aclient.deals.get(deal_id)
+            second = await aclient.deals.get(deal_id)
+            return HttpResponse(f"{first.title} {second.title}")
+
+        middleware = TeamleaderMiddleware(view)
+        assert iscoroutinefunction(middleware)
+        response = async_to_sync(middleware)(RequestFactory().get("/"))
+        aclient.close()
+
+        assert response.content == b"Deal Deal"
+        assert response["Server-Timing"].endswith('desc="1 call, 1 deduplicated"')
+        assert [op for op, _ in server.calls] == ["deals.info"]
+
+    def test_sync_view_stays_sync(self) -> None:
+        middleware = TeamleaderMiddleware(lambda request: HttpResponse())
+        assert not iscoroutinefunction(middleware)
+        assert middleware(RequestFactory().get("/")).status_code == 200
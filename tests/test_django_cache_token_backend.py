@@ -0,0 +1,213 @@
+"""Unit tests for CacheTokenBackend (django.core.cache over the database).
+
+Covers:
+- get(): a cached token costs no database query; a cold or evicted cache
+  falls back to the database row and re-populates the cache
+- save()/clear(): write through to the database and the cache
+- refresh_lock(): excludes other holders, waits for them, expires, and is
+  only released by its owner; concurrent refreshes through OAuth2Handler
+  request one token
+- cache_lookup hook reporting, and wiring through ``TEAMLEADER`` settings
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from teamleader.auth import OAuth2Handler, Token
+from teamleader.django import build_client
+from teamleader.django.token_store import (
+    TOKEN_CACHE_KEY,
+    CacheTokenBackend,
+    DatabaseTokenBackend,
+    TieredTokenBackend,
+)
+from teamleader.hooks import MetricsCollector
+from teamleader.testing import FakeTeamleader, FakeTransport
+
+pytestmark = pytest.mark.django_db
+
+LOCK_KEY = f"{TOKEN_CACHE_KEY}:refresh-lock"
+
+
+def _token(name: str, *, minutes: float = 60) -> Token:
+    return Token(
+        access_token=f"access_{name}",
+        refresh_token=f"refresh_{name}",
+        expires_at=datetime.now(tz=timezone.utc) + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    cache.clear()
+
+
+@pytest.fixture()
+def backend() -> CacheTokenBackend:
+    return CacheTokenBackend(poll_interval=0.01)
+
+
+# ---------------------------------------------------------------------------
+# get() / save() / clear()
+# ---------------------------------------------------------------------------
+
+
+class TestStorage:
+    def test_empty(self, backend: CacheTokenBackend) -> None:
+        assert backend.get() is None
+
+    def test_hit_skips_database(
+        self, backend: CacheTokenBackend, django_assert_num_queries: Any
+    ) -> None:
+        token = _token("a")
+        backend.save(token)
+        with django_assert_num_queries(0):
+            assert backend.get() == token
+
+    def test_miss_reads_database_and_fills_cache(
+        self, backend: CacheTokenBackend, django_assert_num_queries: Any
+    ) -> None:
+        DatabaseTokenBackend().save(_token("a"))
+        with django_assert_num_queries(1):
+            assert backend.get().access_token == "access_a"  # type: ignore[union-attr]
+            backend.get()
+
+    def test_evicted_cache_falls_back_to_database(
+        self, backend: CacheTokenBackend
+    ) -> None:
+        backend.save(_token("a"))
+        cache.delete(TOKEN_CACHE_KEY)
+        assert backend.get().access_token == "access_a"  # type: ignore[union-attr]
+        assert cache.get(TOKEN_CACHE_KEY) is not None
+
+    def test_save_writes_through(self, backend: CacheTokenBackend) -> None:
+        backend.save(_token("a"))
+        backend.save(_token("b"))
+        assert DatabaseTokenBackend().get().access_token == "access_b"  # type: ignore[union-attr]
+        assert CacheTokenBackend().get().access_token == "access_b"  # type: ignore[union-attr]
+
+    def test_clear(self, backend: CacheTokenBackend) -> None:
+        backend.save(_token("a"))
+        backend.clear()
+        assert backend.get() is None
+        assert DatabaseTokenBackend().get() is None
+        assert cache.get(TOKEN_CACHE_KEY) is None
+
+    def test_custom_key(self) -> None:
+        CacheTokenBackend(key="custom").save(_token("a"))
+        assert cache.get("custom") is not None
+        assert cache.get(TOKEN_CACHE_KEY) is None
+
+
+# ---------------------------------------------------------------------------
+# refresh_lock()
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshLock:
+    def test_held_and_released(self, backend: CacheTokenBackend) -> None:
+        with backend.refresh_lock():
+            assert cache.get(LOCK_KEY) is not None
+        assert cache.get(LOCK_KEY) is None
+
+    def test_released_on_error(self, backend: CacheTokenBackend) -> None:
+        with pytest.raises(RuntimeError), backend.refresh_lock():
+            raise RuntimeError
+        assert cache.get(LOCK_KEY) is None
+
+    def test_waits_for_holder(self, backend: CacheTokenBackend) -> None:
+        order: list[str] = []
+        held = threading.Event()
+
+        def holder() -> None:
+            with CacheTokenBackend().refresh_lock():
+                held.set()
+                time.sleep(0.1)
+                order.append("holder")
+
+        thread = threading.Thread(target=holder)
+        thread.start()
+        held.wait()
+        with backend.refresh_lock():
+            order.append("waiter")
+        thread.join()
+        assert order == ["holder", "waiter"]
+
+    def test_expired_lock_is_taken_over(self) -> None:
+        backend = CacheTokenBackend(lock_timeout=0.2, poll_interval=0.01)
+        cache.add(LOCK_KEY, "dead-worker", timeout=0.2)
+        start = time.monotonic()
+        with backend.refresh_lock():
+            pass
+        assert time.monotonic() - start < 2
+
+    def test_not_released_by_others(self, backend: CacheTokenBackend) -> None:
+        with backend.refresh_lock():
+            cache.set(LOCK_KEY, "next-owner")
+        assert cache.get(LOCK_KEY) == "next-owner"
+
+    def test_tiered_backend_uses_l2_lock(self, backend: CacheTokenBackend) -> None:
+        with TieredTokenBackend(backend).refresh_lock():
+            assert cache.get(LOCK_KEY) is not None
+
+    @pytest.mark.django_db(transaction=True)
+    def test_concurrent_refresh_requests_one_token(self) -> None:
+        server = FakeTeamleader(latency=0.05)
+        CacheTokenBackend().save(_token("stale", minutes=-1))
+        results: list[str] = []
+        barrier = threading.Barrier(4)
+
+        def worker() -> None:
+            handler = OAuth2Handler(
+                "id",
+                "secret",
+                "http://localhost/callback",
+                CacheTokenBackend(poll_interval=0.01),
+                transport=FakeTransport(server),
+            )
+            barrier.wait()
+            results.append(handler.get_valid_token())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server._tokens_issued == 1
+        assert results == ["fake-access-1"] * 4
+
+
+# ---------------------------------------------------------------------------
+# Hooks and settings
+# ---------------------------------------------------------------------------
+
+
+class TestReporting:
+    def test_cache_lookup_hook(self) -> None:
+        metrics = MetricsCollector()
+        backend = CacheTokenBackend(hooks=[metrics])
+        backend.save(_token("a"))
+        backend.get()
+        cache.clear()
+        backend.get()
+        backend.get()
+        assert metrics.snapshot()["caches"] == {"tokens": {"hits": 2, "misses": 1}}
+
+    def test_configured_through_settings(self, settings: Any) -> None:
+        conf = {
+            **settings.TEAMLEADER,
+            "TOKEN_BACKEND": "teamleader.django.token_store.CacheTokenBackend",
+            "TOKEN_BACKEND_OPTIONS": {"lock_timeout": 10},
+        }
+        with override_settings(TEAMLEADER=conf):
+            backend = build_client(conf)._auth.token_backend
+        assert isinstance(backend, CacheTokenBackend)
+        assert backend.lock_timeout == 10
@@ -0,0 +1,133 @@
+"""Tests for the shared Django client returned by ``get_client()``.
+
+Covers:
+- One client per process: built lazily, reused, thread-safe first build
+- Rebuilt after reset_client(), after a TEAMLEADER settings change and in a
+  forked child; reset_client() closes the old client's connections
+- SHARED_CLIENT=False builds a new client per call
+- Settings: TIMEOUT, POOL_SIZE, MAX_RETRIES, TOKEN_BACKEND
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+import teamleader.django as integration
+from teamleader.auth import MemoryTokenBackend
+from teamleader.constants import BASE_URL
+from teamleader.django import build_client, get_client, reset_client
+from teamleader.django.token_store import DatabaseTokenBackend
+
+
+@pytest.fixture(autouse=True)
+def _fresh() -> Iterator[None]:
+    reset_client()
+    yield
+    reset_client()
+
+
+def _with(settings: Any, **overrides: Any) -> Any:
+    return override_settings(TEAMLEADER={**settings.TEAMLEADER, **overrides})
+
+
+# ---------------------------------------------------------------------------
+# Sharing
+# ---------------------------------------------------------------------------
+
+
+class TestSharedClient:
+    def test_reused(self) -> None:
+        assert get_client() is get_client()
+
+    def test_built_lazily(self) -> None:
+        assert integration._shared_client is None
+        client = get_client()
+        assert integration._shared_client is client
+
+    def test_built_once_across_threads(self) -> None:
+        clients: list[Any] = []
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            clients.append(get_client())
+
+        with patch.object(
+            integration, "build_client", wraps=integration.build_client
+        ) as build:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert build.call_count == 1
+        assert len({id(c) for c in clients}) == 1
+
+    def test_reset_closes_and_rebuilds(self) -> None:
+        client = get_client()
+        with patch.object(client, "close") as close:
+            reset_client()
+        close.assert_called_once_with()
+        assert get_client() is not client
+
+    def test_rebuilt_when_settings_change(self, settings: Any) -> None:
+        before = get_client()
+        with _with(settings, TIMEOUT=5):
+            inside = get_client()
+            assert inside is not before
+            assert inside._timeout == 5
+        assert get_client()._timeout == 30
+
+    def test_not_shared(self, settings: Any) -> None:
+        with _with(settings, SHARED_CLIENT=False):
+            assert get_client() is not get_client()
+            assert integration._shared_client is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+    def test_dropped_in_forked_child(self) -> None:
+        get_client()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.write(write, b"1" if integration._shared_client is None else b"0")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.read(read, 1) == b"1"
+        assert integration._shared_client is not None
+
+
+# ---------------------------------------------------------------------------
+# Settings
+# ---------------------------------------------------------------------------
+
+
+class TestSettings:
+    def test_defaults(self, settings: Any) -> None:
+        client = build_client(settings.TEAMLEADER)
+        adapter = client._transport.session.get_adapter(f"{BASE_URL}/deals.list")
+        assert client._timeout == 30
+        assert client._max_retries == 0
+        assert adapter._pool_maxsize == integration.DEFAULT_POOL_SIZE
+        assert isinstance(client._auth.token_backend, DatabaseTokenBackend)
+
+    def test_overrides(self, settings: Any) -> None:
+        conf = {
+            **settings.TEAMLEADER,
+            "TIMEOUT": 10,
+            "POOL_SIZE": 32,
+            "MAX_RETRIES": 3,
+            "TOKEN_BACKEND": "teamleader.auth.MemoryTokenBackend",
+        }
+        client = build_client(conf)
+        adapter = client._transport.session.get_adapter(f"{BASE_URL}/deals.list")
+        assert client._timeout == 10
+        assert client._max_retries == 3
+        assert adapter._pool_maxsize == 32
+        assert isinstance(client._auth.token_backend, MemoryTokenBackend)
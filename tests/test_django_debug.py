@@ -0,0 +1,247 @@
+"""Tests for the per-request Teamleader call log (teamleader.django.debug).
+
+Covers:
+- CallRecorder: records sent and memoised calls into the active CallLog with
+  their caller, nothing outside record_calls(), slow-call warnings with and
+  without a log
+- CallLog.repeated(): N+1 suspects from repeated ``*.info`` sends
+- TeamleaderMiddleware: per-call DEBUG lines and N+1 warnings on the
+  ``teamleader.calls`` logger when ``CALL_LOG`` is on
+- get_client() attaches the recorder for ``CALL_LOG`` / ``SLOW_CALL_MS``
+- TeamleaderPanel (only when django-debug-toolbar is installed)
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+
+from teamleader.client import TeamleaderClient
+from teamleader.django import build_client
+from teamleader.django.debug import CallLog, CallRecord, CallRecorder, record_calls
+from teamleader.django.middleware import TeamleaderMiddleware
+from teamleader.exceptions import TeamleaderNotFoundError
+from teamleader.memo import memoize
+from teamleader.testing import FakeTeamleader
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": f"Deal {i}"} for i in range(4)])
+    return server
+
+
+@pytest.fixture()
+def client(server: FakeTeamleader) -> TeamleaderClient:
+    return server.client(hooks=[CallRecorder()])
+
+
+def _ids(server: FakeTeamleader) -> list[str]:
+    return [str(record["id"]) for record in server.records("deals")]
+
+
+def _n_plus_one(client: TeamleaderClient) -> list[str]:
+    """A view body that fetches every listed deal one by one."""
+    return [client.deals.get(deal.id).title for deal in client.deals.list().data]
+
+
+# ---------------------------------------------------------------------------
+# CallRecorder / CallLog
+# ---------------------------------------------------------------------------
+
+
+class TestCallRecorder:
+    def test_records_sent_calls(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        with record_calls() as log:
+            client.deals.get(_ids(server)[0])
+        (record,) = log.records
+        assert record.operation_id == "deals.info"
+        assert record.status_code == 200
+        assert record.bytes_in > 0
+        assert record.duration_ms > 0
+        assert not record.memoised
+        assert "test_django_debug.py" in record.caller
+        assert "in test_records_sent_calls" in record.caller
+
+    def test_records_memoised_calls(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        deal_id = _ids(server)[0]
+        with record_calls() as log, memoize():
+            client.deals.get(deal_id)
+            client.deals.get(deal_id)
+        assert [r.memoised for r in log.records] == [False, True]
+        assert log.sent == 1
+
+    def test_records_errors(self, client: TeamleaderClient) -> None:
+        with record_calls() as log, pytest.raises(TeamleaderNotFoundError):
+            client.deals.get("missing")
+        assert log.records[0].status_code == 404
+        assert log.records[0].error == "TeamleaderNotFoundError"
+
+    def test_nothing_recorded_outside_block(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        with record_calls() as log:
+            pass
+        client.deals.get(_ids(server)[0])
+        assert log.records == []
+
+    def test_stack_depth(self, server: FakeTeamleader) -> None:
+        client = server.client(hooks=[CallRecorder(stack_depth=1)])
+        with record_calls() as log:
+            client.deals.get(_ids(server)[0])
+        assert len(log.records[0].stack) == 1
+
+    def test_slow_call_warning(
+        self, caplog: pytest.LogCaptureFixture, server: FakeTeamleader
+    ) -> None:
+        server.latency = 0.02
+        client = server.client(hooks=[CallRecorder(slow_ms=10)])
+        with caplog.at_level(logging.WARNING, logger="teamleader.calls"):
+            client.deals.get(_ids(server)[0])
+        (message,) = caplog.messages
+        assert message.startswith("Slow Teamleader call deals.info: ")
+        assert "test_django_debug.py" in message
+
+    def test_fast_call_not_logged(
+        self, caplog: pytest.LogCaptureFixture, server: FakeTeamleader
+    ) -> None:
+        client = server.client(hooks=[CallRecorder(slow_ms=10_000)])
+        with caplog.at_level(logging.WARNING, logger="teamleader.calls"):
+            client.deals.get(_ids(server)[0])
+        assert caplog.messages == []
+
+
+class TestRepeated:
+    def test_n_plus_one(self, client: TeamleaderClient) -> None:
+        with record_calls() as log:
+            _n_plus_one(client)
+        assert log.repeated() == {"deals.info": 4}
+        assert log.repeated(threshold=5) == {}
+
+    def test_memoised_calls_not_counted(self) -> None:
+        log = CallLog()
+        for _ in range(5):
+            log.add(CallRecord("deals.info", memoised=True))
+        log.add(CallRecord("deals.list"))
+        assert log.repeated() == {}
+
+
+# ---------------------------------------------------------------------------
+# Middleware logging fallback
+# ---------------------------------------------------------------------------
+
+
+class TestMiddlewareLog:
+    def _get(self, settings: Any, client: TeamleaderClient, **conf: Any) -> None:
+        def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(", ".join(_n_plus_one(client)))
+
+        with override_settings(TEAMLEADER={**settings.TEAMLEADER, **conf}):
+            TeamleaderMiddleware(view)(RequestFactory().get("/deals/"))
+
+    def test_logs_calls_and_n_plus_one(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        settings: Any,
+        client: TeamleaderClient,
+    ) -> None:
+        with caplog.at_level(logging.DEBUG, logger="teamleader.calls"):
+            self._get(settings, client, CALL_LOG=True)
+        assert caplog.messages[0].startswith("GET /deals/: 5 Teamleader calls (5 sent)")
+        assert sum("deals.info 200" in m for m in caplog.messages) == 4
+        warning = caplog.records[-1]
+        assert warning.levelno == logging.WARNING
+        assert "deals.info was called 4 times" in warning.getMessage()
+        assert "deals.list" in warning.getMessage()
+
+    def test_threshold(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        settings: Any,
+        client: TeamleaderClient,
+    ) -> None:
+        with caplog.at_level(logging.WARNING, logger="teamleader.calls"):
+            self._get(settings, client, CALL_LOG=True, REPEAT_THRESHOLD=10)
+        assert caplog.messages == []
+
+    def test_off_by_default_without_debug(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        settings: Any,
+        client: TeamleaderClient,
+    ) -> None:
+        with caplog.at_level(logging.DEBUG, logger="teamleader.calls"):
+            self._get(settings, client)
+        assert caplog.messages == []
+
+
+# ---------------------------------------------------------------------------
+# get_client() wiring
+# ---------------------------------------------------------------------------
+
+
+class TestSettings:
+    def _recorders(self, conf: dict[str, Any]) -> list[CallRecorder]:
+        hooks = build_client(conf).hooks
+        return [hook for hook in hooks if isinstance(hook, CallRecorder)]
+
+    def test_not_attached_by_default(self, settings: Any) -> None:
+        assert self._recorders(settings.TEAMLEADER) == []
+
+    def test_attached_in_debug(self, settings: Any) -> None:
+        settings.DEBUG = True
+        assert len(self._recorders(settings.TEAMLEADER)) == 1
+
+    def test_slow_call_threshold(self, settings: Any) -> None:
+        (recorder,) = self._recorders({**settings.TEAMLEADER, "SLOW_CALL_MS": 500})
+        assert recorder.slow_ms == 500
+
+
+# ---------------------------------------------------------------------------
+# Debug Toolbar panel
+# ---------------------------------------------------------------------------
+
+
+class TestPanel:
+    @pytest.fixture()
+    def panel_class(self) -> Any:
+        pytest.importorskip("debug_toolbar")
+        from teamleader.django.panels import TeamleaderPanel
+
+        return TeamleaderPanel
+
+    def test_lists_calls(self, panel_class: Any, client: TeamleaderClient) -> None:
+        toolbar = SimpleNamespace(
+            stats={},
+            request_id="1",
+            store=SimpleNamespace(save_panel=lambda *args: None),
+        )
+
+        def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(", ".join(_n_plus_one(client)))
+
+        panel = panel_class(toolbar, view)
+        request = RequestFactory().get("/")
+        response = panel.process_request(request)
+        panel.generate_stats(request, response)
+
+        assert panel.nav_subtitle.startswith("5 calls in ")
+        stats = panel.get_stats()
+        assert [c["operation_id"] for c in stats["calls"]] == ["deals.list"] + [
+            "deals.info"
+        ] * 4
+        assert stats["repeated"] == [("deals.info", 4)]
+        content = str(panel.content)
+        assert "Possible N+1" in content
+        assert content.count("<tr>") == 6  # header + 5 calls
+        assert "test_django_debug.py" in content
@@ -0,0 +1,105 @@
+"""Tests for TeamleaderMiddleware (request-scoped memoisation + Server-Timing).
+
+Covers:
+- Identical reads within one request are sent once; requests do not share
+  remembered responses
+- Server-Timing: added when Teamleader was called, with call and
+  deduplication counts, appended to an existing header, omitted when no
+  call was made or ``SERVER_TIMING`` is off
+- ``MEMOIZE`` off: every call is sent but still reported
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+
+from teamleader.client import TeamleaderClient
+from teamleader.django.middleware import TeamleaderMiddleware
+from teamleader.testing import FakeTeamleader
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": "Deal"}])
+    return server
+
+
+@pytest.fixture()
+def client(server: FakeTeamleader) -> TeamleaderClient:
+    return server.client()
+
+
+def _view(client: TeamleaderClient, server: FakeTeamleader, reads: int = 2) -> Any:
+    deal_id = server.records("deals")[0]["id"]
+
+    def view(request: HttpRequest) -> HttpResponse:
+        titles = [client.deals.get(deal_id).title for _ in range(reads)]
+        return HttpResponse(", ".join(titles))
+
+    return view
+
+
+def _get(view: Any) -> HttpResponse:
+    return TeamleaderMiddleware(view)(RequestFactory().get("/"))
+
+
+def _with(settings: Any, **overrides: Any) -> Any:
+    return override_settings(TEAMLEADER={**settings.TEAMLEADER, **overrides})
+
+
+class TestMemoisation:
+    def test_identical_reads_sent_once(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        response = _get(_view(client, server, reads=3))
+        assert response.content == b"Deal, Deal, Deal"
+        assert 'desc="1 call, 2 deduplicated"' in response["Server-Timing"]
+
+    def test_not_shared_between_requests(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        view = _view(client, server, reads=1)
+        assert 'desc="1 call"' in _get(view)["Server-Timing"]
+        assert 'desc="1 call"' in _get(view)["Server-Timing"]
+
+    def test_memoize_off(
+        self, settings: Any, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        with _with(settings, MEMOIZE=False):
+            response = _get(_view(client, server, reads=2))
+        assert 'desc="2 calls"' in response["Server-Timing"]
+
+
+class TestServerTiming:
+    def test_format(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        header = _get(_view(client, server, reads=1))["Server-Timing"]
+        assert re.fullmatch(r'teamleader;dur=\d+\.\d;desc="1 call"', header)
+
+    def test_appended_to_existing_header(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        inner = _view(client, server, reads=1)
+
+        def view(request: HttpRequest) -> HttpResponse:
+            response = inner(request)
+            response["Server-Timing"] = "db;dur=3"
+            return response
+
+        assert _get(view)["Server-Timing"].startswith("db;dur=3, teamleader;dur=")
+
+    def test_omitted_without_calls(self) -> None:
+        response = _get(lambda request: HttpResponse("ok"))
+        assert "Server-Timing" not in response
+
+    def test_disabled(
+        self, settings: Any, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        with _with(settings, SERVER_TIMING=False):
+            response = _get(_view(client, server))
+        assert "Server-Timing" not in response
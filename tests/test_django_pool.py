@@ -0,0 +1,187 @@
+"""Tests for multi-tenant support in the Django integration.
+
+Covers:
+- DatabaseTokenBackend(tenant_id=...): one TeamleaderTenantToken row per
+  tenant, independent of each other and of the TeamleaderToken singleton;
+  sync and async methods
+- TieredTokenBackend and CacheTokenBackend: tenant-specific cache keys, also
+  when a key is given
+- get_client_pool(): shared, rebuilt after reset_client() and settings
+  changes; TENANTS, POOL_SIZE, TIMEOUT and TOKEN_BACKEND settings; an
+  explicit key in TOKEN_BACKEND_OPTIONS still kept apart per tenant
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import override_settings
+
+from teamleader.auth import Token
+from teamleader.constants import BASE_URL
+from teamleader.django import get_client_pool, reset_client
+from teamleader.django.models import TeamleaderTenantToken, TeamleaderToken
+from teamleader.django.token_store import (
+    TOKEN_CACHE_KEY,
+    TOKEN_VERSION_KEY,
+    CacheTokenBackend,
+    DatabaseTokenBackend,
+    TieredTokenBackend,
+)
+from teamleader.pool import TeamleaderClientPool
+
+
+def _token(name: str) -> Token:
+    return Token(
+        access_token=f"access_{name}",
+        refresh_token=f"refresh_{name}",
+        expires_at=datetime.now(tz=timezone.utc).replace(microsecond=0)
+        + timedelta(hours=1),
+    )
+
+
+def _with(settings: Any, **overrides: Any) -> Any:
+    return override_settings(TEAMLEADER={**settings.TEAMLEADER, **overrides})
+
+
+@pytest.fixture(autouse=True)
+def _fresh() -> Iterator[None]:
+    cache.clear()
+    reset_client()
+    yield
+    reset_client()
+
+
+# ---------------------------------------------------------------------------
+# Token backends
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestDatabaseTokenBackend:
+    def test_row_per_tenant(self) -> None:
+        acme, globex = DatabaseTokenBackend("acme"), DatabaseTokenBackend("globex")
+        acme.save(_token("acme"))
+        globex.save(_token("globex"))
+        acme.save(_token("acme2"))
+        assert acme.get() == _token("acme2")
+        assert globex.get() == _token("globex")
+        assert TeamleaderTenantToken.objects.count() == 2
+        assert not TeamleaderToken.objects.exists()
+
+    def test_independent_of_singleton(self) -> None:
+        DatabaseTokenBackend().save(_token("single"))
+        assert DatabaseTokenBackend("acme").get() is None
+        DatabaseTokenBackend("acme").save(_token("acme"))
+        DatabaseTokenBackend("acme").clear()
+        assert DatabaseTokenBackend().get() == _token("single")
+        assert not TeamleaderTenantToken.objects.exists()
+
+    def test_async(self) -> None:
+        backend = DatabaseTokenBackend(tenant_id="acme")
+        async_to_sync(backend.asave)(_token("a"))
+        assert TeamleaderTenantToken.objects.get().tenant_id == "acme"
+        assert async_to_sync(backend.aget)() == _token("a")
+        async_to_sync(backend.aclear)()
+        assert DatabaseTokenBackend("acme").get() is None
+
+
+@pytest.mark.django_db
+class TestCacheKeys:
+    def test_tiered(self) -> None:
+        backend = TieredTokenBackend(tenant_id="acme")
+        assert backend.version_key == f"{TOKEN_VERSION_KEY}:acme"
+        assert TieredTokenBackend().version_key == TOKEN_VERSION_KEY
+        custom = TieredTokenBackend(version_key="custom", tenant_id="acme")
+        assert custom.version_key == "custom:acme"
+        backend.save(_token("acme"))
+        assert DatabaseTokenBackend("acme").get() == _token("acme")
+        assert TieredTokenBackend(tenant_id="globex").get() is None
+
+    def test_cache(self) -> None:
+        backend = CacheTokenBackend(tenant_id="acme")
+        assert backend.key == f"{TOKEN_CACHE_KEY}:acme"
+        assert CacheTokenBackend(key="custom", tenant_id="acme").key == "custom:acme"
+        backend.save(_token("acme"))
+        assert DatabaseTokenBackend("acme").get() == _token("acme")
+        assert CacheTokenBackend(tenant_id="globex").get() is None
+
+
+# ---------------------------------------------------------------------------
+# get_client_pool()
+# ---------------------------------------------------------------------------
+
+
+class TestGetClientPool:
+    def test_shared(self) -> None:
+        pool = get_client_pool()
+        assert isinstance(pool, TeamleaderClientPool)
+        assert get_client_pool() is pool
+
+    def test_rebuilt(self, settings: Any) -> None:
+        pool = get_client_pool()
+        reset_client()
+        rebuilt = get_client_pool()
+        assert rebuilt is not pool
+        with _with(settings, TIMEOUT=5):
+            assert get_client_pool() is not rebuilt
+
+    def test_settings(self, settings: Any) -> None:
+        tenants = {
+            "MAX_CLIENTS": 3,
+            "IDLE_TIMEOUT": None,
+            "RATE_LIMIT": 100,
+            "RATE_WINDOW": 10,
+        }
+        with _with(settings, TENANTS=tenants, POOL_SIZE=4, TIMEOUT=5):
+            pool = get_client_pool()
+            client = pool.get("acme")
+        assert (pool.max_clients, pool.idle_timeout) == (3, None)
+        assert (pool.rate_limit, pool.rate_window) == (100, 10)
+        adapter = pool.transport.session.get_adapter(  # type: ignore[attr-defined]
+            f"{BASE_URL}/deals.list"
+        )
+        assert adapter._pool_maxsize == 4
+        assert client._timeout == 5
+
+    def test_defaults(self) -> None:
+        pool = get_client_pool()
+        assert (pool.max_clients, pool.idle_timeout, pool.rate_limit) == (
+            100,
+            600.0,
+            None,
+        )
+
+    def test_tenant_token_backend(self, settings: Any) -> None:
+        backend = get_client_pool().get("acme")._auth.token_backend
+        assert isinstance(backend, DatabaseTokenBackend)
+        assert backend.tenant_id == "acme"
+
+        path = "teamleader.django.token_store.TieredTokenBackend"
+        with _with(
+            settings,
+            TOKEN_BACKEND=path,
+            TOKEN_BACKEND_OPTIONS={"recheck_within": 60},
+        ):
+            backend = get_client_pool().get("acme")._auth.token_backend
+        assert isinstance(backend, TieredTokenBackend)
+        assert backend.version_key == f"{TOKEN_VERSION_KEY}:acme"
+        assert backend.recheck_within == 60
+
+    @pytest.mark.django_db
+    def test_explicit_key_kept_per_tenant(self, settings: Any) -> None:
+        path = "teamleader.django.token_store.CacheTokenBackend"
+        with _with(settings, TOKEN_BACKEND=path, TOKEN_BACKEND_OPTIONS={"key": "k"}):
+            pool = get_client_pool()
+            acme = pool.get("acme")._auth.token_backend
+            globex = pool.get("globex")._auth.token_backend
+        assert isinstance(acme, CacheTokenBackend)
+        assert isinstance(globex, CacheTokenBackend)
+        assert (acme.key, globex.key) == ("k:acme", "k:globex")
+        acme.save(_token("acme"))
+        assert globex.get() is None
@@ -0,0 +1,297 @@
+"""Tests for mirroring Teamleader records into the database.
+
+Covers:
+- sync_resource(): typed columns and the full record in ``data``, the
+  ``updated_since`` checkpoint, incremental runs sending
+  ``filter.updated_since``, full runs deleting rows no longer returned,
+  quotations always synced in full, batched upserts, the checkpoint never
+  passing the run's start, records read inside interning()
+- sync(): all resources by default, parallel workers, unknown resources
+- teamleader_sync command: output, resource selection, ``--full``, errors
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from teamleader.client import TeamleaderClient
+from teamleader.django.models import (
+    TeamleaderContact,
+    TeamleaderDeal,
+    TeamleaderInvoice,
+    TeamleaderQuotation,
+    TeamleaderSyncState,
+)
+from teamleader.django.sync import MIRRORS, SyncResult, sync, sync_resource
+from teamleader.models.interning import Interner, active_interner
+from teamleader.testing import FakeTeamleader
+
+JAN = "2024-01-01T10:00:00+00:00"
+FEB = "2024-02-01T10:00:00+00:00"
+MAR = "2024-03-01T10:00:00+00:00"
+
+
+def _deal(title: str, updated_at: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "title": title,
+        "status": "open",
+        "estimated_value": {"amount": 1250.5, "currency": "EUR"},
+        "current_phase": {"type": "dealPhase", "id": "phase-1"},
+        "updated_at": updated_at,
+        **extra,
+    }
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [_deal("First", JAN), _deal("Second", FEB)])
+    return server
+
+
+@pytest.fixture()
+def client(server: FakeTeamleader) -> TeamleaderClient:
+    return server.client()
+
+
+def _list_filters(server: FakeTeamleader, operation: str) -> list[Any]:
+    return [(body or {}).get("filter") for op, body in server.calls if op == operation]
+
+
+# ---------------------------------------------------------------------------
+# sync_resource()
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestSyncResource:
+    def test_mirrors_records(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        result = sync_resource(client, "deals")
+        assert (result.records, result.full) == (2, True)
+        deal = TeamleaderDeal.objects.get(title="First")
+        assert deal.status == "open"
+        assert deal.phase_id == "phase-1"
+        assert deal.estimated_value == Decimal("1250.50")
+        assert deal.currency == "EUR"
+        assert deal.updated_at == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+        assert deal.data["title"] == "First"
+        assert deal.data["estimated_value"] == {"amount": 1250.5, "currency": "EUR"}
+
+    def test_records_checkpoint(self, client: TeamleaderClient) -> None:
+        sync_resource(client, "deals")
+        state = TeamleaderSyncState.objects.get(resource="deals")
+        assert state.updated_since == datetime(2024, 2, 1, 10, tzinfo=timezone.utc)
+        assert state.records == 2
+
+    def test_incremental_run(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        sync_resource(client, "deals")
+        (first_id,) = [
+            r["id"] for r in server.records("deals") if r["title"] == "First"
+        ]
+        client.call("deals.update", id=first_id, title="Renamed", updated_at=MAR)
+
+        result = sync_resource(client, "deals")
+
+        assert result.updated_since == datetime(2024, 2, 1, 10, tzinfo=timezone.utc)
+        assert _list_filters(server, "deals.list")[-1] == {"updated_since": FEB}
+        # The checkpoint record itself is returned again; the renamed one too.
+        assert result.records == 2
+        assert TeamleaderDeal.objects.get(id=first_id).title == "Renamed"
+        state = TeamleaderSyncState.objects.get(resource="deals")
+        assert state.updated_since == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+
+    def test_full_run_deletes_missing_rows(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        sync_resource(client, "deals")
+        deal_id = server.records("deals")[0]["id"]
+        client.call("deals.delete", id=deal_id)
+
+        assert sync_resource(client, "deals").deleted == 0
+        assert TeamleaderDeal.objects.filter(id=deal_id).exists()
+
+        result = sync_resource(client, "deals", full=True)
+        assert (result.full, result.deleted) == (True, 1)
+        assert not TeamleaderDeal.objects.filter(id=deal_id).exists()
+        assert _list_filters(server, "deals.list")[-1] is None
+
+    def test_quotations_always_full(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        server.seed(
+            "quotations",
+            [{"name": "Offer", "status": "open", "deal": {"type": "deal", "id": "d"}}],
+        )
+        sync_resource(client, "quotations")
+        result = sync_resource(client, "quotations")
+        assert result.full
+        assert _list_filters(server, "quotations.list") == [None, None]
+        assert TeamleaderQuotation.objects.get().deal_id == "d"
+
+    def test_batches(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        server.seed("deals", [_deal(f"Deal {i}", JAN) for i in range(3)])
+        with CaptureQueriesContext(connection) as queries:
+            sync_resource(client, "deals", batch_size=2)
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        # 5 deals in upserts of 2, plus the sync state.
+        assert len(inserts) == 4
+        assert TeamleaderDeal.objects.count() == 5
+
+    def test_interned(
+        self, monkeypatch: pytest.MonkeyPatch, client: TeamleaderClient
+    ) -> None:
+        interners: list[Interner] = []
+        original = client.deals.iterate
+
+        def iterate(*args: Any, **kwargs: Any) -> Any:
+            interners.append(active_interner())
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(client.deals, "iterate", iterate)
+        sync_resource(client, "deals")
+        assert isinstance(interners[0], Interner)
+        assert active_interner() is None
+
+    def test_checkpoint_not_past_run_start(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        server.seed("deals", [_deal("Future", "2999-01-01T00:00:00+00:00")])
+        sync_resource(client, "deals")
+        state = TeamleaderSyncState.objects.get(resource="deals")
+        assert state.updated_since == state.synced_at
+
+    def test_contact_and_invoice_columns(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        server.seed(
+            "contacts",
+            [
+                {
+                    "first_name": "Ada",
+                    "last_name": "Lovelace",
+                    "emails": [{"type": "primary", "email": "ada@example.com"}],
+                    "updated_at": JAN,
+                }
+            ],
+        )
+        server.seed(
+            "invoices",
+            [
+                {
+                    "invoice_number": "2024 / 7",
+                    "invoice_date": "2024-01-31",
+                    "paid": True,
+                }
+            ],
+        )
+        sync_resource(client, "contacts")
+        sync_resource(client, "invoices")
+        assert TeamleaderContact.objects.get().email == "ada@example.com"
+        invoice = TeamleaderInvoice.objects.get()
+        assert invoice.invoice_number == "2024 / 7"
+        assert str(invoice.invoice_date) == "2024-01-31"
+        assert invoice.paid
+        assert invoice.updated_at is None
+
+
+# ---------------------------------------------------------------------------
+# sync()
+# ---------------------------------------------------------------------------
+
+
+class TestSync:
+    @pytest.mark.django_db
+    def test_all_resources(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        server.seed("companies", [{"name": "Acme", "updated_at": JAN}])
+        results = sync(client=client, workers=1)
+        assert [r.resource for r in results] == list(MIRRORS)
+        assert {r.resource: r.records for r in results}["deals"] == 2
+        assert TeamleaderSyncState.objects.count() == len(MIRRORS)
+
+    def test_parallel_workers(
+        self, monkeypatch: pytest.MonkeyPatch, client: TeamleaderClient
+    ) -> None:
+        # The in-memory SQLite test database locks tables written from
+        # several threads at once, so only the dispatch is exercised here.
+        barrier = threading.Barrier(len(MIRRORS), timeout=5)
+        threads: dict[str, str] = {}
+
+        def fake_sync_resource(
+            client: TeamleaderClient, resource: str, **options: Any
+        ) -> SyncResult:
+            barrier.wait()  # every resource is in flight at once
+            threads[resource] = threading.current_thread().name
+            return SyncResult(resource)
+
+        monkeypatch.setattr("teamleader.django.sync.sync_resource", fake_sync_resource)
+        results = sync(client=client, workers=len(MIRRORS))
+        assert [r.resource for r in results] == list(MIRRORS)
+        assert len(set(threads.values())) == len(MIRRORS)
+        assert all(name.startswith("teamleader-sync") for name in threads.values())
+
+    @pytest.mark.django_db
+    def test_selected_resources(self, client: TeamleaderClient) -> None:
+        results = sync(["deals"], client=client)
+        assert [r.resource for r in results] == ["deals"]
+
+    def test_unknown_resource(self, client: TeamleaderClient) -> None:
+        with pytest.raises(ValueError, match="tasks"):
+            sync(["deals", "tasks"], client=client)
+
+
+# ---------------------------------------------------------------------------
+# teamleader_sync command
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+class TestCommand:
+    @pytest.fixture(autouse=True)
+    def _client(
+        self, monkeypatch: pytest.MonkeyPatch, client: TeamleaderClient
+    ) -> None:
+        monkeypatch.setattr("teamleader.django.get_client", lambda: client)
+
+    def _run(self, *args: str) -> str:
+        out = StringIO()
+        call_command("teamleader_sync", *args, "--workers=1", stdout=out)
+        return out.getvalue()
+
+    def test_output(self) -> None:
+        output = self._run("deals")
+        assert output.startswith("deals: 2 records (full) in ")
+        output = self._run("deals")
+        assert "deals: 1 records (updated since 2024-02-01T10:00:00+00:00)" in output
+
+    def test_full(self) -> None:
+        self._run("deals")
+        assert "(full)" in self._run("deals", "--full")
+
+    def test_all_resources(self) -> None:
+        output = self._run()
+        assert [line.split(":")[0] for line in output.splitlines()] == list(MIRRORS)
+
+    def test_unknown_resource(self) -> None:
+        with pytest.raises(CommandError, match="Unknown resource"):
+            self._run("tasks")
+
+    def test_api_error(self, server: FakeTeamleader) -> None:
+        server.burst_429(10)
+        with pytest.raises(CommandError, match="Sync failed"):
+            self._run("deals")
@@ -0,0 +1,198 @@
+"""Unit tests for TieredTokenBackend (in-memory L1 over a database L2).
+
+Covers:
+- get(): L1 hits cost no database query; a changed, missing or flushed
+  version marker and a token near expiry re-read L2
+- save()/clear(): write through to L2, update L1 and publish a new version
+  that other workers (other backend instances sharing the cache) pick up
+- refresh_lock(): a cache lock when L2 has none, L2's own lock otherwise
+- cache_lookup hook reporting, and wiring through ``TEAMLEADER`` settings
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from teamleader.auth import MemoryTokenBackend, Token
+from teamleader.django import build_client
+from teamleader.django.token_store import (
+    TOKEN_VERSION_KEY,
+    DatabaseTokenBackend,
+    TieredTokenBackend,
+)
+from teamleader.hooks import MetricsCollector
+from teamleader.metrics import DEFAULT_COLLECTOR
+
+pytestmark = pytest.mark.django_db
+
+
+def _token(name: str, *, minutes: float = 60) -> Token:
+    return Token(
+        access_token=f"access_{name}",
+        refresh_token=f"refresh_{name}",
+        expires_at=datetime.now(tz=timezone.utc) + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    cache.clear()
+
+
+@pytest.fixture()
+def worker() -> TieredTokenBackend:
+    return TieredTokenBackend()
+
+
+# ---------------------------------------------------------------------------
+# get()
+# ---------------------------------------------------------------------------
+
+
+class TestGet:
+    def test_empty(self, worker: TieredTokenBackend) -> None:
+        assert worker.get() is None
+
+    def test_hit_skips_database(
+        self, worker: TieredTokenBackend, django_assert_num_queries: Any
+    ) -> None:
+        worker.save(_token("a"))
+        with django_assert_num_queries(0):
+            for _ in range(5):
+                assert worker.get().access_token == "access_a"  # type: ignore[union-attr]
+
+    def test_first_get_reads_database_then_hits(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        DatabaseTokenBackend().save(_token("a"))
+        worker = TieredTokenBackend()
+        with django_assert_num_queries(1):
+            assert worker.get().access_token == "access_a"  # type: ignore[union-attr]
+            worker.get()
+
+    def test_flushed_cache_rereads(
+        self, worker: TieredTokenBackend, django_assert_num_queries: Any
+    ) -> None:
+        worker.save(_token("a"))
+        cache.clear()
+        with django_assert_num_queries(1):
+            worker.get()
+            worker.get()
+
+    def test_near_expiry_rereads(
+        self, worker: TieredTokenBackend, django_assert_num_queries: Any
+    ) -> None:
+        worker.save(_token("a", minutes=4))  # inside the default 300 s window
+        with django_assert_num_queries(2):
+            worker.get()
+            worker.get()
+
+    def test_recheck_window_is_configurable(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        worker = TieredTokenBackend(recheck_within=60)
+        worker.save(_token("a", minutes=4))
+        with django_assert_num_queries(0):
+            worker.get()
+
+
+# ---------------------------------------------------------------------------
+# save() / clear() across workers
+# ---------------------------------------------------------------------------
+
+
+class TestInvalidation:
+    def test_rotation_reaches_other_workers(self) -> None:
+        first, second = TieredTokenBackend(), TieredTokenBackend()
+        first.save(_token("a"))
+        assert second.get().access_token == "access_a"  # type: ignore[union-attr]
+
+        first.save(_token("b"))
+        assert second.get().access_token == "access_b"  # type: ignore[union-attr]
+
+    def test_save_bumps_version(self, worker: TieredTokenBackend) -> None:
+        worker.save(_token("a"))
+        before = cache.get(TOKEN_VERSION_KEY)
+        worker.save(_token("b"))
+        assert cache.get(TOKEN_VERSION_KEY) not in (None, before)
+
+    def test_clear_reaches_other_workers(self) -> None:
+        first, second = TieredTokenBackend(), TieredTokenBackend()
+        first.save(_token("a"))
+        second.get()
+        first.clear()
+        assert second.get() is None
+        assert DatabaseTokenBackend().get() is None
+
+    def test_custom_l2_and_key(self) -> None:
+        l2 = MemoryTokenBackend()
+        worker = TieredTokenBackend(l2, version_key="custom")
+        worker.save(_token("a"))
+        assert l2.get().access_token == "access_a"  # type: ignore[union-attr]
+        assert cache.get("custom") is not None
+        assert cache.get(TOKEN_VERSION_KEY) is None
+
+
+# ---------------------------------------------------------------------------
+# refresh_lock()
+# ---------------------------------------------------------------------------
+
+
+class TestRefreshLock:
+    def test_cache_lock_over_database(self, worker: TieredTokenBackend) -> None:
+        lock_key = f"{TOKEN_VERSION_KEY}:refresh-lock"
+        with worker.refresh_lock():
+            assert cache.get(lock_key) is not None
+            assert not cache.add(lock_key, "other-worker")
+        assert cache.get(lock_key) is None
+
+    def test_l2_lock(self) -> None:
+        class _Locking(MemoryTokenBackend):
+            held = False
+
+            @contextmanager
+            def refresh_lock(self) -> Iterator[None]:
+                self.held = True
+                yield
+
+        l2 = _Locking()
+        with TieredTokenBackend(l2).refresh_lock():
+            assert l2.held
+            assert cache.get(f"{TOKEN_VERSION_KEY}:refresh-lock") is None
+
+
+# ---------------------------------------------------------------------------
+# Hooks and settings
+# ---------------------------------------------------------------------------
+
+
+class TestReporting:
+    def test_cache_lookup_hook(self) -> None:
+        metrics = MetricsCollector()
+        worker = TieredTokenBackend(hooks=[metrics])
+        worker.save(_token("a"))
+        worker.get()
+        worker.get()
+        cache.clear()
+        worker.get()
+        assert metrics.snapshot()["caches"] == {"tokens": {"hits": 2, "misses": 1}}
+
+    def test_configured_through_settings(self, settings: Any) -> None:
+        conf = {
+            **settings.TEAMLEADER,
+            "TOKEN_BACKEND": "teamleader.django.token_store.TieredTokenBackend",
+            "TOKEN_BACKEND_OPTIONS": {"recheck_within": 120},
+            "METRICS": True,
+        }
+        with override_settings(TEAMLEADER=conf):
+            backend = build_client(conf)._auth.token_backend
+        assert isinstance(backend, TieredTokenBackend)
+        assert backend.recheck_within == 120
+        assert backend.hooks == [DEFAULT_COLLECTOR]
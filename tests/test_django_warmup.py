@@ -0,0 +1,272 @@
+"""Tests for reference-data caching and the startup warm-up.
+
+Covers:
+- get_reference_data(): cached after the first fetch, every page fetched,
+  unpaginated lists, refresh, REFERENCE_CACHE/REFERENCE_TIMEOUT settings,
+  cache_lookup hooks, unknown names; the shortcut functions
+- preload_reference_data(): all or selected lists
+- warm_up(): token loaded, pooled connections opened concurrently, reference
+  data preloaded unless already cached, failing steps logged without
+  stopping the others
+- start_warm_up(): background thread only when WARM_UP is set;
+  TeamleaderConfig.ready() never starts it
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.apps import apps
+from django.core.cache import cache, caches
+from django.test import override_settings
+
+from teamleader.client import TeamleaderClient
+from teamleader.django import reference, warmup
+from teamleader.django.reference import (
+    REFERENCE_DATA,
+    get_reference_data,
+    preload_reference_data,
+)
+from teamleader.django.warmup import start_warm_up, warm_up
+from teamleader.hooks import ClientHooks
+from teamleader.testing import FakeTeamleader
+
+
+class _Lookups(ClientHooks):
+    def __init__(self) -> None:
+        self.lookups: list[tuple[str, bool]] = []
+
+    def cache_lookup(self, cache: str, hit: bool) -> None:
+        self.lookups.append((cache, hit))
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("dealPhases", [{"name": f"Phase {i}"} for i in range(3)])
+    server.seed("dealSources", [{"name": "Website"}])
+    server.seed("users", [{"first_name": "Ada"}])
+    server.seed("departments", [{"name": "Sales"}])
+    return server
+
+
+@pytest.fixture()
+def client(server: FakeTeamleader) -> TeamleaderClient:
+    return server.client()
+
+
+def _operations(server: FakeTeamleader) -> list[str]:
+    return [op for op, _ in server.calls]
+
+
+# ---------------------------------------------------------------------------
+# Reference data
+# ---------------------------------------------------------------------------
+
+
+class TestGetReferenceData:
+    def test_cached(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        phases = get_reference_data("deal_phases", client=client)
+        assert [p["name"] for p in phases] == ["Phase 0", "Phase 1", "Phase 2"]
+        assert get_reference_data("deal_phases", client=client) == phases
+        assert _operations(server) == ["dealPhases.list"]
+
+    def test_every_page(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        server.seed("users", [{"first_name": f"User {i}"} for i in range(150)])
+        assert len(get_reference_data("users", client=client)) == 151
+        assert [body["page"] for _, body in server.calls] == [
+            {"size": 100, "number": 1},
+            {"size": 100, "number": 2},
+        ]
+
+    def test_unpaginated(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        assert reference.departments(client=client)[0]["name"] == "Sales"
+        assert server.calls == [("departments.list", None)]
+
+    def test_refresh(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        get_reference_data("deal_sources", client=client)
+        server.seed("dealSources", [{"name": "Referral"}])
+        assert len(get_reference_data("deal_sources", client=client)) == 1
+        assert len(get_reference_data("deal_sources", client=client, refresh=True)) == 2
+        assert len(reference.deal_sources(client=client)) == 2
+
+    def test_settings(self, settings: Any, client: TeamleaderClient) -> None:
+        conf = {
+            **settings.TEAMLEADER,
+            "REFERENCE_CACHE": "default",
+            "REFERENCE_TIMEOUT": 0,
+        }
+        with override_settings(TEAMLEADER=conf):
+            reference.users(client=client)
+        # A zero timeout means the value is not kept at all.
+        assert caches["default"].get("teamleader:reference:users") is None
+
+    def test_hooks(self, server: FakeTeamleader) -> None:
+        hooks = _Lookups()
+        client = server.client(hooks=[hooks])
+        reference.deal_phases(client=client)
+        reference.deal_phases(client=client)
+        assert hooks.lookups == [("reference", False), ("reference", True)]
+
+    def test_unknown(self, client: TeamleaderClient) -> None:
+        with pytest.raises(KeyError):
+            get_reference_data("tasks", client=client)
+
+    def test_default_client(
+        self, monkeypatch: pytest.MonkeyPatch, client: TeamleaderClient
+    ) -> None:
+        monkeypatch.setattr("teamleader.django.get_client", lambda: client)
+        assert len(reference.deal_phases()) == 3
+
+
+class TestPreload:
+    def test_all(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        counts = preload_reference_data(client=client)
+        assert counts == {
+            "deal_phases": 3,
+            "deal_sources": 1,
+            "users": 1,
+            "departments": 1,
+        }
+        for name in REFERENCE_DATA:
+            get_reference_data(name, client=client)
+        assert len(server.calls) == len(REFERENCE_DATA)
+
+    def test_selected(self, server: FakeTeamleader, client: TeamleaderClient) -> None:
+        assert preload_reference_data(["users"], client=client) == {"users": 1}
+        assert _operations(server) == ["users.list"]
+
+
+# ---------------------------------------------------------------------------
+# warm_up()
+# ---------------------------------------------------------------------------
+
+
+class _Heads:
+    """Wraps a transport, recording which threads sent ``HEAD`` requests."""
+
+    def __init__(self, client: TeamleaderClient) -> None:
+        self.threads: set[str] = set()
+        self._request = client._transport.request
+        client._transport.request = self.request  # type: ignore[method-assign]
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        if method == "HEAD":
+            self.threads.add(threading.current_thread().name)
+        return self._request(method, url, **kwargs)
+
+
+def _warm_up_settings(settings: Any, value: Any) -> Any:
+    return override_settings(TEAMLEADER={**settings.TEAMLEADER, "WARM_UP": value})
+
+
+class TestWarmUp:
+    def test_steps(
+        self, settings: Any, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        heads = _Heads(client)
+        with _warm_up_settings(settings, True):
+            timings = warm_up(client)
+        assert list(timings) == [
+            "token",
+            "connections",
+            *(f"reference:{name}" for name in REFERENCE_DATA),
+        ]
+        assert len(heads.threads) == warmup.DEFAULT_WARM_UP_CONNECTIONS
+        assert sorted(_operations(server)) == sorted(
+            op for op, _ in REFERENCE_DATA.values()
+        )
+
+    def test_options(
+        self, settings: Any, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        heads = _Heads(client)
+        options = {"CONNECTIONS": 3, "REFERENCE_DATA": ["users"]}
+        with _warm_up_settings(settings, options):
+            timings = warm_up(client)
+        assert list(timings) == ["token", "connections", "reference:users"]
+        assert len(heads.threads) == 3
+        assert _operations(server) == ["users.list"]
+
+    def test_connections_bounded_by_pool_size(
+        self, settings: Any, client: TeamleaderClient
+    ) -> None:
+        heads = _Heads(client)
+        conf = {
+            **settings.TEAMLEADER,
+            "POOL_SIZE": 1,
+            "WARM_UP": {"CONNECTIONS": 8, "REFERENCE_DATA": []},
+        }
+        with override_settings(TEAMLEADER=conf):
+            warm_up(client)
+        assert len(heads.threads) == 1
+
+    def test_cached_reference_data_kept(
+        self, settings: Any, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        get_reference_data("users", client=client)
+        server.seed("users", [{"first_name": "Grace"}])
+        options = {"CONNECTIONS": 0, "REFERENCE_DATA": ["users"]}
+        with _warm_up_settings(settings, options):
+            warm_up(client)
+        assert _operations(server) == ["users.list"]
+        assert len(get_reference_data("users", client=client)) == 1
+
+    def test_failing_step_logged(
+        self,
+        settings: Any,
+        server: FakeTeamleader,
+        client: TeamleaderClient,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        server.burst_429(10)
+        options = {"CONNECTIONS": 0, "REFERENCE_DATA": ["users", "nonsense"]}
+        with _warm_up_settings(settings, options), caplog.at_level(logging.INFO):
+            timings = warm_up(client)
+        assert list(timings) == ["token"]
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert warnings == [
+            "Teamleader warm-up step 'reference:users' failed",
+            "Teamleader warm-up step 'reference:nonsense' failed",
+        ]
+        assert "Teamleader warm-up finished: token " in caplog.text
+
+
+class TestStartWarmUp:
+    def test_background_thread(
+        self, settings: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ran: list[str] = []
+        monkeypatch.setattr(
+            warmup,
+            "warm_up",
+            lambda: ran.append(threading.current_thread().name),
+        )
+        assert start_warm_up() is None
+        with _warm_up_settings(settings, True):
+            thread = start_warm_up()
+        assert thread is not None
+        thread.join(5)
+        assert ran == ["teamleader-warm-up"]
+
+    def test_not_started_by_ready(
+        self, settings: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        started: list[bool] = []
+        monkeypatch.setattr(warmup, "start_warm_up", lambda: started.append(True))
+        with _warm_up_settings(settings, True):
+            apps.get_app_config("teamleader_django").ready()
+        assert started == []
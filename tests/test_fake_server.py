@@ -0,0 +1,262 @@
+"""Tests for the in-process fake Teamleader API (``teamleader.testing``).
+
+Covers:
+- Every operation in ENDPOINTS is routable by its request path
+- CRUD through curated resources: add, info, update, delete, 404 on unknown id
+- list pagination, ``meta.matches`` (and its absence for contacts), filters
+- iterate() and iterate(stream=True) over seeded records
+- 401 without a bearer token, 422 on missing required parameters
+- 429 bursts and the sliding-window rate limit, both with Retry-After
+- Token refresh served by the fake token endpoint
+- Latency is applied per request
+- Calls are logged in order with their operation id and body
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from teamleader._generated.endpoints import ENDPOINTS
+from teamleader.auth import Token
+from teamleader.constants import BASE_URL
+from teamleader.exceptions import (
+    TeamleaderNotFoundError,
+    TeamleaderRateLimitError,
+    TeamleaderValidationError,
+)
+from teamleader.testing import FakeTeamleader, FakeTransport
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    return FakeTeamleader()
+
+
+# ---------------------------------------------------------------------------
+# Routing
+# ---------------------------------------------------------------------------
+
+
+class TestRouting:
+    def test_every_endpoint_is_routable(self, server: FakeTeamleader) -> None:
+        for operation_id in ENDPOINTS:
+            endpoint = ENDPOINTS[operation_id]
+            assert server._route(endpoint.request_path) is endpoint
+
+    def test_unknown_operation_is_404(self, server: FakeTeamleader) -> None:
+        status, _, _ = server.handle("POST", f"{BASE_URL}/nope.nothing", {}, {})
+        assert status == 404
+
+    def test_calls_are_logged(self, server: FakeTeamleader) -> None:
+        client = server.client()
+        client.call("users.me")
+        client.call("deals.list", page={"size": 5, "number": 1})
+        assert server.calls == [
+            ("users.me", None),
+            ("deals.list", {"page": {"size": 5, "number": 1}}),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# CRUD
+# ---------------------------------------------------------------------------
+
+
+class TestCrud:
+    def test_add_info_update_delete(self, server: FakeTeamleader) -> None:
+        client = server.client()
+
+        contact = client.contacts.create(first_name="Ada", last_name="Lovelace")
+        assert client.contacts.get(contact.id).first_name == "Ada"
+
+        client.contacts.update(contact.id, first_name="Augusta")
+        assert server.records("contacts")[0]["first_name"] == "Augusta"
+
+        client.contacts.delete(contact.id)
+        assert server.records("contacts") == []
+
+    def test_info_unknown_id_is_404(self, server: FakeTeamleader) -> None:
+        with pytest.raises(TeamleaderNotFoundError):
+            server.client().call("deals.info", id="missing")
+
+    def test_seed_assigns_ids(self, server: FakeTeamleader) -> None:
+        ids = server.seed("deals", [{"title": "a"}, {"id": "fixed", "title": "b"}])
+        assert len(ids) == 2
+        assert ids[1] == "fixed"
+        assert {r["id"] for r in server.records("deals")} == set(ids)
+
+
+# ---------------------------------------------------------------------------
+# Listing
+# ---------------------------------------------------------------------------
+
+
+class TestList:
+    def test_pagination_and_matches(self, server: FakeTeamleader) -> None:
+        server.seed("deals", [{"title": f"Deal {i}"} for i in range(25)])
+        result = server.client().call(
+            "deals.list", page={"size": 10, "number": 3}, includes="pagination"
+        )
+        assert len(result["data"]) == 5
+        assert result["meta"]["matches"] == 25
+
+    def test_no_matches_without_includes(self, server: FakeTeamleader) -> None:
+        server.seed("deals", [{"title": "a"}])
+        result = server.client().call("deals.list")
+        assert "matches" not in result["meta"]
+
+    def test_contacts_never_report_matches(self, server: FakeTeamleader) -> None:
+        server.seed("contacts", [{"first_name": "a"}])
+        result = server.client().call("contacts.list", includes="pagination")
+        assert "matches" not in result["meta"]
+
+    def test_filters(self, server: FakeTeamleader) -> None:
+        ids = server.seed(
+            "deals",
+            [
+                {"title": "Website redesign", "status": "open"},
+                {"title": "Hosting", "status": "won"},
+                {"title": "Website hosting", "status": "won"},
+            ],
+        )
+        client = server.client()
+
+        def titles(**filters: object) -> list[str]:
+            deals = client.call("deals.list", filter=filters)["data"]
+            return [d["title"] for d in deals]
+
+        assert titles(term="website") == ["Website redesign", "Website hosting"]
+        assert titles(status="won") == ["Hosting", "Website hosting"]
+        assert titles(ids=[ids[0]]) == ["Website redesign"]
+        assert titles(term="hosting", status="won") == ["Hosting", "Website hosting"]
+
+    def test_updated_since(self, server: FakeTeamleader) -> None:
+        server.seed(
+            "deals",
+            [
+                {"title": "Old", "updated_at": "2024-01-01T00:00:00+00:00"},
+                {"title": "New", "updated_at": "2024-06-01T00:00:00+00:00"},
+            ],
+        )
+        data = server.client().call(
+            "deals.list", filter={"updated_since": "2024-06-01T00:00:00+00:00"}
+        )["data"]
+        assert [d["title"] for d in data] == ["New"]
+
+    def test_iterate_uses_matches(self, server: FakeTeamleader) -> None:
+        server.seed("deals", [{"title": f"Deal {i}"} for i in range(250)])
+        deals = list(server.client().deals.iterate(page_size=100))
+        assert len(deals) == 250
+        assert len(server.calls) == 3
+
+    def test_iterate_without_matches(self, server: FakeTeamleader) -> None:
+        server.seed("contacts", [{"first_name": f"C{i}"} for i in range(45)])
+        contacts = list(server.client().contacts.iterate(page_size=20))
+        assert len(contacts) == 45
+        assert len(server.calls) == 3
+
+    def test_iterate_stream(self, server: FakeTeamleader) -> None:
+        server.seed("deals", [{"title": f"Deal {i}"} for i in range(30)])
+        deals = list(server.client().deals.iterate(page_size=10, stream=True))
+        assert [d.title for d in deals] == [f"Deal {i}" for i in range(30)]
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+
+class TestErrors:
+    def test_missing_bearer_token_is_401(self, server: FakeTeamleader) -> None:
+        status, _, _ = server.handle("POST", f"{BASE_URL}/users.me", {}, None)
+        assert status == 401
+
+    def test_missing_required_parameter_is_422(self, server: FakeTeamleader) -> None:
+        transport = FakeTransport(server)
+        response = transport.request(
+            "POST",
+            f"{BASE_URL}/deals.info",
+            headers={"Authorization": "Bearer x"},
+            data=b"{}",
+        )
+        assert response.status_code == 422
+        assert "id" in response.json()["errors"][0]["title"]
+
+    def test_422_maps_to_validation_error(self, server: FakeTeamleader) -> None:
+        transport = FakeTransport(server)
+        client = server.client()
+        # Bypass the client's own required-parameter check.
+        response = transport.request(
+            "POST",
+            f"{BASE_URL}/deals.update",
+            headers={"Authorization": "Bearer x"},
+            data=b"{}",
+        )
+        with pytest.raises(TeamleaderValidationError):
+            client._handle_response(response)
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiting:
+    def test_burst(self, server: FakeTeamleader) -> None:
+        client = server.client()
+        server.burst_429(2, retry_after=3)
+
+        for _ in range(2):
+            with pytest.raises(TeamleaderRateLimitError) as exc_info:
+                client.call("users.me")
+            assert exc_info.value.retry_after == 3
+        client.call("users.me")
+
+    def test_sliding_window(self) -> None:
+        server = FakeTeamleader(rate_limit=3, rate_window=10)
+        client = server.client()
+
+        for _ in range(3):
+            client.call("users.me")
+        with pytest.raises(TeamleaderRateLimitError) as exc_info:
+            client.call("users.me")
+        assert 1 <= exc_info.value.retry_after <= 10
+
+    def test_window_expires(self) -> None:
+        server = FakeTeamleader(rate_limit=1, rate_window=0.05)
+        client = server.client()
+        client.call("users.me")
+        time.sleep(0.06)
+        client.call("users.me")
+
+
+# ---------------------------------------------------------------------------
+# Tokens and latency
+# ---------------------------------------------------------------------------
+
+
+class TestTokensAndLatency:
+    def test_expired_token_is_refreshed(self, server: FakeTeamleader) -> None:
+        client = server.client()
+        client._auth.token_backend.save(
+            Token("old", "old-refresh", datetime(2000, 1, 1, tzinfo=timezone.utc))
+        )
+
+        client.call("users.me")
+
+        assert client._auth.token_backend.get().access_token == "fake-access-1"  # type: ignore[union-attr]
+        assert [op for op, _ in server.calls] == ["users.me"]
+
+    def test_token_endpoint_rejects_nothing(self, server: FakeTeamleader) -> None:
+        handler = server.client()._auth
+        assert handler.exchange_code("anything").access_token == "fake-access-1"
+
+    def test_latency(self) -> None:
+        server = FakeTeamleader(latency=0.02)
+        client = server.client()
+        started = time.perf_counter()
+        client.call("users.me")
+        assert time.perf_counter() - started >= 0.02
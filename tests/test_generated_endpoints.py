@@ -0,0 +1,90 @@
+"""Unit tests for the generated endpoint registry.
+
+Covers:
+- ``ENDPOINTS`` behaves as a read-only mapping over all operations
+- ``Endpoint.request_path`` strips the leading slash of ``path``
+- ``Endpoint.required`` mirrors ``required_params`` and is shared between
+  endpoints with the same required set
+- ``Endpoint.description`` is loaded lazily from ``_descriptions``
+- Endpoints are slotted (no per-instance ``__dict__``)
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from teamleader._generated.endpoints import ENDPOINTS, Endpoint
+
+
+class TestEndpointsMapping:
+    def test_len_matches_iteration(self) -> None:
+        assert len(ENDPOINTS) == len(list(ENDPOINTS)) == 290
+
+    def test_membership(self) -> None:
+        assert "deals.info" in ENDPOINTS
+        assert "not.real" not in ENDPOINTS
+
+    def test_get_unknown_returns_default(self) -> None:
+        assert ENDPOINTS.get("not.real") is None
+
+    def test_getitem_unknown_raises_key_error(self) -> None:
+        with pytest.raises(KeyError):
+            ENDPOINTS["not.real"]
+
+    def test_lookup_returns_endpoint(self) -> None:
+        endpoint = ENDPOINTS["deals.info"]
+        assert isinstance(endpoint, Endpoint)
+        assert endpoint.operation_id == "deals.info"
+        assert endpoint.tag == "deals"
+
+
+class TestEndpoint:
+    def test_request_path_has_no_leading_slash(self) -> None:
+        for operation_id in ENDPOINTS:
+            endpoint = ENDPOINTS[operation_id]
+            assert endpoint.request_path == endpoint.path.lstrip("/")
+
+    def test_request_path_differs_from_operation_id_where_spec_says_so(self) -> None:
+        assert ENDPOINTS["LegacyProjects.info"].request_path == "projects.info"
+
+    def test_required_matches_required_params(self) -> None:
+        endpoint = ENDPOINTS["deals.move"]
+        assert endpoint.required == frozenset({"id", "phase_id"})
+
+    def test_required_sets_are_shared(self) -> None:
+        required = ENDPOINTS["departments.info"].required
+        assert ENDPOINTS["deals.info"].required is required
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(ENDPOINTS["deals.info"], "__dict__")
+
+    def test_is_frozen(self) -> None:
+        with pytest.raises(AttributeError):
+            ENDPOINTS["deals.info"].path = "/x"  # type: ignore[misc]
+
+    def test_manual_construction_computes_derived_fields(self) -> None:
+        endpoint = Endpoint("x.y", "POST", "/x.y", "x", ("id",), ())
+        assert endpoint.request_path == "x.y"
+        assert endpoint.required == {"id"}
+        assert endpoint.description == ""
+
+    def test_description(self) -> None:
+        assert ENDPOINTS["deals.info"].description == "Get details for a single deal."
+
+    def test_description_module_not_loaded_by_lookup(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from teamleader._generated.endpoints import ENDPOINTS; "
+                "ENDPOINTS['deals.info'].request_path; "
+                "print('teamleader._generated.endpoints._descriptions' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,91 @@
+"""Unit tests for the codegen-emitted request-body validators.
+
+Covers:
+- Every operation has a validator; an empty body only fails on required
+  fields
+- Type, enum, nullable, required and unknown-key checks, with dotted paths
+  into nested objects and arrays
+- ``oneOf`` accepts any branch and reports a single error otherwise
+- Unknown operations raise ``KeyError``
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from teamleader._generated.endpoints import ENDPOINTS
+from teamleader._generated.validators import get_validator, validate_request
+
+_VALID_DEAL = {
+    "lead": {"customer": {"type": "company", "id": "c1"}},
+    "title": "Big deal",
+    "estimated_value": {"amount": 100, "currency": "EUR"},
+}
+
+
+@pytest.mark.parametrize("operation_id", sorted(ENDPOINTS))
+def test_every_operation_has_a_validator(operation_id: str) -> None:
+    errors = sorted(validate_request(operation_id, {}))
+    required = ENDPOINTS[operation_id].required_params
+    # Bodies that are a top-level oneOf report a single shape error instead.
+    assert errors in (
+        sorted(f"{name}: required" for name in required),
+        ["body: does not match any allowed shape"],
+    )
+
+
+class TestValidateRequest:
+    def test_valid_body(self) -> None:
+        assert validate_request("deals.create", _VALID_DEAL) == []
+
+    def test_wrong_type(self) -> None:
+        errors = validate_request("deals.create", {**_VALID_DEAL, "title": 3})
+        assert errors == ["title: expected string"]
+
+    def test_bool_is_not_a_number(self) -> None:
+        body = {**_VALID_DEAL, "estimated_probability": True}
+        assert validate_request("deals.create", body) == [
+            "estimated_probability: expected number"
+        ]
+
+    def test_bad_enum_value_in_nested_object(self) -> None:
+        body = {**_VALID_DEAL, "lead": {"customer": {"type": "person", "id": "c1"}}}
+        assert validate_request("deals.create", body) == [
+            "lead.customer.type: must be one of ['company', 'contact']"
+        ]
+
+    def test_unknown_key(self) -> None:
+        errors = validate_request("deals.create", {**_VALID_DEAL, "titel": "x"})
+        assert errors == ["titel: unknown field"]
+
+    def test_missing_nested_required(self) -> None:
+        body = {**_VALID_DEAL, "lead": {"customer": {"type": "company"}}}
+        assert validate_request("deals.create", body) == ["lead.customer.id: required"]
+
+    def test_nullable_accepts_none(self) -> None:
+        body = {**_VALID_DEAL, "estimated_value": None}
+        assert validate_request("deals.create", body) == []
+
+    def test_non_nullable_rejects_none(self) -> None:
+        errors = validate_request("deals.create", {**_VALID_DEAL, "summary": None})
+        assert errors == ["summary: must not be null"]
+
+    def test_array_items_are_indexed(self) -> None:
+        body = {**_VALID_DEAL, "custom_fields": [{"id": "a", "value": "x"}, {"id": 2}]}
+        errors = validate_request("deals.create", body)
+        assert errors == ["custom_fields[1].id: expected string"]
+
+    def test_one_of_accepts_any_branch(self) -> None:
+        for value in ("text", 1.5, True, ["a", "b"]):
+            body = {**_VALID_DEAL, "custom_fields": [{"id": "a", "value": value}]}
+            assert validate_request("deals.create", body) == [], value
+
+    def test_one_of_rejects_when_no_branch_matches(self) -> None:
+        body = {**_VALID_DEAL, "custom_fields": [{"id": "a", "value": {"x": 1}}]}
+        assert validate_request("deals.create", body) == [
+            "custom_fields[0].value: does not match any allowed shape"
+        ]
+
+    def test_unknown_operation(self) -> None:
+        with pytest.raises(KeyError):
+            get_validator("not.real")
@@ -0,0 +1,305 @@
+"""Tests for request lifecycle hooks and the in-memory metrics collector.
+
+Covers:
+- Event order and fields (operation id, status, bytes, timings) for call(),
+  curated resources and streamed lists
+- Failed requests: error name on the event, transport exceptions
+- max_retries: 429s are retried after Retry-After, with a retry event
+  per attempt; the default (0) raises straight away
+- token_refresh fires only when the access token is refreshed
+- MetricsCollector: per-operation counts, histogram buckets, error counts,
+  bytes, retries, token refreshes, snapshot() and reset()
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+import requests
+
+import teamleader.client as client_module
+from teamleader.auth import Token
+from teamleader.client import TeamleaderClient
+from teamleader.exceptions import TeamleaderNotFoundError, TeamleaderRateLimitError
+from teamleader.hooks import (
+    ClientHooks,
+    MetricsCollector,
+    RequestEvent,
+    TokenRefreshEvent,
+)
+from teamleader.testing import FakeTeamleader
+from teamleader.transport import Transport
+
+
+class _Recorder(ClientHooks):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, Any]] = []
+
+    def request_start(self, event: RequestEvent) -> None:
+        self.events.append(("request_start", event.operation_id))
+
+    def response_received(self, event: RequestEvent) -> None:
+        self.events.append(("response_received", event.status_code))
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        self.events.append(("retry", delay))
+
+    def request_finished(self, event: RequestEvent) -> None:
+        self.events.append(("request_finished", event))
+
+    def token_refresh(self, event: TokenRefreshEvent) -> None:
+        self.events.append(("token_refresh", event))
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.events]
+
+    def finished(self) -> RequestEvent:
+        return next(
+            e for name, e in reversed(self.events) if name == "request_finished"
+        )
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    return FakeTeamleader()
+
+
+@pytest.fixture()
+def recorder() -> _Recorder:
+    return _Recorder()
+
+
+@pytest.fixture()
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    slept: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", slept.append)
+    return slept
+
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+
+class TestEvents:
+    def test_successful_call(self, server: FakeTeamleader, recorder: _Recorder) -> None:
+        server.seed("deals", [{"id": "d1", "title": "Deal"}])
+        client = server.client(hooks=[recorder])
+
+        client.call("deals.info", id="d1")
+
+        assert recorder.names() == [
+            "request_start",
+            "response_received",
+            "request_finished",
+        ]
+        assert recorder.events[0] == ("request_start", "deals.info")
+        event = recorder.finished()
+        assert event.status_code == 200
+        assert event.bytes_out == len(b'{"id":"d1"}')
+        assert event.bytes_in > 0
+        assert event.error is None
+        assert event.attempt == 1
+        assert event.total_ms == event.auth_ms + event.network_ms + event.decode_ms
+        assert min(event.auth_ms, event.network_ms, event.decode_ms) >= 0
+
+    def test_resource_calls_are_named_by_path(
+        self, server: FakeTeamleader, recorder: _Recorder
+    ) -> None:
+        server.client(hooks=[recorder]).deals.list()
+        assert recorder.finished().operation_id == "deals.list"
+
+    def test_error_is_reported(
+        self, server: FakeTeamleader, recorder: _Recorder
+    ) -> None:
+        client = server.client(hooks=[recorder])
+        with pytest.raises(TeamleaderNotFoundError):
+            client.call("deals.info", id="missing")
+        event = recorder.finished()
+        assert event.status_code == 404
+        assert event.error == "TeamleaderNotFoundError"
+
+    def test_transport_exception_is_reported(self, server: FakeTeamleader) -> None:
+        class _Down(Transport):
+            def request(
+                self, method: str, url: str, **kwargs: Any
+            ) -> requests.Response:
+                raise requests.ConnectionError("down")
+
+        recorder = _Recorder()
+        client = TeamleaderClient(
+            server.client()._auth, transport=_Down(), hooks=[recorder]
+        )
+        with pytest.raises(requests.ConnectionError):
+            client.call("users.me")
+        assert recorder.names() == ["request_start", "request_finished"]
+        assert recorder.finished().error == "ConnectionError"
+        assert recorder.finished().status_code is None
+
+    def test_stream_finishes_when_exhausted(
+        self, server: FakeTeamleader, recorder: _Recorder
+    ) -> None:
+        server.seed("deals", [{"title": str(i)} for i in range(3)])
+        stream = server.client(hooks=[recorder]).stream("deals.list")
+
+        assert "request_finished" not in recorder.names()
+        assert len(list(stream)) == 3
+        event = recorder.finished()
+        assert event.bytes_in == len(
+            json.dumps(
+                {
+                    "data": server.records("deals"),
+                    "meta": {"page": {"size": 20, "number": 1}},
+                }
+            )
+        )
+
+    def test_hooks_can_be_added_later(
+        self, server: FakeTeamleader, recorder: _Recorder
+    ) -> None:
+        client = server.client()
+        client.hooks.append(recorder)
+        client.call("users.me")
+        assert recorder.names()[-1] == "request_finished"
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+
+class TestRetries:
+    def test_default_raises_immediately(
+        self, server: FakeTeamleader, no_sleep: list[float]
+    ) -> None:
+        server.burst_429(1)
+        with pytest.raises(TeamleaderRateLimitError):
+            server.client().call("users.me")
+        assert no_sleep == []
+
+    def test_retries_after_retry_after(
+        self, server: FakeTeamleader, recorder: _Recorder, no_sleep: list[float]
+    ) -> None:
+        server.burst_429(2, retry_after=3)
+        client = server.client(hooks=[recorder], max_retries=2)
+
+        client.call("users.me")
+
+        assert no_sleep == [3.0, 3.0]
+        assert recorder.names() == [
+            "request_start", "response_received", "retry",
+            "request_start", "response_received", "retry",
+            "request_start", "response_received", "request_finished",
+        ]  # fmt: skip
+        assert recorder.finished().attempt == 3
+        assert len(server.calls) == 3
+
+    def test_gives_up_after_max_retries(
+        self, server: FakeTeamleader, recorder: _Recorder, no_sleep: list[float]
+    ) -> None:
+        server.burst_429(5)
+        client = server.client(hooks=[recorder], max_retries=1)
+        with pytest.raises(TeamleaderRateLimitError):
+            client.call("users.me")
+        assert len(no_sleep) == 1
+        assert recorder.finished().error == "TeamleaderRateLimitError"
+
+    def test_stream_is_retried(
+        self, server: FakeTeamleader, no_sleep: list[float]
+    ) -> None:
+        server.seed("deals", [{"title": "a"}])
+        server.burst_429(1)
+        assert len(list(server.client(max_retries=1).stream("deals.list"))) == 1
+
+
+# ---------------------------------------------------------------------------
+# Token refresh
+# ---------------------------------------------------------------------------
+
+
+class TestTokenRefresh:
+    def test_only_fires_on_refresh(
+        self, server: FakeTeamleader, recorder: _Recorder
+    ) -> None:
+        client = server.client(hooks=[recorder])
+        client.call("users.me")
+        assert "token_refresh" not in recorder.names()
+
+        client._auth.token_backend.save(
+            Token("old", "old", datetime(2000, 1, 1, tzinfo=timezone.utc))
+        )
+        client.call("users.me")
+
+        assert recorder.names()[0:4] == [
+            "request_start", "response_received", "request_finished", "token_refresh",
+        ]  # fmt: skip
+        refresh = recorder.events[3][1]
+        assert refresh.error is None
+        assert refresh.duration_ms >= 0
+
+
+# ---------------------------------------------------------------------------
+# MetricsCollector
+# ---------------------------------------------------------------------------
+
+
+def _event(
+    operation_id: str, total_ms: float, error: str | None = None
+) -> RequestEvent:
+    return RequestEvent(
+        operation_id, network_ms=total_ms, bytes_in=10, bytes_out=2, error=error
+    )
+
+
+class TestMetricsCollector:
+    def test_histogram_and_errors(self) -> None:
+        metrics = MetricsCollector(buckets_ms=(10.0, 100.0))
+        for total in (1.0, 10.0, 50.0, 500.0):
+            metrics.request_finished(_event("deals.list", total))
+        metrics.request_finished(_event("deals.list", 5.0, "TeamleaderServerError"))
+        metrics.retry(_event("deals.list", 0), 1.0)
+
+        stats = metrics.snapshot()["operations"]["deals.list"]
+        assert stats["count"] == 5
+        assert stats["histogram"] == [3, 1, 1]
+        assert stats["sum_ms"] == 566.0
+        assert stats["errors"] == {"TeamleaderServerError": 1}
+        assert stats["bytes_in"] == 50
+        assert stats["bytes_out"] == 10
+        assert stats["retries"] == 1
+
+    def test_token_refresh(self) -> None:
+        metrics = MetricsCollector()
+        metrics.token_refresh(TokenRefreshEvent(12.0))
+        metrics.token_refresh(TokenRefreshEvent(3.0, "TeamleaderAuthExpiredError"))
+        assert metrics.snapshot()["token_refresh"] == {
+            "count": 2,
+            "errors": 1,
+            "sum_ms": 15.0,
+        }
+
+    def test_collects_from_client(self, server: FakeTeamleader) -> None:
+        metrics = MetricsCollector()
+        client = server.client(hooks=[metrics])
+        server.seed("deals", [{"title": "a"}])
+
+        client.call("users.me")
+        list(client.deals.iterate())
+        with pytest.raises(TeamleaderNotFoundError):
+            client.deals.get("missing")
+
+        snapshot = metrics.snapshot()
+        json.dumps(snapshot)
+        operations = snapshot["operations"]
+        assert set(operations) == {"users.me", "deals.list", "deals.info"}
+        assert operations["deals.info"]["errors"] == {"TeamleaderNotFoundError": 1}
+        assert sum(operations["users.me"]["histogram"]) == 1
+
+    def test_reset(self) -> None:
+        metrics = MetricsCollector()
+        metrics.request_finished(_event("users.me", 1.0))
+        metrics.reset()
+        assert metrics.snapshot()["operations"] == {}
@@ -0,0 +1,81 @@
+"""Import-time budget for ``import teamleader``.
+
+Serverless functions and CLI tools pay the SDK's import cost on every cold
+start, so the generated layer is split per tag and loaded lazily.  These
+tests run the import in a fresh interpreter and fail if:
+
+- any per-tag ``_generated`` module is imported eagerly, or
+- the self-time of all ``teamleader*`` modules (from ``python -X importtime``,
+  third-party dependencies excluded) exceeds the budget.
+
+The budget defaults to 250 ms and can be overridden with the
+``TEAMLEADER_IMPORT_BUDGET_MS`` environment variable on slow CI runners.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+_BUDGET_MS = float(os.environ.get("TEAMLEADER_IMPORT_BUDGET_MS", "250"))
+
+#: Prints the loaded ``teamleader._generated`` submodules, one per line.
+_PRINT_GENERATED = (
+    "print('\\n'.join("
+    "m for m in sys.modules if m.startswith('teamleader._generated.')))"
+)
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _teamleader_self_time_ms(stderr: str) -> float:
+    """Sum the self-time column of every ``teamleader*`` line in importtime output."""
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("teamleader"):
+            total_us += int(self_us)
+    return total_us / 1000
+
+
+def test_generated_tag_modules_not_loaded_on_import() -> None:
+    result = _run("import sys, teamleader; " + _PRINT_GENERATED)
+    loaded = set(result.stdout.split())
+    assert loaded <= {"teamleader._generated.endpoints"}
+
+
+def test_endpoint_lookup_loads_only_its_tag_module() -> None:
+    result = _run(
+        "import sys; from teamleader._generated.endpoints import ENDPOINTS; "
+        "ENDPOINTS['deals.info']; " + _PRINT_GENERATED
+    )
+    assert set(result.stdout.split()) == {
+        "teamleader._generated.endpoints",
+        "teamleader._generated.endpoints.deals",
+    }
+
+
+@pytest.mark.skipif(
+    sys.flags.dev_mode, reason="-X dev slows imports; budget would be meaningless"
+)
+def test_import_teamleader_within_budget() -> None:
+    # Warm the bytecode cache first so the measurement excludes compilation.
+    _run("import teamleader")
+    result = _run("import teamleader", "-X", "importtime")
+    elapsed = _teamleader_self_time_ms(result.stderr)
+    assert elapsed < _BUDGET_MS, (
+        f"import teamleader took {elapsed:.1f} ms of SDK self-time "
+        f"(budget {_BUDGET_MS:.0f} ms)"
+    )
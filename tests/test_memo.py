@@ -0,0 +1,229 @@
+"""Tests for request-scoped memoisation of read calls.
+
+Covers:
+- is_read(): which operations are memoised
+- memoize(): identical reads sent once (curated get/list, call()), different
+  bodies sent separately, every hit decoded afresh, errors not remembered,
+  writes forget remembered responses, streams counted but not memoised
+- Scope: nothing memoised outside a block, nested blocks share the outer
+  memo, blocks are per thread, clients never share responses,
+  deduplicate=False only counts
+- RequestMemo totals (calls, hits, duration_ms) and the
+  ``cache_lookup("requests", hit)`` hook
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from teamleader.client import TeamleaderClient
+from teamleader.exceptions import TeamleaderNotFoundError
+from teamleader.hooks import ClientHooks, MetricsCollector, RequestEvent
+from teamleader.memo import current, is_read, memoize
+from teamleader.testing import FakeTeamleader
+
+
+class _Sent(ClientHooks):
+    """Records the operation of every request that reached the server."""
+
+    def __init__(self) -> None:
+        self.operations: list[str] = []
+
+    def request_start(self, event: RequestEvent) -> None:
+        self.operations.append(event.operation_id)
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": f"Deal {i}"} for i in range(5)])
+    return server
+
+
+@pytest.fixture()
+def sent() -> _Sent:
+    return _Sent()
+
+
+@pytest.fixture()
+def client(server: FakeTeamleader, sent: _Sent) -> TeamleaderClient:
+    return server.client(hooks=[sent])
+
+
+def _deal_id(server: FakeTeamleader) -> str:
+    return str(server.records("deals")[0]["id"])
+
+
+# ---------------------------------------------------------------------------
+# is_read()
+# ---------------------------------------------------------------------------
+
+
+class TestIsRead:
+    @pytest.mark.parametrize(
+        "operation",
+        ["deals.list", "deals.info", "users.me", "invoices.listPayments"],
+    )
+    def test_reads(self, operation: str) -> None:
+        assert is_read(operation)
+
+    @pytest.mark.parametrize(
+        "operation",
+        ["deals.update", "deals.create", "deals.move", "invoices.download"],
+    )
+    def test_writes(self, operation: str) -> None:
+        assert not is_read(operation)
+
+
+# ---------------------------------------------------------------------------
+# memoize()
+# ---------------------------------------------------------------------------
+
+
+class TestMemoize:
+    def test_identical_get_sent_once(
+        self, server: FakeTeamleader, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize() as memo:
+            first = client.deals.get(deal_id)
+            second = client.deals.get(deal_id)
+        assert first == second
+        assert sent.operations == ["deals.info"]
+        assert (memo.calls, memo.hits) == (1, 1)
+
+    def test_different_bodies_sent_separately(
+        self, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        with memoize():
+            client.deals.list(page=1, page_size=2)
+            client.deals.list(page=2, page_size=2)
+            client.deals.list(page=1, page_size=2)
+        assert sent.operations == ["deals.list", "deals.list"]
+
+    def test_call_is_memoised(self, client: TeamleaderClient, sent: _Sent) -> None:
+        with memoize():
+            client.call("users.me")
+            client.call("users.me")
+        assert sent.operations == ["users.me"]
+
+    def test_hits_are_independent_copies(
+        self, server: FakeTeamleader, client: TeamleaderClient
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize():
+            first = client.call("deals.info", id=deal_id)
+            first["data"]["title"] = "changed"
+            second = client.call("deals.info", id=deal_id)
+        assert second["data"]["title"] == "Deal 0"
+
+    def test_errors_are_not_remembered(
+        self, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        with memoize():
+            for _ in range(2):
+                with pytest.raises(TeamleaderNotFoundError):
+                    client.deals.get("missing")
+        assert sent.operations == ["deals.info", "deals.info"]
+
+    def test_write_forgets_responses(
+        self, server: FakeTeamleader, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize() as memo:
+            client.call("deals.info", id=deal_id)
+            client.call("deals.update", id=deal_id, title="Renamed")
+            assert len(memo) == 0
+            after = client.call("deals.info", id=deal_id)
+        assert after["data"]["title"] == "Renamed"
+        assert sent.operations == ["deals.info", "deals.update", "deals.info"]
+
+    def test_streams_counted_not_memoised(
+        self, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        with memoize() as memo:
+            for _ in range(2):
+                list(client.stream("deals.list"))
+        assert sent.operations == ["deals.list", "deals.list"]
+        assert memo.calls == 2
+
+
+# ---------------------------------------------------------------------------
+# Scope and totals
+# ---------------------------------------------------------------------------
+
+
+class TestScope:
+    def test_not_memoised_outside_block(
+        self, server: FakeTeamleader, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize():
+            client.deals.get(deal_id)
+        client.deals.get(deal_id)
+        assert current() is None
+        assert len(sent.operations) == 2
+
+    def test_nested_blocks_share_outer_memo(
+        self, server: FakeTeamleader, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize() as outer:
+            client.deals.get(deal_id)
+            with memoize() as inner:
+                client.deals.get(deal_id)
+            assert inner is outer
+        assert (outer.calls, outer.hits) == (1, 1)
+        assert sent.operations == ["deals.info"]
+
+    def test_per_thread(self, client: TeamleaderClient) -> None:
+        seen: list[object] = []
+        with memoize():
+            thread = threading.Thread(target=lambda: seen.append(current()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
+
+    def test_clients_do_not_share_responses(self) -> None:
+        acme, globex = FakeTeamleader(), FakeTeamleader()
+        acme.seed("deals", [{"title": "Acme deal"}])
+        globex.seed("deals", [{"title": "Globex deal"}])
+        acme_client, globex_client = acme.client(), globex.client()
+        with memoize() as memo:
+            acme_page = acme_client.deals.list()
+            globex_page = globex_client.deals.list()
+            acme_client.deals.list()
+        assert [d.title for d in acme_page.data] == ["Acme deal"]
+        assert [d.title for d in globex_page.data] == ["Globex deal"]
+        assert len(acme.calls) == len(globex.calls) == 1
+        assert (memo.calls, memo.hits) == (2, 1)
+
+    def test_deduplicate_off_only_counts(
+        self, server: FakeTeamleader, client: TeamleaderClient, sent: _Sent
+    ) -> None:
+        deal_id = _deal_id(server)
+        with memoize(deduplicate=False) as memo:
+            client.deals.get(deal_id)
+            client.deals.get(deal_id)
+        assert len(sent.operations) == 2
+        assert (memo.calls, memo.hits) == (2, 0)
+
+    def test_totals(self) -> None:
+        client = FakeTeamleader(latency=0.01).client()
+        with memoize() as memo:
+            client.call("users.me")
+            client.call("users.me")
+            client.call("departments.list")
+        assert (memo.calls, memo.hits) == (2, 1)
+        assert memo.duration_ms >= 20
+
+    def test_cache_lookup_hook(self, server: FakeTeamleader) -> None:
+        metrics = MetricsCollector()
+        client = server.client(hooks=[metrics])
+        deal_id = _deal_id(server)
+        with memoize():
+            for _ in range(3):
+                client.deals.get(deal_id)
+        assert metrics.snapshot()["caches"] == {"requests": {"hits": 2, "misses": 1}}
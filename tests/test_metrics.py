@@ -0,0 +1,219 @@
+"""Tests for the OpenMetrics exporter and the metrics it reports.
+
+Covers:
+- MetricsCollector: status counts, 429s with Retry-After, pages per
+  iterate() (buffered, streamed, stopped early), cache lookups
+- render(): TYPE/UNIT/HELP metadata, cumulative histogram buckets in seconds,
+  label escaping, token-refresh summary, trailing ``# EOF``
+- make_wsgi_app(): GET and HEAD serve metrics with the OpenMetrics
+  Content-Type; other methods get 405
+- Django: the metrics view and get_client() with ``TEAMLEADER["METRICS"]``
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from teamleader.exceptions import TeamleaderRateLimitError
+from teamleader.hooks import MetricsCollector, RequestEvent, TokenRefreshEvent
+from teamleader.metrics import CONTENT_TYPE, DEFAULT_COLLECTOR, make_wsgi_app, render
+from teamleader.testing import FakeTeamleader
+
+
+@pytest.fixture()
+def metrics() -> MetricsCollector:
+    return MetricsCollector()
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    return FakeTeamleader()
+
+
+def _samples(text: str) -> dict[str, str]:
+    """``{"name{labels}": "value"}`` for every sample line."""
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+# ---------------------------------------------------------------------------
+# Collector
+# ---------------------------------------------------------------------------
+
+
+class TestCollector:
+    def test_statuses(self, metrics: MetricsCollector) -> None:
+        for status in (200, 200, 404, None):
+            metrics.request_finished(RequestEvent("deals.info", status_code=status))
+        stats = metrics.snapshot()["operations"]["deals.info"]
+        assert stats["statuses"] == {"none": 1, "200": 2, "404": 1}
+
+    def test_rate_limited(
+        self, server: FakeTeamleader, metrics: MetricsCollector
+    ) -> None:
+        server.burst_429(1, retry_after=7)
+        with pytest.raises(TeamleaderRateLimitError):
+            server.client(hooks=[metrics]).call("users.me")
+        stats = metrics.snapshot()["operations"]["users.me"]
+        assert stats["rate_limited"] == 1
+        assert stats["retry_after_s"] == 7.0
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iterate_pages(
+        self, server: FakeTeamleader, metrics: MetricsCollector, stream: bool
+    ) -> None:
+        server.seed("deals", [{"title": str(i)} for i in range(45)])
+        client = server.client(hooks=[metrics])
+
+        list(client.deals.iterate(page_size=20, stream=stream))
+
+        stats = metrics.snapshot()["operations"]["deals.list"]
+        assert stats["iterations"] == 1
+        assert stats["pages"] == 3
+        assert stats["pages_histogram"] == [0, 0, 1, 0, 0, 0, 0, 0]
+
+    def test_iterate_stopped_early(
+        self, server: FakeTeamleader, metrics: MetricsCollector
+    ) -> None:
+        server.seed("deals", [{"title": str(i)} for i in range(45)])
+        iterator = server.client(hooks=[metrics]).deals.iterate(page_size=20)
+        next(iterator)
+        iterator.close()
+        assert metrics.snapshot()["operations"]["deals.list"]["pages"] == 1
+
+    def test_cache_lookups(self, metrics: MetricsCollector) -> None:
+        metrics.cache_lookup("tokens", True)
+        metrics.cache_lookup("tokens", True)
+        metrics.cache_lookup("tokens", False)
+        assert metrics.snapshot()["caches"] == {"tokens": {"hits": 2, "misses": 1}}
+
+
+# ---------------------------------------------------------------------------
+# render()
+# ---------------------------------------------------------------------------
+
+
+class TestRender:
+    def test_empty(self, metrics: MetricsCollector) -> None:
+        text = render(metrics)
+        assert text.endswith("# EOF\n")
+        assert "# TYPE teamleader_requests counter" in text
+        assert _samples(text)["teamleader_token_refreshes_total"] == "0"
+
+    def test_request_metrics(self) -> None:
+        metrics = MetricsCollector(buckets_ms=(10.0, 100.0))
+        for ms in (5.0, 50.0, 500.0):
+            metrics.request_finished(
+                RequestEvent("deals.list", status_code=200, network_ms=ms, bytes_in=10)
+            )
+        samples = _samples(render(metrics))
+
+        op = 'operation_id="deals.list"'
+        assert samples[f'teamleader_requests_total{{{op},status="200"}}'] == "3"
+        bucket = "teamleader_request_duration_seconds_bucket"
+        assert samples[f'{bucket}{{{op},le="0.01"}}'] == "1"
+        assert samples[f'{bucket}{{{op},le="0.1"}}'] == "2"
+        assert samples[f'{bucket}{{{op},le="+Inf"}}'] == "3"
+        assert samples[f"teamleader_request_duration_seconds_count{{{op}}}"] == "3"
+        assert samples[f"teamleader_request_duration_seconds_sum{{{op}}}"] == "0.555"
+        assert samples[f"teamleader_response_bytes_total{{{op}}}"] == "30"
+
+    def test_units_are_declared(self, metrics: MetricsCollector) -> None:
+        text = render(metrics)
+        assert "# UNIT teamleader_request_duration_seconds seconds" in text
+        assert "# UNIT teamleader_response_bytes bytes" in text
+
+    def test_label_escaping(self, metrics: MetricsCollector) -> None:
+        metrics.request_finished(
+            RequestEvent("x", status_code=500, error='Bad"\\\nName')
+        )
+        assert 'error="Bad\\"\\\\\\nName"' in render(metrics)
+
+    def test_token_refresh_summary(self, metrics: MetricsCollector) -> None:
+        metrics.token_refresh(TokenRefreshEvent(250.0))
+        samples = _samples(render(metrics))
+        assert samples["teamleader_token_refresh_duration_seconds_count"] == "1"
+        assert samples["teamleader_token_refresh_duration_seconds_sum"] == "0.25"
+
+    def test_cache_lookups(self, metrics: MetricsCollector) -> None:
+        metrics.cache_lookup("tokens", False)
+        samples = _samples(render(metrics))
+        lookups = "teamleader_cache_lookups_total"
+        assert samples[lookups + '{cache="tokens",result="miss"}'] == "1"
+        assert samples[lookups + '{cache="tokens",result="hit"}'] == "0"
+
+
+# ---------------------------------------------------------------------------
+# WSGI app
+# ---------------------------------------------------------------------------
+
+
+def _wsgi(
+    method: str, collector: MetricsCollector
+) -> tuple[str, dict[str, str], bytes]:
+    captured: dict[str, Any] = {}
+
+    def start_response(status: str, headers: list[tuple[str, str]]) -> None:
+        captured["status"] = status
+        captured["headers"] = dict(headers)
+
+    body = b"".join(
+        make_wsgi_app(collector)({"REQUEST_METHOD": method}, start_response)
+    )
+    return captured["status"], captured["headers"], body
+
+
+class TestWsgiApp:
+    def test_get(self, metrics: MetricsCollector) -> None:
+        status, headers, body = _wsgi("GET", metrics)
+        assert status == "200 OK"
+        assert headers["Content-Type"] == CONTENT_TYPE
+        assert body == render(metrics).encode()
+        assert headers["Content-Length"] == str(len(body))
+
+    def test_head(self, metrics: MetricsCollector) -> None:
+        status, _, body = _wsgi("HEAD", metrics)
+        assert status == "200 OK"
+        assert body == b""
+
+    def test_post_not_allowed(self, metrics: MetricsCollector) -> None:
+        status, headers, _ = _wsgi("POST", metrics)
+        assert status.startswith("405")
+        assert headers["Allow"] == "GET, HEAD"
+
+
+# ---------------------------------------------------------------------------
+# Django
+# ---------------------------------------------------------------------------
+
+
+class TestDjango:
+    def test_view(self, metrics: MetricsCollector) -> None:
+        from teamleader.django.views import metrics as metrics_view
+
+        metrics.cache_lookup("tokens", True)
+        response = metrics_view(RequestFactory().get("/metrics"), collector=metrics)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == CONTENT_TYPE
+        assert response.content.decode() == render(metrics)
+
+    def test_view_rejects_post(self) -> None:
+        from teamleader.django.views import metrics as metrics_view
+
+        assert metrics_view(RequestFactory().post("/metrics")).status_code == 405
+
+    def test_get_client_without_metrics(self) -> None:
+        from teamleader.django import get_client
+
+        assert get_client().hooks == []
+
+    def test_get_client_with_metrics(self, settings: Any) -> None:
+        from teamleader.django import get_client
+
+        with override_settings(TEAMLEADER={**settings.TEAMLEADER, "METRICS": True}):
+            assert get_client().hooks == [DEFAULT_COLLECTOR]
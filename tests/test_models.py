@@ -8,6 +8,8 @@ Covers:
 - ``to_dict()`` shape and optional-field omission
 - Common sub-models: TypeAndId, Address, AddressEntry, Email, Telephone,
   Money, CustomField, PaymentTerm, WebLink
+- ``interning()`` scopes: shared strings, deduplicated references and
+  custom-field definitions
 """
 
 from __future__ import annotations
@@ -25,6 +27,7 @@ from teamleader.models import (
     CustomField,
     Deal,
     Email,
+    Interner,
     Invoice,
     Money,
     PaymentTerm,
@@ -32,7 +35,9 @@ from teamleader.models import (
     Telephone,
     TypeAndId,
     WebLink,
+    interning,
 )
+from teamleader.models.interning import active_interner
 
 # ---------------------------------------------------------------------------
 # Shared sample payloads (trimmed to fields touched by from_api)
@@ -855,3 +860,74 @@ class TestQuotationToDict:
         q = Quotation(deal=TypeAndId(id="d1", type="deal"))
         d = q.to_dict()
         assert d["deal"] == {"id": "d1", "type": "deal"}
+
+
+# ===========================================================================
+# Interning
+# ===========================================================================
+
+
+class TestInterning:
+    def test_no_interner_active_by_default(self):
+        assert active_interner() is None
+
+    def test_interner_active_inside_block_only(self):
+        with interning() as interner:
+            assert active_interner() is interner
+        assert active_interner() is None
+
+    def test_reuses_supplied_interner(self):
+        interner = Interner()
+        with interning(interner) as active:
+            assert active is interner
+
+    def test_type_and_id_not_shared_without_interner(self):
+        a = TypeAndId.from_api({"id": "u1", "type": "user"})
+        b = TypeAndId.from_api({"id": "u1", "type": "user"})
+        assert a is not b
+        assert a == b
+
+    def test_type_and_id_deduplicated_inside_block(self):
+        with interning():
+            a = TypeAndId.from_api({"id": "u1", "type": "user"})
+            b = TypeAndId.from_api({"id": "u1", "type": "user"})
+            c = TypeAndId.from_api({"id": "u2", "type": "user"})
+        assert a is b
+        assert a is not c
+        assert a.type is c.type
+
+    def test_type_string_interned_without_interner(self):
+        a = TypeAndId.from_api({"id": "x", "type": "".join(["com", "pany"])})
+        b = TypeAndId.from_api({"id": "y", "type": "".join(["comp", "any"])})
+        assert a.type is b.type
+
+    def test_money_currency_interned(self):
+        a = Money.from_api({"amount": 1, "currency": "".join(["E", "UR"])})
+        b = Money.from_api({"amount": 2, "currency": "".join(["EU", "R"])})
+        assert a.currency is b.currency
+
+    def test_custom_field_definitions_shared_inside_block(self):
+        raw = {"type": "customFieldDefinition", "id": "cf-1"}
+        with interning() as interner:
+            a = CustomField.from_api({"definition": dict(raw), "value": 1})
+            b = CustomField.from_api({"definition": dict(raw), "value": 2})
+        assert a.definition is b.definition
+        assert interner.stats()["definitions"] == 1
+
+    def test_unhashable_definition_returned_unchanged(self):
+        raw = {"id": "cf-1", "options": ["a", "b"]}
+        with interning():
+            cf = CustomField.from_api({"definition": raw})
+        assert cf.definition is raw
+
+    def test_deals_share_references_inside_block(self):
+        with interning() as interner:
+            a = Deal.from_api(DEAL_DATA)
+            b = Deal.from_api(DEAL_DATA)
+        assert a.department is b.department
+        assert a.responsible_user is b.responsible_user
+        assert interner.stats()["refs"] > 0
+
+    def test_null_type_passes_through(self):
+        obj = TypeAndId.from_api({"id": "x", "type": None})
+        assert obj.type is None
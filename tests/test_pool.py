@@ -0,0 +1,392 @@
+"""Tests for the multi-tenant client pool (teamleader.pool).
+
+Covers:
+- TeamleaderClientPool.get(): one client per tenant, reused, each with its
+  own token backend, all sending through the one shared transport; inside
+  memoize() every tenant still sends its own reads
+- Eviction: least recently used beyond max_clients, idle clients after
+  idle_timeout, evict(); evicted tenants get a new client
+- auth_handler(): connecting a tenant saves its token in its backend
+- Per-tenant rate limits, kept across eviction and dropped once their window
+  is empty; client options and hooks passed to every client
+- close(): the shared transport is closed by the pool, never by a client
+- RateLimiter: limit per window, waiting for the oldest slot, empty()
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from teamleader.auth import MemoryTokenBackend, Token, TokenBackend
+from teamleader.hooks import ClientHooks, RequestEvent
+from teamleader.memo import memoize
+from teamleader.pool import RateLimiter, TeamleaderClientPool
+from teamleader.testing import FakeTeamleader, FakeTransport
+
+
+class _Clock:
+    """Stands in for ``time.monotonic`` and ``time.sleep`` in teamleader.pool."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+        monkeypatch.setattr("teamleader.pool.time.monotonic", lambda: self.now)
+        monkeypatch.setattr("teamleader.pool.time.sleep", self.sleep)
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class _Operations(ClientHooks):
+    def __init__(self) -> None:
+        self.operations: list[str] = []
+
+    def request_start(self, event: RequestEvent) -> None:
+        self.operations.append(event.operation_id)
+
+
+class _Transport(FakeTransport):
+    """Counts :meth:`close` calls."""
+
+    closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": "Deal"}])
+    return server
+
+
+@pytest.fixture()
+def backends() -> dict[str, MemoryTokenBackend]:
+    return {}
+
+
+def _backend(backends: dict[str, MemoryTokenBackend]) -> Any:
+    def factory(tenant_id: str) -> TokenBackend:
+        backend = backends.setdefault(tenant_id, MemoryTokenBackend())
+        if backend.get() is None:
+            backend.save(
+                Token(
+                    f"access-{tenant_id}",
+                    f"refresh-{tenant_id}",
+                    datetime.now(tz=timezone.utc) + timedelta(hours=1),
+                )
+            )
+        return backend
+
+    return factory
+
+
+@pytest.fixture()
+def transport(server: FakeTeamleader) -> _Transport:
+    return _Transport(server)
+
+
+def _pool(
+    backends: dict[str, MemoryTokenBackend], transport: _Transport, **options: Any
+) -> TeamleaderClientPool:
+    return TeamleaderClientPool(
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="http://localhost/callback",
+        token_backend=_backend(backends),
+        transport=transport,
+        **options,
+    )
+
+
+# ---------------------------------------------------------------------------
+# get()
+# ---------------------------------------------------------------------------
+
+
+class TestGet:
+    def test_client_per_tenant(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        acme, globex = pool.get("acme"), pool.get("globex")
+        assert acme is not globex
+        assert pool.get("acme") is acme
+        assert len(pool) == 2
+        assert "acme" in pool
+        assert "initech" not in pool
+
+    def test_own_tokens(
+        self,
+        server: FakeTeamleader,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        seen: list[str] = []
+        original = transport.request
+
+        def request(method: str, url: str, **kwargs: Any) -> Any:
+            seen.append((kwargs.get("headers") or {}).get("Authorization", ""))
+            return original(method, url, **kwargs)
+
+        transport.request = request  # type: ignore[method-assign]
+        pool = _pool(backends, transport)
+        pool.get("acme").call("deals.list")
+        pool.get("globex").call("deals.list")
+        assert seen == ["Bearer access-acme", "Bearer access-globex"]
+
+    def test_own_tokens_inside_memoize(
+        self,
+        server: FakeTeamleader,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        seen: list[str] = []
+        original = transport.request
+
+        def request(method: str, url: str, **kwargs: Any) -> Any:
+            seen.append((kwargs.get("headers") or {}).get("Authorization", ""))
+            return original(method, url, **kwargs)
+
+        transport.request = request  # type: ignore[method-assign]
+        pool = _pool(backends, transport)
+        with memoize() as memo:
+            for tenant_id in ("acme", "globex", "acme", "globex"):
+                pool.get(tenant_id).call("deals.list")
+        assert seen == ["Bearer access-acme", "Bearer access-globex"]
+        assert [operation for operation, _ in server.calls] == ["deals.list"] * 2
+        assert (memo.calls, memo.hits) == (2, 2)
+
+    def test_shared_transport(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        for tenant_id in ("acme", "globex"):
+            client = pool.get(tenant_id)
+            assert client._transport._transport is transport  # type: ignore[attr-defined]
+            assert client._auth.transport is transport
+
+    def test_default_transport_pool_size(
+        self, backends: dict[str, MemoryTokenBackend]
+    ) -> None:
+        pool = TeamleaderClientPool(
+            client_id="id",
+            client_secret="secret",
+            redirect_uri="http://localhost/callback",
+            token_backend=_backend(backends),
+            pool_size=4,
+        )
+        adapter = pool.transport.session.get_adapter(  # type: ignore[attr-defined]
+            "https://api.focus.teamleader.eu/deals.list"
+        )
+        assert adapter._pool_maxsize == 4
+
+    def test_client_options(
+        self,
+        server: FakeTeamleader,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        hooks = _Operations()
+        pool = _pool(backends, transport, hooks=iter([hooks]), timeout=5)
+        pool.get("acme").call("deals.list")
+        pool.get("globex").call("deals.list")
+        assert hooks.operations == ["deals.list", "deals.list"]
+        assert pool.get("acme")._timeout == 5
+
+
+# ---------------------------------------------------------------------------
+# Eviction
+# ---------------------------------------------------------------------------
+
+
+class TestEviction:
+    def test_least_recently_used(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport, max_clients=2)
+        acme = pool.get("acme")
+        pool.get("globex")
+        pool.get("acme")
+        pool.get("initech")
+        assert "globex" not in pool
+        assert pool.get("acme") is acme
+        assert len(pool) == 2
+
+    def test_idle(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        pool = _pool(backends, transport, idle_timeout=60)
+        acme = pool.get("acme")
+        clock.now += 30
+        pool.get("globex")
+        clock.now += 31
+        assert pool.get("globex") is not None
+        assert "acme" not in pool
+        assert pool.get("acme") is not acme
+
+    def test_idle_timeout_none(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        pool = _pool(backends, transport, idle_timeout=None)
+        acme = pool.get("acme")
+        clock.now += 10**6
+        assert pool.get("acme") is acme
+
+    def test_evict(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        acme = pool.get("acme")
+        assert pool.evict("acme")
+        assert not pool.evict("acme")
+        assert pool.get("acme") is not acme
+
+    def test_max_clients_validated(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        with pytest.raises(ValueError):
+            _pool(backends, transport, max_clients=0)
+
+
+# ---------------------------------------------------------------------------
+# Tokens, rate limits, closing
+# ---------------------------------------------------------------------------
+
+
+class TestAuthHandler:
+    def test_exchange_code_saves_tenant_token(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        handler = pool.auth_handler("acme")
+        assert "client_id=id" in handler.get_authorization_url()
+        handler.exchange_code("code")
+        assert backends["acme"].get().access_token == "fake-access-1"  # type: ignore[union-attr]
+        assert backends.keys() == {"acme"}
+
+
+class TestRateLimit:
+    def test_per_tenant(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        pool = _pool(backends, transport, rate_limit=2, rate_window=10)
+        acme, globex = pool.get("acme"), pool.get("globex")
+        acme.call("deals.list")
+        acme.call("deals.list")
+        globex.call("deals.list")
+        assert clock.slept == []
+        acme.call("deals.list")
+        assert clock.slept == [10]
+
+    def test_kept_across_eviction(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        pool = _pool(backends, transport, max_clients=1, rate_limit=2, rate_window=10)
+        acme = pool.get("acme")
+        acme.call("deals.list")
+        acme.call("deals.list")
+        pool.get("globex")
+        rebuilt = pool.get("acme")
+        assert rebuilt is not acme
+        assert rebuilt._transport._limiter is acme._transport._limiter  # type: ignore[attr-defined]
+        rebuilt.call("deals.list")
+        assert clock.slept == [10]
+
+    def test_dropped_once_window_empty(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        pool = _pool(backends, transport, max_clients=1, rate_limit=2, rate_window=10)
+        pool.get("acme").call("deals.list")
+        pool.get("globex")
+        assert pool._limiters.keys() == {"acme", "globex"}
+        clock.now += 10
+        pool.get("initech")
+        assert pool._limiters.keys() == {"initech"}
+
+    def test_unlimited_by_default(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        backends: dict[str, MemoryTokenBackend],
+        transport: _Transport,
+    ) -> None:
+        clock = _Clock(monkeypatch)
+        client = _pool(backends, transport).get("acme")
+        for _ in range(5):
+            client.call("deals.list")
+        assert clock.slept == []
+
+
+class TestClose:
+    def test_client_close_keeps_shared_transport(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        pool.get("acme").close()
+        assert transport.closed == 0
+        pool.get("globex").call("deals.list")
+
+    def test_pool_close(
+        self, backends: dict[str, MemoryTokenBackend], transport: _Transport
+    ) -> None:
+        pool = _pool(backends, transport)
+        pool.get("acme")
+        pool.close()
+        assert transport.closed == 1
+        assert len(pool) == 0
+
+
+# ---------------------------------------------------------------------------
+# RateLimiter
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiter:
+    def test_waits_for_oldest_slot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = _Clock(monkeypatch)
+        limiter = RateLimiter(2, window=10)
+        assert limiter.acquire() == 0
+        clock.now += 4
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 6
+        # The slot of the second request frees up 4 s later.
+        assert limiter.acquire() == 4
+
+    def test_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = _Clock(monkeypatch)
+        limiter = RateLimiter(2, window=10)
+        assert limiter.empty()
+        limiter.acquire()
+        clock.now += 9
+        assert not limiter.empty()
+        clock.now += 1
+        assert limiter.empty()
+
+    def test_limit_validated(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(0)
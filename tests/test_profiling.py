@@ -0,0 +1,229 @@
+"""Tests for sampled per-call profiling.
+
+Covers:
+- CallProfiler: sampling rate (0, 1, deterministic sampler), rate validation,
+  one .prof and one tracemalloc diff per profiled operation, memory capture
+  off, tracemalloc stopped again unless it was already running, failed
+  operations still written, unwritable directory logged without failing the
+  operation, one profiled operation at a time
+- client.call and CrudResource.iterate (buffered, streamed, stopped early):
+  profiled when sampled, only while the SDK produces items
+- Django: get_client() with and without ``TEAMLEADER["PROFILING"]``
+"""
+
+from __future__ import annotations
+
+import logging
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.test import override_settings
+
+from teamleader.profiling import CallProfiler
+from teamleader.testing import FakeTeamleader
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": str(i)} for i in range(45)])
+    return server
+
+
+def _functions(path: Path) -> set[str]:
+    """Names of the functions recorded in a cProfile stats file."""
+    return {name for _, _, name in pstats.Stats(str(path)).stats}  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# CallProfiler
+# ---------------------------------------------------------------------------
+
+
+class TestCallProfiler:
+    def test_rate_zero_never_samples(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=0.0, sample=pytest.fail)
+        with profiler.profile("x"):
+            pass
+        assert not profiler.results
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sampler_decides(self, tmp_path: Path) -> None:
+        draws = iter([0.2, 0.05, 0.1])
+        profiler = CallProfiler(
+            tmp_path, rate=0.1, memory=False, sample=lambda: next(draws)
+        )
+        for _ in range(3):
+            with profiler.profile("x"):
+                pass
+        assert len(profiler.results) == 1
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.5])
+    def test_invalid_rate(self, tmp_path: Path, rate: float) -> None:
+        with pytest.raises(ValueError, match="rate"):
+            CallProfiler(tmp_path, rate=rate)
+
+    def test_writes_stats_and_memory_diff(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path / "profiles", rate=1.0, top=5)
+
+        def build() -> list[bytes]:
+            return [bytes(1000) for _ in range(100)]
+
+        with profiler.profile("deals.list"):
+            kept = build()
+
+        (result,) = profiler.results
+        assert result.operation == "deals.list"
+        assert result.stats_path.name.endswith("-deals.list.prof")
+        assert "build" in _functions(result.stats_path)
+        assert result.memory_path is not None
+        lines = result.memory_path.read_text().splitlines()
+        assert lines[0].startswith("# deals.list: top 5 allocation changes")
+        assert 1 < len(lines) <= 6
+        assert "test_profiling.py" in lines[1]
+        assert len(kept) == 100
+
+    def test_memory_off(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        with profiler.profile("x"):
+            assert not tracemalloc.is_tracing()
+        assert profiler.results[0].memory_path is None
+
+    def test_tracemalloc_left_as_found(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0)
+        with profiler.profile("x"):
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+        tracemalloc.start()
+        try:
+            with profiler.profile("x"):
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_failure_is_still_written(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        with pytest.raises(RuntimeError), profiler.profile("x"):
+            raise RuntimeError
+        assert profiler.results[0].stats_path.exists()
+
+    def test_unwritable_directory(
+        self, server: FakeTeamleader, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        (tmp_path / "file").write_text("")
+        profiler = CallProfiler(tmp_path / "file" / "profiles", rate=1.0)
+        client = server.client()
+        client.profiler = profiler
+        with caplog.at_level(logging.WARNING, logger="teamleader.profiling"):
+            assert len(client.call("deals.list")["data"]) == 20
+            assert len(list(client.deals.iterate(page_size=20))) == 45
+        assert not tracemalloc.is_tracing()
+        assert len(profiler.results) == 0
+        assert [r.getMessage() for r in caplog.records] == [
+            f"Could not write the profile of {op} to {profiler.directory}"
+            for op in ("deals.list", "deals.iterate")
+        ]
+        with profiler.profile("again"):
+            pass
+
+    def test_one_operation_at_a_time(self, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        with profiler.profile("outer"), profiler.profile("inner"):
+            pass
+        assert [r.operation for r in profiler.results] == ["outer"]
+        with profiler.profile("again"):
+            pass
+        assert len(profiler.results) == 2
+
+
+# ---------------------------------------------------------------------------
+# Client integration
+# ---------------------------------------------------------------------------
+
+
+class TestClient:
+    def test_unprofiled_by_default(self, server: FakeTeamleader) -> None:
+        assert server.client().profiler is None
+
+    def test_call(self, server: FakeTeamleader, tmp_path: Path) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        server.client(profiler=profiler).call("deals.list")
+        (result,) = profiler.results
+        assert result.operation == "deals.list"
+        assert "_send" in _functions(result.stats_path)
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iterate(
+        self, server: FakeTeamleader, tmp_path: Path, stream: bool
+    ) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        client = server.client(profiler=profiler)
+
+        def consumer_work() -> None:
+            pass
+
+        count = 0
+        for _ in client.deals.iterate(page_size=20, stream=stream):
+            consumer_work()
+            count += 1
+
+        assert count == 45
+        (result,) = profiler.results
+        assert result.operation == "deals.iterate"
+        functions = _functions(result.stats_path)
+        assert "_send" in functions
+        assert "consumer_work" not in functions
+
+    def test_iterate_stopped_early(
+        self, server: FakeTeamleader, tmp_path: Path
+    ) -> None:
+        profiler = CallProfiler(tmp_path, rate=1.0, memory=False)
+        iterator = server.client(profiler=profiler).deals.iterate(page_size=20)
+        next(iterator)
+        iterator.close()
+        assert len(profiler.results) == 1
+        # The lock was released: the next operation is profiled again.
+        server.client(profiler=profiler).call("users.me")
+        assert len(profiler.results) == 2
+
+
+# ---------------------------------------------------------------------------
+# Django
+# ---------------------------------------------------------------------------
+
+
+class TestDjango:
+    def test_not_configured(self) -> None:
+        from teamleader.django import get_client
+
+        assert get_client().profiler is None
+
+    def test_configured(self, settings: Any, tmp_path: Path) -> None:
+        from teamleader.django import get_client
+
+        conf = {"RATE": 0.25, "DIRECTORY": str(tmp_path), "MEMORY": False, "TOP": 5}
+        with override_settings(TEAMLEADER={**settings.TEAMLEADER, "PROFILING": conf}):
+            profiler = get_client().profiler
+        assert profiler is not None
+        assert (profiler.rate, profiler.directory, profiler.memory, profiler.top) == (
+            0.25,
+            tmp_path,
+            False,
+            5,
+        )
+
+    def test_default_directory(self, settings: Any) -> None:
+        from teamleader.django import get_client
+
+        with override_settings(
+            TEAMLEADER={**settings.TEAMLEADER, "PROFILING": {"RATE": 0.5}}
+        ):
+            profiler = get_client().profiler
+        assert profiler is not None
+        assert profiler.directory.name == "teamleader-profiles"
+        assert profiler.rate == 0.5
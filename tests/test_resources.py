@@ -48,10 +48,23 @@ CrudResource.iterate
   - stops after the last page (does not over-fetch)
   - custom page_size is forwarded to list()
   - **filters are forwarded to every list() call
+
+Field projection (fields=[...])
+  - only the projected keys reach from_api; others keep defaults
+  - id is always included
+  - unknown field names raise ValueError
+  - the projection is carried to Page.next() and every iterate() page
+
+Streaming iterate (stream=True)
+  - items from every page are yielded via client._post_stream
+  - pagination stops on meta.matches, or on a short page without it
+  - the projection applies to streamed items
+  - breaking out early closes the current stream
 """
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import MagicMock, call, patch
@@ -59,6 +72,7 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 
 from teamleader.resources.base import CrudResource, Page
+from teamleader.streaming import ListStream
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +130,9 @@ def _make_add_resp(id: str) -> dict[str, Any]:
 @pytest.fixture()
 def mock_client() -> MagicMock:
     """A MagicMock that stands in for TeamleaderClient."""
-    return MagicMock()
+    client = MagicMock()
+    client.profiler = None
+    return client
 
 
 @pytest.fixture()
@@ -604,6 +620,159 @@ class TestCrudResourceIterate:
         assert result == []
 
 
+class TestCrudResourceFields:
+    def test_list_projects_requested_fields(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post.return_value = _make_list_resp(
+            [{"id": "a", "name": "A"}], matches=1
+        )
+
+        page = resource.list(fields=["id"])
+
+        assert page.data == [_FakeModel("a", "")]
+
+    def test_id_always_included(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post.return_value = _make_list_resp(
+            [{"id": "a", "name": "A"}], matches=1
+        )
+
+        page = resource.list(fields=["name"])
+
+        assert page.data == [_FakeModel("a", "A")]
+        assert page._fields == ("id", "name")
+
+    def test_fields_not_sent_to_api(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post.return_value = _make_list_resp([], matches=0)
+
+        resource.list(fields=["name"])
+
+        body = mock_client._post.call_args[0][1]
+        assert "fields" not in body
+
+    def test_unknown_field_raises_value_error(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        with pytest.raises(ValueError, match="Unknown field"):
+            resource.list(fields=["nope"])
+        mock_client._post.assert_not_called()
+
+    def test_page_next_forwards_fields(self) -> None:
+        mock_resource = MagicMock()
+        page = Page(data=[], total_count=50, current_page=1, page_size=20)
+        page._resource = mock_resource
+        page._fields = ("id", "name")
+
+        page.next()
+
+        mock_resource.list.assert_called_once_with(
+            page=2, page_size=20, fields=("id", "name")
+        )
+
+    def test_iterate_projects_every_page(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post.side_effect = [
+            _make_list_resp([{"id": "a", "name": "A"}], matches=2),
+            _make_list_resp([{"id": "b", "name": "B"}], matches=2),
+        ]
+
+        result = list(resource.iterate(page_size=1, fields=["id"]))
+
+        assert result == [_FakeModel("a", ""), _FakeModel("b", "")]
+
+    def test_invoice_heavy_fields_skipped(self) -> None:
+        from teamleader.resources.invoices import InvoicesResource
+
+        client = MagicMock()
+        client._post.return_value = _make_list_resp(
+            [
+                {
+                    "id": "inv-1",
+                    "invoice_number": "2024 / 1",
+                    "grouped_lines": [{"section": {"title": "A"}, "line_items": []}],
+                    "custom_fields": [{"definition": {"id": "cf"}, "value": 1}],
+                }
+            ],
+            matches=1,
+        )
+
+        page = InvoicesResource(client).list(fields=["invoice_number"])
+
+        invoice = page.data[0]
+        assert invoice.invoice_number == "2024 / 1"
+        assert invoice.grouped_lines == []
+        assert invoice.custom_fields == []
+
+
+def _make_stream(
+    items: list[dict[str, Any]], *, matches: int | None = None
+) -> ListStream:
+    """Build a ListStream over a synthetic list response, one chunk per 7 bytes."""
+    body = json.dumps(_make_list_resp(items, matches=matches)).encode()
+    if matches is None:
+        body = json.dumps({"data": items}).encode()
+    return ListStream(body[i : i + 7] for i in range(0, len(body), 7))
+
+
+class TestCrudResourceIterateStream:
+    def test_yields_items_from_every_page(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post_stream.side_effect = [
+            _make_stream([{"id": "a", "name": "A"}], matches=2),
+            _make_stream([{"id": "b", "name": "B"}], matches=2),
+        ]
+
+        result = list(resource.iterate(page_size=1, stream=True))
+
+        assert result == [_FakeModel("a", "A"), _FakeModel("b", "B")]
+        mock_client._post.assert_not_called()
+        bodies = [c[0][1] for c in mock_client._post_stream.call_args_list]
+        assert [b["page"]["number"] for b in bodies] == [1, 2]
+
+    def test_short_page_without_matches_stops(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post_stream.side_effect = [
+            _make_stream([{"id": "a"}, {"id": "b"}]),
+            _make_stream([{"id": "c"}]),
+        ]
+
+        result = list(resource.iterate(page_size=2, stream=True))
+
+        assert [m.id for m in result] == ["a", "b", "c"]
+        assert mock_client._post_stream.call_count == 2
+
+    def test_projection_applies(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        mock_client._post_stream.return_value = _make_stream(
+            [{"id": "a", "name": "A"}], matches=1
+        )
+
+        result = list(resource.iterate(stream=True, fields=["id"]))
+
+        assert result == [_FakeModel("a", "")]
+
+    def test_early_break_closes_stream(
+        self, resource: _FakeResource, mock_client: MagicMock
+    ) -> None:
+        closed = MagicMock()
+        body = json.dumps(_make_list_resp([{"id": "a"}, {"id": "b"}])).encode()
+        mock_client._post_stream.return_value = ListStream([body], close=closed)
+
+        iterator = resource.iterate(stream=True)
+        next(iterator)
+        iterator.close()
+
+        closed.assert_called_once()
+
+
 # ===========================================================================
 # Phase 9 — Extra methods on concrete resource classes
 # ===========================================================================
@@ -0,0 +1,141 @@
+"""Unit tests for incremental list-response parsing.
+
+Covers:
+- ListStream yields every ``data`` item regardless of chunk boundaries
+  (including splits inside strings, numbers and multi-byte UTF-8)
+- Other top-level members are collected in ``rest`` / ``meta``, whether they
+  come before or after ``data``
+- ``meta`` is unavailable until the stream is exhausted
+- Empty bodies and empty ``data`` arrays yield nothing
+- Malformed input raises ValueError
+- ``close`` is called on exhaustion and on early close
+- The first item is yielded before the rest of the body has been read
+- TeamleaderClient.stream() validates like call(), streams over HTTP and
+  raises HTTP errors before the first item
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import responses
+
+from teamleader.client import TeamleaderClient
+from teamleader.constants import BASE_URL
+from teamleader.exceptions import TeamleaderNotFoundError
+from teamleader.streaming import ListStream
+
+_ITEMS: list[dict[str, Any]] = [
+    {
+        "id": f"id-{i}",
+        "name": 'Café "Ø" ✓\n',
+        "amount": 1234.5 + i,
+        "tags": [],
+        "x": None,
+    }
+    for i in range(5)
+]
+_BODY = json.dumps(
+    {"data": _ITEMS, "meta": {"page": {"size": 5, "number": 1}, "matches": 12}},
+    ensure_ascii=False,
+).encode()
+
+
+def _chunks(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class TestListStream:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+    def test_items_independent_of_chunk_size(self, size: int) -> None:
+        stream = ListStream(_chunks(_BODY, size))
+        assert list(stream) == _ITEMS
+        assert stream.meta == {"page": {"size": 5, "number": 1}, "matches": 12}
+
+    def test_members_before_data_are_kept(self) -> None:
+        body = b'{"meta": {"matches": 1}, "data": [{"id": 1}], "included": {}}'
+        stream = ListStream([body])
+        assert list(stream) == [{"id": 1}]
+        assert stream.rest == {"meta": {"matches": 1}, "included": {}}
+
+    def test_meta_requires_exhaustion(self) -> None:
+        stream = ListStream([_BODY])
+        next(stream)
+        with pytest.raises(RuntimeError):
+            stream.meta
+
+    def test_meta_defaults_to_empty(self) -> None:
+        stream = ListStream([b'{"data": []}'])
+        assert list(stream) == []
+        assert stream.meta == {}
+
+    def test_empty_body(self) -> None:
+        assert list(ListStream([b""])) == []
+
+    def test_whitespace_everywhere(self) -> None:
+        body = b' {\n "data" : [ {"id": 1} ,\t{"id": 2} ] , "meta" : {} } '
+        assert list(ListStream(_chunks(body, 3))) == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.parametrize(
+        "body", [b'["not", "an", "object"]', b'{"data": [{"id": 1}', b'{"data": [1 2]}']
+    )
+    def test_malformed_raises_value_error(self, body: bytes) -> None:
+        with pytest.raises(ValueError):
+            list(ListStream([body]))
+
+    def test_close_called_on_exhaustion(self) -> None:
+        close = MagicMock()
+        list(ListStream([_BODY], close=close))
+        close.assert_called_once()
+
+    def test_close_called_on_early_close(self) -> None:
+        close = MagicMock()
+        stream = ListStream([_BODY], close=close)
+        next(stream)
+        stream.close()
+        close.assert_called_once()
+
+    def test_first_item_yielded_before_body_is_read(self) -> None:
+        read: list[int] = []
+
+        def chunks() -> Any:
+            for i, chunk in enumerate(_chunks(_BODY, 16)):
+                read.append(i)
+                yield chunk
+
+        total = len(_chunks(_BODY, 16))
+        stream = ListStream(chunks())
+        assert next(stream) == _ITEMS[0]
+        assert len(read) < total // 2
+
+
+class TestClientStream:
+    @responses.activate
+    def test_streams_items(self, client: TeamleaderClient) -> None:
+        responses.add(responses.POST, f"{BASE_URL}/departments.list", body=_BODY)
+        stream = client.stream("departments.list", page={"size": 5, "number": 1})
+        assert list(stream) == _ITEMS
+        assert stream.meta["matches"] == 12
+        assert json.loads(responses.calls[0].request.body) == {
+            "page": {"size": 5, "number": 1}
+        }
+
+    def test_validates_like_call(self, client: TeamleaderClient) -> None:
+        with pytest.raises(ValueError, match="Unknown operation_id"):
+            client.stream("not.real")
+
+    @responses.activate
+    def test_http_error_raised_before_first_item(
+        self, client: TeamleaderClient
+    ) -> None:
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/departments.list",
+            json={"errors": [{"title": "Nope"}]},
+            status=404,
+        )
+        with pytest.raises(TeamleaderNotFoundError, match="Nope"):
+            client.stream("departments.list")
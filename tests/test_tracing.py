@@ -0,0 +1,205 @@
+"""Tests for the optional OpenTelemetry instrumentation.
+
+Covers:
+- Without OpenTelemetry: span/start_span are no-ops, no traceparent is
+  injected, propagate_context returns the callable unchanged, and
+  instrumented client calls behave exactly as before
+- With the OpenTelemetry SDK (skipped when it is not installed):
+  - client.call: span name, operation ID and item count attributes
+  - CrudResource list/get/create/update: one span per call, nested API calls
+  - iterate(): one span per page, buffered and streamed, with page number,
+    page size and item count; a failing page is marked as an error
+  - traceparent propagation: inject/use_traceparent and propagate_context
+    across a thread pool
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from teamleader import tracing
+from teamleader.exceptions import TeamleaderServerError
+from teamleader.testing import FakeTeamleader
+
+
+@pytest.fixture()
+def server() -> FakeTeamleader:
+    server = FakeTeamleader()
+    server.seed("deals", [{"title": str(i)} for i in range(45)])
+    return server
+
+
+# ---------------------------------------------------------------------------
+# Without OpenTelemetry
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def no_otel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tracing, "_api", None)
+    monkeypatch.setattr(tracing, "_resolved", True)
+
+
+@pytest.mark.usefixtures("no_otel")
+class TestNoop:
+    def test_span(self) -> None:
+        with tracing.span("x", {tracing.OPERATION_ID: "x"}) as span:
+            span.set_attribute(tracing.ITEM_COUNT, 1)
+            assert not span.is_recording()
+
+    def test_start_span(self) -> None:
+        span = tracing.start_span("x")
+        tracing.record_error(span, ValueError())
+        span.end()
+        assert not span.is_recording()
+
+    def test_no_traceparent(self) -> None:
+        assert tracing.inject_traceparent() == {}
+        with tracing.use_traceparent(
+            {"traceparent": "00-" + "1" * 32 + "-" + "2" * 16 + "-01"}
+        ):
+            pass
+
+    def test_propagate_context_is_identity(self) -> None:
+        def fn() -> int:
+            return 1
+
+        assert tracing.propagate_context(fn) is fn
+
+    def test_client_unchanged(self, server: FakeTeamleader) -> None:
+        client = server.client()
+        assert len(client.call("deals.list")["data"]) == 20
+        assert len(list(client.deals.iterate(page_size=20, stream=True))) == 45
+        contact = client.contacts.create(first_name="Ada", last_name="Lovelace")
+        updated = client.contacts.update(contact.id, first_name="Grace")
+        assert updated.first_name == "Grace"
+
+    def test_missing_package_resolves_to_none(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import sys
+
+        monkeypatch.setattr(tracing, "_resolved", False)
+        monkeypatch.setitem(sys.modules, "opentelemetry", None)
+        assert tracing._opentelemetry() is None
+        assert tracing._resolved
+
+
+# ---------------------------------------------------------------------------
+# With OpenTelemetry
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def spans(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """An in-memory exporter behind a private tracer provider."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    api = tracing._OpenTelemetry()
+    api.tracer = provider.get_tracer("teamleader")
+    monkeypatch.setattr(tracing, "_api", api)
+    monkeypatch.setattr(tracing, "_resolved", True)
+    yield exporter
+    provider.shutdown()
+
+
+def _named(exporter: Any, name: str) -> list[Any]:
+    return [s for s in exporter.get_finished_spans() if s.name == name]
+
+
+class TestSpans:
+    def test_call(self, server: FakeTeamleader, spans: Any) -> None:
+        server.client().call("deals.list")
+        (span,) = spans.get_finished_spans()
+        assert span.name == "teamleader deals.list"
+        assert span.attributes[tracing.OPERATION_ID] == "deals.list"
+        assert span.attributes[tracing.ITEM_COUNT] == 20
+
+    def test_list(self, server: FakeTeamleader, spans: Any) -> None:
+        server.client().deals.list(page=2, page_size=10)
+        (span,) = spans.get_finished_spans()
+        assert dict(span.attributes) == {
+            tracing.OPERATION_ID: "deals.list",
+            tracing.PAGE_NUMBER: 2,
+            tracing.PAGE_SIZE: 10,
+            tracing.ITEM_COUNT: 10,
+        }
+
+    def test_create_nests_get(self, server: FakeTeamleader, spans: Any) -> None:
+        server.client().contacts.create(first_name="Ada", last_name="Lovelace")
+        (add,) = _named(spans, "teamleader contacts.add")
+        (info,) = _named(spans, "teamleader contacts.info")
+        assert info.parent.span_id == add.context.span_id
+
+    def test_update(self, server: FakeTeamleader, spans: Any) -> None:
+        client = server.client()
+        contact = client.contacts.create(first_name="Ada", last_name="Lovelace")
+        spans.clear()
+        client.contacts.update(contact.id, first_name="Grace")
+        assert [s.name for s in spans.get_finished_spans()] == [
+            "teamleader contacts.info",
+            "teamleader contacts.update",
+        ]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_iterate_pages(
+        self, server: FakeTeamleader, spans: Any, stream: bool
+    ) -> None:
+        list(server.client().deals.iterate(page_size=20, stream=stream))
+        pages = _named(spans, "teamleader deals.list")
+        assert [
+            (s.attributes[tracing.PAGE_NUMBER], s.attributes[tracing.ITEM_COUNT])
+            for s in pages
+        ] == [(1, 20), (2, 20), (3, 5)]
+        assert {s.attributes[tracing.PAGE_SIZE] for s in pages} == {20}
+
+    def test_failed_stream_page(self, server: FakeTeamleader, spans: Any) -> None:
+        from opentelemetry.trace import StatusCode
+
+        client = server.client()
+
+        def fail(*args: Any, **kwargs: Any) -> Any:
+            raise TeamleaderServerError("down")
+
+        client._post_stream = fail  # type: ignore[method-assign]
+        with pytest.raises(TeamleaderServerError):
+            list(client.deals.iterate(stream=True))
+        (span,) = spans.get_finished_spans()
+        assert span.status.status_code is StatusCode.ERROR
+
+
+class TestPropagation:
+    def test_roundtrip(self, spans: Any) -> None:
+        with tracing.span("parent") as parent:
+            carrier = tracing.inject_traceparent()
+        assert carrier["traceparent"].startswith("00-")
+        with tracing.use_traceparent(carrier), tracing.span("child"):
+            pass
+        (child,) = _named(spans, "child")
+        assert child.parent.span_id == parent.get_span_context().span_id
+
+    def test_thread_pool(self, server: FakeTeamleader, spans: Any) -> None:
+        client = server.client()
+        with tracing.span("sync") as parent, ThreadPoolExecutor(2) as pool:
+            list(
+                pool.map(
+                    tracing.propagate_context(lambda n: client.deals.list(page=n)),
+                    [1, 2],
+                )
+            )
+        pages = _named(spans, "teamleader deals.list")
+        assert len(pages) == 2
+        trace_id = parent.get_span_context().trace_id
+        assert all(s.context.trace_id == trace_id for s in pages)
@@ -0,0 +1,197 @@
+"""Unit tests for the pluggable HTTP transport.
+
+Covers:
+- RequestsTransport passes method, URL, headers, body, params and timeout
+  through to its session and returns the response unchanged
+- A custom Transport is used by TeamleaderClient for API calls and by
+  OAuth2Handler for token requests
+- make_response builds a response that behaves like one from requests
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import requests
+import responses
+
+from teamleader.auth import MemoryTokenBackend, OAuth2Handler, Token
+from teamleader.client import TeamleaderClient
+from teamleader.constants import BASE_URL, TOKEN_URL
+from teamleader.transport import RequestsTransport, Transport, make_response
+
+
+class _RecordingTransport(Transport):
+    """Answers every request with a canned JSON body and records it."""
+
+    def __init__(self, payload: Any) -> None:
+        self.payload = payload
+        self.requests: list[dict[str, Any]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        data: bytes | dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.requests.append(
+            {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "data": data,
+                "stream": stream,
+            }
+        )
+        return make_response(200, json.dumps(self.payload).encode(), url=url)
+
+
+def _handler(
+    backend: MemoryTokenBackend, transport: Transport | None = None
+) -> OAuth2Handler:
+    return OAuth2Handler(
+        client_id="cid",
+        client_secret="secret",
+        redirect_uri="http://localhost/callback",
+        token_backend=backend,
+        transport=transport,
+    )
+
+
+def _valid_backend() -> MemoryTokenBackend:
+    backend = MemoryTokenBackend()
+    backend.save(
+        Token(
+            access_token="acc",
+            refresh_token="ref",
+            expires_at=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        )
+    )
+    return backend
+
+
+# ---------------------------------------------------------------------------
+# RequestsTransport
+# ---------------------------------------------------------------------------
+
+
+class TestRequestsTransport:
+    @responses.activate
+    def test_passes_request_through(self) -> None:
+        responses.add(
+            responses.POST, f"{BASE_URL}/deals.info", json={"data": {}}, status=200
+        )
+        transport = RequestsTransport()
+
+        response = transport.request(
+            "POST",
+            f"{BASE_URL}/deals.info",
+            headers={"X-Test": "1"},
+            data=b'{"id":"d1"}',
+            timeout=5,
+        )
+
+        assert response.status_code == 200
+        sent = responses.calls[0].request
+        assert sent.headers["X-Test"] == "1"
+        assert sent.body == b'{"id":"d1"}'
+
+    @responses.activate
+    def test_does_not_raise_for_error_status(self) -> None:
+        responses.add(responses.GET, f"{BASE_URL}/x", status=500, body="boom")
+        response = RequestsTransport().request(
+            "GET", f"{BASE_URL}/x", params={"a": "b"}
+        )
+        assert response.status_code == 500
+        assert responses.calls[0].request.url.endswith("?a=b")
+
+    def test_uses_given_session(self) -> None:
+        session = requests.Session()
+        assert RequestsTransport(session).session is session
+
+    def test_close_closes_session(self) -> None:
+        closed: list[bool] = []
+        session = requests.Session()
+        session.close = lambda: closed.append(True)  # type: ignore[method-assign]
+        RequestsTransport(session).close()
+        assert closed == [True]
+
+
+# ---------------------------------------------------------------------------
+# Wiring into client and OAuth handler
+# ---------------------------------------------------------------------------
+
+
+class TestCustomTransport:
+    def test_client_sends_calls_through_transport(self) -> None:
+        transport = _RecordingTransport({"data": {"id": "u1"}})
+        client = TeamleaderClient(_handler(_valid_backend()), transport=transport)
+
+        result = client.call("users.me")
+
+        assert result == {"data": {"id": "u1"}}
+        (sent,) = transport.requests
+        assert sent["method"] == "POST"
+        assert sent["url"] == f"{BASE_URL}/users.me"
+        assert sent["headers"]["Authorization"] == "Bearer acc"
+        assert sent["stream"] is False
+
+    def test_stream_requests_streamed_response(self) -> None:
+        transport = _RecordingTransport({"data": [{"id": "a"}, {"id": "b"}]})
+        client = TeamleaderClient(_handler(_valid_backend()), transport=transport)
+
+        items = list(client.stream("deals.list"))
+
+        assert [i["id"] for i in items] == ["a", "b"]
+        assert transport.requests[0]["stream"] is True
+
+    def test_oauth_handler_requests_tokens_through_transport(self) -> None:
+        transport = _RecordingTransport(
+            {"access_token": "new", "refresh_token": "r2", "expires_in": 3600}
+        )
+        backend = MemoryTokenBackend()
+        handler = _handler(backend, transport)
+
+        token = handler.exchange_code("the-code")
+
+        assert token.access_token == "new"
+        (sent,) = transport.requests
+        assert sent["url"] == TOKEN_URL
+        assert sent["data"]["code"] == "the-code"
+
+    def test_default_transport_is_requests(self) -> None:
+        client = TeamleaderClient(_handler(_valid_backend()))
+        assert isinstance(client._transport, RequestsTransport)
+
+
+# ---------------------------------------------------------------------------
+# make_response
+# ---------------------------------------------------------------------------
+
+
+class TestMakeResponse:
+    def test_behaves_like_requests_response(self) -> None:
+        response = make_response(
+            404, b'{"errors": []}', headers={"Retry-After": "3"}, url="http://x"
+        )
+        assert response.status_code == 404
+        assert not response.ok
+        assert response.json() == {"errors": []}
+        assert response.text == '{"errors": []}'
+        assert response.headers["retry-after"] == "3"
+        assert response.url == "http://x"
+
+    def test_iter_content_yields_body(self) -> None:
+        response = make_response(200, b"abcdef")
+        assert b"".join(response.iter_content(2)) == b"abcdef"
+
+    def test_empty_body(self) -> None:
+        response = make_response(204)
+        assert response.content == b""